@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.harness import compare, format_report, measure
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks", description="Benchmark the sync's hot paths on synthetic data")
+    parser.add_argument("scenarios", nargs="*", help="Scenario names to run (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply the synthetic data sizes by this")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per scenario; the best is reported")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to the baseline file")
+    parser.add_argument("--max-slowdown", type=float, default=1.5, help="Fail if a scenario is this many times slower than the baseline")
+    parser.add_argument("--max-memory-growth", type=float, default=1.5, help="Fail if a scenario's peak memory grows by this factor")
+    args = parser.parse_args(argv)
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenarios or scenario.name in args.scenarios]
+    unknown = set(args.scenarios) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    # A baseline is only comparable at the scale it was recorded at
+    baseline_scenarios = baseline.get("scenarios", {}) if baseline.get("scale") == args.scale else {}
+
+    measurements = []
+    for scenario in scenarios:
+        measurement = measure(scenario, args.scale, args.repeats)
+        measurements.append(measurement)
+        print(f"{scenario.name}: {measurement.seconds * 1000:.1f} ms, peak {measurement.peak_bytes / 1e6:.1f} MB", file=sys.stderr)
+
+    print(format_report(measurements, baseline_scenarios))
+
+    if args.save_baseline:
+        scenario_results = dict(baseline_scenarios)
+        scenario_results.update({measurement.name: measurement.to_dict() for measurement in measurements})
+        with open(args.baseline, "w") as f:
+            json.dump({"scale": args.scale, "scenarios": scenario_results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = compare(measurements, baseline_scenarios, args.max_slowdown, args.max_memory_growth)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
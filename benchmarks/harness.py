@@ -0,0 +1,87 @@
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmark. `setup(scale)` builds the synthetic input (not timed) and `run(data)`
+    is the code under test.
+    """
+    name: str
+    setup: Callable[[float], Any]
+    run: Callable[[Any], Any]
+
+
+@dataclass
+class Measurement:
+    name: str
+    seconds: float
+    peak_bytes: int
+
+    def to_dict(self) -> dict:
+        return {"seconds": self.seconds, "peak_bytes": self.peak_bytes}
+
+
+def measure(scenario: Scenario, scale: float = 1.0, repeats: int = 5) -> Measurement:
+    """
+    Returns the best wall time of `repeats` runs, and the peak memory allocated during
+    one more run traced with tracemalloc (tracing slows code down, so it isn't timed).
+    """
+    data = scenario.setup(scale)
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        started_at = time.perf_counter()
+        scenario.run(data)
+        best = min(best, time.perf_counter() - started_at)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        scenario.run(data)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(scenario.name, best, peak_bytes)
+
+
+def compare(
+    measurements: list[Measurement],
+    baseline: dict,
+    max_slowdown: float = 1.5,
+    max_memory_growth: float = 1.5,
+) -> list[str]:
+    """
+    Compares measurements to a stored baseline ({name: {"seconds", "peak_bytes"}}).
+    Returns a description of each regression; scenarios missing from the baseline are skipped.
+    """
+    regressions = []
+    for measurement in measurements:
+        expected = baseline.get(measurement.name)
+        if not expected:
+            continue
+        if measurement.seconds > expected["seconds"] * max_slowdown:
+            regressions.append(
+                f"{measurement.name}: {measurement.seconds * 1000:.1f} ms vs baseline {expected['seconds'] * 1000:.1f} ms"
+            )
+        if measurement.peak_bytes > expected["peak_bytes"] * max_memory_growth:
+            regressions.append(
+                f"{measurement.name}: peak {measurement.peak_bytes / 1e6:.1f} MB vs baseline {expected['peak_bytes'] / 1e6:.1f} MB"
+            )
+    return regressions
+
+
+def format_report(measurements: list[Measurement], baseline: Optional[dict] = None) -> str:
+    baseline = baseline or {}
+    lines = [f"{'scenario':<32} {'time':>10} {'peak mem':>10} {'vs baseline':>12}"]
+    for measurement in measurements:
+        expected = baseline.get(measurement.name)
+        ratio = f"{measurement.seconds / expected['seconds']:.2f}x" if expected else "-"
+        lines.append(
+            f"{measurement.name:<32} {measurement.seconds * 1000:>8.1f}ms {measurement.peak_bytes / 1e6:>8.1f}MB {ratio:>12}"
+        )
+    return "\n".join(lines)
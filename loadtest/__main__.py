@@ -0,0 +1,41 @@
+import argparse
+import sys
+from dataclasses import fields
+
+from loadtest.harness import LoadProfile, format_results, run_load_test
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="loadtest", description="Run the sync end to end against local stand-ins for its APIs")
+    defaults = LoadProfile()
+    for profile_field in fields(LoadProfile):
+        if profile_field.name == "environment":
+            continue
+        parser.add_argument(
+            f"--{profile_field.name.replace('_', '-')}",
+            type=type(getattr(defaults, profile_field.name)),
+            default=getattr(defaults, profile_field.name),
+            help=f"(default {getattr(defaults, profile_field.name)})",
+        )
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE", help="Extra environment variable for the runs")
+    parser.add_argument("--verbose", action="store_true", help="Show the sync's own output")
+    args = parser.parse_args(argv)
+
+    environment = {}
+    for variable in args.env:
+        name, separator, value = variable.partition("=")
+        if not separator:
+            parser.error(f"--env expects NAME=VALUE, got {variable}")
+        environment[name] = value
+    profile = LoadProfile(
+        **{profile_field.name: getattr(args, profile_field.name) for profile_field in fields(LoadProfile) if profile_field.name != "environment"},
+        environment=environment,
+    )
+
+    results = run_load_test(profile, verbose=args.verbose)
+    print(format_results(profile, results))
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import threading
+from collections import Counter
+
+
+class CallCounter:
+    """Thread-safe count of the calls made to each stand-in, e.g. "ads.search_stream"."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def record(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += count
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> dict[str, int]:
+        """Returns the counts so far and starts again from zero."""
+        with self._lock:
+            counts, self._counts = dict(self._counts), Counter()
+            return counts
@@ -0,0 +1,322 @@
+"""
+In-process stand-in for the parts of the Google Ads API the sync uses:
+
+* GoogleAdsService.search_stream, for the GAQL queries the fetchers and the change status reader send
+* CampaignCriterionService.mutate_campaign_criteria, with partial failures and quota errors
+
+Batch jobs aren't emulated, so load tests run with BATCH_JOB_THRESHOLD=0.
+"""
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+import grpc
+from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.v20.enums.types.change_status_operation import ChangeStatusOperationEnum
+from google.ads.googleads.v20.errors.types import GoogleAdsFailure
+from google.ads.googleads.v20.services.types import campaign_criterion_service, google_ads_service
+from google.protobuf import any_pb2
+from google.rpc import status_pb2
+
+from loadtest.call_counter import CallCounter
+
+TYPES = {
+    "CampaignCriterionOperation": campaign_criterion_service.CampaignCriterionOperation,
+    "MutateCampaignCriteriaRequest": campaign_criterion_service.MutateCampaignCriteriaRequest,
+}
+
+TIME_ZONE = "UTC"
+DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+STREAM_BATCH_SIZE = 10000
+
+SELECT_PATTERN = re.compile(r"SELECT\s+(.*?)\s+FROM\s+(\w+)", re.S | re.I)
+IN_PATTERN = re.compile(r"(campaign\.id|campaign_criterion\.resource_name)\s+IN\s*\((.*?)\)", re.S)
+SINCE_PATTERN = re.compile(r"last_change_date_time\s*>=\s*'([^']+)'")
+UNTIL_PATTERN = re.compile(r"last_change_date_time\s*<=\s*'([^']+)'")
+LIMIT_PATTERN = re.compile(r"LIMIT\s+(\d+)")
+
+ADDED = ChangeStatusOperationEnum.ChangeStatusOperation.ADDED
+REMOVED = ChangeStatusOperationEnum.ChangeStatusOperation.REMOVED
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+class FakeGoogleAdsAccount:
+    """
+    One account's campaigns and their location criteria, plus the change_status log.
+    As in the real API, a location criterion's ID is its geo target constant ID.
+    """
+
+    def __init__(
+        self,
+        customer_id: str,
+        campaign_locations: dict[str, Iterable[int]],
+        counter: Optional[CallCounter] = None,
+        latency: float = 0.0,
+        partial_failure_rate: float = 0.0,
+        quota_error_rate: float = 0.0,
+        quota_retry_delay: float = 1.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            customer_id (str): The customer ID the sync is configured with.
+            campaign_locations (dict): Campaign ID -> the location IDs it targets to begin with.
+            counter (CallCounter): Counts each request.
+            latency (float): Seconds added to every request.
+            partial_failure_rate (float): Chance of each mutate operation failing on its own.
+            quota_error_rate (float): Chance of a mutate request failing with RESOURCE_EXHAUSTED.
+            quota_retry_delay (float): Retry delay suggested by the quota errors.
+        """
+        self.customer_id = customer_id
+        self.counter = counter or CallCounter()
+        self.latency = latency
+        self.partial_failure_rate = partial_failure_rate
+        self.quota_error_rate = quota_error_rate
+        self.quota_retry_delay = quota_retry_delay
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._campaigns: dict[str, set[int]] = {
+            str(campaign_id): set(location_ids) for campaign_id, location_ids in campaign_locations.items()
+        }
+        # Latest (time, status) per campaign criterion resource name, like change_status
+        self._change_log: dict[str, tuple[str, int]] = {}
+
+    def get_locations(self, campaign_id: str) -> set[int]:
+        with self._lock:
+            return set(self._campaigns.get(str(campaign_id), ()))
+
+    def get_campaign_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._campaigns)
+
+    def wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get_resource_name(self, campaign_id: str, criterion_id: int) -> str:
+        return f"customers/{self.customer_id}/campaignCriteria/{campaign_id}~{criterion_id}"
+
+    def add_criterion(self, campaign_id: str, location_id: int) -> Optional[str]:
+        """Adds a location criterion. Returns its resource name, or None if the campaign already has it."""
+        with self._lock:
+            locations = self._campaigns.setdefault(campaign_id, set())
+            if location_id in locations:
+                return None
+            locations.add(location_id)
+            return self._log_change(campaign_id, location_id, ADDED)
+
+    def remove_criterion(self, resource_name: str) -> bool:
+        campaign_id, _, criterion_id = resource_name.rpartition("/")[2].partition("~")
+        with self._lock:
+            locations = self._campaigns.get(campaign_id)
+            if not criterion_id.isdigit() or locations is None or int(criterion_id) not in locations:
+                return False
+            locations.discard(int(criterion_id))
+            self._log_change(campaign_id, int(criterion_id), REMOVED)
+            return True
+
+    def _log_change(self, campaign_id: str, criterion_id: int, status: int) -> str:
+        resource_name = self.get_resource_name(campaign_id, criterion_id)
+        self._change_log[resource_name] = (datetime.now(ZoneInfo(TIME_ZONE)).strftime(DATE_TIME_FORMAT), status)
+        return resource_name
+
+    def should_fail(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def iter_criteria(self, campaign_ids: Optional[set[str]] = None) -> Iterator[tuple[str, int]]:
+        with self._lock:
+            criteria = [
+                (campaign_id, location_id)
+                for campaign_id, locations in self._campaigns.items()
+                if campaign_ids is None or campaign_id in campaign_ids
+                for location_id in locations
+            ]
+        return iter(criteria)
+
+    def get_changes(self, since: str, until: str, limit: int) -> list[tuple[str, str, int]]:
+        """Returns (time, resource name, status) for changes in the window, oldest first."""
+        with self._lock:
+            changes = [
+                (changed_at, resource_name, status)
+                for resource_name, (changed_at, status) in self._change_log.items()
+                if since <= changed_at <= until
+            ]
+        return sorted(changes)[:limit]
+
+
+class FakeGoogleAdsService:
+    """Answers the sync's GAQL queries from a FakeGoogleAdsAccount."""
+
+    def __init__(self, account: FakeGoogleAdsAccount, batch_size: int = STREAM_BATCH_SIZE):
+        self._account = account
+        self._batch_size = batch_size
+
+    def search_stream(self, customer_id: str, query: str) -> Iterator[google_ads_service.SearchGoogleAdsStreamResponse]:
+        self._account.counter.record("ads.search_stream")
+        self._account.wait()
+        match = SELECT_PATTERN.search(query)
+        if match is None:
+            raise ValueError(f"Can't parse query: {query}")
+        fields = [field.strip() for field in match.group(1).split(",")]
+        rows = self._get_rows(match.group(2), query)
+        return self._stream(rows, fields)
+
+    def _stream(self, rows: Iterator[dict], fields: list[str]) -> Iterator[google_ads_service.SearchGoogleAdsStreamResponse]:
+        response_class = google_ads_service.SearchGoogleAdsStreamResponse.pb()
+        row_class = google_ads_service.GoogleAdsRow.pb()
+        response = response_class()
+        response.field_mask.paths.extend(fields)
+        for values in rows:
+            row = row_class()
+            for field in fields:
+                _set_field(row, field, values[field])
+            response.results.append(row)
+            if len(response.results) >= self._batch_size:
+                self._account.counter.record("ads.search_stream.batches")
+                yield google_ads_service.SearchGoogleAdsStreamResponse.wrap(response)
+                response = response_class()
+                response.field_mask.paths.extend(fields)
+        if response.results:
+            self._account.counter.record("ads.search_stream.batches")
+            yield google_ads_service.SearchGoogleAdsStreamResponse.wrap(response)
+
+    def _get_rows(self, resource: str, query: str) -> Iterator[dict]:
+        account = self._account
+        if resource == "customer":
+            return iter([{"customer.time_zone": TIME_ZONE}])
+        if resource == "campaign":
+            return iter([
+                {"campaign.id": int(campaign_id), "campaign.name": f"[Appliance] Load test {campaign_id}"}
+                for campaign_id in account.get_campaign_ids()
+            ])
+        if resource == "campaign_criterion":
+            return self._get_criterion_rows(query)
+        if resource == "change_status":
+            since, until = SINCE_PATTERN.search(query).group(1), UNTIL_PATTERN.search(query).group(1)
+            limit = int(LIMIT_PATTERN.search(query).group(1))
+            return iter([
+                {
+                    "change_status.campaign_criterion": resource_name,
+                    "change_status.resource_status": status,
+                    "change_status.last_change_date_time": changed_at,
+                }
+                for changed_at, resource_name, status in account.get_changes(since, until, limit)
+            ])
+        raise ValueError(f"The load test stand-in doesn't support queries on {resource}")
+
+    def _get_criterion_rows(self, query: str) -> Iterator[dict]:
+        match = IN_PATTERN.search(query)
+        values = {value.strip().strip("'") for value in match.group(2).split(",")} if match else None
+        if match and match.group(1) == "campaign_criterion.resource_name":
+            campaign_ids = {resource_name.rpartition("/")[2].partition("~")[0] for resource_name in values}
+            resource_names = values
+        else:
+            campaign_ids, resource_names = values, None
+
+        for campaign_id, location_id in self._account.iter_criteria(campaign_ids):
+            if resource_names is not None and self._account.get_resource_name(campaign_id, location_id) not in resource_names:
+                continue
+            yield {
+                "campaign.id": int(campaign_id),
+                "campaign_criterion.criterion_id": location_id,
+                "campaign_criterion.location.geo_target_constant": f"geoTargetConstants/{location_id}",
+            }
+
+
+class FakeCampaignCriterionService:
+    """Applies criterion mutations to a FakeGoogleAdsAccount, like the API does with partial failure on."""
+
+    def __init__(self, account: FakeGoogleAdsAccount):
+        self._account = account
+
+    def mutate_campaign_criteria(self, request) -> campaign_criterion_service.MutateCampaignCriteriaResponse:
+        account = self._account
+        account.counter.record("ads.mutate_campaign_criteria")
+        account.wait()
+        if not request.partial_failure:
+            raise ValueError("The load test stand-in only supports partial failure requests")
+        if account.should_fail(account.quota_error_rate):
+            account.counter.record("ads.mutate_campaign_criteria.quota_errors")
+            raise self._quota_error()
+
+        account.counter.record("ads.mutate_campaign_criteria.operations", len(request.operations))
+        results, errors = [], []
+        for index, operation in enumerate(request.operations):
+            resource_name, message = self._apply(operation)
+            if message is not None:
+                errors.append({"message": message, "location": {"field_path_elements": [{"field_name": "operations", "index": index}]}})
+                results.append({})
+            else:
+                results.append({"resource_name": resource_name})
+
+        partial_failure_error = None
+        if errors:
+            account.counter.record("ads.mutate_campaign_criteria.failed_operations", len(errors))
+            detail = any_pb2.Any()
+            detail.Pack(GoogleAdsFailure.pb(GoogleAdsFailure(errors=errors)))
+            partial_failure_error = status_pb2.Status(code=3, message=f"{len(errors)} operations failed", details=[detail])
+        return campaign_criterion_service.MutateCampaignCriteriaResponse(results=results, partial_failure_error=partial_failure_error)
+
+    def _apply(self, operation) -> tuple[Optional[str], Optional[str]]:
+        """Returns (resource name, None) on success and (None, error message) on failure."""
+        account = self._account
+        if account.should_fail(account.partial_failure_rate):
+            return None, "Simulated failure"
+        kind = type(operation).pb(operation).WhichOneof("operation")
+        if kind == "create":
+            campaign_id = operation.create.campaign.rpartition("/")[2]
+            location_id = int(operation.create.location.geo_target_constant.rpartition("/")[2])
+            resource_name = account.add_criterion(campaign_id, location_id)
+            return (resource_name, None) if resource_name else (None, "Duplicate campaign criterion")
+        if kind == "remove":
+            if account.remove_criterion(operation.remove):
+                return operation.remove, None
+            return None, "Resource not found"
+        return None, f"Unsupported operation: {kind}"
+
+    def _quota_error(self) -> GoogleAdsException:
+        delay = self._account.quota_retry_delay
+        failure = GoogleAdsFailure(errors=[{
+            "error_code": {"quota_error": "RESOURCE_EXHAUSTED"},
+            "message": "Too many requests (simulated)",
+            "details": {"quota_error_details": {"retry_delay": {"seconds": int(delay), "nanos": int(delay % 1 * 1e9)}}},
+        }])
+        return GoogleAdsException(_RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED), None, failure, "load-test")
+
+
+class FakeGoogleAdsClient:
+    """Drop-in for GoogleAdsClient, backed by a FakeGoogleAdsAccount."""
+
+    def __init__(self, account: FakeGoogleAdsAccount):
+        self.account = account
+        self._services = {
+            "GoogleAdsService": FakeGoogleAdsService(account),
+            "CampaignCriterionService": FakeCampaignCriterionService(account),
+        }
+
+    def get_service(self, name: str, **kwargs):
+        if name not in self._services:
+            raise ValueError(f"The load test stand-in doesn't support {name}")
+        return self._services[name]
+
+    def get_type(self, name: str):
+        return TYPES[name]()
+
+
+def _set_field(message, path: str, value) -> None:
+    *parents, name = path.split(".")
+    for parent in parents:
+        message = getattr(message, parent)
+    setattr(message, name, value)
@@ -0,0 +1,121 @@
+"""
+Localhost stand-in for the sync's plain HTTP dependencies: the eLocal price-list feed
+(with ETag / If-None-Match support) and Slack incoming webhooks.
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from loadtest.call_counter import CallCounter
+
+FEED_PATH = "/api/call_category_price_list.json"
+SLACK_PATH_PREFIX = "/slack/"
+
+
+class FakeHttpServer:
+    """
+    Serves the feed at FEED_PATH and accepts Slack webhook posts under SLACK_PATH_PREFIX,
+    on a free localhost port. Use as a context manager, or call start() and stop().
+    """
+
+    def __init__(self, counter: Optional[CallCounter] = None, latency: float = 0.0):
+        self.counter = counter or CallCounter()
+        self.latency = latency
+        self.slack_messages: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._feed_body = b"[]"
+        self._feed_etag = self._get_etag(self._feed_body)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def feed_url(self) -> str:
+        return self.base_url + FEED_PATH
+
+    def get_slack_webhook_url(self, channel: str) -> str:
+        return f"{self.base_url}{SLACK_PATH_PREFIX}{channel}"
+
+    def set_feed(self, entries: list[dict]) -> None:
+        """Sets the price list served from now on."""
+        body = json.dumps(entries).encode()
+        with self._lock:
+            self._feed_body = body
+            self._feed_etag = self._get_etag(body)
+
+    def start(self) -> "FakeHttpServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeHttpServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _get_etag(self, body: bytes) -> str:
+        return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != FEED_PATH:
+                    self._respond(404, b"")
+                    return
+                fake.counter.record("feed.get")
+                fake._wait()
+                with fake._lock:
+                    body, etag = fake._feed_body, fake._feed_etag
+                if self.headers.get("If-None-Match") == etag:
+                    fake.counter.record("feed.not_modified")
+                    self._respond(304, b"", {"ETag": etag})
+                    return
+                self._respond(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self.path.startswith(SLACK_PATH_PREFIX):
+                    self._respond(404, b"")
+                    return
+                fake.counter.record("slack.post")
+                fake._wait()
+                with fake._lock:
+                    fake.slack_messages.append((self.path[len(SLACK_PATH_PREFIX):], json.loads(body).get("text", "")))
+                self._respond(200, b"ok")
+
+            def _respond(self, status: int, body: bytes, headers: Optional[dict] = None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
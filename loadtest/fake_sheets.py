@@ -0,0 +1,129 @@
+"""
+In-process stand-in for the gspread client SheetsService uses: opening a spreadsheet,
+listing its worksheets, and values batch get / batch update.
+"""
+import random
+import re
+import threading
+import time
+from typing import Optional
+
+from loadtest.call_counter import CallCounter
+
+RANGE_PATTERN = re.compile(r"^'?(.*?)'?!([A-Z])(\d+)(?::([A-Z])(\d*))?$")
+
+
+class FakeSheetsQuotaError(Exception):
+    """Raised in place of gspread's APIError; SheetsService retries it the same way."""
+
+    def __init__(self):
+        super().__init__("APIError: [429]: RESOURCE_EXHAUSTED (simulated)")
+
+
+class FakeWorksheet:
+    def __init__(self, title: str):
+        self.title = title
+        # Column letter -> cell values, from row 1
+        self.columns: dict[str, list[str]] = {}
+
+    def get_column(self, column: str) -> list[str]:
+        return self.columns.setdefault(column, [])
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet_names: list[str], counter: CallCounter, latency: float, quota_error_rate: float, random_value):
+        self._worksheets = {name: FakeWorksheet(name) for name in worksheet_names}
+        self._counter = counter
+        self._latency = latency
+        self._quota_error_rate = quota_error_rate
+        self._random_value = random_value
+        self._lock = threading.Lock()
+
+    def worksheets(self) -> list[FakeWorksheet]:
+        self._request("sheets.worksheets")
+        return list(self._worksheets.values())
+
+    def worksheet(self, name: str) -> FakeWorksheet:
+        return self._worksheets[name]
+
+    def values_batch_get(self, ranges: list[str]) -> dict:
+        self._request("sheets.values_batch_get")
+        value_ranges = []
+        with self._lock:
+            for cell_range in ranges:
+                worksheet, column, first_row = self._parse_range(cell_range)
+                values = _strip_trailing_empty(worksheet.get_column(column)[first_row - 1:])
+                value_ranges.append({"range": cell_range, "values": [[value] if value != "" else [] for value in values]})
+        return {"valueRanges": value_ranges}
+
+    def values_batch_update(self, body: dict) -> dict:
+        self._request("sheets.values_batch_update")
+        cells = 0
+        with self._lock:
+            for range_data in body["data"]:
+                worksheet, column, first_row = self._parse_range(range_data["range"])
+                values = worksheet.get_column(column)
+                rows = [row[0] if row else "" for row in range_data["values"]]
+                last_row = first_row + len(rows) - 1
+                if len(values) < last_row:
+                    values.extend([""] * (last_row - len(values)))
+                values[first_row - 1:last_row] = [str(value) for value in rows]
+                cells += len(rows)
+        self._counter.record("sheets.cells_written", cells)
+        return {"totalUpdatedCells": cells}
+
+    def get_values(self, worksheet_name: str, column: str = "A", start_row: int = 2) -> list[str]:
+        """Returns a column's values from start_row, without the trailing empty cells."""
+        with self._lock:
+            return _strip_trailing_empty(self._worksheets[worksheet_name].get_column(column)[start_row - 1:])
+
+    def _request(self, name: str) -> None:
+        self._counter.record(name)
+        if self._latency:
+            time.sleep(self._latency)
+        if self._quota_error_rate and self._random_value() < self._quota_error_rate:
+            self._counter.record("sheets.quota_errors")
+            raise FakeSheetsQuotaError()
+
+    def _parse_range(self, cell_range: str) -> tuple[FakeWorksheet, str, int]:
+        """Returns the worksheet, column letter and first row of an A1 range like 'Tab'!A2:A."""
+        match = RANGE_PATTERN.match(cell_range)
+        if match is None:
+            raise ValueError(f"Can't parse range: {cell_range}")
+        worksheet_name = match.group(1).replace("''", "'")
+        return self._worksheets[worksheet_name], match.group(2), int(match.group(3))
+
+
+class FakeSheetsClient:
+    """Drop-in for an authorized gspread client. Every URL opens the same spreadsheet."""
+
+    def __init__(
+        self,
+        worksheet_names: list[str],
+        counter: Optional[CallCounter] = None,
+        latency: float = 0.0,
+        quota_error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            worksheet_names (list[str]): The spreadsheet's tabs, which start out empty.
+            counter (CallCounter): Counts each request.
+            latency (float): Seconds added to every request.
+            quota_error_rate (float): Chance of a request failing with a quota error.
+        """
+        self.counter = counter or CallCounter()
+        self.spreadsheet = FakeSpreadsheet(
+            worksheet_names, self.counter, latency, quota_error_rate, random.Random(seed).random
+        )
+
+    def open_by_url(self, url: str) -> FakeSpreadsheet:
+        self.counter.record("sheets.open_by_url")
+        return self.spreadsheet
+
+
+def _strip_trailing_empty(values: list[str]) -> list[str]:
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    return values[:end]
@@ -0,0 +1,235 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from loadtest.call_counter import CallCounter
+from loadtest.fake_google_ads import FakeGoogleAdsAccount, FakeGoogleAdsClient
+from loadtest.fake_http import FakeHttpServer
+from loadtest.fake_sheets import FakeSheetsClient
+
+CUSTOMER_ID = "1234567890"
+SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/load-test"
+# Zip codes are drawn from the whole range, so roughly 40% of them are in the zip index, like the real feed
+ZIP_CODE_RANGE = (501, 99951)
+
+
+@dataclass
+class LoadProfile:
+    """The account size, stand-in behaviour and number of runs for a load test."""
+    campaigns: int = 30
+    criteria_per_campaign: int = 10000
+    feed_size: int = 42000
+    worksheets: int = 5
+    runs: int = 2
+    # Fraction of feed entries whose prices change before each run after the first
+    feed_churn: float = 0.05
+    ads_latency: float = 0.05
+    sheets_latency: float = 0.05
+    http_latency: float = 0.0
+    partial_failure_rate: float = 0.0
+    ads_quota_error_rate: float = 0.0
+    sheets_quota_error_rate: float = 0.0
+    quota_retry_delay: float = 1.0
+    seed: int = 0
+    # Extra environment variables for the runs, e.g. {"MUTATION_REQUESTS_PER_SECOND": "20"}
+    environment: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class RunResult:
+    run: int
+    seconds: float
+    calls: dict[str, int]
+    campaigns_in_sync: int
+    worksheets_in_sync: int
+    error: Optional[str] = None
+
+
+def make_feed(size: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "zip_code": f"{zip_code:05d}",
+            "max_call_price": round(rng.uniform(0, 60), 2),
+            "min_call_price": round(rng.uniform(0, 10), 2),
+        }
+        for zip_code in rng.sample(range(*ZIP_CODE_RANGE), size)
+    ]
+
+
+def churn_feed(feed: list[dict], fraction: float, rng: random.Random) -> list[dict]:
+    """Returns a copy of the feed with the prices of `fraction` of its entries re-rolled."""
+    feed = [dict(entry) for entry in feed]
+    for entry in rng.sample(feed, int(len(feed) * fraction)):
+        entry["max_call_price"] = round(rng.uniform(0, 60), 2)
+    return feed
+
+
+def make_campaign_locations(profile: LoadProfile, feed: list[dict], rng: random.Random) -> dict[str, list[int]]:
+    """
+    Each campaign starts out targeting a random sample of the feed's locations, so the
+    first run has both adds and removes to make.
+    """
+    from zip_sync.data.zip_index import get_zip_index
+
+    location_ids = [int(geo_target_id) for geo_target_id in get_zip_index().lookup_many(entry["zip_code"] for entry in feed)]
+    sample_size = min(profile.criteria_per_campaign, len(location_ids))
+    return {
+        str(1000 + index): rng.sample(location_ids, sample_size)
+        for index in range(profile.campaigns)
+    }
+
+
+def get_expected_criteria_ids(feed: list[dict]) -> list[str]:
+    """The criteria the sync should end up targeting for this feed, under the configured price rules."""
+    from zip_sync.data.zip_code_fetcher import FeedResult
+    from zip_sync.zip_code_service import get_criteria_ids
+
+    return get_criteria_ids(FeedResult("", body=json.dumps(feed).encode()))
+
+
+@contextlib.contextmanager
+def _environment(variables: dict[str, str]) -> Iterator[None]:
+    previous = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextlib.contextmanager
+def _captured_output() -> Iterator[None]:
+    """Keeps the sync's prints and log messages out of the report."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        yield
+
+
+@contextlib.contextmanager
+def _installed_stand_ins(ads_client: FakeGoogleAdsClient, sheets_client: FakeSheetsClient) -> Iterator[None]:
+    from zip_sync.ads_api.google_ads_client import set_shared_google_ads_client
+    from zip_sync.core.update_google_sheets import set_sheets_service
+    from zip_sync.environment.environment_service import EnvironmentService
+    from zip_sync.sheets.sheets_service import SheetsService
+
+    environment_service = EnvironmentService()
+    set_shared_google_ads_client(ads_client)
+    set_sheets_service(SPREADSHEET_URL, SheetsService(
+        "",
+        SPREADSHEET_URL,
+        max_cells_per_request=environment_service.get_sheets_max_cells_per_request(),
+        max_workers=environment_service.get_sheets_write_workers(),
+        client=sheets_client,
+    ))
+    try:
+        yield
+    finally:
+        set_shared_google_ads_client(None)
+        set_sheets_service(SPREADSHEET_URL, None)
+
+
+def run_load_test(profile: LoadProfile, verbose: bool = False) -> list[RunResult]:
+    """
+    Runs zip_sync's main() `profile.runs` times against local stand-ins for Google Ads,
+    Google Sheets, the eLocal feed and Slack, with run state kept in a temporary directory.
+    Returns the wall time, API call counts and end state of each run.
+    """
+    from zip_sync.__main__ import main
+
+    rng = random.Random(profile.seed)
+    counter = CallCounter()
+    feed = make_feed(profile.feed_size, rng)
+    account = FakeGoogleAdsAccount(
+        CUSTOMER_ID,
+        make_campaign_locations(profile, feed, rng),
+        counter=counter,
+        latency=profile.ads_latency,
+        partial_failure_rate=profile.partial_failure_rate,
+        quota_error_rate=profile.ads_quota_error_rate,
+        quota_retry_delay=profile.quota_retry_delay,
+        seed=profile.seed,
+    )
+    worksheet_names = [f"Load test {index + 1}" for index in range(profile.worksheets)]
+    sheets_client = FakeSheetsClient(
+        worksheet_names,
+        counter=counter,
+        latency=profile.sheets_latency,
+        quota_error_rate=profile.sheets_quota_error_rate,
+        seed=profile.seed,
+    )
+
+    results = []
+    with FakeHttpServer(counter, latency=profile.http_latency) as http_server, tempfile.TemporaryDirectory() as state_dir:
+        variables = {
+            "GOOGLE_ADS_ACCOUNT_ID": CUSTOMER_ID,
+            "GOOGLE_SHEET_URL": SPREADSHEET_URL,
+            "FEED_URL": http_server.feed_url,
+            "SLACK_ADMIN_WEBHOOK": http_server.get_slack_webhook_url("admin"),
+            "SLACK_ALERTS_WEBHOOK": http_server.get_slack_webhook_url("alerts"),
+            "STATE_DIR": state_dir,
+            "API_ACTIVE": "true",
+            "TEST_MODE": "false",
+            "FEED_OFFLINE": "false",
+            # Batch jobs aren't emulated
+            "BATCH_JOB_THRESHOLD": "0",
+            # The stand-in account is new for every load test, so a cached campaign list would be wrong
+            "CAMPAIGN_LIST_TTL_SECONDS": "0",
+            **profile.environment,
+        }
+        with _environment(variables), _installed_stand_ins(FakeGoogleAdsClient(account), sheets_client):
+            for run in range(1, profile.runs + 1):
+                if run > 1:
+                    feed = churn_feed(feed, profile.feed_churn, rng)
+                http_server.set_feed(feed)
+                counter.reset()
+
+                error = None
+                started_at = time.perf_counter()
+                try:
+                    with contextlib.nullcontext() if verbose else _captured_output():
+                        main()
+                except Exception:
+                    error = traceback.format_exc(limit=3)
+                seconds = time.perf_counter() - started_at
+
+                expected = set(get_expected_criteria_ids(feed))
+                campaigns_in_sync = sum(
+                    1 for campaign_id in account.get_campaign_ids()
+                    if {str(location_id) for location_id in account.get_locations(campaign_id)} == expected
+                )
+                worksheets_in_sync = sum(
+                    1 for worksheet_name in worksheet_names
+                    if set(sheets_client.spreadsheet.get_values(worksheet_name)) == expected
+                )
+                results.append(RunResult(run, seconds, counter.reset(), campaigns_in_sync, worksheets_in_sync, error))
+    return results
+
+
+def format_results(profile: LoadProfile, results: list[RunResult]) -> str:
+    lines = [
+        f"{profile.campaigns} campaigns x {profile.criteria_per_campaign} criteria, "
+        f"{profile.feed_size} feed entries, {profile.worksheets} worksheets"
+    ]
+    for result in results:
+        lines.append("")
+        lines.append(
+            f"Run {result.run}: {result.seconds:.2f}s, "
+            f"{result.campaigns_in_sync}/{profile.campaigns} campaigns and "
+            f"{result.worksheets_in_sync}/{profile.worksheets} worksheets in sync"
+        )
+        for name, count in sorted(result.calls.items()):
+            lines.append(f"  {name:<48} {count:>10}")
+        if result.error:
+            lines.append(f"  FAILED: {result.error.strip()}")
+    return "\n".join(lines)
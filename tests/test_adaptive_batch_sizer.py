@@ -0,0 +1,48 @@
+import pytest
+from zip_sync.ads_api.adaptive_batch_sizer import AdaptiveBatchSizer
+from zip_sync.utils.chunker import iter_chunks
+
+def _sizer(**kwargs):
+    defaults = dict(initial_size=1000, min_size=10, max_size=5000, target_latency=10.0)
+    defaults.update(kwargs)
+    return AdaptiveBatchSizer(**defaults)
+
+def test_grows_on_fast_full_batches_only():
+    sizer = _sizer()
+    assert sizer.record(1000, latency=1.0) == 1500
+    assert sizer.record(200, latency=1.0) == 1500  # partial batch says nothing about capacity
+    assert sizer.record(1500, latency=6.0) == 1500  # inside target but not fast enough to grow
+
+def test_shrinks_on_slow_requests_failures_and_quota_errors():
+    sizer = _sizer()
+    assert sizer.record(1000, latency=20.0) == 500
+    assert sizer.record(500, latency=12.5) == 400
+    assert sizer.record(400, latency=1.0, failed_count=100) == 300
+    assert sizer.record(300, latency=1.0, quota_error=True) == 150
+
+def test_stays_within_bounds():
+    sizer = _sizer(initial_size=20, max_size=25)
+    for _ in range(5):
+        sizer.record(1, latency=1.0, quota_error=True)
+    assert sizer.size == 10
+    for _ in range(5):
+        sizer.record(sizer.size, latency=0.1)
+    assert sizer.size == 25
+
+def test_remembers_last_size(tmp_path):
+    state_path = str(tmp_path / "batch_size.json")
+    sizer = AdaptiveBatchSizer.load(initial_size=1000, state_path=state_path)
+    assert sizer.size == 1000
+    sizer.record(1000, latency=20.0)
+    sizer.save()
+    assert AdaptiveBatchSizer.load(initial_size=1000, state_path=state_path).size == 500
+    # a remembered size outside the configured bounds is clamped
+    assert AdaptiveBatchSizer.load(initial_size=1000, state_path=state_path, max_size=100).size == 100
+
+def test_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        _sizer(min_size=100, max_size=10)
+
+def test_iter_chunks_follows_size_changes():
+    sizes = iter([2, 3, 1, 10])
+    assert list(iter_chunks(list(range(8)), lambda: next(sizes))) == [[0, 1], [2, 3, 4], [5], [6, 7]]
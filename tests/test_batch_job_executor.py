@@ -0,0 +1,146 @@
+from types import SimpleNamespace
+
+from google.rpc import status_pb2
+from google.ads.googleads.v20.resources.types import batch_job
+from google.ads.googleads.v20.services.types import batch_job_service, google_ads_service
+
+from zip_sync.ads_api.batch_job_executor import BatchJobExecutor
+from zip_sync.ads_api.criterion_changes import build_criterion_changes
+
+TYPES = {
+    "BatchJob": batch_job.BatchJob,
+    "BatchJobOperation": batch_job_service.BatchJobOperation,
+    "MutateOperation": google_ads_service.MutateOperation,
+}
+
+class FakeOperation:
+    def __init__(self, polls_until_done):
+        self.polls_until_done = polls_until_done
+
+    def done(self):
+        self.polls_until_done -= 1
+        return self.polls_until_done <= 0
+
+class FakeBatchJobService:
+    def __init__(self, failed_indices=(), polls_until_done=1):
+        self.failed_indices = failed_indices
+        self.polls_until_done = polls_until_done
+        self.mutate_operations = []
+        self.sequence_tokens = []
+
+    def mutate_batch_job(self, customer_id, operation):
+        return batch_job_service.MutateBatchJobResponse(result={"resource_name": f"customers/{customer_id}/batchJobs/1"})
+
+    def add_batch_job_operations(self, resource_name, sequence_token, mutate_operations):
+        self.sequence_tokens.append(sequence_token)
+        self.mutate_operations.extend(mutate_operations)
+        return batch_job_service.AddBatchJobOperationsResponse(next_sequence_token=str(len(self.mutate_operations)))
+
+    def run_batch_job(self, resource_name):
+        return FakeOperation(self.polls_until_done)
+
+    def list_batch_job_results(self, request=None, *, resource_name=None):
+        # The real client only takes page_size inside the request
+        assert request["page_size"] > 0
+        return [
+            batch_job_service.BatchJobResult(
+                operation_index=index,
+                status=status_pb2.Status(code=3, message="Duplicate") if index in self.failed_indices else None,
+            )
+            for index in range(len(self.mutate_operations))
+        ]
+
+class FakeGoogleAdsService:
+    def __init__(self, batch_job_status):
+        self.batch_job_status = batch_job_status
+        self.queries = []
+
+    def search(self, customer_id, query):
+        self.queries.append(query)
+        if self.batch_job_status is None:
+            return []
+        return [SimpleNamespace(batch_job=SimpleNamespace(status=SimpleNamespace(name=self.batch_job_status)))]
+
+class FakeGoogleAdsClient:
+    def __init__(self, service, ga_service=None):
+        self.service = service
+        self.ga_service = ga_service or FakeGoogleAdsService(None)
+
+    def get_service(self, name):
+        return self.ga_service if name == "GoogleAdsService" else self.service
+
+    def get_type(self, name):
+        return TYPES[name]()
+
+CAMPAIGN_CHANGES = [
+    ("1", ["100", "200"], ["customers/999/campaignCriteria/1~300"]),
+    ("2", ["100"], []),
+]
+
+def create_executor(service, state_path, ga_service=None, **kwargs):
+    sleeps = []
+    clock = lambda: sum(sleeps)
+    executor = BatchJobExecutor(
+        FakeGoogleAdsClient(service, ga_service), "999", state_path=str(state_path), sleep=sleeps.append, clock=clock, **kwargs)
+    return executor, sleeps
+
+def test_batch_job_results_are_mapped_back_to_campaigns(tmp_path):
+    service = FakeBatchJobService(failed_indices={1})
+    executor, _ = create_executor(service, tmp_path / "batch_job.json")
+
+    results = executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    operations = [mutate_operation.campaign_criterion_operation for mutate_operation in service.mutate_operations]
+    assert [operation.create.location.geo_target_constant for operation in operations] == [
+        "geoTargetConstants/100", "geoTargetConstants/200", "", "geoTargetConstants/100"]
+    assert operations[2].remove == "customers/999/campaignCriteria/1~300"
+    assert (results["1"].added, results["1"].removed, results["1"].failed, results["1"].unsent) == (1, 1, 1, 0)
+    assert (results["2"].added, results["2"].removed, results["2"].failed, results["2"].unsent) == (1, 0, 0, 0)
+
+def test_operations_are_added_in_chunks_with_sequence_tokens(monkeypatch, tmp_path):
+    monkeypatch.setattr("zip_sync.ads_api.batch_job_executor.ADD_OPERATIONS_CHUNK_SIZE", 2)
+    service = FakeBatchJobService()
+    executor, _ = create_executor(service, tmp_path / "batch_job.json")
+
+    executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    assert service.sequence_tokens == [None, "2"]
+
+def test_polling_backs_off_until_the_job_is_done(tmp_path):
+    service = FakeBatchJobService(polls_until_done=4)
+    executor, sleeps = create_executor(service, tmp_path / "batch_job.json", poll_initial_interval=5, poll_max_interval=15)
+
+    executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    assert sleeps == [5, 10, 15, 15]
+
+def test_timed_out_job_counts_every_change_as_unsent(tmp_path):
+    service = FakeBatchJobService(polls_until_done=100)
+    executor, _ = create_executor(service, tmp_path / "batch_job.json", poll_initial_interval=10, poll_timeout=30)
+
+    results = executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    assert (results["1"].unsent, results["2"].unsent) == (3, 1)
+    assert results["1"].added == 0
+
+def test_timed_out_job_is_not_submitted_again_while_it_runs(tmp_path):
+    state_path = tmp_path / "batch_job.json"
+    executor, _ = create_executor(FakeBatchJobService(polls_until_done=100), state_path, poll_initial_interval=10, poll_timeout=30)
+    executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    service = FakeBatchJobService()
+    ga_service = FakeGoogleAdsService("RUNNING")
+    executor, _ = create_executor(service, state_path, ga_service)
+    results = executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    assert "batch_job.resource_name = 'customers/999/batchJobs/1'" in ga_service.queries[0]
+    assert service.mutate_operations == []
+    assert (results["1"].unsent, results["2"].unsent) == (3, 1)
+
+    ga_service.batch_job_status = "DONE"
+    results = executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+
+    assert len(service.mutate_operations) == 4
+    assert (results["1"].added, results["1"].removed, results["2"].added) == (2, 1, 1)
+    executor.mutate_criterion_changes(build_criterion_changes(CAMPAIGN_CHANGES))
+    assert len(ga_service.queries) == 2
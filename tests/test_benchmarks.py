@@ -0,0 +1,28 @@
+from benchmarks.harness import Measurement, Scenario, compare, measure
+from benchmarks.scenarios import SCENARIOS
+
+def test_every_scenario_runs_at_a_tiny_scale():
+    for scenario in SCENARIOS:
+        measurement = measure(scenario, scale=0.001, repeats=1)
+        assert measurement.seconds >= 0
+        assert measurement.peak_bytes >= 0
+
+def test_measure_reports_peak_memory():
+    scenario = Scenario("allocate", lambda scale: int(100000 * scale), lambda count: [0] * count)
+    measurement = measure(scenario, scale=1.0, repeats=1)
+    assert measurement.peak_bytes >= 100000 * 8
+
+def test_compare_flags_slowdowns_and_memory_growth():
+    baseline = {
+        "fast": {"seconds": 1.0, "peak_bytes": 1000},
+        "lean": {"seconds": 1.0, "peak_bytes": 1000},
+    }
+    measurements = [
+        Measurement("fast", 2.0, 1000),
+        Measurement("lean", 1.0, 2000),
+        Measurement("new", 9.0, 9000),
+    ]
+    regressions = compare(measurements, baseline, max_slowdown=1.5, max_memory_growth=1.5)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("fast:")
+    assert regressions[1].startswith("lean:")
@@ -0,0 +1,70 @@
+import re
+import threading
+
+import pytest
+from google.protobuf import field_mask_pb2
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow, SearchGoogleAdsStreamResponse
+
+from zip_sync.ads_api.campaign_criterion_id_fetcher import CampaignCriterionIdFetcher, CriterionReportError
+
+FIELDS = ["campaign.id", "campaign_criterion.criterion_id", "campaign_criterion.location.geo_target_constant"]
+
+class FakeGoogleAdsService:
+    """Returns one criterion per campaign in the query. Shards containing a campaign in `failures` fail that many times."""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def search_stream(self, customer_id, query):
+        campaign_ids = re.findall(r"'(\d+)'", query)
+        with self._lock:
+            self.queries.append(campaign_ids)
+        rows = [
+            GoogleAdsRow(campaign={"id": int(campaign_id)}, campaign_criterion={
+                "criterion_id": 100 + int(campaign_id),
+                "location": {"geo_target_constant": f"geoTargetConstants/{100 + int(campaign_id)}"},
+            })
+            for campaign_id in campaign_ids
+        ]
+        yield SearchGoogleAdsStreamResponse(results=rows[:1], field_mask=field_mask_pb2.FieldMask(paths=FIELDS))
+        with self._lock:
+            for campaign_id in campaign_ids:
+                if self.failures.get(campaign_id):
+                    self.failures[campaign_id] -= 1
+                    raise RuntimeError("stream reset")
+        yield SearchGoogleAdsStreamResponse(results=rows[1:], field_mask=field_mask_pb2.FieldMask(paths=FIELDS))
+
+class FakeGoogleAdsClient:
+    def __init__(self, service):
+        self.service = service
+
+    def get_service(self, name):
+        return self.service
+
+def create_fetcher(service, **kwargs):
+    return CampaignCriterionIdFetcher(FakeGoogleAdsClient(service), "999", shard_size=2, sleep=lambda delay: None, **kwargs)
+
+def test_campaigns_are_fetched_in_shards_and_merged():
+    service = FakeGoogleAdsService()
+    criteria_map = create_fetcher(service).get_campaign_location_criteria_for_campaigns(["1", "2", "3"])
+
+    assert sorted(service.queries) == [["1", "2"], ["3"]]
+    assert criteria_map == {
+        "1": {"101": "customers/999/campaignCriteria/1~101"},
+        "2": {"102": "customers/999/campaignCriteria/2~102"},
+        "3": {"103": "customers/999/campaignCriteria/3~103"},
+    }
+
+def test_only_the_failed_shard_is_retried():
+    service = FakeGoogleAdsService(failures={"3": 1})
+    criteria_map = create_fetcher(service).get_campaign_location_criteria_for_campaigns(["1", "2", "3", "4"])
+
+    assert sorted(service.queries) == [["1", "2"], ["3", "4"], ["3", "4"]]
+    assert len(criteria_map["3"]) == 1 and len(criteria_map["4"]) == 1
+
+def test_a_shard_that_keeps_failing_raises():
+    service = FakeGoogleAdsService(failures={"1": 5})
+    with pytest.raises(CriterionReportError):
+        create_fetcher(service, max_shard_retries=1).get_campaign_location_criteria_for_campaigns(["1", "2", "3"])
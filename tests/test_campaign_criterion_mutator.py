@@ -0,0 +1,76 @@
+from google.protobuf import any_pb2
+from google.rpc import status_pb2
+from google.ads.googleads.v20.errors.types import GoogleAdsFailure
+from google.ads.googleads.v20.services.types import campaign_criterion_service
+
+from zip_sync.ads_api.campaign_criterion_mutator import CampaignCriterionMutator
+from zip_sync.ads_api.criterion_changes import ADD, REMOVE, CriterionChange, build_criterion_changes
+
+TYPES = {
+    "CampaignCriterionOperation": campaign_criterion_service.CampaignCriterionOperation,
+    "MutateCampaignCriteriaRequest": campaign_criterion_service.MutateCampaignCriteriaRequest,
+}
+
+class FakeCampaignCriterionService:
+    def __init__(self, failed_indices=()):
+        self.failed_indices = failed_indices
+        self.requests = []
+
+    def mutate_campaign_criteria(self, request):
+        self.requests.append(request)
+        failure = GoogleAdsFailure(errors=[
+            {"message": "Duplicate", "location": {"field_path_elements": [{"field_name": "operations", "index": index}]}}
+            for index in self.failed_indices
+        ])
+        detail = any_pb2.Any()
+        detail.Pack(GoogleAdsFailure.pb(failure))
+        return campaign_criterion_service.MutateCampaignCriteriaResponse(
+            results=[{} for _ in request.operations],
+            partial_failure_error=status_pb2.Status(code=3, message="Partial failure", details=[detail]) if self.failed_indices else None,
+        )
+
+class FakeGoogleAdsClient:
+    def __init__(self, service):
+        self.service = service
+
+    def get_service(self, name):
+        return self.service
+
+    def get_type(self, name):
+        return TYPES[name]()
+
+def test_mutate_criterion_changes_packs_campaigns_into_one_request():
+    service = FakeCampaignCriterionService(failed_indices=[1, 3])
+    mutator = CampaignCriterionMutator(FakeGoogleAdsClient(service), "999")
+    changes = build_criterion_changes([
+        ("1", ["100", "200"], ["customers/999/campaignCriteria/1~300"]),
+        ("2", ["100"], []),
+    ])
+    assert changes[2] == CriterionChange("1", REMOVE, "customers/999/campaignCriteria/1~300")
+
+    results = mutator.mutate_criterion_changes(changes)
+
+    assert len(service.requests) == 1
+    request = service.requests[0]
+    assert request.partial_failure
+    assert [operation.create.campaign for operation in request.operations] == [
+        "customers/999/campaigns/1", "customers/999/campaigns/1", "", "customers/999/campaigns/2"]
+    assert request.operations[2].remove == "customers/999/campaignCriteria/1~300"
+    assert (results["1"].added, results["1"].removed, results["1"].failed) == (1, 1, 1)
+    assert (results["2"].added, results["2"].removed, results["2"].failed) == (0, 0, 1)
+
+def test_partial_failures_are_counted():
+    service = FakeCampaignCriterionService(failed_indices=[0])
+    mutator = CampaignCriterionMutator(FakeGoogleAdsClient(service), "999")
+    result = mutator._execute_criteria_mutation([TYPES["CampaignCriterionOperation"]() for _ in range(3)])
+    assert (result["successful_count"], result["failed_count"], result["failed_indices"]) == (2, 1, {0})
+
+def test_retry_delay_is_read_from_quota_error_details():
+    from google.ads.googleads.errors import GoogleAdsException
+
+    failure = GoogleAdsFailure(errors=[{"details": {"quota_error_details": {"retry_delay": {"seconds": 2, "nanos": 500000000}}}}])
+    mutator = CampaignCriterionMutator(FakeGoogleAdsClient(FakeCampaignCriterionService()), "999")
+    assert mutator._get_retry_delay(GoogleAdsException(None, None, failure, "1")) == 2.5
+    # Clients built with use_proto_plus=False raise raw protobuf failures
+    assert mutator._get_retry_delay(GoogleAdsException(None, None, GoogleAdsFailure.pb(failure), "1")) == 2.5
+    assert mutator._get_retry_delay(GoogleAdsException(None, None, GoogleAdsFailure(errors=[{}]), "1")) is None
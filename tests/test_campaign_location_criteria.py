@@ -0,0 +1,31 @@
+import pytest
+
+from zip_sync.ads_api.campaign_location_criteria import CampaignLocationCriteria
+
+def test_lookups_build_resource_names():
+    criteria = CampaignLocationCriteria("123-456", "7")
+    criteria.add(9000, 9000)
+    criteria.add(1000, 1001)
+
+    assert criteria["1000"] == "customers/123456/campaignCriteria/7~1001"
+    assert "9000" in criteria and "5000" not in criteria
+    assert set(criteria.keys()) == {"1000", "9000"}
+    with pytest.raises(KeyError):
+        criteria["5000"]
+
+def test_duplicate_locations_keep_the_last_criterion():
+    criteria = CampaignLocationCriteria("999", "1")
+    criteria.add(100, 1)
+    criteria.add(100, 2)
+
+    assert len(criteria) == 1
+    assert criteria["100"] == "customers/999/campaignCriteria/1~2"
+
+def test_discard_criteria_removes_them_in_one_pass():
+    criteria = CampaignLocationCriteria("999", "1")
+    for location_id in (300, 100, 200):
+        criteria.add(location_id, location_id + 1)
+
+    assert criteria.discard_criteria({101, 301, 999}) == 2
+    assert dict(criteria) == {"200": "customers/999/campaignCriteria/1~201"}
+    assert criteria.get_criterion_ids() == {201}
@@ -0,0 +1,102 @@
+from zip_sync.ads_api.campaign_location_criteria import CampaignLocationCriteria
+from zip_sync.ads_api.change_status_reader import CriterionStatusChange, CriterionStatusChanges
+from zip_sync.ads_api.criterion_changes import CampaignMutationResult
+from zip_sync.core.update_campaigns import _reconcile_criterion_replica
+from zip_sync.state.criterion_replica import CriterionReplica
+
+def create_criteria(campaign_id, location_ids):
+    criteria = CampaignLocationCriteria("999", campaign_id)
+    for location_id in location_ids:
+        criteria.add(location_id, location_id)
+    return criteria
+
+def create_replica(tmp_path):
+    replica = CriterionReplica("999", full_refresh_every_hours=24, path=str(tmp_path / "replica.json"))
+    replica.replace_all({"1": create_criteria("1", [100, 200]), "2": create_criteria("2", [100])}, "2026-01-01 00:00:00", now=0)
+    return replica
+
+class FakeChangeStatusReader:
+    def __init__(self, changes, location_criteria, truncated=False):
+        self.changes = changes
+        self.location_criteria = location_criteria
+        self.truncated = truncated
+        self.looked_up = []
+        self.windows = []
+
+    def get_criterion_changes(self, since, until):
+        self.windows.append((since, until))
+        return CriterionStatusChanges(self.changes, self.truncated)
+
+    def get_location_criteria(self, changes):
+        self.looked_up.extend(changes)
+        return self.location_criteria
+
+def test_full_refresh_is_due_on_cold_start_and_on_schedule(tmp_path):
+    assert CriterionReplica("999", path=str(tmp_path / "missing.json")).is_full_refresh_due()
+    replica = create_replica(tmp_path)
+    assert not replica.is_full_refresh_due(now=3600)
+    assert replica.is_full_refresh_due(now=24 * 3600)
+
+def test_replica_round_trips_through_the_state_file(tmp_path):
+    create_replica(tmp_path).save()
+    replica = CriterionReplica("999", path=str(tmp_path / "replica.json"))
+    assert dict(replica.get("1")) == {"100": "customers/999/campaignCriteria/1~100", "200": "customers/999/campaignCriteria/1~200"}
+    assert replica.checkpoint == "2026-01-01 00:00:00"
+    assert CriterionReplica("other", path=str(tmp_path / "replica.json")).get("1") is None
+
+def test_mutation_results_are_applied_or_the_campaign_is_dropped(tmp_path):
+    replica = create_replica(tmp_path)
+    campaign_changes = [
+        ("1", ["300"], ["customers/999/campaignCriteria/1~100"]),
+        ("2", ["300"], []),
+    ]
+    results = {
+        "1": CampaignMutationResult("1", added=1, removed=1),
+        "2": CampaignMutationResult("2", failed=1),
+    }
+    replica.apply_mutation_results(campaign_changes, results)
+
+    assert set(replica.get("1")) == {"200", "300"}
+    assert replica.get("2") is None
+    assert replica.get_missing_campaign_ids(["1", "2"]) == ["2"]
+
+def test_reconcile_applies_changes_made_outside_the_sync(tmp_path):
+    replica = create_replica(tmp_path)
+    reader = FakeChangeStatusReader(
+        changes=[
+            CriterionStatusChange("1", 100, "REMOVED"),
+            CriterionStatusChange("1", 200, "ADDED"),
+            CriterionStatusChange("2", 500, "ADDED"),
+            CriterionStatusChange("3", 500, "ADDED"),
+        ],
+        location_criteria=[("2", 500, 500)],
+    )
+
+    assert _reconcile_criterion_replica(replica, reader, "2026-01-02 00:00:00")
+
+    # The window overlaps the last one, for changes that reached change_status late
+    assert reader.windows == [("2025-12-31 23:55:00", "2026-01-02 00:00:00")]
+    # Only the addition that isn't already known, in a replicated campaign, is looked up
+    assert reader.looked_up == [CriterionStatusChange("2", 500, "ADDED")]
+    assert set(replica.get("1")) == {"200"}
+    assert set(replica.get("2")) == {"100", "500"}
+    assert replica.checkpoint == "2026-01-02 00:00:00"
+
+def test_changes_read_twice_are_no_ops(tmp_path):
+    replica = create_replica(tmp_path)
+    reader = FakeChangeStatusReader(
+        changes=[CriterionStatusChange("1", 100, "REMOVED"), CriterionStatusChange("2", 500, "ADDED")],
+        location_criteria=[("2", 500, 500)],
+    )
+    assert _reconcile_criterion_replica(replica, reader, "2026-01-02 00:00:00")
+    reader.looked_up.clear()
+    assert _reconcile_criterion_replica(replica, reader, "2026-01-02 00:15:00")
+
+    assert reader.looked_up == []
+    assert set(replica.get("1")) == {"200"}
+    assert set(replica.get("2")) == {"100", "500"}
+
+def test_reconcile_asks_for_a_full_report_when_changes_are_truncated(tmp_path):
+    replica = create_replica(tmp_path)
+    assert not _reconcile_criterion_replica(replica, FakeChangeStatusReader([], [], truncated=True), "2026-01-02 00:00:00")
+    assert replica.checkpoint == "2026-01-01 00:00:00"
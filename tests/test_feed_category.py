@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from loadtest.fake_http import FEED_PATH, FakeHttpServer
+from zip_sync.data.feed_category import (FeedCategory, get_all_criteria_ids, get_combined_body_hash,
+                                         get_criteria_ids_by_name_pattern, get_worksheet_criteria_ids,
+                                         parse_feed_categories)
+from zip_sync.filter.zip_code_filter import PriceRule
+from zip_sync.state.sync_state import SyncState
+from zip_sync.zip_code_service import fetch_feeds, get_feed_categories
+
+DEFAULT_RULES = [PriceRule(threshold=20)]
+
+def test_parse_feed_categories():
+    categories = parse_feed_categories(
+        '[{"category_id": 149, "campaigns": "%[Appliance]%"},'
+        ' {"category_id": 212, "campaigns": "%[Plumbing]%", "price_threshold": 35, "worksheets": ["Plumbing"]},'
+        ' {"category_id": 300, "campaigns": "%[HVAC]%", "price_rules": "min_call_price>=5"}]',
+        DEFAULT_RULES,
+    )
+    assert categories == [
+        FeedCategory("149", "%[Appliance]%", (PriceRule(threshold=20),)),
+        FeedCategory("212", "%[Plumbing]%", (PriceRule(threshold=35),), ("Plumbing",)),
+        FeedCategory("300", "%[HVAC]%", (PriceRule("min_call_price", ">=", 5),)),
+    ]
+
+@pytest.mark.parametrize("config", [
+    "not json",
+    "[]",
+    '[{"category_id": 149}]',
+    '[{"category_id": 149, "campaigns": "%\'%"}]',
+    '[{"category_id": 149, "campaigns": "a"}, {"category_id": "149", "campaigns": "b"}]',
+])
+def test_invalid_feed_categories_are_rejected(config):
+    with pytest.raises(ValueError):
+        parse_feed_categories(config, DEFAULT_RULES)
+
+def test_default_category_uses_the_price_rules(monkeypatch):
+    monkeypatch.delenv("FEED_CATEGORIES", raising=False)
+    monkeypatch.setenv("PRICE_RULES", "max_call_price>30")
+    assert get_feed_categories() == [FeedCategory("149", "%[Appliance]%", (PriceRule(threshold=30),))]
+
+def test_categories_are_combined_by_campaign_pattern_and_worksheet():
+    categories = [
+        FeedCategory("1", "%[Appliance]%", worksheets=("Appliance",)),
+        FeedCategory("2", "%[Appliance]%"),
+        FeedCategory("3", "%[Plumbing]%", worksheets=("Plumbing", "Appliance")),
+    ]
+    criteria_ids_by_category = {"1": ["100", "200"], "2": ["200", "300"], "3": ["400"]}
+
+    assert get_criteria_ids_by_name_pattern(categories, criteria_ids_by_category) == {
+        "%[Appliance]%": ["100", "200", "300"],
+        "%[Plumbing]%": ["400"],
+    }
+    assert get_worksheet_criteria_ids(categories, criteria_ids_by_category) == {
+        "Appliance": ["100", "200", "400"],
+        "Plumbing": ["400"],
+    }
+    assert get_all_criteria_ids(criteria_ids_by_category) == ["100", "200", "300", "400"]
+
+def test_combined_body_hash_changes_with_the_config():
+    body_hashes = {"1": "a", "2": "b"}
+    categories = [FeedCategory("1"), FeedCategory("2", "%[Plumbing]%")]
+    changed = [FeedCategory("1"), FeedCategory("2", "%[Plumbing]%", (PriceRule(threshold=50),))]
+    assert get_combined_body_hash(categories, body_hashes) == get_combined_body_hash(list(categories), dict(body_hashes))
+    assert get_combined_body_hash(categories, body_hashes) != get_combined_body_hash(changed, body_hashes)
+    assert get_combined_body_hash(categories, body_hashes) != get_combined_body_hash(categories, {"1": "a", "2": "c"})
+
+def test_changed_price_rules_are_not_skipped_with_an_unchanged_feed(monkeypatch, tmp_path):
+    monkeypatch.delenv("FEED_CATEGORIES", raising=False)
+    monkeypatch.delenv("PRICE_RULES", raising=False)
+    monkeypatch.setenv("PRICE_THRESHOLD", "20")
+    get_feed_hash = lambda: get_combined_body_hash(get_feed_categories(), {"149": "unchanged"})
+    sync_state = SyncState(path=str(tmp_path / "sync_state.json"), full_reconcile_every_runs=0, full_reconcile_every_hours=0)
+    sync_state.record_applied("fingerprint", get_feed_hash())
+    assert sync_state.should_skip_feed(get_feed_hash())
+
+    monkeypatch.setenv("PRICE_THRESHOLD", "25")
+    assert not sync_state.should_skip_feed(get_feed_hash())
+    monkeypatch.setenv("PRICE_RULES", "min_call_price>=5")
+    assert not sync_state.should_skip_feed(get_feed_hash())
+
+def test_category_feeds_are_fetched_concurrently(monkeypatch, tmp_path):
+    with FakeHttpServer(latency=0.3) as http_server:
+        http_server.set_feed([{"zip_code": "10001", "max_call_price": 50}])
+        monkeypatch.setenv("FEED_URL", http_server.base_url + FEED_PATH + "?category={category_id}")
+        monkeypatch.setenv("STATE_DIR", str(tmp_path))
+        monkeypatch.setenv("FEED_OFFLINE", "false")
+        categories = [FeedCategory(str(category_id)) for category_id in range(4)]
+
+        started = time.perf_counter()
+        feeds = fetch_feeds(categories)
+        elapsed = time.perf_counter() - started
+
+    assert list(feeds) == ["0", "1", "2", "3"]
+    assert http_server.counter.snapshot()["feed.get"] == 4
+    # Sequential fetches would take at least 4 x 0.3s
+    assert elapsed < 0.9
+    # Each category is cached under its own URL
+    assert len(list((tmp_path / "feed_cache").glob("*.body"))) == 4
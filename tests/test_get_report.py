@@ -0,0 +1,68 @@
+from google.protobuf import field_mask_pb2
+from google.ads.googleads.v20.enums.types.campaign_status import CampaignStatusEnum
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow, SearchGoogleAdsStreamResponse
+
+from zip_sync.ads_api.campaign_criterion_id_fetcher import CampaignCriterionIdFetcher
+from zip_sync.ads_api.report.get_report import GetReport
+
+class FakeGoogleAdsService:
+    def __init__(self, batches):
+        self.batches = batches
+        self.consumed = 0
+
+    def search_stream(self, customer_id, query):
+        for fields, rows in self.batches:
+            self.consumed += 1
+            yield SearchGoogleAdsStreamResponse(
+                results=rows, field_mask=field_mask_pb2.FieldMask(paths=fields))
+
+class FakeGoogleAdsClient:
+    def __init__(self, service):
+        self.service = service
+
+    def get_service(self, name):
+        return self.service
+
+CAMPAIGN_FIELDS = ["campaign.id", "campaign.status"]
+ENABLED = CampaignStatusEnum.CampaignStatus.ENABLED
+
+def campaign_batches():
+    return [
+        (CAMPAIGN_FIELDS, [GoogleAdsRow(campaign={"id": 1, "status": ENABLED})]),
+        (CAMPAIGN_FIELDS, [GoogleAdsRow(campaign={"id": 2, "status": ENABLED})]),
+    ]
+
+def test_iter_batches_yields_each_stream_batch_lazily():
+    service = FakeGoogleAdsService(campaign_batches())
+    batches = GetReport("query", CAMPAIGN_FIELDS, "123-456", FakeGoogleAdsClient(service)).iter_batches()
+
+    assert next(batches) == [{"campaign.id": 1, "campaign.status": "ENABLED"}]
+    assert service.consumed == 1
+    assert next(batches) == [{"campaign.id": 2, "campaign.status": "ENABLED"}]
+
+def test_get_df_matches_iter_rows():
+    report = GetReport("query", CAMPAIGN_FIELDS, "123-456", FakeGoogleAdsClient(FakeGoogleAdsService(campaign_batches())))
+    df = report.get_df()
+    assert df.to_dict("records") == [
+        {"campaign.id": 1, "campaign.status": "ENABLED"},
+        {"campaign.id": 2, "campaign.status": "ENABLED"},
+    ]
+
+def test_criterion_fetcher_builds_map_from_rows():
+    fields = ["campaign.id", "campaign_criterion.criterion_id", "campaign_criterion.location.geo_target_constant"]
+    rows = [
+        GoogleAdsRow(campaign={"id": 1}, campaign_criterion={
+            "criterion_id": 100 + location_id,
+            "location": {"geo_target_constant": f"geoTargetConstants/{location_id}"},
+        })
+        for location_id in (300, 200)
+    ]
+    fetcher = CampaignCriterionIdFetcher(FakeGoogleAdsClient(FakeGoogleAdsService([(fields, rows)])), "999")
+
+    criteria_map = fetcher.get_campaign_location_criteria_for_campaigns(["1", "2"])
+
+    assert criteria_map == {
+        "1": {"200": "customers/999/campaignCriteria/1~300", "300": "customers/999/campaignCriteria/1~400"},
+        "2": {},
+    }
+    assert list(criteria_map["1"]) == ["200", "300"]
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from google.auth.credentials import AnonymousCredentials
+from google.ads.googleads.client import GoogleAdsClient
+from google.ads.googleads.v20.services.services.google_ads_service import GoogleAdsServiceClient
+from google.ads.googleads.v20.services.services.google_ads_service.transports.grpc import GoogleAdsServiceGrpcTransport
+from google.ads.googleads.v20.services.types import campaign_criterion_service
+
+from zip_sync.ads_api.google_ads_client import KEEPALIVE_CHANNEL_OPTIONS, SharedGoogleAdsClient
+
+class FakeClient:
+    login_customer_id = "123"
+
+    def __init__(self):
+        self.service_calls = []
+
+    def get_service(self, name, version="v20"):
+        self.service_calls.append((name, version))
+        return object()
+
+    def get_type(self, name):
+        return campaign_criterion_service.CampaignCriterionOperation()
+
+def test_services_are_created_once_and_shared_across_threads():
+    fake_client = FakeClient()
+    shared_client = SharedGoogleAdsClient(fake_client)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        services = list(executor.map(lambda _: shared_client.get_service("GoogleAdsService"), range(32)))
+
+    assert fake_client.service_calls == [("GoogleAdsService", "v20")]
+    assert all(service is services[0] for service in services)
+    assert shared_client.login_customer_id == "123"
+
+def test_get_type_returns_fresh_instances():
+    shared_client = SharedGoogleAdsClient(FakeClient())
+    first = shared_client.get_type("CampaignCriterionOperation")
+    first.remove = "customers/1/campaignCriteria/1~1"
+    assert shared_client.get_type("CampaignCriterionOperation").remove == ""
+
+def test_services_are_cached_per_version():
+    fake_client = FakeClient()
+    shared_client = SharedGoogleAdsClient(fake_client)
+    assert shared_client.get_service("GoogleAdsService") is shared_client.get_service("GoogleAdsService")
+    assert shared_client.get_service("GoogleAdsService", version="v19") is not shared_client.get_service("GoogleAdsService")
+    assert fake_client.service_calls == [("GoogleAdsService", "v20"), ("GoogleAdsService", "v19")]
+
+def test_channel_options_are_passed_to_the_service_channel(monkeypatch):
+    channel_options = []
+    create_channel = GoogleAdsServiceGrpcTransport.create_channel
+
+    def recording_create_channel(*args, **kwargs):
+        channel_options.extend(kwargs["options"])
+        return create_channel(*args, **kwargs)
+
+    monkeypatch.setattr(GoogleAdsServiceGrpcTransport, "create_channel", recording_create_channel)
+    client = GoogleAdsClient(AnonymousCredentials(), "developer-token", login_customer_id="123", version="v20", use_proto_plus=True)
+    shared_client = SharedGoogleAdsClient(client, KEEPALIVE_CHANNEL_OPTIONS)
+
+    service = shared_client.get_service("GoogleAdsService")
+
+    assert isinstance(service, GoogleAdsServiceClient)
+    assert ("grpc.keepalive_time_ms", 300_000) in channel_options
+    assert ("grpc.keepalive_permit_without_calls", 0) in channel_options
+    assert ("grpc.max_receive_message_length", 64 * 1024 * 1024) in channel_options
@@ -0,0 +1,24 @@
+from zip_sync.utils.import_profiler import parse_importtime, format_report, measure_startup_imports
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   zip_sync.data.zip_index
+import time:      5000 |       9000 |     pandas.core
+import time:      3000 |      12000 |   pandas
+something else on stderr
+"""
+
+def test_parse_importtime():
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+    assert [t.module for t in timings] == ['zip_sync.data.zip_index', 'pandas.core', 'pandas']
+    assert timings[1].self_us == 5000
+    assert timings[2].cumulative_us == 12000
+
+def test_format_report_flags_heavy_packages():
+    report, total_ms, heavy_imported = format_report(parse_importtime(IMPORTTIME_OUTPUT), top=2)
+    assert total_ms == 8.12
+    assert heavy_imported == ['pandas']
+    assert 'pandas.core' in report
+
+def test_startup_path_does_not_import_heavy_packages():
+    _, _, heavy_imported = format_report(measure_startup_imports())
+    assert heavy_imported == []
@@ -0,0 +1,41 @@
+from loadtest.fake_google_ads import FakeGoogleAdsAccount, FakeGoogleAdsClient
+from loadtest.harness import LoadProfile, run_load_test
+
+from zip_sync.ads_api.campaign_criterion_id_fetcher import CampaignCriterionIdFetcher
+
+SMALL_PROFILE = dict(campaigns=2, criteria_per_campaign=200, feed_size=1000, worksheets=2, ads_latency=0, sheets_latency=0)
+
+def test_runs_bring_the_stand_in_account_and_sheets_in_sync():
+    results = run_load_test(LoadProfile(**SMALL_PROFILE))
+    assert [result.error for result in results] == [None, None]
+    for result in results:
+        assert (result.campaigns_in_sync, result.worksheets_in_sync) == (2, 2)
+        assert result.calls["feed.get"] == 1
+        assert result.calls["ads.search_stream"] >= 1
+    assert results[0].calls["ads.mutate_campaign_criteria"] >= 1
+
+def test_quota_errors_are_retried_and_partial_failures_reported():
+    profile = LoadProfile(
+        **SMALL_PROFILE,
+        runs=1,
+        partial_failure_rate=0.05,
+        ads_quota_error_rate=0.3,
+        quota_retry_delay=0.01,
+        # One mutate worker, so the seeded error draws don't depend on how threads interleave
+        environment={"MUTATION_BATCH_SIZE_INITIAL": "50", "MUTATION_REQUESTS_PER_SECOND": "1000", "MUTATION_BURST": "1000", "MUTATION_WORKERS": "1"},
+    )
+    result = run_load_test(profile)[0]
+    assert result.error is None
+    assert result.calls["ads.mutate_campaign_criteria.quota_errors"] > 0
+    assert result.calls["ads.mutate_campaign_criteria.failed_operations"] > 0
+    assert result.campaigns_in_sync < 2
+
+def test_fake_account_answers_the_criterion_report():
+    account = FakeGoogleAdsAccount("999", {"1": [100, 200], "2": [300]})
+    fetcher = CampaignCriterionIdFetcher(FakeGoogleAdsClient(account), "999")
+    criteria_map = fetcher.get_campaign_location_criteria_for_campaigns(["1", "2"])
+    assert dict(criteria_map["1"]) == {
+        "100": "customers/999/campaignCriteria/1~100",
+        "200": "customers/999/campaignCriteria/1~200",
+    }
+    assert list(criteria_map["2"]) == ["300"]
@@ -0,0 +1,59 @@
+import threading
+import pytest
+from zip_sync.utils.rate_limiter import TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def _bucket(rate=2.0, capacity=2.0):
+    clock = FakeClock()
+    return TokenBucket(rate, capacity, initial_backoff=1.0, max_backoff=4.0, clock=clock, sleep=clock.sleep), clock
+
+def test_burst_then_sustained_rate():
+    bucket, clock = _bucket()
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+def test_backoff_pauses_and_grows_until_success():
+    bucket, clock = _bucket()
+    assert bucket.backoff() == 1.0
+    assert bucket.backoff() == 2.0
+    assert bucket.backoff() == 4.0
+    assert bucket.backoff() == 4.0
+    bucket.acquire()
+    # the pause started at t=0 and the longest backoff was 4s, then one token refills at 2/s
+    assert clock.now == pytest.approx(4.5)
+    bucket.record_success()
+    assert bucket.backoff() == 1.0
+
+def test_backoff_uses_suggested_delay():
+    bucket, clock = _bucket()
+    assert bucket.backoff(delay=7.0) == 7.0
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+def test_rejects_capacity_below_one_token():
+    with pytest.raises(ValueError):
+        TokenBucket(2.0, capacity=0.5)
+
+def test_thread_safe():
+    bucket = TokenBucket(rate=1000.0, capacity=1000.0)
+    acquired = []
+    threads = [threading.Thread(target=lambda: acquired.append(bucket.acquire())) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(acquired) == 50
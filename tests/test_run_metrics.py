@@ -0,0 +1,58 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from zip_sync.utils.run_metrics import RunMetrics, get_run_metrics, start_run_metrics
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_stage_durations_add_up():
+    timer = FakeTimer()
+    run_metrics = RunMetrics(clock=lambda: 1000.0, timer=timer)
+    for seconds in (1.5, 2.0):
+        with run_metrics.stage("report"):
+            timer.now += seconds
+    assert run_metrics.snapshot()["stages"] == {"report": 3.5}
+    assert run_metrics.snapshot()["duration_seconds"] == 3.5
+
+def test_counters_are_thread_safe():
+    run_metrics = RunMetrics()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: run_metrics.increment("mutate_operations", 2), range(1000)))
+    assert run_metrics.snapshot()["counters"] == {"mutate_operations": 2000}
+
+def test_prometheus_and_json_lines_output(tmp_path):
+    run_metrics = RunMetrics(clock=lambda: 1000.0)
+    run_metrics.outcome = "applied"
+    run_metrics.add_duration("sheets", 0.25)
+    run_metrics.increment("report_rows", 1200)
+
+    text = run_metrics.to_prometheus()
+    assert 'zip_sync_run_outcome{outcome="applied"} 1' in text
+    assert 'zip_sync_stage_duration_seconds{stage="sheets"} 0.25' in text
+    assert "zip_sync_report_rows 1200" in text
+
+    path = str(tmp_path / "metrics" / "run_metrics.jsonl")
+    run_metrics.write(path, "jsonl")
+    run_metrics.write(path, "jsonl")
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 2
+    assert lines[0]["counters"] == {"report_rows": 1200}
+
+    prom_path = str(tmp_path / "run_metrics.prom")
+    run_metrics.write(prom_path, "prometheus")
+    with open(prom_path) as f:
+        assert "zip_sync_report_rows 1200" in f.read()
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".tmp-")] == []
+
+def test_start_run_metrics_replaces_the_current_run():
+    first = start_run_metrics()
+    first.increment("criteria")
+    second = start_run_metrics()
+    assert get_run_metrics() is second
+    assert second.snapshot()["counters"] == {}
@@ -0,0 +1,100 @@
+import json
+import threading
+
+from zip_sync.utils.run_profiler import (
+    PeakMemoryTracer,
+    Profile,
+    SamplingProfiler,
+    diff_tables,
+    find_previous_profile,
+    format_profile,
+    profile_run,
+    save_profile,
+)
+
+def _make_own_function():
+    """Defines a busy function that looks like it lives in a zip_sync module."""
+    namespace = {"__name__": "zip_sync.fake_module"}
+    exec(
+        "def busy(stop):\n"
+        "    while not stop.is_set():\n"
+        "        sum(range(100))\n",
+        namespace,
+    )
+    return namespace["busy"]
+
+def test_sampler_attributes_samples_to_zip_sync_functions():
+    stop = threading.Event()
+    worker = threading.Thread(target=_make_own_function(), args=(stop,))
+    worker.start()
+    sampler = SamplingProfiler(interval=0.01)
+    try:
+        for _ in range(5):
+            sampler.sample()
+    finally:
+        stop.set()
+        worker.join()
+
+    own, own_cumulative, _ = sampler.get_tables()
+    assert sampler.samples == 5
+    assert own == {"zip_sync.fake_module:busy": 0.05}
+    assert own_cumulative == {"zip_sync.fake_module:busy": 0.05}
+
+def test_sampler_skips_threads_without_zip_sync_code():
+    stop = threading.Event()
+    worker = threading.Thread(target=stop.wait)
+    worker.start()
+    sampler = SamplingProfiler()
+    try:
+        sampler.sample()
+    finally:
+        stop.set()
+        worker.join()
+    assert sampler.samples == 0
+
+def test_memory_tracer_reports_the_peak():
+    tracer = PeakMemoryTracer()
+    tracer.start()
+    try:
+        data = [bytearray(1000) for _ in range(1000)]
+        tracer.check()
+        del data
+    finally:
+        tracer.stop()
+    _, functions = tracer.get_tables()
+    assert tracer.peak_bytes >= 1_000_000
+    assert any(key.startswith("tests/test_run_profiler.py:") and size >= 1_000_000 for key, size in functions.items())
+
+def test_diff_tables_orders_by_largest_change():
+    old = {"a": 1.0, "b": 5.0, "c": 2.0}
+    new = {"a": 1.0, "b": 2.0, "d": 4.0}
+    assert diff_tables(old, new) == [("d", 0, 4.0), ("b", 5.0, 2.0), ("c", 2.0, 0)]
+
+def _make_profile(started_at: float, own: dict) -> Profile:
+    return Profile("cpu", started_at, 10.0, "seconds", sum(own.values()), own, dict(own), dict(own))
+
+def test_save_profile_keeps_the_newest(tmp_path):
+    for day in range(4):
+        run_profile = _make_profile(1_700_000_000 + day * 86400, {"zip_sync.x:f": day})
+        save_profile(run_profile, str(tmp_path), format_profile(run_profile), keep=2)
+
+    assert len(list(tmp_path.glob("*-cpu.json"))) == 2
+    assert len(list(tmp_path.glob("*-cpu.txt"))) == 2
+    with open(find_previous_profile(str(tmp_path), "cpu")) as f:
+        assert json.load(f)["own"] == {"zip_sync.x:f": 3}
+
+def test_report_includes_diff_against_previous():
+    previous = _make_profile(1_700_000_000, {"zip_sync.x:f": 1.0})
+    run_profile = _make_profile(1_700_086_400, {"zip_sync.x:f": 3.5})
+    report = format_profile(run_profile, previous=previous)
+    assert "Biggest changes" in report
+    assert "+2.50 s  zip_sync.x:f" in report
+
+def test_profile_run_respects_sample_rate(tmp_path):
+    with profile_run("cpu", str(tmp_path), sample_rate=0.1, random_value=lambda: 0.5):
+        pass
+    assert not list(tmp_path.iterdir())
+
+    with profile_run("cpu", str(tmp_path), sample_rate=0.1, random_value=lambda: 0.05):
+        pass
+    assert len(list(tmp_path.glob("*-cpu.json"))) == 1
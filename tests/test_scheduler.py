@@ -0,0 +1,31 @@
+from zip_sync.core.scheduler import SyncScheduler
+from zip_sync.state.run_lock import acquire_run_lock
+
+def test_next_delay_accounts_for_run_time_and_jitter():
+    scheduler = SyncScheduler(lambda: None, interval=300, jitter=30, random_uniform=lambda low, high: high)
+    assert scheduler.get_next_delay(elapsed=10) == 320
+    assert scheduler.get_next_delay(elapsed=400) == 0
+
+def test_failed_runs_dont_stop_the_loop():
+    calls = []
+    def run():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+    scheduler = SyncScheduler(run, interval=0.001)
+    scheduler.serve(max_runs=3)
+    assert calls == [0, 1, 2]
+
+def test_stop_ends_the_loop_after_the_current_run():
+    scheduler = SyncScheduler(lambda: scheduler.stop(), interval=3600)
+    scheduler.serve()
+    assert scheduler.runs == 1
+
+def test_run_lock_is_exclusive(tmp_path):
+    path = str(tmp_path / "sync.lock")
+    with acquire_run_lock(path) as acquired:
+        assert acquired
+        with acquire_run_lock(path) as acquired_again:
+            assert not acquired_again
+    with acquire_run_lock(path) as acquired:
+        assert acquired
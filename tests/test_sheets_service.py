@@ -0,0 +1,88 @@
+import threading
+
+from zip_sync.sheets.sheets_service import SheetsService
+from zip_sync.sheets.sheets_snapshot import SheetsSnapshot, diff_column
+
+class FakeSpreadsheet:
+    def __init__(self, columns=None):
+        self.columns = columns or {}
+        self.bodies = []
+        self.reads = []
+        self._lock = threading.Lock()
+
+    def values_batch_get(self, ranges):
+        self.reads.append(ranges)
+        names = [cell_range.split("!")[0].strip("'") for cell_range in ranges]
+        return {"valueRanges": [{"values": [[value] if value else [] for value in self.columns.get(name, [])]} for name in names]}
+
+    def values_batch_update(self, body):
+        with self._lock:
+            self.bodies.append(body)
+
+def create_service(max_cells_per_request=40000, columns=None):
+    sheets_service = SheetsService("credentials.json", "https://docs.google.com/spreadsheets/d/1", max_cells_per_request=max_cells_per_request)
+    spreadsheet = FakeSpreadsheet(columns)
+    sheets_service._spreadsheet = spreadsheet
+    return sheets_service, spreadsheet
+
+def test_every_tab_is_written_in_one_request():
+    sheets_service, spreadsheet = create_service()
+    sheets_service.update_columns(["Campaign 1", "Bob's tab"], ["100", "200"])
+
+    assert len(spreadsheet.bodies) == 1
+    assert spreadsheet.bodies[0]["data"] == [
+        {"range": "'Campaign 1'!A2:A3", "values": [["100"], ["200"]]},
+        {"range": "'Bob''s tab'!A2:A3", "values": [["100"], ["200"]]},
+    ]
+
+def test_large_payloads_are_split_across_requests():
+    sheets_service, spreadsheet = create_service(max_cells_per_request=3)
+    sheets_service.update_columns(["A", "B"], ["1", "2", "3", "4"])
+
+    ranges = sorted(data["range"] for body in spreadsheet.bodies for data in body["data"])
+    assert ranges == ["'A'!A2:A4", "'A'!A5:A5", "'B'!A2:A4", "'B'!A5:A5"]
+    assert all(sum(len(data["values"]) for data in body["data"]) <= 3 for body in spreadsheet.bodies)
+
+def test_spreadsheet_handle_is_reused():
+    sheets_service, spreadsheet = create_service()
+    assert sheets_service.get_spreadsheet() is spreadsheet
+
+def test_diff_column_merges_nearby_changes_and_clears_the_tail():
+    old = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
+    new = ["1", "X", "3", "Y", "5", "6", "7", "8", "9", "10"]
+    assert diff_column(old, new, max_gap=1) == [(1, ["X", "3", "Y"]), (10, [""])]
+    assert diff_column(new, new) == []
+
+def test_snapshot_writes_only_changed_rows(tmp_path):
+    snapshot = SheetsSnapshot("url", path=str(tmp_path / "snapshot.json"))
+    sheets_service, spreadsheet = create_service(columns={"A": ["100", "200", "300", "", "stale"]})
+
+    sheets_service.update_columns(["A"], ["100", "250", "300"], snapshot=snapshot)
+
+    assert len(spreadsheet.reads) == 1
+    assert spreadsheet.bodies[0]["data"] == [{"range": "'A'!A3:A6", "values": [["250"], ["300"], [""], [""]]}]
+
+    sheets_service.update_columns(["A"], ["100", "250", "300", "400"], snapshot=SheetsSnapshot("url", path=str(tmp_path / "snapshot.json")))
+
+    assert len(spreadsheet.reads) == 1
+    assert spreadsheet.bodies[1]["data"] == [{"range": "'A'!A5:A5", "values": [["400"]]}]
+
+def test_snapshot_is_verified_against_the_sheet_when_due(tmp_path):
+    snapshot = SheetsSnapshot("url", verify_every_hours=1, path=str(tmp_path / "snapshot.json"))
+    snapshot.record(SheetsSnapshot.get_key("A", 1, 2), ["100"], verified=True, now=0)
+    sheets_service, spreadsheet = create_service(columns={"A": ["edited by hand"]})
+
+    sheets_service.update_columns(["A"], ["100"], snapshot=snapshot)
+
+    assert spreadsheet.bodies[0]["data"] == [{"range": "'A'!A2:A2", "values": [["100"]]}]
+
+def test_tabs_with_their_own_values_share_one_request(tmp_path):
+    snapshot = SheetsSnapshot("url", path=str(tmp_path / "snapshot.json"))
+    sheets_service, spreadsheet = create_service(columns={"Appliance": ["100"], "Plumbing": ["900"]})
+
+    sheets_service.update_worksheet_columns({"Appliance": ["100", "200"], "Plumbing": ["300"]}, snapshot=snapshot)
+    assert len(spreadsheet.bodies) == 1
+    assert spreadsheet.bodies[0]["data"] == [
+        {"range": "'Appliance'!A3:A3", "values": [["200"]]},
+        {"range": "'Plumbing'!A2:A2", "values": [["300"]]},
+    ]
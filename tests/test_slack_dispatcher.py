@@ -0,0 +1,53 @@
+import threading
+
+from zip_sync.slack.slack_dispatcher import SlackDispatcher
+
+class FakeNotifier:
+    def __init__(self, release=None):
+        self.sent = []
+        self.release = release
+
+    def send_message(self, message, webhook_url):
+        if self.release is not None:
+            self.release.wait()
+        self.sent.append((webhook_url, message))
+
+def test_admin_messages_are_sent_as_one_digest_on_flush():
+    notifier = FakeNotifier()
+    dispatcher = SlackDispatcher(notifier)
+    dispatcher.notify_admin("admin", "Starting")
+    dispatcher.notify_admin("admin", "Finished")
+    assert notifier.sent == []
+
+    assert dispatcher.flush(timeout=5)
+
+    assert len(notifier.sent) == 1
+    webhook_url, digest = notifier.sent[0]
+    assert webhook_url == "admin"
+    lines = digest.split("\n")
+    assert lines[0].endswith("] Starting") and lines[1].endswith("] Finished")
+
+def test_repeated_alerts_are_rate_limited_and_counted():
+    now = [0.0]
+    notifier = FakeNotifier()
+    dispatcher = SlackDispatcher(notifier, alert_cooldown=60, clock=lambda: now[0])
+    dispatcher.notify_alert("alerts", "Error: boom\ntraceback 1")
+    dispatcher.notify_alert("alerts", "Error: boom\ntraceback 2")
+    now[0] = 61
+    dispatcher.notify_alert("alerts", "Error: boom\ntraceback 3")
+    dispatcher.notify_admin("admin", "Finished")
+
+    assert dispatcher.flush(timeout=5)
+
+    alerts = [message for webhook_url, message in notifier.sent if webhook_url == "alerts"]
+    assert alerts == ["Error: boom\ntraceback 1", "Error: boom\ntraceback 3"]
+    assert "Suppressed 1 repeats of alert: Error: boom" in dict(notifier.sent)["admin"]
+
+def test_flush_gives_up_after_the_timeout():
+    release = threading.Event()
+    dispatcher = SlackDispatcher(FakeNotifier(release))
+    dispatcher.notify_alert("alerts", "Slack is slow")
+
+    assert not dispatcher.flush(timeout=0.05)
+    release.set()
+    assert dispatcher.flush(timeout=5)
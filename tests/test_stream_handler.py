@@ -0,0 +1,29 @@
+from google.ads.googleads.v20.enums.types.criterion_type import CriterionTypeEnum
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+
+from zip_sync.ads_api.report.stream_handler import StreamHandler, compile_field_extractors
+
+FIELDS = ["campaign.id", "campaign_criterion.type", "campaign_criterion.location.geo_target_constant", "campaign.missing_field"]
+
+def create_row(campaign_id, geo_target_constant):
+    return GoogleAdsRow(
+        campaign={"id": campaign_id},
+        campaign_criterion={"type_": CriterionTypeEnum.CriterionType.LOCATION, "location": {"geo_target_constant": geo_target_constant}},
+    )
+
+def test_row_to_dict_reads_nested_fields_and_unwraps_enums():
+    output = StreamHandler().row_to_dict(create_row(1, "geoTargetConstants/100"), FIELDS)
+    assert output == {
+        "campaign.id": 1,
+        "campaign_criterion.type": CriterionTypeEnum.CriterionType.LOCATION.value,
+        "campaign_criterion.location.geo_target_constant": "geoTargetConstants/100",
+        "campaign.missing_field": None,
+    }
+
+def test_rows_to_dicts_matches_row_to_dict():
+    rows = [create_row(1, "geoTargetConstants/100"), create_row(2, "geoTargetConstants/200")]
+    stream_handler = StreamHandler()
+    assert stream_handler.rows_to_dicts(rows, FIELDS) == [stream_handler.row_to_dict(row, FIELDS) for row in rows]
+
+def test_extractors_are_cached_by_field_mask():
+    assert compile_field_extractors(tuple(FIELDS)) is compile_field_extractors(tuple(FIELDS))
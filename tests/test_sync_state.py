@@ -0,0 +1,34 @@
+from zip_sync.state.sync_state import SyncState, compute_fingerprint
+
+def test_fingerprint_ignores_order_and_duplicates():
+    assert compute_fingerprint(['2', '1', '2']) == compute_fingerprint(['1', '2'])
+    assert compute_fingerprint(['1', '2']) != compute_fingerprint(['1', '2', '3'])
+    assert compute_fingerprint(['12', '3']) != compute_fingerprint(['1', '23'])
+
+def _sync_state(tmp_path, every_runs=3, every_hours=6):
+    return SyncState(str(tmp_path / "sync_state.json"), every_runs, every_hours)
+
+def test_first_run_is_never_skipped(tmp_path):
+    assert not _sync_state(tmp_path).should_skip(compute_fingerprint(['1']))
+
+def test_skips_unchanged_set_until_reconcile_is_due(tmp_path):
+    fingerprint = compute_fingerprint(['1', '2'])
+    _sync_state(tmp_path).record_applied(fingerprint, now=1000)
+
+    sync_state = _sync_state(tmp_path)
+    assert sync_state.should_skip(fingerprint, now=1060)
+    assert not sync_state.should_skip(compute_fingerprint(['1']), now=1060)
+
+    for _ in range(3):
+        sync_state.record_skipped()
+    assert not _sync_state(tmp_path).should_skip(fingerprint, now=1060)
+
+def test_reconcile_due_after_hours(tmp_path):
+    fingerprint = compute_fingerprint(['1'])
+    _sync_state(tmp_path).record_applied(fingerprint, now=0)
+    assert _sync_state(tmp_path).should_skip(fingerprint, now=6 * 3600 - 1)
+    assert not _sync_state(tmp_path).should_skip(fingerprint, now=6 * 3600)
+
+def test_corrupt_state_file_forces_full_run(tmp_path):
+    (tmp_path / "sync_state.json").write_text("{not json")
+    assert not _sync_state(tmp_path).should_skip(compute_fingerprint(['1']))
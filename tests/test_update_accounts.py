@@ -0,0 +1,98 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import zip_sync.core.update_accounts as update_accounts_module
+from zip_sync.__main__ import _compute_feed_hash, _compute_run_fingerprint
+from zip_sync.core.update_accounts import _get_account_pool, _sync_account, get_account_ids, update_accounts
+from zip_sync.utils.run_metrics import get_run_metrics, start_run_metrics
+
+def _install_fakes(monkeypatch, failing_account_ids=()):
+    """Runs the account syncs one at a time in threads, with a fake update_campaigns."""
+    calls = []
+    messages = []
+
+    def fake_update_campaigns(criteria_ids_by_name_pattern):
+        account_id = os.environ["GOOGLE_ADS_ACCOUNT_ID"]
+        calls.append((account_id, os.environ["STATE_DIR"], os.environ["MUTATION_REQUESTS_PER_SECOND"], criteria_ids_by_name_pattern))
+        if account_id in failing_account_ids:
+            raise RuntimeError("quota exhausted")
+        get_run_metrics().increment("criteria_added", 2)
+        get_run_metrics().add_duration("mutate_requests", 0.5)
+        return True
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(update_accounts_module, "_get_account_pool", lambda max_workers: executor)
+    monkeypatch.setattr(update_accounts_module, "update_campaigns", fake_update_campaigns)
+    monkeypatch.setattr(update_accounts_module, "flush_slack", lambda: True)
+    monkeypatch.setattr(update_accounts_module, "send_admin_slack", messages.append)
+    monkeypatch.setattr(update_accounts_module, "send_alert_slack", messages.append)
+    # The workers change these, so monkeypatch puts them back afterwards
+    monkeypatch.setenv("GOOGLE_ADS_ACCOUNT_ID", "1")
+    monkeypatch.setenv("MUTATION_REQUESTS_PER_SECOND", "4")
+    monkeypatch.setenv("MUTATION_BURST", "4")
+    return calls, messages
+
+def test_accounts_are_synced_with_their_own_state_and_rate_share(monkeypatch, tmp_path):
+    calls, messages = _install_fakes(monkeypatch)
+    monkeypatch.setenv("API_ACTIVE", "true")
+    monkeypatch.setenv("STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("GOOGLE_ADS_ACCOUNT_IDS", "123-456-7890, 222,123-456-7890")
+    monkeypatch.setenv("ACCOUNT_WORKERS", "4")
+    monkeypatch.setenv("MUTATION_REQUESTS_PER_SECOND", "8")
+    run_metrics = start_run_metrics()
+
+    assert get_account_ids() == ["1234567890", "222"]
+    assert update_accounts({"%[Appliance]%": ["100", "200"]}, get_account_ids())
+    assert calls == [
+        ("1234567890", str(tmp_path / "accounts" / "1234567890"), "4.0", {"%[Appliance]%": ["100", "200"]}),
+        ("222", str(tmp_path / "accounts" / "222"), "4.0", {"%[Appliance]%": ["100", "200"]}),
+    ]
+    snapshot = run_metrics.snapshot()
+    assert snapshot["counters"] == {"criteria_added": 4, "accounts_applied": 2}
+    assert snapshot["stages"] == {"mutate_requests": 1.0}
+    assert "Account 222: applied" in messages[0]
+
+def test_failed_account_fails_the_run_and_alerts(monkeypatch, tmp_path):
+    calls, messages = _install_fakes(monkeypatch, failing_account_ids={"222"})
+    monkeypatch.setenv("API_ACTIVE", "true")
+    monkeypatch.setenv("STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("GOOGLE_ADS_ACCOUNT_IDS", "111,222")
+    run_metrics = start_run_metrics()
+
+    assert not update_accounts({"%[Appliance]%": ["100"]}, get_account_ids())
+    assert len(calls) == 2
+    assert run_metrics.snapshot()["counters"] == {"criteria_added": 2, "accounts_applied": 1, "accounts_failed": 1}
+    assert any(message.startswith("Error syncing account 222: quota exhausted") for message in messages)
+
+def test_single_account_mode_runs_in_process(monkeypatch):
+    monkeypatch.delenv("GOOGLE_ADS_ACCOUNT_IDS", raising=False)
+    monkeypatch.delenv("GOOGLE_ADS_MANAGER_ACCOUNT_ID", raising=False)
+    monkeypatch.setenv("API_ACTIVE", "true")
+    monkeypatch.setattr(update_accounts_module, "update_campaigns", lambda criteria_ids_by_name_pattern: criteria_ids_by_name_pattern == {"%[Appliance]%": ["100"]})
+    monkeypatch.setattr(update_accounts_module, "_get_account_pool", None)
+    assert get_account_ids() is None
+    assert update_accounts({"%[Appliance]%": ["100"]}, None)
+
+def test_account_set_is_part_of_the_skip_hashes():
+    criteria_ids_by_name_pattern = {"%[Appliance]%": ["100"]}
+    assert _compute_feed_hash("feed", None) == "feed"
+    assert _compute_feed_hash("feed", ["111"]) != _compute_feed_hash("feed", ["111", "222"])
+    assert _compute_run_fingerprint(criteria_ids_by_name_pattern, {}, ["111"]) != _compute_run_fingerprint(criteria_ids_by_name_pattern, {}, ["111", "222"])
+    assert _compute_run_fingerprint(criteria_ids_by_name_pattern, {}, ["222", "111"]) == _compute_run_fingerprint(criteria_ids_by_name_pattern, {}, ["111", "222"])
+
+def test_worker_process_reports_errors(tmp_path):
+    """Runs a real spawned worker; with no Google Ads config the sync fails, and the failure comes back in the result."""
+    environment = {
+        "GOOGLE_ADS_ACCOUNT_ID": "333",
+        "STATE_DIR": str(tmp_path / "accounts" / "333"),
+        "API_ACTIVE": "true",
+        "TEST_MODE": "false",
+        "CAMPAIGN_LIST_TTL_SECONDS": "0",
+    }
+    try:
+        result = _get_account_pool(1).submit(_sync_account, "333", {"%[Appliance]%": ["100"]}, environment).result(timeout=120)
+    finally:
+        update_accounts_module._discard_account_pool()
+    assert result.account_id == "333"
+    assert not result.applied
+    assert result.error
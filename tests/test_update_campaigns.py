@@ -0,0 +1,110 @@
+import zip_sync.core.update_campaigns as update_campaigns_module
+from zip_sync.ads_api.criterion_changes import CampaignMutationResult
+from zip_sync.core.update_campaigns import (
+    _apply_campaign_criteria_changes, _apply_cross_campaign_batches, _apply_per_campaign, _get_campaign_changes, _log_campaign_results, _split_into_lanes,
+)
+
+class FakeMutator:
+    def __init__(self, fail_campaign_ids=(), rejected_values=()):
+        self.fail_campaign_ids = set(fail_campaign_ids)
+        self.rejected_values = set(rejected_values)
+        self.calls = []
+
+    def add_location_criteria_to_campaign(self, campaign_id, location_criteria_ids):
+        self.calls.append(("add", campaign_id, list(location_criteria_ids)))
+        return self._mutate(campaign_id, location_criteria_ids, "added")
+
+    def remove_location_criteria_from_campaign(self, campaign_id, resource_names):
+        self.calls.append(("remove", campaign_id, list(resource_names)))
+        return self._mutate(campaign_id, resource_names, "removed")
+
+    def _mutate(self, campaign_id, values, succeeded_field):
+        result = CampaignMutationResult(campaign_id)
+        if campaign_id in self.fail_campaign_ids:
+            result.unsent = len(values)
+            return result
+        result.failed = len([value for value in values if value in self.rejected_values])
+        setattr(result, succeeded_field, len(values) - result.failed)
+        return result
+
+    def mutate_criterion_changes(self, changes):
+        self.calls.append(("batch", [(change.campaign_id, change.kind, change.value) for change in changes]))
+        results = {}
+        for change in changes:
+            result = results.setdefault(change.campaign_id, CampaignMutationResult(change.campaign_id))
+            if change.campaign_id in self.fail_campaign_ids:
+                result.unsent += 1
+            else:
+                result.record(change, True)
+        return results
+
+def test_get_campaign_changes(monkeypatch):
+    monkeypatch.setenv("TEST_MODE", "false")
+    campaign_criterion_ids_map = {
+        "1": {"100": "customers/9/campaignCriteria/1~100", "200": "customers/9/campaignCriteria/1~200"},
+        "2": {"100": "customers/9/campaignCriteria/2~100", "300": "customers/9/campaignCriteria/2~300"},
+    }
+    campaign_targets = {campaign_id: {"100", "200"} for campaign_id in ["1", "2", "3"]}
+    changes = _get_campaign_changes(campaign_targets, campaign_criterion_ids_map)
+    changes = [(campaign_id, sorted(add), sorted(remove)) for campaign_id, add, remove in changes]
+    assert changes == [
+        ("2", ["200"], ["customers/9/campaignCriteria/2~300"]),
+        ("3", ["100", "200"], []),
+    ]
+
+def test_apply_campaign_criteria_changes_chunks_and_reports_failure():
+    mutator = FakeMutator()
+    result = _apply_campaign_criteria_changes(mutator, "1", ["a", "b", "c"], ["r1"], lambda: 2)
+    assert (result.added, result.removed, result.failed, result.unsent) == (3, 1, 0, 0)
+    assert mutator.calls == [("add", "1", ["a", "b"]), ("add", "1", ["c"]), ("remove", "1", ["r1"])]
+
+    result = _apply_campaign_criteria_changes(FakeMutator(fail_campaign_ids=["1"]), "1", ["a"], [], lambda: 2)
+    assert (result.added, result.unsent) == (0, 1)
+
+def test_apply_per_campaign_counts_partial_failures():
+    mutator = FakeMutator(rejected_values=["b", "r2"])
+    campaign_changes = [("1", ["a", "b", "c"], ["r1", "r2"]), ("2", ["a"], [])]
+    results = _apply_per_campaign(mutator, campaign_changes, lambda: 2, max_workers=2)
+    assert (results["1"].added, results["1"].removed, results["1"].failed, results["1"].unsent) == (2, 1, 2, 0)
+    assert (results["2"].added, results["2"].failed) == (1, 0)
+    assert not _log_campaign_results(results)
+
+def test_apply_cross_campaign_batches_packs_full_requests():
+    mutator = FakeMutator()
+    campaign_changes = [("1", ["a", "b"], ["r1"]), ("2", ["a", "b"], []), ("3", ["a"], [])]
+    results = _apply_cross_campaign_batches(mutator, campaign_changes, lambda: 4, max_workers=1)
+    assert [(result.added, result.removed) for result in results.values()] == [(2, 1), (2, 0), (1, 0)]
+    assert mutator.calls == [
+        ("batch", [("1", "add", "a"), ("1", "add", "b"), ("1", "remove", "r1"), ("2", "add", "a")]),
+        ("batch", [("2", "add", "b"), ("3", "add", "a")]),
+    ]
+
+def test_apply_cross_campaign_batches_reports_failed_requests():
+    mutator = FakeMutator(fail_campaign_ids=["2"])
+    results = _apply_cross_campaign_batches(mutator, [("1", ["a"], []), ("2", ["a"], [])], lambda: 1, max_workers=2)
+    assert (results["1"].unsent, results["2"].unsent) == (0, 1)
+    assert len(mutator.calls) == 2
+
+def test_each_campaign_is_mutated_by_one_worker():
+    campaign_changes = [("1", ["a", "b", "c"], ["r1"]), ("2", ["a"], []), ("3", ["a", "b"], []), ("4", ["a"], ["r1"])]
+    lanes = _split_into_lanes(campaign_changes, 2)
+    assert [[campaign_id for campaign_id, _, _ in lane] for lane in lanes] == [["1", "2"], ["3", "4"]]
+
+    mutator = FakeMutator()
+    results = _apply_cross_campaign_batches(mutator, campaign_changes, lambda: 3, max_workers=2)
+    campaign_ids_by_request = [{campaign_id for campaign_id, _, _ in call[1]} for call in mutator.calls]
+    assert sorted(map(sorted, campaign_ids_by_request)) == [["1"], ["1", "2"], ["3", "4"], ["4"]]
+    assert (results["1"].added, results["1"].removed, results["4"].removed) == (3, 1, 1)
+
+def test_partially_failed_operations_fail_the_run():
+    assert _log_campaign_results({"1": CampaignMutationResult("1", added=2), "2": CampaignMutationResult("2", removed=1)})
+    assert not _log_campaign_results({"1": CampaignMutationResult("1", added=2), "2": CampaignMutationResult("2", added=1, failed=1)})
+    assert not _log_campaign_results({"1": CampaignMutationResult("1", unsent=1)})
+
+def test_campaigns_matching_several_patterns_target_all_their_criteria(monkeypatch):
+    campaigns_by_pattern = {"%[Appliance]%": ["1", "2"], "%[Plumbing]%": ["2", "3"], "%[HVAC]%": ["2"]}
+    monkeypatch.setattr(update_campaigns_module, "_get_campaign_ids", lambda name_pattern: campaigns_by_pattern[name_pattern])
+    campaign_targets = update_campaigns_module._get_campaign_targets(
+        {"%[Appliance]%": ["100", "200"], "%[Plumbing]%": ["300"], "%[HVAC]%": ["400"]}
+    )
+    assert campaign_targets == {"1": {"100", "200"}, "2": {"100", "200", "300", "400"}, "3": {"300"}}
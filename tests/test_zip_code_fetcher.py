@@ -0,0 +1,73 @@
+import pytest
+from zip_sync.data.feed_cache import FeedCache
+from zip_sync.data.zip_code_fetcher import ZipCodeFetcher
+
+URL = "https://example.com/api/call_category_price_list/149.json"
+BODY = b'[{"zip_code": "12345", "max_call_price": 25}]'
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected status {self.status_code}")
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+def test_conditional_request_and_not_modified(tmp_path):
+    cache = FeedCache(URL, str(tmp_path))
+    session = FakeSession([
+        FakeResponse(200, BODY, {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+        FakeResponse(304),
+    ])
+    fetcher = ZipCodeFetcher(URL, session=session, cache=cache)
+
+    first = fetcher.fetch_feed()
+    assert not first.not_modified
+    assert first.json() == [{"zip_code": "12345", "max_call_price": 25}]
+    assert b"".join(first.iter_chunks(chunk_size=7)) == BODY
+    assert session.requests[0] == {}
+
+    second = fetcher.fetch_feed()
+    assert second.not_modified
+    assert second.body is None
+    assert second.body_hash == first.body_hash
+    assert session.requests[1] == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    assert second.read_body() == BODY
+
+def test_without_cache_sends_no_conditional_headers():
+    session = FakeSession([FakeResponse(200, BODY, {"ETag": '"abc"'})])
+    assert ZipCodeFetcher(URL, session=session).fetch() == [{"zip_code": "12345", "max_call_price": 25}]
+    assert session.requests == [{}]
+
+def test_offline_replays_cache(tmp_path):
+    cache = FeedCache(URL, str(tmp_path))
+    with pytest.raises(ValueError):
+        ZipCodeFetcher(URL, cache=cache, offline=True).fetch_feed()
+
+    cache.store(BODY, etag='"abc"')
+    session = FakeSession([])
+    feed = ZipCodeFetcher(URL, session=session, cache=cache, offline=True).fetch_feed()
+    assert feed.from_cache
+    assert feed.json() == [{"zip_code": "12345", "max_call_price": 25}]
+    assert session.requests == []
@@ -1,5 +1,8 @@
+import json
 import pytest
-from zip_sync.filter.zip_code_filter import is_max_call_price_above_threshold, filter_zip_codes
+from zip_sync.filter.zip_code_filter import (
+    PriceRule, filter_zip_code_entries, filter_zip_code_stream, filter_zip_codes,
+    is_max_call_price_above_threshold, iter_feed_entries, parse_price_rules)
 
 @pytest.mark.parametrize("entry,threshold,expected", [
     ({'max_call_price': 25}, 20, True),
@@ -20,4 +23,38 @@ def test_filter_zip_codes():
         {'zip_code': '34567', 'max_call_price': 'not_a_number'},
         {'zip_code': '45678', 'max_call_price': 21},
     ]
-    assert filter_zip_codes(data) == ['12345', '45678'] 
\ No newline at end of file
+    assert filter_zip_codes(data) == ['12345', '45678'] 
+
+def test_filter_zip_codes_with_rules():
+    data = [
+        {'zip_code': '12345', 'max_call_price': 25, 'min_call_price': 4},
+        {'zip_code': '23456', 'max_call_price': 30, 'min_call_price': 5},
+        {'zip_code': '34567', 'max_call_price': 10, 'min_call_price': 9},
+        {'zip_code': '45678', 'max_call_price': 40},
+    ]
+    assert filter_zip_codes(data, [PriceRule(threshold=9)]) == ['12345', '23456', '34567', '45678']
+    assert filter_zip_codes(data, parse_price_rules('max_call_price>20, min_call_price>=5')) == ['23456']
+    assert filter_zip_codes(data, parse_price_rules('max_call_price<=25')) == ['12345', '34567']
+
+@pytest.mark.parametrize("rule", ['max_call_price', 'max_call_price>abc', '>'])
+def test_invalid_price_rule(rule):
+    with pytest.raises(ValueError):
+        PriceRule.from_string(rule)
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 10000])
+def test_filter_zip_code_stream_matches_filter_zip_codes(chunk_size):
+    data = [{'zip_code': f'{i:05d}', 'max_call_price': i % 40, 'city': 'Montréal'} for i in range(300)]
+    body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    assert list(filter_zip_code_stream(_chunks(body, chunk_size))) == filter_zip_codes(data)
+
+def test_filter_zip_code_entries_batches():
+    data = [{'zip_code': str(i), 'max_call_price': 21 if i % 2 else 0} for i in range(10)]
+    assert list(filter_zip_code_entries(data, batch_size=3)) == ['1', '3', '5', '7', '9']
+
+@pytest.mark.parametrize("body", [b'[{"zip_code": "1", "max_call_price": 25}', b'{"zip_code": "1"}', b'', b'[1, 2]'])
+def test_iter_feed_entries_rejects_invalid_feeds(body):
+    with pytest.raises(ValueError):
+        list(iter_feed_entries([body]))
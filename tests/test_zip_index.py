@@ -0,0 +1,48 @@
+import pytest
+from zip_sync.data.zip_index import ZipIndex, normalize_zip_code, write_zip_index, get_zip_index
+
+@pytest.mark.parametrize("zip_code,expected", [
+    ('01001', 1001),
+    ('1001', 1001),
+    (1001, 1001),
+    (' 90210 ', 90210),
+    ('01001-1234', 1001),
+    ('abcde', None),
+    ('', None),
+    (None, None),
+])
+def test_normalize_zip_code(zip_code, expected):
+    assert normalize_zip_code(zip_code) == expected
+
+@pytest.fixture
+def zip_index(tmp_path):
+    path = str(tmp_path / "zips_index.bin")
+    write_zip_index(path, {'90210': '9031109', '1001': '9001634', '02134': '9001900'})
+    index = ZipIndex(path)
+    yield index
+    index.close()
+
+def test_get(zip_index):
+    assert len(zip_index) == 3
+    assert zip_index.get('01001') == '9001634'
+    assert zip_index.get('1001') == '9001634'
+    assert zip_index.get('2134') == '9001900'
+    assert zip_index.get('90210') == '9031109'
+    assert zip_index.get('12345') is None
+    assert zip_index.get('99999') is None
+    assert zip_index.get('0') is None
+    assert '90210' in zip_index
+
+def test_lookup_many_keeps_order_and_drops_unknown(zip_index):
+    assert zip_index.lookup_many(['90210', '12345', '01001']) == ['9031109', '9001634']
+
+def test_rejects_invalid_file(tmp_path):
+    path = tmp_path / "not_an_index.bin"
+    path.write_bytes(b"zips_dict = {}\n" + b"\x00" * 16)
+    with pytest.raises(ValueError):
+        ZipIndex(str(path))
+
+def test_bundled_index():
+    zip_index = get_zip_index()
+    assert len(zip_index) > 30000
+    assert zip_index.get('01001') == '9001634'
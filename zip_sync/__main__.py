@@ -1,29 +1,198 @@
+import argparse
+import sys
 import traceback
+from typing import Optional
 
-from zip_sync.constants.zips_dict import zips_dict
-from zip_sync.core.update_campaigns import update_campaigns
+from zip_sync.core.scheduler import SyncScheduler
+from zip_sync.core.update_accounts import get_account_ids, update_accounts
 from zip_sync.core.update_google_sheets import update_google_sheets
+from zip_sync.data.feed_category import (get_all_criteria_ids, get_combined_body_hash,
+                                         get_criteria_ids_by_name_pattern, get_worksheet_criteria_ids)
+from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.environment.folder_paths import get_profile_dir_path, get_run_metrics_path
 from zip_sync.environment.load_environment_variables import \
     load_environment_variables
 from zip_sync.slack.send_admin_slack import send_admin_slack
 from zip_sync.slack.send_alert_slack import send_alert_slack
-from zip_sync.zip_code_service import get_zip_codes
+from zip_sync.slack.slack_dispatcher import flush_slack
+from zip_sync.state.run_lock import acquire_run_lock
+from zip_sync.state.sync_state import SyncState, compute_fingerprint
+from zip_sync.utils.import_profiler import profile_imports
+from zip_sync.utils.run_metrics import RunMetrics, start_run_metrics
+from zip_sync.utils.run_profiler import compare_profiles, profile_run
+from zip_sync.zip_code_service import fetch_feeds, get_criteria_ids_by_category, get_feed_categories
 
 
 def main():
+    with acquire_run_lock() as acquired:
+        if not acquired:
+            print("Another sync is already running. Skipping this run.")
+            return
+        load_environment_variables()
+        environment_service = EnvironmentService()
+        with profile_run(
+            environment_service.get_profile_mode(),
+            get_profile_dir_path(),
+            sample_rate=environment_service.get_profile_sample_rate(),
+            top=environment_service.get_profile_top(),
+            keep=environment_service.get_profile_keep(),
+            interval=environment_service.get_profile_interval_ms() / 1000,
+            mem_frames=environment_service.get_profile_mem_frames(),
+        ):
+            _run_sync()
+
+def _run_sync():
+    run_metrics = start_run_metrics()
     try:
         load_environment_variables()
         send_admin_slack("Starting campaign zip code sync")
-        zip_codes = get_zip_codes()
-        criteria_ids = [zips_dict[zip_code] for zip_code in zip_codes if zip_code in zips_dict]
-        update_google_sheets(criteria_ids)
-        update_campaigns(criteria_ids)
+        categories = get_feed_categories()
+        with run_metrics.stage("feed"):
+            feeds = fetch_feeds(categories)
+        # Listed before the skip check, so a new or removed account isn't skipped
+        account_ids = get_account_ids()
+        feed_hash = _compute_feed_hash(
+            get_combined_body_hash(categories, {category_id: feed.body_hash for category_id, feed in feeds.items()}),
+            account_ids,
+        )
+        sync_state = SyncState()
+        if sync_state.should_skip_feed(feed_hash):
+            print("Feed unchanged since the last applied sync. Skipping sheets and campaign sync.")
+            sync_state.record_skipped()
+            run_metrics.outcome = "skipped"
+            return
+
+        with run_metrics.stage("filter"):
+            criteria_ids_by_category = get_criteria_ids_by_category(feeds, categories)
+        criteria_ids = get_all_criteria_ids(criteria_ids_by_category)
+        criteria_ids_by_name_pattern = get_criteria_ids_by_name_pattern(categories, criteria_ids_by_category)
+        worksheet_criteria_ids = get_worksheet_criteria_ids(categories, criteria_ids_by_category)
+        fingerprint = _compute_run_fingerprint(criteria_ids_by_name_pattern, worksheet_criteria_ids, account_ids)
+        if sync_state.should_skip(fingerprint):
+            print(f"Criteria set unchanged ({len(criteria_ids)} criteria). Skipping sheets and campaign sync.")
+            sync_state.record_skipped(feed_hash)
+            run_metrics.outcome = "skipped"
+            return
+
+        with run_metrics.stage("sheets"):
+            update_google_sheets(criteria_ids, worksheet_criteria_ids)
+        with run_metrics.stage("campaigns"):
+            applied = update_accounts(criteria_ids_by_name_pattern, account_ids)
+        if applied:
+            sync_state.record_applied(fingerprint, feed_hash)
+        run_metrics.outcome = "applied" if applied else "incomplete"
     except Exception as e:
+        run_metrics.outcome = "failed"
         send_admin_slack(f"Error updating campaigns with zip codes: {e}\nFull traceback:\n{traceback.format_exc()}")
         send_alert_slack(f"Error updating campaigns with zip codes: {e}\nFull traceback:\n{traceback.format_exc()}")
         raise e
     finally:
-        send_admin_slack("Finished campaign zip code sync")
+        _report_run_metrics(run_metrics)
+        send_admin_slack(f"Finished campaign zip code sync\n{run_metrics.format_summary()}")
+        flush_slack()
+
+def _compute_feed_hash(combined_body_hash: str, account_ids: Optional[list[str]]) -> str:
+    """The feeds' combined hash, plus the accounts they're synced to in multi-account mode."""
+    if account_ids is None:
+        return combined_body_hash
+    return compute_fingerprint([combined_body_hash] + [f"account:{account_id}" for account_id in account_ids])
+
+def _compute_run_fingerprint(criteria_ids_by_name_pattern: dict[str, list[str]], worksheet_criteria_ids: dict[str, list[str]], account_ids: Optional[list[str]] = None) -> str:
+    """
+    Fingerprint of everything the run would write: each campaign pattern's and each named tab's
+    criteria IDs, and the accounts in multi-account mode.
+    """
+    return compute_fingerprint(
+        [f"{name_pattern}\t{criteria_id}" for name_pattern, criteria_ids in criteria_ids_by_name_pattern.items() for criteria_id in criteria_ids]
+        + [f"sheet:{worksheet}\t{criteria_id}" for worksheet, criteria_ids in worksheet_criteria_ids.items() for criteria_id in criteria_ids]
+        + [f"account:{account_id}" for account_id in account_ids or []]
+    )
+
+def _report_run_metrics(run_metrics: RunMetrics):
+    """Write the run's metrics file and alert if the run went over its time budget."""
+    environment_service = EnvironmentService()
+    metrics_format = environment_service.get_run_metrics_format()
+    if metrics_format != "off":
+        path = environment_service.get_run_metrics_path() or get_run_metrics_path(metrics_format)
+        try:
+            run_metrics.write(path, metrics_format)
+        except (OSError, ValueError) as e:
+            print(f"Couldn't write run metrics to {path}: {e}")
+
+    budget_seconds = environment_service.get_run_time_budget_seconds()
+    elapsed_seconds = run_metrics.get_elapsed()
+    if budget_seconds and elapsed_seconds > budget_seconds:
+        send_alert_slack(
+            f"Campaign zip code sync went over its {budget_seconds:.0f}s time budget\n"
+            f"{run_metrics.format_summary()}"
+        )
+
+def serve(interval: Optional[float] = None, jitter: Optional[float] = None):
+    """
+    Runs the sync every `interval` seconds in this process until SIGTERM / SIGINT.
+    Defaults come from SERVE_INTERVAL_SECONDS and SERVE_JITTER_SECONDS.
+    """
+    load_environment_variables()
+    environment_service = EnvironmentService()
+    interval = interval if interval is not None else environment_service.get_serve_interval_seconds()
+    jitter = jitter if jitter is not None else environment_service.get_serve_jitter_seconds()
+
+    scheduler = SyncScheduler(main, interval, jitter)
+    scheduler.install_signal_handlers()
+    print(f"Serving: syncing every {interval:.0f}s (jitter {jitter:.0f}s).")
+    scheduler.serve()
+    flush_slack()
+
+def cli(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="zip_sync", description="Sync eLocal zip codes to Google Ads campaigns")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve"],
+        default="run",
+        help="'run' syncs once (the default), 'serve' keeps syncing on an interval until stopped",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="With serve, seconds between runs (default SERVE_INTERVAL_SECONDS)",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=None,
+        help="With serve, randomly move each run by up to this many seconds (default SERVE_JITTER_SECONDS)",
+    )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Report the import time of the startup path instead of running the sync",
+    )
+    parser.add_argument(
+        "--compare-profiles",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        default=None,
+        help="Print the differences between two saved profiles instead of running the sync",
+    )
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=None,
+        help="With --profile-imports, exit non-zero if startup imports take longer than this",
+    )
+    args = parser.parse_args(argv)
+
+    if args.profile_imports:
+        sys.exit(profile_imports(budget_ms=args.import_budget_ms))
+    if args.compare_profiles:
+        print(compare_profiles(*args.compare_profiles))
+        return
+    if args.command == "serve":
+        serve(args.interval, args.jitter)
+        return
+    main()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
\ No newline at end of file
@@ -0,0 +1,89 @@
+import logging
+import threading
+from typing import Optional
+
+from zip_sync.state.state_file import get_state_file_path, read_state, write_state
+
+# Configure logging for the module
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_STATE_NAME = "mutation_batch_size"
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses how many operations go into each mutate request, based on feedback from the API.
+
+    * Quota errors halve the batch size.
+    * A high partial-failure rate shrinks it, to limit how much a bad batch costs.
+    * Requests slower than the target latency shrink it in proportion.
+    * Full batches that come back well inside the target latency grow it.
+
+    The size is shared by all worker threads and the last good size is persisted between runs.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 1000,
+        min_size: int = 10,
+        max_size: int = 5000,
+        target_latency: float = 10.0,
+        max_failed_fraction: float = 0.1,
+        growth_factor: float = 1.5,
+        state_path: Optional[str] = None,
+    ):
+        if not 0 < min_size <= max_size:
+            raise ValueError("Batch sizes must satisfy 0 < min_size <= max_size")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_failed_fraction = max_failed_fraction
+        self.growth_factor = growth_factor
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._size = self._clamp(initial_size)
+
+    @classmethod
+    def load(cls, initial_size: int = 1000, state_path: Optional[str] = None, **kwargs) -> "AdaptiveBatchSizer":
+        """Creates a sizer starting from the size remembered by the last run, if there is one."""
+        state_path = state_path or get_state_file_path(BATCH_SIZE_STATE_NAME)
+        remembered_size = read_state(state_path).get("size")
+        if isinstance(remembered_size, int):
+            initial_size = remembered_size
+        return cls(initial_size, state_path=state_path, **kwargs)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def record(self, batch_size: int, latency: float, failed_count: int = 0, quota_error: bool = False) -> int:
+        """Adjusts the batch size after a request. Returns the new size."""
+        with self._lock:
+            old_size = self._size
+            failed_fraction = failed_count / batch_size if batch_size else 0.0
+
+            if quota_error:
+                self._size = self._clamp(self._size // 2)
+            elif failed_fraction > self.max_failed_fraction:
+                self._size = self._clamp(int(self._size * 0.75))
+            elif latency > self.target_latency:
+                # Shrink in proportion to how far over target we were, but by at most half
+                self._size = self._clamp(int(self._size * max(0.5, self.target_latency / latency)))
+            elif batch_size >= self._size and latency < self.target_latency / 2:
+                self._size = self._clamp(int(self._size * self.growth_factor))
+
+            if self._size != old_size:
+                logger.info(
+                    f"Mutation batch size {old_size} -> {self._size} "
+                    f"(latency {latency:.2f}s, {failed_count}/{batch_size} failed, quota error: {quota_error})"
+                )
+            return self._size
+
+    def save(self) -> None:
+        """Remembers the current size for the next run."""
+        if self.state_path:
+            write_state(self.state_path, {"size": self.size})
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
@@ -0,0 +1,180 @@
+import logging
+import time
+from typing import Callable, Optional
+from google.ads.googleads.errors import GoogleAdsException
+from zip_sync.ads_api.criterion_changes import ADD, CampaignMutationResult, CriterionChange
+from zip_sync.state.state_file import get_state_file_path, read_state, write_state
+from zip_sync.utils.chunker import chunk_list
+
+# Configure logging for the module
+logger = logging.getLogger(__name__)
+
+# AddBatchJobOperations accepts at most 10,000 operations per call
+ADD_OPERATIONS_CHUNK_SIZE = 5000
+RESULTS_PAGE_SIZE = 1000
+UNFINISHED_BATCH_JOB_NAME = "batch_job"
+
+
+class BatchJobTimeoutError(Exception):
+    pass
+
+
+class BatchJobExecutor:
+    """
+    Applies campaign criterion changes through the Google Ads BatchJobService instead of
+    synchronous mutate requests. Used for very large diffs, where one offline job is far
+    cheaper in time and quota than thousands of mutate calls.
+
+    Has the same mutate_criterion_changes interface as CampaignCriterionMutator.
+
+    A running batch job can't be cancelled, so one that times out is remembered in a state
+    file. Until it has finished, later runs don't submit their changes again.
+    """
+
+    def __init__(
+        self,
+        google_ads_client,
+        customer_id: str,
+        poll_initial_interval: float = 5.0,
+        poll_max_interval: float = 60.0,
+        poll_timeout: float = 600.0,
+        state_path: Optional[str] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            google_ads_client: An initialized GoogleAdsClient instance.
+            customer_id (str): The Google Ads customer ID (without dashes).
+            poll_initial_interval (float): Seconds before the first status check; doubles up to poll_max_interval.
+            poll_timeout (float): Give up waiting for the job after this many seconds.
+            state_path (str): The file remembering a job that timed out. Defaults to one in the state directory.
+        """
+        self._client = google_ads_client
+        self._customer_id = customer_id
+        self._poll_initial_interval = poll_initial_interval
+        self._poll_max_interval = poll_max_interval
+        self._poll_timeout = poll_timeout
+        self._state_path = state_path or get_state_file_path(UNFINISHED_BATCH_JOB_NAME)
+        self._sleep = sleep
+        self._clock = clock
+        self._batch_job_service = self._client.get_service("BatchJobService")
+
+    def mutate_criterion_changes(self, changes: list[CriterionChange]) -> dict[str, CampaignMutationResult]:
+        """
+        Submits the changes as one batch job, waits for it and maps the results back per campaign.
+        Changes with no result (the job failed or timed out) count as unsent, and so do all the
+        changes while an earlier job that timed out is still running.
+        """
+        results = {change.campaign_id: CampaignMutationResult(change.campaign_id) for change in changes}
+        if not changes:
+            return results
+
+        resource_name = None
+        try:
+            if self._is_unfinished_job_running():
+                succeeded_indices = None
+            else:
+                resource_name = self._create_batch_job()
+                succeeded_indices = self._run_batch_job(resource_name, changes)
+        except GoogleAdsException as ex:
+            logger.error(f"Batch job request '{ex.request_id}' failed with status '{ex.error.code().name}'")
+            for error in ex.failure.errors:
+                logger.error(f"Error: {error.message}")
+            succeeded_indices = None
+        except BatchJobTimeoutError as ex:
+            logger.error(str(ex))
+            write_state(self._state_path, {"resource_name": resource_name})
+            succeeded_indices = None
+
+        if succeeded_indices is None:
+            for change in changes:
+                results[change.campaign_id].unsent += 1
+            return results
+
+        for index, change in enumerate(changes):
+            results[change.campaign_id].record(change, index in succeeded_indices)
+        failed_count = len(changes) - len(succeeded_indices)
+        logger.info(f"Batch job finished: {len(succeeded_indices)} operations succeeded, {failed_count} failed")
+        return results
+
+    def _is_unfinished_job_running(self) -> bool:
+        """
+        True if a job that timed out in an earlier run is still running. Once it has finished
+        (or can't be found) it's forgotten, and this run's changes are worked out from the
+        account as it is now.
+        """
+        resource_name = read_state(self._state_path).get("resource_name")
+        if not resource_name:
+            return False
+        query = f"SELECT batch_job.status FROM batch_job WHERE batch_job.resource_name = '{resource_name}'"
+        ga_service = self._client.get_service("GoogleAdsService")
+        rows = list(ga_service.search(customer_id=self._customer_id, query=query))
+        if rows and rows[0].batch_job.status.name == "RUNNING":
+            logger.warning(f"Batch job {resource_name} from an earlier run is still running. Not submitting another.")
+            return True
+        write_state(self._state_path, {})
+        return False
+
+    def _run_batch_job(self, resource_name: str, changes: list[CriterionChange]) -> set[int]:
+        """Uploads the changes to the job, runs it and returns the indices of the operations that succeeded."""
+        self._add_operations(resource_name, changes)
+        campaign_count = len({change.campaign_id for change in changes})
+        logger.info(f"Running batch job {resource_name} with {len(changes)} operations across {campaign_count} campaigns")
+        self._run_and_wait(resource_name)
+        return self._get_succeeded_indices(resource_name, len(changes))
+
+    def _create_batch_job(self) -> str:
+        batch_job_operation = self._client.get_type("BatchJobOperation")
+        batch_job_operation.create = self._client.get_type("BatchJob")
+        response = self._batch_job_service.mutate_batch_job(customer_id=self._customer_id, operation=batch_job_operation)
+        return response.result.resource_name
+
+    def _add_operations(self, resource_name: str, changes: list[CriterionChange]) -> None:
+        sequence_token: Optional[str] = None
+        for chunk in chunk_list(changes, ADD_OPERATIONS_CHUNK_SIZE):
+            mutate_operations = [self._build_mutate_operation(change) for change in chunk]
+            response = self._batch_job_service.add_batch_job_operations(
+                resource_name=resource_name,
+                sequence_token=sequence_token,
+                mutate_operations=mutate_operations,
+            )
+            sequence_token = response.next_sequence_token
+
+    def _build_mutate_operation(self, change: CriterionChange):
+        mutate_operation = self._client.get_type("MutateOperation")
+        campaign_criterion_operation = mutate_operation.campaign_criterion_operation
+        if change.kind == ADD:
+            create_op = campaign_criterion_operation.create
+            create_op.campaign = f"customers/{self._customer_id}/campaigns/{change.campaign_id}"
+            create_op.location.geo_target_constant = f"geoTargetConstants/{change.value}"
+        else:
+            campaign_criterion_operation.remove = change.value
+        return mutate_operation
+
+    def _run_and_wait(self, resource_name: str) -> None:
+        """Starts the job and polls it with exponential backoff until it's done."""
+        operation = self._batch_job_service.run_batch_job(resource_name=resource_name)
+        started_at = self._clock()
+        interval = self._poll_initial_interval
+        while True:
+            self._sleep(interval)
+            if operation.done():
+                return
+            elapsed = self._clock() - started_at
+            if elapsed >= self._poll_timeout:
+                raise BatchJobTimeoutError(f"Batch job {resource_name} did not finish within {self._poll_timeout:.0f}s")
+            logger.info(f"Batch job {resource_name} still running after {elapsed:.0f}s")
+            interval = min(self._poll_max_interval, interval * 2)
+
+    def _get_succeeded_indices(self, resource_name: str, operation_count: int) -> set[int]:
+        succeeded_indices = set()
+        results = self._batch_job_service.list_batch_job_results(
+            request={"resource_name": resource_name, "page_size": RESULTS_PAGE_SIZE}
+        )
+        for result in results:
+            if result.status.code != 0:
+                logger.error(f"Operation {result.operation_index} failed: {result.status.message}")
+            elif result.operation_index < operation_count:
+                succeeded_indices.add(result.operation_index)
+        return succeeded_indices
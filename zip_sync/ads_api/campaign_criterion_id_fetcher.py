@@ -1,28 +1,62 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable
 from google.ads.googleads.errors import GoogleAdsException
+from zip_sync.ads_api.campaign_location_criteria import CampaignLocationCriteria
 from zip_sync.ads_api.report.get_report import GetReport
+from zip_sync.utils.chunker import chunk_list
+from zip_sync.utils.run_metrics import get_run_metrics
 
 # Configure logging for the module
 logger = logging.getLogger(__name__)
 
+
+class CriterionReportError(Exception):
+    """Raised when a shard of the criterion report still fails after its retries."""
+    pass
+
+
 class CampaignCriterionIdFetcher:
     """
     Fetches campaign criterion data, specifically location (geo-target) IDs,
     for a given list of campaign IDs using the Google Ads API reports.
+
+    Campaigns are split into shards, each fetched with its own report stream,
+    and the shards are downloaded in parallel.
     """
 
-    def __init__(self, google_ads_client, customer_id: str):
+    def __init__(
+        self,
+        google_ads_client,
+        customer_id: str,
+        shard_size: int = 500,
+        max_workers: int = 4,
+        max_shard_retries: int = 2,
+        retry_backoff: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         """
         Initializes the CampaignCriterionIdFetcher.
 
         Args:
             google_ads_client: An initialized GoogleAdsClient instance.
             customer_id (str): The Google Ads customer ID (without dashes).
+            shard_size (int): Maximum number of campaigns in each report query.
+            max_workers (int): Maximum number of shard streams open at once.
+            max_shard_retries (int): How many times a failed shard is retried before giving up.
         """
         self._client = google_ads_client
         self._customer_id = customer_id
+        self._shard_size = max(1, shard_size)
+        self._max_workers = max(1, max_workers)
+        self._max_shard_retries = max_shard_retries
+        self._retry_backoff = retry_backoff
+        self._sleep = sleep
 
-    def get_campaign_location_criteria_for_campaigns(self, campaign_ids: list[str]) -> dict[str, dict[str, str]]:
+    def get_campaign_location_criteria_for_campaigns(self, campaign_ids: list[str]) -> dict[str, CampaignLocationCriteria]:
         """
         Retrieves the location (geo-target) criteria for a list of campaigns.
         These are the locations which are being targeted by the campaigns.
@@ -31,21 +65,75 @@ class CampaignCriterionIdFetcher:
             campaign_ids (list[str]): A list of campaign IDs for which to fetch criteria.
 
         Returns:
-            dict[str, dict[str, str]]: A dictionary where keys are campaign IDs (str)
-                                      and values are dictionaries mapping location criteria IDs (str)
+            dict[str, CampaignLocationCriteria]: A dictionary where keys are campaign IDs (str)
+                                      and values map location criteria IDs (str)
                                       to their full resource names (str).
+
+        Raises:
+            CriterionReportError: If a shard failed on every attempt. A partial map would make
+                                  the campaigns in that shard look like they target nothing.
         """
         if not campaign_ids:
             logger.info("No campaign IDs provided. Returning an empty dictionary.")
             return {}
 
+        shards = chunk_list(list(campaign_ids), self._shard_size)
+        logger.info(f"Fetching location criteria for {len(campaign_ids)} campaigns in {len(shards)} shards.")
+
+        run_metrics = get_run_metrics()
+        campaign_criteria_map: dict[str, CampaignLocationCriteria] = {}
+        max_workers = min(self._max_workers, len(shards))
+        with run_metrics.stage("criterion_report"), ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="criteria-report") as executor:
+            # Shards hold disjoint campaigns, so their maps can be merged without conflicts
+            for shard_map in executor.map(self._fetch_shard_with_retries, shards):
+                campaign_criteria_map.update(shard_map)
+        run_metrics.increment("criterion_report_shards", len(shards))
+        run_metrics.increment("criterion_report_criteria", sum(len(criteria) for criteria in campaign_criteria_map.values()))
+
+        if not any(campaign_criteria_map.values()):
+            logger.info("No location criteria found for the specified campaigns.")
+        logger.info(f"Finished fetching location criteria for campaigns. Populated map for {len(campaign_criteria_map)} campaigns.")
+        return campaign_criteria_map
+
+    def _fetch_shard_with_retries(self, campaign_ids: list[str]) -> dict[str, CampaignLocationCriteria]:
+        """Fetches one shard, retrying just that shard with exponential backoff if it fails."""
+        for attempt in range(self._max_shard_retries + 1):
+            try:
+                return self._fetch_shard(campaign_ids)
+            except GoogleAdsException as ex:
+                logger.error(
+                    f"Request with ID '{ex.request_id}' failed when fetching campaign criteria "
+                    f"with status '{ex.error.code().name}' and includes the following errors:"
+                )
+                for error in ex.failure.errors:
+                    logger.error(f"\tError with message '{error.message}'.")
+                    if error.location:
+                        for field_path_element in error.location.field_path_elements:
+                            logger.error(f"\t\tOn field: {field_path_element.field_name}")
+                last_error: Exception = ex
+            except Exception as e:
+                logger.error(f"An unexpected error occurred while fetching campaign criteria: {e}")
+                last_error = e
+
+            if attempt < self._max_shard_retries:
+                get_run_metrics().increment("criterion_report_retries")
+                delay = self._retry_backoff * (2 ** attempt)
+                logger.warning(f"Retrying shard of {len(campaign_ids)} campaigns in {delay:.1f}s (attempt {attempt + 2} of {self._max_shard_retries + 1}).")
+                self._sleep(delay)
+
+        raise CriterionReportError(
+            f"Failed to fetch location criteria for {len(campaign_ids)} campaigns "
+            f"(first campaign ID {campaign_ids[0]}) after {self._max_shard_retries + 1} attempts"
+        ) from last_error
+
+    def _fetch_shard(self, campaign_ids: list[str]) -> dict[str, CampaignLocationCriteria]:
         # Format campaign IDs for the IN clause in GAQL
         formatted_campaign_ids = ", ".join([f"'{cid}'" for cid in campaign_ids])
 
         query = f"""
             SELECT
                 campaign.id,
-                campaign_criterion.resource_name,
+                campaign_criterion.criterion_id,
                 campaign_criterion.location.geo_target_constant
             FROM
                 campaign_criterion
@@ -55,48 +143,30 @@ class CampaignCriterionIdFetcher:
         """
         fields = [
             "campaign.id",
-            "campaign_criterion.resource_name",
+            "campaign_criterion.criterion_id",
             "campaign_criterion.location.geo_target_constant"
         ]
-        campaign_criteria_map: dict[str, dict[str, str]] = {str(cid): {} for cid in campaign_ids}
-
-        logger.info(f"Fetching location criteria for {len(campaign_ids)} campaigns.")
-        try:
-            get_report_service = GetReport(query, fields, self._customer_id, self._client)
-            df = get_report_service.get_df()
-
-            if df.empty:
-                logger.info("No location criteria found for the specified campaigns.")
-                return campaign_criteria_map
-
-            for _, row in df.iterrows():
-                campaign_id = str(row["campaign.id"])
-                resource_name = row["campaign_criterion.resource_name"]
-                geo_target_constant_resource_name = row["campaign_criterion.location.geo_target_constant"]
-                if geo_target_constant_resource_name:
-                    location_id = geo_target_constant_resource_name.split('/')[-1]
-                    if campaign_id in campaign_criteria_map:
-                        campaign_criteria_map[campaign_id][location_id] = resource_name
-                    else:
-                        campaign_criteria_map[campaign_id] = {location_id: resource_name}
-                    logger.debug(f"Found location criterion '{resource_name}' for campaign ID '{campaign_id}'")
-
-            logger.info(f"Finished fetching location criteria for campaigns. Populated map for {len(campaign_criteria_map)} campaigns.")
-
-        except GoogleAdsException as ex:
-            logger.error(
-                f"Request with ID '{ex.request_id}' failed when fetching campaign criteria "
-                f"with status '{ex.error.code().name}' and includes the following errors:"
-            )
-            for error in ex.failure.errors:
-                logger.error(f"\tError with message '{error.message}'.")
-                if error.location:
-                    for field_path_element in error.location.field_path_elements:
-                        logger.error(f"\t\tOn field: {field_path_element.field_name}")
-            return {}
-        except Exception as e:
-            logger.error(f"An unexpected error occurred while fetching campaign criteria: {e}")
-            return {}
+        # Built fresh on every attempt, so a stream that fails halfway leaves nothing behind
+        campaign_criteria_map = {str(cid): CampaignLocationCriteria(self._customer_id, cid) for cid in campaign_ids}
 
+        get_report_service = GetReport(query, fields, self._customer_id, self._client)
+        for batch in get_report_service.iter_batches():
+            self._add_batch_to_map(campaign_criteria_map, batch)
         return campaign_criteria_map
 
+    def _add_batch_to_map(self, campaign_criteria_map: dict[str, CampaignLocationCriteria], batch: list[dict]) -> None:
+        """
+        Adds one report batch to the map. The batch is split into columns and each
+        campaign's run of rows is added in one go.
+        """
+        campaign_ids = [str(row["campaign.id"]) for row in batch]
+        criterion_ids = [row["campaign_criterion.criterion_id"] for row in batch]
+        geo_target_constants = [row["campaign_criterion.location.geo_target_constant"] for row in batch]
+
+        for campaign_id, rows in groupby(zip(campaign_ids, criterion_ids, geo_target_constants), key=itemgetter(0)):
+            criteria = campaign_criteria_map.get(campaign_id)
+            if criteria is None:
+                criteria = campaign_criteria_map[campaign_id] = CampaignLocationCriteria(self._customer_id, campaign_id)
+            for _, criterion_id, geo_target_constant in rows:
+                if geo_target_constant:
+                    criteria.add(int(geo_target_constant.rpartition('/')[2]), criterion_id)
@@ -1,7 +1,13 @@
 import logging
+import time
+from datetime import timedelta
 from typing import Optional
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v20.errors.types import GoogleAdsFailure
+from zip_sync.ads_api.adaptive_batch_sizer import AdaptiveBatchSizer
+from zip_sync.ads_api.criterion_changes import ADD, CampaignMutationResult, CriterionChange
+from zip_sync.utils.rate_limiter import TokenBucket
+from zip_sync.utils.run_metrics import get_run_metrics
 
 # Configure logging for the module
 logger = logging.getLogger(__name__)
@@ -11,64 +17,182 @@ class CampaignCriterionMutator:
     Handles the mutation of campaign criteria in the Google Ads API.
     """
 
-    def __init__(self, google_ads_client, customer_id: str):
+    def __init__(
+        self,
+        google_ads_client,
+        customer_id: str,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_quota_retries: int = 5,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None,
+    ):
         """
         Initializes the CampaignCriterionMutator with a Google Ads client and customer ID.
+        The mutator is safe to share between worker threads.
 
         Args:
             google_ads_client: An initialized GoogleAdsClient instance.
             customer_id (str): The Google Ads customer ID (without dashes).
+            rate_limiter (TokenBucket): Paces mutate requests across all threads using this mutator.
+            max_quota_retries (int): How many times a request is retried after a RESOURCE_EXHAUSTED error.
+            batch_sizer (AdaptiveBatchSizer): Receives latency, partial failure and quota feedback from each request.
         """
         self._client = google_ads_client
         self._customer_id = customer_id
+        self._rate_limiter = rate_limiter
+        self._max_quota_retries = max_quota_retries
+        self._batch_sizer = batch_sizer
         self._campaign_criterion_service = self._client.get_service("CampaignCriterionService")
         
-    def add_location_criteria_to_campaign(self, campaign_id: str, location_criteria_ids: list[str]) -> bool:
+    def add_location_criteria_to_campaign(self, campaign_id: str, location_criteria_ids: list[str]) -> CampaignMutationResult:
         """
         Adds multiple location criteria to a specific campaign.
+        Returns how many were added, failed (partial failure) or unsent (the request failed).
         """
-        operations = []
-        for location_id in location_criteria_ids:
-            campaign_criterion_operation = self._client.get_type("CampaignCriterionOperation")
-            create_op = campaign_criterion_operation.create
-            create_op.campaign = f"customers/{self._customer_id}/campaigns/{campaign_id}"
-            create_op.location.geo_target_constant = f"geoTargetConstants/{location_id}"
-            operations.append(campaign_criterion_operation)
-
+        operations = [self._build_add_operation(campaign_id, location_id) for location_id in location_criteria_ids]
         return self._mutate_criteria(campaign_id, operations, "add")
     
-    def remove_location_criteria_from_campaign(self, campaign_id: str, resource_names: list[str]) -> bool:
+    def remove_location_criteria_from_campaign(self, campaign_id: str, resource_names: list[str]) -> CampaignMutationResult:
         """
         Removes multiple location criteria from a specific campaign.
+        Returns how many were removed, failed (partial failure) or unsent (the request failed).
         """
-        operations = []
-        for resource_name in resource_names:
-            campaign_criterion_operation = self._client.get_type("CampaignCriterionOperation")
-            campaign_criterion_operation.remove = resource_name
-            operations.append(campaign_criterion_operation)
-
+        operations = [self._build_remove_operation(resource_name) for resource_name in resource_names]
         return self._mutate_criteria(campaign_id, operations, "remove")
 
-    def _mutate_criteria(self, campaign_id: str, operations: list, operation_type: str) -> bool:
+    def mutate_criterion_changes(self, changes: list[CriterionChange]) -> dict[str, CampaignMutationResult]:
+        """
+        Sends adds and removes for any number of campaigns in a single request.
+        Per-campaign results are worked out from the indices of the failed operations.
+        If the whole request fails, every change counts as unsent.
+        """
+        results = {change.campaign_id: CampaignMutationResult(change.campaign_id) for change in changes}
+        if not changes:
+            return results
+
+        operations = [
+            self._build_add_operation(change.campaign_id, change.value) if change.kind == ADD
+            else self._build_remove_operation(change.value)
+            for change in changes
+        ]
+        description = f"a batch of {len(operations)} operations across {len(results)} campaigns"
+        logger.info(f"Attempting to mutate {description}")
+
+        result = self._send_operations(operations, description, "mutate")
+        if result is None:
+            for change in changes:
+                results[change.campaign_id].unsent += 1
+            return results
+
+        for index, change in enumerate(changes):
+            results[change.campaign_id].record(change, index not in result["failed_indices"])
+        self._log_mutation_result(result, description, "mutate")
+        return results
+
+    def _build_add_operation(self, campaign_id: str, location_id: str):
+        campaign_criterion_operation = self._client.get_type("CampaignCriterionOperation")
+        create_op = campaign_criterion_operation.create
+        create_op.campaign = f"customers/{self._customer_id}/campaigns/{campaign_id}"
+        create_op.location.geo_target_constant = f"geoTargetConstants/{location_id}"
+        return campaign_criterion_operation
+
+    def _build_remove_operation(self, resource_name: str):
+        campaign_criterion_operation = self._client.get_type("CampaignCriterionOperation")
+        campaign_criterion_operation.remove = resource_name
+        return campaign_criterion_operation
+
+    def _mutate_criteria(self, campaign_id: str, operations: list, operation_type: str) -> CampaignMutationResult:
         """Main entry point for criteria mutations."""
+        campaign_result = CampaignMutationResult(campaign_id)
         if not operations:
             logger.info(f"No criteria to {operation_type} for campaign ID {campaign_id}. Skipping mutation.")
-            return True
+            return campaign_result
         
         logger.info(f"Attempting to {operation_type} {len(operations)} criteria for campaign ID: {campaign_id}")
         
-        try:
-            result = self._execute_criteria_mutation(operations)
-            self._log_mutation_result(result, campaign_id, operation_type)
-            return result["success"]
-        
-        except GoogleAdsException as ex:
-            self._handle_ads_exception(ex, campaign_id, operation_type)
-            return False
-        
-        except Exception as ex:
-            self._handle_unexpected_exception(ex, campaign_id)
-            return False
+        result = self._send_operations(operations, f"campaign {campaign_id}", operation_type)
+        if result is None:
+            campaign_result.unsent = len(operations)
+            return campaign_result
+        self._log_mutation_result(result, f"campaign {campaign_id}", operation_type)
+        if operation_type == "add":
+            campaign_result.added = result["successful_count"]
+        else:
+            campaign_result.removed = result["successful_count"]
+        campaign_result.failed = result["failed_count"]
+        return campaign_result
+
+    def _send_operations(self, operations: list, description: str, operation_type: str) -> Optional[dict]:
+        """
+        Sends one mutate request, pacing it with the rate limiter and retrying after quota errors.
+        Feeds the outcome back to the batch sizer. Returns the result, or None if the request failed.
+        """
+        run_metrics = get_run_metrics()
+        for attempt in range(self._max_quota_retries + 1):
+            try:
+                if self._rate_limiter:
+                    self._rate_limiter.acquire()
+                started_at = time.monotonic()
+                run_metrics.increment("mutate_requests")
+                result = self._execute_criteria_mutation(operations)
+                latency = time.monotonic() - started_at
+                run_metrics.add_duration("mutate_requests", latency)
+                run_metrics.increment("mutate_operations", len(operations))
+                run_metrics.increment("mutate_failed_operations", result["failed_count"])
+                if self._rate_limiter:
+                    self._rate_limiter.record_success()
+                if self._batch_sizer:
+                    self._batch_sizer.record(len(operations), latency, result["failed_count"])
+                return result
+            
+            except GoogleAdsException as ex:
+                run_metrics.add_duration("mutate_requests", time.monotonic() - started_at)
+                quota_error = self._is_quota_error(ex)
+                if quota_error and self._batch_sizer:
+                    self._batch_sizer.record(len(operations), time.monotonic() - started_at, quota_error=True)
+                if quota_error and attempt < self._max_quota_retries:
+                    run_metrics.increment("mutate_retries")
+                    self._back_off(ex, description, attempt)
+                    continue
+                run_metrics.increment("mutate_failed_requests")
+                self._handle_ads_exception(ex, description, operation_type)
+                return None
+            
+            except Exception as ex:
+                run_metrics.increment("mutate_failed_requests")
+                self._handle_unexpected_exception(ex, description)
+                return None
+        return None
+
+    def _is_quota_error(self, ex: GoogleAdsException) -> bool:
+        """True for RESOURCE_EXHAUSTED / quota errors, which are worth retrying after a pause."""
+        if ex.error.code().name == "RESOURCE_EXHAUSTED":
+            return True
+        return any(error.error_code.quota_error for error in ex.failure.errors)
+
+    def _get_retry_delay(self, ex: GoogleAdsException) -> Optional[float]:
+        """Returns the retry delay suggested by the API's quota error details, if there is one."""
+        for error in ex.failure.errors:
+            retry_delay = error.details.quota_error_details.retry_delay
+            # proto-plus messages give the Duration as a timedelta, raw protobuf ones as seconds and nanos
+            if isinstance(retry_delay, timedelta):
+                seconds = retry_delay.total_seconds()
+            else:
+                seconds = retry_delay.seconds + retry_delay.nanos / 1e9
+            if seconds:
+                return seconds
+        return None
+
+    def _back_off(self, ex: GoogleAdsException, description: str, attempt: int) -> None:
+        """Pauses every worker sharing the rate limiter after a quota error."""
+        if self._rate_limiter:
+            delay = self._rate_limiter.backoff(self._get_retry_delay(ex))
+        else:
+            delay = self._get_retry_delay(ex) or 2.0 * (2 ** attempt)
+            time.sleep(delay)
+        logger.warning(
+            f"Quota exhausted mutating criteria for {description}. "
+            f"Retrying in {delay:.1f}s (retry {attempt + 1}/{self._max_quota_retries})"
+        )
 
 
     def _execute_criteria_mutation(self, operations: list) -> dict:
@@ -76,17 +200,18 @@ class CampaignCriterionMutator:
         request = self._build_criteria_mutation_request(operations)
         response = self._campaign_criterion_service.mutate_campaign_criteria(request=request)
         
-        successful_count = len(response.results)
+        # With partial failure enabled, failed operations still get an (empty) entry in
+        # response.results, so failures are counted from the partial failure error instead
+        failed_indices = self._log_partial_failures(response)
         total_count = len(operations)
-        failed_count = total_count - successful_count
-        
-        # Log partial failures if any
-        self._log_partial_failures(response)
+        failed_count = len(failed_indices)
+        successful_count = total_count - failed_count
         
         return {
             "success": True,
             "successful_count": successful_count,
             "failed_count": failed_count,
+            "failed_indices": failed_indices,
             "total_count": total_count
         }
 
@@ -100,32 +225,36 @@ class CampaignCriterionMutator:
         return request
 
 
-    def _log_mutation_result(self, result: dict, campaign_id: str, operation_type: str) -> None:
+    def _log_mutation_result(self, result: dict, description: str, operation_type: str) -> None:
         """Logs mutation results in a clean, readable format."""
         if result["failed_count"] == 0:
-            logger.info(f"Successfully {operation_type}d all {result['successful_count']} criteria for campaign {campaign_id}")
+            logger.info(f"Successfully {operation_type}d all {result['successful_count']} criteria for {description}")
         else:
-            logger.info(f"Successfully {operation_type}d {result['successful_count']} criteria for campaign {campaign_id}")
+            logger.info(f"Successfully {operation_type}d {result['successful_count']} criteria for {description}")
             logger.warning(f"{result['failed_count']} operations failed out of {result['total_count']} total")
 
 
-    def _log_partial_failures(self, response) -> None:
-        """Logs partial failure details in a readable format."""
+    def _log_partial_failures(self, response) -> set[int]:
+        """Logs partial failure details in a readable format. Returns the indices of the failed operations."""
+        failed_indices = set()
         if not response.partial_failure_error:
-            return
+            return failed_indices
         
         try:
-            failure = GoogleAdsFailure.deserialize(response.partial_failure_error.details)
-            for error in failure.errors:
-                operation_index = self._extract_operation_index(error)
-                
-                if operation_index is not None:
-                    logger.error(f"Operation {operation_index} failed: {error.message}")
-                else:
-                    logger.error(f"Operation failed: {error.message}")
+            for detail in response.partial_failure_error.details:
+                failure = GoogleAdsFailure.deserialize(detail.value)
+                for error in failure.errors:
+                    operation_index = self._extract_operation_index(error)
+                    
+                    if operation_index is not None:
+                        failed_indices.add(operation_index)
+                        logger.error(f"Operation {operation_index} failed: {error.message}")
+                    else:
+                        logger.error(f"Operation failed: {error.message}")
         
         except Exception:
             logger.warning(f"Could not parse failure details: {response.partial_failure_error.message}")
+        return failed_indices
 
 
     def _extract_operation_index(self, error) -> Optional[int]:
@@ -140,10 +269,10 @@ class CampaignCriterionMutator:
         return None
 
 
-    def _handle_ads_exception(self, ex: GoogleAdsException, campaign_id: str, operation_type: str) -> None:
+    def _handle_ads_exception(self, ex: GoogleAdsException, description: str, operation_type: str) -> None:
         """Handles Google Ads API exceptions with detailed logging."""
         logger.error(
-            f"Request '{ex.request_id}' failed when {operation_type}ing criteria for campaign {campaign_id} "
+            f"Request '{ex.request_id}' failed when {operation_type}ing criteria for {description} "
             f"with status '{ex.error.code().name}'"
         )
         
@@ -154,6 +283,6 @@ class CampaignCriterionMutator:
                     logger.error(f"  Field: {field_path.field_name}")
 
 
-    def _handle_unexpected_exception(self, ex: Exception, campaign_id: str) -> None:
+    def _handle_unexpected_exception(self, ex: Exception, description: str) -> None:
         """Handles unexpected exceptions."""
-        logger.error(f"Unexpected error mutating criteria for campaign {campaign_id}: {ex}")
\ No newline at end of file
+        logger.error(f"Unexpected error mutating criteria for {description}: {ex}")
\ No newline at end of file
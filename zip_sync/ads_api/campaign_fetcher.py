@@ -1,6 +1,7 @@
 import logging
 from google.ads.googleads.errors import GoogleAdsException
 from zip_sync.ads_api.report.get_report import GetReport # Import your existing GetReport class
+from zip_sync.data.feed_category import DEFAULT_CAMPAIGN_NAME_PATTERN
 
 # Configure logging for the module
 logger = logging.getLogger(__name__)
@@ -10,26 +11,28 @@ class CampaignFetcher:
     Fetches campaign data from the Google Ads API using the GetReport class.
     """
 
-    def __init__(self, google_ads_client, customer_id: str):
+    def __init__(self, google_ads_client, customer_id: str, name_pattern: str = DEFAULT_CAMPAIGN_NAME_PATTERN):
         """
         Initializes the CampaignFetcher with a Google Ads client and customer ID.
 
         Args:
             google_ads_client: An initialized GoogleAdsClient instance.
             customer_id (str): The Google Ads customer ID (without dashes).
+            name_pattern (str): GAQL LIKE pattern the campaign names must match.
         """
         self._client = google_ads_client
         self._customer_id = customer_id
+        self._name_pattern = name_pattern
 
     def get_active_campaign_ids(self) -> list[str]:
         """
         Retrieves the IDs of all active campaigns under the configured customer ID
-        by utilizing the GetReport service.
+        whose names match the name pattern, by utilizing the GetReport service.
 
         Returns:
             list[str]: A list of active campaign IDs.
         """
-        query = """
+        query = f"""
             SELECT
                 campaign.id,
                 campaign.name
@@ -37,7 +40,7 @@ class CampaignFetcher:
                 campaign
             WHERE
                 campaign.status = 'ENABLED'
-                and campaign.name LIKE '%[Appliance]%'
+                and campaign.name LIKE '{self._name_pattern}'
             ORDER BY
                 campaign.id
         """
@@ -48,9 +51,7 @@ class CampaignFetcher:
             fields = ["campaign.id", "campaign.name"]
             get_report_service = GetReport(query, fields, self._customer_id, self._client)
             # Use the GetReport service to execute the query
-            df = get_report_service.get_df()
-
-            active_campaign_ids = df["campaign.id"].tolist()
+            active_campaign_ids = [row["campaign.id"] for row in get_report_service.iter_rows()]
             logger.info(f"Finished fetching active campaigns. Found {len(active_campaign_ids)} active campaigns.")
 
         except GoogleAdsException as ex:
@@ -0,0 +1,77 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Collection, Mapping
+from typing import Iterator
+
+
+class CampaignLocationCriteria(Mapping):
+    """
+    The location criteria targeted by one campaign, as a read-only location ID -> resource name mapping.
+
+    IDs are held in two parallel integer arrays sorted by location ID, and resource names are
+    only built when they're looked up, so a campaign targeting tens of thousands of zip codes
+    costs a few hundred KB instead of a dict of full resource name strings.
+    """
+
+    def __init__(self, customer_id: str, campaign_id: str):
+        self.customer_id = customer_id.replace('-', '')
+        self.campaign_id = str(campaign_id)
+        self._location_ids = array("q")
+        self._criterion_ids = array("q")
+        self._sorted = True
+
+    def add(self, location_id: int, criterion_id: int) -> None:
+        if self._location_ids and location_id <= self._location_ids[-1]:
+            self._sorted = False
+        self._location_ids.append(location_id)
+        self._criterion_ids.append(criterion_id)
+
+    def discard_criteria(self, criterion_ids: Collection[int]) -> int:
+        """Removes the locations with these criterion IDs, in one pass. Returns how many were there."""
+        self._ensure_sorted()
+        kept = [
+            (location_id, criterion_id)
+            for location_id, criterion_id in zip(self._location_ids, self._criterion_ids)
+            if criterion_id not in criterion_ids
+        ]
+        removed = len(self._location_ids) - len(kept)
+        if removed:
+            self._location_ids = array("q", (location_id for location_id, _ in kept))
+            self._criterion_ids = array("q", (criterion_id for _, criterion_id in kept))
+        return removed
+
+    def get_criterion_ids(self) -> set[int]:
+        """The criterion IDs as a set, for checking many of them at once."""
+        return set(self._criterion_ids)
+
+    def iter_ids(self) -> Iterator[tuple[int, int]]:
+        """Yields (location ID, criterion ID) pairs in location ID order."""
+        self._ensure_sorted()
+        return zip(self._location_ids, self._criterion_ids)
+
+    def get_resource_name(self, criterion_id: int) -> str:
+        return f"customers/{self.customer_id}/campaignCriteria/{self.campaign_id}~{criterion_id}"
+
+    def __getitem__(self, location_id: str) -> str:
+        self._ensure_sorted()
+        key = int(location_id)
+        position = bisect_left(self._location_ids, key)
+        if position < len(self._location_ids) and self._location_ids[position] == key:
+            return self.get_resource_name(self._criterion_ids[position])
+        raise KeyError(location_id)
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_sorted()
+        return (str(location_id) for location_id in self._location_ids)
+
+    def __len__(self) -> int:
+        self._ensure_sorted()
+        return len(self._location_ids)
+
+    def _ensure_sorted(self) -> None:
+        if self._sorted:
+            return
+        pairs = sorted(dict(zip(self._location_ids, self._criterion_ids)).items())
+        self._location_ids = array("q", (location_id for location_id, _ in pairs))
+        self._criterion_ids = array("q", (criterion_id for _, criterion_id in pairs))
+        self._sorted = True
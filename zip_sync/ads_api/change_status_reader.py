@@ -0,0 +1,140 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
+from zip_sync.ads_api.report.get_report import GetReport
+from zip_sync.utils.chunker import chunk_list
+
+# Configure logging for the module
+logger = logging.getLogger(__name__)
+
+# change_status queries must have a LIMIT of at most 10,000
+CHANGE_STATUS_LIMIT = 10000
+RESOURCE_NAMES_PER_QUERY = 500
+DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# change_status rows can show up a few minutes after the change, so each window starts this long
+# before the last checkpoint. Reading a change twice is harmless.
+CHANGE_STATUS_OVERLAP_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class CriterionStatusChange:
+    """The latest change to one campaign criterion, from the change_status resource."""
+    campaign_id: str
+    criterion_id: int
+    resource_status: str
+
+
+@dataclass
+class CriterionStatusChanges:
+    changes: list[CriterionStatusChange]
+    # True if the LIMIT was hit, so some changes are missing and a full report is needed
+    truncated: bool = False
+
+
+def parse_campaign_criterion_resource_name(resource_name: str) -> tuple[str, int]:
+    """Splits 'customers/1/campaignCriteria/<campaign ID>~<criterion ID>' into (campaign ID, criterion ID)."""
+    campaign_id, _, criterion_id = resource_name.rpartition("/")[2].partition("~")
+    return campaign_id, int(criterion_id)
+
+
+def get_window_start(checkpoint: str, overlap_seconds: float = CHANGE_STATUS_OVERLAP_SECONDS) -> str:
+    """The start of the change_status window after checkpoint: overlap_seconds earlier."""
+    return (datetime.strptime(checkpoint, DATE_TIME_FORMAT) - timedelta(seconds=overlap_seconds)).strftime(DATE_TIME_FORMAT)
+
+
+class ChangeStatusReader:
+    """
+    Reads which campaign criteria changed in a time window, and the location details of
+    specific criteria, so a local copy of the account's targeting can be kept up to date
+    without re-downloading every criterion.
+    """
+
+    def __init__(self, google_ads_client, customer_id: str):
+        """
+        Args:
+            google_ads_client: An initialized GoogleAdsClient instance.
+            customer_id (str): The Google Ads customer ID (without dashes).
+        """
+        self._client = google_ads_client
+        self._customer_id = customer_id
+        self._time_zone: Optional[str] = None
+
+    def get_account_now(self) -> str:
+        """Returns the current time in the account's time zone, which is what change_status times are in."""
+        if self._time_zone is None:
+            query = "SELECT customer.time_zone FROM customer LIMIT 1"
+            rows = list(GetReport(query, ["customer.time_zone"], self._customer_id, self._client).iter_rows())
+            self._time_zone = rows[0]["customer.time_zone"] if rows else "UTC"
+        return datetime.now(ZoneInfo(self._time_zone)).strftime(DATE_TIME_FORMAT)
+
+    def get_criterion_changes(self, since: str, until: str) -> CriterionStatusChanges:
+        """
+        Returns the latest status of every campaign criterion changed between since and until
+        (account time, inclusive). This includes changes made by the sync itself.
+        """
+        query = f"""
+            SELECT
+                change_status.campaign_criterion,
+                change_status.resource_status,
+                change_status.last_change_date_time
+            FROM
+                change_status
+            WHERE
+                change_status.last_change_date_time >= '{since}'
+                AND change_status.last_change_date_time <= '{until}'
+                AND change_status.resource_type = 'CAMPAIGN_CRITERION'
+            ORDER BY
+                change_status.last_change_date_time
+            LIMIT {CHANGE_STATUS_LIMIT}
+        """
+        fields = ["change_status.campaign_criterion", "change_status.resource_status"]
+        changes = []
+        for row in GetReport(query, fields, self._customer_id, self._client).iter_rows():
+            resource_name = row["change_status.campaign_criterion"]
+            if not resource_name:
+                continue
+            campaign_id, criterion_id = parse_campaign_criterion_resource_name(resource_name)
+            changes.append(CriterionStatusChange(campaign_id, criterion_id, row["change_status.resource_status"]))
+
+        logger.info(f"Found {len(changes)} campaign criterion changes between {since} and {until}.")
+        return CriterionStatusChanges(changes, truncated=len(changes) >= CHANGE_STATUS_LIMIT)
+
+    def get_location_criteria(self, changes: list[CriterionStatusChange]) -> list[tuple[str, int, int]]:
+        """
+        Looks up the criteria that are still location criteria.
+        Returns (campaign ID, location ID, criterion ID) for each one found.
+        """
+        resource_names = [
+            f"customers/{self._customer_id}/campaignCriteria/{change.campaign_id}~{change.criterion_id}"
+            for change in changes
+        ]
+        fields = [
+            "campaign.id",
+            "campaign_criterion.criterion_id",
+            "campaign_criterion.location.geo_target_constant"
+        ]
+        location_criteria = []
+        for chunk in chunk_list(resource_names, RESOURCE_NAMES_PER_QUERY):
+            formatted_resource_names = ", ".join(f"'{resource_name}'" for resource_name in chunk)
+            query = f"""
+                SELECT
+                    campaign.id,
+                    campaign_criterion.criterion_id,
+                    campaign_criterion.location.geo_target_constant
+                FROM
+                    campaign_criterion
+                WHERE
+                    campaign_criterion.type = 'LOCATION'
+                    AND campaign_criterion.resource_name IN ({formatted_resource_names})
+            """
+            for row in GetReport(query, fields, self._customer_id, self._client).iter_rows():
+                geo_target_constant = row["campaign_criterion.location.geo_target_constant"]
+                if geo_target_constant:
+                    location_criteria.append((
+                        str(row["campaign.id"]),
+                        int(geo_target_constant.rpartition('/')[2]),
+                        row["campaign_criterion.criterion_id"],
+                    ))
+        return location_criteria
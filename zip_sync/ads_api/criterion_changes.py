@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+ADD = "add"
+REMOVE = "remove"
+
+
+@dataclass(frozen=True)
+class CriterionChange:
+    """
+    One location criterion change for a campaign.
+    For ADD the value is the geo target constant ID, for REMOVE it's the campaign criterion resource name.
+    """
+    campaign_id: str
+    kind: str
+    value: str
+
+
+@dataclass
+class CampaignMutationResult:
+    """
+    Per-campaign tally of mutate operations across every request they were sent in.
+    `failed` counts partial failures of individual operations, `unsent` counts operations
+    in requests that failed as a whole.
+    """
+    campaign_id: str
+    added: int = 0
+    removed: int = 0
+    failed: int = 0
+    unsent: int = 0
+
+    def record(self, change: CriterionChange, succeeded: bool) -> None:
+        if not succeeded:
+            self.failed += 1
+        elif change.kind == ADD:
+            self.added += 1
+        else:
+            self.removed += 1
+
+    def merge(self, other: "CampaignMutationResult") -> None:
+        self.added += other.added
+        self.removed += other.removed
+        self.failed += other.failed
+        self.unsent += other.unsent
+
+
+def build_criterion_changes(campaign_changes: list[tuple[str, list[str], list[str]]]) -> list[CriterionChange]:
+    """Flattens (campaign ID, criteria to add, resource names to remove) tuples into a single change list."""
+    changes = []
+    for campaign_id, criteria_to_add, resource_names_to_remove in campaign_changes:
+        changes.extend(CriterionChange(campaign_id, ADD, location_id) for location_id in criteria_to_add)
+        changes.extend(CriterionChange(campaign_id, REMOVE, resource_name) for resource_name in resource_names_to_remove)
+    return changes
+
+
+def merge_campaign_results(results: list[dict[str, CampaignMutationResult]]) -> dict[str, CampaignMutationResult]:
+    merged: dict[str, CampaignMutationResult] = {}
+    for result in results:
+        for campaign_id, campaign_result in result.items():
+            merged.setdefault(campaign_id, CampaignMutationResult(campaign_id)).merge(campaign_result)
+    return merged
@@ -0,0 +1,49 @@
+import logging
+from zip_sync.ads_api.report.get_report import GetReport
+
+logger = logging.getLogger(__name__)
+
+class CustomerClientFetcher:
+    """
+    Lists the client accounts under a manager account using the GetReport class.
+    """
+
+    def __init__(self, google_ads_client, manager_customer_id: str):
+        """
+        Initializes the CustomerClientFetcher with a Google Ads client and manager customer ID.
+
+        Args:
+            google_ads_client: An initialized GoogleAdsClient instance.
+            manager_customer_id (str): The manager account's customer ID (without dashes).
+        """
+        self._client = google_ads_client
+        self._manager_customer_id = manager_customer_id
+
+    def get_client_account_ids(self) -> list[str]:
+        """
+        Retrieves the IDs of every enabled, non-manager account under the manager,
+        including ones under sub-managers.
+        Unlike CampaignFetcher, errors are raised rather than returning an empty list,
+        since an empty list would silently sync nothing.
+
+        Returns:
+            list[str]: The client account IDs, in ascending order.
+        """
+        query = """
+            SELECT
+                customer_client.id,
+                customer_client.descriptive_name
+            FROM
+                customer_client
+            WHERE
+                customer_client.status = 'ENABLED'
+                AND customer_client.manager = FALSE
+            ORDER BY
+                customer_client.id
+        """
+        logger.info(f"Fetching client accounts under manager ID: {self._manager_customer_id}")
+        fields = ["customer_client.id", "customer_client.descriptive_name"]
+        get_report_service = GetReport(query, fields, self._manager_customer_id, self._client)
+        account_ids = [str(row["customer_client.id"]) for row in get_report_service.iter_rows()]
+        logger.info(f"Found {len(account_ids)} client accounts.")
+        return account_ids
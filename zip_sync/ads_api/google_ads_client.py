@@ -1,5 +1,31 @@
+import logging
 import os
+import threading
+from importlib import import_module
+from typing import Optional
+import grpc
+from google.ads.googleads import util
 from google.ads.googleads.client import GoogleAdsClient as Client
+from google.ads.googleads.interceptors import ExceptionInterceptor, LoggingInterceptor, MetadataInterceptor
+
+DEFAULT_VERSION = "v20"
+# The library's request logging is configured on this logger
+LOGGER = logging.getLogger("google.ads.googleads.client")
+
+# The same options the Google Ads library gives its own channels
+BASE_CHANNEL_OPTIONS = [
+    ("grpc.max_metadata_size", 16 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    ("SingleThreadedUnaryStream", 1),
+]
+
+# Notice connections that died during a long call. Google's front ends answer more frequent
+# pings, or pings on idle channels, with GOAWAY too_many_pings, so these stay well clear of that.
+KEEPALIVE_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.keepalive_permit_without_calls", 0),
+]
 
 class GoogleAdsClient:
 
@@ -7,4 +33,98 @@ class GoogleAdsClient:
         with open(os.path.join(yaml_path), "r") as f:
             yaml_string = f.read()
             googleads_client = Client.load_from_string(yaml_string, version="v20")
-            return googleads_client
\ No newline at end of file
+            return googleads_client
+
+
+class SharedGoogleAdsClient:
+    """
+    Wraps a GoogleAdsClient so that each service client (and its gRPC channel) is only
+    created once and then reused by every fetcher and mutator, from any thread.
+    The underlying client builds a new channel, with a fresh TLS handshake, on every get_service call.
+
+    With channel_options, channels are built here through the service's transport instead,
+    since the library's get_service has no way to pass channel options.
+
+    Anything other than get_service and get_type is passed through to the wrapped client.
+    """
+
+    def __init__(self, client: Client, channel_options: Optional[list[tuple[str, object]]] = None):
+        self._client = client
+        self._channel_options = channel_options
+        self._lock = threading.Lock()
+        self._services: dict[tuple[str, Optional[str]], object] = {}
+        self._types: dict[str, type] = {}
+
+    def get_service(self, name: str, version: Optional[str] = None):
+        key = (name, version)
+        service = self._services.get(key)
+        if service is None:
+            with self._lock:
+                service = self._services.get(key)
+                if service is None:
+                    service = self._services[key] = self._create_service(name, version)
+        return service
+
+    def get_type(self, name: str):
+        """Returns a new instance of the named type. The type lookup is only done once per name."""
+        type_class = self._types.get(name)
+        if type_class is None:
+            type_class = self._types[name] = type(self._client.get_type(name))
+        return type_class()
+
+    def _create_service(self, name: str, version: Optional[str]):
+        if self._channel_options is None:
+            return self._client.get_service(name) if version is None else self._client.get_service(name, version=version)
+        return create_service_with_channel_options(self._client, name, version, self._channel_options)
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+
+def create_service_with_channel_options(client: Client, name: str, version: Optional[str], channel_options: list[tuple[str, object]]):
+    """
+    Builds a service client the way the library's get_service does, but on a channel with
+    channel_options added to the library's usual limits. Only the generated service's public
+    transport API and the library's exported interceptors are used.
+    """
+    version = client.version or version or DEFAULT_VERSION
+    service_module = import_module(f"google.ads.googleads.{version}.services.services.{util.convert_upper_case_to_snake_case(name)}")
+    service_client_class = getattr(service_module, f"{name}Client")
+    transport_class = service_client_class.get_transport_class()
+    endpoint = client.endpoint or service_client_class.DEFAULT_ENDPOINT
+    channel = transport_class.create_channel(
+        host=endpoint,
+        credentials=client.credentials,
+        options=BASE_CHANNEL_OPTIONS + list(channel_options),
+    )
+    channel = grpc.intercept_channel(
+        channel,
+        MetadataInterceptor(client.developer_token, client.login_customer_id, client.linked_customer_id, client.use_cloud_org_for_api_access),
+        LoggingInterceptor(LOGGER, version, endpoint),
+        ExceptionInterceptor(version, use_proto_plus=client.use_proto_plus),
+    )
+    return service_client_class(transport=transport_class(channel=channel))
+
+
+_shared_client: Optional[SharedGoogleAdsClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_google_ads_client(yaml_path: str, keepalive: bool = True) -> SharedGoogleAdsClient:
+    """Returns the process-wide client, loading the YAML config and building it on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            channel_options = KEEPALIVE_CHANNEL_OPTIONS if keepalive else None
+            _shared_client = SharedGoogleAdsClient(GoogleAdsClient().get(yaml_path), channel_options)
+        return _shared_client
+
+
+def set_shared_google_ads_client(client: Optional[object]) -> None:
+    """
+    Makes every later get_shared_google_ads_client call use `client` (e.g. a local stand-in
+    for load tests) instead of loading the YAML config. None goes back to the real client.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = SharedGoogleAdsClient(client) if client is not None else None
@@ -1,36 +1,59 @@
 import time
-import pandas as pd
-from google.ads.googleads.client import GoogleAdsClient 
+from typing import TYPE_CHECKING, Iterator
 from zip_sync.ads_api.report.stream_handler import StreamHandler
 from zip_sync.ads_api.report.options_enums_mapper import enum_map
-from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.utils.run_metrics import get_run_metrics
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from google.ads.googleads.client import GoogleAdsClient
 
 class GetReport:
 
-    def __init__(self, query, fields, customer_id, google_ads_client: GoogleAdsClient):
+    def __init__(self, query, fields, customer_id, google_ads_client: "GoogleAdsClient"):
         self.query = query
         self.fields = fields
         self.customer_id = customer_id
         self.google_ads_client = google_ads_client
 
-    def get_df(self) -> pd.DataFrame:
-        results = self._get_results()
-        df = pd.DataFrame.from_records(results)
-        df = self._convert_enums_from_integer_to_name(df)
-        return df
-    
-    def _get_results(self, ) -> list[dict]:
+    def get_df(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame.from_records(list(self.iter_rows()))
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Yields each row as a dict of field path -> value, as the stream delivers them."""
+        for batch in self.iter_batches():
+            yield from batch
+
+    def iter_batches(self) -> Iterator[list[dict]]:
+        """
+        Yields the rows of each search_stream batch as soon as it arrives, with enums
+        converted to their names. Only one batch is held in memory at a time.
+        The time spent waiting for and converting batches (not the caller's time) is
+        recorded in the run metrics.
+        """
+        run_metrics = get_run_metrics()
+        run_metrics.increment("report_requests")
+        started_at = time.perf_counter()
         ga_service = self.google_ads_client.get_service("GoogleAdsService")
         customer_id = self.customer_id
         stream = ga_service.search_stream(customer_id=customer_id.replace('-', ''), query=self.query)
-        results = []
+        stream_handler = StreamHandler()
         for batch in stream:
             fields = batch.field_mask.paths
-            for row in batch.results:
-                results.append(StreamHandler().row_to_dict(row, fields))
-        return results
-    
-    def _convert_enums_from_integer_to_name(self, data_frame: pd.DataFrame) -> pd.DataFrame:
-        for field_name in data_frame.columns[data_frame.columns.isin(enum_map.keys())]:
-            data_frame[field_name] = data_frame[field_name].map(enum_map[field_name])
-        return data_frame
\ No newline at end of file
+            rows = stream_handler.rows_to_dicts(batch.results, fields)
+            rows = self._convert_enums_from_integer_to_name(rows, fields)
+            run_metrics.add_duration("report", time.perf_counter() - started_at)
+            run_metrics.increment("report_batches")
+            run_metrics.increment("report_rows", len(rows))
+            yield rows
+            started_at = time.perf_counter()
+        run_metrics.add_duration("report", time.perf_counter() - started_at)
+
+    def _convert_enums_from_integer_to_name(self, rows: list[dict], fields: list[str]) -> list[dict]:
+        enum_fields = [(field_name, enum_map[field_name]) for field_name in fields if field_name in enum_map]
+        for field_name, convert in enum_fields:
+            for row in rows:
+                row[field_name] = convert(row[field_name])
+        return rows
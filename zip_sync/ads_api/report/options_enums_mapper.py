@@ -1,159 +1,82 @@
 """holds ENUM_MAP variable which is a dictionary used to map googe ads api enums form int values to
-names"""
-from google.ads.googleads.v20.enums.types import (
-    gender_type,
-    day_of_week,
-    customer_status,
-    advertising_channel_sub_type,
-    advertising_channel_type,
-    ad_network_type,
-    campaign_experiment_type,
-    bidding_strategy_type,
-    campaign_status,
-    campaign_serving_status,
-    ad_group_status,
-    campaign_status,
-    keyword_match_type,
-    ad_group_criterion_status,
-    quality_score_bucket,
-    ad_group_ad_status,
-    ad_type,
-    ad_strength,
-    device,
-    policy_approval_status,
-    policy_review_status,
-    shared_set_status,
-    shared_set_type,
-    campaign_shared_set_status,
-    search_term_targeting_status,
-    budget_status,
-)
+names
 
-enum_map = {
-    "campaign_criterion.ad_schedule.day_of_week": lambda value: day_of_week.DayOfWeekEnum.DayOfWeek(value).name
-    if value is not None
-    else None,
-    "ad_group_criterion.gender.type": lambda value: gender_type.GenderTypeEnum.GenderType(value).name
-    if value is not None
-    else None,
-    "segments.ad_network_type": lambda value: ad_network_type.AdNetworkTypeEnum.AdNetworkType(value).name
-    if value is not None
-    else None,
-    "customer.status": lambda value: customer_status.CustomerStatusEnum.CustomerStatus(value).name
-    if value is not None
-    else None,
-    "campaign.advertising_channel_sub_type": lambda value: advertising_channel_sub_type.AdvertisingChannelSubTypeEnum.AdvertisingChannelSubType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "campaign.advertising_channel_type": lambda value: advertising_channel_type.AdvertisingChannelTypeEnum.AdvertisingChannelType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "campaign.experiment_type": lambda value: campaign_experiment_type.CampaignExperimentTypeEnum.CampaignExperimentType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "bidding_strategy.type": lambda value: bidding_strategy_type.BiddingStrategyTypeEnum.BiddingStrategyType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "campaign.status": lambda value: campaign_status.CampaignStatusEnum.CampaignStatus(value).name
-    if value is not None
-    else None,
-    "campaign.serving_status": lambda value: campaign_serving_status.CampaignServingStatusEnum.CampaignServingStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group.status": lambda value: ad_group_status.AdGroupStatusEnum.AdGroupStatus(value).name
-    if value is not None
-    else None,
-    "ad_group_criterion.keyword.match_type": lambda value: keyword_match_type.KeywordMatchTypeEnum.KeywordMatchType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_criterion.status": lambda value: ad_group_criterion_status.AdGroupCriterionStatusEnum.AdGroupCriterionStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_criterion.quality_info.creative_quality_score": lambda value: quality_score_bucket.QualityScoreBucketEnum.QualityScoreBucket(
-        value
-    ).name
-    if value is not None
-    else None,
-    "campaign_criterion.keyword.match_type": lambda value: keyword_match_type.KeywordMatchTypeEnum.KeywordMatchType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_criterion.keyword.match_type": lambda value: keyword_match_type.KeywordMatchTypeEnum.KeywordMatchType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "shared_criterion.keyword.match_type": lambda value: keyword_match_type.KeywordMatchTypeEnum.KeywordMatchType(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_ad.status": lambda value: ad_group_ad_status.AdGroupAdStatusEnum.AdGroupAdStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_ad.ad.type": lambda value: ad_type.AdTypeEnum.AdType(value).name
-    if value is not None
-    else None,
-    "ad_group_ad.ad.stregth": lambda value: ad_strength.AdStrengthEnum.AdStrength(value).name
-    if value is not None
-    else None,
-    "ad_group_ad.policy_summary.approval_status": lambda value: policy_approval_status.PolicyApprovalStatusEnum.PolicyApprovalStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_ad.policy_summary.review_status": lambda value: policy_review_status.PolicyReviewStatusEnum.PolicyReviewStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "ad_group_ad.ad.device_preference": lambda value: device.DeviceEnum.Device(value).name
-    if value is not None
-    else None,
-    "search_term_view.status": lambda value: search_term_targeting_status.SearchTermTargetingStatusEnum.SearchTermTargetingStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "shared_set.status": lambda value: shared_set_status.SharedSetStatusEnum.SharedSetStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "shared_set.type": lambda value: shared_set_type.SharedSetTypeEnum.SharedSetType(value).name
-    if value is not None
-    else None,
-    "campaign_shared_set.status": lambda value: campaign_shared_set_status.CampaignSharedSetStatusEnum.CampaignSharedSetStatus(
-        value
-    ).name
-    if value is not None
-    else None,
-    "segments.device": lambda value: device.DeviceEnum.Device(value).name
-    if value is not None
-    else None,
-    "campaign_budget.status": lambda value: budget_status.BudgetStatusEnum.BudgetStatus(value).name
-    if value is not None
-    else None,
-    "campaign.bidding_strategy.type": lambda value: bidding_strategy_type.BiddingStrategyTypeEnum.BiddingStrategyType(
-        value
-    ).name
-    if value is not None
-    else None,
+The enum modules are imported the first time a field's converter is looked up, so importing this
+module doesn't pull in the google.ads enum types.
+"""
+import importlib
+from collections.abc import Mapping
+from typing import Callable, Optional
+
+ENUMS_PACKAGE = "google.ads.googleads.v20.enums.types"
+
+# field name -> (module in ENUMS_PACKAGE, enum name)
+# e.g. ("day_of_week", "DayOfWeek") resolves to day_of_week.DayOfWeekEnum.DayOfWeek
+ENUM_FIELDS = {
+    "campaign_criterion.ad_schedule.day_of_week": ("day_of_week", "DayOfWeek"),
+    "ad_group_criterion.gender.type": ("gender_type", "GenderType"),
+    "segments.ad_network_type": ("ad_network_type", "AdNetworkType"),
+    "customer.status": ("customer_status", "CustomerStatus"),
+    "campaign.advertising_channel_sub_type": ("advertising_channel_sub_type", "AdvertisingChannelSubType"),
+    "campaign.advertising_channel_type": ("advertising_channel_type", "AdvertisingChannelType"),
+    "campaign.experiment_type": ("campaign_experiment_type", "CampaignExperimentType"),
+    "bidding_strategy.type": ("bidding_strategy_type", "BiddingStrategyType"),
+    "campaign.status": ("campaign_status", "CampaignStatus"),
+    "campaign.serving_status": ("campaign_serving_status", "CampaignServingStatus"),
+    "ad_group.status": ("ad_group_status", "AdGroupStatus"),
+    "ad_group_criterion.keyword.match_type": ("keyword_match_type", "KeywordMatchType"),
+    "ad_group_criterion.status": ("ad_group_criterion_status", "AdGroupCriterionStatus"),
+    "ad_group_criterion.quality_info.creative_quality_score": ("quality_score_bucket", "QualityScoreBucket"),
+    "campaign_criterion.keyword.match_type": ("keyword_match_type", "KeywordMatchType"),
+    "shared_criterion.keyword.match_type": ("keyword_match_type", "KeywordMatchType"),
+    "ad_group_ad.status": ("ad_group_ad_status", "AdGroupAdStatus"),
+    "ad_group_ad.ad.type": ("ad_type", "AdType"),
+    "ad_group_ad.ad.stregth": ("ad_strength", "AdStrength"),
+    "ad_group_ad.policy_summary.approval_status": ("policy_approval_status", "PolicyApprovalStatus"),
+    "ad_group_ad.policy_summary.review_status": ("policy_review_status", "PolicyReviewStatus"),
+    "ad_group_ad.ad.device_preference": ("device", "Device"),
+    "search_term_view.status": ("search_term_targeting_status", "SearchTermTargetingStatus"),
+    "shared_set.status": ("shared_set_status", "SharedSetStatus"),
+    "shared_set.type": ("shared_set_type", "SharedSetType"),
+    "campaign_shared_set.status": ("campaign_shared_set_status", "CampaignSharedSetStatus"),
+    "segments.device": ("device", "Device"),
+    "campaign_budget.status": ("budget_status", "BudgetStatus"),
+    "campaign.bidding_strategy.type": ("bidding_strategy_type", "BiddingStrategyType"),
+    "change_status.resource_status": ("change_status_operation", "ChangeStatusOperation"),
 }
+
+
+def _build_converter(module_name: str, enum_name: str) -> Callable[[Optional[int]], Optional[str]]:
+    module = importlib.import_module(f"{ENUMS_PACKAGE}.{module_name}")
+    enum_class = getattr(getattr(module, f"{enum_name}Enum"), enum_name)
+    return lambda value: enum_class(value).name if value is not None else None
+
+
+class LazyEnumMap(Mapping):
+    """
+    Read-only field name -> converter mapping that builds each converter on first access.
+    """
+
+    def __init__(self, enum_fields: dict[str, tuple[str, str]]):
+        self._enum_fields = enum_fields
+        self._converters: dict[str, Callable] = {}
+
+    def __getitem__(self, field_name: str) -> Callable[[Optional[int]], Optional[str]]:
+        converter = self._converters.get(field_name)
+        if converter is None:
+            module_name, enum_name = self._enum_fields[field_name]
+            converter = _build_converter(module_name, enum_name)
+            self._converters[field_name] = converter
+        return converter
+
+    def __iter__(self):
+        return iter(self._enum_fields)
+
+    def __len__(self) -> int:
+        return len(self._enum_fields)
+
+    def __contains__(self, field_name) -> bool:
+        return field_name in self._enum_fields
+
+
+enum_map = LazyEnumMap(ENUM_FIELDS)
@@ -1,30 +1,82 @@
-import inspect
-from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+
+FieldExtractor = Callable[[Any], Any]
+
+
+def _get_attribute(value, attribute):
+    if attribute != 'type':
+        return getattr(value, attribute, None)
+    if hasattr(value, 'type_'):
+        return getattr(value, 'type_', None)
+    return getattr(value, 'type', None)
+
+
+def _compile_field(field: str) -> FieldExtractor:
+    """
+    Builds a callable that reads one dotted field path from a row.
+    A missing attribute anywhere along the path gives None.
+    """
+    attributes = field.split(".")
+    if 'type' not in attributes:
+        get_path = attrgetter(field)
+
+        def extract(row):
+            try:
+                return get_path(row)
+            except AttributeError:
+                return None
+        return extract
+
+    # proto-plus renames `type` fields to `type_`, so these paths are walked one step at a time
+    def extract_with_type(row):
+        value = row
+        for attribute in attributes:
+            value = _get_attribute(value, attribute)
+            if value is None:
+                return None
+        return value
+    return extract_with_type
+
+
+@lru_cache(maxsize=64)
+def compile_field_extractors(fields: tuple[str, ...]) -> tuple[tuple[str, FieldExtractor], ...]:
+    """Compiles the extractors for a field mask once; later batches with the same mask reuse them."""
+    return tuple((field, _compile_field(field)) for field in fields)
 
 
 class StreamHandler:
 
-    def row_to_dict(self, row: GoogleAdsRow, fields: dict[str, list]):
-        """tbd"""
-        split_fields_dict = self._split_fields(fields)
+    def __init__(self):
+        # Whether values of a given type are wrappers (e.g. enums) that should be unwrapped to `.value`
+        self._unwrap_by_type: dict[type, bool] = {}
+
+    def row_to_dict(self, row: "GoogleAdsRow", fields: Iterable[str]) -> dict:
+        """Converts a GoogleAdsRow to a dict of field path -> value."""
+        return self._extract(row, compile_field_extractors(tuple(fields)))
+
+    def rows_to_dicts(self, rows: Iterable["GoogleAdsRow"], fields: Iterable[str]) -> list[dict]:
+        """Converts a batch of rows that share a field mask."""
+        extractors = compile_field_extractors(tuple(fields))
+        return [self._extract(row, extractors) for row in rows]
+
+    def _extract(self, row, extractors: tuple[tuple[str, FieldExtractor], ...]) -> dict:
         output = {}
-        for field, split_field in split_fields_dict.items():
-            value = row
-            for attribute in split_field:
-                value = self._get_attribute(value, attribute)
-                if value is None:
-                    break
-            if value is not None and hasattr(value, "value"):
+        for field, extract in extractors:
+            value = extract(row)
+            if value is not None and self._should_unwrap(value):
                 value = value.value
             output[field] = value
         return output
-    
-    def _get_attribute(self, value, attribute):
-        if attribute != 'type':
-            return getattr(value, attribute, None)
-        if hasattr(value, 'type_'):
-            return getattr(value, 'type_', None)
-        return getattr(value, 'type', None)
-        
-    def _split_fields(self, fields: list) -> dict[str, list]:
-        return {field: field.split(".") for field in fields}
\ No newline at end of file
+
+    def _should_unwrap(self, value) -> bool:
+        value_type = type(value)
+        unwrap: Optional[bool] = self._unwrap_by_type.get(value_type)
+        if unwrap is None:
+            unwrap = hasattr(value, "value")
+            self._unwrap_by_type[value_type] = unwrap
+        return unwrap
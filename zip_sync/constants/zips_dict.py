@@ -1 +0,0 @@
-zips_dict = {'1001': '9001634', '1002': '9001635', '1003': '9001636', '1005': '9001637', '1007': '9001638', '1008': '9001639', '1010': '9001641', '1011': '9001642', '1012': '9001643', '1013': '9001644', '1020': '9001645', '1022': '9001646', '1026': '9001647', '1027': '9001648', '1028': '9001649', '1029': '9001650', '1030': '9001651', '1031': '9001652', '1032': '9001653', '1033': '9001654', '1034': '9001655', '1035': '9001656', '1036': '9001657', '1037': '9001658', '1038': '9001659', '1039': '9001660', '1040': '9001661', '1050': '9001662', '1053': '9001663', '1054': '9001664', '1056': '9001665', '1057': '9001666', '1060': '9001667', '1062': '9001668', '1063': '9001669', '1068': '9001671', '1069': '9001672', '1070': '9001673', '1071': '9001674', '1072': '9001675', '1073': '9001676', '1075': '9001677', '1077': '9001678', '1079': '9001679', '1080': '9001680', '1081': '9001681', '1082': '9001682', '1083': '9001683', '1084': '9001684', '1085': '9001685', '1088': '9001686', '1089': '9001687', '1092': '9001688', '1095': '9001690', '1096': '9001691', '1098': '9001692', '1103': '9001694', '1104': '9001695', '1105': '9001696', '1106': '9001697', '1107': '9001698', '1108': '9001699', '1109': '9001700', '1118': '9001702', '1119': '9001703', '1128': '9001704', '1129': '9001705', '1144': '9001706', '1151': '9001707', '1152': '9001708', '1199': '9001709', '1201': '9001710', '1220': '9001711', '1222': '9001712', '1223': '9001713', '1224': '9001714', '1225': '9001715', '1226': '9001716', '1229': '9001717', '1230': '9001718', '1235': '9001719', '1236': '9001720', '1237': '9001721', '1238': '9001722', '1240': '9001723', '1243': '9001725', '1245': '9001726', '1247': '9001727', '1253': '9001728', '1254': '9001729', '1255': '9001730', '1256': '9001731', '1257': '9001732', '1258': '9001733', '1259': '9001734', '1262': '9001735', '1263': '9001736', '1264': '9001737', '1266': '9001738', '1267': '9001739', '1270': '9001740', '1301': '9001741', '1330': '9001742', '1331': '9001743', '1337': '9001744', '1338': '9001745', '1339': '9001746', '1340': '9001747', '1341': '9001748', '1342': '9001749', '1343': '9001750', '1344': '9001751', '1346': '9001752', '1349': '9001754', '1350': '9001755', '1351': '9001756', '1354': '9001757', '1355': '9001758', '1360': '9001759', '1364': '9001760', '1366': '9001761', '1367': '9001762', '1368': '9001763', '1370': '9001764', '1373': '9001765', '1375': '9001766', '1376': '9001767', '1378': '9001768', '1379': '9001769', '1380': '9001770', '1420': '9001771', '1430': '9001772', '1431': '9001773', '1432': '9001774', '1434': '9001775', '1436': '9001776', '1440': '9001778', '1450': '9001779', '1451': '9001780', '1452': '9001781', '1453': '9001782', '1460': '9001783', '1462': '9001784', '1463': '9001785', '1464': '9001786', '1468': '9001787', '1469': '9001788', '1471': '9001789', '1473': '9001790', '1474': '9001791', '1475': '9001792', '1501': '9001793', '1503': '9001794', '1504': '9001795', '1505': '9001796', '1506': '9001797', '1507': '9001798', '1510': '9001799', '1515': '9001800', '1516': '9001801', '1518': '9001802', '1519': '9001803', '1520': '9001804', '1521': '9001805', '1522': '9001806', '1523': '9001807', '1524': '9001808', '1527': '9001809', '1529': '9001810', '1531': '9001811', '1532': '9001812', '1534': '9001813', '1535': '9001814', '1536': '9001815', '1537': '9001816', '1540': '9001817', '1541': '9001818', '1542': '9001819', '1543': '9001820', '1545': '9001821', '1546': '9001822', '1550': '9001823', '1560': '9001824', '1562': '9001826', '1564': '9001827', '1566': '9001828', '1568': '9001829', '1569': '9001830', '1570': '9001831', '1571': '9001832', '1581': '9001834', '1583': '9001836', '1585': '9001837', '1588': '9001838', '1590': '9001839', '1602': '9001840', '1603': '9001841', '1604': '9001842', '1605': '9001843', '1606': '9001844', '1607': '9001845', '1608': '9001846', '1609': '9001847', '1610': '9001848', '1611': '9001849', '1612': '9001850', '1653': '9001852', '1701': '9001853', '1702': '9001854', '1718': '9001855', '1719': '9001856', '1720': '9001857', '1721': '9001858', '1730': '9001859', '1731': '9001860', '1740': '9001861', '1741': '9001862', '1742': '9001863', '1745': '9001864', '1746': '9001865', '1747': '9001866', '1748': '9001867', '1749': '9001868', '1752': '9001869', '1754': '9001870', '1756': '9001871', '1757': '9001872', '1760': '9001873', '1770': '9001874', '1772': '9001875', '1773': '9001876', '1775': '9001877', '1776': '9001878', '1778': '9001879', '1801': '9001880', '1803': '9001881', '1810': '9001882', '1821': '9001883', '1824': '9001884', '1826': '9001885', '1827': '9001886', '1830': '9001887', '1832': '9001888', '1833': '9001889', '1834': '9001890', '1835': '9001891', '1840': '9001892', '1841': '9001893', '1843': '9001894', '1844': '9001895', '1845': '9001896', '1850': '9001897', '1851': '9001898', '1852': '9001899', '1854': '9001901', '1860': '9001902', '1862': '9001903', '1863': '9001904', '1864': '9001905', '1867': '9001906', '1876': '9001907', '1879': '9001908', '1880': '9001909', '1886': '9001910', '1887': '9001911', '1889': '9001912', '1890': '9001913', '1901': '9001915', '1902': '9001916', '1904': '9001917', '1905': '9001918', '1906': '9001919', '1907': '9001920', '1908': '9001921', '1913': '9001922', '1915': '9001923', '1921': '9001924', '1922': '9001925', '1923': '9001926', '1929': '9001927', '1930': '9001928', '1938': '9001929', '1940': '9001930', '1944': '9001931', '1945': '9001932', '1949': '9001933', '1950': '9001934', '1951': '9001935', '1952': '9001936', '1960': '9001937', '1966': '9001939', '1969': '9001940', '1970': '9001941', '1982': '9001942', '1983': '9001943', '1984': '9001944', '1985': '9001945', '2019': '9001946', '2021': '9001947', '2025': '9001948', '2026': '9001949', '2030': '9001950', '2032': '9001951', '2035': '9001952', '2038': '9001953', '2043': '9001954', '2045': '9001955', '2047': '9001956', '2048': '9001957', '2050': '9001958', '2052': '9001960', '2053': '9001961', '2054': '9001962', '2056': '9001963', '2061': '9001964', '2062': '9001965', '2066': '9001966', '2067': '9001967', '2071': '9001968', '2072': '9001969', '2081': '9001970', '2090': '9001971', '2093': '9001972', '2108': '9001973', '2109': '9001974', '2110': '9001975', '2111': '9001976', '2113': '9001977', '2114': '9001978', '2115': '9001979', '2116': '9001980', '2118': '9001981', '2119': '9001982', '2120': '9001983', '2121': '9001984', '2122': '9001985', '2124': '9001986', '2125': '9001987', '2126': '9001988', '2127': '9001989', '2128': '9001990', '2129': '9001991', '2130': '9001992', '2131': '9001993', '2132': '9001994', '2133': '9001995', '2134': '9001996', '2135': '9001997', '2136': '9001998', '2138': '9001999', '2139': '9002000', '2140': '9002001', '2141': '9002002', '2142': '9002003', '2143': '9002004', '2144': '9002005', '2145': '9002006', '2148': '9002007', '2149': '9002008', '2150': '9002009', '2151': '9002010', '2152': '9002011', '2155': '9002012', '2163': '9002013', '2169': '9002014', '2170': '9002015', '2171': '9002016', '2176': '9002017', '2180': '9002018', '2184': '9002019', '2186': '9002020', '2188': '9002021', '2189': '9002022', '2190': '9002023', '2191': '9002024', '2199': '9002025', '2201': '9002026', '2210': '9002028', '2215': '9002029', '2301': '9002030', '2302': '9002031', '2322': '9002032', '2324': '9002033', '2330': '9002034', '2332': '9002036', '2333': '9002037', '2338': '9002038', '2339': '9002039', '2341': '9002040', '2343': '9002041', '2346': '9002042', '2347': '9002043', '2351': '9002044', '2356': '9002045', '2357': '9002046', '2359': '9002047', '2360': '9002048', '2364': '9002049', '2367': '9002050', '2368': '9002051', '2370': '9002052', '2375': '9002053', '2379': '9002054', '2382': '9002055', '2420': '9002056', '2421': '9002057', '2445': '9002058', '2446': '9002059', '2451': '9002060', '2452': '9002061', '2453': '9002062', '2458': '9002064', '2459': '9002065', '2460': '9002066', '2461': '9002067', '2462': '9002068', '2464': '9002069', '2465': '9002070', '2466': '9002071', '2467': '9002072', '2468': '9002073', '2472': '9002074', '2474': '9002075', '2476': '9002076', '2478': '9002077', '2481': '9002078', '2482': '9002079', '2492': '9002080', '2493': '9002081', '2494': '9002082', '2532': '9002083', '2534': '9002084', '2535': '9002085', '2536': '9002086', '2537': '9002087', '2538': '9002088', '2539': '9002089', '2540': '9002090', '2542': '9002091', '2543': '9002092', '2554': '9002094', '2556': '9002095', '2557': '9002096', '2559': '9002098', '2561': '9002099', '2562': '9002100', '2563': '9002101', '2564': '9002102', '2568': '9002103', '2571': '9002104', '2576': '9002106', '2601': '9002107', '2630': '9002108', '2631': '9002109', '2632': '9002110', '2633': '9002111', '2635': '9002112', '2638': '9002113', '2639': '9002114', '2642': '9002115', '2644': '9002117', '2645': '9002118', '2646': '9002119', '2647': '9002120', '2648': '9002121', '2649': '9002122', '2650': '9002123', '2652': '9002125', '2653': '9002126', '2655': '9002127', '2657': '9002128', '2659': '9002129', '2660': '9002130', '2664': '9002132', '2666': '9002133', '2667': '9002134', '2668': '9002135', '2670': '9002136', '2671': '9002137', '2673': '9002139', '2675': '9002140', '2702': '9002141', '2703': '9002142', '2713': '9002143', '2715': '9002144', '2717': '9002145', '2718': '9002146', '2719': '9002147', '2720': '9002148', '2721': '9002149', '2723': '9002150', '2724': '9002151', '2725': '9002152', '2726': '9002153', '2738': '9002154', '2739': '9002155', '2740': '9002156', '2743': '9002157', '2744': '9002158', '2745': '9002159', '2746': '9002160', '2747': '9002161', '2748': '9002162', '2760': '9002163', '2762': '9002165', '2763': '9002166', '2764': '9002167', '2766': '9002168', '2767': '9002169', '2769': '9002170', '2770': '9002171', '2771': '9002172', '2777': '9002173', '2779': '9002174', '2780': '9002175', '2790': '9002176', '2802': '9002178', '2804': '9002179', '2806': '9002180', '2807': '9002181', '2808': '9002182', '2809': '9002183', '2812': '9002184', '2813': '9002185', '2814': '9002186', '2815': '9002187', '2816': '9002188', '2817': '9002189', '2818': '9002190', '2822': '9002191', '2824': '9002192', '2825': '9002193', '2826': '9002194', '2827': '9002195', '2828': '9002196', '2830': '9002197', '2831': '9002198', '2832': '9002199', '2833': '9002200', '2835': '9002201', '2836': '9002202', '2837': '9002203', '2838': '9002204', '2839': '9002205', '2840': '9002206', '2842': '9002207', '2852': '9002208', '2857': '9002209', '2858': '9002210', '2859': '9002211', '2860': '9002212', '2861': '9002213', '2863': '9002214', '2864': '9002215', '2865': '9002216', '2871': '9002217', '2873': '9002218', '2874': '9002219', '2875': '9002220', '2876': '9002221', '2877': '9002222', '2878': '9002223', '2879': '9002224', '2881': '9002225', '2882': '9002226', '2885': '9002227', '2886': '9002228', '2888': '9002229', '2889': '9002230', '2891': '9002231', '2892': '9002232', '2893': '9002233', '2894': '9002234', '2895': '9002235', '2896': '9002236', '2898': '9002237', '2902': '9002238', '2903': '9002239', '2904': '9002240', '2905': '9002241', '2906': '9002242', '2907': '9002243', '2908': '9002244', '2909': '9002245', '2910': '9002246', '2911': '9002247', '2912': '9002248', '2914': '9002249', '2915': '9002250', '2916': '9002251', '2917': '9002252', '2919': '9002253', '2920': '9002254', '2921': '9002255', '3031': '9002256', '3032': '9002257', '3033': '9002258', '3034': '9002259', '3036': '9002260', '3037': '9002261', '3038': '9002262', '3042': '9002263', '3043': '9002264', '3044': '9002265', '3045': '9002266', '3046': '9002267', '3047': '9002268', '3048': '9002269', '3049': '9002270', '3051': '9002271', '3052': '9002272', '3053': '9002273', '3054': '9002274', '3055': '9002275', '3057': '9002276', '3060': '9002277', '3062': '9002278', '3063': '9002279', '3064': '9002280', '3070': '9002281', '3071': '9002282', '3076': '9002283', '3077': '9002284', '3079': '9002285', '3082': '9002286', '3084': '9002287', '3086': '9002288', '3087': '9002289', '3101': '9002290', '3102': '9002291', '3103': '9002292', '3104': '9002293', '3106': '9002294', '3109': '9002296', '3110': '9002297', '3215': '9002298', '3216': '9002299', '3217': '9002300', '3218': '9002301', '3220': '9002302', '3221': '9002303', '3222': '9002304', '3223': '9002305', '3224': '9002306', '3225': '9002307', '3226': '9002308', '3227': '9002309', '3229': '9002310', '3230': '9002311', '3233': '9002312', '3234': '9002313', '3235': '9002314', '3237': '9002315', '3240': '9002316', '3241': '9002317', '3242': '9002318', '3243': '9002319', '3244': '9002320', '3245': '9002321', '3246': '9002322', '3249': '9002324', '3251': '9002325', '3253': '9002326', '3254': '9002327', '3255': '9002328', '3256': '9002329', '3257': '9002330', '3258': '9002331', '3259': '9002332', '3260': '9002333', '3261': '9002334', '3262': '9002335', '3263': '9002336', '3264': '9002337', '3266': '9002338', '3268': '9002339', '3269': '9002340', '3275': '9002341', '3276': '9002342', '3278': '9002343', '3279': '9002344', '3280': '9002345', '3281': '9002346', '3282': '9002347', '3284': '9002348', '3285': '9002349', '3287': '9002350', '3290': '9002351', '3291': '9002352', '3301': '9002353', '3303': '9002354', '3304': '9002355', '3307': '9002356', '3431': '9002357', '3440': '9002358', '3441': '9002359', '3442': '9002360', '3443': '9002361', '3444': '9002362', '3445': '9002363', '3446': '9002364', '3447': '9002365', '3448': '9002366', '3449': '9002367', '3450': '9002368', '3451': '9002369', '3452': '9002370', '3455': '9002371', '3456': '9002372', '3457': '9002373', '3458': '9002374', '3461': '9002375', '3462': '9002376', '3464': '9002377', '3465': '9002378', '3466': '9002379', '3467': '9002380', '3470': '9002381', '3561': '9002382', '3570': '9002383', '3574': '9002384', '3575': '9002385', '3576': '9002386', '3579': '9002387', '3580': '9002388', '3581': '9002389', '3582': '9002390', '3583': '9002391', '3584': '9002392', '3585': '9002393', '3586': '9002394', '3588': '9002395', '3590': '9002396', '3592': '9002397', '3595': '9002398', '3598': '9002399', '3601': '9002400', '3602': '9002401', '3603': '9002402', '3605': '9002403', '3607': '9002404', '3608': '9002405', '3609': '9002406', '3740': '9002407', '3741': '9002408', '3743': '9002409', '3745': '9002410', '3748': '9002411', '3750': '9002412', '3751': '9002413', '3752': '9002414', '3753': '9002415', '3755': '9002416', '3765': '9002418', '3766': '9002419', '3768': '9002420', '3770': '9002421', '3771': '9002422', '3773': '9002423', '3774': '9002424', '3777': '9002425', '3779': '9002426', '3780': '9002427', '3781': '9002428', '3782': '9002429', '3784': '9002430', '3785': '9002431', '3801': '9002432', '3809': '9002433', '3810': '9002434', '3811': '9002435', '3812': '9002436', '3813': '9002437', '3814': '9002438', '3816': '9002439', '3817': '9002440', '3818': '9002441', '3819': '9002442', '3820': '9002443', '3823': '9002445', '3824': '9002446', '3825': '9002447', '3826': '9002448', '3827': '9002449', '3830': '9002450', '3833': '9002451', '3835': '9002452', '3836': '9002453', '3837': '9002454', '3838': '9002455', '3839': '9002456', '3840': '9002457', '3841': '9002458', '3842': '9002459', '3844': '9002460', '3845': '9002461', '3846': '9002462', '3848': '9002464', '3849': '9002465', '3851': '9002466', '3852': '9002467', '3853': '9002468', '3854': '9002469', '3855': '9002470', '3856': '9002471', '3857': '9002472', '3858': '9002473', '3860': '9002474', '3861': '9002475', '3862': '9002476', '3864': '9002477', '3865': '9002478', '3867': '9002479', '3868': '9002480', '3869': '9002481', '3870': '9002482', '3872': '9002484', '3873': '9002485', '3874': '9002486', '3875': '9002487', '3878': '9002488', '3882': '9002489', '3883': '9002490', '3884': '9002491', '3885': '9002492', '3886': '9002493', '3887': '9002494', '3890': '9002495', '3894': '9002496', '3897': '9002498', '3901': '9002499', '3902': '9002500', '3903': '9002501', '3904': '9002502', '3905': '9002503', '3906': '9002504', '3907': '9002505', '3908': '9002506', '3909': '9002507', '4001': '9002510', '4002': '9002511', '4003': '9002512', '4005': '9002513', '4008': '9002514', '4009': '9002515', '4010': '9002516', '4011': '9002517', '4015': '9002518', '4017': '9002519', '4019': '9002520', '4020': '9002521', '4021': '9002522', '4022': '9002523', '4024': '9002524', '4027': '9002525', '4029': '9002526', '4030': '9002527', '4032': '9002528', '4037': '9002530', '4038': '9002531', '4039': '9002532', '4040': '9002533', '4041': '9002534', '4042': '9002535', '4043': '9002536', '4046': '9002537', '4047': '9002538', '4048': '9002539', '4049': '9002540', '4050': '9002541', '4051': '9002542', '4055': '9002544', '4061': '9002546', '4062': '9002547', '4064': '9002549', '4066': '9002550', '4068': '9002551', '4069': '9002552', '4071': '9002554', '4072': '9002555', '4073': '9002556', '4074': '9002557', '4076': '9002558', '4079': '9002560', '4083': '9002561', '4084': '9002562', '4085': '9002563', '4086': '9002564', '4087': '9002565', '4088': '9002566', '4090': '9002567', '4091': '9002568', '4092': '9002569', '4093': '9002570', '4095': '9002571', '4096': '9002572', '4097': '9002573', '4101': '9002574', '4102': '9002575', '4103': '9002576', '4105': '9002577', '4106': '9002578', '4107': '9002579', '4108': '9002580', '4110': '9002581', '4210': '9002583', '4216': '9002584', '4217': '9002585', '4219': '9002586', '4220': '9002587', '4221': '9002588', '4222': '9002589', '4224': '9002590', '4226': '9002591', '4231': '9002592', '4236': '9002593', '4237': '9002594', '4238': '9002595', '4239': '9002596', '4240': '9002597', '4250': '9002598', '4252': '9002599', '4253': '9002600', '4254': '9002601', '4255': '9002602', '4256': '9002603', '4257': '9002604', '4258': '9002605', '4259': '9002606', '4260': '9002607', '4261': '9002608', '4263': '9002609', '4265': '9002610', '4268': '9002611', '4270': '9002612', '4274': '9002614', '4275': '9002615', '4276': '9002616', '4280': '9002617', '4281': '9002618', '4282': '9002619', '4284': '9002620', '4285': '9002621', '4287': '9002623', '4289': '9002624', '4290': '9002625', '4292': '9002626', '4294': '9002627', '4330': '9002628', '4342': '9002630', '4344': '9002631', '4345': '9002632', '4346': '9002633', '4347': '9002634', '4348': '9002635', '4349': '9002636', '4350': '9002637', '4351': '9002638', '4352': '9002639', '4353': '9002640', '4354': '9002641', '4355': '9002642', '4357': '9002643', '4358': '9002644', '4359': '9002645', '4360': '9002646', '4363': '9002647', '4364': '9002648', '4401': '9002649', '4406': '9002650', '4408': '9002651', '4410': '9002652', '4411': '9002653', '4412': '9002654', '4413': '9002655', '4414': '9002656', '4416': '9002657', '4417': '9002658', '4418': '9002659', '4419': '9002660', '4421': '9002661', '4422': '9002662', '4424': '9002663', '4426': '9002664', '4427': '9002665', '4428': '9002666', '4429': '9002667', '4430': '9002668', '4434': '9002669', '4435': '9002670', '4438': '9002671', '4441': '9002672', '4442': '9002673', '4443': '9002674', '4444': '9002675', '4448': '9002676', '4449': '9002677', '4450': '9002678', '4451': '9002679', '4453': '9002680', '4454': '9002681', '4455': '9002682', '4456': '9002683', '4457': '9002684', '4459': '9002685', '4460': '9002686', '4461': '9002687', '4462': '9002688', '4463': '9002689', '4464': '9002690', '4468': '9002691', '4471': '9002692', '4472': '9002693', '4473': '9002694', '4474': '9002695', '4475': '9002696', '4476': '9002697', '4478': '9002698', '4479': '9002699', '4481': '9002700', '4485': '9002701', '4487': '9002702', '4488': '9002703', '4490': '9002704', '4491': '9002705', '4492': '9002706', '4493': '9002707', '4495': '9002708', '4496': '9002709', '4497': '9002710', '4530': '9002711', '4535': '9002712', '4537': '9002713', '4538': '9002714', '4539': '9002715', '4541': '9002716', '4543': '9002717', '4544': '9002718', '4547': '9002719', '4548': '9002720', '4551': '9002721', '4553': '9002722', '4554': '9002723', '4555': '9002724', '4556': '9002725', '4558': '9002726', '4562': '9002727', '4563': '9002728', '4564': '9002729', '4568': '9002730', '4571': '9002731', '4572': '9002732', '4573': '9002733', '4574': '9002734', '4576': '9002736', '4578': '9002737', '4579': '9002738', '4605': '9002739', '4606': '9002740', '4607': '9002741', '4609': '9002742', '4611': '9002743', '4612': '9002744', '4614': '9002745', '4616': '9002747', '4617': '9002748', '4619': '9002749', '4622': '9002750', '4623': '9002751', '4624': '9002752', '4626': '9002753', '4627': '9002754', '4628': '9002755', '4630': '9002756', '4631': '9002757', '4634': '9002758', '4635': '9002759', '4637': '9002760', '4640': '9002761', '4643': '9002762', '4645': '9002763', '4646': '9002764', '4648': '9002765', '4649': '9002766', '4652': '9002767', '4653': '9002768', '4654': '9002769', '4655': '9002770', '4657': '9002771', '4658': '9002772', '4660': '9002773', '4662': '9002774', '4666': '9002775', '4667': '9002776', '4668': '9002777', '4671': '9002778', '4673': '9002779', '4675': '9002780', '4676': '9002781', '4677': '9002782', '4679': '9002783', '4680': '9002784', '4681': '9002785', '4684': '9002786', '4685': '9002787', '4686': '9002788', '4691': '9002789', '4693': '9002790', '4694': '9002791', '4730': '9002792', '4732': '9002793', '4733': '9002794', '4734': '9002795', '4735': '9002796', '4736': '9002797', '4739': '9002798', '4740': '9002799', '4742': '9002800', '4743': '9002801', '4745': '9002802', '4746': '9002803', '4747': '9002804', '4750': '9002805', '4756': '9002806', '4757': '9002807', '4758': '9002808', '4760': '9002809', '4761': '9002810', '4762': '9002811', '4763': '9002812', '4764': '9002813', '4765': '9002814', '4766': '9002815', '4768': '9002816', '4769': '9002817', '4772': '9002818', '4773': '9002819', '4774': '9002820', '4776': '9002821', '4777': '9002822', '4779': '9002823', '4780': '9002824', '4781': '9002825', '4783': '9002826', '4785': '9002827', '4786': '9002828', '4787': '9002829', '4841': '9002830', '4843': '9002831', '4847': '9002832', '4848': '9002833', '4849': '9002834', '4851': '9002835', '4852': '9002836', '4853': '9002837', '4854': '9002838', '4856': '9002840', '4858': '9002841', '4859': '9002842', '4860': '9002843', '4861': '9002844', '4862': '9002845', '4863': '9002846', '4864': '9002847', '4901': '9002848', '4910': '9002849', '4911': '9002850', '4912': '9002851', '4915': '9002852', '4917': '9002853', '4918': '9002854', '4920': '9002855', '4921': '9002856', '4922': '9002857', '4923': '9002858', '4924': '9002859', '4925': '9002860', '4927': '9002861', '4928': '9002862', '4929': '9002863', '4930': '9002864', '4932': '9002865', '4936': '9002866', '4937': '9002867', '4938': '9002868', '4939': '9002869', '4941': '9002870', '4942': '9002871', '4943': '9002872', '4945': '9002873', '4947': '9002874', '4949': '9002875', '4950': '9002876', '4951': '9002877', '4952': '9002878', '4953': '9002879', '4955': '9002881', '4956': '9002882', '4957': '9002883', '4958': '9002884', '4961': '9002885', '4963': '9002887', '4964': '9002888', '4965': '9002889', '4966': '9002890', '4967': '9002891', '4969': '9002892', '4970': '9002893', '4971': '9002894', '4973': '9002895', '4974': '9002896', '4975': '9002897', '4976': '9002898', '4978': '9002899', '4979': '9002900', '4981': '9002901', '4982': '9002902', '4983': '9002903', '4984': '9002904', '4985': '9002905', '4986': '9002906', '4987': '9002907', '4988': '9002908', '4989': '9002909', '5001': '9002910', '5009': '9002911', '5030': '9002912', '5032': '9002913', '5033': '9002914', '5034': '9002915', '5035': '9002916', '5036': '9002917', '5037': '9002918', '5038': '9002919', '5039': '9002920', '5040': '9002921', '5042': '9002922', '5043': '9002923', '5045': '9002924', '5046': '9002925', '5048': '9002926', '5050': '9002927', '5051': '9002928', '5052': '9002929', '5053': '9002930', '5055': '9002931', '5056': '9002932', '5058': '9002933', '5060': '9002935', '5061': '9002936', '5062': '9002937', '5065': '9002938', '5067': '9002939', '5068': '9002940', '5069': '9002941', '5070': '9002942', '5071': '9002943', '5072': '9002944', '5073': '9002945', '5075': '9002947', '5076': '9002948', '5077': '9002949', '5079': '9002950', '5081': '9002951', '5083': '9002952', '5084': '9002953', '5086': '9002954', '5089': '9002956', '5091': '9002957', '5101': '9002958', '5142': '9002959', '5143': '9002960', '5146': '9002961', '5148': '9002962', '5149': '9002963', '5150': '9002964', '5151': '9002965', '5152': '9002966', '5153': '9002967', '5154': '9002968', '5155': '9002969', '5156': '9002970', '5158': '9002971', '5161': '9002972', '5201': '9002973', '5250': '9002974', '5251': '9002975', '5252': '9002976', '5253': '9002977', '5255': '9002979', '5257': '9002980', '5260': '9002981', '5261': '9002982', '5262': '9002983', '5301': '9002984', '5340': '9002986', '5341': '9002987', '5342': '9002988', '5343': '9002989', '5344': '9002990', '5345': '9002991', '5346': '9002992', '5350': '9002993', '5351': '9002994', '5352': '9002995', '5353': '9002996', '5354': '9002997', '5355': '9002998', '5356': '9002999', '5358': '9003000', '5359': '9003001', '5360': '9003002', '5361': '9003003', '5362': '9003004', '5363': '9003005', '5401': '9003006', '5403': '9003007', '5404': '9003008', '5405': '9003009', '5408': '9003010', '5440': '9003012', '5441': '9003013', '5442': '9003014', '5443': '9003015', '5444': '9003016', '5445': '9003017', '5446': '9003018', '5447': '9003019', '5448': '9003020', '5450': '9003021', '5452': '9003022', '5454': '9003023', '5455': '9003024', '5456': '9003025', '5457': '9003026', '5458': '9003027', '5459': '9003028', '5461': '9003029', '5462': '9003030', '5463': '9003031', '5464': '9003032', '5465': '9003033', '5468': '9003034', '5471': '9003036', '5472': '9003037', '5473': '9003038', '5474': '9003039', '5476': '9003040', '5477': '9003041', '5478': '9003042', '5479': '9003043', '5482': '9003044', '5483': '9003045', '5486': '9003046', '5487': '9003047', '5488': '9003048', '5489': '9003049', '5491': '9003051', '5492': '9003052', '5494': '9003053', '5495': '9003054', '5602': '9003055', '5620': '9003056', '5633': '9003057', '5640': '9003058', '5641': '9003059', '5647': '9003060', '5648': '9003061', '5649': '9003062', '5650': '9003063', '5651': '9003064', '5652': '9003065', '5653': '9003066', '5654': '9003067', '5655': '9003068', '5656': '9003069', '5658': '9003071', '5660': '9003072', '5661': '9003073', '5663': '9003074', '5666': '9003075', '5667': '9003076', '5669': '9003077', '5672': '9003078', '5673': '9003079', '5674': '9003080', '5675': '9003081', '5676': '9003082', '5677': '9003083', '5678': '9003084', '5679': '9003085', '5680': '9003086', '5681': '9003087', '5682': '9003088', '5701': '9003089', '5730': '9003090', '5732': '9003091', '5733': '9003092', '5734': '9003093', '5735': '9003094', '5736': '9003095', '5737': '9003096', '5738': '9003097', '5739': '9003098', '5742': '9003099', '5743': '9003100', '5744': '9003101', '5747': '9003103', '5748': '9003104', '5751': '9003105', '5753': '9003106', '5757': '9003107', '5758': '9003108', '5759': '9003109', '5760': '9003110', '5761': '9003111', '5763': '9003112', '5764': '9003113', '5765': '9003114', '5766': '9003115', '5767': '9003116', '5769': '9003117', '5770': '9003118', '5772': '9003119', '5773': '9003120', '5774': '9003121', '5775': '9003122', '5776': '9003123', '5777': '9003124', '5778': '9003125', '5819': '9003126', '5820': '9003127', '5821': '9003128', '5822': '9003129', '5824': '9003130', '5826': '9003132', '5827': '9003133', '5828': '9003134', '5829': '9003135', '5830': '9003136', '5832': '9003137', '5833': '9003138', '5836': '9003139', '5837': '9003140', '5839': '9003141', '5840': '9003142', '5841': '9003143', '5842': '9003144', '5843': '9003145', '5845': '9003146', '5846': '9003147', '5847': '9003148', '5850': '9003149', '5851': '9003150', '5853': '9003151', '5855': '9003152', '5857': '9003153', '5858': '9003154', '5859': '9003155', '5860': '9003156', '5862': '9003157', '5866': '9003158', '5867': '9003159', '5871': '9003160', '5872': '9003161', '5873': '9003162', '5874': '9003163', '5875': '9003164', '5902': '9003165', '5903': '9003166', '5904': '9003167', '5905': '9003168', '5906': '9003169', '5907': '9003170', '6001': '9003171', '6002': '9003172', '6010': '9003173', '6013': '9003174', '6016': '9003175', '6018': '9003176', '6019': '9003177', '6021': '9003178', '6023': '9003179', '6024': '9003180', '6026': '9003181', '6027': '9003182', '6029': '9003183', '6030': '9003184', '6031': '9003185', '6032': '9003186', '6033': '9003187', '6035': '9003188', '6037': '9003189', '6039': '9003190', '6040': '9003191', '6041': '9003192', '6042': '9003193', '6043': '9003194', '6051': '9003195', '6052': '9003196', '6053': '9003197', '6057': '9003198', '6058': '9003199', '6060': '9003200', '6062': '9003202', '6063': '9003203', '6065': '9003204', '6066': '9003205', '6067': '9003206', '6068': '9003207', '6069': '9003208', '6070': '9003209', '6071': '9003210', '6073': '9003211', '6074': '9003212', '6076': '9003214', '6078': '9003215', '6081': '9003216', '6082': '9003217', '6084': '9003219', '6085': '9003220', '6088': '9003221', '6089': '9003222', '6090': '9003223', '6091': '9003224', '6092': '9003225', '6093': '9003226', '6095': '9003227', '6096': '9003228', '6098': '9003229', '6101': '9003230', '6103': '9003231', '6105': '9003232', '6106': '9003233', '6107': '9003234', '6108': '9003235', '6109': '9003236', '6110': '9003237', '6111': '9003238', '6112': '9003239', '6114': '9003240', '6115': '9003241', '6117': '9003242', '6118': '9003243', '6119': '9003244', '6120': '9003245', '6154': '9003246', '6156': '9003247', '6161': '9003248', '6183': '9003249', '6226': '9003250', '6231': '9003251', '6232': '9003252', '6234': '9003253', '6235': '9003254', '6237': '9003255', '6238': '9003256', '6239': '9003257', '6241': '9003258', '6242': '9003259', '6243': '9003260', '6247': '9003261', '6248': '9003262', '6249': '9003263', '6250': '9003264', '6254': '9003265', '6255': '9003266', '6256': '9003267', '6259': '9003269', '6260': '9003270', '6262': '9003271', '6264': '9003273', '6266': '9003274', '6268': '9003275', '6269': '9003276', '6277': '9003277', '6278': '9003278', '6279': '9003279', '6280': '9003280', '6281': '9003281', '6282': '9003282', '6320': '9003283', '6330': '9003284', '6331': '9003285', '6333': '9003287', '6334': '9003288', '6335': '9003289', '6336': '9003290', '6339': '9003291', '6340': '9003292', '6351': '9003293', '6353': '9003294', '6354': '9003295', '6355': '9003296', '6357': '9003297', '6359': '9003298', '6360': '9003299', '6365': '9003300', '6370': '9003301', '6371': '9003302', '6374': '9003303', '6375': '9003304', '6377': '9003305', '6378': '9003306', '6379': '9003307', '6380': '9003308', '6382': '9003309', '6384': '9003310', '6385': '9003311', '6390': '9003313', '6401': '9003314', '6403': '9003315', '6405': '9003316', '6409': '9003317', '6410': '9003318', '6412': '9003319', '6413': '9003320', '6414': '9003321', '6415': '9003322', '6416': '9003323', '6417': '9003324', '6418': '9003325', '6419': '9003326', '6420': '9003327', '6422': '9003328', '6423': '9003329', '6424': '9003330', '6426': '9003331', '6437': '9003332', '6438': '9003333', '6441': '9003334', '6442': '9003335', '6443': '9003336', '6447': '9003337', '6450': '9003338', '6451': '9003339', '6455': '9003340', '6456': '9003341', '6457': '9003342', '6459': '9003343', '6460': '9003344', '6461': '9003345', '6468': '9003347', '6469': '9003348', '6470': '9003349', '6471': '9003350', '6472': '9003351', '6473': '9003352', '6475': '9003353', '6477': '9003354', '6478': '9003355', '6479': '9003356', '6480': '9003357', '6481': '9003358', '6482': '9003359', '6483': '9003360', '6484': '9003361', '6488': '9003362', '6489': '9003363', '6492': '9003364', '6498': '9003365', '6510': '9003366', '6511': '9003367', '6512': '9003368', '6513': '9003369', '6514': '9003370', '6515': '9003371', '6516': '9003372', '6517': '9003373', '6518': '9003374', '6519': '9003375', '6524': '9003376', '6525': '9003377', '6604': '9003378', '6605': '9003379', '6606': '9003380', '6607': '9003381', '6608': '9003382', '6610': '9003383', '6611': '9003384', '6612': '9003385', '6614': '9003386', '6615': '9003387', '6702': '9003388', '6704': '9003389', '6705': '9003390', '6706': '9003391', '6708': '9003392', '6710': '9003393', '6712': '9003394', '6716': '9003395', '6750': '9003397', '6751': '9003398', '6752': '9003399', '6754': '9003401', '6755': '9003402', '6756': '9003403', '6757': '9003404', '6759': '9003405', '6762': '9003406', '6763': '9003407', '6770': '9003408', '6776': '9003409', '6777': '9003410', '6778': '9003411', '6779': '9003412', '6782': '9003413', '6783': '9003414', '6784': '9003415', '6785': '9003416', '6786': '9003417', '6787': '9003418', '6790': '9003419', '6791': '9003420', '6793': '9003421', '6794': '9003422', '6795': '9003423', '6796': '9003424', '6798': '9003425', '6801': '9003426', '6804': '9003427', '6807': '9003428', '6810': '9003429', '6811': '9003430', '6812': '9003431', '6820': '9003432', '6824': '9003433', '6825': '9003434', '6830': '9003435', '6831': '9003436', '6840': '9003437', '6850': '9003438', '6851': '9003439', '6853': '9003440', '6854': '9003441', '6855': '9003442', '6858': '9003443', '6870': '9003444', '6877': '9003445', '6878': '9003446', '6880': '9003447', '6883': '9003448', '6889': '9003449', '6890': '9003450', '6896': '9003451', '6897': '9003452', '6901': '9003453', '6902': '9003454', '6903': '9003455', '6905': '9003456', '6906': '9003457', '6907': '9003458', '6910': '9003459', '6926': '9003461', '6927': '9003462', '7001': '9003463', '7002': '9003464', '7003': '9003465', '7004': '9003466', '7005': '9003467', '7006': '9003468', '7008': '9003469', '7009': '9003470', '7010': '9003471', '7011': '9003472', '7012': '9003473', '7013': '9003474', '7014': '9003475', '7016': '9003476', '7017': '9003477', '7018': '9003478', '7020': '9003479', '7021': '9003480', '7022': '9003481', '7023': '9003482', '7024': '9003483', '7026': '9003484', '7027': '9003485', '7028': '9003486', '7029': '9003487', '7030': '9003488', '7031': '9003489', '7032': '9003490', '7033': '9003491', '7034': '9003492', '7035': '9003493', '7036': '9003494', '7039': '9003495', '7040': '9003496', '7041': '9003497', '7042': '9003498', '7043': '9003499', '7044': '9003500', '7045': '9003501', '7046': '9003502', '7047': '9003503', '7050': '9003504', '7052': '9003505', '7054': '9003506', '7055': '9003507', '7057': '9003508', '7058': '9003509', '7059': '9003510', '7060': '9003511', '7062': '9003512', '7063': '9003513', '7064': '9003514', '7065': '9003515', '7066': '9003516', '7067': '9003517', '7068': '9003518', '7069': '9003519', '7070': '9003520', '7071': '9003521', '7072': '9003522', '7073': '9003523', '7074': '9003524', '7075': '9003525', '7076': '9003526', '7077': '9003527', '7078': '9003528', '7079': '9003529', '7080': '9003530', '7081': '9003531', '7082': '9003532', '7083': '9003533', '7086': '9003534', '7087': '9003535', '7088': '9003536', '7090': '9003537', '7092': '9003538', '7093': '9003539', '7094': '9003540', '7095': '9003541', '7099': '9003542', '7102': '9003543', '7103': '9003544', '7104': '9003545', '7105': '9003546', '7106': '9003547', '7107': '9003548', '7108': '9003549', '7109': '9003550', '7110': '9003551', '7111': '9003552', '7112': '9003553', '7114': '9003554', '7201': '9003555', '7202': '9003556', '7203': '9003557', '7204': '9003558', '7205': '9003559', '7206': '9003560', '7208': '9003561', '7302': '9003562', '7304': '9003563', '7305': '9003564', '7306': '9003565', '7307': '9003566', '7310': '9003567', '7401': '9003568', '7403': '9003569', '7405': '9003570', '7407': '9003571', '7410': '9003572', '7416': '9003573', '7417': '9003574', '7418': '9003575', '7419': '9003576', '7420': '9003577', '7421': '9003578', '7422': '9003579', '7423': '9003580', '7424': '9003581', '7430': '9003583', '7432': '9003584', '7435': '9003585', '7436': '9003586', '7438': '9003587', '7439': '9003588', '7440': '9003589', '7442': '9003590', '7444': '9003591', '7446': '9003592', '7450': '9003593', '7452': '9003594', '7456': '9003595', '7457': '9003596', '7458': '9003597', '7460': '9003598', '7461': '9003599', '7462': '9003600', '7463': '9003601', '7465': '9003602', '7470': '9003603', '7480': '9003604', '7481': '9003605', '7495': '9003606', '7501': '9003607', '7502': '9003608', '7503': '9003609', '7504': '9003610', '7505': '9003611', '7506': '9003612', '7508': '9003613', '7512': '9003614', '7513': '9003615', '7514': '9003616', '7522': '9003617', '7524': '9003618', '7601': '9003619', '7603': '9003620', '7604': '9003621', '7605': '9003622', '7606': '9003623', '7607': '9003624', '7608': '9003625', '7620': '9003626', '7621': '9003627', '7624': '9003628', '7626': '9003629', '7627': '9003630', '7628': '9003631', '7630': '9003632', '7631': '9003633', '7632': '9003634', '7640': '9003635', '7641': '9003636', '7642': '9003637', '7643': '9003638', '7644': '9003639', '7645': '9003640', '7646': '9003641', '7647': '9003642', '7648': '9003643', '7649': '9003644', '7650': '9003645', '7652': '9003646', '7656': '9003647', '7657': '9003648', '7660': '9003649', '7661': '9003650', '7662': '9003651', '7663': '9003652', '7666': '9003653', '7670': '9003654', '7675': '9003655', '7676': '9003656', '7677': '9003657', '7699': '9003658', '7701': '9003659', '7702': '9003660', '7703': '9003661', '7704': '9003662', '7711': '9003663', '7712': '9003664', '7716': '9003665', '7717': '9003666', '7718': '9003667', '7719': '9003668', '7720': '9003669', '7721': '9003670', '7722': '9003671', '7723': '9003672', '7724': '9003673', '7726': '9003674', '7727': '9003675', '7728': '9003676', '7730': '9003677', '7731': '9003678', '7732': '9003679', '7733': '9003680', '7734': '9003681', '7735': '9003682', '7737': '9003683', '7738': '9003684', '7739': '9003685', '7740': '9003686', '7746': '9003687', '7747': '9003688', '7748': '9003689', '7750': '9003690', '7751': '9003691', '7753': '9003692', '7755': '9003693', '7756': '9003694', '7757': '9003695', '7758': '9003696', '7760': '9003697', '7762': '9003698', '7764': '9003699', '7801': '9003700', '7803': '9003701', '7821': '9003703', '7822': '9003704', '7823': '9003705', '7825': '9003706', '7826': '9003707', '7827': '9003708', '7828': '9003709', '7830': '9003710', '7832': '9003711', '7834': '9003712', '7836': '9003713', '7838': '9003714', '7840': '9003715', '7843': '9003717', '7847': '9003720', '7848': '9003721', '7849': '9003722', '7850': '9003723', '7851': '9003724', '7852': '9003725', '7853': '9003726', '7856': '9003727', '7857': '9003728', '7860': '9003729', '7863': '9003730', '7865': '9003731', '7866': '9003732', '7869': '9003733', '7871': '9003734', '7874': '9003735', '7876': '9003736', '7882': '9003739', '7885': '9003740', '7901': '9003741', '7920': '9003742', '7921': '9003743', '7922': '9003744', '7924': '9003745', '7927': '9003747', '7928': '9003748', '7930': '9003749', '7931': '9003750', '7932': '9003751', '7933': '9003752', '7934': '9003753', '7935': '9003754', '7936': '9003755', '7940': '9003758', '7945': '9003759', '7946': '9003760', '7950': '9003761', '7960': '9003762', '7974': '9003763', '7976': '9003764', '7980': '9003768', '7981': '9003769', '8001': '9003771', '8002': '9003772', '8003': '9003773', '8004': '9003774', '8005': '9003775', '8006': '9003776', '8007': '9003777', '8008': '9003778', '8009': '9003779', '8010': '9003780', '8012': '9003781', '8014': '9003782', '8015': '9003783', '8016': '9003784', '8019': '9003785', '8020': '9003786', '8021': '9003787', '8022': '9003788', '8026': '9003790', '8027': '9003791', '8028': '9003792', '8029': '9003793', '8030': '9003794', '8031': '9003795', '8032': '9003796', '8033': '9003797', '8034': '9003798', '8035': '9003799', '8036': '9003800', '8037': '9003801', '8038': '9003802', '8041': '9003803', '8043': '9003805', '8045': '9003806', '8046': '9003807', '8048': '9003808', '8049': '9003809', '8050': '9003810', '8051': '9003811', '8052': '9003812', '8053': '9003813', '8054': '9003814', '8055': '9003815', '8056': '9003816', '8057': '9003817', '8059': '9003818', '8060': '9003819', '8061': '9003820', '8062': '9003821', '8063': '9003822', '8065': '9003824', '8066': '9003825', '8067': '9003826', '8068': '9003827', '8069': '9003828', '8070': '9003829', '8071': '9003830', '8075': '9003832', '8077': '9003833', '8078': '9003834', '8079': '9003835', '8080': '9003836', '8081': '9003837', '8083': '9003838', '8084': '9003839', '8085': '9003840', '8086': '9003841', '8087': '9003842', '8088': '9003843', '8089': '9003844', '8090': '9003845', '8091': '9003846', '8092': '9003847', '8093': '9003848', '8094': '9003849', '8096': '9003851', '8097': '9003852', '8098': '9003853', '8102': '9003854', '8103': '9003855', '8104': '9003856', '8105': '9003857', '8106': '9003858', '8107': '9003859', '8108': '9003860', '8109': '9003861', '8110': '9003862', '8201': '9003863', '8202': '9003864', '8203': '9003865', '8204': '9003866', '8205': '9003867', '8210': '9003868', '8212': '9003869', '8215': '9003870', '8221': '9003871', '8223': '9003872', '8225': '9003873', '8226': '9003874', '8230': '9003875', '8232': '9003876', '8234': '9003877', '8241': '9003878', '8242': '9003879', '8243': '9003880', '8244': '9003881', '8247': '9003882', '8248': '9003883', '8251': '9003884', '8260': '9003885', '8270': '9003886', '8302': '9003887', '8310': '9003888', '8311': '9003889', '8312': '9003890', '8314': '9003891', '8316': '9003892', '8317': '9003893', '8318': '9003894', '8319': '9003895', '8321': '9003896', '8322': '9003897', '8323': '9003898', '8324': '9003899', '8326': '9003900', '8327': '9003901', '8328': '9003902', '8329': '9003903', '8330': '9003904', '8332': '9003905', '8340': '9003906', '8341': '9003907', '8343': '9003908', '8344': '9003909', '8345': '9003910', '8346': '9003911', '8348': '9003912', '8349': '9003913', '8350': '9003914', '8353': '9003916', '8360': '9003917', '8361': '9003918', '8401': '9003919', '8402': '9003920', '8403': '9003921', '8406': '9003922', '8501': '9003923', '8502': '9003924', '8505': '9003925', '8510': '9003926', '8511': '9003927', '8512': '9003928', '8514': '9003929', '8515': '9003930', '8518': '9003931', '8520': '9003932', '8525': '9003933', '8527': '9003934', '8528': '9003935', '8530': '9003936', '8533': '9003937', '8534': '9003938', '8535': '9003939', '8536': '9003940', '8540': '9003941', '8542': '9003942', '8544': '9003943', '8550': '9003944', '8551': '9003945', '8553': '9003946', '8554': '9003947', '8555': '9003948', '8558': '9003949', '8559': '9003950', '8560': '9003951', '8562': '9003953', '8608': '9003954', '8609': '9003955', '8610': '9003956', '8611': '9003957', '8618': '9003958', '8619': '9003959', '8620': '9003960', '8628': '9003962', '8629': '9003963', '8638': '9003964', '8640': '9003965', '8641': '9003966', '8648': '9003967', '8690': '9003969', '8691': '9003970', '8701': '9003971', '8720': '9003972', '8721': '9003973', '8722': '9003974', '8723': '9003975', '8724': '9003976', '8730': '9003977', '8731': '9003978', '8732': '9003979', '8733': '9003980', '8734': '9003981', '8735': '9003982', '8736': '9003983', '8738': '9003984', '8740': '9003985', '8741': '9003986', '8742': '9003987', '8750': '9003988', '8751': '9003989', '8752': '9003990', '8753': '9003991', '8755': '9003992', '8757': '9003993', '8758': '9003994', '8759': '9003995', '8801': '9003996', '8802': '9003997', '8804': '9003998', '8805': '9003999', '8807': '9004000', '8809': '9004002', '8810': '9004003', '8812': '9004004', '8816': '9004005', '8817': '9004006', '8820': '9004007', '8822': '9004009', '8823': '9004010', '8824': '9004011', '8825': '9004012', '8826': '9004013', '8827': '9004014', '8828': '9004015', '8829': '9004016', '8830': '9004017', '8831': '9004018', '8832': '9004019', '8833': '9004020', '8835': '9004021', '8836': '9004022', '8837': '9004023', '8840': '9004024', '8844': '9004025', '8846': '9004026', '8848': '9004027', '8850': '9004028', '8852': '9004029', '8853': '9004030', '8854': '9004031', '8857': '9004032', '8859': '9004034', '8861': '9004035', '8863': '9004036', '8865': '9004037', '8867': '9004038', '8869': '9004039', '8872': '9004040', '8873': '9004041', '8876': '9004042', '8879': '9004043', '8880': '9004044', '8882': '9004045', '8884': '9004046', '8886': '9004047', '8887': '9004048', '8889': '9004050', '8899': '9004052', '8901': '9004053', '8902': '9004054', '8904': '9004055', '10001': '9004056', '10002': '9004057', '10003': '9004058', '10004': '9004059', '10006': '9004061', '10007': '9004062', '10009': '9004063', '10010': '9004064', '10011': '9004065', '10012': '9004066', '10013': '9004067', '10014': '9004068', '10016': '9004069', '10017': '9004070', '10018': '9004071', '10019': '9004072', '10020': '9004073', '10021': '9004074', '10022': '9004075', '10023': '9004076', '10024': '9004077', '10025': '9004078', '10026': '9004079', '10027': '9004080', '10028': '9004081', '10029': '9004082', '10030': '9004083', '10031': '9004084', '10032': '9004085', '10033': '9004086', '10034': '9004087', '10035': '9004088', '10036': '9004089', '10037': '9004090', '10038': '9004091', '10039': '9004092', '10040': '9004093', '10043': '9004095', '10044': '9004096', '10045': '9004097', '10065': '9004098', '10069': '9004099', '10075': '9004100', '10080': '9004101', '10104': '9004103', '10105': '9004104', '10106': '9004105', '10107': '9004106', '10111': '9004108', '10112': '9004109', '10115': '9004110', '10119': '9004112', '10120': '9004113', '10123': '9004115', '10128': '9004116', '10154': '9004119', '10155': '9004120', '10165': '9004122', '10167': '9004124', '10168': '9004125', '10170': '9004127', '10174': '9004130', '10176': '9004132', '10199': '9004134', '10270': '9004136', '10278': '9004138', '10280': '9004140', '10282': '9004142', '10301': '9004144', '10302': '9004145', '10303': '9004146', '10304': '9004147', '10305': '9004148', '10306': '9004149', '10307': '9004150', '10308': '9004151', '10309': '9004152', '10310': '9004153', '10312': '9004155', '10314': '9004156', '10451': '9004157', '10452': '9004158', '10453': '9004159', '10454': '9004160', '10455': '9004161', '10456': '9004162', '10457': '9004163', '10458': '9004164', '10459': '9004165', '10460': '9004166', '10461': '9004167', '10462': '9004168', '10463': '9004169', '10464': '9004170', '10465': '9004171', '10466': '9004172', '10467': '9004173', '10468': '9004174', '10469': '9004175', '10470': '9004176', '10471': '9004177', '10472': '9004178', '10473': '9004179', '10474': '9004180', '10475': '9004181', '10501': '9004182', '10502': '9004183', '10504': '9004185', '10505': '9004186', '10506': '9004187', '10507': '9004188', '10509': '9004189', '10510': '9004190', '10511': '9004191', '10512': '9004192', '10514': '9004193', '10516': '9004194', '10518': '9004196', '10520': '9004198', '10522': '9004199', '10523': '9004200', '10524': '9004201', '10526': '9004202', '10527': '9004203', '10528': '9004204', '10530': '9004205', '10532': '9004206', '10533': '9004207', '10535': '9004208', '10536': '9004209', '10537': '9004210', '10538': '9004211', '10541': '9004212', '10543': '9004214', '10546': '9004215', '10547': '9004216', '10548': '9004217', '10549': '9004218', '10550': '9004219', '10552': '9004220', '10553': '9004221', '10560': '9004222', '10562': '9004223', '10566': '9004224', '10567': '9004225', '10570': '9004226', '10573': '9004227', '10576': '9004228', '10577': '9004229', '10578': '9004230', '10579': '9004231', '10580': '9004232', '10583': '9004233', '10588': '9004234', '10589': '9004235', '10590': '9004236', '10591': '9004237', '10594': '9004238', '10595': '9004239', '10596': '9004240', '10597': '9004241', '10598': '9004242', '10601': '9004243', '10603': '9004244', '10604': '9004245', '10605': '9004246', '10606': '9004247', '10607': '9004248', '10701': '9004249', '10703': '9004250', '10704': '9004251', '10705': '9004252', '10706': '9004253', '10707': '9004254', '10708': '9004255', '10709': '9004256', '10710': '9004257', '10801': '9004258', '10803': '9004259', '10804': '9004260', '10805': '9004261', '10901': '9004262', '10913': '9004263', '10914': '9004264', '10916': '9004265', '10917': '9004266', '10918': '9004267', '10919': '9004268', '10920': '9004269', '10921': '9004270', '10922': '9004271', '10923': '9004272', '10924': '9004273', '10925': '9004274', '10926': '9004275', '10927': '9004276', '10928': '9004277', '10930': '9004278', '10931': '9004279', '10933': '9004280', '10940': '9004281', '10941': '9004282', '10950': '9004283', '10952': '9004284', '10954': '9004286', '10956': '9004287', '10958': '9004288', '10960': '9004289', '10962': '9004290', '10963': '9004291', '10964': '9004292', '10965': '9004293', '10968': '9004294', '10969': '9004295', '10970': '9004296', '10973': '9004297', '10974': '9004298', '10975': '9004299', '10976': '9004300', '10977': '9004301', '10980': '9004302', '10983': '9004304', '10984': '9004305', '10985': '9004306', '10986': '9004307', '10987': '9004308', '10988': '9004309', '10989': '9004310', '10990': '9004311', '10992': '9004312', '10993': '9004313', '10994': '9004314', '10996': '9004315', '10998': '9004316', '11001': '9004317', '11003': '9004318', '11004': '9004319', '11005': '9004320', '11010': '9004321', '11020': '9004322', '11021': '9004323', '11023': '9004324', '11024': '9004325', '11030': '9004326', '11040': '9004327', '11042': '9004328', '11050': '9004329', '11096': '9004330', '11101': '9004331', '11102': '9004332', '11103': '9004333', '11104': '9004334', '11105': '9004335', '11106': '9004336', '11109': '9004337', '11201': '9004338', '11203': '9004339', '11204': '9004340', '11205': '9004341', '11206': '9004342', '11207': '9004343', '11208': '9004344', '11209': '9004345', '11210': '9004346', '11211': '9004347', '11212': '9004348', '11213': '9004349', '11214': '9004350', '11215': '9004351', '11216': '9004352', '11217': '9004353', '11218': '9004354', '11219': '9004355', '11220': '9004356', '11221': '9004357', '11222': '9004358', '11223': '9004359', '11224': '9004360', '11225': '9004361', '11226': '9004362', '11228': '9004363', '11229': '9004364', '11230': '9004365', '11231': '9004366', '11232': '9004367', '11233': '9004368', '11234': '9004369', '11235': '9004370', '11236': '9004371', '11237': '9004372', '11238': '9004373', '11239': '9004374', '11252': '9004378', '11354': '9004379', '11355': '9004380', '11356': '9004381', '11357': '9004382', '11358': '9004383', '11359': '9004384', '11360': '9004385', '11361': '9004386', '11362': '9004387', '11363': '9004388', '11364': '9004389', '11365': '9004390', '11366': '9004391', '11367': '9004392', '11368': '9004393', '11369': '9004394', '11370': '9004395', '11371': '9004396', '11372': '9004397', '11373': '9004398', '11374': '9004399', '11375': '9004400', '11377': '9004401', '11378': '9004402', '11379': '9004403', '11381': '9004404', '11385': '9004405', '11405': '9004406', '11411': '9004407', '11412': '9004408', '11413': '9004409', '11414': '9004410', '11415': '9004411', '11416': '9004412', '11417': '9004413', '11418': '9004414', '11419': '9004415', '11420': '9004416', '11421': '9004417', '11422': '9004418', '11423': '9004419', '11425': '9004420', '11426': '9004421', '11427': '9004422', '11428': '9004423', '11429': '9004424', '11430': '9004425', '11432': '9004426', '11433': '9004427', '11434': '9004428', '11435': '9004429', '11436': '9004430', '11439': '9004431', '11451': '9004432', '11501': '9004433', '11507': '9004434', '11509': '9004435', '11510': '9004436', '11514': '9004437', '11516': '9004438', '11518': '9004439', '11520': '9004440', '11530': '9004441', '11542': '9004442', '11545': '9004443', '11547': '9004444', '11548': '9004445', '11550': '9004446', '11552': '9004447', '11553': '9004448', '11554': '9004449', '11557': '9004450', '11558': '9004451', '11559': '9004452', '11560': '9004453', '11561': '9004454', '11563': '9004455', '11565': '9004456', '11566': '9004457', '11568': '9004458', '11569': '9004459', '11570': '9004460', '11572': '9004461', '11575': '9004462', '11576': '9004463', '11577': '9004464', '11579': '9004465', '11580': '9004466', '11581': '9004467', '11590': '9004468', '11596': '9004469', '11598': '9004470', '11691': '9004471', '11692': '9004472', '11693': '9004473', '11694': '9004474', '11697': '9004475', '11701': '9004476', '11702': '9004477', '11703': '9004478', '11704': '9004479', '11705': '9004480', '11706': '9004481', '11709': '9004482', '11710': '9004483', '11713': '9004484', '11714': '9004485', '11715': '9004486', '11716': '9004487', '11717': '9004488', '11718': '9004489', '11719': '9004490', '11720': '9004491', '11721': '9004492', '11722': '9004493', '11724': '9004494', '11725': '9004495', '11726': '9004496', '11727': '9004497', '11729': '9004498', '11730': '9004499', '11731': '9004500', '11732': '9004501', '11733': '9004502', '11735': '9004503', '11738': '9004504', '11739': '9004505', '11740': '9004506', '11741': '9004507', '11742': '9004508', '11743': '9004509', '11746': '9004510', '11747': '9004511', '11749': '9004512', '11751': '9004513', '11752': '9004514', '11753': '9004515', '11754': '9004516', '11755': '9004517', '11756': '9004518', '11757': '9004519', '11758': '9004520', '11762': '9004521', '11763': '9004522', '11764': '9004523', '11765': '9004524', '11766': '9004525', '11767': '9004526', '11768': '9004527', '11769': '9004528', '11770': '9004529', '11771': '9004530', '11772': '9004531', '11776': '9004532', '11777': '9004533', '11778': '9004534', '11779': '9004535', '11780': '9004536', '11782': '9004537', '11783': '9004538', '11784': '9004539', '11786': '9004540', '11787': '9004541', '11788': '9004542', '11789': '9004543', '11790': '9004544', '11791': '9004545', '11792': '9004546', '11793': '9004547', '11795': '9004549', '11796': '9004550', '11797': '9004551', '11798': '9004552', '11801': '9004553', '11803': '9004554', '11804': '9004555', '11815': '9004556', '11901': '9004557', '11930': '9004558', '11932': '9004560', '11933': '9004561', '11934': '9004562', '11935': '9004563', '11937': '9004564', '11939': '9004565', '11940': '9004566', '11941': '9004567', '11942': '9004568', '11944': '9004569', '11946': '9004570', '11948': '9004571', '11949': '9004572', '11950': '9004573', '11951': '9004574', '11952': '9004575', '11953': '9004576', '11954': '9004577', '11955': '9004578', '11956': '9004579', '11957': '9004580', '11958': '9004581', '11959': '9004582', '11960': '9004583', '11961': '9004584', '11962': '9004585', '11963': '9004586', '11964': '9004587', '11965': '9004588', '11967': '9004589', '11968': '9004590', '11971': '9004592', '11975': '9004593', '11976': '9004594', '11977': '9004595', '11978': '9004596', '11980': '9004597', '12007': '9004598', '12008': '9004599', '12009': '9004600', '12010': '9004601', '12015': '9004602', '12017': '9004603', '12018': '9004604', '12019': '9004605', '12020': '9004606', '12022': '9004607', '12023': '9004608', '12024': '9004609', '12025': '9004610', '12027': '9004611', '12028': '9004612', '12029': '9004613', '12032': '9004614', '12033': '9004615', '12035': '9004616', '12036': '9004617', '12037': '9004618', '12041': '9004619', '12042': '9004620', '12043': '9004621', '12046': '9004623', '12047': '9004624', '12051': '9004625', '12052': '9004626', '12053': '9004627', '12054': '9004628', '12056': '9004629', '12057': '9004630', '12058': '9004631', '12059': '9004632', '12060': '9004633', '12061': '9004634', '12062': '9004635', '12063': '9004636', '12064': '9004637', '12065': '9004638', '12066': '9004639', '12067': '9004640', '12068': '9004641', '12069': '9004642', '12070': '9004643', '12071': '9004644', '12072': '9004645', '12074': '9004646', '12075': '9004647', '12076': '9004648', '12077': '9004649', '12078': '9004650', '12083': '9004651', '12084': '9004652', '12085': '9004653', '12086': '9004654', '12087': '9004655', '12089': '9004656', '12090': '9004657', '12092': '9004658', '12093': '9004659', '12094': '9004660', '12095': '9004661', '12106': '9004662', '12108': '9004663', '12110': '9004664', '12115': '9004665', '12116': '9004666', '12117': '9004667', '12118': '9004668', '12120': '9004669', '12121': '9004670', '12122': '9004671', '12123': '9004672', '12124': '9004673', '12125': '9004674', '12130': '9004675', '12131': '9004676', '12134': '9004677', '12136': '9004678', '12137': '9004679', '12138': '9004680', '12139': '9004681', '12140': '9004682', '12143': '9004683', '12144': '9004684', '12147': '9004685', '12148': '9004686', '12149': '9004687', '12150': '9004688', '12151': '9004689', '12153': '9004690', '12154': '9004691', '12155': '9004692', '12156': '9004693', '12157': '9004694', '12158': '9004695', '12159': '9004696', '12160': '9004697', '12164': '9004698', '12165': '9004699', '12166': '9004700', '12167': '9004701', '12168': '9004702', '12169': '9004703', '12170': '9004704', '12173': '9004705', '12175': '9004707', '12176': '9004708', '12177': '9004709', '12180': '9004710', '12182': '9004711', '12183': '9004712', '12184': '9004713', '12185': '9004714', '12186': '9004715', '12187': '9004716', '12188': '9004717', '12189': '9004718', '12190': '9004719', '12192': '9004720', '12193': '9004721', '12194': '9004722', '12196': '9004723', '12197': '9004724', '12198': '9004725', '12202': '9004727', '12203': '9004728', '12204': '9004729', '12205': '9004730', '12206': '9004731', '12207': '9004732', '12208': '9004733', '12209': '9004734', '12210': '9004735', '12211': '9004736', '12226': '9004737', '12234': '9004738', '12302': '9004739', '12303': '9004740', '12304': '9004741', '12305': '9004742', '12306': '9004743', '12307': '9004744', '12308': '9004745', '12309': '9004746', '12401': '9004747', '12404': '9004749', '12405': '9004750', '12406': '9004751', '12407': '9004752', '12409': '9004753', '12410': '9004754', '12411': '9004755', '12412': '9004756', '12413': '9004757', '12414': '9004758', '12416': '9004759', '12418': '9004761', '12419': '9004762', '12421': '9004764', '12422': '9004765', '12423': '9004766', '12424': '9004767', '12427': '9004768', '12428': '9004769', '12429': '9004770', '12430': '9004771', '12431': '9004772', '12432': '9004773', '12433': '9004774', '12434': '9004775', '12435': '9004776', '12439': '9004777', '12440': '9004778', '12442': '9004780', '12443': '9004781', '12444': '9004782', '12446': '9004783', '12448': '9004784', '12449': '9004785', '12450': '9004786', '12451': '9004787', '12454': '9004789', '12455': '9004790', '12456': '9004791', '12457': '9004792', '12458': '9004793', '12459': '9004794', '12460': '9004795', '12461': '9004796', '12463': '9004797', '12464': '9004798', '12465': '9004799', '12466': '9004800', '12468': '9004801', '12469': '9004802', '12470': '9004803', '12471': '9004804', '12472': '9004805', '12473': '9004806', '12474': '9004807', '12477': '9004809', '12480': '9004810', '12481': '9004811', '12482': '9004812', '12484': '9004813', '12485': '9004814', '12486': '9004815', '12487': '9004816', '12489': '9004817', '12491': '9004818', '12492': '9004819', '12494': '9004820', '12495': '9004821', '12496': '9004822', '12498': '9004823', '12501': '9004824', '12502': '9004825', '12503': '9004826', '12507': '9004827', '12508': '9004828', '12513': '9004830', '12514': '9004831', '12515': '9004832', '12516': '9004833', '12517': '9004834', '12518': '9004835', '12520': '9004836', '12521': '9004837', '12522': '9004838', '12523': '9004839', '12524': '9004840', '12525': '9004841', '12526': '9004842', '12528': '9004843', '12529': '9004844', '12531': '9004845', '12533': '9004846', '12534': '9004847', '12538': '9004848', '12540': '9004849', '12542': '9004850', '12543': '9004851', '12545': '9004852', '12546': '9004853', '12547': '9004854', '12548': '9004855', '12549': '9004856', '12550': '9004857', '12553': '9004858', '12561': '9004859', '12563': '9004860', '12564': '9004861', '12565': '9004862', '12566': '9004863', '12567': '9004864', '12569': '9004866', '12570': '9004867', '12571': '9004868', '12572': '9004869', '12575': '9004871', '12577': '9004872', '12578': '9004873', '12580': '9004874', '12581': '9004875', '12582': '9004876', '12583': '9004877', '12585': '9004879', '12586': '9004880', '12589': '9004881', '12590': '9004882', '12592': '9004883', '12594': '9004884', '12601': '9004885', '12603': '9004886', '12701': '9004887', '12719': '9004888', '12720': '9004889', '12721': '9004890', '12723': '9004891', '12725': '9004892', '12726': '9004893', '12729': '9004894', '12732': '9004895', '12733': '9004896', '12734': '9004897', '12736': '9004898', '12737': '9004899', '12738': '9004900', '12740': '9004901', '12741': '9004902', '12742': '9004903', '12743': '9004904', '12745': '9004905', '12746': '9004906', '12747': '9004907', '12748': '9004908', '12749': '9004909', '12750': '9004910', '12751': '9004911', '12752': '9004912', '12754': '9004913', '12758': '9004914', '12759': '9004915', '12760': '9004916', '12762': '9004917', '12763': '9004918', '12764': '9004919', '12765': '9004920', '12766': '9004921', '12768': '9004922', '12770': '9004923', '12771': '9004924', '12775': '9004925', '12776': '9004926', '12777': '9004927', '12778': '9004928', '12779': '9004929', '12780': '9004930', '12783': '9004931', '12786': '9004933', '12788': '9004934', '12789': '9004935', '12790': '9004936', '12791': '9004937', '12792': '9004938', '12801': '9004939', '12803': '9004940', '12804': '9004941', '12808': '9004942', '12809': '9004943', '12810': '9004944', '12812': '9004945', '12814': '9004946', '12815': '9004947', '12816': '9004948', '12817': '9004949', '12819': '9004950', '12821': '9004951', '12822': '9004952', '12823': '9004953', '12824': '9004954', '12827': '9004955', '12828': '9004956', '12831': '9004957', '12832': '9004958', '12833': '9004959', '12834': '9004960', '12835': '9004961', '12836': '9004962', '12837': '9004963', '12838': '9004964', '12839': '9004965', '12841': '9004966', '12842': '9004967', '12843': '9004968', '12844': '9004969', '12845': '9004970', '12846': '9004971', '12847': '9004972', '12849': '9004973', '12850': '9004974', '12851': '9004975', '12852': '9004976', '12853': '9004977', '12855': '9004978', '12856': '9004979', '12857': '9004980', '12858': '9004981', '12859': '9004982', '12860': '9004983', '12861': '9004984', '12862': '9004985', '12863': '9004986', '12865': '9004988', '12866': '9004989', '12870': '9004990', '12871': '9004991', '12873': '9004993', '12874': '9004994', '12878': '9004995', '12883': '9004996', '12885': '9004997', '12886': '9004998', '12887': '9004999', '12901': '9005000', '12903': '9005001', '12910': '9005002', '12912': '9005003', '12913': '9005004', '12914': '9005005', '12916': '9005006', '12917': '9005007', '12918': '9005008', '12919': '9005009', '12920': '9005010', '12921': '9005011', '12922': '9005012', '12923': '9005013', '12924': '9005014', '12926': '9005015', '12927': '9005016', '12928': '9005017', '12930': '9005019', '12932': '9005020', '12934': '9005021', '12935': '9005022', '12936': '9005023', '12937': '9005024', '12939': '9005025', '12941': '9005026', '12942': '9005027', '12943': '9005028', '12944': '9005029', '12945': '9005030', '12946': '9005031', '12950': '9005032', '12952': '9005033', '12953': '9005034', '12955': '9005035', '12956': '9005036', '12957': '9005037', '12958': '9005038', '12959': '9005039', '12960': '9005040', '12962': '9005041', '12964': '9005042', '12965': '9005043', '12966': '9005044', '12967': '9005045', '12969': '9005046', '12970': '9005047', '12972': '9005048', '12973': '9005049', '12974': '9005050', '12975': '9005051', '12976': '9005052', '12978': '9005053', '12979': '9005054', '12980': '9005055', '12981': '9005056', '12983': '9005057', '12985': '9005058', '12986': '9005059', '12989': '9005060', '12992': '9005061', '12993': '9005062', '12996': '9005063', '12997': '9005064', '12998': '9005065', '13021': '9005066', '13024': '9005068', '13026': '9005069', '13027': '9005070', '13028': '9005071', '13029': '9005072', '13030': '9005073', '13031': '9005074', '13032': '9005075', '13033': '9005076', '13034': '9005077', '13035': '9005078', '13036': '9005079', '13037': '9005080', '13039': '9005081', '13040': '9005082', '13041': '9005083', '13042': '9005084', '13044': '9005085', '13045': '9005086', '13052': '9005087', '13053': '9005088', '13054': '9005089', '13057': '9005090', '13060': '9005091', '13061': '9005092', '13063': '9005093', '13066': '9005095', '13068': '9005096', '13069': '9005097', '13071': '9005098', '13072': '9005099', '13073': '9005100', '13074': '9005101', '13076': '9005102', '13077': '9005103', '13078': '9005104', '13080': '9005105', '13081': '9005106', '13082': '9005107', '13083': '9005108', '13084': '9005109', '13088': '9005111', '13090': '9005112', '13092': '9005113', '13101': '9005114', '13103': '9005116', '13104': '9005117', '13108': '9005119', '13110': '9005120', '13111': '9005121', '13112': '9005122', '13114': '9005123', '13116': '9005124', '13118': '9005126', '13120': '9005127', '13122': '9005128', '13124': '9005130', '13126': '9005131', '13131': '9005132', '13132': '9005133', '13135': '9005135', '13136': '9005136', '13140': '9005138', '13141': '9005139', '13142': '9005140', '13143': '9005141', '13144': '9005142', '13145': '9005143', '13146': '9005144', '13147': '9005145', '13148': '9005146', '13152': '9005147', '13153': '9005148', '13155': '9005149', '13156': '9005150', '13158': '9005152', '13159': '9005153', '13160': '9005154', '13164': '9005157', '13165': '9005158', '13166': '9005159', '13167': '9005160', '13202': '9005161', '13203': '9005162', '13204': '9005163', '13205': '9005164', '13206': '9005165', '13207': '9005166', '13208': '9005167', '13209': '9005168', '13210': '9005169', '13211': '9005170', '13212': '9005171', '13214': '9005172', '13215': '9005173', '13219': '9005174', '13220': '9005175', '13224': '9005176', '13244': '9005177', '13290': '9005179', '13301': '9005180', '13302': '9005181', '13303': '9005182', '13304': '9005183', '13308': '9005185', '13309': '9005186', '13310': '9005187', '13312': '9005188', '13313': '9005189', '13314': '9005190', '13315': '9005191', '13316': '9005192', '13317': '9005193', '13318': '9005194', '13319': '9005195', '13320': '9005196', '13322': '9005198', '13323': '9005199', '13324': '9005200', '13325': '9005201', '13326': '9005202', '13327': '9005203', '13328': '9005204', '13329': '9005205', '13331': '9005206', '13332': '9005207', '13333': '9005208', '13334': '9005209', '13335': '9005210', '13337': '9005211', '13338': '9005212', '13339': '9005213', '13340': '9005214', '13342': '9005216', '13343': '9005217', '13345': '9005218', '13346': '9005219', '13348': '9005220', '13350': '9005221', '13353': '9005222', '13354': '9005223', '13355': '9005224', '13357': '9005225', '13360': '9005226', '13361': '9005227', '13363': '9005228', '13364': '9005229', '13365': '9005230', '13367': '9005231', '13368': '9005232', '13402': '9005233', '13403': '9005234', '13406': '9005235', '13407': '9005236', '13408': '9005237', '13409': '9005238', '13411': '9005239', '13413': '9005240', '13415': '9005241', '13416': '9005242', '13417': '9005243', '13418': '9005244', '13420': '9005245', '13421': '9005246', '13424': '9005247', '13425': '9005248', '13428': '9005250', '13431': '9005251', '13433': '9005252', '13436': '9005253', '13437': '9005254', '13438': '9005255', '13439': '9005256', '13440': '9005257', '13441': '9005258', '13450': '9005259', '13452': '9005260', '13454': '9005261', '13456': '9005262', '13459': '9005263', '13460': '9005264', '13461': '9005265', '13464': '9005266', '13468': '9005267', '13469': '9005268', '13470': '9005269', '13471': '9005270', '13472': '9005271', '13473': '9005272', '13476': '9005273', '13477': '9005274', '13478': '9005275', '13480': '9005277', '13482': '9005278', '13483': '9005279', '13485': '9005280', '13486': '9005281', '13488': '9005282', '13489': '9005283', '13490': '9005284', '13491': '9005285', '13492': '9005286', '13493': '9005287', '13494': '9005288', '13495': '9005289', '13501': '9005290', '13502': '9005291', '13601': '9005292', '13602': '9005293', '13603': '9005294', '13605': '9005295', '13606': '9005296', '13607': '9005297', '13608': '9005298', '13612': '9005299', '13613': '9005300', '13614': '9005301', '13616': '9005303', '13617': '9005304', '13618': '9005305', '13619': '9005306', '13620': '9005307', '13621': '9005308', '13622': '9005309', '13624': '9005311', '13625': '9005312', '13626': '9005313', '13628': '9005314', '13630': '9005315', '13633': '9005316', '13634': '9005317', '13635': '9005318', '13636': '9005319', '13637': '9005320', '13638': '9005321', '13639': '9005322', '13640': '9005323', '13642': '9005324', '13645': '9005325', '13646': '9005326', '13648': '9005327', '13650': '9005328', '13652': '9005329', '13654': '9005330', '13655': '9005331', '13656': '9005332', '13658': '9005333', '13659': '9005334', '13660': '9005335', '13661': '9005336', '13662': '9005337', '13664': '9005338', '13665': '9005339', '13666': '9005340', '13667': '9005341', '13668': '9005342', '13669': '9005343', '13670': '9005344', '13672': '9005345', '13673': '9005346', '13674': '9005347', '13675': '9005348', '13676': '9005349', '13679': '9005350', '13680': '9005351', '13681': '9005352', '13682': '9005353', '13684': '9005354', '13685': '9005355', '13687': '9005356', '13690': '9005357', '13691': '9005358', '13692': '9005359', '13693': '9005360', '13694': '9005361', '13695': '9005362', '13696': '9005363', '13697': '9005364', '13730': '9005365', '13731': '9005366', '13732': '9005367', '13733': '9005368', '13734': '9005369', '13736': '9005370', '13739': '9005371', '13740': '9005372', '13743': '9005373', '13744': '9005374', '13746': '9005375', '13748': '9005376', '13750': '9005377', '13752': '9005378', '13753': '9005379', '13754': '9005380', '13755': '9005381', '13756': '9005382', '13757': '9005383', '13760': '9005384', '13775': '9005385', '13776': '9005386', '13777': '9005387', '13778': '9005388', '13780': '9005389', '13782': '9005390', '13783': '9005391', '13784': '9005392', '13786': '9005393', '13787': '9005394', '13788': '9005395', '13790': '9005396', '13795': '9005397', '13796': '9005398', '13797': '9005399', '13801': '9005400', '13802': '9005401', '13803': '9005402', '13804': '9005403', '13807': '9005404', '13808': '9005405', '13809': '9005406', '13810': '9005407', '13811': '9005408', '13812': '9005409', '13813': '9005410', '13815': '9005411', '13820': '9005412', '13825': '9005413', '13826': '9005414', '13827': '9005415', '13830': '9005416', '13832': '9005417', '13833': '9005418', '13834': '9005419', '13835': '9005420', '13838': '9005421', '13839': '9005422', '13841': '9005423', '13842': '9005424', '13843': '9005425', '13844': '9005426', '13846': '9005427', '13849': '9005430', '13850': '9005431', '13856': '9005432', '13859': '9005433', '13861': '9005434', '13862': '9005435', '13863': '9005436', '13864': '9005437', '13865': '9005438', '13901': '9005439', '13903': '9005440', '13904': '9005441', '13905': '9005442', '14001': '9005443', '14004': '9005444', '14005': '9005445', '14006': '9005446', '14008': '9005447', '14009': '9005448', '14011': '9005449', '14012': '9005450', '14013': '9005451', '14020': '9005452', '14024': '9005453', '14025': '9005454', '14026': '9005455', '14028': '9005456', '14030': '9005457', '14031': '9005458', '14032': '9005459', '14033': '9005460', '14034': '9005461', '14036': '9005462', '14037': '9005463', '14039': '9005464', '14040': '9005465', '14041': '9005466', '14042': '9005467', '14043': '9005468', '14047': '9005469', '14048': '9005470', '14051': '9005471', '14052': '9005472', '14054': '9005473', '14055': '9005474', '14057': '9005475', '14058': '9005476', '14059': '9005477', '14060': '9005478', '14062': '9005480', '14063': '9005481', '14065': '9005482', '14066': '9005483', '14067': '9005484', '14068': '9005485', '14069': '9005486', '14070': '9005487', '14072': '9005488', '14075': '9005489', '14080': '9005490', '14081': '9005491', '14082': '9005492', '14085': '9005494', '14086': '9005495', '14091': '9005496', '14092': '9005497', '14094': '9005498', '14098': '9005499', '14101': '9005500', '14102': '9005501', '14103': '9005502', '14105': '9005503', '14108': '9005504', '14111': '9005506', '14113': '9005507', '14120': '9005508', '14125': '9005509', '14126': '9005510', '14127': '9005511', '14129': '9005512', '14130': '9005513', '14131': '9005514', '14132': '9005515', '14134': '9005516', '14136': '9005517', '14138': '9005518', '14139': '9005519', '14141': '9005520', '14143': '9005521', '14145': '9005522', '14150': '9005523', '14167': '9005524', '14170': '9005526', '14171': '9005527', '14172': '9005528', '14174': '9005530', '14201': '9005531', '14202': '9005532', '14203': '9005533', '14204': '9005534', '14206': '9005535', '14207': '9005536', '14208': '9005537', '14209': '9005538', '14210': '9005539', '14211': '9005540', '14212': '9005541', '14213': '9005542', '14214': '9005543', '14215': '9005544', '14216': '9005545', '14217': '9005546', '14218': '9005547', '14219': '9005548', '14220': '9005549', '14221': '9005550', '14222': '9005551', '14223': '9005552', '14224': '9005553', '14225': '9005554', '14226': '9005555', '14227': '9005556', '14228': '9005557', '14240': '9005558', '14241': '9005559', '14260': '9005560', '14301': '9005561', '14303': '9005562', '14304': '9005563', '14305': '9005564', '14411': '9005565', '14414': '9005566', '14415': '9005567', '14416': '9005568', '14418': '9005569', '14420': '9005570', '14422': '9005571', '14423': '9005572', '14424': '9005573', '14425': '9005574', '14427': '9005575', '14428': '9005576', '14432': '9005577', '14433': '9005578', '14435': '9005579', '14437': '9005580', '14441': '9005581', '14445': '9005582', '14450': '9005583', '14454': '9005584', '14456': '9005585', '14462': '9005586', '14464': '9005588', '14466': '9005589', '14467': '9005590', '14468': '9005591', '14469': '9005592', '14470': '9005593', '14471': '9005594', '14472': '9005595', '14475': '9005596', '14476': '9005597', '14477': '9005598', '14478': '9005599', '14479': '9005600', '14480': '9005601', '14481': '9005602', '14482': '9005603', '14485': '9005604', '14486': '9005605', '14487': '9005606', '14489': '9005607', '14502': '9005608', '14504': '9005609', '14505': '9005610', '14506': '9005611', '14507': '9005612', '14510': '9005613', '14512': '9005615', '14513': '9005616', '14514': '9005617', '14516': '9005619', '14517': '9005620', '14519': '9005621', '14521': '9005622', '14522': '9005623', '14525': '9005624', '14526': '9005625', '14527': '9005626', '14530': '9005627', '14532': '9005628', '14533': '9005629', '14534': '9005630', '14536': '9005631', '14541': '9005633', '14543': '9005634', '14544': '9005635', '14545': '9005636', '14546': '9005637', '14547': '9005638', '14548': '9005639', '14550': '9005641', '14551': '9005642', '14555': '9005643', '14559': '9005645', '14560': '9005646', '14561': '9005647', '14564': '9005648', '14568': '9005649', '14569': '9005650', '14571': '9005651', '14572': '9005652', '14580': '9005653', '14586': '9005654', '14589': '9005655', '14590': '9005656', '14591': '9005657', '14604': '9005658', '14605': '9005659', '14606': '9005660', '14607': '9005661', '14608': '9005662', '14609': '9005663', '14610': '9005664', '14611': '9005665', '14612': '9005666', '14613': '9005667', '14614': '9005668', '14615': '9005669', '14616': '9005670', '14617': '9005671', '14618': '9005672', '14619': '9005673', '14620': '9005674', '14621': '9005675', '14622': '9005676', '14623': '9005677', '14624': '9005678', '14625': '9005679', '14626': '9005680', '14650': '9005682', '14653': '9005683', '14701': '9005685', '14706': '9005686', '14707': '9005687', '14708': '9005688', '14709': '9005689', '14710': '9005690', '14711': '9005691', '14712': '9005692', '14714': '9005693', '14715': '9005694', '14716': '9005695', '14717': '9005696', '14718': '9005697', '14719': '9005698', '14721': '9005699', '14723': '9005701', '14724': '9005702', '14726': '9005703', '14727': '9005704', '14728': '9005705', '14729': '9005706', '14731': '9005708', '14733': '9005710', '14735': '9005711', '14736': '9005712', '14737': '9005713', '14738': '9005714', '14739': '9005715', '14740': '9005716', '14741': '9005717', '14743': '9005718', '14744': '9005719', '14747': '9005721', '14748': '9005722', '14750': '9005723', '14753': '9005725', '14754': '9005726', '14755': '9005727', '14757': '9005728', '14760': '9005729', '14767': '9005730', '14769': '9005731', '14770': '9005732', '14772': '9005733', '14775': '9005734', '14777': '9005735', '14779': '9005736', '14781': '9005737', '14782': '9005738', '14783': '9005739', '14784': '9005740', '14787': '9005741', '14801': '9005742', '14802': '9005743', '14803': '9005744', '14804': '9005745', '14805': '9005746', '14806': '9005747', '14807': '9005748', '14808': '9005749', '14809': '9005750', '14810': '9005751', '14812': '9005752', '14813': '9005753', '14814': '9005754', '14815': '9005755', '14816': '9005756', '14817': '9005757', '14818': '9005758', '14819': '9005759', '14820': '9005760', '14821': '9005761', '14822': '9005762', '14823': '9005763', '14824': '9005764', '14825': '9005765', '14826': '9005766', '14830': '9005767', '14836': '9005768', '14837': '9005769', '14838': '9005770', '14839': '9005771', '14840': '9005772', '14841': '9005773', '14842': '9005774', '14843': '9005775', '14845': '9005776', '14846': '9005777', '14847': '9005778', '14850': '9005779', '14853': '9005781', '14855': '9005783', '14858': '9005785', '14859': '9005786', '14860': '9005787', '14861': '9005788', '14864': '9005789', '14865': '9005790', '14867': '9005791', '14869': '9005792', '14870': '9005793', '14871': '9005794', '14872': '9005795', '14873': '9005796', '14874': '9005797', '14877': '9005798', '14878': '9005799', '14879': '9005800', '14880': '9005801', '14881': '9005802', '14882': '9005803', '14883': '9005804', '14884': '9005805', '14885': '9005806', '14886': '9005807', '14889': '9005808', '14891': '9005809', '14892': '9005810', '14894': '9005811', '14895': '9005812', '14897': '9005813', '14898': '9005814', '14901': '9005815', '14903': '9005816', '14904': '9005817', '14905': '9005818', '15001': '9005819', '15003': '9005820', '15005': '9005821', '15007': '9005823', '15009': '9005824', '15010': '9005825', '15012': '9005826', '15014': '9005827', '15015': '9005828', '15017': '9005829', '15018': '9005830', '15019': '9005831', '15020': '9005832', '15021': '9005833', '15022': '9005834', '15024': '9005835', '15025': '9005836', '15026': '9005837', '15027': '9005838', '15030': '9005840', '15031': '9005841', '15033': '9005842', '15034': '9005843', '15035': '9005844', '15037': '9005845', '15038': '9005846', '15042': '9005847', '15043': '9005848', '15044': '9005849', '15045': '9005850', '15046': '9005851', '15047': '9005852', '15049': '9005853', '15050': '9005854', '15051': '9005855', '15052': '9005856', '15053': '9005857', '15054': '9005858', '15055': '9005859', '15056': '9005860', '15057': '9005861', '15059': '9005862', '15060': '9005863', '15061': '9005864', '15062': '9005865', '15063': '9005866', '15064': '9005867', '15065': '9005868', '15066': '9005869', '15067': '9005870', '15068': '9005871', '15071': '9005872', '15074': '9005873', '15076': '9005874', '15078': '9005875', '15083': '9005878', '15084': '9005879', '15085': '9005880', '15086': '9005881', '15089': '9005883', '15090': '9005884', '15101': '9005885', '15102': '9005886', '15104': '9005887', '15106': '9005888', '15108': '9005889', '15110': '9005890', '15112': '9005891', '15116': '9005892', '15120': '9005893', '15122': '9005894', '15123': '9005895', '15126': '9005896', '15129': '9005897', '15131': '9005898', '15132': '9005899', '15133': '9005900', '15135': '9005901', '15136': '9005902', '15137': '9005903', '15139': '9005904', '15140': '9005905', '15142': '9005906', '15143': '9005907', '15144': '9005908', '15145': '9005909', '15146': '9005910', '15147': '9005911', '15148': '9005912', '15201': '9005913', '15202': '9005914', '15203': '9005915', '15204': '9005916', '15205': '9005917', '15206': '9005918', '15207': '9005919', '15208': '9005920', '15209': '9005921', '15210': '9005922', '15211': '9005923', '15212': '9005924', '15213': '9005925', '15214': '9005926', '15215': '9005927', '15216': '9005928', '15217': '9005929', '15218': '9005930', '15219': '9005931', '15220': '9005932', '15221': '9005933', '15222': '9005934', '15223': '9005935', '15224': '9005936', '15225': '9005937', '15226': '9005938', '15227': '9005939', '15228': '9005940', '15229': '9005941', '15232': '9005942', '15233': '9005943', '15234': '9005944', '15235': '9005945', '15236': '9005946', '15237': '9005947', '15238': '9005948', '15239': '9005949', '15241': '9005950', '15243': '9005951', '15260': '9005952', '15261': '9005953', '15275': '9005954', '15276': '9005955', '15277': '9005956', '15282': '9005957', '15290': '9005958', '15301': '9005959', '15310': '9005960', '15311': '9005961', '15312': '9005962', '15313': '9005963', '15314': '9005964', '15315': '9005965', '15317': '9005966', '15320': '9005967', '15321': '9005968', '15322': '9005969', '15323': '9005970', '15327': '9005972', '15329': '9005973', '15330': '9005974', '15332': '9005976', '15333': '9005977', '15334': '9005978', '15337': '9005979', '15338': '9005980', '15340': '9005981', '15341': '9005982', '15342': '9005983', '15344': '9005984', '15345': '9005985', '15348': '9005987', '15349': '9005988', '15351': '9005989', '15352': '9005990', '15357': '9005991', '15360': '9005993', '15362': '9005995', '15363': '9005996', '15364': '9005997', '15367': '9005999', '15370': '9006001', '15376': '9006002', '15377': '9006003', '15380': '9006005', '15401': '9006006', '15410': '9006007', '15411': '9006008', '15412': '9006009', '15413': '9006010', '15417': '9006012', '15419': '9006013', '15423': '9006016', '15424': '9006017', '15425': '9006018', '15427': '9006019', '15428': '9006020', '15431': '9006022', '15432': '9006023', '15433': '9006024', '15436': '9006025', '15437': '9006026', '15438': '9006027', '15440': '9006028', '15442': '9006029', '15444': '9006030', '15445': '9006031', '15446': '9006032', '15449': '9006033', '15450': '9006034', '15451': '9006035', '15456': '9006036', '15458': '9006037', '15459': '9006038', '15461': '9006040', '15462': '9006041', '15464': '9006042', '15468': '9006044', '15469': '9006045', '15470': '9006046', '15473': '9006048', '15474': '9006049', '15476': '9006050', '15478': '9006052', '15479': '9006053', '15480': '9006054', '15483': '9006055', '15486': '9006057', '15488': '9006058', '15490': '9006059', '15501': '9006060', '15510': '9006061', '15521': '9006063', '15522': '9006064', '15530': '9006065', '15531': '9006066', '15533': '9006067', '15534': '9006068', '15535': '9006069', '15536': '9006070', '15537': '9006071', '15538': '9006072', '15539': '9006073', '15540': '9006074', '15541': '9006075', '15542': '9006076', '15544': '9006077', '15545': '9006078', '15546': '9006079', '15550': '9006081', '15551': '9006082', '15552': '9006083', '15554': '9006085', '15557': '9006086', '15558': '9006087', '15559': '9006088', '15562': '9006091', '15563': '9006092', '15601': '9006093', '15610': '9006094', '15611': '9006095', '15613': '9006096', '15615': '9006097', '15617': '9006098', '15618': '9006099', '15620': '9006100', '15622': '9006101', '15623': '9006102', '15626': '9006103', '15627': '9006104', '15628': '9006105', '15631': '9006107', '15632': '9006108', '15634': '9006109', '15636': '9006111', '15637': '9006112', '15639': '9006113', '15641': '9006115', '15642': '9006116', '15644': '9006117', '15646': '9006118', '15647': '9006119', '15650': '9006120', '15655': '9006121', '15656': '9006122', '15658': '9006123', '15661': '9006124', '15665': '9006126', '15666': '9006127', '15668': '9006128', '15670': '9006129', '15671': '9006130', '15672': '9006131', '15675': '9006132', '15677': '9006133', '15678': '9006134', '15679': '9006135', '15681': '9006136', '15683': '9006137', '15684': '9006138', '15686': '9006139', '15690': '9006140', '15692': '9006141', '15695': '9006142', '15697': '9006143', '15701': '9006144', '15705': '9006145', '15711': '9006146', '15713': '9006147', '15714': '9006148', '15715': '9006149', '15717': '9006151', '15722': '9006152', '15724': '9006154', '15725': '9006155', '15728': '9006156', '15729': '9006157', '15730': '9006158', '15732': '9006160', '15741': '9006163', '15742': '9006164', '15746': '9006165', '15747': '9006166', '15748': '9006167', '15753': '9006168', '15757': '9006171', '15759': '9006172', '15760': '9006173', '15762': '9006174', '15763': '9006175', '15765': '9006176', '15767': '9006177', '15771': '9006178', '15772': '9006179', '15773': '9006180', '15774': '9006181', '15775': '9006182', '15777': '9006183', '15779': '9006184', '15784': '9006186', '15801': '9006187', '15821': '9006188', '15823': '9006189', '15824': '9006190', '15825': '9006191', '15827': '9006192', '15828': '9006193', '15829': '9006194', '15832': '9006195', '15834': '9006196', '15840': '9006197', '15845': '9006198', '15846': '9006199', '15848': '9006200', '15849': '9006201', '15851': '9006202', '15853': '9006203', '15856': '9006204', '15857': '9006205', '15860': '9006206', '15861': '9006207', '15864': '9006208', '15865': '9006209', '15866': '9006210', '15868': '9006211', '15870': '9006212', '15901': '9006213', '15902': '9006214', '15904': '9006215', '15905': '9006216', '15906': '9006217', '15909': '9006218', '15920': '9006219', '15921': '9006220', '15923': '9006221', '15924': '9006222', '15926': '9006224', '15927': '9006225', '15928': '9006226', '15931': '9006227', '15935': '9006229', '15936': '9006230', '15938': '9006231', '15940': '9006232', '15942': '9006233', '15943': '9006234', '15944': '9006235', '15945': '9006236', '15946': '9006237', '15949': '9006239', '15952': '9006240', '15953': '9006241', '15954': '9006242', '15955': '9006243', '15956': '9006244', '15957': '9006245', '15958': '9006246', '15961': '9006248', '15963': '9006250', '16001': '9006251', '16002': '9006252', '16020': '9006253', '16023': '9006255', '16025': '9006257', '16028': '9006259', '16033': '9006262', '16034': '9006263', '16037': '9006265', '16038': '9006266', '16040': '9006267', '16041': '9006268', '16045': '9006269', '16046': '9006270', '16049': '9006271', '16050': '9006272', '16051': '9006273', '16052': '9006274', '16053': '9006275', '16055': '9006277', '16056': '9006278', '16057': '9006279', '16059': '9006280', '16061': '9006281', '16063': '9006282', '16066': '9006283', '16101': '9006284', '16102': '9006285', '16105': '9006286', '16110': '9006287', '16111': '9006288', '16112': '9006289', '16114': '9006291', '16115': '9006292', '16116': '9006293', '16117': '9006294', '16120': '9006295', '16121': '9006296', '16123': '9006297', '16124': '9006298', '16125': '9006299', '16127': '9006300', '16130': '9006301', '16131': '9006302', '16132': '9006303', '16133': '9006304', '16134': '9006305', '16136': '9006306', '16137': '9006307', '16141': '9006308', '16142': '9006309', '16143': '9006310', '16145': '9006311', '16146': '9006312', '16148': '9006313', '16150': '9006314', '16153': '9006315', '16154': '9006316', '16156': '9006317', '16157': '9006318', '16159': '9006319', '16161': '9006321', '16201': '9006322', '16210': '9006323', '16214': '9006325', '16217': '9006326', '16218': '9006327', '16222': '9006328', '16224': '9006329', '16226': '9006330', '16228': '9006331', '16229': '9006332', '16232': '9006334', '16233': '9006335', '16235': '9006336', '16239': '9006338', '16240': '9006339', '16242': '9006340', '16248': '9006343', '16249': '9006344', '16250': '9006345', '16254': '9006346', '16255': '9006347', '16256': '9006348', '16258': '9006349', '16259': '9006350', '16260': '9006351', '16262': '9006352', '16301': '9006353', '16311': '9006354', '16313': '9006355', '16314': '9006356', '16316': '9006357', '16317': '9006358', '16319': '9006359', '16323': '9006361', '16326': '9006362', '16327': '9006363', '16329': '9006364', '16331': '9006365', '16332': '9006366', '16334': '9006367', '16335': '9006368', '16340': '9006369', '16341': '9006370', '16342': '9006371', '16343': '9006372', '16345': '9006373', '16346': '9006374', '16347': '9006375', '16350': '9006376', '16351': '9006377', '16353': '9006378', '16354': '9006379', '16360': '9006380', '16362': '9006381', '16364': '9006382', '16365': '9006383', '16371': '9006385', '16373': '9006386', '16374': '9006387', '16401': '9006388', '16402': '9006389', '16403': '9006390', '16404': '9006391', '16405': '9006392', '16406': '9006393', '16407': '9006394', '16410': '9006395', '16411': '9006396', '16412': '9006397', '16415': '9006398', '16417': '9006399', '16420': '9006400', '16421': '9006401', '16423': '9006402', '16424': '9006403', '16426': '9006404', '16428': '9006406', '16430': '9006407', '16433': '9006408', '16434': '9006409', '16435': '9006410', '16436': '9006411', '16438': '9006412', '16440': '9006413', '16441': '9006414', '16442': '9006415', '16443': '9006416', '16501': '9006417', '16502': '9006418', '16503': '9006419', '16504': '9006420', '16505': '9006421', '16506': '9006422', '16507': '9006423', '16508': '9006424', '16509': '9006425', '16510': '9006426', '16511': '9006427', '16515': '9006428', '16534': '9006429', '16546': '9006430', '16550': '9006431', '16563': '9006432', '16565': '9006433', '16601': '9006434', '16602': '9006435', '16611': '9006436', '16613': '9006437', '16616': '9006438', '16617': '9006439', '16621': '9006440', '16622': '9006441', '16623': '9006442', '16625': '9006444', '16627': '9006445', '16630': '9006446', '16635': '9006447', '16636': '9006448', '16637': '9006449', '16639': '9006450', '16640': '9006451', '16641': '9006452', '16646': '9006453', '16647': '9006454', '16648': '9006455', '16650': '9006456', '16651': '9006457', '16652': '9006458', '16655': '9006459', '16656': '9006460', '16657': '9006461', '16659': '9006462', '16661': '9006463', '16662': '9006464', '16664': '9006465', '16666': '9006466', '16667': '9006467', '16668': '9006468', '16669': '9006469', '16670': '9006470', '16673': '9006472', '16677': '9006473', '16678': '9006474', '16679': '9006475', '16680': '9006476', '16682': '9006477', '16686': '9006478', '16689': '9006479', '16691': '9006480', '16692': '9006481', '16693': '9006482', '16695': '9006483', '16701': '9006484', '16720': '9006485', '16726': '9006487', '16727': '9006488', '16729': '9006489', '16731': '9006490', '16734': '9006491', '16735': '9006492', '16738': '9006493', '16740': '9006494', '16743': '9006495', '16744': '9006496', '16745': '9006497', '16746': '9006498', '16748': '9006499', '16749': '9006500', '16801': '9006501', '16802': '9006502', '16803': '9006503', '16820': '9006504', '16821': '9006505', '16822': '9006506', '16823': '9006507', '16827': '9006508', '16828': '9006509', '16829': '9006510', '16830': '9006511', '16832': '9006512', '16833': '9006513', '16836': '9006515', '16837': '9006516', '16838': '9006517', '16839': '9006518', '16840': '9006519', '16841': '9006520', '16843': '9006521', '16844': '9006522', '16845': '9006523', '16847': '9006524', '16849': '9006526', '16852': '9006528', '16854': '9006530', '16858': '9006531', '16859': '9006532', '16860': '9006533', '16861': '9006534', '16863': '9006535', '16864': '9006536', '16865': '9006537', '16866': '9006538', '16868': '9006539', '16870': '9006540', '16871': '9006541', '16872': '9006542', '16874': '9006543', '16875': '9006544', '16877': '9006545', '16878': '9006546', '16879': '9006547', '16881': '9006548', '16882': '9006549', '16901': '9006550', '16912': '9006552', '16914': '9006553', '16915': '9006554', '16917': '9006555', '16920': '9006556', '16921': '9006557', '16922': '9006558', '16923': '9006559', '16925': '9006560', '16926': '9006561', '16927': '9006562', '16928': '9006563', '16929': '9006564', '16930': '9006565', '16932': '9006566', '16933': '9006567', '16935': '9006568', '16936': '9006569', '16937': '9006570', '16938': '9006571', '16941': '9006573', '16942': '9006574', '16943': '9006575', '16946': '9006576', '16947': '9006577', '16948': '9006578', '16950': '9006579', '17002': '9006580', '17003': '9006581', '17004': '9006582', '17006': '9006584', '17007': '9006585', '17009': '9006586', '17011': '9006587', '17013': '9006588', '17015': '9006589', '17017': '9006591', '17018': '9006592', '17019': '9006593', '17020': '9006594', '17022': '9006595', '17023': '9006596', '17024': '9006597', '17025': '9006598', '17026': '9006599', '17028': '9006600', '17029': '9006601', '17030': '9006602', '17032': '9006603', '17033': '9006604', '17034': '9006605', '17035': '9006606', '17036': '9006607', '17037': '9006608', '17038': '9006609', '17040': '9006610', '17042': '9006612', '17043': '9006613', '17044': '9006614', '17045': '9006615', '17046': '9006616', '17047': '9006617', '17048': '9006618', '17049': '9006619', '17050': '9006620', '17051': '9006621', '17053': '9006622', '17055': '9006623', '17057': '9006624', '17058': '9006625', '17059': '9006626', '17061': '9006627', '17062': '9006628', '17063': '9006629', '17064': '9006630', '17065': '9006631', '17066': '9006632', '17067': '9006633', '17068': '9006634', '17070': '9006635', '17073': '9006637', '17074': '9006638', '17078': '9006641', '17080': '9006642', '17082': '9006644', '17084': '9006645', '17086': '9006646', '17087': '9006647', '17088': '9006648', '17090': '9006649', '17093': '9006650', '17094': '9006651', '17098': '9006653', '17099': '9006654', '17101': '9006655', '17102': '9006656', '17103': '9006657', '17104': '9006658', '17107': '9006660', '17109': '9006661', '17110': '9006662', '17111': '9006663', '17112': '9006664', '17113': '9006665', '17120': '9006666', '17121': '9006667', '17123': '9006668', '17124': '9006669', '17125': '9006670', '17128': '9006671', '17201': '9006672', '17202': '9006673', '17210': '9006674', '17211': '9006675', '17212': '9006676', '17214': '9006677', '17215': '9006678', '17217': '9006679', '17219': '9006680', '17220': '9006681', '17221': '9006682', '17222': '9006683', '17223': '9006684', '17224': '9006685', '17225': '9006686', '17228': '9006687', '17229': '9006688', '17232': '9006689', '17233': '9006690', '17236': '9006691', '17237': '9006692', '17238': '9006693', '17240': '9006694', '17241': '9006695', '17243': '9006696', '17244': '9006697', '17246': '9006698', '17252': '9006700', '17255': '9006702', '17257': '9006703', '17262': '9006704', '17264': '9006705', '17265': '9006706', '17266': '9006707', '17267': '9006708', '17268': '9006709', '17271': '9006710', '17301': '9006711', '17302': '9006712', '17304': '9006714', '17307': '9006715', '17309': '9006716', '17313': '9006718', '17314': '9006719', '17315': '9006720', '17316': '9006721', '17319': '9006723', '17320': '9006724', '17321': '9006725', '17322': '9006726', '17324': '9006727', '17325': '9006728', '17327': '9006729', '17329': '9006730', '17331': '9006731', '17339': '9006732', '17340': '9006733', '17344': '9006734', '17345': '9006735', '17347': '9006736', '17349': '9006737', '17350': '9006738', '17352': '9006739', '17353': '9006740', '17356': '9006742', '17360': '9006743', '17361': '9006744', '17362': '9006745', '17363': '9006746', '17364': '9006747', '17365': '9006748', '17366': '9006749', '17368': '9006750', '17370': '9006751', '17372': '9006753', '17401': '9006754', '17402': '9006755', '17403': '9006756', '17404': '9006757', '17406': '9006758', '17407': '9006759', '17408': '9006760', '17501': '9006761', '17502': '9006762', '17505': '9006763', '17509': '9006766', '17512': '9006767', '17516': '9006768', '17517': '9006769', '17518': '9006770', '17519': '9006771', '17520': '9006772', '17522': '9006773', '17527': '9006774', '17529': '9006775', '17532': '9006776', '17535': '9006778', '17536': '9006779', '17538': '9006780', '17540': '9006781', '17543': '9006782', '17545': '9006783', '17547': '9006784', '17551': '9006786', '17552': '9006787', '17554': '9006788', '17555': '9006789', '17557': '9006790', '17560': '9006791', '17562': '9006792', '17563': '9006793', '17565': '9006794', '17566': '9006795', '17569': '9006797', '17572': '9006798', '17576': '9006799', '17578': '9006800', '17579': '9006801', '17581': '9006803', '17582': '9006804', '17584': '9006805', '17601': '9006806', '17602': '9006807', '17603': '9006808', '17701': '9006810', '17702': '9006811', '17721': '9006812', '17723': '9006813', '17724': '9006814', '17727': '9006815', '17728': '9006816', '17729': '9006817', '17731': '9006819', '17737': '9006820', '17740': '9006822', '17742': '9006823', '17744': '9006824', '17745': '9006825', '17747': '9006826', '17751': '9006828', '17752': '9006829', '17754': '9006830', '17756': '9006831', '17758': '9006832', '17760': '9006833', '17764': '9006835', '17765': '9006836', '17768': '9006837', '17771': '9006838', '17772': '9006839', '17774': '9006840', '17776': '9006841', '17777': '9006842', '17778': '9006843', '17801': '9006845', '17810': '9006846', '17812': '9006847', '17813': '9006848', '17814': '9006849', '17815': '9006850', '17820': '9006851', '17821': '9006852', '17822': '9006853', '17823': '9006854', '17824': '9006855', '17827': '9006856', '17830': '9006858', '17832': '9006859', '17834': '9006860', '17837': '9006861', '17840': '9006862', '17841': '9006863', '17842': '9006864', '17844': '9006865', '17845': '9006866', '17846': '9006867', '17847': '9006868', '17850': '9006869', '17851': '9006870', '17853': '9006871', '17855': '9006872', '17856': '9006873', '17857': '9006874', '17859': '9006875', '17860': '9006876', '17864': '9006878', '17866': '9006879', '17870': '9006881', '17872': '9006882', '17876': '9006883', '17878': '9006884', '17881': '9006885', '17886': '9006887', '17888': '9006889', '17889': '9006890', '17901': '9006891', '17921': '9006892', '17922': '9006893', '17925': '9006894', '17929': '9006895', '17931': '9006897', '17934': '9006899', '17935': '9006900', '17938': '9006902', '17941': '9006903', '17945': '9006904', '17948': '9006906', '17952': '9006909', '17953': '9006910', '17954': '9006911', '17957': '9006912', '17959': '9006913', '17960': '9006914', '17961': '9006915', '17963': '9006916', '17964': '9006917', '17965': '9006918', '17967': '9006919', '17968': '9006920', '17970': '9006921', '17972': '9006922', '17976': '9006923', '17978': '9006924', '17980': '9006925', '17981': '9006926', '17982': '9006927', '17983': '9006928', '17985': '9006929', '18011': '9006930', '18013': '9006931', '18014': '9006932', '18015': '9006933', '18017': '9006934', '18018': '9006935', '18020': '9006936', '18025': '9006937', '18031': '9006939', '18032': '9006940', '18034': '9006941', '18035': '9006942', '18036': '9006943', '18037': '9006944', '18038': '9006945', '18040': '9006946', '18041': '9006947', '18042': '9006948', '18045': '9006949', '18049': '9006950', '18051': '9006951', '18052': '9006952', '18053': '9006953', '18054': '9006954', '18055': '9006955', '18056': '9006956', '18058': '9006957', '18059': '9006958', '18062': '9006959', '18064': '9006961', '18066': '9006962', '18067': '9006963', '18069': '9006964', '18070': '9006965', '18071': '9006966', '18072': '9006967', '18073': '9006968', '18074': '9006969', '18076': '9006970', '18077': '9006971', '18078': '9006972', '18079': '9006973', '18080': '9006974', '18085': '9006977', '18087': '9006979', '18088': '9006980', '18091': '9006981', '18092': '9006982', '18101': '9006983', '18102': '9006984', '18103': '9006985', '18104': '9006986', '18106': '9006987', '18109': '9006988', '18195': '9006989', '18201': '9006990', '18202': '9006991', '18210': '9006992', '18211': '9006993', '18214': '9006994', '18216': '9006995', '18218': '9006996', '18222': '9006999', '18224': '9007000', '18229': '9007001', '18232': '9007004', '18235': '9007006', '18237': '9007007', '18240': '9007009', '18241': '9007010', '18242': '9007011', '18249': '9007015', '18250': '9007016', '18252': '9007017', '18255': '9007019', '18301': '9007020', '18302': '9007021', '18321': '9007022', '18322': '9007023', '18323': '9007024', '18324': '9007025', '18325': '9007026', '18326': '9007027', '18327': '9007028', '18328': '9007029', '18330': '9007030', '18331': '9007031', '18332': '9007032', '18333': '9007033', '18334': '9007034', '18336': '9007035', '18337': '9007036', '18340': '9007037', '18343': '9007039', '18344': '9007040', '18346': '9007041', '18347': '9007042', '18349': '9007043', '18350': '9007044', '18353': '9007046', '18354': '9007047', '18355': '9007048', '18360': '9007050', '18372': '9007051', '18403': '9007052', '18405': '9007053', '18407': '9007054', '18411': '9007055', '18414': '9007056', '18415': '9007057', '18417': '9007059', '18419': '9007060', '18421': '9007061', '18424': '9007062', '18425': '9007063', '18426': '9007064', '18427': '9007065', '18428': '9007066', '18431': '9007067', '18433': '9007068', '18434': '9007069', '18435': '9007070', '18436': '9007071', '18437': '9007072', '18438': '9007073', '18439': '9007074', '18443': '9007075', '18444': '9007076', '18445': '9007077', '18446': '9007078', '18447': '9007079', '18452': '9007080', '18453': '9007081', '18458': '9007082', '18460': '9007083', '18461': '9007084', '18462': '9007085', '18464': '9007086', '18465': '9007087', '18466': '9007088', '18469': '9007089', '18470': '9007090', '18471': '9007091', '18472': '9007092', '18503': '9007093', '18504': '9007094', '18505': '9007095', '18507': '9007096', '18508': '9007097', '18509': '9007098', '18510': '9007099', '18512': '9007100', '18515': '9007101', '18517': '9007102', '18518': '9007103', '18519': '9007104', '18602': '9007105', '18603': '9007106', '18610': '9007107', '18612': '9007108', '18614': '9007109', '18615': '9007110', '18616': '9007111', '18617': '9007112', '18618': '9007113', '18619': '9007114', '18621': '9007115', '18622': '9007116', '18623': '9007117', '18624': '9007118', '18626': '9007119', '18628': '9007120', '18629': '9007121', '18630': '9007122', '18631': '9007123', '18632': '9007124', '18634': '9007125', '18635': '9007126', '18636': '9007127', '18640': '9007128', '18641': '9007129', '18642': '9007130', '18643': '9007131', '18644': '9007132', '18651': '9007133', '18655': '9007134', '18656': '9007135', '18657': '9007136', '18660': '9007137', '18661': '9007138', '18701': '9007139', '18702': '9007140', '18704': '9007141', '18705': '9007142', '18706': '9007143', '18707': '9007144', '18708': '9007145', '18709': '9007146', '18711': '9007147', '18801': '9007149', '18810': '9007150', '18812': '9007151', '18818': '9007153', '18821': '9007154', '18822': '9007155', '18823': '9007156', '18824': '9007157', '18826': '9007158', '18828': '9007160', '18829': '9007161', '18830': '9007162', '18831': '9007163', '18832': '9007164', '18833': '9007165', '18834': '9007166', '18837': '9007167', '18840': '9007168', '18844': '9007169', '18845': '9007170', '18846': '9007171', '18847': '9007172', '18848': '9007173', '18850': '9007174', '18851': '9007175', '18853': '9007176', '18854': '9007177', '18901': '9007178', '18902': '9007179', '18914': '9007181', '18915': '9007182', '18917': '9007183', '18920': '9007184', '18923': '9007186', '18925': '9007187', '18927': '9007188', '18929': '9007189', '18930': '9007190', '18932': '9007192', '18934': '9007193', '18936': '9007194', '18938': '9007195', '18940': '9007196', '18942': '9007197', '18944': '9007198', '18947': '9007199', '18951': '9007201', '18954': '9007202', '18955': '9007203', '18960': '9007204', '18964': '9007205', '18966': '9007206', '18969': '9007207', '18972': '9007209', '18974': '9007210', '18976': '9007211', '18977': '9007212', '19001': '9007214', '19002': '9007215', '19003': '9007216', '19004': '9007217', '19006': '9007218', '19007': '9007219', '19008': '9007220', '19009': '9007221', '19010': '9007222', '19012': '9007223', '19013': '9007224', '19014': '9007225', '19015': '9007226', '19018': '9007227', '19020': '9007228', '19021': '9007229', '19022': '9007230', '19023': '9007231', '19025': '9007232', '19026': '9007233', '19027': '9007234', '19029': '9007235', '19030': '9007236', '19031': '9007237', '19032': '9007238', '19033': '9007239', '19034': '9007240', '19035': '9007241', '19036': '9007242', '19038': '9007243', '19040': '9007244', '19041': '9007245', '19043': '9007246', '19044': '9007247', '19046': '9007248', '19047': '9007249', '19050': '9007250', '19053': '9007251', '19054': '9007252', '19055': '9007253', '19056': '9007254', '19057': '9007255', '19060': '9007256', '19061': '9007257', '19063': '9007258', '19064': '9007259', '19066': '9007260', '19067': '9007261', '19070': '9007262', '19072': '9007263', '19073': '9007264', '19074': '9007265', '19075': '9007266', '19076': '9007267', '19078': '9007268', '19079': '9007269', '19081': '9007270', '19082': '9007271', '19083': '9007272', '19085': '9007273', '19086': '9007274', '19087': '9007275', '19089': '9007276', '19090': '9007277', '19094': '9007279', '19095': '9007280', '19096': '9007281', '19102': '9007282', '19103': '9007283', '19104': '9007284', '19106': '9007285', '19107': '9007286', '19109': '9007288', '19110': '9007289', '19111': '9007290', '19112': '9007291', '19113': '9007292', '19114': '9007293', '19115': '9007294', '19116': '9007295', '19118': '9007296', '19119': '9007297', '19120': '9007298', '19121': '9007299', '19122': '9007300', '19123': '9007301', '19124': '9007302', '19125': '9007303', '19126': '9007304', '19127': '9007305', '19128': '9007306', '19129': '9007307', '19130': '9007308', '19131': '9007309', '19132': '9007310', '19133': '9007311', '19134': '9007312', '19135': '9007313', '19136': '9007314', '19137': '9007315', '19138': '9007316', '19139': '9007317', '19140': '9007318', '19141': '9007319', '19142': '9007320', '19143': '9007321', '19144': '9007322', '19145': '9007323', '19146': '9007324', '19147': '9007325', '19148': '9007326', '19149': '9007327', '19150': '9007328', '19151': '9007329', '19152': '9007330', '19153': '9007331', '19154': '9007332', '19176': '9007333', '19192': '9007334', '19255': '9007335', '19301': '9007336', '19310': '9007337', '19311': '9007338', '19312': '9007339', '19317': '9007340', '19318': '9007341', '19319': '9007342', '19320': '9007343', '19330': '9007344', '19333': '9007346', '19335': '9007347', '19341': '9007348', '19342': '9007349', '19343': '9007350', '19344': '9007351', '19348': '9007353', '19350': '9007354', '19352': '9007356', '19355': '9007357', '19362': '9007359', '19363': '9007360', '19365': '9007361', '19372': '9007362', '19373': '9007363', '19374': '9007364', '19380': '9007365', '19382': '9007366', '19383': '9007367', '19390': '9007368', '19401': '9007369', '19403': '9007370', '19405': '9007371', '19406': '9007372', '19422': '9007374', '19425': '9007376', '19426': '9007377', '19428': '9007378', '19435': '9007379', '19436': '9007380', '19438': '9007382', '19440': '9007383', '19444': '9007385', '19446': '9007386', '19453': '9007387', '19454': '9007388', '19460': '9007390', '19462': '9007391', '19464': '9007392', '19465': '9007393', '19468': '9007394', '19473': '9007396', '19475': '9007398', '19477': '9007399', '19492': '9007403', '19501': '9007404', '19503': '9007405', '19504': '9007406', '19505': '9007407', '19506': '9007408', '19507': '9007409', '19508': '9007410', '19510': '9007411', '19512': '9007412', '19518': '9007414', '19520': '9007416', '19522': '9007417', '19525': '9007418', '19526': '9007419', '19529': '9007420', '19530': '9007421', '19533': '9007422', '19534': '9007423', '19538': '9007425', '19539': '9007426', '19540': '9007427', '19541': '9007428', '19543': '9007429', '19545': '9007431', '19547': '9007432', '19549': '9007433', '19550': '9007434', '19551': '9007435', '19555': '9007436', '19560': '9007438', '19562': '9007439', '19565': '9007440', '19567': '9007441', '19601': '9007442', '19602': '9007443', '19604': '9007445', '19605': '9007446', '19606': '9007447', '19607': '9007448', '19608': '9007449', '19609': '9007450', '19610': '9007451', '19611': '9007452', '19701': '9007454', '19702': '9007455', '19703': '9007456', '19706': '9007457', '19707': '9007458', '19709': '9007459', '19711': '9007460', '19713': '9007461', '19716': '9007462', '19717': '9007463', '19720': '9007464', '19721': '9007465', '19730': '9007466', '19732': '9007468', '19734': '9007470', '19736': '9007471', '19801': '9007472', '19802': '9007473', '19803': '9007474', '19804': '9007475', '19805': '9007476', '19806': '9007477', '19807': '9007478', '19808': '9007479', '19809': '9007480', '19810': '9007481', '19884': '9007482', '19895': '9007483', '19898': '9007484', '19901': '9007486', '19902': '9007487', '19904': '9007488', '19930': '9007489', '19931': '9007490', '19933': '9007491', '19934': '9007492', '19938': '9007494', '19939': '9007495', '19940': '9007496', '19941': '9007497', '19943': '9007498', '19944': '9007499', '19945': '9007500', '19946': '9007501', '19947': '9007502', '19950': '9007503', '19951': '9007504', '19952': '9007505', '19953': '9007506', '19954': '9007507', '19956': '9007509', '19958': '9007510', '19960': '9007511', '19962': '9007512', '19963': '9007513', '19964': '9007514', '19966': '9007515', '19967': '9007516', '19968': '9007517', '19970': '9007518', '19971': '9007519', '19973': '9007520', '19975': '9007521', '19977': '9007522', '19979': '9007523', '20001': '9007525', '20002': '9007526', '20003': '9007527', '20004': '9007528', '20005': '9007529', '20006': '9007530', '20007': '9007531', '20008': '9007532', '20009': '9007533', '20010': '9007534', '20011': '9007535', '20012': '9007536', '20015': '9007537', '20016': '9007538', '20017': '9007539', '20018': '9007540', '20019': '9007541', '20020': '9007542', '20024': '9007543', '20032': '9007544', '20036': '9007545', '20037': '9007546', '20045': '9007547', '20052': '9007548', '20064': '9007551', '20105': '9007552', '20106': '9007553', '20109': '9007554', '20110': '9007555', '20111': '9007556', '20112': '9007557', '20115': '9007558', '20117': '9007559', '20119': '9007561', '20120': '9007562', '20121': '9007563', '20124': '9007564', '20129': '9007565', '20130': '9007566', '20132': '9007567', '20135': '9007568', '20136': '9007569', '20137': '9007570', '20141': '9007571', '20143': '9007572', '20144': '9007573', '20147': '9007574', '20148': '9007575', '20151': '9007576', '20152': '9007577', '20155': '9007578', '20158': '9007579', '20164': '9007580', '20165': '9007581', '20166': '9007582', '20169': '9007583', '20170': '9007584', '20171': '9007585', '20175': '9007586', '20176': '9007587', '20180': '9007588', '20181': '9007589', '20184': '9007590', '20186': '9007591', '20187': '9007592', '20190': '9007594', '20191': '9007595', '20194': '9007596', '20197': '9007597', '20198': '9007598', '20216': '9007600', '20217': '9007601', '20219': '9007602', '20228': '9007604', '20229': '9007605', '20230': '9007606', '20240': '9007607', '20242': '9007608', '20245': '9007609', '20250': '9007610', '20303': '9007611', '20319': '9007613', '20375': '9007615', '20392': '9007616', '20401': '9007617', '20408': '9007619', '20410': '9007620', '20415': '9007621', '20418': '9007622', '20422': '9007623', '20431': '9007624', '20433': '9007625', '20451': '9007626', '20472': '9007627', '20500': '9007628', '20515': '9007629', '20520': '9007630', '20529': '9007631', '20530': '9007632', '20533': '9007633', '20535': '9007634', '20536': '9007635', '20540': '9007636', '20542': '9007637', '20543': '9007638', '20546': '9007639', '20547': '9007640', '20548': '9007641', '20549': '9007642', '20551': '9007643', '20560': '9007644', '20571': '9007645', '20580': '9007646', '20590': '9007648', '20591': '9007649', '20593': '9007650', '20597': '9007651', '20601': '9007652', '20602': '9007653', '20603': '9007654', '20606': '9007656', '20607': '9007657', '20608': '9007658', '20609': '9007659', '20611': '9007660', '20613': '9007662', '20615': '9007663', '20616': '9007664', '20617': '9007665', '20618': '9007666', '20619': '9007667', '20620': '9007668', '20621': '9007669', '20622': '9007670', '20623': '9007671', '20624': '9007672', '20625': '9007673', '20626': '9007674', '20628': '9007675', '20629': '9007676', '20630': '9007677', '20632': '9007678', '20634': '9007679', '20636': '9007680', '20637': '9007681', '20639': '9007682', '20640': '9007683', '20645': '9007684', '20646': '9007685', '20650': '9007686', '20653': '9007687', '20656': '9007688', '20657': '9007689', '20658': '9007690', '20659': '9007691', '20662': '9007692', '20664': '9007693', '20667': '9007694', '20670': '9007695', '20674': '9007696', '20675': '9007697', '20676': '9007698', '20677': '9007699', '20678': '9007700', '20680': '9007701', '20684': '9007702', '20685': '9007703', '20687': '9007704', '20688': '9007705', '20689': '9007706', '20690': '9007707', '20692': '9007708', '20693': '9007709', '20695': '9007710', '20701': '9007711', '20705': '9007712', '20706': '9007713', '20707': '9007714', '20708': '9007715', '20710': '9007716', '20711': '9007717', '20712': '9007718', '20714': '9007719', '20715': '9007720', '20716': '9007721', '20720': '9007722', '20721': '9007723', '20722': '9007724', '20723': '9007725', '20724': '9007726', '20732': '9007728', '20733': '9007729', '20735': '9007730', '20736': '9007731', '20737': '9007732', '20740': '9007733', '20743': '9007735', '20744': '9007736', '20745': '9007737', '20746': '9007738', '20747': '9007739', '20748': '9007740', '20751': '9007741', '20754': '9007742', '20755': '9007743', '20758': '9007744', '20759': '9007745', '20762': '9007746', '20763': '9007747', '20764': '9007748', '20765': '9007749', '20769': '9007750', '20770': '9007751', '20772': '9007753', '20774': '9007754', '20776': '9007755', '20777': '9007756', '20778': '9007757', '20779': '9007758', '20781': '9007759', '20782': '9007760', '20783': '9007761', '20784': '9007762', '20785': '9007763', '20794': '9007765', '20812': '9007766', '20814': '9007767', '20815': '9007768', '20816': '9007769', '20817': '9007770', '20818': '9007771', '20832': '9007772', '20833': '9007773', '20837': '9007774', '20838': '9007775', '20839': '9007776', '20841': '9007777', '20842': '9007778', '20850': '9007779', '20851': '9007780', '20852': '9007781', '20853': '9007782', '20854': '9007783', '20855': '9007784', '20860': '9007785', '20861': '9007786', '20862': '9007787', '20866': '9007788', '20868': '9007789', '20871': '9007790', '20872': '9007791', '20874': '9007792', '20876': '9007793', '20877': '9007794', '20878': '9007795', '20879': '9007796', '20880': '9007797', '20882': '9007798', '20886': '9007799', '20889': '9007800', '20892': '9007801', '20894': '9007802', '20895': '9007803', '20896': '9007804', '20899': '9007805', '20901': '9007806', '20902': '9007807', '20903': '9007808', '20904': '9007809', '20905': '9007810', '20906': '9007811', '20910': '9007812', '20912': '9007813', '21001': '9007814', '21005': '9007815', '21009': '9007816', '21010': '9007817', '21012': '9007818', '21013': '9007819', '21014': '9007820', '21015': '9007821', '21017': '9007822', '21022': '9007823', '21028': '9007824', '21029': '9007825', '21030': '9007826', '21031': '9007827', '21032': '9007828', '21034': '9007829', '21035': '9007830', '21036': '9007831', '21037': '9007832', '21040': '9007833', '21042': '9007834', '21043': '9007835', '21044': '9007836', '21045': '9007837', '21046': '9007838', '21047': '9007839', '21048': '9007840', '21050': '9007841', '21051': '9007842', '21052': '9007843', '21053': '9007844', '21054': '9007845', '21056': '9007846', '21057': '9007847', '21060': '9007848', '21061': '9007849', '21074': '9007851', '21075': '9007852', '21076': '9007853', '21077': '9007854', '21078': '9007855', '21082': '9007856', '21084': '9007857', '21085': '9007858', '21087': '9007859', '21090': '9007861', '21093': '9007862', '21102': '9007863', '21104': '9007864', '21108': '9007866', '21111': '9007867', '21113': '9007868', '21114': '9007869', '21117': '9007870', '21120': '9007871', '21122': '9007872', '21128': '9007873', '21130': '9007874', '21131': '9007875', '21132': '9007876', '21133': '9007877', '21136': '9007878', '21140': '9007879', '21144': '9007880', '21146': '9007881', '21152': '9007882', '21153': '9007883', '21154': '9007884', '21155': '9007885', '21156': '9007886', '21157': '9007887', '21158': '9007888', '21160': '9007889', '21161': '9007890', '21162': '9007891', '21163': '9007892', '21201': '9007893', '21202': '9007894', '21204': '9007895', '21205': '9007896', '21206': '9007897', '21207': '9007898', '21208': '9007899', '21209': '9007900', '21210': '9007901', '21211': '9007902', '21212': '9007903', '21213': '9007904', '21214': '9007905', '21215': '9007906', '21216': '9007907', '21217': '9007908', '21218': '9007909', '21219': '9007910', '21220': '9007911', '21221': '9007912', '21222': '9007913', '21223': '9007914', '21224': '9007915', '21225': '9007916', '21226': '9007917', '21227': '9007918', '21228': '9007919', '21229': '9007920', '21230': '9007921', '21231': '9007922', '21233': '9007923', '21234': '9007924', '21236': '9007925', '21237': '9007926', '21239': '9007927', '21240': '9007928', '21244': '9007929', '21250': '9007930', '21251': '9007931', '21252': '9007932', '21278': '9007933', '21286': '9007934', '21287': '9007935', '21290': '9007936', '21401': '9007937', '21402': '9007938', '21403': '9007939', '21405': '9007940', '21409': '9007941', '21502': '9007942', '21520': '9007944', '21521': '9007945', '21522': '9007946', '21523': '9007947', '21529': '9007948', '21530': '9007949', '21531': '9007950', '21532': '9007951', '21536': '9007952', '21538': '9007953', '21539': '9007954', '21540': '9007955', '21541': '9007956', '21545': '9007957', '21550': '9007958', '21555': '9007959', '21557': '9007960', '21561': '9007962', '21562': '9007963', '21601': '9007964', '21607': '9007965', '21610': '9007966', '21612': '9007967', '21613': '9007968', '21617': '9007969', '21619': '9007970', '21620': '9007971', '21622': '9007972', '21623': '9007973', '21625': '9007974', '21626': '9007975', '21627': '9007976', '21629': '9007977', '21631': '9007978', '21632': '9007979', '21634': '9007980', '21635': '9007981', '21636': '9007982', '21638': '9007983', '21639': '9007984', '21640': '9007985', '21643': '9007987', '21644': '9007988', '21645': '9007989', '21647': '9007990', '21648': '9007991', '21649': '9007992', '21650': '9007993', '21651': '9007994', '21652': '9007995', '21654': '9007997', '21655': '9007998', '21657': '9007999', '21658': '9008000', '21659': '9008001', '21660': '9008002', '21661': '9008003', '21662': '9008004', '21663': '9008005', '21665': '9008007', '21666': '9008008', '21667': '9008009', '21668': '9008010', '21669': '9008011', '21671': '9008012', '21672': '9008013', '21673': '9008014', '21675': '9008015', '21676': '9008016', '21677': '9008017', '21678': '9008018', '21679': '9008019', '21701': '9008020', '21702': '9008021', '21703': '9008022', '21704': '9008023', '21710': '9008024', '21711': '9008025', '21713': '9008026', '21716': '9008027', '21718': '9008029', '21719': '9008030', '21722': '9008031', '21723': '9008032', '21727': '9008033', '21733': '9008034', '21737': '9008035', '21738': '9008036', '21740': '9008037', '21742': '9008038', '21746': '9008039', '21750': '9008040', '21754': '9008041', '21755': '9008042', '21756': '9008043', '21757': '9008044', '21758': '9008045', '21766': '9008048', '21767': '9008049', '21769': '9008050', '21770': '9008051', '21771': '9008052', '21773': '9008053', '21774': '9008054', '21776': '9008055', '21777': '9008056', '21778': '9008057', '21779': '9008058', '21780': '9008059', '21782': '9008060', '21783': '9008061', '21784': '9008062', '21787': '9008063', '21788': '9008064', '21790': '9008065', '21791': '9008066', '21793': '9008067', '21794': '9008068', '21795': '9008069', '21797': '9008070', '21798': '9008071', '21801': '9008072', '21804': '9008073', '21810': '9008074', '21811': '9008075', '21813': '9008076', '21814': '9008077', '21817': '9008078', '21821': '9008079', '21822': '9008080', '21824': '9008081', '21826': '9008082', '21829': '9008083', '21830': '9008084', '21835': '9008085', '21837': '9008086', '21838': '9008087', '21840': '9008088', '21841': '9008089', '21842': '9008090', '21849': '9008091', '21850': '9008092', '21851': '9008093', '21853': '9008094', '21856': '9008095', '21861': '9008096', '21862': '9008097', '21863': '9008098', '21864': '9008099', '21865': '9008100', '21866': '9008101', '21869': '9008102', '21871': '9008103', '21872': '9008104', '21874': '9008105', '21875': '9008106', '21890': '9008107', '21901': '9008108', '21902': '9008109', '21903': '9008110', '21904': '9008111', '21911': '9008112', '21912': '9008113', '21913': '9008114', '21914': '9008115', '21915': '9008116', '21917': '9008117', '21918': '9008118', '21919': '9008119', '21920': '9008120', '21921': '9008121', '21930': '9008122', '22003': '9008123', '22015': '9008124', '22025': '9008125', '22026': '9008126', '22027': '9008127', '22030': '9008128', '22031': '9008129', '22032': '9008130', '22033': '9008131', '22035': '9008132', '22039': '9008133', '22041': '9008134', '22042': '9008135', '22043': '9008136', '22044': '9008137', '22046': '9008138', '22060': '9008139', '22066': '9008140', '22079': '9008141', '22101': '9008142', '22102': '9008143', '22124': '9008145', '22134': '9008147', '22150': '9008148', '22151': '9008149', '22152': '9008150', '22153': '9008151', '22172': '9008153', '22180': '9008154', '22181': '9008155', '22182': '9008156', '22185': '9008158', '22191': '9008159', '22192': '9008160', '22193': '9008161', '22201': '9008162', '22202': '9008163', '22203': '9008164', '22204': '9008165', '22205': '9008166', '22206': '9008167', '22207': '9008168', '22209': '9008169', '22211': '9008170', '22213': '9008171', '22214': '9008172', '22217': '9008173', '22226': '9008174', '22227': '9008175', '22230': '9008176', '22240': '9008177', '22242': '9008178', '22243': '9008179', '22301': '9008180', '22302': '9008181', '22303': '9008182', '22304': '9008183', '22305': '9008184', '22306': '9008185', '22307': '9008186', '22308': '9008187', '22309': '9008188', '22310': '9008189', '22311': '9008190', '22312': '9008191', '22314': '9008192', '22315': '9008193', '22331': '9008194', '22332': '9008195', '22401': '9008196', '22405': '9008197', '22406': '9008198', '22407': '9008199', '22408': '9008200', '22427': '9008201', '22432': '9008202', '22433': '9008203', '22435': '9008204', '22436': '9008205', '22437': '9008206', '22438': '9008207', '22443': '9008209', '22448': '9008210', '22454': '9008211', '22460': '9008212', '22469': '9008213', '22473': '9008214', '22476': '9008215', '22480': '9008216', '22482': '9008217', '22485': '9008218', '22488': '9008219', '22503': '9008220', '22504': '9008221', '22508': '9008222', '22509': '9008223', '22511': '9008224', '22514': '9008225', '22520': '9008227', '22534': '9008229', '22535': '9008230', '22538': '9008231', '22539': '9008232', '22542': '9008233', '22546': '9008234', '22551': '9008236', '22553': '9008237', '22554': '9008238', '22556': '9008239', '22560': '9008240', '22567': '9008242', '22572': '9008243', '22576': '9008244', '22578': '9008245', '22580': '9008246', '22601': '9008247', '22602': '9008248', '22603': '9008249', '22610': '9008250', '22611': '9008251', '22620': '9008252', '22623': '9008253', '22624': '9008254', '22625': '9008255', '22627': '9008256', '22630': '9008257', '22637': '9008258', '22639': '9008259', '22640': '9008260', '22641': '9008261', '22642': '9008262', '22643': '9008263', '22644': '9008264', '22645': '9008265', '22650': '9008267', '22652': '9008268', '22654': '9008269', '22655': '9008270', '22656': '9008271', '22657': '9008272', '22660': '9008273', '22663': '9008274', '22664': '9008275', '22701': '9008276', '22709': '9008277', '22711': '9008278', '22712': '9008279', '22713': '9008280', '22714': '9008281', '22715': '9008282', '22716': '9008283', '22718': '9008284', '22719': '9008285', '22720': '9008286', '22722': '9008287', '22723': '9008288', '22724': '9008289', '22725': '9008290', '22726': '9008291', '22727': '9008292', '22728': '9008293', '22729': '9008294', '22733': '9008295', '22734': '9008296', '22735': '9008297', '22736': '9008298', '22737': '9008299', '22738': '9008300', '22740': '9008301', '22741': '9008302', '22742': '9008303', '22747': '9008304', '22749': '9008305', '22801': '9008306', '22802': '9008307', '22807': '9008308', '22810': '9008309', '22811': '9008310', '22812': '9008311', '22815': '9008312', '22820': '9008313', '22821': '9008314', '22824': '9008315', '22827': '9008316', '22830': '9008317', '22831': '9008318', '22832': '9008319', '22834': '9008320', '22835': '9008321', '22840': '9008322', '22841': '9008323', '22842': '9008324', '22843': '9008325', '22844': '9008326', '22845': '9008327', '22846': '9008328', '22847': '9008329', '22849': '9008331', '22850': '9008332', '22851': '9008333', '22853': '9008334', '22901': '9008335', '22902': '9008336', '22903': '9008337', '22911': '9008341', '22920': '9008342', '22922': '9008343', '22923': '9008344', '22931': '9008345', '22932': '9008346', '22935': '9008347', '22936': '9008348', '22937': '9008349', '22938': '9008350', '22939': '9008351', '22940': '9008352', '22942': '9008353', '22943': '9008354', '22946': '9008355', '22947': '9008356', '22949': '9008357', '22952': '9008358', '22958': '9008359', '22959': '9008360', '22960': '9008361', '22963': '9008362', '22964': '9008363', '22967': '9008364', '22968': '9008365', '22969': '9008366', '22971': '9008367', '22972': '9008368', '22973': '9008369', '22974': '9008370', '22976': '9008371', '22980': '9008372', '23002': '9008373', '23004': '9008374', '23005': '9008375', '23009': '9008376', '23011': '9008377', '23015': '9008378', '23022': '9008379', '23024': '9008380', '23027': '9008381', '23030': '9008382', '23032': '9008383', '23038': '9008384', '23039': '9008385', '23040': '9008386', '23043': '9008387', '23045': '9008388', '23047': '9008389', '23050': '9008390', '23055': '9008391', '23059': '9008392', '23060': '9008393', '23061': '9008394', '23062': '9008395', '23063': '9008396', '23065': '9008397', '23069': '9008398', '23070': '9008399', '23071': '9008400', '23072': '9008401', '23075': '9008402', '23079': '9008403', '23083': '9008404', '23084': '9008405', '23085': '9008406', '23086': '9008407', '23089': '9008408', '23091': '9008410', '23092': '9008411', '23093': '9008412', '23102': '9008413', '23103': '9008414', '23106': '9008415', '23109': '9008416', '23110': '9008417', '23111': '9008418', '23112': '9008419', '23113': '9008420', '23114': '9008421', '23116': '9008422', '23117': '9008423', '23119': '9008424', '23120': '9008425', '23123': '9008426', '23124': '9008427', '23128': '9008428', '23129': '9008429', '23130': '9008430', '23138': '9008431', '23139': '9008432', '23140': '9008433', '23141': '9008434', '23146': '9008435', '23148': '9008436', '23149': '9008437', '23150': '9008438', '23153': '9008439', '23156': '9008440', '23163': '9008441', '23168': '9008442', '23169': '9008443', '23173': '9008444', '23175': '9008445', '23176': '9008446', '23177': '9008447', '23180': '9008448', '23181': '9008449', '23185': '9008450', '23186': '9008451', '23188': '9008452', '23192': '9008453', '23219': '9008454', '23220': '9008455', '23221': '9008456', '23222': '9008457', '23223': '9008458', '23224': '9008459', '23225': '9008460', '23226': '9008461', '23227': '9008462', '23228': '9008463', '23229': '9008464', '23230': '9008465', '23231': '9008466', '23232': '9008467', '23233': '9008468', '23234': '9008469', '23235': '9008470', '23236': '9008471', '23237': '9008472', '23238': '9008473', '23249': '9008475', '23250': '9008476', '23273': '9008477', '23294': '9008479', '23298': '9008480', '23301': '9008481', '23302': '9008482', '23303': '9008483', '23306': '9008484', '23307': '9008485', '23308': '9008486', '23310': '9008487', '23314': '9008488', '23315': '9008489', '23320': '9008490', '23321': '9008491', '23322': '9008492', '23323': '9008493', '23324': '9008494', '23325': '9008495', '23326': '9008496', '23336': '9008497', '23337': '9008498', '23350': '9008499', '23354': '9008500', '23356': '9008501', '23357': '9008502', '23358': '9008503', '23359': '9008504', '23395': '9008505', '23405': '9008507', '23409': '9008509', '23410': '9008510', '23413': '9008511', '23415': '9008512', '23416': '9008513', '23417': '9008514', '23418': '9008515', '23420': '9008516', '23421': '9008517', '23423': '9008518', '23426': '9008520', '23427': '9008521', '23430': '9008522', '23432': '9008523', '23433': '9008524', '23434': '9008525', '23435': '9008526', '23436': '9008527', '23437': '9008528', '23438': '9008529', '23440': '9008530', '23442': '9008531', '23451': '9008532', '23452': '9008533', '23453': '9008534', '23454': '9008535', '23455': '9008536', '23456': '9008537', '23457': '9008538', '23459': '9008539', '23460': '9008540', '23461': '9008541', '23462': '9008542', '23464': '9008543', '23480': '9008544', '23487': '9008546', '23488': '9008547', '23502': '9008549', '23503': '9008550', '23504': '9008551', '23505': '9008552', '23507': '9008553', '23508': '9008554', '23509': '9008555', '23510': '9008556', '23511': '9008557', '23513': '9008558', '23515': '9008559', '23517': '9008560', '23518': '9008561', '23523': '9008562', '23551': '9008563', '23601': '9008564', '23602': '9008565', '23603': '9008566', '23604': '9008567', '23605': '9008568', '23606': '9008569', '23607': '9008570', '23608': '9008571', '23651': '9008572', '23661': '9008573', '23662': '9008574', '23663': '9008575', '23664': '9008576', '23665': '9008577', '23666': '9008578', '23667': '9008579', '23668': '9008580', '23669': '9008581', '23690': '9008582', '23691': '9008583', '23692': '9008584', '23693': '9008585', '23696': '9008586', '23701': '9008587', '23702': '9008588', '23703': '9008589', '23704': '9008590', '23707': '9008591', '23801': '9008592', '23803': '9008593', '23805': '9008594', '23806': '9008595', '23821': '9008596', '23824': '9008597', '23827': '9008598', '23828': '9008599', '23829': '9008600', '23830': '9008601', '23831': '9008602', '23832': '9008603', '23833': '9008604', '23834': '9008605', '23836': '9008606', '23837': '9008607', '23838': '9008608', '23839': '9008609', '23840': '9008610', '23841': '9008611', '23842': '9008612', '23843': '9008613', '23844': '9008614', '23845': '9008615', '23846': '9008616', '23847': '9008617', '23850': '9008618', '23851': '9008619', '23856': '9008620', '23857': '9008621', '23860': '9008622', '23866': '9008623', '23867': '9008624', '23868': '9008625', '23872': '9008626', '23874': '9008627', '23875': '9008628', '23876': '9008629', '23878': '9008630', '23879': '9008631', '23881': '9008632', '23882': '9008633', '23883': '9008634', '23885': '9008635', '23887': '9008636', '23888': '9008637', '23889': '9008638', '23890': '9008639', '23891': '9008640', '23893': '9008641', '23894': '9008642', '23897': '9008643', '23898': '9008644', '23899': '9008645', '23901': '9008646', '23915': '9008647', '23917': '9008648', '23919': '9008649', '23920': '9008650', '23921': '9008651', '23922': '9008652', '23923': '9008653', '23924': '9008654', '23927': '9008655', '23930': '9008656', '23934': '9008657', '23936': '9008658', '23937': '9008659', '23938': '9008660', '23942': '9008661', '23944': '9008662', '23947': '9008663', '23950': '9008664', '23952': '9008665', '23954': '9008666', '23958': '9008667', '23959': '9008668', '23960': '9008669', '23962': '9008670', '23963': '9008671', '23964': '9008672', '23966': '9008673', '23967': '9008674', '23968': '9008675', '23970': '9008676', '23974': '9008677', '23976': '9008678', '24011': '9008679', '24012': '9008680', '24013': '9008681', '24014': '9008682', '24015': '9008683', '24016': '9008684', '24017': '9008685', '24018': '9008686', '24019': '9008687', '24042': '9008689', '24053': '9008690', '24054': '9008691', '24055': '9008692', '24059': '9008694', '24060': '9008695', '24061': '9008696', '24064': '9008697', '24065': '9008698', '24066': '9008699', '24067': '9008700', '24069': '9008701', '24070': '9008702', '24072': '9008703', '24073': '9008704', '24076': '9008705', '24077': '9008706', '24078': '9008707', '24079': '9008708', '24082': '9008709', '24083': '9008710', '24084': '9008711', '24085': '9008712', '24086': '9008713', '24087': '9008714', '24088': '9008715', '24089': '9008716', '24090': '9008717', '24091': '9008718', '24092': '9008719', '24093': '9008720', '24095': '9008721', '24101': '9008722', '24102': '9008723', '24104': '9008724', '24105': '9008725', '24112': '9008726', '24120': '9008727', '24121': '9008728', '24122': '9008729', '24124': '9008730', '24127': '9008731', '24128': '9008732', '24131': '9008733', '24133': '9008735', '24134': '9008736', '24136': '9008737', '24137': '9008738', '24138': '9008739', '24139': '9008740', '24141': '9008741', '24142': '9008742', '24147': '9008743', '24148': '9008744', '24149': '9008745', '24150': '9008746', '24151': '9008747', '24153': '9008748', '24161': '9008749', '24162': '9008750', '24165': '9008751', '24167': '9008752', '24168': '9008753', '24171': '9008754', '24174': '9008755', '24175': '9008756', '24176': '9008757', '24179': '9008758', '24184': '9008759', '24185': '9008760', '24201': '9008761', '24202': '9008762', '24210': '9008763', '24211': '9008764', '24216': '9008765', '24217': '9008766', '24219': '9008767', '24220': '9008768', '24221': '9008769', '24224': '9008770', '24225': '9008771', '24226': '9008772', '24228': '9008773', '24230': '9008774', '24236': '9008775', '24237': '9008776', '24239': '9008777', '24243': '9008778', '24244': '9008779', '24245': '9008780', '24248': '9008782', '24250': '9008783', '24251': '9008784', '24256': '9008785', '24258': '9008786', '24260': '9008787', '24263': '9008788', '24265': '9008789', '24266': '9008790', '24269': '9008791', '24270': '9008792', '24271': '9008793', '24272': '9008794', '24273': '9008795', '24277': '9008796', '24279': '9008797', '24280': '9008798', '24281': '9008799', '24282': '9008800', '24283': '9008801', '24290': '9008802', '24292': '9008803', '24293': '9008804', '24301': '9008805', '24311': '9008806', '24312': '9008807', '24313': '9008808', '24314': '9008809', '24315': '9008810', '24316': '9008811', '24317': '9008812', '24318': '9008813', '24319': '9008814', '24322': '9008815', '24323': '9008816', '24324': '9008817', '24325': '9008818', '24326': '9008819', '24328': '9008820', '24330': '9008821', '24333': '9008822', '24340': '9008823', '24343': '9008824', '24347': '9008825', '24348': '9008826', '24350': '9008827', '24351': '9008828', '24352': '9008829', '24354': '9008830', '24360': '9008831', '24361': '9008832', '24363': '9008833', '24368': '9008834', '24370': '9008835', '24374': '9008836', '24375': '9008837', '24377': '9008838', '24378': '9008839', '24380': '9008840', '24381': '9008841', '24382': '9008842', '24401': '9008843', '24412': '9008845', '24413': '9008846', '24416': '9008848', '24421': '9008849', '24422': '9008850', '24426': '9008851', '24430': '9008852', '24431': '9008853', '24432': '9008854', '24433': '9008855', '24435': '9008856', '24437': '9008857', '24439': '9008858', '24440': '9008859', '24441': '9008860', '24445': '9008861', '24450': '9008863', '24458': '9008864', '24459': '9008865', '24460': '9008866', '24464': '9008868', '24465': '9008869', '24467': '9008870', '24471': '9008871', '24472': '9008872', '24473': '9008873', '24476': '9008875', '24477': '9008876', '24479': '9008877', '24482': '9008878', '24483': '9008879', '24484': '9008880', '24485': '9008881', '24486': '9008882', '24487': '9008883', '24501': '9008884', '24502': '9008885', '24503': '9008886', '24504': '9008887', '24517': '9008889', '24520': '9008890', '24521': '9008891', '24522': '9008892', '24523': '9008893', '24526': '9008894', '24527': '9008895', '24528': '9008896', '24529': '9008897', '24530': '9008898', '24531': '9008899', '24534': '9008900', '24536': '9008901', '24538': '9008902', '24539': '9008903', '24540': '9008904', '24541': '9008905', '24549': '9008906', '24550': '9008907', '24551': '9008908', '24553': '9008909', '24554': '9008910', '24555': '9008911', '24556': '9008912', '24557': '9008913', '24558': '9008914', '24562': '9008915', '24563': '9008916', '24565': '9008917', '24566': '9008918', '24569': '9008919', '24570': '9008920', '24571': '9008921', '24572': '9008922', '24574': '9008923', '24577': '9008924', '24578': '9008925', '24579': '9008926', '24580': '9008927', '24581': '9008928', '24586': '9008929', '24588': '9008930', '24589': '9008931', '24590': '9008932', '24592': '9008933', '24593': '9008934', '24594': '9008935', '24597': '9008936', '24598': '9008937', '24599': '9008938', '24602': '9008939', '24603': '9008940', '24604': '9008941', '24605': '9008942', '24607': '9008943', '24609': '9008944', '24614': '9008945', '24620': '9008946', '24622': '9008947', '24630': '9008950', '24631': '9008951', '24634': '9008952', '24635': '9008953', '24637': '9008954', '24639': '9008955', '24641': '9008956', '24646': '9008957', '24649': '9008958', '24651': '9008959', '24656': '9008960', '24657': '9008961', '24701': '9008963', '24712': '9008964', '24714': '9008965', '24715': '9008966', '24724': '9008967', '24726': '9008968', '24733': '9008969', '24736': '9008970', '24740': '9008971', '24747': '9008972', '24801': '9008973', '24808': '9008974', '24815': '9008977', '24818': '9008979', '24822': '9008981', '24823': '9008982', '24827': '9008983', '24828': '9008984', '24830': '9008985', '24836': '9008988', '24839': '9008989', '24844': '9008990', '24846': '9008992', '24848': '9008993', '24849': '9008994', '24850': '9008995', '24855': '9008998', '24862': '9009001', '24866': '9009002', '24868': '9009003', '24869': '9009004', '24870': '9009005', '24872': '9009007', '24873': '9009008', '24874': '9009009', '24879': '9009010', '24882': '9009012', '24884': '9009013', '24892': '9009014', '24901': '9009017', '24910': '9009018', '24915': '9009019', '24916': '9009020', '24920': '9009022', '24924': '9009023', '24925': '9009024', '24927': '9009025', '24931': '9009026', '24934': '9009027', '24935': '9009028', '24938': '9009029', '24941': '9009030', '24943': '9009031', '24944': '9009032', '24945': '9009033', '24946': '9009034', '24951': '9009035', '24954': '9009036', '24963': '9009037', '24966': '9009038', '24970': '9009039', '24983': '9009041', '24984': '9009042', '24986': '9009044', '24991': '9009045', '25003': '9009046', '25005': '9009047', '25007': '9009048', '25008': '9009049', '25015': '9009051', '25019': '9009052', '25021': '9009053', '25024': '9009055', '25028': '9009056', '25033': '9009057', '25035': '9009058', '25039': '9009059', '25043': '9009060', '25044': '9009061', '25045': '9009062', '25047': '9009063', '25048': '9009064', '25049': '9009065', '25053': '9009066', '25059': '9009067', '25060': '9009068', '25062': '9009069', '25063': '9009070', '25064': '9009071', '25067': '9009072', '25070': '9009073', '25071': '9009074', '25075': '9009075', '25082': '9009076', '25085': '9009077', '25086': '9009078', '25102': '9009079', '25106': '9009080', '25111': '9009081', '25113': '9009082', '25123': '9009083', '25125': '9009084', '25130': '9009085', '25136': '9009086', '25140': '9009087', '25141': '9009088', '25143': '9009089', '25148': '9009090', '25159': '9009091', '25160': '9009092', '25161': '9009093', '25164': '9009095', '25165': '9009096', '25168': '9009097', '25173': '9009098', '25174': '9009099', '25177': '9009100', '25181': '9009101', '25186': '9009102', '25187': '9009103', '25193': '9009104', '25202': '9009105', '25204': '9009106', '25206': '9009107', '25208': '9009108', '25209': '9009109', '25213': '9009111', '25234': '9009112', '25235': '9009113', '25239': '9009114', '25241': '9009115', '25243': '9009116', '25244': '9009117', '25245': '9009118', '25248': '9009119', '25251': '9009120', '25252': '9009121', '25253': '9009122', '25259': '9009123', '25260': '9009124', '25261': '9009125', '25262': '9009126', '25265': '9009127', '25266': '9009128', '25267': '9009129', '25268': '9009130', '25270': '9009131', '25271': '9009132', '25275': '9009133', '25276': '9009134', '25286': '9009135', '25287': '9009136', '25301': '9009137', '25302': '9009138', '25303': '9009139', '25304': '9009140', '25305': '9009141', '25306': '9009142', '25309': '9009143', '25311': '9009144', '25312': '9009145', '25313': '9009146', '25314': '9009147', '25315': '9009148', '25320': '9009149', '25401': '9009152', '25403': '9009153', '25404': '9009154', '25405': '9009155', '25411': '9009156', '25413': '9009157', '25414': '9009158', '25419': '9009159', '25420': '9009160', '25421': '9009161', '25422': '9009162', '25425': '9009163', '25427': '9009164', '25428': '9009165', '25430': '9009166', '25434': '9009168', '25437': '9009169', '25438': '9009170', '25442': '9009171', '25443': '9009172', '25444': '9009173', '25446': '9009174', '25501': '9009175', '25502': '9009176', '25503': '9009177', '25504': '9009178', '25506': '9009179', '25508': '9009181', '25510': '9009182', '25511': '9009183', '25514': '9009184', '25515': '9009185', '25517': '9009186', '25520': '9009187', '25521': '9009188', '25523': '9009189', '25524': '9009190', '25526': '9009191', '25529': '9009192', '25530': '9009193', '25535': '9009194', '25537': '9009195', '25541': '9009196', '25545': '9009197', '25547': '9009198', '25550': '9009199', '25555': '9009200', '25557': '9009201', '25559': '9009202', '25560': '9009203', '25564': '9009204', '25565': '9009205', '25567': '9009206', '25570': '9009207', '25571': '9009208', '25573': '9009209', '25601': '9009210', '25607': '9009211', '25621': '9009213', '25625': '9009214', '25630': '9009215', '25632': '9009216', '25635': '9009217', '25638': '9009218', '25649': '9009219', '25652': '9009221', '25654': '9009222', '25661': '9009223', '25669': '9009225', '25670': '9009226', '25671': '9009227', '25674': '9009229', '25699': '9009230', '25701': '9009231', '25702': '9009232', '25703': '9009233', '25704': '9009234', '25705': '9009235', '25755': '9009237', '25801': '9009238', '25812': '9009239', '25813': '9009240', '25817': '9009241', '25820': '9009242', '25823': '9009243', '25825': '9009244', '25827': '9009245', '25831': '9009246', '25832': '9009247', '25837': '9009248', '25839': '9009249', '25840': '9009250', '25841': '9009251', '25843': '9009252', '25844': '9009253', '25845': '9009254', '25854': '9009256', '25857': '9009257', '25862': '9009258', '25864': '9009259', '25865': '9009260', '25868': '9009261', '25878': '9009263', '25880': '9009264', '25882': '9009265', '25901': '9009266', '25902': '9009267', '25904': '9009268', '25908': '9009269', '25913': '9009271', '25915': '9009272', '25917': '9009274', '25918': '9009275', '25920': '9009276', '25921': '9009277', '25922': '9009278', '25932': '9009279', '25951': '9009281', '25958': '9009282', '25962': '9009283', '25969': '9009284', '25971': '9009285', '25976': '9009286', '25981': '9009287', '25984': '9009288', '25989': '9009290', '26003': '9009291', '26030': '9009292', '26031': '9009293', '26032': '9009294', '26033': '9009295', '26034': '9009296', '26035': '9009297', '26036': '9009298', '26037': '9009299', '26038': '9009300', '26039': '9009301', '26040': '9009302', '26041': '9009303', '26047': '9009304', '26050': '9009305', '26055': '9009306', '26059': '9009307', '26060': '9009308', '26062': '9009309', '26070': '9009310', '26075': '9009312', '26101': '9009313', '26104': '9009314', '26105': '9009315', '26134': '9009316', '26136': '9009317', '26137': '9009318', '26138': '9009319', '26141': '9009320', '26142': '9009321', '26143': '9009322', '26146': '9009323', '26147': '9009324', '26148': '9009325', '26149': '9009326', '26150': '9009327', '26151': '9009328', '26152': '9009329', '26155': '9009330', '26159': '9009331', '26160': '9009332', '26161': '9009333', '26162': '9009334', '26164': '9009335', '26169': '9009337', '26170': '9009338', '26175': '9009339', '26178': '9009340', '26180': '9009341', '26181': '9009342', '26184': '9009343', '26187': '9009345', '26201': '9009346', '26203': '9009347', '26205': '9009348', '26206': '9009349', '26208': '9009350', '26209': '9009351', '26215': '9009352', '26218': '9009353', '26224': '9009354', '26230': '9009355', '26234': '9009356', '26237': '9009358', '26241': '9009359', '26250': '9009360', '26253': '9009361', '26254': '9009362', '26257': '9009363', '26260': '9009364', '26261': '9009365', '26263': '9009366', '26264': '9009367', '26267': '9009368', '26268': '9009369', '26269': '9009370', '26270': '9009371', '26271': '9009372', '26273': '9009373', '26276': '9009374', '26278': '9009375', '26280': '9009376', '26282': '9009377', '26283': '9009378', '26287': '9009379', '26288': '9009380', '26289': '9009381', '26291': '9009382', '26292': '9009383', '26294': '9009384', '26296': '9009385', '26301': '9009387', '26320': '9009388', '26321': '9009389', '26325': '9009390', '26327': '9009391', '26330': '9009392', '26335': '9009393', '26337': '9009394', '26338': '9009395', '26339': '9009396', '26342': '9009397', '26343': '9009398', '26346': '9009399', '26351': '9009403', '26354': '9009404', '26362': '9009405', '26372': '9009406', '26374': '9009407', '26376': '9009408', '26377': '9009409', '26378': '9009410', '26384': '9009411', '26385': '9009412', '26386': '9009413', '26405': '9009414', '26408': '9009415', '26410': '9009416', '26411': '9009417', '26412': '9009418', '26415': '9009419', '26416': '9009420', '26419': '9009421', '26421': '9009422', '26425': '9009423', '26426': '9009424', '26430': '9009425', '26431': '9009426', '26440': '9009430', '26443': '9009431', '26444': '9009432', '26447': '9009433', '26448': '9009434', '26451': '9009435', '26452': '9009436', '26456': '9009437', '26501': '9009438', '26505': '9009439', '26506': '9009440', '26508': '9009441', '26519': '9009442', '26520': '9009443', '26521': '9009444', '26525': '9009445', '26534': '9009446', '26537': '9009447', '26541': '9009448', '26542': '9009449', '26546': '9009450', '26547': '9009451', '26554': '9009452', '26562': '9009454', '26570': '9009456', '26571': '9009457', '26574': '9009458', '26575': '9009459', '26581': '9009460', '26582': '9009461', '26585': '9009462', '26586': '9009463', '26587': '9009464', '26588': '9009465', '26590': '9009467', '26591': '9009468', '26601': '9009469', '26617': '9009470', '26621': '9009471', '26623': '9009472', '26624': '9009473', '26629': '9009474', '26636': '9009475', '26638': '9009476', '26651': '9009479', '26676': '9009480', '26678': '9009481', '26679': '9009482', '26680': '9009483', '26681': '9009484', '26690': '9009485', '26704': '9009486', '26705': '9009487', '26707': '9009488', '26710': '9009489', '26711': '9009490', '26716': '9009492', '26717': '9009493', '26719': '9009494', '26720': '9009495', '26722': '9009496', '26726': '9009497', '26739': '9009498', '26743': '9009499', '26750': '9009500', '26753': '9009501', '26755': '9009502', '26757': '9009503', '26763': '9009505', '26764': '9009506', '26767': '9009507', '26801': '9009508', '26802': '9009509', '26804': '9009510', '26807': '9009511', '26808': '9009512', '26810': '9009513', '26812': '9009514', '26814': '9009515', '26815': '9009516', '26833': '9009518', '26836': '9009519', '26838': '9009520', '26845': '9009521', '26847': '9009522', '26851': '9009523', '26852': '9009524', '26855': '9009525', '26866': '9009527', '26884': '9009528', '27006': '9009530', '27007': '9009531', '27009': '9009532', '27011': '9009533', '27012': '9009534', '27013': '9009535', '27016': '9009537', '27017': '9009538', '27018': '9009539', '27019': '9009540', '27020': '9009541', '27021': '9009542', '27022': '9009543', '27023': '9009544', '27024': '9009545', '27025': '9009546', '27027': '9009547', '27028': '9009548', '27030': '9009549', '27040': '9009550', '27041': '9009551', '27042': '9009552', '27043': '9009553', '27045': '9009554', '27046': '9009555', '27047': '9009556', '27048': '9009557', '27050': '9009558', '27051': '9009559', '27052': '9009560', '27053': '9009561', '27054': '9009562', '27055': '9009563', '27101': '9009564', '27103': '9009565', '27104': '9009566', '27105': '9009567', '27106': '9009568', '27107': '9009569', '27109': '9009570', '27110': '9009571', '27127': '9009572', '27203': '9009574', '27205': '9009575', '27207': '9009576', '27208': '9009577', '27209': '9009578', '27212': '9009579', '27214': '9009581', '27215': '9009582', '27217': '9009583', '27229': '9009584', '27231': '9009585', '27233': '9009586', '27235': '9009587', '27239': '9009588', '27242': '9009589', '27243': '9009590', '27244': '9009591', '27248': '9009592', '27249': '9009593', '27252': '9009594', '27253': '9009595', '27256': '9009596', '27258': '9009597', '27260': '9009598', '27262': '9009599', '27263': '9009600', '27265': '9009601', '27278': '9009602', '27281': '9009603', '27282': '9009604', '27283': '9009605', '27284': '9009606', '27288': '9009607', '27291': '9009608', '27292': '9009609', '27295': '9009610', '27298': '9009611', '27299': '9009612', '27301': '9009613', '27302': '9009614', '27305': '9009615', '27306': '9009616', '27310': '9009617', '27311': '9009618', '27312': '9009619', '27313': '9009620', '27314': '9009621', '27315': '9009622', '27316': '9009623', '27317': '9009624', '27320': '9009625', '27325': '9009626', '27326': '9009627', '27330': '9009628', '27332': '9009630', '27341': '9009632', '27343': '9009633', '27344': '9009634', '27349': '9009635', '27350': '9009636', '27355': '9009637', '27356': '9009638', '27357': '9009639', '27358': '9009640', '27360': '9009641', '27370': '9009642', '27371': '9009643', '27376': '9009644', '27377': '9009645', '27379': '9009646', '27401': '9009647', '27403': '9009648', '27405': '9009649', '27406': '9009650', '27407': '9009651', '27408': '9009652', '27409': '9009653', '27410': '9009654', '27412': '9009655', '27455': '9009656', '27501': '9009657', '27502': '9009658', '27503': '9009659', '27504': '9009660', '27505': '9009661', '27507': '9009663', '27508': '9009664', '27509': '9009665', '27510': '9009666', '27511': '9009667', '27513': '9009669', '27514': '9009670', '27516': '9009671', '27517': '9009672', '27518': '9009673', '27519': '9009674', '27520': '9009675', '27521': '9009676', '27522': '9009677', '27523': '9009678', '27524': '9009679', '27525': '9009680', '27526': '9009681', '27527': '9009682', '27529': '9009683', '27530': '9009684', '27531': '9009685', '27534': '9009686', '27536': '9009687', '27537': '9009688', '27539': '9009689', '27540': '9009690', '27541': '9009691', '27542': '9009692', '27544': '9009693', '27545': '9009694', '27546': '9009695', '27549': '9009696', '27551': '9009697', '27553': '9009698', '27557': '9009701', '27559': '9009702', '27560': '9009703', '27562': '9009704', '27563': '9009705', '27565': '9009706', '27569': '9009708', '27571': '9009710', '27572': '9009711', '27573': '9009712', '27574': '9009713', '27576': '9009714', '27577': '9009715', '27581': '9009716', '27583': '9009717', '27587': '9009718', '27589': '9009720', '27591': '9009721', '27592': '9009722', '27596': '9009723', '27597': '9009724', '27599': '9009725', '27601': '9009726', '27603': '9009728', '27604': '9009729', '27605': '9009730', '27606': '9009731', '27607': '9009732', '27608': '9009733', '27609': '9009734', '27610': '9009735', '27612': '9009736', '27613': '9009737', '27614': '9009738', '27615': '9009739', '27616': '9009740', '27617': '9009741', '27656': '9009743', '27690': '9009744', '27701': '9009745', '27703': '9009746', '27704': '9009747', '27705': '9009748', '27707': '9009749', '27709': '9009750', '27712': '9009751', '27713': '9009752', '27801': '9009753', '27803': '9009754', '27804': '9009755', '27805': '9009756', '27806': '9009757', '27807': '9009758', '27808': '9009759', '27809': '9009760', '27810': '9009761', '27812': '9009762', '27814': '9009764', '27816': '9009765', '27817': '9009766', '27818': '9009767', '27819': '9009768', '27820': '9009769', '27821': '9009770', '27822': '9009771', '27823': '9009772', '27824': '9009773', '27825': '9009774', '27826': '9009775', '27828': '9009776', '27829': '9009777', '27830': '9009778', '27831': '9009779', '27832': '9009780', '27834': '9009782', '27837': '9009783', '27839': '9009784', '27840': '9009785', '27842': '9009786', '27843': '9009787', '27844': '9009788', '27845': '9009789', '27846': '9009790', '27847': '9009791', '27849': '9009792', '27850': '9009793', '27851': '9009794', '27852': '9009795', '27853': '9009796', '27855': '9009797', '27856': '9009798', '27857': '9009799', '27858': '9009800', '27860': '9009801', '27862': '9009802', '27863': '9009803', '27864': '9009804', '27865': '9009805', '27866': '9009806', '27869': '9009807', '27870': '9009808', '27871': '9009809', '27872': '9009810', '27874': '9009811', '27875': '9009812', '27876': '9009813', '27877': '9009814', '27880': '9009816', '27881': '9009817', '27882': '9009818', '27883': '9009819', '27884': '9009820', '27885': '9009821', '27886': '9009822', '27888': '9009823', '27889': '9009824', '27890': '9009825', '27891': '9009826', '27892': '9009827', '27893': '9009828', '27896': '9009829', '27897': '9009830', '27909': '9009831', '27910': '9009832', '27915': '9009833', '27916': '9009834', '27917': '9009835', '27919': '9009836', '27920': '9009837', '27921': '9009838', '27922': '9009839', '27923': '9009840', '27924': '9009841', '27925': '9009842', '27926': '9009843', '27927': '9009844', '27928': '9009845', '27929': '9009846', '27932': '9009847', '27935': '9009848', '27936': '9009849', '27937': '9009850', '27938': '9009851', '27939': '9009852', '27941': '9009853', '27942': '9009854', '27943': '9009855', '27944': '9009856', '27946': '9009857', '27947': '9009858', '27948': '9009859', '27949': '9009860', '27950': '9009861', '27953': '9009862', '27954': '9009863', '27956': '9009864', '27957': '9009865', '27958': '9009866', '27959': '9009867', '27960': '9009868', '27962': '9009869', '27964': '9009870', '27965': '9009871', '27966': '9009872', '27967': '9009873', '27968': '9009874', '27970': '9009875', '27973': '9009877', '27974': '9009878', '27976': '9009879', '27978': '9009880', '27979': '9009881', '27980': '9009882', '27981': '9009883', '27983': '9009885', '27986': '9009887', '28001': '9009888', '28006': '9009890', '28009': '9009891', '28012': '9009892', '28016': '9009893', '28018': '9009895', '28020': '9009896', '28021': '9009897', '28023': '9009898', '28025': '9009899', '28027': '9009900', '28031': '9009901', '28032': '9009902', '28033': '9009903', '28034': '9009904', '28036': '9009905', '28037': '9009906', '28040': '9009907', '28043': '9009908', '28052': '9009909', '28054': '9009910', '28056': '9009911', '28071': '9009913', '28073': '9009915', '28075': '9009916', '28077': '9009918', '28078': '9009919', '28079': '9009920', '28080': '9009921', '28081': '9009922', '28083': '9009923', '28086': '9009924', '28088': '9009925', '28090': '9009926', '28091': '9009927', '28092': '9009928', '28097': '9009929', '28098': '9009930', '28101': '9009931', '28103': '9009932', '28104': '9009933', '28105': '9009934', '28107': '9009935', '28110': '9009936', '28112': '9009937', '28114': '9009938', '28115': '9009939', '28117': '9009940', '28119': '9009941', '28120': '9009942', '28124': '9009943', '28125': '9009944', '28127': '9009945', '28128': '9009946', '28129': '9009947', '28133': '9009948', '28134': '9009949', '28135': '9009950', '28137': '9009951', '28138': '9009952', '28139': '9009953', '28144': '9009954', '28146': '9009955', '28147': '9009956', '28150': '9009957', '28152': '9009958', '28159': '9009959', '28160': '9009960', '28163': '9009961', '28164': '9009962', '28166': '9009963', '28167': '9009964', '28168': '9009965', '28170': '9009967', '28173': '9009968', '28174': '9009969', '28202': '9009970', '28203': '9009971', '28204': '9009972', '28205': '9009973', '28206': '9009974', '28207': '9009975', '28208': '9009976', '28209': '9009977', '28210': '9009978', '28211': '9009979', '28212': '9009980', '28213': '9009981', '28214': '9009982', '28215': '9009983', '28216': '9009984', '28217': '9009985', '28226': '9009987', '28227': '9009988', '28228': '9009989', '28244': '9009990', '28262': '9009991', '28269': '9009992', '28270': '9009993', '28273': '9009994', '28274': '9009995', '28277': '9009996', '28278': '9009997', '28280': '9009998', '28282': '9009999', '28284': '9010000', '28285': '9010001', '28301': '9010002', '28303': '9010003', '28304': '9010004', '28305': '9010005', '28306': '9010006', '28307': '9010007', '28308': '9010008', '28310': '9010009', '28311': '9010010', '28312': '9010011', '28314': '9010012', '28315': '9010013', '28318': '9010014', '28320': '9010015', '28323': '9010016', '28326': '9010018', '28327': '9010019', '28328': '9010020', '28333': '9010023', '28334': '9010024', '28337': '9010025', '28338': '9010026', '28339': '9010027', '28340': '9010028', '28341': '9010029', '28342': '9010030', '28343': '9010031', '28344': '9010032', '28345': '9010033', '28347': '9010034', '28348': '9010035', '28349': '9010036', '28350': '9010037', '28351': '9010038', '28352': '9010039', '28356': '9010040', '28357': '9010041', '28358': '9010042', '28360': '9010044', '28363': '9010045', '28364': '9010046', '28365': '9010047', '28366': '9010048', '28369': '9010049', '28371': '9010051', '28372': '9010052', '28373': '9010053', '28374': '9010054', '28376': '9010055', '28377': '9010056', '28378': '9010057', '28379': '9010058', '28382': '9010059', '28383': '9010060', '28384': '9010061', '28385': '9010062', '28386': '9010063', '28387': '9010064', '28390': '9010065', '28391': '9010066', '28392': '9010067', '28393': '9010068', '28394': '9010069', '28395': '9010070', '28396': '9010071', '28398': '9010072', '28399': '9010073', '28401': '9010074', '28403': '9010076', '28405': '9010077', '28409': '9010078', '28411': '9010079', '28412': '9010080', '28420': '9010081', '28421': '9010082', '28422': '9010083', '28423': '9010084', '28425': '9010086', '28428': '9010087', '28429': '9010088', '28430': '9010089', '28431': '9010090', '28432': '9010091', '28433': '9010092', '28434': '9010093', '28435': '9010094', '28436': '9010095', '28438': '9010096', '28439': '9010097', '28441': '9010098', '28442': '9010099', '28443': '9010100', '28444': '9010101', '28445': '9010102', '28447': '9010103', '28448': '9010104', '28449': '9010105', '28450': '9010106', '28451': '9010107', '28452': '9010108', '28453': '9010109', '28454': '9010110', '28455': '9010111', '28456': '9010112', '28457': '9010113', '28458': '9010114', '28460': '9010115', '28461': '9010116', '28462': '9010117', '28463': '9010118', '28464': '9010119', '28465': '9010120', '28466': '9010121', '28467': '9010122', '28468': '9010123', '28469': '9010124', '28470': '9010125', '28472': '9010126', '28478': '9010127', '28479': '9010128', '28480': '9010129', '28501': '9010130', '28504': '9010131', '28508': '9010132', '28510': '9010133', '28511': '9010134', '28512': '9010135', '28513': '9010136', '28515': '9010137', '28516': '9010138', '28518': '9010139', '28520': '9010141', '28521': '9010142', '28523': '9010143', '28524': '9010144', '28525': '9010145', '28526': '9010146', '28527': '9010147', '28528': '9010148', '28529': '9010149', '28530': '9010150', '28531': '9010151', '28532': '9010152', '28537': '9010153', '28538': '9010154', '28539': '9010155', '28540': '9010156', '28543': '9010157', '28544': '9010158', '28546': '9010159', '28547': '9010160', '28551': '9010161', '28552': '9010162', '28553': '9010163', '28555': '9010165', '28556': '9010166', '28557': '9010167', '28560': '9010168', '28562': '9010169', '28570': '9010170', '28571': '9010171', '28572': '9010172', '28573': '9010173', '28574': '9010174', '28577': '9010175', '28578': '9010176', '28579': '9010177', '28580': '9010178', '28581': '9010179', '28582': '9010180', '28584': '9010181', '28585': '9010182', '28586': '9010183', '28587': '9010184', '28590': '9010185', '28594': '9010186', '28601': '9010187', '28602': '9010188', '28604': '9010189', '28605': '9010190', '28606': '9010191', '28607': '9010192', '28608': '9010193', '28609': '9010194', '28610': '9010195', '28611': '9010196', '28612': '9010197', '28613': '9010198', '28615': '9010199', '28617': '9010200', '28618': '9010201', '28621': '9010203', '28622': '9010204', '28623': '9010205', '28624': '9010206', '28625': '9010207', '28626': '9010208', '28627': '9010209', '28630': '9010211', '28631': '9010212', '28634': '9010213', '28635': '9010214', '28636': '9010215', '28637': '9010216', '28638': '9010217', '28640': '9010218', '28642': '9010219', '28643': '9010220', '28644': '9010221', '28645': '9010222', '28649': '9010223', '28650': '9010224', '28651': '9010225', '28654': '9010226', '28655': '9010227', '28656': '9010228', '28657': '9010229', '28658': '9010230', '28659': '9010231', '28660': '9010232', '28663': '9010233', '28665': '9010234', '28668': '9010235', '28669': '9010236', '28670': '9010237', '28672': '9010239', '28673': '9010240', '28675': '9010241', '28676': '9010242', '28677': '9010243', '28678': '9010244', '28679': '9010245', '28681': '9010246', '28682': '9010247', '28683': '9010248', '28684': '9010249', '28685': '9010250', '28689': '9010251', '28690': '9010252', '28692': '9010253', '28693': '9010254', '28694': '9010255', '28697': '9010256', '28698': '9010257', '28701': '9010258', '28704': '9010259', '28705': '9010260', '28707': '9010261', '28708': '9010262', '28709': '9010263', '28711': '9010264', '28712': '9010265', '28713': '9010266', '28714': '9010267', '28715': '9010268', '28716': '9010269', '28717': '9010270', '28718': '9010271', '28719': '9010272', '28720': '9010273', '28721': '9010274', '28722': '9010275', '28723': '9010276', '28726': '9010278', '28728': '9010279', '28729': '9010280', '28730': '9010281', '28731': '9010282', '28732': '9010283', '28733': '9010284', '28734': '9010285', '28735': '9010286', '28736': '9010287', '28739': '9010288', '28740': '9010289', '28741': '9010290', '28742': '9010291', '28743': '9010292', '28745': '9010293', '28746': '9010294', '28747': '9010295', '28748': '9010296', '28751': '9010297', '28752': '9010298', '28753': '9010299', '28754': '9010300', '28756': '9010301', '28757': '9010302', '28759': '9010303', '28761': '9010304', '28762': '9010305', '28763': '9010306', '28766': '9010307', '28768': '9010308', '28771': '9010309', '28772': '9010310', '28773': '9010311', '28774': '9010312', '28775': '9010313', '28777': '9010314', '28778': '9010315', '28779': '9010316', '28781': '9010317', '28782': '9010318', '28783': '9010319', '28785': '9010320', '28786': '9010321', '28787': '9010322', '28789': '9010323', '28790': '9010324', '28791': '9010325', '28792': '9010326', '28801': '9010328', '28803': '9010329', '28804': '9010330', '28805': '9010331', '28806': '9010332', '28901': '9010333', '28902': '9010334', '28904': '9010335', '28905': '9010336', '28906': '9010337', '28909': '9010338', '29001': '9010339', '29003': '9010340', '29006': '9010341', '29009': '9010342', '29010': '9010343', '29014': '9010344', '29015': '9010345', '29016': '9010346', '29018': '9010347', '29020': '9010348', '29030': '9010349', '29031': '9010350', '29032': '9010351', '29033': '9010352', '29036': '9010353', '29037': '9010354', '29038': '9010355', '29039': '9010356', '29040': '9010357', '29042': '9010358', '29044': '9010359', '29045': '9010360', '29047': '9010362', '29048': '9010363', '29051': '9010364', '29052': '9010365', '29053': '9010366', '29054': '9010367', '29055': '9010368', '29056': '9010369', '29058': '9010370', '29059': '9010371', '29061': '9010372', '29063': '9010373', '29065': '9010374', '29067': '9010375', '29069': '9010376', '29070': '9010377', '29072': '9010378', '29073': '9010379', '29074': '9010380', '29075': '9010381', '29078': '9010382', '29080': '9010383', '29081': '9010384', '29082': '9010385', '29101': '9010386', '29102': '9010387', '29104': '9010388', '29105': '9010389', '29107': '9010390', '29108': '9010391', '29111': '9010392', '29112': '9010393', '29113': '9010394', '29114': '9010395', '29115': '9010396', '29118': '9010398', '29122': '9010399', '29123': '9010400', '29125': '9010401', '29126': '9010402', '29127': '9010403', '29128': '9010404', '29129': '9010405', '29130': '9010406', '29133': '9010408', '29135': '9010409', '29137': '9010410', '29138': '9010411', '29142': '9010412', '29145': '9010413', '29146': '9010414', '29148': '9010415', '29150': '9010416', '29152': '9010417', '29153': '9010418', '29154': '9010419', '29160': '9010420', '29161': '9010421', '29162': '9010422', '29163': '9010423', '29164': '9010424', '29166': '9010425', '29168': '9010426', '29169': '9010427', '29170': '9010428', '29172': '9010429', '29175': '9010430', '29178': '9010431', '29180': '9010432', '29201': '9010433', '29203': '9010434', '29204': '9010435', '29205': '9010436', '29206': '9010437', '29207': '9010438', '29208': '9010439', '29209': '9010440', '29210': '9010441', '29212': '9010442', '29215': '9010443', '29217': '9010444', '29218': '9010445', '29220': '9010446', '29223': '9010447', '29227': '9010448', '29229': '9010449', '29301': '9010450', '29302': '9010451', '29303': '9010452', '29306': '9010453', '29307': '9010454', '29316': '9010455', '29321': '9010456', '29322': '9010457', '29323': '9010458', '29325': '9010459', '29330': '9010461', '29332': '9010462', '29334': '9010464', '29335': '9010465', '29340': '9010466', '29341': '9010467', '29349': '9010468', '29351': '9010469', '29353': '9010470', '29355': '9010471', '29356': '9010472', '29360': '9010473', '29364': '9010474', '29365': '9010475', '29369': '9010476', '29370': '9010477', '29372': '9010478', '29374': '9010480', '29376': '9010481', '29379': '9010483', '29384': '9010484', '29385': '9010485', '29388': '9010486', '29401': '9010487', '29403': '9010488', '29404': '9010489', '29405': '9010490', '29406': '9010491', '29407': '9010492', '29410': '9010493', '29412': '9010494', '29414': '9010496', '29418': '9010497', '29420': '9010498', '29424': '9010499', '29425': '9010500', '29426': '9010501', '29429': '9010502', '29431': '9010503', '29432': '9010504', '29434': '9010506', '29435': '9010507', '29436': '9010508', '29437': '9010509', '29438': '9010510', '29439': '9010511', '29440': '9010512', '29445': '9010513', '29446': '9010514', '29448': '9010515', '29449': '9010516', '29450': '9010517', '29451': '9010518', '29452': '9010519', '29453': '9010520', '29455': '9010521', '29456': '9010522', '29458': '9010523', '29461': '9010524', '29464': '9010525', '29466': '9010526', '29468': '9010527', '29469': '9010528', '29470': '9010529', '29471': '9010530', '29472': '9010531', '29474': '9010532', '29475': '9010533', '29477': '9010534', '29479': '9010535', '29481': '9010536', '29482': '9010537', '29483': '9010538', '29485': '9010540', '29487': '9010541', '29488': '9010542', '29492': '9010543', '29501': '9010545', '29505': '9010546', '29506': '9010547', '29510': '9010548', '29511': '9010549', '29512': '9010550', '29516': '9010551', '29518': '9010552', '29520': '9010553', '29525': '9010554', '29526': '9010555', '29527': '9010556', '29530': '9010557', '29532': '9010558', '29536': '9010559', '29540': '9010560', '29541': '9010561', '29543': '9010562', '29544': '9010563', '29545': '9010564', '29546': '9010565', '29547': '9010566', '29550': '9010567', '29554': '9010568', '29555': '9010569', '29556': '9010570', '29560': '9010571', '29563': '9010572', '29564': '9010573', '29565': '9010574', '29566': '9010575', '29567': '9010576', '29568': '9010577', '29569': '9010578', '29570': '9010579', '29571': '9010580', '29572': '9010581', '29574': '9010582', '29575': '9010583', '29576': '9010584', '29577': '9010585', '29579': '9010587', '29580': '9010588', '29581': '9010589', '29582': '9010590', '29583': '9010591', '29584': '9010592', '29585': '9010593', '29588': '9010594', '29590': '9010595', '29591': '9010596', '29592': '9010597', '29593': '9010598', '29594': '9010599', '29596': '9010600', '29601': '9010601', '29605': '9010603', '29607': '9010604', '29609': '9010605', '29611': '9010606', '29613': '9010607', '29614': '9010608', '29615': '9010609', '29617': '9010610', '29620': '9010611', '29621': '9010612', '29624': '9010613', '29625': '9010614', '29626': '9010615', '29627': '9010616', '29628': '9010617', '29630': '9010618', '29631': '9010619', '29634': '9010620', '29635': '9010621', '29638': '9010622', '29639': '9010623', '29640': '9010624', '29642': '9010625', '29643': '9010626', '29644': '9010627', '29645': '9010628', '29646': '9010629', '29649': '9010630', '29650': '9010631', '29651': '9010632', '29653': '9010633', '29654': '9010634', '29655': '9010635', '29657': '9010637', '29658': '9010638', '29661': '9010640', '29662': '9010641', '29664': '9010642', '29666': '9010643', '29667': '9010644', '29669': '9010645', '29670': '9010646', '29671': '9010647', '29672': '9010648', '29673': '9010649', '29676': '9010650', '29678': '9010651', '29680': '9010652', '29681': '9010653', '29682': '9010654', '29684': '9010655', '29685': '9010656', '29686': '9010657', '29687': '9010658', '29689': '9010660', '29690': '9010661', '29691': '9010662', '29692': '9010663', '29693': '9010664', '29696': '9010665', '29697': '9010666', '29702': '9010667', '29704': '9010668', '29706': '9010669', '29707': '9010670', '29708': '9010671', '29709': '9010672', '29710': '9010673', '29712': '9010674', '29714': '9010675', '29715': '9010676', '29717': '9010677', '29718': '9010678', '29720': '9010679', '29726': '9010681', '29727': '9010682', '29728': '9010683', '29729': '9010684', '29730': '9010685', '29732': '9010687', '29741': '9010688', '29742': '9010689', '29743': '9010690', '29745': '9010691', '29801': '9010692', '29803': '9010693', '29805': '9010694', '29809': '9010695', '29810': '9010696', '29812': '9010697', '29817': '9010699', '29819': '9010700', '29821': '9010701', '29824': '9010703', '29827': '9010704', '29828': '9010705', '29829': '9010706', '29831': '9010707', '29832': '9010708', '29835': '9010710', '29836': '9010711', '29838': '9010712', '29840': '9010713', '29841': '9010714', '29842': '9010715', '29843': '9010716', '29845': '9010717', '29847': '9010718', '29848': '9010719', '29849': '9010720', '29851': '9010721', '29853': '9010722', '29856': '9010723', '29860': '9010724', '29902': '9010725', '29904': '9010726', '29906': '9010727', '29907': '9010728', '29909': '9010729', '29910': '9010730', '29911': '9010731', '29912': '9010732', '29916': '9010733', '29918': '9010734', '29920': '9010735', '29922': '9010736', '29923': '9010737', '29924': '9010738', '29926': '9010739', '29927': '9010740', '29928': '9010741', '29929': '9010742', '29932': '9010743', '29934': '9010744', '29935': '9010745', '29936': '9010746', '29939': '9010747', '29940': '9010748', '29941': '9010749', '29944': '9010750', '29945': '9010751', '30002': '9010752', '30004': '9010753', '30005': '9010754', '30008': '9010755', '30009': '9010756', '30011': '9010757', '30012': '9010758', '30013': '9010759', '30014': '9010760', '30016': '9010761', '30017': '9010762', '30018': '9010763', '30019': '9010764', '30021': '9010765', '30022': '9010766', '30024': '9010767', '30025': '9010768', '30028': '9010769', '30030': '9010770', '30032': '9010771', '30033': '9010772', '30034': '9010773', '30035': '9010774', '30038': '9010775', '30039': '9010776', '30040': '9010777', '30041': '9010778', '30043': '9010779', '30044': '9010780', '30045': '9010781', '30046': '9010782', '30047': '9010783', '30052': '9010784', '30054': '9010785', '30055': '9010786', '30056': '9010787', '30058': '9010788', '30060': '9010789', '30062': '9010790', '30064': '9010791', '30066': '9010792', '30067': '9010793', '30068': '9010794', '30069': '9010795', '30071': '9010796', '30075': '9010798', '30076': '9010799', '30078': '9010800', '30079': '9010801', '30080': '9010802', '30082': '9010803', '30083': '9010804', '30084': '9010805', '30087': '9010806', '30088': '9010807', '30090': '9010808', '30092': '9010810', '30093': '9010811', '30094': '9010812', '30096': '9010813', '30097': '9010814', '30101': '9010815', '30102': '9010816', '30103': '9010817', '30104': '9010818', '30105': '9010819', '30106': '9010820', '30107': '9010821', '30108': '9010822', '30110': '9010823', '30113': '9010824', '30114': '9010825', '30115': '9010826', '30116': '9010827', '30117': '9010828', '30118': '9010829', '30120': '9010830', '30121': '9010831', '30122': '9010832', '30124': '9010833', '30125': '9010834', '30126': '9010835', '30127': '9010836', '30132': '9010837', '30134': '9010838', '30135': '9010839', '30137': '9010840', '30139': '9010841', '30141': '9010842', '30143': '9010843', '30144': '9010844', '30145': '9010845', '30147': '9010846', '30148': '9010847', '30152': '9010848', '30153': '9010849', '30157': '9010850', '30161': '9010851', '30165': '9010853', '30168': '9010854', '30170': '9010855', '30171': '9010856', '30173': '9010857', '30175': '9010858', '30176': '9010859', '30177': '9010860', '30178': '9010861', '30179': '9010862', '30180': '9010863', '30182': '9010864', '30183': '9010865', '30184': '9010866', '30185': '9010867', '30187': '9010868', '30188': '9010869', '30189': '9010870', '30204': '9010871', '30205': '9010872', '30206': '9010873', '30213': '9010874', '30214': '9010875', '30215': '9010876', '30216': '9010877', '30217': '9010878', '30218': '9010879', '30220': '9010880', '30222': '9010881', '30223': '9010882', '30224': '9010883', '30228': '9010884', '30230': '9010885', '30233': '9010886', '30234': '9010887', '30236': '9010888', '30238': '9010889', '30240': '9010890', '30241': '9010891', '30248': '9010892', '30251': '9010893', '30252': '9010894', '30253': '9010895', '30256': '9010896', '30257': '9010897', '30258': '9010898', '30259': '9010899', '30260': '9010900', '30263': '9010901', '30265': '9010902', '30268': '9010903', '30269': '9010904', '30273': '9010905', '30274': '9010906', '30276': '9010907', '30277': '9010908', '30281': '9010909', '30285': '9010911', '30286': '9010912', '30288': '9010913', '30290': '9010915', '30291': '9010916', '30292': '9010917', '30293': '9010918', '30294': '9010919', '30295': '9010920', '30296': '9010921', '30297': '9010922', '30303': '9010923', '30305': '9010924', '30306': '9010925', '30307': '9010926', '30308': '9010927', '30309': '9010928', '30310': '9010929', '30311': '9010930', '30312': '9010931', '30313': '9010932', '30314': '9010933', '30315': '9010934', '30316': '9010935', '30317': '9010936', '30318': '9010937', '30319': '9010938', '30322': '9010940', '30324': '9010941', '30326': '9010942', '30327': '9010943', '30328': '9010944', '30329': '9010945', '30331': '9010947', '30332': '9010948', '30334': '9010949', '30336': '9010950', '30337': '9010951', '30338': '9010952', '30339': '9010953', '30340': '9010954', '30341': '9010955', '30342': '9010956', '30344': '9010957', '30345': '9010958', '30346': '9010959', '30349': '9010960', '30350': '9010961', '30354': '9010962', '30360': '9010963', '30361': '9010964', '30363': '9010965', '30369': '9010966', '30375': '9010967', '30401': '9010969', '30410': '9010970', '30411': '9010971', '30413': '9010972', '30415': '9010973', '30417': '9010974', '30420': '9010975', '30421': '9010976', '30425': '9010977', '30426': '9010978', '30427': '9010979', '30428': '9010980', '30434': '9010981', '30436': '9010982', '30439': '9010983', '30441': '9010984', '30442': '9010985', '30445': '9010986', '30446': '9010987', '30450': '9010988', '30452': '9010989', '30453': '9010990', '30454': '9010991', '30455': '9010992', '30456': '9010993', '30457': '9010994', '30458': '9010995', '30460': '9010997', '30461': '9010998', '30467': '9010999', '30470': '9011000', '30471': '9011001', '30473': '9011002', '30474': '9011003', '30477': '9011004', '30501': '9011005', '30504': '9011006', '30506': '9011007', '30507': '9011008', '30510': '9011009', '30511': '9011010', '30512': '9011011', '30513': '9011012', '30516': '9011013', '30517': '9011014', '30518': '9011015', '30519': '9011016', '30520': '9011017', '30521': '9011018', '30522': '9011019', '30523': '9011020', '30525': '9011021', '30527': '9011022', '30528': '9011023', '30529': '9011024', '30530': '9011025', '30531': '9011026', '30533': '9011027', '30534': '9011028', '30535': '9011029', '30536': '9011030', '30537': '9011031', '30538': '9011032', '30540': '9011033', '30541': '9011034', '30542': '9011035', '30543': '9011036', '30545': '9011037', '30546': '9011038', '30547': '9011039', '30548': '9011040', '30549': '9011041', '30552': '9011042', '30553': '9011043', '30554': '9011044', '30555': '9011045', '30557': '9011046', '30558': '9011047', '30559': '9011048', '30560': '9011049', '30563': '9011051', '30564': '9011052', '30565': '9011053', '30566': '9011054', '30567': '9011055', '30568': '9011056', '30571': '9011057', '30572': '9011058', '30573': '9011059', '30575': '9011060', '30576': '9011061', '30577': '9011062', '30582': '9011064', '30597': '9011065', '30599': '9011067', '30601': '9011068', '30602': '9011069', '30605': '9011070', '30606': '9011071', '30607': '9011072', '30619': '9011073', '30620': '9011074', '30621': '9011075', '30622': '9011076', '30624': '9011078', '30625': '9011079', '30627': '9011080', '30628': '9011081', '30629': '9011082', '30630': '9011083', '30631': '9011084', '30633': '9011085', '30634': '9011086', '30635': '9011087', '30641': '9011089', '30642': '9011090', '30643': '9011091', '30646': '9011092', '30648': '9011093', '30650': '9011094', '30655': '9011095', '30656': '9011096', '30660': '9011097', '30662': '9011098', '30663': '9011099', '30666': '9011101', '30667': '9011102', '30668': '9011103', '30669': '9011104', '30673': '9011105', '30677': '9011106', '30678': '9011107', '30680': '9011108', '30683': '9011109', '30701': '9011110', '30705': '9011111', '30707': '9011112', '30708': '9011113', '30710': '9011114', '30711': '9011115', '30720': '9011117', '30721': '9011118', '30725': '9011119', '30728': '9011120', '30730': '9011121', '30731': '9011122', '30733': '9011123', '30734': '9011124', '30735': '9011125', '30736': '9011126', '30738': '9011127', '30739': '9011128', '30740': '9011129', '30741': '9011130', '30742': '9011131', '30746': '9011132', '30747': '9011133', '30750': '9011134', '30752': '9011135', '30753': '9011136', '30755': '9011137', '30757': '9011138', '30802': '9011139', '30803': '9011140', '30805': '9011141', '30808': '9011143', '30809': '9011144', '30810': '9011145', '30813': '9011146', '30814': '9011147', '30815': '9011148', '30816': '9011149', '30817': '9011150', '30818': '9011151', '30820': '9011152', '30821': '9011153', '30822': '9011154', '30823': '9011155', '30824': '9011156', '30828': '9011157', '30830': '9011158', '30833': '9011159', '30901': '9011160', '30904': '9011161', '30905': '9011162', '30906': '9011163', '30907': '9011164', '30909': '9011165', '30912': '9011166', '31001': '9011167', '31002': '9011168', '31005': '9011170', '31006': '9011171', '31007': '9011172', '31008': '9011173', '31009': '9011174', '31011': '9011175', '31012': '9011176', '31014': '9011177', '31015': '9011178', '31016': '9011179', '31017': '9011180', '31018': '9011181', '31019': '9011182', '31020': '9011183', '31021': '9011184', '31022': '9011185', '31023': '9011186', '31024': '9011187', '31025': '9011188', '31027': '9011189', '31028': '9011190', '31029': '9011191', '31030': '9011192', '31031': '9011193', '31032': '9011194', '31033': '9011195', '31035': '9011196', '31036': '9011197', '31037': '9011198', '31038': '9011199', '31041': '9011201', '31042': '9011202', '31044': '9011203', '31045': '9011204', '31046': '9011205', '31047': '9011206', '31049': '9011207', '31050': '9011208', '31052': '9011209', '31054': '9011210', '31055': '9011211', '31057': '9011212', '31058': '9011213', '31060': '9011214', '31061': '9011215', '31062': '9011216', '31063': '9011217', '31064': '9011218', '31065': '9011219', '31066': '9011220', '31067': '9011221', '31068': '9011222', '31069': '9011223', '31070': '9011224', '31071': '9011225', '31072': '9011226', '31075': '9011227', '31076': '9011228', '31077': '9011229', '31078': '9011230', '31079': '9011231', '31081': '9011232', '31082': '9011233', '31085': '9011234', '31087': '9011235', '31088': '9011236', '31089': '9011237', '31090': '9011238', '31091': '9011239', '31092': '9011240', '31093': '9011241', '31094': '9011242', '31096': '9011243', '31097': '9011244', '31098': '9011245', '31201': '9011246', '31204': '9011248', '31206': '9011249', '31207': '9011250', '31210': '9011251', '31211': '9011252', '31213': '9011253', '31216': '9011254', '31217': '9011255', '31220': '9011256', '31296': '9011257', '31301': '9011259', '31302': '9011260', '31303': '9011261', '31305': '9011262', '31307': '9011263', '31308': '9011264', '31309': '9011265', '31312': '9011266', '31313': '9011267', '31314': '9011268', '31315': '9011269', '31316': '9011270', '31318': '9011271', '31320': '9011272', '31321': '9011273', '31322': '9011274', '31323': '9011275', '31324': '9011276', '31326': '9011277', '31327': '9011278', '31328': '9011279', '31329': '9011280', '31331': '9011281', '31401': '9011283', '31404': '9011285', '31405': '9011286', '31406': '9011287', '31407': '9011288', '31408': '9011289', '31409': '9011290', '31410': '9011291', '31411': '9011292', '31415': '9011293', '31419': '9011294', '31501': '9011295', '31503': '9011296', '31510': '9011297', '31512': '9011298', '31513': '9011299', '31516': '9011300', '31518': '9011301', '31519': '9011302', '31520': '9011303', '31522': '9011304', '31523': '9011305', '31525': '9011306', '31527': '9011307', '31532': '9011308', '31533': '9011309', '31535': '9011311', '31537': '9011312', '31539': '9011313', '31542': '9011314', '31543': '9011315', '31544': '9011316', '31545': '9011317', '31546': '9011318', '31548': '9011319', '31549': '9011320', '31550': '9011321', '31551': '9011322', '31552': '9011323', '31553': '9011324', '31554': '9011325', '31555': '9011326', '31557': '9011327', '31558': '9011328', '31560': '9011329', '31562': '9011330', '31563': '9011331', '31565': '9011332', '31566': '9011333', '31567': '9011334', '31568': '9011335', '31569': '9011336', '31601': '9011337', '31602': '9011338', '31605': '9011339', '31606': '9011340', '31620': '9011341', '31622': '9011342', '31624': '9011343', '31625': '9011344', '31626': '9011345', '31629': '9011346', '31630': '9011347', '31631': '9011348', '31632': '9011349', '31634': '9011350', '31635': '9011351', '31636': '9011352', '31637': '9011353', '31638': '9011354', '31639': '9011355', '31641': '9011356', '31642': '9011357', '31643': '9011358', '31645': '9011359', '31647': '9011360', '31648': '9011361', '31649': '9011362', '31650': '9011363', '31698': '9011364', '31699': '9011365', '31701': '9011366', '31704': '9011367', '31705': '9011368', '31707': '9011369', '31709': '9011370', '31711': '9011371', '31712': '9011372', '31714': '9011373', '31716': '9011374', '31719': '9011375', '31720': '9011376', '31721': '9011377', '31730': '9011379', '31733': '9011380', '31735': '9011381', '31738': '9011382', '31743': '9011383', '31744': '9011384', '31749': '9011385', '31750': '9011386', '31756': '9011387', '31757': '9011388', '31763': '9011389', '31764': '9011390', '31765': '9011391', '31768': '9011392', '31771': '9011393', '31772': '9011394', '31773': '9011395', '31774': '9011396', '31775': '9011397', '31778': '9011398', '31779': '9011399', '31780': '9011400', '31781': '9011401', '31783': '9011402', '31784': '9011403', '31787': '9011404', '31788': '9011405', '31789': '9011406', '31790': '9011407', '31791': '9011408', '31792': '9011409', '31793': '9011410', '31794': '9011411', '31795': '9011412', '31796': '9011413', '31798': '9011414', '31801': '9011415', '31803': '9011416', '31804': '9011417', '31805': '9011418', '31806': '9011419', '31807': '9011420', '31808': '9011421', '31811': '9011422', '31812': '9011423', '31814': '9011424', '31815': '9011425', '31816': '9011426', '31820': '9011427', '31821': '9011428', '31822': '9011429', '31823': '9011430', '31824': '9011431', '31825': '9011432', '31826': '9011433', '31827': '9011434', '31829': '9011435', '31830': '9011436', '31831': '9011437', '31833': '9011438', '31836': '9011439', '31901': '9011440', '31903': '9011442', '31904': '9011443', '31905': '9011444', '31906': '9011445', '31907': '9011446', '31909': '9011447', '31999': '9011448', '32003': '9011449', '32008': '9011450', '32009': '9011451', '32011': '9011452', '32024': '9011454', '32025': '9011455', '32033': '9011456', '32034': '9011457', '32038': '9011459', '32040': '9011460', '32043': '9011461', '32044': '9011462', '32046': '9011463', '32052': '9011464', '32053': '9011465', '32054': '9011466', '32055': '9011467', '32058': '9011468', '32059': '9011469', '32060': '9011470', '32062': '9011471', '32063': '9011472', '32064': '9011473', '32065': '9011474', '32066': '9011475', '32068': '9011476', '32071': '9011477', '32072': '9011478', '32073': '9011479', '32080': '9011480', '32081': '9011481', '32082': '9011482', '32083': '9011483', '32084': '9011484', '32086': '9011485', '32087': '9011486', '32091': '9011487', '32092': '9011488', '32094': '9011489', '32095': '9011490', '32096': '9011491', '32097': '9011492', '32102': '9011493', '32110': '9011494', '32112': '9011495', '32113': '9011496', '32114': '9011497', '32117': '9011498', '32118': '9011499', '32119': '9011500', '32124': '9011501', '32127': '9011502', '32128': '9011503', '32129': '9011504', '32130': '9011505', '32131': '9011506', '32132': '9011507', '32134': '9011508', '32136': '9011509', '32137': '9011510', '32139': '9011512', '32140': '9011513', '32141': '9011514', '32145': '9011515', '32148': '9011517', '32159': '9011518', '32162': '9011519', '32164': '9011520', '32168': '9011521', '32169': '9011522', '32174': '9011523', '32176': '9011524', '32177': '9011525', '32179': '9011526', '32180': '9011527', '32181': '9011528', '32187': '9011530', '32189': '9011531', '32190': '9011532', '32193': '9011534', '32195': '9011535', '32202': '9011536', '32203': '9011537', '32204': '9011538', '32205': '9011539', '32206': '9011540', '32207': '9011541', '32208': '9011542', '32209': '9011543', '32210': '9011544', '32211': '9011545', '32212': '9011546', '32216': '9011547', '32217': '9011548', '32218': '9011549', '32219': '9011550', '32220': '9011551', '32221': '9011552', '32222': '9011553', '32223': '9011554', '32224': '9011555', '32225': '9011556', '32226': '9011557', '32227': '9011558', '32233': '9011560', '32234': '9011561', '32244': '9011562', '32246': '9011563', '32250': '9011564', '32254': '9011565', '32256': '9011566', '32257': '9011567', '32258': '9011568', '32259': '9011569', '32266': '9011570', '32277': '9011571', '32301': '9011572', '32303': '9011573', '32304': '9011574', '32305': '9011575', '32308': '9011577', '32309': '9011578', '32310': '9011579', '32311': '9011580', '32312': '9011581', '32317': '9011582', '32320': '9011583', '32321': '9011584', '32322': '9011585', '32324': '9011586', '32327': '9011587', '32328': '9011588', '32331': '9011591', '32332': '9011592', '32333': '9011593', '32334': '9011594', '32336': '9011595', '32340': '9011596', '32343': '9011597', '32344': '9011598', '32346': '9011599', '32347': '9011600', '32348': '9011601', '32350': '9011602', '32351': '9011603', '32352': '9011604', '32355': '9011605', '32356': '9011606', '32358': '9011607', '32359': '9011608', '32399': '9011610', '32401': '9011611', '32403': '9011612', '32404': '9011613', '32405': '9011614', '32407': '9011616', '32408': '9011617', '32409': '9011618', '32410': '9011619', '32413': '9011620', '32420': '9011622', '32421': '9011623', '32423': '9011624', '32424': '9011625', '32425': '9011626', '32426': '9011627', '32427': '9011628', '32428': '9011629', '32430': '9011630', '32431': '9011631', '32433': '9011633', '32435': '9011634', '32437': '9011635', '32438': '9011636', '32439': '9011637', '32440': '9011638', '32442': '9011639', '32443': '9011640', '32444': '9011641', '32445': '9011642', '32446': '9011643', '32448': '9011644', '32449': '9011645', '32455': '9011647', '32456': '9011648', '32459': '9011649', '32460': '9011650', '32462': '9011652', '32464': '9011654', '32465': '9011655', '32466': '9011656', '32501': '9011657', '32502': '9011658', '32503': '9011659', '32504': '9011660', '32505': '9011661', '32506': '9011662', '32507': '9011663', '32508': '9011664', '32509': '9011665', '32511': '9011666', '32514': '9011667', '32520': '9011668', '32526': '9011669', '32531': '9011670', '32533': '9011671', '32534': '9011672', '32535': '9011673', '32536': '9011674', '32539': '9011675', '32541': '9011677', '32542': '9011678', '32544': '9011679', '32547': '9011680', '32548': '9011681', '32550': '9011682', '32561': '9011683', '32563': '9011684', '32564': '9011685', '32565': '9011686', '32566': '9011687', '32567': '9011688', '32568': '9011689', '32569': '9011690', '32570': '9011691', '32571': '9011692', '32577': '9011693', '32578': '9011694', '32579': '9011695', '32580': '9011696', '32583': '9011697', '32601': '9011698', '32603': '9011699', '32605': '9011700', '32606': '9011701', '32607': '9011702', '32608': '9011703', '32609': '9011704', '32615': '9011707', '32617': '9011709', '32618': '9011710', '32619': '9011711', '32621': '9011712', '32622': '9011713', '32625': '9011714', '32626': '9011715', '32628': '9011716', '32631': '9011717', '32639': '9011718', '32640': '9011719', '32641': '9011720', '32643': '9011721', '32648': '9011722', '32653': '9011723', '32656': '9011724', '32664': '9011725', '32666': '9011726', '32667': '9011727', '32668': '9011728', '32669': '9011729', '32680': '9011730', '32686': '9011732', '32692': '9011733', '32693': '9011734', '32694': '9011735', '32696': '9011736', '32701': '9011738', '32702': '9011739', '32703': '9011740', '32707': '9011742', '32708': '9011743', '32709': '9011744', '32712': '9011745', '32713': '9011746', '32714': '9011747', '32720': '9011748', '32724': '9011750', '32725': '9011751', '32726': '9011752', '32730': '9011753', '32732': '9011754', '32735': '9011755', '32736': '9011756', '32738': '9011757', '32744': '9011758', '32746': '9011759', '32750': '9011760', '32751': '9011761', '32754': '9011762', '32757': '9011763', '32759': '9011764', '32763': '9011765', '32764': '9011766', '32765': '9011767', '32766': '9011768', '32767': '9011769', '32771': '9011770', '32773': '9011771', '32776': '9011773', '32778': '9011774', '32779': '9011775', '32780': '9011776', '32784': '9011777', '32789': '9011778', '32792': '9011779', '32796': '9011780', '32798': '9011781', '32801': '9011782', '32803': '9011784', '32804': '9011785', '32805': '9011786', '32806': '9011787', '32807': '9011788', '32808': '9011789', '32809': '9011790', '32810': '9011791', '32811': '9011792', '32812': '9011793', '32814': '9011794', '32816': '9011795', '32817': '9011796', '32818': '9011797', '32819': '9011798', '32820': '9011799', '32821': '9011800', '32822': '9011801', '32824': '9011802', '32825': '9011803', '32826': '9011804', '32827': '9011805', '32828': '9011806', '32829': '9011807', '32830': '9011808', '32831': '9011809', '32832': '9011810', '32833': '9011811', '32835': '9011812', '32836': '9011813', '32837': '9011814', '32839': '9011815', '32887': '9011816', '32901': '9011817', '32903': '9011818', '32904': '9011819', '32905': '9011820', '32907': '9011821', '32908': '9011822', '32909': '9011823', '32920': '9011824', '32922': '9011825', '32925': '9011826', '32926': '9011827', '32927': '9011828', '32931': '9011829', '32934': '9011830', '32935': '9011831', '32937': '9011832', '32940': '9011833', '32948': '9011834', '32949': '9011835', '32950': '9011836', '32951': '9011837', '32952': '9011838', '32953': '9011839', '32955': '9011840', '32958': '9011841', '32960': '9011842', '32962': '9011843', '32963': '9011844', '32966': '9011845', '32967': '9011846', '32968': '9011847', '32976': '9011848', '33001': '9011849', '33004': '9011850', '33009': '9011851', '33010': '9011852', '33012': '9011853', '33013': '9011854', '33014': '9011855', '33015': '9011856', '33016': '9011857', '33018': '9011858', '33019': '9011859', '33020': '9011860', '33021': '9011861', '33023': '9011863', '33024': '9011864', '33025': '9011865', '33026': '9011866', '33027': '9011867', '33028': '9011868', '33029': '9011869', '33030': '9011870', '33031': '9011871', '33032': '9011872', '33033': '9011873', '33034': '9011874', '33035': '9011875', '33036': '9011876', '33037': '9011877', '33039': '9011878', '33040': '9011879', '33042': '9011880', '33043': '9011881', '33050': '9011882', '33051': '9011883', '33054': '9011884', '33055': '9011885', '33056': '9011886', '33060': '9011887', '33062': '9011888', '33063': '9011889', '33064': '9011890', '33065': '9011891', '33066': '9011892', '33067': '9011893', '33068': '9011894', '33069': '9011895', '33070': '9011896', '33071': '9011897', '33073': '9011898', '33076': '9011899', '33109': '9011901', '33122': '9011902', '33125': '9011903', '33126': '9011904', '33127': '9011905', '33128': '9011906', '33129': '9011907', '33130': '9011908', '33131': '9011909', '33132': '9011910', '33133': '9011911', '33134': '9011912', '33135': '9011913', '33136': '9011914', '33137': '9011915', '33138': '9011916', '33139': '9011917', '33140': '9011918', '33141': '9011919', '33142': '9011920', '33143': '9011921', '33144': '9011922', '33145': '9011923', '33146': '9011924', '33147': '9011925', '33149': '9011926', '33150': '9011927', '33154': '9011929', '33155': '9011930', '33156': '9011931', '33157': '9011932', '33158': '9011933', '33160': '9011934', '33161': '9011935', '33162': '9011936', '33165': '9011937', '33166': '9011938', '33167': '9011939', '33168': '9011940', '33169': '9011941', '33170': '9011942', '33172': '9011943', '33173': '9011944', '33174': '9011945', '33175': '9011946', '33176': '9011947', '33177': '9011948', '33178': '9011949', '33179': '9011950', '33180': '9011951', '33181': '9011952', '33182': '9011953', '33183': '9011954', '33184': '9011955', '33185': '9011956', '33186': '9011957', '33187': '9011958', '33189': '9011959', '33190': '9011960', '33193': '9011961', '33194': '9011962', '33196': '9011963', '33199': '9011964', '33301': '9011965', '33304': '9011966', '33305': '9011967', '33306': '9011968', '33308': '9011969', '33309': '9011970', '33311': '9011972', '33312': '9011973', '33313': '9011974', '33314': '9011975', '33315': '9011976', '33316': '9011977', '33317': '9011978', '33319': '9011979', '33321': '9011980', '33322': '9011981', '33323': '9011982', '33324': '9011983', '33325': '9011984', '33326': '9011985', '33327': '9011986', '33328': '9011987', '33330': '9011988', '33331': '9011989', '33332': '9011990', '33334': '9011991', '33351': '9011992', '33388': '9011993', '33394': '9011994', '33401': '9011995', '33403': '9011996', '33404': '9011997', '33405': '9011998', '33406': '9011999', '33407': '9012000', '33408': '9012001', '33409': '9012002', '33410': '9012003', '33411': '9012004', '33412': '9012005', '33413': '9012006', '33414': '9012007', '33415': '9012008', '33417': '9012009', '33418': '9012010', '33426': '9012011', '33428': '9012012', '33430': '9012014', '33431': '9012015', '33432': '9012016', '33433': '9012017', '33434': '9012018', '33435': '9012019', '33436': '9012020', '33437': '9012021', '33438': '9012022', '33440': '9012023', '33441': '9012024', '33442': '9012025', '33444': '9012026', '33445': '9012027', '33446': '9012028', '33449': '9012029', '33455': '9012030', '33458': '9012031', '33460': '9012032', '33461': '9012033', '33462': '9012034', '33463': '9012035', '33467': '9012036', '33469': '9012038', '33470': '9012039', '33471': '9012040', '33472': '9012041', '33473': '9012042', '33476': '9012043', '33477': '9012044', '33478': '9012045', '33480': '9012046', '33483': '9012047', '33484': '9012048', '33486': '9012049', '33487': '9012050', '33493': '9012051', '33496': '9012052', '33498': '9012053', '33499': '9012054', '33510': '9012055', '33511': '9012056', '33513': '9012057', '33514': '9012058', '33523': '9012060', '33525': '9012061', '33527': '9012062', '33534': '9012063', '33540': '9012064', '33541': '9012065', '33542': '9012066', '33543': '9012067', '33544': '9012068', '33545': '9012069', '33547': '9012070', '33548': '9012071', '33549': '9012072', '33556': '9012073', '33558': '9012074', '33559': '9012075', '33563': '9012076', '33565': '9012077', '33566': '9012078', '33567': '9012079', '33569': '9012080', '33570': '9012081', '33572': '9012082', '33573': '9012083', '33576': '9012084', '33578': '9012085', '33579': '9012086', '33584': '9012087', '33585': '9012088', '33592': '9012089', '33594': '9012090', '33596': '9012091', '33597': '9012092', '33598': '9012093', '33602': '9012094', '33603': '9012095', '33604': '9012096', '33605': '9012097', '33606': '9012098', '33607': '9012099', '33609': '9012100', '33610': '9012101', '33611': '9012102', '33612': '9012103', '33613': '9012104', '33614': '9012105', '33615': '9012106', '33616': '9012107', '33617': '9012108', '33618': '9012109', '33619': '9012110', '33620': '9012111', '33621': '9012112', '33624': '9012113', '33625': '9012114', '33626': '9012115', '33629': '9012116', '33634': '9012117', '33635': '9012118', '33637': '9012119', '33647': '9012120', '33701': '9012121', '33702': '9012122', '33703': '9012123', '33704': '9012124', '33705': '9012125', '33706': '9012126', '33707': '9012127', '33708': '9012128', '33709': '9012129', '33710': '9012130', '33711': '9012131', '33712': '9012132', '33713': '9012133', '33714': '9012134', '33715': '9012135', '33716': '9012136', '33730': '9012137', '33755': '9012138', '33756': '9012139', '33759': '9012140', '33760': '9012141', '33761': '9012142', '33762': '9012143', '33763': '9012144', '33764': '9012145', '33765': '9012146', '33767': '9012147', '33770': '9012148', '33771': '9012149', '33772': '9012150', '33773': '9012151', '33774': '9012152', '33776': '9012153', '33777': '9012154', '33778': '9012155', '33781': '9012156', '33782': '9012157', '33785': '9012158', '33786': '9012159', '33801': '9012160', '33803': '9012161', '33805': '9012162', '33809': '9012163', '33810': '9012164', '33811': '9012165', '33812': '9012166', '33813': '9012167', '33815': '9012168', '33823': '9012169', '33825': '9012170', '33827': '9012171', '33830': '9012172', '33834': '9012173', '33837': '9012174', '33838': '9012175', '33839': '9012176', '33841': '9012177', '33843': '9012178', '33844': '9012179', '33849': '9012182', '33850': '9012183', '33852': '9012184', '33853': '9012185', '33855': '9012186', '33857': '9012187', '33859': '9012188', '33860': '9012189', '33865': '9012190', '33867': '9012191', '33868': '9012192', '33870': '9012193', '33872': '9012194', '33873': '9012195', '33875': '9012196', '33876': '9012197', '33880': '9012198', '33881': '9012199', '33884': '9012200', '33888': '9012201', '33890': '9012202', '33896': '9012203', '33897': '9012204', '33898': '9012205', '33901': '9012206', '33903': '9012207', '33904': '9012208', '33905': '9012209', '33907': '9012210', '33908': '9012211', '33909': '9012212', '33912': '9012213', '33913': '9012214', '33914': '9012215', '33916': '9012216', '33917': '9012217', '33919': '9012218', '33920': '9012219', '33921': '9012220', '33922': '9012221', '33924': '9012222', '33928': '9012223', '33930': '9012224', '33931': '9012225', '33935': '9012226', '33936': '9012227', '33944': '9012228', '33946': '9012230', '33947': '9012231', '33948': '9012232', '33952': '9012233', '33953': '9012234', '33954': '9012235', '33955': '9012236', '33956': '9012237', '33957': '9012238', '33960': '9012239', '33965': '9012240', '33966': '9012241', '33967': '9012242', '33971': '9012243', '33972': '9012244', '33973': '9012245', '33974': '9012246', '33976': '9012247', '33980': '9012248', '33981': '9012249', '33982': '9012250', '33983': '9012251', '33990': '9012252', '33991': '9012253', '33993': '9012254', '34102': '9012255', '34103': '9012256', '34104': '9012257', '34105': '9012258', '34108': '9012259', '34109': '9012260', '34110': '9012261', '34112': '9012262', '34113': '9012263', '34114': '9012264', '34116': '9012265', '34117': '9012266', '34119': '9012267', '34120': '9012268', '34134': '9012269', '34135': '9012270', '34138': '9012272', '34139': '9012273', '34140': '9012274', '34141': '9012275', '34142': '9012276', '34145': '9012277', '34201': '9012278', '34202': '9012279', '34203': '9012280', '34205': '9012281', '34207': '9012282', '34208': '9012283', '34209': '9012284', '34210': '9012285', '34211': '9012286', '34212': '9012287', '34215': '9012288', '34216': '9012289', '34217': '9012290', '34219': '9012291', '34221': '9012292', '34222': '9012293', '34223': '9012294', '34224': '9012295', '34228': '9012296', '34229': '9012297', '34231': '9012299', '34232': '9012300', '34233': '9012301', '34234': '9012302', '34235': '9012303', '34236': '9012304', '34237': '9012305', '34238': '9012306', '34239': '9012307', '34240': '9012308', '34241': '9012309', '34242': '9012310', '34243': '9012311', '34250': '9012312', '34251': '9012313', '34266': '9012315', '34269': '9012316', '34275': '9012317', '34285': '9012318', '34286': '9012319', '34287': '9012320', '34288': '9012321', '34289': '9012322', '34291': '9012323', '34292': '9012324', '34293': '9012325', '34420': '9012326', '34428': '9012327', '34429': '9012328', '34431': '9012329', '34432': '9012330', '34433': '9012331', '34434': '9012332', '34436': '9012333', '34442': '9012334', '34446': '9012335', '34448': '9012336', '34449': '9012337', '34450': '9012338', '34452': '9012340', '34461': '9012341', '34465': '9012342', '34470': '9012343', '34471': '9012344', '34472': '9012345', '34473': '9012346', '34474': '9012347', '34475': '9012348', '34476': '9012349', '34479': '9012351', '34480': '9012352', '34481': '9012353', '34482': '9012354', '34484': '9012355', '34488': '9012356', '34491': '9012357', '34498': '9012358', '34601': '9012359', '34602': '9012360', '34604': '9012361', '34606': '9012362', '34607': '9012363', '34608': '9012364', '34609': '9012365', '34610': '9012366', '34613': '9012367', '34614': '9012368', '34637': '9012369', '34638': '9012370', '34639': '9012371', '34652': '9012372', '34653': '9012373', '34654': '9012374', '34655': '9012375', '34667': '9012377', '34668': '9012378', '34669': '9012379', '34677': '9012380', '34683': '9012383', '34684': '9012384', '34685': '9012385', '34688': '9012386', '34689': '9012387', '34690': '9012388', '34691': '9012389', '34695': '9012390', '34698': '9012391', '34705': '9012392', '34711': '9012393', '34714': '9012394', '34715': '9012395', '34731': '9012396', '34734': '9012397', '34736': '9012398', '34737': '9012399', '34739': '9012400', '34741': '9012401', '34743': '9012402', '34744': '9012403', '34746': '9012404', '34747': '9012405', '34748': '9012406', '34753': '9012407', '34756': '9012409', '34758': '9012410', '34759': '9012411', '34760': '9012412', '34761': '9012413', '34762': '9012414', '34769': '9012415', '34771': '9012416', '34772': '9012417', '34773': '9012418', '34785': '9012419', '34786': '9012420', '34787': '9012421', '34788': '9012422', '34797': '9012423', '34945': '9012424', '34946': '9012425', '34947': '9012426', '34949': '9012427', '34950': '9012428', '34951': '9012429', '34952': '9012430', '34953': '9012431', '34956': '9012432', '34957': '9012433', '34972': '9012434', '34974': '9012435', '34981': '9012436', '34982': '9012437', '34983': '9012438', '34984': '9012439', '34986': '9012440', '34987': '9012441', '34990': '9012442', '34994': '9012443', '34996': '9012444', '34997': '9012445', '35004': '9012446', '35005': '9012447', '35006': '9012448', '35007': '9012449', '35010': '9012450', '35014': '9012451', '35016': '9012452', '35019': '9012453', '35020': '9012454', '35022': '9012455', '35023': '9012456', '35031': '9012457', '35033': '9012458', '35034': '9012459', '35035': '9012460', '35040': '9012462', '35042': '9012463', '35043': '9012464', '35044': '9012465', '35045': '9012466', '35046': '9012467', '35049': '9012468', '35051': '9012469', '35053': '9012470', '35054': '9012471', '35055': '9012472', '35057': '9012473', '35058': '9012474', '35061': '9012476', '35062': '9012477', '35063': '9012478', '35064': '9012479', '35068': '9012480', '35071': '9012482', '35072': '9012483', '35073': '9012484', '35077': '9012486', '35078': '9012487', '35079': '9012488', '35080': '9012489', '35083': '9012490', '35085': '9012491', '35087': '9012492', '35089': '9012493', '35091': '9012494', '35094': '9012495', '35096': '9012496', '35097': '9012497', '35098': '9012498', '35111': '9012499', '35112': '9012500', '35114': '9012501', '35115': '9012502', '35116': '9012503', '35117': '9012504', '35118': '9012505', '35120': '9012507', '35121': '9012508', '35124': '9012509', '35125': '9012510', '35126': '9012511', '35127': '9012512', '35128': '9012513', '35130': '9012514', '35131': '9012515', '35133': '9012516', '35135': '9012517', '35136': '9012518', '35139': '9012520', '35143': '9012521', '35146': '9012522', '35147': '9012523', '35148': '9012524', '35150': '9012526', '35151': '9012527', '35160': '9012528', '35171': '9012529', '35172': '9012530', '35173': '9012531', '35175': '9012532', '35176': '9012533', '35178': '9012534', '35179': '9012535', '35180': '9012536', '35183': '9012538', '35184': '9012539', '35186': '9012541', '35188': '9012542', '35203': '9012544', '35204': '9012545', '35205': '9012546', '35206': '9012547', '35207': '9012548', '35208': '9012549', '35209': '9012550', '35210': '9012551', '35211': '9012552', '35212': '9012553', '35213': '9012554', '35214': '9012555', '35215': '9012556', '35216': '9012557', '35217': '9012558', '35218': '9012559', '35221': '9012560', '35222': '9012561', '35223': '9012562', '35224': '9012563', '35226': '9012564', '35228': '9012565', '35229': '9012566', '35233': '9012567', '35234': '9012568', '35235': '9012569', '35242': '9012570', '35243': '9012571', '35244': '9012572', '35249': '9012573', '35254': '9012574', '35293': '9012575', '35294': '9012576', '35401': '9012577', '35404': '9012578', '35405': '9012579', '35406': '9012580', '35441': '9012581', '35442': '9012582', '35443': '9012583', '35444': '9012584', '35446': '9012585', '35447': '9012586', '35452': '9012588', '35453': '9012589', '35456': '9012590', '35457': '9012591', '35458': '9012592', '35459': '9012593', '35460': '9012594', '35461': '9012595', '35462': '9012596', '35463': '9012597', '35464': '9012598', '35466': '9012599', '35469': '9012600', '35470': '9012601', '35473': '9012602', '35474': '9012603', '35475': '9012604', '35476': '9012605', '35480': '9012607', '35481': '9012608', '35490': '9012610', '35501': '9012611', '35503': '9012612', '35504': '9012613', '35540': '9012614', '35541': '9012615', '35542': '9012616', '35543': '9012617', '35544': '9012618', '35546': '9012620', '35548': '9012621', '35549': '9012622', '35550': '9012623', '35552': '9012624', '35553': '9012625', '35554': '9012626', '35555': '9012627', '35563': '9012628', '35564': '9012629', '35565': '9012630', '35570': '9012631', '35571': '9012632', '35572': '9012633', '35574': '9012634', '35575': '9012635', '35576': '9012636', '35578': '9012637', '35579': '9012638', '35580': '9012639', '35581': '9012640', '35582': '9012641', '35585': '9012643', '35586': '9012644', '35587': '9012645', '35592': '9012646', '35593': '9012647', '35594': '9012648', '35601': '9012649', '35603': '9012650', '35610': '9012651', '35611': '9012652', '35613': '9012653', '35614': '9012654', '35616': '9012655', '35618': '9012656', '35619': '9012657', '35620': '9012658', '35621': '9012659', '35622': '9012660', '35630': '9012661', '35633': '9012662', '35634': '9012663', '35640': '9012664', '35643': '9012665', '35645': '9012666', '35646': '9012667', '35647': '9012668', '35648': '9012669', '35649': '9012670', '35650': '9012671', '35651': '9012672', '35652': '9012673', '35653': '9012674', '35654': '9012675', '35660': '9012676', '35661': '9012677', '35670': '9012678', '35671': '9012679', '35672': '9012680', '35673': '9012681', '35674': '9012682', '35677': '9012683', '35739': '9012684', '35740': '9012685', '35741': '9012686', '35744': '9012687', '35745': '9012688', '35746': '9012689', '35747': '9012690', '35748': '9012691', '35749': '9012692', '35750': '9012693', '35751': '9012694', '35752': '9012695', '35754': '9012696', '35755': '9012697', '35756': '9012698', '35757': '9012699', '35758': '9012700', '35759': '9012701', '35760': '9012702', '35761': '9012703', '35763': '9012704', '35764': '9012705', '35765': '9012706', '35766': '9012707', '35768': '9012708', '35769': '9012709', '35771': '9012710', '35772': '9012711', '35773': '9012712', '35774': '9012713', '35775': '9012714', '35776': '9012715', '35801': '9012716', '35802': '9012717', '35803': '9012718', '35805': '9012719', '35806': '9012720', '35808': '9012721', '35810': '9012722', '35811': '9012723', '35813': '9012724', '35816': '9012725', '35824': '9012726', '35901': '9012727', '35903': '9012728', '35904': '9012729', '35905': '9012730', '35906': '9012731', '35907': '9012732', '35950': '9012733', '35951': '9012734', '35952': '9012735', '35953': '9012736', '35954': '9012737', '35956': '9012738', '35957': '9012739', '35958': '9012740', '35959': '9012741', '35960': '9012742', '35961': '9012743', '35962': '9012744', '35963': '9012745', '35966': '9012746', '35967': '9012747', '35968': '9012748', '35971': '9012749', '35972': '9012750', '35973': '9012751', '35974': '9012752', '35975': '9012753', '35976': '9012754', '35978': '9012755', '35979': '9012756', '35980': '9012757', '35981': '9012758', '35983': '9012759', '35984': '9012760', '35986': '9012761', '35987': '9012762', '35988': '9012763', '35989': '9012764', '36003': '9012766', '36005': '9012767', '36006': '9012768', '36009': '9012769', '36010': '9012770', '36013': '9012771', '36016': '9012772', '36017': '9012773', '36020': '9012774', '36022': '9012775', '36024': '9012776', '36025': '9012777', '36026': '9012778', '36027': '9012779', '36028': '9012780', '36029': '9012781', '36030': '9012782', '36032': '9012783', '36033': '9012784', '36034': '9012785', '36035': '9012786', '36036': '9012787', '36037': '9012788', '36039': '9012789', '36040': '9012790', '36041': '9012791', '36042': '9012792', '36043': '9012793', '36046': '9012794', '36047': '9012795', '36048': '9012796', '36049': '9012797', '36051': '9012798', '36052': '9012799', '36053': '9012800', '36054': '9012801', '36064': '9012802', '36066': '9012803', '36067': '9012804', '36069': '9012805', '36071': '9012806', '36075': '9012807', '36078': '9012808', '36079': '9012809', '36080': '9012810', '36081': '9012811', '36082': '9012812', '36083': '9012813', '36088': '9012814', '36089': '9012815', '36091': '9012816', '36092': '9012817', '36093': '9012818', '36104': '9012819', '36105': '9012820', '36106': '9012821', '36107': '9012822', '36108': '9012823', '36109': '9012824', '36110': '9012825', '36111': '9012826', '36112': '9012827', '36113': '9012828', '36114': '9012829', '36115': '9012830', '36116': '9012831', '36117': '9012832', '36130': '9012834', '36131': '9012835', '36201': '9012836', '36203': '9012837', '36205': '9012838', '36206': '9012839', '36207': '9012840', '36250': '9012841', '36251': '9012842', '36255': '9012843', '36256': '9012844', '36258': '9012845', '36260': '9012846', '36262': '9012847', '36263': '9012848', '36264': '9012849', '36265': '9012850', '36266': '9012851', '36268': '9012853', '36269': '9012854', '36271': '9012855', '36272': '9012856', '36273': '9012857', '36274': '9012858', '36276': '9012859', '36277': '9012860', '36278': '9012861', '36279': '9012862', '36280': '9012863', '36301': '9012864', '36303': '9012866', '36305': '9012867', '36310': '9012868', '36311': '9012869', '36312': '9012870', '36314': '9012871', '36316': '9012872', '36317': '9012873', '36318': '9012874', '36319': '9012875', '36320': '9012876', '36321': '9012877', '36322': '9012878', '36323': '9012879', '36330': '9012880', '36340': '9012881', '36343': '9012882', '36344': '9012883', '36345': '9012884', '36346': '9012885', '36350': '9012886', '36351': '9012887', '36352': '9012888', '36353': '9012889', '36360': '9012890', '36362': '9012891', '36370': '9012892', '36373': '9012893', '36374': '9012894', '36375': '9012895', '36376': '9012896', '36401': '9012897', '36420': '9012898', '36421': '9012899', '36425': '9012900', '36426': '9012901', '36432': '9012902', '36435': '9012903', '36439': '9012904', '36441': '9012905', '36442': '9012906', '36444': '9012907', '36445': '9012908', '36451': '9012909', '36453': '9012910', '36456': '9012911', '36460': '9012912', '36467': '9012913', '36471': '9012914', '36474': '9012915', '36475': '9012916', '36477': '9012917', '36480': '9012918', '36481': '9012919', '36482': '9012920', '36483': '9012921', '36502': '9012922', '36505': '9012923', '36507': '9012924', '36509': '9012925', '36511': '9012926', '36518': '9012928', '36521': '9012929', '36522': '9012930', '36523': '9012931', '36524': '9012932', '36525': '9012933', '36526': '9012934', '36527': '9012935', '36528': '9012936', '36529': '9012937', '36530': '9012938', '36532': '9012939', '36535': '9012940', '36538': '9012941', '36539': '9012942', '36541': '9012943', '36542': '9012944', '36544': '9012946', '36545': '9012947', '36548': '9012948', '36549': '9012949', '36550': '9012950', '36551': '9012951', '36553': '9012952', '36555': '9012953', '36556': '9012954', '36558': '9012955', '36560': '9012956', '36561': '9012957', '36562': '9012958', '36567': '9012959', '36569': '9012960', '36571': '9012961', '36572': '9012962', '36574': '9012963', '36575': '9012964', '36576': '9012965', '36578': '9012966', '36579': '9012967', '36580': '9012968', '36581': '9012969', '36582': '9012970', '36583': '9012971', '36584': '9012972', '36585': '9012973', '36587': '9012974', '36602': '9012976', '36603': '9012977', '36604': '9012978', '36605': '9012979', '36606': '9012980', '36607': '9012981', '36608': '9012982', '36609': '9012983', '36610': '9012984', '36611': '9012985', '36612': '9012986', '36613': '9012987', '36615': '9012988', '36617': '9012989', '36618': '9012990', '36619': '9012991', '36628': '9012992', '36688': '9012993', '36693': '9012994', '36695': '9012995', '36701': '9012996', '36703': '9012997', '36720': '9012998', '36722': '9012999', '36726': '9013000', '36727': '9013001', '36728': '9013002', '36732': '9013003', '36736': '9013004', '36738': '9013005', '36740': '9013006', '36741': '9013007', '36742': '9013008', '36744': '9013009', '36748': '9013010', '36749': '9013011', '36750': '9013012', '36751': '9013013', '36752': '9013014', '36754': '9013015', '36756': '9013016', '36758': '9013017', '36759': '9013018', '36761': '9013019', '36765': '9013020', '36767': '9013021', '36768': '9013022', '36769': '9013023', '36773': '9013024', '36775': '9013025', '36776': '9013026', '36782': '9013028', '36783': '9013029', '36784': '9013030', '36785': '9013031', '36786': '9013032', '36790': '9013033', '36792': '9013034', '36793': '9013035', '36801': '9013036', '36804': '9013037', '36830': '9013038', '36832': '9013039', '36849': '9013040', '36850': '9013041', '36852': '9013042', '36853': '9013043', '36854': '9013044', '36855': '9013045', '36856': '9013046', '36858': '9013047', '36860': '9013048', '36861': '9013049', '36862': '9013050', '36863': '9013051', '36866': '9013052', '36867': '9013053', '36869': '9013054', '36870': '9013055', '36871': '9013056', '36874': '9013057', '36875': '9013058', '36877': '9013059', '36879': '9013060', '36901': '9013061', '36904': '9013062', '36907': '9013063', '36908': '9013064', '36912': '9013065', '36915': '9013066', '36916': '9013067', '36919': '9013068', '36921': '9013069', '36922': '9013070', '36925': '9013071', '37010': '9013072', '37012': '9013073', '37013': '9013074', '37014': '9013075', '37015': '9013076', '37016': '9013077', '37018': '9013078', '37019': '9013079', '37020': '9013080', '37022': '9013081', '37023': '9013082', '37025': '9013083', '37026': '9013084', '37027': '9013085', '37028': '9013086', '37029': '9013087', '37030': '9013088', '37031': '9013089', '37032': '9013090', '37033': '9013091', '37034': '9013092', '37035': '9013093', '37036': '9013094', '37037': '9013095', '37040': '9013096', '37042': '9013097', '37043': '9013098', '37044': '9013099', '37046': '9013100', '37047': '9013101', '37048': '9013102', '37049': '9013103', '37050': '9013104', '37051': '9013105', '37052': '9013106', '37055': '9013107', '37057': '9013108', '37058': '9013109', '37059': '9013110', '37060': '9013111', '37061': '9013112', '37062': '9013113', '37064': '9013114', '37066': '9013115', '37067': '9013116', '37069': '9013117', '37072': '9013118', '37073': '9013119', '37074': '9013120', '37075': '9013121', '37076': '9013122', '37078': '9013123', '37079': '9013124', '37080': '9013125', '37082': '9013126', '37083': '9013127', '37085': '9013128', '37086': '9013129', '37087': '9013130', '37090': '9013131', '37091': '9013132', '37095': '9013133', '37096': '9013134', '37097': '9013135', '37098': '9013136', '37101': '9013137', '37110': '9013138', '37115': '9013139', '37118': '9013140', '37122': '9013141', '37127': '9013142', '37128': '9013143', '37129': '9013144', '37130': '9013145', '37134': '9013146', '37135': '9013147', '37137': '9013148', '37138': '9013149', '37140': '9013150', '37141': '9013151', '37142': '9013152', '37143': '9013153', '37144': '9013154', '37145': '9013155', '37146': '9013156', '37148': '9013157', '37149': '9013158', '37150': '9013159', '37151': '9013160', '37153': '9013162', '37160': '9013163', '37166': '9013164', '37167': '9013165', '37171': '9013166', '37172': '9013167', '37174': '9013168', '37175': '9013169', '37178': '9013170', '37179': '9013171', '37180': '9013172', '37181': '9013173', '37183': '9013174', '37184': '9013175', '37185': '9013176', '37186': '9013177', '37187': '9013178', '37188': '9013179', '37189': '9013180', '37190': '9013181', '37191': '9013182', '37201': '9013183', '37203': '9013184', '37204': '9013185', '37205': '9013186', '37206': '9013187', '37207': '9013188', '37208': '9013189', '37209': '9013190', '37210': '9013191', '37211': '9013192', '37212': '9013193', '37213': '9013194', '37214': '9013195', '37215': '9013196', '37216': '9013197', '37217': '9013198', '37218': '9013199', '37219': '9013200', '37220': '9013201', '37221': '9013202', '37228': '9013203', '37240': '9013209', '37243': '9013210', '37246': '9013211', '37301': '9013212', '37302': '9013213', '37303': '9013214', '37305': '9013215', '37306': '9013216', '37307': '9013217', '37308': '9013218', '37309': '9013219', '37310': '9013220', '37311': '9013221', '37312': '9013222', '37313': '9013223', '37317': '9013225', '37318': '9013226', '37321': '9013228', '37322': '9013229', '37323': '9013230', '37324': '9013231', '37325': '9013232', '37327': '9013234', '37328': '9013235', '37329': '9013236', '37330': '9013237', '37331': '9013238', '37332': '9013239', '37333': '9013240', '37334': '9013241', '37335': '9013242', '37336': '9013243', '37337': '9013244', '37338': '9013245', '37339': '9013246', '37340': '9013247', '37341': '9013248', '37342': '9013249', '37343': '9013250', '37345': '9013251', '37347': '9013252', '37348': '9013253', '37350': '9013254', '37351': '9013255', '37352': '9013256', '37353': '9013257', '37354': '9013258', '37355': '9013259', '37356': '9013260', '37357': '9013261', '37359': '9013262', '37360': '9013263', '37361': '9013264', '37362': '9013265', '37363': '9013266', '37365': '9013267', '37366': '9013268', '37367': '9013269', '37369': '9013270', '37370': '9013271', '37373': '9013272', '37374': '9013273', '37375': '9013274', '37376': '9013275', '37377': '9013276', '37379': '9013277', '37380': '9013278', '37381': '9013279', '37385': '9013280', '37387': '9013281', '37388': '9013282', '37391': '9013283', '37396': '9013285', '37397': '9013286', '37398': '9013287', '37402': '9013288', '37403': '9013289', '37404': '9013290', '37405': '9013291', '37406': '9013292', '37407': '9013293', '37408': '9013294', '37409': '9013295', '37410': '9013296', '37411': '9013297', '37412': '9013298', '37415': '9013299', '37416': '9013300', '37419': '9013301', '37421': '9013302', '37450': '9013303', '37501': '9013304', '37601': '9013305', '37604': '9013306', '37615': '9013308', '37616': '9013309', '37617': '9013310', '37618': '9013311', '37620': '9013312', '37640': '9013313', '37641': '9013314', '37642': '9013315', '37643': '9013316', '37645': '9013318', '37650': '9013319', '37656': '9013320', '37657': '9013321', '37658': '9013322', '37659': '9013323', '37660': '9013324', '37663': '9013326', '37664': '9013327', '37665': '9013328', '37680': '9013329', '37681': '9013330', '37683': '9013332', '37686': '9013333', '37687': '9013334', '37688': '9013335', '37690': '9013336', '37691': '9013337', '37692': '9013338', '37694': '9013339', '37701': '9013340', '37705': '9013341', '37708': '9013342', '37709': '9013343', '37710': '9013344', '37711': '9013345', '37713': '9013346', '37714': '9013347', '37715': '9013348', '37716': '9013349', '37721': '9013350', '37722': '9013351', '37723': '9013352', '37724': '9013353', '37725': '9013354', '37726': '9013355', '37727': '9013356', '37729': '9013357', '37731': '9013358', '37737': '9013361', '37738': '9013362', '37742': '9013363', '37743': '9013364', '37745': '9013365', '37748': '9013366', '37752': '9013367', '37753': '9013368', '37754': '9013369', '37755': '9013370', '37756': '9013371', '37757': '9013372', '37760': '9013373', '37762': '9013374', '37763': '9013375', '37764': '9013376', '37766': '9013377', '37769': '9013378', '37770': '9013379', '37771': '9013380', '37772': '9013381', '37774': '9013382', '37777': '9013383', '37779': '9013384', '37801': '9013385', '37803': '9013386', '37804': '9013387', '37806': '9013388', '37807': '9013389', '37809': '9013390', '37810': '9013391', '37811': '9013392', '37813': '9013393', '37814': '9013394', '37818': '9013395', '37819': '9013396', '37820': '9013397', '37821': '9013398', '37825': '9013399', '37826': '9013400', '37828': '9013401', '37829': '9013402', '37830': '9013403', '37840': '9013405', '37841': '9013406', '37843': '9013407', '37845': '9013408', '37846': '9013409', '37847': '9013410', '37848': '9013411', '37849': '9013412', '37852': '9013414', '37853': '9013415', '37854': '9013416', '37857': '9013417', '37860': '9013418', '37861': '9013419', '37862': '9013420', '37863': '9013421', '37865': '9013422', '37866': '9013423', '37869': '9013425', '37870': '9013426', '37871': '9013427', '37872': '9013428', '37873': '9013429', '37874': '9013430', '37876': '9013431', '37877': '9013432', '37878': '9013433', '37879': '9013434', '37880': '9013435', '37881': '9013436', '37882': '9013437', '37885': '9013438', '37886': '9013439', '37887': '9013440', '37888': '9013441', '37890': '9013442', '37891': '9013443', '37892': '9013444', '37902': '9013446', '37909': '9013447', '37912': '9013448', '37914': '9013449', '37915': '9013450', '37916': '9013451', '37917': '9013452', '37918': '9013453', '37919': '9013454', '37920': '9013455', '37921': '9013456', '37922': '9013457', '37923': '9013458', '37924': '9013459', '37929': '9013460', '37931': '9013461', '37932': '9013462', '37934': '9013463', '37938': '9013464', '37996': '9013466', '37998': '9013467', '38001': '9013468', '38002': '9013469', '38004': '9013470', '38006': '9013471', '38008': '9013473', '38011': '9013474', '38012': '9013475', '38015': '9013476', '38016': '9013477', '38017': '9013478', '38018': '9013479', '38019': '9013480', '38023': '9013481', '38024': '9013482', '38028': '9013483', '38030': '9013484', '38034': '9013485', '38037': '9013487', '38039': '9013488', '38040': '9013489', '38041': '9013490', '38042': '9013491', '38044': '9013492', '38047': '9013494', '38049': '9013495', '38050': '9013496', '38052': '9013497', '38053': '9013498', '38057': '9013499', '38058': '9013500', '38059': '9013501', '38060': '9013502', '38061': '9013503', '38063': '9013504', '38066': '9013505', '38067': '9013506', '38068': '9013507', '38069': '9013508', '38075': '9013509', '38076': '9013510', '38079': '9013511', '38080': '9013512', '38103': '9013514', '38104': '9013515', '38105': '9013516', '38106': '9013517', '38107': '9013518', '38108': '9013519', '38109': '9013520', '38111': '9013521', '38112': '9013522', '38114': '9013523', '38115': '9013524', '38116': '9013525', '38117': '9013526', '38118': '9013527', '38119': '9013528', '38120': '9013529', '38122': '9013530', '38125': '9013531', '38126': '9013532', '38127': '9013533', '38128': '9013534', '38131': '9013535', '38132': '9013536', '38133': '9013537', '38134': '9013538', '38135': '9013539', '38136': '9013540', '38137': '9013541', '38138': '9013542', '38139': '9013543', '38141': '9013544', '38152': '9013545', '38157': '9013546', '38163': '9013547', '38166': '9013548', '38201': '9013549', '38220': '9013550', '38221': '9013551', '38222': '9013552', '38224': '9013553', '38225': '9013554', '38226': '9013555', '38229': '9013556', '38230': '9013557', '38231': '9013558', '38232': '9013559', '38233': '9013560', '38236': '9013562', '38237': '9013563', '38240': '9013564', '38241': '9013565', '38242': '9013566', '38251': '9013567', '38253': '9013568', '38255': '9013569', '38256': '9013570', '38257': '9013571', '38258': '9013572', '38259': '9013573', '38260': '9013574', '38261': '9013575', '38301': '9013577', '38305': '9013578', '38310': '9013579', '38311': '9013580', '38313': '9013581', '38315': '9013582', '38316': '9013583', '38317': '9013584', '38318': '9013585', '38320': '9013586', '38321': '9013587', '38326': '9013588', '38327': '9013589', '38328': '9013590', '38329': '9013591', '38330': '9013592', '38332': '9013593', '38333': '9013594', '38334': '9013595', '38337': '9013596', '38339': '9013597', '38340': '9013598', '38341': '9013599', '38342': '9013600', '38343': '9013601', '38344': '9013602', '38345': '9013603', '38347': '9013604', '38348': '9013605', '38351': '9013606', '38352': '9013607', '38355': '9013608', '38356': '9013609', '38357': '9013610', '38358': '9013611', '38359': '9013612', '38361': '9013613', '38362': '9013614', '38363': '9013615', '38366': '9013616', '38367': '9013617', '38368': '9013618', '38369': '9013619', '38370': '9013620', '38371': '9013621', '38372': '9013622', '38374': '9013623', '38375': '9013624', '38376': '9013625', '38379': '9013626', '38380': '9013627', '38381': '9013628', '38382': '9013629', '38387': '9013630', '38388': '9013631', '38390': '9013633', '38391': '9013634', '38392': '9013635', '38401': '9013636', '38425': '9013637', '38449': '9013638', '38450': '9013639', '38451': '9013640', '38452': '9013641', '38453': '9013642', '38454': '9013643', '38455': '9013644', '38456': '9013645', '38457': '9013646', '38459': '9013647', '38460': '9013648', '38461': '9013649', '38462': '9013650', '38463': '9013651', '38464': '9013652', '38468': '9013653', '38469': '9013654', '38471': '9013655', '38472': '9013656', '38473': '9013657', '38474': '9013658', '38475': '9013659', '38476': '9013660', '38477': '9013661', '38478': '9013662', '38481': '9013663', '38482': '9013664', '38483': '9013665', '38485': '9013666', '38486': '9013667', '38487': '9013668', '38488': '9013669', '38501': '9013670', '38504': '9013672', '38505': '9013673', '38506': '9013674', '38541': '9013675', '38542': '9013676', '38543': '9013677', '38544': '9013678', '38545': '9013679', '38547': '9013680', '38548': '9013681', '38549': '9013682', '38551': '9013683', '38552': '9013684', '38553': '9013685', '38554': '9013686', '38555': '9013687', '38556': '9013688', '38558': '9013689', '38559': '9013690', '38560': '9013691', '38562': '9013692', '38563': '9013693', '38564': '9013694', '38565': '9013695', '38567': '9013696', '38568': '9013697', '38569': '9013698', '38570': '9013699', '38571': '9013700', '38572': '9013701', '38573': '9013702', '38574': '9013703', '38575': '9013704', '38577': '9013705', '38579': '9013707', '38580': '9013708', '38581': '9013709', '38582': '9013710', '38583': '9013711', '38585': '9013712', '38587': '9013713', '38588': '9013714', '38589': '9013715', '38601': '9013716', '38603': '9013717', '38606': '9013718', '38610': '9013719', '38611': '9013720', '38614': '9013721', '38617': '9013722', '38618': '9013723', '38619': '9013724', '38620': '9013725', '38621': '9013726', '38623': '9013727', '38625': '9013728', '38626': '9013729', '38627': '9013730', '38629': '9013731', '38631': '9013732', '38632': '9013733', '38633': '9013734', '38635': '9013735', '38637': '9013736', '38641': '9013737', '38642': '9013738', '38643': '9013739', '38644': '9013740', '38645': '9013741', '38646': '9013742', '38647': '9013743', '38650': '9013744', '38651': '9013745', '38652': '9013746', '38654': '9013747', '38655': '9013748', '38658': '9013749', '38659': '9013750', '38661': '9013751', '38663': '9013752', '38664': '9013753', '38665': '9013754', '38666': '9013755', '38668': '9013756', '38670': '9013757', '38671': '9013758', '38672': '9013759', '38673': '9013760', '38674': '9013761', '38676': '9013762', '38677': '9013763', '38680': '9013764', '38683': '9013765', '38685': '9013766', '38701': '9013767', '38703': '9013768', '38720': '9013769', '38721': '9013770', '38725': '9013772', '38726': '9013773', '38730': '9013774', '38732': '9013775', '38733': '9013776', '38736': '9013777', '38737': '9013778', '38740': '9013779', '38744': '9013780', '38746': '9013781', '38748': '9013782', '38751': '9013783', '38753': '9013784', '38754': '9013785', '38756': '9013786', '38759': '9013787', '38760': '9013788', '38761': '9013789', '38762': '9013790', '38768': '9013791', '38769': '9013792', '38771': '9013793', '38772': '9013794', '38773': '9013795', '38774': '9013796', '38778': '9013797', '38801': '9013798', '38804': '9013799', '38821': '9013800', '38824': '9013801', '38826': '9013802', '38827': '9013803', '38828': '9013804', '38829': '9013805', '38833': '9013806', '38834': '9013807', '38838': '9013808', '38841': '9013809', '38843': '9013810', '38844': '9013811', '38846': '9013812', '38847': '9013813', '38848': '9013814', '38849': '9013815', '38850': '9013816', '38851': '9013817', '38852': '9013818', '38855': '9013819', '38856': '9013820', '38857': '9013821', '38858': '9013822', '38859': '9013823', '38860': '9013824', '38862': '9013825', '38863': '9013826', '38864': '9013827', '38865': '9013828', '38866': '9013829', '38868': '9013830', '38869': '9013831', '38870': '9013832', '38871': '9013833', '38873': '9013834', '38876': '9013835', '38877': '9013836', '38878': '9013837', '38901': '9013839', '38913': '9013840', '38914': '9013841', '38915': '9013842', '38916': '9013843', '38917': '9013844', '38920': '9013845', '38921': '9013846', '38922': '9013847', '38923': '9013848', '38924': '9013849', '38925': '9013850', '38927': '9013851', '38928': '9013852', '38929': '9013853', '38930': '9013854', '38940': '9013855', '38941': '9013856', '38944': '9013857', '38946': '9013858', '38948': '9013859', '38949': '9013860', '38950': '9013861', '38951': '9013862', '38952': '9013863', '38953': '9013864', '38954': '9013865', '38957': '9013866', '38961': '9013867', '38963': '9013868', '38964': '9013869', '38965': '9013870', '38967': '9013871', '39038': '9013872', '39039': '9013873', '39040': '9013874', '39041': '9013875', '39042': '9013876', '39044': '9013877', '39045': '9013878', '39046': '9013879', '39047': '9013880', '39051': '9013881', '39054': '9013882', '39056': '9013883', '39057': '9013884', '39058': '9013885', '39059': '9013886', '39063': '9013888', '39066': '9013889', '39067': '9013890', '39069': '9013891', '39071': '9013892', '39073': '9013893', '39074': '9013894', '39078': '9013895', '39079': '9013896', '39082': '9013897', '39083': '9013898', '39086': '9013899', '39088': '9013900', '39090': '9013901', '39092': '9013902', '39094': '9013903', '39095': '9013904', '39096': '9013905', '39097': '9013906', '39108': '9013907', '39110': '9013908', '39111': '9013909', '39113': '9013910', '39114': '9013911', '39116': '9013913', '39117': '9013914', '39119': '9013915', '39120': '9013916', '39140': '9013917', '39144': '9013918', '39145': '9013919', '39146': '9013920', '39149': '9013921', '39150': '9013922', '39152': '9013923', '39153': '9013924', '39154': '9013925', '39156': '9013926', '39157': '9013927', '39159': '9013928', '39160': '9013929', '39166': '9013930', '39168': '9013931', '39169': '9013932', '39170': '9013933', '39173': '9013934', '39174': '9013935', '39175': '9013936', '39176': '9013937', '39179': '9013939', '39180': '9013940', '39183': '9013941', '39189': '9013942', '39191': '9013943', '39192': '9013944', '39194': '9013945', '39201': '9013946', '39202': '9013947', '39203': '9013948', '39204': '9013949', '39206': '9013950', '39208': '9013951', '39209': '9013952', '39211': '9013953', '39212': '9013954', '39213': '9013955', '39216': '9013956', '39217': '9013957', '39218': '9013958', '39232': '9013959', '39269': '9013960', '39272': '9013961', '39301': '9013962', '39305': '9013964', '39307': '9013965', '39309': '9013966', '39320': '9013967', '39322': '9013968', '39323': '9013969', '39325': '9013970', '39326': '9013971', '39327': '9013972', '39328': '9013973', '39330': '9013974', '39332': '9013975', '39335': '9013976', '39336': '9013977', '39337': '9013978', '39338': '9013979', '39339': '9013980', '39341': '9013981', '39342': '9013982', '39345': '9013983', '39346': '9013984', '39347': '9013985', '39348': '9013986', '39350': '9013987', '39352': '9013988', '39354': '9013989', '39355': '9013990', '39356': '9013991', '39358': '9013992', '39359': '9013993', '39360': '9013994', '39361': '9013995', '39362': '9013996', '39363': '9013997', '39364': '9013998', '39365': '9013999', '39366': '9014000', '39367': '9014001', '39401': '9014002', '39402': '9014003', '39406': '9014004', '39421': '9014005', '39422': '9014006', '39423': '9014007', '39425': '9014008', '39426': '9014009', '39427': '9014010', '39428': '9014011', '39429': '9014012', '39437': '9014014', '39439': '9014015', '39440': '9014016', '39443': '9014017', '39451': '9014018', '39452': '9014019', '39455': '9014020', '39456': '9014021', '39459': '9014022', '39461': '9014023', '39462': '9014024', '39464': '9014025', '39465': '9014026', '39466': '9014027', '39470': '9014028', '39474': '9014029', '39475': '9014030', '39476': '9014031', '39478': '9014032', '39479': '9014033', '39480': '9014034', '39481': '9014035', '39482': '9014036', '39483': '9014037', '39501': '9014038', '39503': '9014039', '39507': '9014040', '39520': '9014041', '39525': '9014042', '39530': '9014044', '39531': '9014045', '39532': '9014046', '39534': '9014047', '39540': '9014048', '39553': '9014049', '39556': '9014050', '39560': '9014051', '39561': '9014052', '39562': '9014053', '39563': '9014054', '39564': '9014055', '39565': '9014056', '39567': '9014057', '39571': '9014058', '39572': '9014059', '39573': '9014060', '39574': '9014061', '39576': '9014062', '39577': '9014063', '39581': '9014064', '39601': '9014065', '39629': '9014066', '39631': '9014067', '39633': '9014069', '39638': '9014071', '39641': '9014072', '39643': '9014073', '39645': '9014074', '39647': '9014075', '39648': '9014076', '39652': '9014077', '39653': '9014078', '39654': '9014079', '39656': '9014080', '39657': '9014081', '39661': '9014082', '39662': '9014083', '39663': '9014084', '39664': '9014085', '39665': '9014086', '39666': '9014087', '39667': '9014088', '39668': '9014089', '39669': '9014090', '39701': '9014091', '39702': '9014092', '39705': '9014093', '39710': '9014094', '39730': '9014095', '39735': '9014096', '39736': '9014097', '39737': '9014098', '39739': '9014099', '39740': '9014100', '39741': '9014101', '39743': '9014102', '39744': '9014103', '39745': '9014104', '39746': '9014105', '39747': '9014106', '39750': '9014107', '39751': '9014108', '39752': '9014109', '39753': '9014110', '39755': '9014111', '39756': '9014112', '39759': '9014113', '39766': '9014116', '39767': '9014117', '39769': '9014118', '39771': '9014119', '39772': '9014120', '39773': '9014121', '39776': '9014122', '39813': '9014123', '39815': '9014124', '39817': '9014125', '39819': '9014127', '39823': '9014128', '39824': '9014129', '39825': '9014130', '39826': '9014131', '39827': '9014132', '39828': '9014133', '39834': '9014134', '39836': '9014135', '39837': '9014136', '39840': '9014137', '39841': '9014138', '39842': '9014139', '39845': '9014140', '39846': '9014141', '39851': '9014142', '39854': '9014143', '39859': '9014144', '39861': '9014145', '39862': '9014146', '39866': '9014147', '39867': '9014148', '39870': '9014149', '39877': '9014150', '39886': '9014151', '39897': '9014152', '40003': '9014153', '40004': '9014154', '40006': '9014155', '40007': '9014156', '40008': '9014157', '40009': '9014158', '40010': '9014159', '40011': '9014160', '40012': '9014161', '40013': '9014162', '40014': '9014163', '40019': '9014164', '40022': '9014166', '40023': '9014167', '40026': '9014168', '40031': '9014169', '40033': '9014170', '40036': '9014171', '40037': '9014172', '40040': '9014173', '40045': '9014174', '40046': '9014175', '40047': '9014176', '40050': '9014177', '40051': '9014178', '40052': '9014179', '40055': '9014180', '40056': '9014181', '40057': '9014182', '40059': '9014183', '40060': '9014184', '40062': '9014185', '40065': '9014186', '40067': '9014187', '40068': '9014188', '40069': '9014189', '40070': '9014190', '40071': '9014191', '40075': '9014192', '40076': '9014193', '40077': '9014194', '40078': '9014195', '40104': '9014196', '40107': '9014197', '40108': '9014198', '40109': '9014199', '40111': '9014200', '40115': '9014201', '40117': '9014202', '40118': '9014203', '40119': '9014204', '40121': '9014205', '40140': '9014206', '40142': '9014207', '40143': '9014208', '40144': '9014209', '40145': '9014210', '40146': '9014211', '40150': '9014212', '40152': '9014213', '40155': '9014214', '40157': '9014215', '40160': '9014216', '40161': '9014217', '40162': '9014218', '40165': '9014219', '40170': '9014220', '40175': '9014221', '40176': '9014222', '40177': '9014223', '40178': '9014224', '40202': '9014225', '40203': '9014226', '40204': '9014227', '40205': '9014228', '40206': '9014229', '40207': '9014230', '40208': '9014231', '40209': '9014232', '40210': '9014233', '40211': '9014234', '40212': '9014235', '40213': '9014236', '40214': '9014237', '40215': '9014238', '40216': '9014239', '40217': '9014240', '40218': '9014241', '40219': '9014242', '40220': '9014243', '40222': '9014244', '40223': '9014245', '40228': '9014246', '40229': '9014247', '40241': '9014248', '40242': '9014249', '40243': '9014250', '40245': '9014251', '40258': '9014252', '40272': '9014253', '40291': '9014254', '40299': '9014255', '40311': '9014257', '40312': '9014258', '40313': '9014259', '40322': '9014260', '40324': '9014261', '40328': '9014262', '40330': '9014263', '40336': '9014264', '40337': '9014265', '40342': '9014266', '40346': '9014267', '40347': '9014268', '40350': '9014270', '40351': '9014271', '40353': '9014272', '40356': '9014273', '40358': '9014275', '40359': '9014276', '40360': '9014277', '40361': '9014278', '40370': '9014279', '40371': '9014280', '40372': '9014281', '40374': '9014282', '40376': '9014283', '40379': '9014284', '40380': '9014285', '40383': '9014286', '40385': '9014287', '40387': '9014288', '40390': '9014289', '40391': '9014290', '40402': '9014291', '40403': '9014292', '40409': '9014293', '40419': '9014294', '40422': '9014295', '40437': '9014297', '40440': '9014298', '40442': '9014299', '40444': '9014300', '40445': '9014301', '40447': '9014302', '40456': '9014303', '40461': '9014304', '40464': '9014305', '40468': '9014306', '40472': '9014307', '40475': '9014308', '40484': '9014309', '40486': '9014310', '40489': '9014311', '40502': '9014312', '40503': '9014313', '40504': '9014314', '40505': '9014315', '40507': '9014317', '40508': '9014318', '40509': '9014319', '40510': '9014320', '40511': '9014321', '40513': '9014322', '40514': '9014323', '40515': '9014324', '40516': '9014325', '40517': '9014326', '40601': '9014329', '40701': '9014330', '40729': '9014331', '40734': '9014332', '40737': '9014333', '40740': '9014334', '40741': '9014335', '40744': '9014336', '40759': '9014337', '40763': '9014338', '40769': '9014339', '40771': '9014340', '40806': '9014342', '40808': '9014344', '40810': '9014345', '40815': '9014346', '40816': '9014347', '40818': '9014348', '40819': '9014349', '40820': '9014350', '40823': '9014351', '40826': '9014352', '40827': '9014353', '40828': '9014354', '40830': '9014355', '40831': '9014356', '40840': '9014357', '40843': '9014358', '40844': '9014359', '40855': '9014361', '40856': '9014362', '40858': '9014363', '40862': '9014364', '40863': '9014365', '40865': '9014366', '40868': '9014367', '40870': '9014368', '40873': '9014369', '40874': '9014370', '40902': '9014371', '40906': '9014372', '40915': '9014373', '40927': '9014374', '40935': '9014375', '40940': '9014376', '40962': '9014377', '40965': '9014378', '40972': '9014379', '40977': '9014380', '40979': '9014381', '40982': '9014382', '40983': '9014383', '40988': '9014384', '40997': '9014385', '41001': '9014387', '41002': '9014388', '41003': '9014389', '41004': '9014390', '41005': '9014391', '41006': '9014392', '41007': '9014393', '41008': '9014394', '41010': '9014395', '41011': '9014396', '41014': '9014397', '41015': '9014398', '41016': '9014399', '41017': '9014400', '41018': '9014401', '41030': '9014402', '41031': '9014403', '41033': '9014404', '41034': '9014405', '41035': '9014406', '41040': '9014407', '41041': '9014408', '41042': '9014409', '41043': '9014410', '41044': '9014411', '41045': '9014412', '41046': '9014413', '41048': '9014414', '41049': '9014415', '41051': '9014416', '41052': '9014417', '41055': '9014418', '41056': '9014419', '41059': '9014420', '41063': '9014421', '41064': '9014422', '41071': '9014423', '41073': '9014424', '41074': '9014425', '41075': '9014426', '41076': '9014427', '41080': '9014428', '41083': '9014429', '41085': '9014430', '41086': '9014431', '41091': '9014432', '41092': '9014433', '41093': '9014434', '41094': '9014435', '41095': '9014436', '41097': '9014437', '41098': '9014438', '41101': '9014439', '41102': '9014440', '41121': '9014441', '41124': '9014442', '41129': '9014443', '41132': '9014444', '41139': '9014446', '41141': '9014447', '41143': '9014448', '41144': '9014449', '41146': '9014450', '41149': '9014451', '41159': '9014452', '41164': '9014453', '41166': '9014454', '41168': '9014455', '41169': '9014456', '41171': '9014457', '41175': '9014458', '41179': '9014459', '41180': '9014460', '41183': '9014461', '41189': '9014462', '41201': '9014463', '41204': '9014464', '41214': '9014465', '41216': '9014466', '41219': '9014467', '41222': '9014468', '41224': '9014469', '41226': '9014470', '41230': '9014471', '41232': '9014472', '41234': '9014473', '41238': '9014474', '41240': '9014475', '41250': '9014476', '41254': '9014477', '41255': '9014478', '41256': '9014479', '41257': '9014480', '41260': '9014481', '41263': '9014482', '41264': '9014483', '41265': '9014484', '41271': '9014485', '41274': '9014486', '41301': '9014487', '41310': '9014488', '41311': '9014489', '41314': '9014490', '41317': '9014491', '41332': '9014492', '41339': '9014493', '41348': '9014494', '41360': '9014495', '41364': '9014496', '41365': '9014497', '41366': '9014498', '41367': '9014499', '41385': '9014500', '41397': '9014501', '41421': '9014502', '41425': '9014503', '41465': '9014504', '41472': '9014505', '41501': '9014506', '41503': '9014507', '41512': '9014508', '41513': '9014509', '41514': '9014510', '41519': '9014511', '41522': '9014512', '41524': '9014513', '41527': '9014514', '41528': '9014515', '41531': '9014516', '41534': '9014517', '41535': '9014518', '41537': '9014519', '41539': '9014520', '41540': '9014521', '41543': '9014522', '41544': '9014523', '41547': '9014524', '41548': '9014525', '41553': '9014526', '41554': '9014527', '41555': '9014528', '41557': '9014529', '41558': '9014530', '41559': '9014531', '41560': '9014532', '41562': '9014533', '41563': '9014534', '41564': '9014535', '41566': '9014536', '41567': '9014537', '41568': '9014538', '41571': '9014539', '41572': '9014540', '41601': '9014541', '41602': '9014542', '41603': '9014543', '41604': '9014544', '41605': '9014545', '41606': '9014546', '41607': '9014547', '41612': '9014548', '41615': '9014549', '41616': '9014550', '41619': '9014551', '41621': '9014552', '41622': '9014553', '41630': '9014554', '41635': '9014555', '41636': '9014556', '41640': '9014557', '41642': '9014558', '41645': '9014559', '41647': '9014560', '41649': '9014561', '41650': '9014562', '41651': '9014563', '41653': '9014564', '41655': '9014565', '41659': '9014566', '41663': '9014567', '41666': '9014568', '41667': '9014569', '41669': '9014570', '41701': '9014571', '41712': '9014572', '41714': '9014573', '41719': '9014574', '41721': '9014575', '41722': '9014576', '41723': '9014577', '41727': '9014578', '41729': '9014579', '41731': '9014580', '41735': '9014581', '41740': '9014582', '41745': '9014583', '41746': '9014584', '41749': '9014585', '41751': '9014586', '41754': '9014587', '41759': '9014588', '41760': '9014589', '41762': '9014590', '41763': '9014591', '41764': '9014592', '41766': '9014593', '41772': '9014594', '41773': '9014595', '41774': '9014596', '41775': '9014597', '41776': '9014598', '41777': '9014599', '41804': '9014600', '41810': '9014601', '41812': '9014602', '41815': '9014603', '41817': '9014604', '41819': '9014605', '41821': '9014606', '41822': '9014607', '41824': '9014608', '41825': '9014609', '41826': '9014610', '41828': '9014611', '41831': '9014612', '41832': '9014613', '41833': '9014614', '41834': '9014615', '41835': '9014616', '41836': '9014617', '41837': '9014618', '41838': '9014619', '41839': '9014620', '41840': '9014621', '41843': '9014622', '41844': '9014623', '41845': '9014624', '41847': '9014625', '41855': '9014627', '41858': '9014628', '41859': '9014629', '41861': '9014630', '41862': '9014631', '42001': '9014632', '42003': '9014633', '42020': '9014634', '42021': '9014635', '42022': '9014636', '42023': '9014637', '42024': '9014638', '42025': '9014639', '42027': '9014640', '42028': '9014641', '42029': '9014642', '42031': '9014643', '42032': '9014644', '42035': '9014645', '42036': '9014646', '42038': '9014648', '42039': '9014649', '42040': '9014650', '42041': '9014651', '42044': '9014652', '42045': '9014653', '42047': '9014654', '42048': '9014655', '42049': '9014656', '42050': '9014657', '42051': '9014658', '42053': '9014659', '42054': '9014660', '42055': '9014661', '42056': '9014662', '42058': '9014663', '42064': '9014665', '42066': '9014666', '42069': '9014667', '42071': '9014668', '42076': '9014669', '42078': '9014670', '42079': '9014671', '42081': '9014672', '42082': '9014673', '42083': '9014674', '42085': '9014676', '42086': '9014677', '42087': '9014678', '42088': '9014679', '42101': '9014680', '42103': '9014681', '42104': '9014682', '42120': '9014683', '42122': '9014684', '42123': '9014685', '42127': '9014686', '42129': '9014687', '42130': '9014688', '42131': '9014689', '42133': '9014690', '42134': '9014691', '42140': '9014692', '42141': '9014693', '42151': '9014694', '42153': '9014695', '42154': '9014696', '42156': '9014697', '42157': '9014698', '42159': '9014699', '42160': '9014700', '42164': '9014701', '42166': '9014702', '42167': '9014703', '42170': '9014704', '42171': '9014705', '42202': '9014706', '42204': '9014707', '42206': '9014708', '42207': '9014709', '42210': '9014710', '42211': '9014711', '42214': '9014712', '42215': '9014713', '42217': '9014714', '42220': '9014715', '42223': '9014716', '42232': '9014717', '42234': '9014718', '42236': '9014719', '42240': '9014720', '42252': '9014722', '42254': '9014723', '42256': '9014724', '42259': '9014725', '42261': '9014726', '42262': '9014727', '42265': '9014728', '42266': '9014729', '42273': '9014730', '42274': '9014731', '42275': '9014732', '42276': '9014733', '42280': '9014734', '42285': '9014735', '42286': '9014736', '42301': '9014737', '42303': '9014738', '42320': '9014739', '42321': '9014740', '42323': '9014742', '42324': '9014743', '42325': '9014744', '42326': '9014745', '42327': '9014746', '42328': '9014747', '42330': '9014748', '42333': '9014750', '42337': '9014751', '42338': '9014752', '42339': '9014753', '42343': '9014754', '42344': '9014755', '42345': '9014756', '42347': '9014757', '42348': '9014758', '42349': '9014759', '42350': '9014760', '42351': '9014761', '42352': '9014762', '42354': '9014763', '42355': '9014764', '42361': '9014765', '42366': '9014766', '42367': '9014767', '42368': '9014768', '42369': '9014769', '42371': '9014771', '42372': '9014772', '42376': '9014773', '42378': '9014774', '42404': '9014775', '42406': '9014776', '42408': '9014777', '42409': '9014778', '42410': '9014779', '42411': '9014780', '42413': '9014781', '42420': '9014782', '42431': '9014783', '42436': '9014784', '42437': '9014785', '42441': '9014787', '42442': '9014788', '42445': '9014789', '42450': '9014790', '42451': '9014791', '42452': '9014792', '42453': '9014793', '42455': '9014794', '42456': '9014795', '42458': '9014796', '42459': '9014797', '42461': '9014798', '42462': '9014799', '42464': '9014801', '42501': '9014802', '42503': '9014803', '42516': '9014804', '42518': '9014805', '42519': '9014806', '42528': '9014807', '42533': '9014808', '42539': '9014809', '42541': '9014810', '42544': '9014811', '42553': '9014812', '42565': '9014813', '42566': '9014814', '42567': '9014815', '42602': '9014816', '42603': '9014817', '42629': '9014818', '42633': '9014819', '42634': '9014820', '42635': '9014821', '42642': '9014822', '42647': '9014823', '42649': '9014824', '42653': '9014825', '42701': '9014826', '42712': '9014827', '42713': '9014828', '42715': '9014829', '42716': '9014830', '42717': '9014831', '42718': '9014832', '42721': '9014833', '42722': '9014834', '42724': '9014835', '42726': '9014836', '42728': '9014837', '42729': '9014838', '42731': '9014839', '42732': '9014840', '42733': '9014841', '42740': '9014842', '42741': '9014843', '42742': '9014844', '42743': '9014845', '42746': '9014846', '42748': '9014847', '42749': '9014848', '42753': '9014849', '42754': '9014850', '42757': '9014851', '42762': '9014852', '42764': '9014853', '42765': '9014854', '42776': '9014855', '42782': '9014856', '42784': '9014857', '42788': '9014858', '43001': '9014859', '43003': '9014860', '43004': '9014861', '43006': '9014863', '43008': '9014864', '43009': '9014865', '43011': '9014867', '43013': '9014868', '43014': '9014869', '43015': '9014870', '43016': '9014871', '43017': '9014872', '43018': '9014873', '43019': '9014874', '43021': '9014875', '43022': '9014876', '43023': '9014877', '43025': '9014878', '43026': '9014879', '43028': '9014881', '43029': '9014882', '43031': '9014883', '43035': '9014885', '43037': '9014887', '43040': '9014888', '43044': '9014889', '43045': '9014890', '43046': '9014891', '43047': '9014892', '43050': '9014893', '43054': '9014894', '43055': '9014895', '43056': '9014896', '43060': '9014897', '43061': '9014898', '43062': '9014899', '43064': '9014900', '43065': '9014901', '43066': '9014902', '43067': '9014903', '43068': '9014904', '43071': '9014906', '43072': '9014907', '43074': '9014908', '43076': '9014909', '43078': '9014911', '43080': '9014912', '43081': '9014913', '43082': '9014914', '43084': '9014915', '43085': '9014916', '43102': '9014917', '43103': '9014918', '43105': '9014919', '43106': '9014920', '43107': '9014921', '43110': '9014923', '43112': '9014925', '43113': '9014926', '43115': '9014927', '43116': '9014928', '43119': '9014929', '43123': '9014930', '43125': '9014931', '43127': '9014933', '43128': '9014934', '43130': '9014935', '43135': '9014936', '43136': '9014937', '43137': '9014938', '43138': '9014939', '43140': '9014940', '43143': '9014942', '43145': '9014944', '43146': '9014945', '43147': '9014946', '43148': '9014947', '43149': '9014948', '43150': '9014949', '43152': '9014951', '43153': '9014952', '43154': '9014953', '43155': '9014954', '43160': '9014958', '43162': '9014959', '43164': '9014960', '43201': '9014961', '43202': '9014962', '43203': '9014963', '43204': '9014964', '43205': '9014965', '43206': '9014966', '43207': '9014967', '43209': '9014968', '43210': '9014969', '43211': '9014970', '43212': '9014971', '43213': '9014972', '43214': '9014973', '43215': '9014974', '43217': '9014975', '43218': '9014976', '43219': '9014977', '43220': '9014978', '43221': '9014979', '43222': '9014980', '43223': '9014981', '43224': '9014982', '43227': '9014983', '43228': '9014984', '43229': '9014985', '43230': '9014986', '43231': '9014987', '43232': '9014988', '43235': '9014989', '43240': '9014990', '43302': '9014991', '43310': '9014992', '43311': '9014993', '43314': '9014994', '43315': '9014995', '43316': '9014996', '43318': '9014998', '43319': '9014999', '43320': '9015000', '43321': '9015001', '43323': '9015002', '43324': '9015003', '43325': '9015004', '43326': '9015005', '43331': '9015007', '43332': '9015008', '43333': '9015009', '43334': '9015010', '43337': '9015012', '43338': '9015013', '43340': '9015014', '43341': '9015015', '43342': '9015016', '43343': '9015017', '43344': '9015018', '43345': '9015019', '43347': '9015020', '43348': '9015021', '43351': '9015022', '43356': '9015023', '43357': '9015024', '43358': '9015025', '43359': '9015026', '43360': '9015027', '43402': '9015028', '43403': '9015029', '43406': '9015030', '43407': '9015031', '43410': '9015033', '43412': '9015034', '43413': '9015035', '43416': '9015036', '43420': '9015037', '43430': '9015038', '43431': '9015039', '43432': '9015040', '43435': '9015041', '43436': '9015042', '43438': '9015044', '43440': '9015045', '43442': '9015046', '43443': '9015047', '43445': '9015048', '43446': '9015049', '43447': '9015050', '43449': '9015051', '43450': '9015052', '43451': '9015053', '43452': '9015054', '43456': '9015055', '43457': '9015056', '43460': '9015057', '43462': '9015058', '43464': '9015059', '43465': '9015060', '43466': '9015061', '43469': '9015063', '43501': '9015064', '43502': '9015065', '43504': '9015066', '43506': '9015068', '43511': '9015070', '43512': '9015071', '43515': '9015072', '43516': '9015073', '43517': '9015074', '43518': '9015075', '43521': '9015076', '43522': '9015077', '43524': '9015078', '43525': '9015079', '43526': '9015080', '43527': '9015081', '43528': '9015082', '43532': '9015085', '43533': '9015086', '43534': '9015087', '43535': '9015088', '43536': '9015089', '43537': '9015090', '43540': '9015091', '43541': '9015092', '43542': '9015093', '43543': '9015094', '43545': '9015095', '43548': '9015097', '43549': '9015098', '43551': '9015099', '43554': '9015101', '43556': '9015102', '43557': '9015103', '43558': '9015104', '43560': '9015105', '43566': '9015107', '43567': '9015108', '43569': '9015109', '43570': '9015110', '43571': '9015111', '43601': '9015112', '43604': '9015113', '43605': '9015114', '43606': '9015115', '43607': '9015116', '43608': '9015117', '43609': '9015118', '43610': '9015119', '43611': '9015120', '43612': '9015121', '43613': '9015122', '43614': '9015123', '43615': '9015124', '43616': '9015125', '43617': '9015126', '43619': '9015127', '43620': '9015128', '43623': '9015129', '43701': '9015130', '43713': '9015131', '43716': '9015132', '43718': '9015133', '43719': '9015134', '43720': '9015135', '43723': '9015137', '43724': '9015138', '43725': '9015139', '43727': '9015140', '43728': '9015141', '43730': '9015142', '43731': '9015143', '43732': '9015144', '43733': '9015145', '43734': '9015146', '43739': '9015148', '43746': '9015150', '43747': '9015151', '43748': '9015152', '43749': '9015153', '43754': '9015154', '43755': '9015155', '43756': '9015156', '43758': '9015157', '43760': '9015158', '43762': '9015159', '43764': '9015160', '43766': '9015161', '43767': '9015162', '43771': '9015163', '43772': '9015164', '43773': '9015165', '43777': '9015166', '43778': '9015167', '43779': '9015168', '43780': '9015169', '43782': '9015170', '43783': '9015171', '43786': '9015172', '43787': '9015173', '43788': '9015174', '43791': '9015175', '43793': '9015176', '43802': '9015177', '43804': '9015178', '43805': '9015179', '43811': '9015180', '43812': '9015181', '43821': '9015182', '43822': '9015183', '43824': '9015184', '43830': '9015185', '43832': '9015186', '43836': '9015187', '43837': '9015188', '43840': '9015189', '43842': '9015190', '43843': '9015191', '43844': '9015192', '43845': '9015193', '43901': '9015194', '43902': '9015195', '43903': '9015196', '43906': '9015197', '43907': '9015198', '43908': '9015199', '43910': '9015201', '43912': '9015202', '43913': '9015203', '43915': '9015205', '43917': '9015206', '43920': '9015207', '43926': '9015209', '43930': '9015212', '43931': '9015213', '43932': '9015214', '43933': '9015215', '43935': '9015217', '43938': '9015218', '43942': '9015221', '43943': '9015222', '43944': '9015223', '43945': '9015224', '43946': '9015225', '43947': '9015226', '43950': '9015228', '43952': '9015230', '43953': '9015231', '43961': '9015232', '43963': '9015234', '43964': '9015235', '43968': '9015236', '43971': '9015237', '43973': '9015238', '43976': '9015239', '43977': '9015240', '43983': '9015242', '43986': '9015243', '43988': '9015244', '44001': '9015245', '44003': '9015246', '44004': '9015247', '44010': '9015248', '44011': '9015249', '44012': '9015250', '44017': '9015251', '44021': '9015252', '44022': '9015253', '44023': '9015254', '44024': '9015255', '44026': '9015256', '44028': '9015257', '44030': '9015258', '44032': '9015259', '44035': '9015260', '44039': '9015261', '44040': '9015262', '44041': '9015263', '44044': '9015264', '44046': '9015266', '44047': '9015267', '44048': '9015268', '44050': '9015269', '44052': '9015270', '44053': '9015271', '44054': '9015272', '44055': '9015273', '44056': '9015274', '44057': '9015275', '44060': '9015276', '44062': '9015277', '44064': '9015278', '44065': '9015279', '44067': '9015280', '44070': '9015282', '44072': '9015283', '44074': '9015284', '44076': '9015285', '44077': '9015286', '44081': '9015287', '44082': '9015288', '44084': '9015289', '44085': '9015290', '44086': '9015291', '44087': '9015292', '44089': '9015293', '44090': '9015294', '44092': '9015295', '44093': '9015296', '44094': '9015297', '44095': '9015298', '44099': '9015299', '44102': '9015301', '44103': '9015302', '44104': '9015303', '44105': '9015304', '44106': '9015305', '44107': '9015306', '44108': '9015307', '44109': '9015308', '44110': '9015309', '44111': '9015310', '44112': '9015311', '44113': '9015312', '44114': '9015313', '44115': '9015314', '44116': '9015315', '44117': '9015316', '44118': '9015317', '44119': '9015318', '44120': '9015319', '44121': '9015320', '44122': '9015321', '44123': '9015322', '44124': '9015323', '44125': '9015324', '44126': '9015325', '44127': '9015326', '44128': '9015327', '44129': '9015328', '44130': '9015329', '44131': '9015330', '44132': '9015331', '44133': '9015332', '44134': '9015333', '44135': '9015334', '44136': '9015335', '44137': '9015336', '44138': '9015337', '44139': '9015338', '44140': '9015339', '44141': '9015340', '44142': '9015341', '44143': '9015342', '44144': '9015343', '44145': '9015344', '44146': '9015345', '44147': '9015346', '44149': '9015347', '44201': '9015349', '44202': '9015350', '44203': '9015351', '44212': '9015354', '44214': '9015355', '44215': '9015356', '44216': '9015357', '44217': '9015358', '44221': '9015359', '44223': '9015360', '44224': '9015361', '44230': '9015362', '44231': '9015363', '44233': '9015364', '44234': '9015365', '44235': '9015366', '44236': '9015367', '44237': '9015368', '44240': '9015369', '44241': '9015370', '44243': '9015372', '44251': '9015374', '44253': '9015375', '44254': '9015376', '44255': '9015377', '44256': '9015378', '44260': '9015379', '44262': '9015380', '44264': '9015381', '44266': '9015383', '44270': '9015384', '44272': '9015385', '44273': '9015386', '44275': '9015388', '44276': '9015389', '44278': '9015390', '44280': '9015391', '44281': '9015392', '44286': '9015393', '44287': '9015394', '44288': '9015395', '44301': '9015396', '44302': '9015397', '44303': '9015398', '44304': '9015399', '44305': '9015400', '44306': '9015401', '44307': '9015402', '44308': '9015403', '44310': '9015405', '44311': '9015406', '44312': '9015407', '44313': '9015408', '44314': '9015409', '44319': '9015410', '44320': '9015411', '44321': '9015412', '44325': '9015413', '44333': '9015414', '44401': '9015415', '44402': '9015416', '44403': '9015417', '44404': '9015418', '44405': '9015419', '44406': '9015420', '44408': '9015421', '44410': '9015422', '44411': '9015423', '44412': '9015424', '44413': '9015425', '44417': '9015426', '44418': '9015427', '44420': '9015428', '44423': '9015429', '44425': '9015430', '44427': '9015431', '44428': '9015432', '44429': '9015433', '44430': '9015434', '44431': '9015435', '44432': '9015436', '44436': '9015437', '44437': '9015438', '44438': '9015439', '44440': '9015440', '44441': '9015441', '44442': '9015442', '44443': '9015443', '44444': '9015444', '44445': '9015445', '44446': '9015446', '44449': '9015447', '44450': '9015448', '44451': '9015449', '44452': '9015450', '44454': '9015451', '44455': '9015452', '44460': '9015453', '44470': '9015454', '44471': '9015455', '44473': '9015456', '44481': '9015457', '44483': '9015458', '44484': '9015459', '44485': '9015460', '44490': '9015461', '44491': '9015462', '44502': '9015465', '44503': '9015466', '44504': '9015467', '44505': '9015468', '44506': '9015469', '44507': '9015470', '44509': '9015471', '44510': '9015472', '44511': '9015473', '44512': '9015474', '44514': '9015475', '44515': '9015476', '44555': '9015477', '44601': '9015478', '44606': '9015479', '44608': '9015480', '44609': '9015481', '44611': '9015483', '44612': '9015484', '44613': '9015485', '44614': '9015486', '44615': '9015487', '44618': '9015488', '44620': '9015489', '44621': '9015490', '44622': '9015491', '44624': '9015492', '44625': '9015493', '44626': '9015494', '44627': '9015495', '44628': '9015496', '44629': '9015497', '44632': '9015498', '44633': '9015499', '44634': '9015500', '44637': '9015501', '44638': '9015502', '44641': '9015504', '44643': '9015505', '44644': '9015506', '44645': '9015507', '44646': '9015508', '44647': '9015509', '44651': '9015510', '44654': '9015512', '44656': '9015513', '44657': '9015514', '44662': '9015517', '44663': '9015518', '44666': '9015519', '44667': '9015520', '44669': '9015521', '44672': '9015523', '44675': '9015524', '44676': '9015525', '44677': '9015526', '44680': '9015527', '44681': '9015528', '44683': '9015530', '44685': '9015531', '44688': '9015533', '44689': '9015534', '44691': '9015535', '44695': '9015537', '44699': '9015538', '44702': '9015539', '44703': '9015540', '44704': '9015541', '44705': '9015542', '44706': '9015543', '44707': '9015544', '44708': '9015545', '44709': '9015546', '44710': '9015547', '44711': '9015548', '44714': '9015549', '44718': '9015550', '44720': '9015551', '44721': '9015552', '44730': '9015553', '44767': '9015554', '44802': '9015555', '44804': '9015556', '44805': '9015557', '44807': '9015558', '44811': '9015560', '44813': '9015561', '44814': '9015562', '44815': '9015563', '44817': '9015564', '44818': '9015565', '44820': '9015566', '44822': '9015567', '44824': '9015568', '44826': '9015570', '44827': '9015571', '44830': '9015573', '44833': '9015574', '44836': '9015575', '44837': '9015576', '44839': '9015578', '44840': '9015579', '44841': '9015580', '44842': '9015581', '44843': '9015582', '44844': '9015583', '44846': '9015584', '44847': '9015585', '44849': '9015587', '44851': '9015589', '44853': '9015590', '44854': '9015591', '44855': '9015592', '44857': '9015594', '44859': '9015595', '44861': '9015597', '44864': '9015598', '44865': '9015599', '44866': '9015600', '44867': '9015601', '44870': '9015602', '44875': '9015604', '44878': '9015605', '44880': '9015606', '44882': '9015607', '44883': '9015608', '44887': '9015609', '44889': '9015610', '44890': '9015611', '44902': '9015613', '44903': '9015614', '44904': '9015615', '44905': '9015616', '44906': '9015617', '44907': '9015618', '45001': '9015619', '45002': '9015620', '45003': '9015621', '45005': '9015622', '45011': '9015623', '45013': '9015624', '45014': '9015625', '45015': '9015626', '45030': '9015627', '45033': '9015628', '45034': '9015629', '45036': '9015630', '45039': '9015631', '45040': '9015632', '45042': '9015634', '45044': '9015635', '45050': '9015636', '45052': '9015637', '45053': '9015638', '45054': '9015639', '45056': '9015640', '45064': '9015641', '45065': '9015642', '45066': '9015643', '45067': '9015644', '45068': '9015645', '45069': '9015646', '45070': '9015647', '45101': '9015648', '45102': '9015649', '45103': '9015650', '45106': '9015651', '45107': '9015652', '45111': '9015653', '45113': '9015655', '45118': '9015657', '45120': '9015659', '45121': '9015660', '45122': '9015661', '45123': '9015662', '45130': '9015663', '45131': '9015664', '45133': '9015666', '45135': '9015667', '45140': '9015669', '45142': '9015670', '45144': '9015671', '45146': '9015673', '45148': '9015675', '45150': '9015676', '45152': '9015677', '45153': '9015678', '45154': '9015679', '45155': '9015680', '45157': '9015682', '45159': '9015684', '45160': '9015685', '45162': '9015686', '45164': '9015687', '45167': '9015688', '45168': '9015689', '45169': '9015690', '45171': '9015691', '45174': '9015692', '45176': '9015693', '45177': '9015694', '45202': '9015695', '45203': '9015696', '45204': '9015697', '45205': '9015698', '45206': '9015699', '45207': '9015700', '45208': '9015701', '45209': '9015702', '45211': '9015703', '45212': '9015704', '45213': '9015705', '45214': '9015706', '45215': '9015707', '45216': '9015708', '45217': '9015709', '45218': '9015710', '45219': '9015711', '45220': '9015712', '45223': '9015713', '45224': '9015714', '45225': '9015715', '45226': '9015716', '45227': '9015717', '45229': '9015719', '45230': '9015720', '45231': '9015721', '45232': '9015722', '45233': '9015723', '45236': '9015725', '45237': '9015726', '45238': '9015727', '45239': '9015728', '45240': '9015729', '45241': '9015730', '45242': '9015731', '45243': '9015732', '45244': '9015733', '45245': '9015734', '45246': '9015735', '45247': '9015736', '45248': '9015737', '45249': '9015738', '45251': '9015739', '45252': '9015740', '45255': '9015741', '45302': '9015743', '45303': '9015744', '45304': '9015745', '45305': '9015746', '45306': '9015747', '45308': '9015749', '45309': '9015750', '45311': '9015752', '45312': '9015753', '45314': '9015754', '45315': '9015755', '45317': '9015757', '45318': '9015758', '45319': '9015759', '45320': '9015760', '45321': '9015761', '45322': '9015762', '45323': '9015763', '45324': '9015764', '45325': '9015765', '45326': '9015766', '45327': '9015767', '45331': '9015770', '45332': '9015771', '45333': '9015772', '45334': '9015773', '45335': '9015774', '45337': '9015776', '45338': '9015777', '45339': '9015778', '45340': '9015779', '45341': '9015780', '45342': '9015781', '45344': '9015782', '45345': '9015783', '45346': '9015784', '45347': '9015785', '45348': '9015786', '45356': '9015792', '45359': '9015794', '45362': '9015797', '45363': '9015798', '45365': '9015799', '45367': '9015800', '45368': '9015801', '45369': '9015802', '45370': '9015803', '45371': '9015804', '45373': '9015806', '45377': '9015807', '45380': '9015809', '45381': '9015810', '45382': '9015811', '45383': '9015812', '45384': '9015813', '45385': '9015814', '45387': '9015815', '45388': '9015816', '45390': '9015818', '45402': '9015820', '45403': '9015821', '45404': '9015822', '45405': '9015823', '45406': '9015824', '45409': '9015826', '45410': '9015827', '45414': '9015828', '45415': '9015829', '45416': '9015830', '45417': '9015831', '45419': '9015833', '45420': '9015834', '45422': '9015835', '45423': '9015836', '45424': '9015837', '45426': '9015838', '45429': '9015841', '45430': '9015842', '45431': '9015843', '45432': '9015844', '45433': '9015845', '45434': '9015846', '45439': '9015847', '45440': '9015848', '45449': '9015849', '45458': '9015850', '45459': '9015851', '45479': '9015853', '45502': '9015854', '45503': '9015855', '45504': '9015856', '45505': '9015857', '45506': '9015858', '45601': '9015859', '45612': '9015860', '45613': '9015861', '45614': '9015862', '45616': '9015863', '45619': '9015865', '45620': '9015866', '45622': '9015868', '45623': '9015869', '45628': '9015871', '45629': '9015872', '45631': '9015873', '45634': '9015874', '45638': '9015875', '45640': '9015876', '45644': '9015877', '45645': '9015878', '45646': '9015879', '45647': '9015880', '45648': '9015881', '45650': '9015882', '45651': '9015883', '45652': '9015884', '45653': '9015885', '45654': '9015886', '45656': '9015887', '45657': '9015888', '45658': '9015889', '45659': '9015890', '45660': '9015891', '45661': '9015892', '45662': '9015893', '45663': '9015894', '45669': '9015895', '45671': '9015896', '45672': '9015897', '45673': '9015898', '45678': '9015900', '45679': '9015901', '45680': '9015902', '45681': '9015903', '45682': '9015904', '45684': '9015905', '45685': '9015906', '45686': '9015907', '45688': '9015908', '45690': '9015909', '45692': '9015910', '45693': '9015911', '45694': '9015912', '45695': '9015913', '45696': '9015914', '45697': '9015915', '45698': '9015916', '45701': '9015917', '45710': '9015918', '45711': '9015919', '45714': '9015920', '45715': '9015921', '45716': '9015922', '45719': '9015923', '45723': '9015924', '45724': '9015925', '45727': '9015926', '45732': '9015927', '45734': '9015928', '45735': '9015929', '45741': '9015930', '45742': '9015931', '45743': '9015932', '45744': '9015933', '45745': '9015934', '45746': '9015935', '45750': '9015936', '45760': '9015937', '45761': '9015938', '45764': '9015939', '45766': '9015940', '45767': '9015941', '45768': '9015942', '45769': '9015943', '45770': '9015944', '45771': '9015945', '45772': '9015946', '45773': '9015947', '45775': '9015948', '45776': '9015949', '45778': '9015950', '45780': '9015952', '45784': '9015955', '45786': '9015956', '45788': '9015957', '45789': '9015958', '45801': '9015959', '45804': '9015960', '45805': '9015961', '45806': '9015962', '45807': '9015963', '45808': '9015964', '45809': '9015965', '45810': '9015966', '45812': '9015967', '45813': '9015968', '45814': '9015969', '45817': '9015971', '45819': '9015972', '45821': '9015974', '45822': '9015975', '45827': '9015976', '45828': '9015977', '45830': '9015978', '45831': '9015979', '45832': '9015980', '45833': '9015981', '45835': '9015982', '45836': '9015983', '45840': '9015985', '45841': '9015986', '45843': '9015987', '45844': '9015988', '45845': '9015989', '45846': '9015990', '45849': '9015991', '45850': '9015992', '45851': '9015993', '45856': '9015997', '45858': '9015998', '45859': '9015999', '45860': '9016000', '45862': '9016002', '45863': '9016003', '45865': '9016005', '45867': '9016007', '45868': '9016008', '45869': '9016009', '45871': '9016011', '45872': '9016012', '45873': '9016013', '45874': '9016014', '45875': '9016015', '45877': '9016017', '45879': '9016018', '45880': '9016019', '45881': '9016020', '45882': '9016021', '45883': '9016022', '45885': '9016023', '45886': '9016024', '45887': '9016025', '45889': '9016026', '45890': '9016027', '45891': '9016028', '45894': '9016030', '45895': '9016031', '45896': '9016032', '45897': '9016033', '45898': '9016034', '46001': '9016036', '46011': '9016037', '46012': '9016038', '46013': '9016039', '46016': '9016040', '46017': '9016041', '46030': '9016042', '46031': '9016043', '46032': '9016044', '46033': '9016045', '46034': '9016046', '46035': '9016047', '46036': '9016048', '46037': '9016049', '46038': '9016050', '46039': '9016051', '46040': '9016052', '46041': '9016053', '46044': '9016054', '46048': '9016056', '46049': '9016057', '46050': '9016058', '46051': '9016059', '46052': '9016060', '46055': '9016061', '46056': '9016062', '46057': '9016063', '46058': '9016064', '46060': '9016065', '46062': '9016066', '46064': '9016067', '46065': '9016068', '46068': '9016069', '46069': '9016070', '46070': '9016071', '46071': '9016072', '46072': '9016073', '46074': '9016074', '46075': '9016075', '46076': '9016076', '46077': '9016077', '46102': '9016078', '46104': '9016080', '46105': '9016081', '46106': '9016082', '46107': '9016083', '46110': '9016084', '46111': '9016085', '46112': '9016086', '46113': '9016087', '46115': '9016088', '46117': '9016089', '46118': '9016090', '46120': '9016091', '46121': '9016092', '46122': '9016093', '46123': '9016094', '46124': '9016095', '46126': '9016096', '46127': '9016097', '46128': '9016098', '46130': '9016099', '46131': '9016100', '46133': '9016101', '46135': '9016102', '46140': '9016103', '46142': '9016104', '46143': '9016105', '46146': '9016107', '46147': '9016108', '46148': '9016109', '46149': '9016110', '46150': '9016111', '46151': '9016112', '46156': '9016114', '46157': '9016115', '46158': '9016116', '46160': '9016117', '46161': '9016118', '46162': '9016119', '46163': '9016120', '46164': '9016121', '46165': '9016122', '46166': '9016123', '46167': '9016124', '46168': '9016125', '46171': '9016126', '46172': '9016127', '46173': '9016128', '46175': '9016129', '46176': '9016130', '46180': '9016131', '46181': '9016132', '46182': '9016133', '46184': '9016134', '46186': '9016135', '46201': '9016136', '46202': '9016137', '46203': '9016138', '46204': '9016139', '46205': '9016140', '46208': '9016142', '46214': '9016144', '46216': '9016145', '46217': '9016146', '46218': '9016147', '46219': '9016148', '46220': '9016149', '46221': '9016150', '46222': '9016151', '46224': '9016152', '46225': '9016153', '46226': '9016154', '46227': '9016155', '46228': '9016156', '46229': '9016157', '46231': '9016158', '46234': '9016159', '46235': '9016160', '46236': '9016161', '46237': '9016162', '46239': '9016163', '46240': '9016164', '46241': '9016165', '46249': '9016166', '46250': '9016167', '46254': '9016168', '46256': '9016170', '46259': '9016171', '46260': '9016172', '46268': '9016173', '46278': '9016174', '46280': '9016175', '46285': '9016176', '46290': '9016177', '46303': '9016180', '46304': '9016181', '46307': '9016182', '46310': '9016183', '46311': '9016184', '46312': '9016185', '46319': '9016186', '46320': '9016187', '46321': '9016188', '46322': '9016189', '46323': '9016190', '46324': '9016191', '46327': '9016192', '46340': '9016193', '46341': '9016194', '46342': '9016195', '46347': '9016197', '46348': '9016198', '46349': '9016199', '46350': '9016200', '46356': '9016201', '46360': '9016202', '46365': '9016203', '46366': '9016204', '46368': '9016205', '46371': '9016206', '46373': '9016207', '46374': '9016208', '46375': '9016209', '46376': '9016210', '46382': '9016211', '46383': '9016212', '46385': '9016213', '46390': '9016214', '46391': '9016215', '46392': '9016216', '46394': '9016217', '46402': '9016219', '46403': '9016220', '46404': '9016221', '46405': '9016222', '46406': '9016223', '46407': '9016224', '46408': '9016225', '46409': '9016226', '46410': '9016227', '46501': '9016228', '46504': '9016230', '46506': '9016231', '46507': '9016232', '46508': '9016233', '46510': '9016234', '46511': '9016235', '46514': '9016237', '46516': '9016238', '46517': '9016239', '46524': '9016240', '46526': '9016241', '46528': '9016242', '46530': '9016243', '46531': '9016244', '46532': '9016245', '46534': '9016246', '46536': '9016247', '46538': '9016249', '46539': '9016250', '46540': '9016251', '46542': '9016252', '46543': '9016253', '46544': '9016254', '46545': '9016255', '46550': '9016256', '46552': '9016257', '46553': '9016258', '46554': '9016259', '46555': '9016260', '46556': '9016261', '46561': '9016262', '46562': '9016263', '46563': '9016264', '46565': '9016265', '46567': '9016266', '46570': '9016267', '46571': '9016268', '46573': '9016269', '46574': '9016270', '46580': '9016271', '46582': '9016272', '46590': '9016273', '46601': '9016275', '46613': '9016276', '46614': '9016277', '46615': '9016278', '46616': '9016279', '46617': '9016280', '46619': '9016281', '46626': '9016282', '46628': '9016283', '46635': '9016284', '46637': '9016285', '46701': '9016286', '46702': '9016287', '46703': '9016288', '46705': '9016289', '46706': '9016290', '46710': '9016291', '46711': '9016292', '46714': '9016293', '46721': '9016294', '46723': '9016295', '46725': '9016296', '46730': '9016297', '46731': '9016298', '46732': '9016299', '46733': '9016300', '46737': '9016301', '46738': '9016302', '46740': '9016303', '46741': '9016304', '46742': '9016305', '46743': '9016306', '46745': '9016307', '46746': '9016308', '46747': '9016309', '46748': '9016310', '46750': '9016311', '46755': '9016312', '46759': '9016313', '46760': '9016314', '46761': '9016315', '46763': '9016316', '46764': '9016317', '46765': '9016318', '46766': '9016319', '46767': '9016320', '46770': '9016321', '46771': '9016322', '46772': '9016323', '46773': '9016324', '46774': '9016325', '46776': '9016326', '46777': '9016327', '46779': '9016328', '46781': '9016329', '46783': '9016330', '46784': '9016331', '46785': '9016332', '46787': '9016333', '46788': '9016334', '46791': '9016335', '46792': '9016336', '46793': '9016337', '46794': '9016338', '46795': '9016339', '46797': '9016340', '46798': '9016341', '46802': '9016342', '46803': '9016343', '46804': '9016344', '46805': '9016345', '46806': '9016346', '46807': '9016347', '46808': '9016348', '46809': '9016349', '46814': '9016350', '46815': '9016351', '46816': '9016352', '46818': '9016353', '46819': '9016354', '46825': '9016355', '46835': '9016356', '46845': '9016357', '46901': '9016358', '46902': '9016359', '46910': '9016360', '46911': '9016361', '46913': '9016362', '46914': '9016363', '46915': '9016364', '46917': '9016365', '46919': '9016366', '46920': '9016367', '46923': '9016368', '46926': '9016369', '46928': '9016370', '46929': '9016371', '46930': '9016372', '46932': '9016373', '46933': '9016374', '46936': '9016375', '46938': '9016376', '46939': '9016377', '46940': '9016378', '46941': '9016379', '46943': '9016380', '46946': '9016381', '46947': '9016382', '46950': '9016383', '46951': '9016384', '46952': '9016385', '46953': '9016386', '46958': '9016388', '46959': '9016389', '46960': '9016390', '46961': '9016391', '46962': '9016392', '46970': '9016394', '46974': '9016395', '46975': '9016396', '46978': '9016397', '46979': '9016398', '46982': '9016399', '46985': '9016400', '46986': '9016401', '46988': '9016402', '46989': '9016403', '46990': '9016404', '46991': '9016405', '46992': '9016406', '46994': '9016407', '46996': '9016408', '47001': '9016409', '47003': '9016410', '47006': '9016411', '47010': '9016412', '47011': '9016413', '47012': '9016414', '47016': '9016415', '47017': '9016416', '47018': '9016417', '47020': '9016418', '47022': '9016419', '47023': '9016420', '47024': '9016421', '47025': '9016422', '47030': '9016423', '47031': '9016424', '47032': '9016425', '47036': '9016427', '47037': '9016428', '47038': '9016429', '47040': '9016430', '47041': '9016431', '47042': '9016432', '47043': '9016433', '47060': '9016434', '47102': '9016435', '47104': '9016436', '47106': '9016437', '47108': '9016438', '47110': '9016439', '47111': '9016440', '47112': '9016441', '47114': '9016442', '47115': '9016443', '47116': '9016444', '47117': '9016445', '47118': '9016446', '47119': '9016447', '47120': '9016448', '47122': '9016449', '47123': '9016450', '47124': '9016451', '47125': '9016452', '47126': '9016453', '47129': '9016454', '47130': '9016455', '47135': '9016456', '47136': '9016457', '47137': '9016458', '47138': '9016459', '47140': '9016460', '47141': '9016461', '47142': '9016462', '47143': '9016463', '47145': '9016464', '47147': '9016465', '47150': '9016466', '47160': '9016467', '47161': '9016468', '47162': '9016469', '47163': '9016470', '47164': '9016471', '47165': '9016472', '47166': '9016473', '47167': '9016474', '47170': '9016475', '47172': '9016476', '47174': '9016477', '47175': '9016478', '47177': '9016479', '47201': '9016480', '47203': '9016481', '47220': '9016482', '47223': '9016483', '47224': '9016484', '47227': '9016486', '47229': '9016487', '47230': '9016488', '47231': '9016489', '47232': '9016490', '47234': '9016491', '47235': '9016492', '47236': '9016493', '47240': '9016494', '47243': '9016495', '47244': '9016496', '47246': '9016497', '47247': '9016498', '47250': '9016499', '47260': '9016500', '47264': '9016501', '47265': '9016502', '47270': '9016503', '47272': '9016504', '47273': '9016505', '47274': '9016506', '47280': '9016507', '47281': '9016508', '47283': '9016509', '47302': '9016510', '47303': '9016511', '47304': '9016512', '47305': '9016513', '47306': '9016514', '47320': '9016515', '47325': '9016517', '47326': '9016518', '47327': '9016519', '47330': '9016520', '47331': '9016521', '47334': '9016522', '47336': '9016523', '47338': '9016525', '47339': '9016526', '47340': '9016527', '47341': '9016528', '47342': '9016529', '47345': '9016531', '47346': '9016532', '47348': '9016533', '47352': '9016535', '47353': '9016536', '47354': '9016537', '47355': '9016538', '47356': '9016539', '47357': '9016540', '47358': '9016541', '47359': '9016542', '47360': '9016543', '47362': '9016544', '47368': '9016545', '47369': '9016546', '47371': '9016547', '47373': '9016548', '47374': '9016549', '47380': '9016550', '47381': '9016551', '47383': '9016553', '47384': '9016554', '47385': '9016555', '47386': '9016556', '47387': '9016557', '47390': '9016559', '47393': '9016560', '47394': '9016561', '47396': '9016562', '47401': '9016563', '47403': '9016564', '47404': '9016565', '47405': '9016566', '47406': '9016567', '47408': '9016568', '47421': '9016569', '47424': '9016570', '47427': '9016571', '47429': '9016572', '47431': '9016573', '47432': '9016574', '47433': '9016575', '47436': '9016576', '47438': '9016577', '47441': '9016578', '47443': '9016579', '47446': '9016580', '47448': '9016581', '47449': '9016582', '47451': '9016583', '47452': '9016584', '47453': '9016585', '47454': '9016586', '47456': '9016587', '47459': '9016588', '47460': '9016589', '47462': '9016590', '47465': '9016592', '47468': '9016593', '47469': '9016594', '47470': '9016595', '47471': '9016596', '47501': '9016597', '47512': '9016598', '47513': '9016599', '47514': '9016600', '47515': '9016601', '47516': '9016602', '47519': '9016603', '47520': '9016604', '47521': '9016605', '47522': '9016606', '47523': '9016607', '47524': '9016608', '47525': '9016609', '47527': '9016610', '47528': '9016611', '47529': '9016612', '47531': '9016613', '47532': '9016614', '47537': '9016616', '47541': '9016617', '47542': '9016618', '47546': '9016619', '47549': '9016620', '47550': '9016621', '47551': '9016622', '47552': '9016623', '47553': '9016624', '47557': '9016625', '47558': '9016626', '47561': '9016627', '47562': '9016628', '47564': '9016629', '47567': '9016630', '47568': '9016631', '47573': '9016632', '47574': '9016633', '47575': '9016634', '47576': '9016635', '47577': '9016636', '47578': '9016637', '47579': '9016638', '47580': '9016639', '47581': '9016640', '47585': '9016642', '47586': '9016643', '47588': '9016644', '47590': '9016645', '47591': '9016646', '47597': '9016647', '47598': '9016648', '47601': '9016649', '47610': '9016650', '47611': '9016651', '47612': '9016652', '47613': '9016653', '47615': '9016654', '47616': '9016655', '47619': '9016656', '47620': '9016657', '47630': '9016658', '47631': '9016659', '47633': '9016660', '47634': '9016661', '47635': '9016662', '47637': '9016663', '47638': '9016664', '47639': '9016665', '47640': '9016666', '47648': '9016667', '47649': '9016668', '47660': '9016669', '47665': '9016670', '47666': '9016671', '47670': '9016672', '47708': '9016673', '47710': '9016674', '47711': '9016675', '47712': '9016676', '47713': '9016677', '47714': '9016678', '47715': '9016679', '47720': '9016680', '47725': '9016681', '47802': '9016682', '47803': '9016683', '47804': '9016684', '47805': '9016685', '47807': '9016686', '47809': '9016687', '47832': '9016688', '47833': '9016689', '47834': '9016690', '47837': '9016691', '47838': '9016692', '47840': '9016693', '47841': '9016694', '47842': '9016695', '47846': '9016696', '47847': '9016697', '47848': '9016698', '47849': '9016699', '47850': '9016700', '47854': '9016702', '47858': '9016704', '47859': '9016705', '47861': '9016706', '47862': '9016707', '47866': '9016709', '47868': '9016710', '47872': '9016712', '47874': '9016713', '47879': '9016714', '47882': '9016716', '47885': '9016718', '47901': '9016719', '47904': '9016720', '47905': '9016721', '47906': '9016722', '47907': '9016723', '47909': '9016724', '47917': '9016726', '47918': '9016727', '47920': '9016728', '47921': '9016729', '47922': '9016730', '47923': '9016731', '47926': '9016733', '47928': '9016734', '47929': '9016735', '47930': '9016736', '47932': '9016737', '47933': '9016738', '47940': '9016739', '47941': '9016740', '47942': '9016741', '47943': '9016742', '47944': '9016743', '47946': '9016744', '47948': '9016745', '47949': '9016746', '47950': '9016747', '47951': '9016748', '47952': '9016749', '47954': '9016750', '47955': '9016751', '47957': '9016752', '47958': '9016753', '47959': '9016754', '47960': '9016755', '47963': '9016756', '47967': '9016759', '47968': '9016760', '47970': '9016762', '47971': '9016763', '47974': '9016764', '47975': '9016765', '47977': '9016766', '47978': '9016767', '47980': '9016768', '47981': '9016769', '47987': '9016771', '47989': '9016772', '47990': '9016773', '47991': '9016774', '47992': '9016775', '47993': '9016776', '47994': '9016777', '47995': '9016778', '47997': '9016779', '48001': '9016780', '48002': '9016781', '48003': '9016782', '48005': '9016783', '48006': '9016784', '48009': '9016785', '48014': '9016786', '48015': '9016787', '48017': '9016788', '48021': '9016789', '48022': '9016790', '48023': '9016791', '48025': '9016792', '48026': '9016793', '48027': '9016794', '48028': '9016795', '48030': '9016796', '48032': '9016797', '48033': '9016798', '48034': '9016799', '48035': '9016800', '48036': '9016801', '48038': '9016802', '48039': '9016803', '48040': '9016804', '48041': '9016805', '48042': '9016806', '48043': '9016807', '48044': '9016808', '48045': '9016809', '48047': '9016810', '48048': '9016811', '48049': '9016812', '48050': '9016813', '48051': '9016814', '48054': '9016815', '48059': '9016816', '48060': '9016817', '48062': '9016818', '48063': '9016819', '48064': '9016820', '48065': '9016821', '48066': '9016822', '48067': '9016823', '48069': '9016825', '48070': '9016826', '48071': '9016827', '48072': '9016828', '48073': '9016829', '48074': '9016830', '48075': '9016831', '48076': '9016832', '48079': '9016833', '48080': '9016834', '48081': '9016835', '48082': '9016836', '48083': '9016837', '48084': '9016838', '48085': '9016839', '48088': '9016840', '48089': '9016841', '48091': '9016842', '48092': '9016843', '48093': '9016844', '48094': '9016845', '48095': '9016846', '48096': '9016847', '48097': '9016848', '48098': '9016849', '48101': '9016850', '48103': '9016851', '48104': '9016852', '48105': '9016853', '48108': '9016854', '48109': '9016855', '48110': '9016856', '48111': '9016857', '48114': '9016858', '48116': '9016859', '48117': '9016860', '48118': '9016861', '48120': '9016862', '48122': '9016863', '48124': '9016864', '48125': '9016865', '48126': '9016866', '48127': '9016867', '48128': '9016868', '48130': '9016869', '48131': '9016870', '48133': '9016871', '48134': '9016872', '48135': '9016873', '48137': '9016874', '48138': '9016875', '48139': '9016876', '48140': '9016877', '48141': '9016878', '48144': '9016879', '48145': '9016880', '48146': '9016881', '48150': '9016882', '48152': '9016883', '48154': '9016884', '48157': '9016885', '48158': '9016886', '48159': '9016887', '48160': '9016888', '48161': '9016889', '48162': '9016890', '48164': '9016891', '48165': '9016892', '48166': '9016893', '48167': '9016894', '48168': '9016895', '48169': '9016896', '48170': '9016897', '48173': '9016898', '48174': '9016899', '48176': '9016901', '48178': '9016902', '48179': '9016903', '48180': '9016904', '48182': '9016905', '48183': '9016906', '48184': '9016907', '48185': '9016908', '48186': '9016909', '48187': '9016910', '48188': '9016911', '48189': '9016912', '48191': '9016914', '48192': '9016915', '48193': '9016916', '48195': '9016917', '48197': '9016918', '48198': '9016919', '48201': '9016920', '48202': '9016921', '48203': '9016922', '48204': '9016923', '48205': '9016924', '48206': '9016925', '48207': '9016926', '48208': '9016927', '48209': '9016928', '48210': '9016929', '48211': '9016930', '48212': '9016931', '48213': '9016932', '48214': '9016933', '48215': '9016934', '48216': '9016935', '48217': '9016936', '48218': '9016937', '48219': '9016938', '48220': '9016939', '48221': '9016940', '48223': '9016941', '48224': '9016942', '48225': '9016943', '48226': '9016944', '48227': '9016945', '48228': '9016946', '48229': '9016947', '48230': '9016948', '48233': '9016949', '48234': '9016950', '48235': '9016951', '48236': '9016952', '48237': '9016953', '48238': '9016954', '48239': '9016955', '48240': '9016956', '48242': '9016957', '48301': '9016959', '48302': '9016960', '48304': '9016961', '48306': '9016962', '48307': '9016963', '48309': '9016965', '48310': '9016966', '48312': '9016967', '48313': '9016968', '48314': '9016969', '48315': '9016970', '48316': '9016971', '48317': '9016972', '48320': '9016973', '48322': '9016974', '48323': '9016975', '48324': '9016976', '48326': '9016977', '48327': '9016978', '48328': '9016979', '48329': '9016980', '48331': '9016981', '48334': '9016982', '48335': '9016983', '48336': '9016984', '48340': '9016985', '48341': '9016986', '48342': '9016987', '48346': '9016988', '48348': '9016989', '48350': '9016990', '48353': '9016991', '48356': '9016992', '48357': '9016993', '48359': '9016994', '48360': '9016995', '48362': '9016996', '48363': '9016997', '48367': '9016998', '48370': '9016999', '48371': '9017000', '48374': '9017001', '48375': '9017002', '48377': '9017003', '48380': '9017004', '48381': '9017005', '48382': '9017006', '48383': '9017007', '48386': '9017008', '48390': '9017009', '48393': '9017010', '48401': '9017011', '48410': '9017012', '48412': '9017013', '48413': '9017014', '48414': '9017015', '48415': '9017016', '48416': '9017017', '48417': '9017018', '48418': '9017019', '48419': '9017020', '48420': '9017021', '48421': '9017022', '48422': '9017023', '48423': '9017024', '48426': '9017025', '48427': '9017026', '48428': '9017027', '48429': '9017028', '48430': '9017029', '48432': '9017030', '48433': '9017031', '48434': '9017032', '48435': '9017033', '48436': '9017034', '48437': '9017035', '48438': '9017036', '48439': '9017037', '48441': '9017038', '48442': '9017039', '48444': '9017040', '48445': '9017041', '48446': '9017042', '48449': '9017043', '48450': '9017044', '48451': '9017045', '48453': '9017046', '48454': '9017047', '48455': '9017048', '48456': '9017049', '48457': '9017050', '48458': '9017051', '48460': '9017052', '48461': '9017053', '48462': '9017054', '48463': '9017055', '48464': '9017056', '48465': '9017057', '48466': '9017058', '48467': '9017059', '48468': '9017060', '48469': '9017061', '48470': '9017062', '48471': '9017063', '48472': '9017064', '48473': '9017065', '48475': '9017066', '48476': '9017067', '48502': '9017068', '48503': '9017069', '48504': '9017070', '48505': '9017071', '48506': '9017072', '48507': '9017073', '48509': '9017074', '48519': '9017075', '48529': '9017076', '48532': '9017077', '48550': '9017078', '48552': '9017079', '48553': '9017080', '48554': '9017081', '48555': '9017082', '48556': '9017083', '48557': '9017084', '48601': '9017085', '48602': '9017086', '48603': '9017087', '48604': '9017088', '48607': '9017089', '48609': '9017090', '48610': '9017091', '48611': '9017092', '48612': '9017093', '48613': '9017094', '48614': '9017095', '48615': '9017096', '48616': '9017097', '48617': '9017098', '48618': '9017099', '48619': '9017100', '48621': '9017101', '48622': '9017102', '48623': '9017103', '48624': '9017104', '48625': '9017105', '48626': '9017106', '48628': '9017107', '48629': '9017108', '48630': '9017109', '48631': '9017110', '48632': '9017111', '48634': '9017112', '48635': '9017113', '48636': '9017114', '48637': '9017115', '48638': '9017116', '48640': '9017117', '48642': '9017118', '48647': '9017119', '48649': '9017120', '48650': '9017121', '48651': '9017122', '48652': '9017123', '48653': '9017124', '48654': '9017125', '48655': '9017126', '48656': '9017127', '48657': '9017128', '48658': '9017129', '48659': '9017130', '48661': '9017131', '48662': '9017132', '48667': '9017133', '48670': '9017134', '48674': '9017135', '48701': '9017136', '48703': '9017137', '48705': '9017138', '48706': '9017139', '48708': '9017140', '48720': '9017142', '48721': '9017143', '48722': '9017144', '48723': '9017145', '48724': '9017146', '48725': '9017147', '48726': '9017148', '48727': '9017149', '48728': '9017150', '48729': '9017151', '48730': '9017152', '48731': '9017153', '48732': '9017154', '48733': '9017155', '48734': '9017156', '48735': '9017157', '48737': '9017158', '48738': '9017159', '48739': '9017160', '48740': '9017161', '48741': '9017162', '48742': '9017163', '48743': '9017164', '48744': '9017165', '48745': '9017166', '48746': '9017167', '48747': '9017168', '48748': '9017169', '48749': '9017170', '48750': '9017171', '48754': '9017172', '48755': '9017173', '48756': '9017174', '48757': '9017175', '48759': '9017176', '48760': '9017177', '48761': '9017178', '48762': '9017179', '48763': '9017180', '48765': '9017181', '48766': '9017182', '48767': '9017183', '48768': '9017184', '48770': '9017185', '48787': '9017186', '48801': '9017187', '48806': '9017188', '48807': '9017189', '48808': '9017190', '48809': '9017191', '48811': '9017192', '48813': '9017194', '48815': '9017195', '48817': '9017197', '48818': '9017198', '48819': '9017199', '48820': '9017200', '48821': '9017201', '48822': '9017202', '48823': '9017203', '48824': '9017204', '48827': '9017205', '48829': '9017206', '48831': '9017207', '48832': '9017208', '48834': '9017209', '48835': '9017210', '48836': '9017211', '48837': '9017212', '48838': '9017213', '48840': '9017214', '48841': '9017215', '48842': '9017216', '48843': '9017217', '48845': '9017218', '48846': '9017219', '48847': '9017220', '48848': '9017221', '48849': '9017222', '48850': '9017223', '48851': '9017224', '48853': '9017226', '48854': '9017227', '48855': '9017228', '48856': '9017229', '48857': '9017230', '48858': '9017231', '48860': '9017232', '48861': '9017233', '48864': '9017234', '48865': '9017235', '48866': '9017236', '48867': '9017237', '48871': '9017238', '48872': '9017239', '48873': '9017240', '48875': '9017241', '48876': '9017242', '48877': '9017243', '48878': '9017244', '48879': '9017245', '48880': '9017246', '48881': '9017247', '48883': '9017248', '48884': '9017249', '48885': '9017250', '48886': '9017251', '48888': '9017252', '48889': '9017253', '48890': '9017254', '48891': '9017255', '48892': '9017256', '48893': '9017257', '48894': '9017258', '48895': '9017259', '48897': '9017261', '48906': '9017262', '48910': '9017263', '48911': '9017264', '48912': '9017265', '48915': '9017266', '48917': '9017267', '48919': '9017268', '48924': '9017269', '48933': '9017270', '49001': '9017271', '49002': '9017272', '49004': '9017273', '49006': '9017274', '49007': '9017275', '49008': '9017276', '49009': '9017277', '49010': '9017278', '49011': '9017279', '49012': '9017280', '49013': '9017281', '49014': '9017282', '49015': '9017283', '49017': '9017285', '49021': '9017286', '49022': '9017287', '49024': '9017288', '49026': '9017289', '49028': '9017291', '49029': '9017292', '49030': '9017293', '49031': '9017294', '49032': '9017295', '49033': '9017296', '49034': '9017297', '49036': '9017298', '49037': '9017299', '49038': '9017300', '49040': '9017301', '49042': '9017302', '49043': '9017303', '49045': '9017304', '49046': '9017305', '49047': '9017306', '49048': '9017307', '49050': '9017308', '49051': '9017309', '49052': '9017310', '49053': '9017311', '49055': '9017312', '49056': '9017313', '49057': '9017314', '49058': '9017315', '49060': '9017316', '49061': '9017317', '49064': '9017318', '49065': '9017319', '49066': '9017320', '49067': '9017321', '49068': '9017322', '49070': '9017324', '49071': '9017325', '49072': '9017326', '49073': '9017327', '49076': '9017328', '49078': '9017329', '49079': '9017330', '49080': '9017331', '49082': '9017332', '49083': '9017333', '49085': '9017334', '49087': '9017335', '49088': '9017336', '49089': '9017337', '49090': '9017338', '49091': '9017339', '49092': '9017340', '49093': '9017341', '49094': '9017342', '49095': '9017343', '49096': '9017344', '49097': '9017345', '49098': '9017346', '49099': '9017347', '49101': '9017348', '49102': '9017349', '49103': '9017350', '49104': '9017351', '49106': '9017352', '49107': '9017353', '49111': '9017354', '49112': '9017355', '49113': '9017356', '49115': '9017357', '49116': '9017358', '49117': '9017359', '49119': '9017360', '49120': '9017361', '49125': '9017363', '49126': '9017364', '49127': '9017365', '49128': '9017366', '49129': '9017367', '49130': '9017368', '49201': '9017369', '49202': '9017370', '49203': '9017371', '49220': '9017373', '49221': '9017374', '49224': '9017375', '49227': '9017376', '49228': '9017377', '49229': '9017378', '49230': '9017379', '49232': '9017380', '49233': '9017381', '49234': '9017382', '49235': '9017383', '49236': '9017384', '49237': '9017385', '49238': '9017386', '49240': '9017387', '49241': '9017388', '49242': '9017389', '49245': '9017390', '49246': '9017391', '49247': '9017392', '49248': '9017393', '49249': '9017394', '49250': '9017395', '49251': '9017396', '49252': '9017397', '49253': '9017398', '49254': '9017399', '49255': '9017400', '49256': '9017401', '49259': '9017402', '49261': '9017403', '49262': '9017404', '49264': '9017406', '49265': '9017407', '49266': '9017408', '49267': '9017409', '49268': '9017410', '49269': '9017411', '49270': '9017412', '49271': '9017413', '49272': '9017414', '49274': '9017415', '49276': '9017416', '49277': '9017417', '49279': '9017418', '49282': '9017419', '49283': '9017420', '49284': '9017421', '49285': '9017422', '49286': '9017423', '49287': '9017424', '49288': '9017425', '49301': '9017427', '49302': '9017428', '49303': '9017429', '49304': '9017430', '49305': '9017431', '49306': '9017432', '49307': '9017433', '49309': '9017434', '49310': '9017435', '49312': '9017436', '49315': '9017437', '49316': '9017438', '49318': '9017439', '49319': '9017440', '49320': '9017441', '49321': '9017442', '49322': '9017443', '49323': '9017444', '49325': '9017445', '49326': '9017446', '49327': '9017447', '49328': '9017448', '49329': '9017449', '49330': '9017450', '49331': '9017451', '49332': '9017452', '49333': '9017453', '49336': '9017455', '49337': '9017456', '49338': '9017457', '49339': '9017458', '49340': '9017459', '49341': '9017460', '49342': '9017461', '49343': '9017462', '49344': '9017463', '49345': '9017464', '49346': '9017465', '49347': '9017466', '49348': '9017467', '49349': '9017468', '49401': '9017469', '49402': '9017470', '49403': '9017471', '49404': '9017472', '49405': '9017473', '49406': '9017474', '49408': '9017475', '49410': '9017477', '49411': '9017478', '49412': '9017479', '49415': '9017480', '49417': '9017481', '49418': '9017482', '49419': '9017483', '49420': '9017484', '49421': '9017485', '49423': '9017486', '49424': '9017487', '49425': '9017488', '49426': '9017489', '49428': '9017490', '49431': '9017492', '49435': '9017494', '49436': '9017495', '49437': '9017496', '49440': '9017497', '49441': '9017498', '49442': '9017499', '49444': '9017501', '49445': '9017502', '49446': '9017503', '49448': '9017504', '49449': '9017505', '49450': '9017506', '49451': '9017507', '49452': '9017508', '49453': '9017509', '49454': '9017510', '49455': '9017511', '49456': '9017512', '49457': '9017513', '49459': '9017514', '49460': '9017515', '49461': '9017516', '49464': '9017517', '49503': '9017518', '49504': '9017519', '49505': '9017520', '49506': '9017521', '49507': '9017522', '49508': '9017523', '49509': '9017524', '49512': '9017525', '49519': '9017526', '49525': '9017527', '49534': '9017528', '49544': '9017529', '49546': '9017530', '49548': '9017531', '49560': '9017532', '49601': '9017533', '49612': '9017536', '49613': '9017537', '49614': '9017538', '49615': '9017539', '49616': '9017540', '49617': '9017541', '49618': '9017542', '49619': '9017543', '49620': '9017544', '49621': '9017545', '49622': '9017546', '49623': '9017547', '49625': '9017548', '49626': '9017549', '49628': '9017551', '49629': '9017552', '49630': '9017553', '49631': '9017554', '49632': '9017555', '49633': '9017556', '49635': '9017558', '49636': '9017559', '49637': '9017560', '49638': '9017561', '49639': '9017562', '49640': '9017563', '49642': '9017564', '49643': '9017565', '49644': '9017566', '49645': '9017567', '49646': '9017568', '49648': '9017569', '49649': '9017570', '49650': '9017571', '49651': '9017572', '49653': '9017573', '49654': '9017574', '49655': '9017575', '49656': '9017576', '49657': '9017577', '49659': '9017578', '49660': '9017579', '49663': '9017580', '49664': '9017581', '49665': '9017582', '49667': '9017583', '49668': '9017584', '49670': '9017585', '49675': '9017587', '49676': '9017588', '49677': '9017589', '49679': '9017590', '49680': '9017591', '49682': '9017592', '49683': '9017593', '49684': '9017594', '49685': '9017595', '49686': '9017596', '49688': '9017597', '49689': '9017598', '49690': '9017599', '49701': '9017600', '49705': '9017601', '49706': '9017602', '49707': '9017603', '49709': '9017604', '49710': '9017605', '49712': '9017606', '49713': '9017607', '49715': '9017608', '49716': '9017609', '49718': '9017610', '49719': '9017611', '49720': '9017612', '49721': '9017613', '49724': '9017614', '49725': '9017615', '49726': '9017616', '49727': '9017617', '49728': '9017618', '49729': '9017619', '49730': '9017620', '49733': '9017621', '49735': '9017622', '49736': '9017623', '49738': '9017624', '49740': '9017625', '49743': '9017626', '49744': '9017627', '49745': '9017628', '49746': '9017629', '49747': '9017630', '49748': '9017631', '49749': '9017632', '49751': '9017633', '49752': '9017634', '49753': '9017635', '49755': '9017636', '49756': '9017637', '49757': '9017638', '49759': '9017639', '49760': '9017640', '49762': '9017641', '49765': '9017643', '49766': '9017644', '49768': '9017645', '49769': '9017646', '49770': '9017647', '49774': '9017648', '49775': '9017649', '49776': '9017650', '49777': '9017651', '49779': '9017652', '49780': '9017653', '49781': '9017654', '49782': '9017655', '49783': '9017656', '49788': '9017657', '49793': '9017659', '49795': '9017660', '49796': '9017661', '49799': '9017662', '49801': '9017663', '49802': '9017664', '49805': '9017665', '49806': '9017666', '49807': '9017667', '49808': '9017668', '49812': '9017669', '49814': '9017670', '49815': '9017671', '49816': '9017672', '49817': '9017673', '49818': '9017674', '49820': '9017675', '49821': '9017676', '49822': '9017677', '49827': '9017678', '49829': '9017679', '49831': '9017680', '49834': '9017681', '49835': '9017682', '49836': '9017683', '49837': '9017684', '49838': '9017685', '49839': '9017686', '49840': '9017687', '49841': '9017688', '49847': '9017689', '49848': '9017690', '49849': '9017691', '49852': '9017692', '49853': '9017693', '49854': '9017694', '49855': '9017695', '49858': '9017696', '49861': '9017697', '49862': '9017698', '49866': '9017701', '49868': '9017702', '49870': '9017703', '49873': '9017705', '49874': '9017706', '49876': '9017707', '49878': '9017708', '49879': '9017709', '49880': '9017710', '49881': '9017711', '49883': '9017712', '49884': '9017713', '49885': '9017714', '49886': '9017715', '49887': '9017716', '49891': '9017717', '49892': '9017718', '49893': '9017719', '49894': '9017720', '49895': '9017721', '49896': '9017722', '49905': '9017724', '49908': '9017725', '49910': '9017726', '49911': '9017727', '49912': '9017728', '49913': '9017729', '49916': '9017731', '49918': '9017733', '49919': '9017734', '49920': '9017735', '49921': '9017736', '49925': '9017738', '49927': '9017739', '49930': '9017741', '49931': '9017742', '49934': '9017743', '49935': '9017744', '49938': '9017745', '49945': '9017746', '49946': '9017747', '49947': '9017748', '49948': '9017749', '49950': '9017750', '49952': '9017751', '49953': '9017752', '49958': '9017753', '49960': '9017754', '49961': '9017755', '49962': '9017756', '49963': '9017757', '49965': '9017758', '49967': '9017759', '49968': '9017760', '49969': '9017761', '50001': '9017762', '50002': '9017763', '50003': '9017764', '50005': '9017765', '50006': '9017766', '50007': '9017767', '50008': '9017768', '50009': '9017769', '50010': '9017770', '50011': '9017771', '50012': '9017772', '50014': '9017773', '50020': '9017774', '50021': '9017775', '50022': '9017776', '50023': '9017777', '50025': '9017778', '50026': '9017779', '50027': '9017780', '50028': '9017781', '50029': '9017782', '50032': '9017783', '50033': '9017784', '50034': '9017785', '50035': '9017786', '50036': '9017787', '50038': '9017788', '50039': '9017789', '50040': '9017790', '50041': '9017791', '50042': '9017792', '50044': '9017793', '50046': '9017794', '50047': '9017795', '50048': '9017796', '50049': '9017797', '50050': '9017798', '50051': '9017799', '50052': '9017800', '50054': '9017801', '50055': '9017802', '50056': '9017803', '50057': '9017804', '50058': '9017805', '50059': '9017806', '50060': '9017807', '50061': '9017808', '50062': '9017809', '50063': '9017810', '50064': '9017811', '50065': '9017812', '50066': '9017813', '50067': '9017814', '50069': '9017815', '50070': '9017816', '50071': '9017817', '50072': '9017818', '50073': '9017819', '50074': '9017820', '50075': '9017821', '50076': '9017822', '50078': '9017823', '50101': '9017824', '50103': '9017825', '50104': '9017826', '50105': '9017827', '50106': '9017828', '50107': '9017829', '50108': '9017830', '50109': '9017831', '50111': '9017832', '50112': '9017833', '50115': '9017834', '50116': '9017835', '50117': '9017836', '50118': '9017837', '50119': '9017838', '50120': '9017839', '50122': '9017840', '50123': '9017841', '50124': '9017842', '50125': '9017843', '50126': '9017844', '50127': '9017845', '50128': '9017846', '50129': '9017847', '50130': '9017848', '50131': '9017849', '50132': '9017850', '50133': '9017851', '50134': '9017852', '50135': '9017853', '50136': '9017854', '50137': '9017855', '50138': '9017856', '50139': '9017857', '50140': '9017858', '50141': '9017859', '50142': '9017860', '50143': '9017861', '50144': '9017862', '50145': '9017863', '50146': '9017864', '50147': '9017865', '50148': '9017866', '50149': '9017867', '50150': '9017868', '50151': '9017869', '50152': '9017870', '50153': '9017871', '50154': '9017872', '50155': '9017873', '50156': '9017874', '50157': '9017875', '50158': '9017876', '50161': '9017878', '50162': '9017879', '50163': '9017880', '50164': '9017881', '50165': '9017882', '50166': '9017883', '50167': '9017884', '50168': '9017885', '50169': '9017886', '50170': '9017887', '50171': '9017888', '50173': '9017889', '50174': '9017890', '50201': '9017891', '50206': '9017892', '50207': '9017893', '50208': '9017894', '50210': '9017895', '50211': '9017896', '50212': '9017897', '50213': '9017898', '50214': '9017899', '50216': '9017900', '50217': '9017901', '50219': '9017902', '50220': '9017903', '50222': '9017904', '50223': '9017905', '50225': '9017906', '50226': '9017907', '50227': '9017908', '50228': '9017909', '50229': '9017910', '50230': '9017911', '50231': '9017912', '50232': '9017913', '50233': '9017914', '50234': '9017915', '50235': '9017916', '50236': '9017917', '50237': '9017918', '50238': '9017919', '50239': '9017920', '50240': '9017921', '50242': '9017923', '50243': '9017924', '50244': '9017925', '50246': '9017926', '50247': '9017927', '50248': '9017928', '50249': '9017929', '50250': '9017930', '50251': '9017931', '50252': '9017932', '50254': '9017933', '50256': '9017934', '50257': '9017935', '50258': '9017936', '50259': '9017937', '50261': '9017938', '50262': '9017939', '50263': '9017940', '50264': '9017941', '50265': '9017942', '50266': '9017943', '50268': '9017944', '50271': '9017945', '50272': '9017946', '50273': '9017947', '50274': '9017948', '50275': '9017949', '50276': '9017950', '50277': '9017951', '50278': '9017952', '50309': '9017953', '50310': '9017954', '50311': '9017955', '50312': '9017956', '50313': '9017957', '50314': '9017958', '50315': '9017959', '50316': '9017960', '50317': '9017961', '50319': '9017963', '50320': '9017964', '50321': '9017965', '50322': '9017966', '50323': '9017967', '50324': '9017968', '50325': '9017969', '50327': '9017970', '50391': '9017971', '50392': '9017972', '50401': '9017973', '50420': '9017974', '50421': '9017975', '50423': '9017976', '50424': '9017977', '50426': '9017978', '50428': '9017979', '50430': '9017980', '50432': '9017982', '50433': '9017983', '50434': '9017984', '50435': '9017985', '50436': '9017986', '50438': '9017987', '50439': '9017988', '50440': '9017989', '50441': '9017990', '50444': '9017991', '50446': '9017992', '50447': '9017993', '50448': '9017994', '50449': '9017995', '50450': '9017996', '50451': '9017997', '50452': '9017998', '50453': '9017999', '50454': '9018000', '50455': '9018001', '50456': '9018002', '50457': '9018003', '50458': '9018004', '50459': '9018005', '50460': '9018006', '50461': '9018007', '50464': '9018008', '50466': '9018009', '50467': '9018010', '50468': '9018011', '50469': '9018012', '50470': '9018013', '50471': '9018014', '50472': '9018015', '50473': '9018016', '50475': '9018017', '50476': '9018018', '50477': '9018019', '50478': '9018020', '50479': '9018021', '50480': '9018022', '50482': '9018023', '50483': '9018024', '50484': '9018025', '50501': '9018026', '50510': '9018027', '50511': '9018028', '50514': '9018029', '50515': '9018030', '50516': '9018031', '50517': '9018032', '50518': '9018033', '50519': '9018034', '50520': '9018035', '50521': '9018036', '50522': '9018037', '50523': '9018038', '50524': '9018039', '50525': '9018040', '50527': '9018041', '50528': '9018042', '50529': '9018043', '50530': '9018044', '50531': '9018045', '50532': '9018046', '50533': '9018047', '50535': '9018048', '50536': '9018049', '50538': '9018050', '50539': '9018051', '50540': '9018052', '50541': '9018053', '50542': '9018054', '50543': '9018055', '50544': '9018056', '50545': '9018057', '50546': '9018058', '50548': '9018059', '50551': '9018060', '50554': '9018061', '50556': '9018062', '50557': '9018063', '50558': '9018064', '50559': '9018065', '50560': '9018066', '50561': '9018067', '50562': '9018068', '50563': '9018069', '50565': '9018070', '50566': '9018071', '50567': '9018072', '50568': '9018073', '50569': '9018074', '50570': '9018075', '50571': '9018076', '50574': '9018078', '50575': '9018079', '50576': '9018080', '50577': '9018081', '50578': '9018082', '50579': '9018083', '50581': '9018084', '50582': '9018085', '50583': '9018086', '50585': '9018087', '50586': '9018088', '50588': '9018089', '50590': '9018090', '50591': '9018091', '50594': '9018094', '50595': '9018095', '50597': '9018096', '50598': '9018097', '50599': '9018098', '50601': '9018099', '50602': '9018100', '50603': '9018101', '50604': '9018102', '50605': '9018103', '50606': '9018104', '50607': '9018105', '50609': '9018106', '50611': '9018107', '50612': '9018108', '50613': '9018109', '50614': '9018110', '50616': '9018111', '50619': '9018112', '50620': '9018113', '50621': '9018114', '50622': '9018115', '50624': '9018116', '50625': '9018117', '50626': '9018118', '50627': '9018119', '50628': '9018120', '50629': '9018121', '50630': '9018122', '50632': '9018123', '50633': '9018124', '50634': '9018125', '50635': '9018126', '50636': '9018127', '50638': '9018128', '50641': '9018129', '50642': '9018130', '50643': '9018131', '50644': '9018132', '50645': '9018133', '50647': '9018134', '50648': '9018135', '50649': '9018136', '50650': '9018137', '50651': '9018138', '50653': '9018139', '50654': '9018140', '50655': '9018141', '50658': '9018142', '50659': '9018143', '50660': '9018144', '50662': '9018145', '50665': '9018146', '50666': '9018147', '50667': '9018148', '50668': '9018149', '50669': '9018150', '50670': '9018151', '50671': '9018152', '50672': '9018153', '50674': '9018154', '50675': '9018155', '50676': '9018156', '50677': '9018157', '50680': '9018158', '50681': '9018159', '50682': '9018160', '50701': '9018161', '50702': '9018162', '50703': '9018163', '50707': '9018164', '50801': '9018165', '50830': '9018166', '50833': '9018167', '50835': '9018168', '50836': '9018169', '50837': '9018170', '50839': '9018171', '50840': '9018172', '50841': '9018173', '50842': '9018174', '50843': '9018175', '50845': '9018176', '50846': '9018177', '50847': '9018178', '50848': '9018179', '50849': '9018180', '50851': '9018181', '50853': '9018182', '50854': '9018183', '50857': '9018184', '50858': '9018185', '50859': '9018186', '50860': '9018187', '50861': '9018188', '50862': '9018189', '50863': '9018190', '50864': '9018191', '51001': '9018192', '51002': '9018193', '51003': '9018194', '51004': '9018195', '51005': '9018196', '51006': '9018197', '51007': '9018198', '51009': '9018200', '51010': '9018201', '51011': '9018202', '51012': '9018203', '51014': '9018204', '51016': '9018205', '51018': '9018206', '51019': '9018207', '51020': '9018208', '51022': '9018209', '51023': '9018210', '51024': '9018211', '51025': '9018212', '51026': '9018213', '51027': '9018214', '51028': '9018215', '51029': '9018216', '51030': '9018217', '51031': '9018218', '51033': '9018219', '51034': '9018220', '51035': '9018221', '51036': '9018222', '51037': '9018223', '51038': '9018224', '51039': '9018225', '51040': '9018226', '51041': '9018227', '51044': '9018228', '51046': '9018230', '51047': '9018231', '51048': '9018232', '51049': '9018233', '51050': '9018234', '51051': '9018235', '51052': '9018236', '51053': '9018237', '51054': '9018238', '51055': '9018239', '51056': '9018240', '51058': '9018241', '51060': '9018242', '51061': '9018243', '51062': '9018244', '51063': '9018245', '51101': '9018246', '51103': '9018247', '51104': '9018248', '51105': '9018249', '51106': '9018250', '51108': '9018251', '51109': '9018252', '51111': '9018253', '51201': '9018254', '51230': '9018255', '51231': '9018256', '51232': '9018257', '51234': '9018258', '51235': '9018259', '51237': '9018260', '51238': '9018261', '51239': '9018262', '51240': '9018263', '51241': '9018264', '51242': '9018265', '51243': '9018266', '51244': '9018267', '51245': '9018268', '51246': '9018269', '51247': '9018270', '51248': '9018271', '51249': '9018272', '51250': '9018273', '51301': '9018274', '51331': '9018275', '51333': '9018276', '51334': '9018277', '51338': '9018278', '51342': '9018280', '51343': '9018281', '51345': '9018282', '51346': '9018283', '51347': '9018284', '51350': '9018285', '51351': '9018286', '51354': '9018287', '51355': '9018288', '51357': '9018289', '51358': '9018290', '51360': '9018291', '51363': '9018292', '51364': '9018293', '51365': '9018294', '51366': '9018295', '51401': '9018296', '51430': '9018297', '51431': '9018298', '51433': '9018300', '51436': '9018301', '51439': '9018302', '51440': '9018303', '51441': '9018304', '51442': '9018305', '51443': '9018306', '51445': '9018308', '51446': '9018309', '51447': '9018310', '51448': '9018311', '51449': '9018312', '51450': '9018313', '51451': '9018314', '51453': '9018315', '51454': '9018316', '51455': '9018317', '51458': '9018318', '51459': '9018319', '51461': '9018321', '51462': '9018322', '51463': '9018323', '51465': '9018324', '51466': '9018325', '51467': '9018326', '51501': '9018327', '51503': '9018328', '51510': '9018329', '51520': '9018330', '51521': '9018331', '51523': '9018332', '51525': '9018333', '51526': '9018334', '51527': '9018335', '51528': '9018336', '51529': '9018337', '51530': '9018338', '51531': '9018339', '51532': '9018340', '51533': '9018341', '51534': '9018342', '51535': '9018343', '51536': '9018344', '51537': '9018345', '51540': '9018346', '51541': '9018347', '51542': '9018348', '51543': '9018349', '51544': '9018350', '51545': '9018351', '51546': '9018352', '51548': '9018353', '51549': '9018354', '51550': '9018355', '51551': '9018356', '51552': '9018357', '51553': '9018358', '51554': '9018359', '51555': '9018360', '51556': '9018361', '51557': '9018362', '51558': '9018363', '51559': '9018364', '51560': '9018365', '51561': '9018366', '51562': '9018367', '51563': '9018368', '51564': '9018369', '51565': '9018370', '51566': '9018371', '51570': '9018372', '51571': '9018373', '51572': '9018374', '51573': '9018375', '51575': '9018376', '51576': '9018377', '51577': '9018378', '51579': '9018380', '51601': '9018381', '51603': '9018382', '51630': '9018383', '51631': '9018384', '51632': '9018385', '51636': '9018386', '51637': '9018387', '51638': '9018388', '51639': '9018389', '51640': '9018390', '51645': '9018391', '51646': '9018392', '51647': '9018393', '51648': '9018394', '51649': '9018395', '51650': '9018396', '51651': '9018397', '51652': '9018398', '51653': '9018399', '51654': '9018400', '52001': '9018402', '52002': '9018403', '52003': '9018404', '52031': '9018406', '52032': '9018407', '52033': '9018408', '52035': '9018409', '52036': '9018410', '52037': '9018411', '52038': '9018412', '52039': '9018413', '52040': '9018414', '52041': '9018415', '52042': '9018416', '52043': '9018417', '52044': '9018418', '52045': '9018419', '52046': '9018420', '52047': '9018421', '52048': '9018422', '52049': '9018423', '52050': '9018424', '52052': '9018425', '52053': '9018426', '52054': '9018427', '52057': '9018429', '52060': '9018430', '52064': '9018431', '52065': '9018432', '52066': '9018433', '52068': '9018434', '52069': '9018435', '52070': '9018436', '52072': '9018437', '52073': '9018438', '52074': '9018439', '52076': '9018440', '52077': '9018441', '52078': '9018442', '52079': '9018443', '52101': '9018444', '52132': '9018445', '52133': '9018446', '52134': '9018447', '52135': '9018448', '52136': '9018449', '52140': '9018450', '52141': '9018451', '52142': '9018452', '52144': '9018453', '52146': '9018454', '52147': '9018455', '52151': '9018456', '52154': '9018457', '52155': '9018458', '52156': '9018459', '52157': '9018460', '52159': '9018461', '52160': '9018462', '52161': '9018463', '52162': '9018464', '52163': '9018465', '52164': '9018466', '52165': '9018467', '52169': '9018469', '52170': '9018470', '52171': '9018471', '52172': '9018472', '52175': '9018473', '52201': '9018474', '52202': '9018475', '52203': '9018476', '52205': '9018477', '52206': '9018478', '52207': '9018479', '52208': '9018480', '52209': '9018481', '52210': '9018482', '52211': '9018483', '52212': '9018484', '52213': '9018485', '52214': '9018486', '52215': '9018487', '52216': '9018488', '52217': '9018489', '52218': '9018490', '52219': '9018491', '52221': '9018492', '52222': '9018493', '52223': '9018494', '52224': '9018495', '52225': '9018496', '52227': '9018497', '52228': '9018498', '52229': '9018499', '52231': '9018500', '52232': '9018501', '52233': '9018502', '52236': '9018503', '52237': '9018504', '52240': '9018505', '52241': '9018506', '52242': '9018507', '52245': '9018508', '52246': '9018509', '52247': '9018510', '52248': '9018511', '52249': '9018512', '52251': '9018513', '52252': '9018514', '52253': '9018515', '52254': '9018516', '52255': '9018517', '52257': '9018518', '52301': '9018519', '52302': '9018520', '52305': '9018521', '52306': '9018522', '52307': '9018523', '52309': '9018524', '52310': '9018525', '52313': '9018526', '52314': '9018527', '52315': '9018528', '52316': '9018529', '52317': '9018530', '52318': '9018531', '52320': '9018532', '52321': '9018533', '52322': '9018534', '52323': '9018535', '52324': '9018536', '52325': '9018537', '52326': '9018538', '52327': '9018539', '52328': '9018540', '52329': '9018541', '52330': '9018542', '52332': '9018543', '52333': '9018544', '52334': '9018545', '52335': '9018546', '52336': '9018547', '52337': '9018548', '52338': '9018549', '52339': '9018550', '52340': '9018551', '52341': '9018552', '52342': '9018553', '52345': '9018554', '52346': '9018555', '52347': '9018556', '52348': '9018557', '52349': '9018558', '52351': '9018559', '52352': '9018560', '52353': '9018561', '52354': '9018562', '52355': '9018563', '52356': '9018564', '52358': '9018565', '52359': '9018566', '52361': '9018567', '52362': '9018568', '52401': '9018569', '52402': '9018570', '52403': '9018571', '52404': '9018572', '52405': '9018573', '52411': '9018574', '52498': '9018575', '52499': '9018576', '52501': '9018577', '52530': '9018578', '52531': '9018579', '52533': '9018580', '52534': '9018581', '52535': '9018582', '52536': '9018583', '52537': '9018584', '52540': '9018585', '52542': '9018586', '52543': '9018587', '52544': '9018588', '52548': '9018589', '52549': '9018590', '52550': '9018591', '52551': '9018592', '52552': '9018593', '52553': '9018594', '52554': '9018595', '52555': '9018596', '52556': '9018597', '52557': '9018598', '52560': '9018599', '52561': '9018600', '52563': '9018601', '52565': '9018602', '52566': '9018603', '52567': '9018604', '52569': '9018605', '52570': '9018606', '52571': '9018607', '52572': '9018608', '52573': '9018609', '52574': '9018610', '52576': '9018611', '52577': '9018612', '52580': '9018613', '52581': '9018614', '52583': '9018615', '52584': '9018616', '52585': '9018617', '52586': '9018618', '52588': '9018619', '52590': '9018620', '52591': '9018621', '52593': '9018622', '52594': '9018623', '52595': '9018624', '52619': '9018625', '52620': '9018626', '52621': '9018627', '52623': '9018628', '52625': '9018629', '52626': '9018630', '52627': '9018631', '52630': '9018632', '52632': '9018633', '52635': '9018634', '52637': '9018635', '52638': '9018636', '52639': '9018637', '52640': '9018638', '52641': '9018639', '52644': '9018640', '52645': '9018641', '52646': '9018642', '52649': '9018643', '52650': '9018644', '52651': '9018645', '52653': '9018646', '52654': '9018647', '52655': '9018648', '52656': '9018649', '52657': '9018650', '52658': '9018651', '52659': '9018652', '52660': '9018653', '52720': '9018654', '52721': '9018655', '52722': '9018656', '52726': '9018657', '52727': '9018658', '52728': '9018659', '52729': '9018660', '52730': '9018661', '52731': '9018662', '52732': '9018663', '52737': '9018664', '52738': '9018665', '52739': '9018666', '52742': '9018667', '52745': '9018668', '52746': '9018669', '52747': '9018670', '52748': '9018671', '52749': '9018672', '52750': '9018673', '52751': '9018674', '52753': '9018675', '52754': '9018676', '52755': '9018677', '52756': '9018678', '52759': '9018680', '52760': '9018681', '52761': '9018682', '52765': '9018683', '52766': '9018684', '52768': '9018686', '52769': '9018687', '52772': '9018688', '52773': '9018689', '52776': '9018690', '52777': '9018691', '52778': '9018692', '52801': '9018693', '52802': '9018694', '52803': '9018695', '52804': '9018696', '52806': '9018697', '52807': '9018698', '53001': '9018699', '53002': '9018700', '53004': '9018701', '53005': '9018702', '53006': '9018703', '53007': '9018704', '53010': '9018705', '53011': '9018706', '53012': '9018707', '53013': '9018708', '53014': '9018709', '53015': '9018710', '53017': '9018712', '53018': '9018713', '53019': '9018714', '53020': '9018715', '53021': '9018716', '53022': '9018717', '53023': '9018718', '53024': '9018719', '53027': '9018720', '53029': '9018721', '53032': '9018722', '53033': '9018723', '53034': '9018724', '53035': '9018725', '53036': '9018726', '53037': '9018727', '53038': '9018728', '53039': '9018729', '53040': '9018730', '53042': '9018731', '53044': '9018732', '53045': '9018733', '53046': '9018734', '53048': '9018735', '53049': '9018736', '53050': '9018737', '53051': '9018738', '53057': '9018740', '53058': '9018741', '53059': '9018742', '53061': '9018744', '53063': '9018745', '53065': '9018746', '53066': '9018747', '53069': '9018748', '53070': '9018749', '53072': '9018750', '53073': '9018751', '53074': '9018752', '53075': '9018753', '53076': '9018754', '53078': '9018755', '53079': '9018756', '53080': '9018757', '53081': '9018758', '53083': '9018759', '53085': '9018760', '53086': '9018761', '53088': '9018762', '53089': '9018763', '53090': '9018764', '53091': '9018765', '53092': '9018766', '53093': '9018767', '53094': '9018768', '53095': '9018769', '53097': '9018770', '53098': '9018771', '53103': '9018772', '53104': '9018773', '53105': '9018774', '53108': '9018775', '53110': '9018776', '53114': '9018777', '53115': '9018778', '53118': '9018779', '53119': '9018780', '53120': '9018781', '53121': '9018782', '53122': '9018783', '53125': '9018784', '53126': '9018785', '53127': '9018786', '53128': '9018787', '53129': '9018788', '53130': '9018789', '53132': '9018790', '53137': '9018791', '53139': '9018792', '53140': '9018793', '53142': '9018794', '53143': '9018795', '53144': '9018796', '53146': '9018797', '53147': '9018798', '53149': '9018799', '53150': '9018800', '53151': '9018801', '53153': '9018802', '53154': '9018803', '53156': '9018804', '53158': '9018805', '53168': '9018807', '53170': '9018808', '53172': '9018809', '53176': '9018810', '53177': '9018811', '53178': '9018812', '53179': '9018813', '53181': '9018814', '53182': '9018815', '53183': '9018816', '53184': '9018817', '53185': '9018818', '53186': '9018819', '53188': '9018821', '53189': '9018822', '53190': '9018823', '53191': '9018824', '53202': '9018827', '53203': '9018828', '53204': '9018829', '53205': '9018830', '53206': '9018831', '53207': '9018832', '53208': '9018833', '53209': '9018834', '53210': '9018835', '53211': '9018836', '53212': '9018837', '53213': '9018838', '53214': '9018839', '53215': '9018840', '53216': '9018841', '53217': '9018842', '53218': '9018843', '53219': '9018844', '53220': '9018845', '53221': '9018846', '53222': '9018847', '53223': '9018848', '53224': '9018849', '53225': '9018850', '53226': '9018851', '53227': '9018852', '53228': '9018853', '53233': '9018854', '53235': '9018855', '53295': '9018856', '53402': '9018857', '53403': '9018858', '53404': '9018859', '53405': '9018860', '53406': '9018861', '53407': '9018862', '53502': '9018863', '53503': '9018864', '53504': '9018865', '53505': '9018866', '53506': '9018867', '53507': '9018868', '53508': '9018869', '53510': '9018870', '53511': '9018871', '53515': '9018872', '53516': '9018873', '53517': '9018874', '53518': '9018875', '53520': '9018876', '53521': '9018877', '53522': '9018878', '53523': '9018879', '53525': '9018880', '53526': '9018881', '53527': '9018882', '53528': '9018883', '53529': '9018884', '53530': '9018885', '53531': '9018886', '53532': '9018887', '53533': '9018888', '53534': '9018889', '53536': '9018890', '53538': '9018892', '53541': '9018893', '53543': '9018894', '53544': '9018895', '53545': '9018896', '53546': '9018897', '53548': '9018898', '53549': '9018899', '53550': '9018900', '53551': '9018901', '53553': '9018902', '53554': '9018903', '53555': '9018904', '53556': '9018905', '53557': '9018906', '53558': '9018907', '53559': '9018908', '53560': '9018909', '53561': '9018910', '53562': '9018911', '53563': '9018912', '53565': '9018913', '53566': '9018914', '53569': '9018915', '53570': '9018916', '53572': '9018917', '53573': '9018918', '53574': '9018919', '53575': '9018920', '53576': '9018921', '53577': '9018922', '53578': '9018923', '53579': '9018924', '53580': '9018925', '53581': '9018926', '53582': '9018927', '53583': '9018928', '53585': '9018929', '53586': '9018930', '53587': '9018931', '53588': '9018932', '53589': '9018933', '53590': '9018934', '53593': '9018935', '53594': '9018936', '53596': '9018937', '53597': '9018938', '53598': '9018939', '53703': '9018941', '53704': '9018942', '53705': '9018943', '53706': '9018944', '53711': '9018945', '53713': '9018946', '53714': '9018947', '53715': '9018948', '53716': '9018949', '53717': '9018950', '53718': '9018951', '53719': '9018952', '53726': '9018953', '53779': '9018954', '53783': '9018955', '53788': '9018956', '53792': '9018957', '53801': '9018958', '53803': '9018959', '53804': '9018960', '53805': '9018961', '53806': '9018962', '53807': '9018963', '53808': '9018964', '53809': '9018965', '53810': '9018966', '53811': '9018967', '53813': '9018968', '53816': '9018969', '53817': '9018970', '53818': '9018971', '53820': '9018972', '53821': '9018973', '53825': '9018974', '53826': '9018975', '53827': '9018976', '53901': '9018977', '53910': '9018978', '53911': '9018979', '53913': '9018980', '53916': '9018981', '53919': '9018982', '53920': '9018983', '53922': '9018984', '53923': '9018985', '53924': '9018986', '53925': '9018987', '53926': '9018988', '53929': '9018989', '53930': '9018990', '53932': '9018991', '53933': '9018992', '53934': '9018993', '53935': '9018994', '53936': '9018995', '53937': '9018996', '53941': '9018998', '53943': '9018999', '53944': '9019000', '53946': '9019001', '53948': '9019002', '53949': '9019003', '53950': '9019004', '53951': '9019005', '53952': '9019006', '53954': '9019008', '53955': '9019009', '53956': '9019010', '53959': '9019011', '53960': '9019012', '53961': '9019013', '53963': '9019014', '53964': '9019015', '53965': '9019016', '53968': '9019017', '53969': '9019018', '54001': '9019019', '54002': '9019020', '54003': '9019021', '54004': '9019022', '54005': '9019023', '54006': '9019024', '54007': '9019025', '54009': '9019026', '54011': '9019027', '54013': '9019028', '54014': '9019029', '54015': '9019030', '54016': '9019031', '54017': '9019032', '54020': '9019033', '54021': '9019034', '54022': '9019035', '54023': '9019036', '54024': '9019037', '54025': '9019038', '54026': '9019039', '54027': '9019040', '54028': '9019041', '54082': '9019042', '54101': '9019043', '54102': '9019044', '54103': '9019045', '54104': '9019046', '54106': '9019047', '54107': '9019048', '54110': '9019049', '54111': '9019050', '54112': '9019051', '54113': '9019052', '54114': '9019053', '54115': '9019054', '54119': '9019055', '54120': '9019056', '54121': '9019057', '54123': '9019058', '54124': '9019059', '54125': '9019060', '54126': '9019061', '54128': '9019062', '54129': '9019063', '54130': '9019064', '54135': '9019065', '54136': '9019066', '54137': '9019067', '54138': '9019068', '54139': '9019069', '54140': '9019070', '54141': '9019071', '54143': '9019072', '54149': '9019073', '54150': '9019074', '54151': '9019075', '54153': '9019076', '54154': '9019077', '54155': '9019078', '54156': '9019079', '54157': '9019080', '54159': '9019081', '54160': '9019082', '54161': '9019083', '54162': '9019084', '54165': '9019085', '54166': '9019086', '54169': '9019087', '54170': '9019088', '54171': '9019089', '54173': '9019090', '54174': '9019091', '54175': '9019092', '54177': '9019093', '54180': '9019094', '54201': '9019095', '54202': '9019096', '54204': '9019097', '54205': '9019098', '54207': '9019099', '54208': '9019100', '54209': '9019101', '54210': '9019102', '54212': '9019104', '54213': '9019105', '54216': '9019107', '54217': '9019108', '54220': '9019109', '54227': '9019110', '54228': '9019111', '54229': '9019112', '54230': '9019113', '54234': '9019115', '54235': '9019116', '54241': '9019117', '54245': '9019118', '54246': '9019119', '54247': '9019120', '54301': '9019121', '54302': '9019122', '54303': '9019123', '54304': '9019124', '54311': '9019126', '54313': '9019127', '54344': '9019128', '54401': '9019129', '54403': '9019130', '54404': '9019131', '54405': '9019132', '54406': '9019133', '54407': '9019134', '54408': '9019135', '54409': '9019136', '54410': '9019137', '54411': '9019138', '54412': '9019139', '54413': '9019140', '54414': '9019141', '54416': '9019142', '54417': '9019143', '54418': '9019144', '54420': '9019145', '54421': '9019146', '54422': '9019147', '54423': '9019148', '54424': '9019149', '54425': '9019150', '54426': '9019151', '54427': '9019152', '54428': '9019153', '54430': '9019154', '54433': '9019155', '54435': '9019156', '54436': '9019157', '54437': '9019158', '54440': '9019159', '54441': '9019160', '54442': '9019161', '54443': '9019162', '54446': '9019163', '54447': '9019164', '54448': '9019165', '54449': '9019166', '54451': '9019168', '54452': '9019169', '54454': '9019170', '54455': '9019171', '54456': '9019172', '54457': '9019173', '54459': '9019175', '54460': '9019176', '54462': '9019177', '54463': '9019178', '54465': '9019179', '54466': '9019180', '54467': '9019181', '54469': '9019182', '54470': '9019183', '54471': '9019184', '54473': '9019185', '54474': '9019186', '54475': '9019187', '54476': '9019188', '54479': '9019189', '54480': '9019190', '54481': '9019191', '54482': '9019192', '54484': '9019193', '54485': '9019194', '54486': '9019195', '54487': '9019196', '54488': '9019197', '54489': '9019198', '54490': '9019199', '54491': '9019200', '54492': '9019201', '54493': '9019202', '54494': '9019203', '54495': '9019204', '54498': '9019205', '54499': '9019206', '54501': '9019207', '54511': '9019208', '54512': '9019209', '54513': '9019210', '54514': '9019211', '54515': '9019212', '54517': '9019213', '54519': '9019214', '54520': '9019215', '54521': '9019216', '54524': '9019217', '54525': '9019218', '54526': '9019219', '54527': '9019220', '54529': '9019221', '54530': '9019222', '54531': '9019223', '54534': '9019224', '54537': '9019225', '54538': '9019226', '54539': '9019227', '54540': '9019228', '54541': '9019229', '54542': '9019230', '54545': '9019231', '54546': '9019232', '54547': '9019233', '54548': '9019234', '54550': '9019235', '54552': '9019236', '54554': '9019237', '54555': '9019238', '54556': '9019239', '54557': '9019240', '54558': '9019241', '54559': '9019242', '54560': '9019243', '54561': '9019244', '54562': '9019245', '54563': '9019246', '54564': '9019247', '54565': '9019248', '54566': '9019249', '54568': '9019250', '54601': '9019251', '54603': '9019252', '54610': '9019253', '54611': '9019254', '54612': '9019255', '54613': '9019256', '54614': '9019257', '54615': '9019258', '54616': '9019259', '54618': '9019260', '54619': '9019261', '54621': '9019262', '54622': '9019263', '54623': '9019264', '54624': '9019265', '54625': '9019266', '54626': '9019267', '54627': '9019268', '54628': '9019269', '54629': '9019270', '54630': '9019271', '54631': '9019272', '54632': '9019273', '54634': '9019274', '54635': '9019275', '54636': '9019276', '54637': '9019277', '54638': '9019278', '54639': '9019279', '54642': '9019280', '54644': '9019281', '54646': '9019282', '54648': '9019283', '54650': '9019284', '54651': '9019285', '54652': '9019286', '54653': '9019287', '54655': '9019288', '54656': '9019289', '54657': '9019290', '54658': '9019291', '54659': '9019292', '54660': '9019293', '54661': '9019294', '54664': '9019295', '54665': '9019296', '54666': '9019297', '54667': '9019298', '54669': '9019299', '54670': '9019300', '54701': '9019301', '54703': '9019303', '54720': '9019304', '54721': '9019305', '54722': '9019306', '54723': '9019307', '54724': '9019308', '54725': '9019309', '54726': '9019310', '54727': '9019311', '54728': '9019312', '54729': '9019313', '54730': '9019314', '54731': '9019315', '54732': '9019316', '54733': '9019317', '54734': '9019318', '54736': '9019319', '54737': '9019320', '54738': '9019321', '54739': '9019322', '54740': '9019323', '54741': '9019324', '54742': '9019325', '54745': '9019326', '54746': '9019327', '54747': '9019328', '54748': '9019329', '54749': '9019330', '54750': '9019331', '54751': '9019332', '54754': '9019333', '54755': '9019334', '54756': '9019335', '54757': '9019336', '54758': '9019337', '54759': '9019338', '54761': '9019339', '54762': '9019340', '54763': '9019341', '54766': '9019342', '54767': '9019343', '54768': '9019344', '54769': '9019345', '54770': '9019346', '54771': '9019347', '54772': '9019348', '54773': '9019349', '54801': '9019350', '54805': '9019351', '54806': '9019352', '54810': '9019353', '54812': '9019354', '54813': '9019355', '54814': '9019356', '54817': '9019357', '54819': '9019358', '54820': '9019359', '54821': '9019360', '54822': '9019361', '54824': '9019362', '54826': '9019363', '54827': '9019364', '54828': '9019365', '54829': '9019366', '54830': '9019367', '54832': '9019368', '54835': '9019369', '54836': '9019370', '54837': '9019371', '54838': '9019372', '54839': '9019373', '54840': '9019374', '54841': '9019375', '54843': '9019376', '54844': '9019377', '54845': '9019378', '54846': '9019379', '54847': '9019380', '54848': '9019381', '54849': '9019382', '54850': '9019383', '54853': '9019384', '54854': '9019385', '54855': '9019386', '54856': '9019387', '54858': '9019388', '54859': '9019389', '54862': '9019391', '54864': '9019392', '54865': '9019393', '54867': '9019394', '54868': '9019395', '54870': '9019396', '54871': '9019397', '54872': '9019398', '54873': '9019399', '54874': '9019400', '54875': '9019401', '54876': '9019402', '54880': '9019403', '54888': '9019404', '54889': '9019405', '54891': '9019406', '54893': '9019407', '54895': '9019408', '54896': '9019409', '54901': '9019410', '54902': '9019411', '54904': '9019412', '54909': '9019413', '54911': '9019414', '54913': '9019415', '54914': '9019416', '54915': '9019417', '54919': '9019418', '54921': '9019419', '54922': '9019420', '54923': '9019421', '54928': '9019423', '54929': '9019424', '54930': '9019425', '54932': '9019426', '54933': '9019427', '54935': '9019428', '54937': '9019429', '54940': '9019430', '54941': '9019431', '54942': '9019432', '54943': '9019433', '54944': '9019434', '54945': '9019435', '54947': '9019436', '54948': '9019437', '54949': '9019438', '54950': '9019439', '54952': '9019440', '54956': '9019441', '54960': '9019443', '54961': '9019444', '54962': '9019445', '54963': '9019446', '54964': '9019447', '54965': '9019448', '54966': '9019449', '54967': '9019450', '54968': '9019451', '54970': '9019452', '54971': '9019453', '54974': '9019454', '54977': '9019455', '54978': '9019456', '54979': '9019457', '54981': '9019459', '54982': '9019460', '54983': '9019461', '54984': '9019462', '54986': '9019464', '54990': '9019465', '55001': '9019466', '55003': '9019467', '55005': '9019468', '55006': '9019469', '55007': '9019470', '55008': '9019471', '55009': '9019472', '55011': '9019473', '55012': '9019474', '55013': '9019475', '55014': '9019476', '55016': '9019477', '55017': '9019478', '55018': '9019479', '55019': '9019480', '55020': '9019481', '55021': '9019482', '55024': '9019483', '55025': '9019484', '55026': '9019485', '55027': '9019486', '55030': '9019487', '55031': '9019488', '55032': '9019489', '55033': '9019490', '55036': '9019491', '55037': '9019492', '55038': '9019493', '55040': '9019494', '55041': '9019495', '55042': '9019496', '55043': '9019497', '55044': '9019498', '55045': '9019499', '55046': '9019500', '55047': '9019501', '55049': '9019502', '55051': '9019503', '55052': '9019504', '55053': '9019505', '55054': '9019506', '55055': '9019507', '55056': '9019508', '55057': '9019509', '55060': '9019510', '55063': '9019511', '55065': '9019512', '55066': '9019513', '55068': '9019514', '55069': '9019515', '55070': '9019516', '55071': '9019517', '55072': '9019518', '55073': '9019519', '55074': '9019520', '55075': '9019521', '55076': '9019522', '55077': '9019523', '55079': '9019524', '55080': '9019525', '55082': '9019526', '55084': '9019527', '55085': '9019528', '55087': '9019529', '55088': '9019530', '55089': '9019531', '55092': '9019533', '55101': '9019534', '55102': '9019535', '55103': '9019536', '55104': '9019537', '55105': '9019538', '55106': '9019539', '55107': '9019540', '55108': '9019541', '55109': '9019542', '55110': '9019543', '55111': '9019544', '55112': '9019545', '55113': '9019546', '55114': '9019547', '55115': '9019548', '55116': '9019549', '55117': '9019550', '55118': '9019551', '55119': '9019552', '55120': '9019553', '55121': '9019554', '55122': '9019555', '55123': '9019556', '55124': '9019557', '55125': '9019558', '55126': '9019559', '55127': '9019560', '55128': '9019561', '55129': '9019562', '55130': '9019563', '55144': '9019564', '55146': '9019565', '55150': '9019566', '55155': '9019567', '55301': '9019568', '55302': '9019569', '55303': '9019570', '55304': '9019571', '55305': '9019572', '55306': '9019573', '55307': '9019574', '55308': '9019575', '55309': '9019576', '55310': '9019577', '55311': '9019578', '55312': '9019579', '55313': '9019580', '55314': '9019581', '55315': '9019582', '55316': '9019583', '55317': '9019584', '55318': '9019585', '55319': '9019586', '55320': '9019587', '55321': '9019588', '55322': '9019589', '55324': '9019590', '55325': '9019591', '55327': '9019592', '55328': '9019593', '55329': '9019594', '55330': '9019595', '55331': '9019596', '55332': '9019597', '55333': '9019598', '55334': '9019599', '55335': '9019600', '55336': '9019601', '55337': '9019602', '55338': '9019603', '55339': '9019604', '55340': '9019605', '55341': '9019606', '55342': '9019607', '55343': '9019608', '55344': '9019609', '55345': '9019610', '55346': '9019611', '55347': '9019612', '55349': '9019613', '55350': '9019614', '55352': '9019615', '55353': '9019616', '55354': '9019617', '55355': '9019618', '55356': '9019619', '55357': '9019620', '55358': '9019621', '55359': '9019622', '55360': '9019623', '55362': '9019624', '55363': '9019625', '55364': '9019626', '55366': '9019627', '55367': '9019628', '55368': '9019629', '55369': '9019630', '55370': '9019631', '55371': '9019632', '55372': '9019633', '55373': '9019634', '55374': '9019635', '55375': '9019636', '55376': '9019637', '55378': '9019638', '55379': '9019639', '55381': '9019640', '55382': '9019641', '55384': '9019642', '55385': '9019643', '55386': '9019644', '55387': '9019645', '55388': '9019646', '55389': '9019647', '55390': '9019648', '55391': '9019649', '55395': '9019650', '55396': '9019651', '55397': '9019652', '55398': '9019653', '55401': '9019654', '55402': '9019655', '55403': '9019656', '55404': '9019657', '55405': '9019658', '55406': '9019659', '55407': '9019660', '55408': '9019661', '55409': '9019662', '55410': '9019663', '55411': '9019664', '55412': '9019665', '55413': '9019666', '55414': '9019667', '55415': '9019668', '55416': '9019669', '55417': '9019670', '55418': '9019671', '55419': '9019672', '55420': '9019673', '55421': '9019674', '55422': '9019675', '55423': '9019676', '55424': '9019677', '55425': '9019678', '55426': '9019679', '55427': '9019680', '55428': '9019681', '55429': '9019682', '55430': '9019683', '55431': '9019684', '55432': '9019685', '55433': '9019686', '55434': '9019687', '55435': '9019688', '55436': '9019689', '55437': '9019690', '55438': '9019691', '55439': '9019692', '55441': '9019693', '55442': '9019694', '55443': '9019695', '55444': '9019696', '55445': '9019697', '55446': '9019698', '55447': '9019699', '55448': '9019700', '55449': '9019701', '55450': '9019702', '55454': '9019703', '55455': '9019704', '55479': '9019705', '55602': '9019706', '55603': '9019707', '55604': '9019708', '55605': '9019709', '55606': '9019710', '55607': '9019711', '55609': '9019712', '55612': '9019713', '55613': '9019714', '55614': '9019715', '55615': '9019716', '55616': '9019717', '55702': '9019718', '55703': '9019719', '55704': '9019720', '55705': '9019721', '55706': '9019722', '55707': '9019723', '55708': '9019724', '55709': '9019725', '55710': '9019726', '55711': '9019727', '55712': '9019728', '55717': '9019729', '55718': '9019730', '55719': '9019731', '55720': '9019732', '55721': '9019733', '55722': '9019734', '55723': '9019735', '55724': '9019736', '55725': '9019737', '55726': '9019738', '55731': '9019739', '55732': '9019740', '55733': '9019741', '55734': '9019742', '55735': '9019743', '55736': '9019744', '55738': '9019745', '55741': '9019746', '55742': '9019747', '55744': '9019748', '55746': '9019749', '55748': '9019750', '55749': '9019751', '55750': '9019752', '55751': '9019753', '55752': '9019754', '55756': '9019756', '55757': '9019757', '55758': '9019758', '55760': '9019759', '55763': '9019760', '55765': '9019762', '55767': '9019763', '55768': '9019764', '55769': '9019765', '55771': '9019766', '55775': '9019767', '55779': '9019768', '55780': '9019769', '55781': '9019770', '55782': '9019771', '55783': '9019772', '55784': '9019773', '55785': '9019774', '55787': '9019776', '55790': '9019777', '55792': '9019778', '55793': '9019779', '55795': '9019780', '55797': '9019782', '55798': '9019783', '55802': '9019784', '55803': '9019785', '55804': '9019786', '55805': '9019787', '55806': '9019788', '55807': '9019789', '55808': '9019790', '55810': '9019791', '55811': '9019792', '55812': '9019793', '55901': '9019794', '55902': '9019795', '55904': '9019796', '55905': '9019797', '55906': '9019798', '55909': '9019799', '55910': '9019800', '55912': '9019801', '55917': '9019802', '55918': '9019803', '55919': '9019804', '55920': '9019805', '55921': '9019806', '55922': '9019807', '55923': '9019808', '55924': '9019809', '55925': '9019810', '55926': '9019811', '55927': '9019812', '55929': '9019813', '55931': '9019814', '55932': '9019815', '55933': '9019816', '55934': '9019817', '55935': '9019818', '55936': '9019819', '55939': '9019820', '55940': '9019821', '55941': '9019822', '55943': '9019823', '55944': '9019824', '55945': '9019825', '55946': '9019826', '55947': '9019827', '55949': '9019828', '55951': '9019830', '55952': '9019831', '55953': '9019832', '55954': '9019833', '55955': '9019834', '55956': '9019835', '55957': '9019836', '55959': '9019837', '55960': '9019838', '55961': '9019839', '55962': '9019840', '55963': '9019841', '55964': '9019842', '55965': '9019843', '55967': '9019844', '55968': '9019845', '55969': '9019846', '55970': '9019847', '55971': '9019848', '55972': '9019849', '55973': '9019850', '55974': '9019851', '55975': '9019852', '55976': '9019853', '55977': '9019854', '55979': '9019855', '55981': '9019856', '55982': '9019857', '55983': '9019858', '55985': '9019859', '55987': '9019860', '55990': '9019861', '55991': '9019862', '55992': '9019863', '56001': '9019864', '56003': '9019865', '56007': '9019866', '56009': '9019867', '56010': '9019868', '56011': '9019869', '56013': '9019870', '56014': '9019871', '56016': '9019872', '56017': '9019873', '56019': '9019874', '56021': '9019875', '56023': '9019876', '56024': '9019877', '56025': '9019878', '56026': '9019879', '56027': '9019880', '56028': '9019881', '56029': '9019882', '56031': '9019883', '56033': '9019884', '56034': '9019885', '56036': '9019887', '56037': '9019888', '56039': '9019889', '56041': '9019890', '56042': '9019891', '56043': '9019892', '56044': '9019893', '56045': '9019894', '56046': '9019895', '56048': '9019896', '56050': '9019897', '56051': '9019898', '56052': '9019899', '56054': '9019900', '56055': '9019901', '56057': '9019902', '56058': '9019903', '56060': '9019904', '56062': '9019905', '56063': '9019906', '56065': '9019907', '56068': '9019908', '56069': '9019909', '56071': '9019910', '56072': '9019911', '56073': '9019912', '56074': '9019913', '56078': '9019914', '56080': '9019915', '56081': '9019916', '56082': '9019917', '56083': '9019918', '56085': '9019919', '56087': '9019920', '56088': '9019921', '56089': '9019922', '56090': '9019923', '56091': '9019924', '56093': '9019925', '56096': '9019926', '56097': '9019927', '56098': '9019928', '56101': '9019929', '56110': '9019930', '56111': '9019931', '56113': '9019932', '56114': '9019933', '56115': '9019934', '56116': '9019935', '56117': '9019936', '56118': '9019937', '56119': '9019938', '56120': '9019939', '56121': '9019940', '56122': '9019941', '56123': '9019942', '56127': '9019943', '56128': '9019944', '56129': '9019945', '56131': '9019946', '56132': '9019947', '56134': '9019948', '56136': '9019949', '56137': '9019950', '56138': '9019951', '56139': '9019952', '56140': '9019953', '56141': '9019954', '56142': '9019955', '56143': '9019956', '56144': '9019957', '56145': '9019958', '56147': '9019959', '56149': '9019960', '56150': '9019961', '56151': '9019962', '56152': '9019963', '56155': '9019965', '56156': '9019966', '56157': '9019967', '56158': '9019968', '56159': '9019969', '56160': '9019970', '56161': '9019971', '56162': '9019972', '56164': '9019973', '56165': '9019974', '56166': '9019975', '56167': '9019976', '56168': '9019977', '56169': '9019978', '56170': '9019979', '56171': '9019980', '56172': '9019981', '56173': '9019982', '56174': '9019983', '56175': '9019984', '56176': '9019985', '56178': '9019986', '56180': '9019987', '56181': '9019988', '56183': '9019989', '56185': '9019990', '56186': '9019991', '56187': '9019992', '56201': '9019993', '56207': '9019994', '56208': '9019995', '56209': '9019996', '56210': '9019997', '56211': '9019998', '56212': '9019999', '56214': '9020000', '56215': '9020001', '56216': '9020002', '56218': '9020003', '56219': '9020004', '56220': '9020005', '56221': '9020006', '56222': '9020007', '56223': '9020008', '56224': '9020009', '56225': '9020010', '56226': '9020011', '56227': '9020012', '56228': '9020013', '56229': '9020014', '56230': '9020015', '56231': '9020016', '56232': '9020017', '56235': '9020018', '56236': '9020019', '56237': '9020020', '56239': '9020021', '56240': '9020022', '56241': '9020023', '56243': '9020024', '56244': '9020025', '56245': '9020026', '56248': '9020027', '56249': '9020028', '56251': '9020029', '56252': '9020030', '56253': '9020031', '56255': '9020032', '56256': '9020033', '56257': '9020034', '56258': '9020035', '56260': '9020036', '56262': '9020037', '56263': '9020038', '56264': '9020039', '56265': '9020040', '56266': '9020041', '56267': '9020042', '56270': '9020043', '56271': '9020044', '56273': '9020045', '56274': '9020046', '56276': '9020047', '56277': '9020048', '56278': '9020049', '56279': '9020050', '56280': '9020051', '56281': '9020052', '56282': '9020053', '56283': '9020054', '56284': '9020055', '56285': '9020056', '56287': '9020057', '56288': '9020058', '56289': '9020059', '56291': '9020060', '56292': '9020061', '56293': '9020062', '56295': '9020063', '56296': '9020064', '56297': '9020065', '56301': '9020066', '56303': '9020067', '56304': '9020068', '56307': '9020069', '56308': '9020070', '56309': '9020071', '56310': '9020072', '56311': '9020073', '56312': '9020074', '56314': '9020076', '56315': '9020077', '56316': '9020078', '56318': '9020080', '56319': '9020081', '56320': '9020082', '56323': '9020083', '56324': '9020084', '56326': '9020086', '56327': '9020087', '56329': '9020089', '56330': '9020090', '56331': '9020091', '56332': '9020092', '56334': '9020093', '56336': '9020094', '56338': '9020095', '56339': '9020096', '56340': '9020097', '56342': '9020098', '56343': '9020099', '56345': '9020100', '56347': '9020101', '56349': '9020102', '56350': '9020103', '56352': '9020104', '56353': '9020105', '56354': '9020106', '56355': '9020107', '56357': '9020109', '56358': '9020110', '56359': '9020111', '56360': '9020112', '56361': '9020113', '56362': '9020114', '56364': '9020115', '56367': '9020116', '56368': '9020117', '56371': '9020119', '56373': '9020120', '56374': '9020121', '56375': '9020122', '56377': '9020124', '56378': '9020125', '56379': '9020126', '56381': '9020127', '56382': '9020128', '56384': '9020129', '56385': '9020130', '56386': '9020131', '56387': '9020132', '56389': '9020133', '56401': '9020135', '56425': '9020136', '56431': '9020137', '56433': '9020138', '56434': '9020139', '56435': '9020140', '56437': '9020141', '56438': '9020142', '56440': '9020143', '56441': '9020144', '56442': '9020145', '56443': '9020146', '56444': '9020147', '56446': '9020148', '56447': '9020149', '56448': '9020150', '56449': '9020151', '56450': '9020152', '56452': '9020153', '56453': '9020154', '56455': '9020155', '56458': '9020156', '56461': '9020157', '56464': '9020158', '56465': '9020159', '56466': '9020160', '56467': '9020161', '56468': '9020162', '56469': '9020163', '56470': '9020164', '56472': '9020165', '56473': '9020166', '56474': '9020167', '56475': '9020168', '56477': '9020169', '56479': '9020170', '56481': '9020171', '56482': '9020172', '56484': '9020173', '56501': '9020174', '56510': '9020175', '56511': '9020176', '56514': '9020177', '56515': '9020178', '56516': '9020179', '56517': '9020180', '56518': '9020181', '56519': '9020182', '56520': '9020183', '56521': '9020184', '56522': '9020185', '56523': '9020186', '56524': '9020187', '56527': '9020188', '56528': '9020189', '56529': '9020190', '56531': '9020191', '56533': '9020192', '56534': '9020193', '56535': '9020194', '56536': '9020195', '56537': '9020196', '56540': '9020197', '56542': '9020198', '56543': '9020199', '56544': '9020200', '56545': '9020201', '56546': '9020202', '56547': '9020203', '56548': '9020204', '56549': '9020205', '56550': '9020206', '56551': '9020207', '56552': '9020208', '56553': '9020209', '56554': '9020210', '56556': '9020211', '56557': '9020212', '56560': '9020213', '56563': '9020214', '56565': '9020215', '56566': '9020216', '56567': '9020217', '56568': '9020218', '56569': '9020219', '56570': '9020220', '56571': '9020221', '56572': '9020222', '56573': '9020223', '56574': '9020224', '56575': '9020225', '56576': '9020226', '56578': '9020227', '56579': '9020228', '56580': '9020229', '56581': '9020230', '56583': '9020231', '56584': '9020232', '56585': '9020233', '56586': '9020234', '56587': '9020235', '56588': '9020236', '56589': '9020237', '56590': '9020238', '56592': '9020239', '56594': '9020240', '56601': '9020241', '56621': '9020242', '56623': '9020243', '56626': '9020244', '56627': '9020245', '56628': '9020246', '56629': '9020247', '56630': '9020248', '56633': '9020249', '56634': '9020250', '56636': '9020251', '56637': '9020252', '56639': '9020253', '56641': '9020254', '56644': '9020255', '56646': '9020256', '56647': '9020257', '56649': '9020258', '56650': '9020259', '56651': '9020260', '56652': '9020261', '56653': '9020262', '56654': '9020263', '56655': '9020264', '56657': '9020265', '56659': '9020266', '56660': '9020267', '56661': '9020268', '56662': '9020269', '56663': '9020270', '56666': '9020271', '56667': '9020272', '56669': '9020273', '56670': '9020274', '56671': '9020275', '56672': '9020276', '56673': '9020277', '56676': '9020278', '56678': '9020279', '56680': '9020280', '56681': '9020281', '56683': '9020282', '56684': '9020283', '56685': '9020284', '56686': '9020285', '56688': '9020286', '56701': '9020287', '56710': '9020288', '56711': '9020289', '56713': '9020291', '56714': '9020292', '56715': '9020293', '56716': '9020294', '56721': '9020295', '56722': '9020296', '56723': '9020297', '56724': '9020298', '56725': '9020299', '56726': '9020300', '56727': '9020301', '56728': '9020302', '56729': '9020303', '56731': '9020304', '56732': '9020305', '56733': '9020306', '56734': '9020307', '56735': '9020308', '56736': '9020309', '56737': '9020310', '56738': '9020311', '56741': '9020312', '56742': '9020313', '56744': '9020314', '56748': '9020315', '56750': '9020316', '56751': '9020317', '56754': '9020318', '56755': '9020319', '56756': '9020320', '56757': '9020321', '56758': '9020322', '56759': '9020323', '56760': '9020324', '56761': '9020325', '56762': '9020326', '56763': '9020327', '57001': '9020328', '57002': '9020329', '57003': '9020330', '57004': '9020331', '57005': '9020332', '57006': '9020333', '57010': '9020334', '57012': '9020335', '57013': '9020336', '57014': '9020337', '57015': '9020338', '57016': '9020339', '57017': '9020340', '57018': '9020341', '57020': '9020342', '57021': '9020343', '57022': '9020344', '57024': '9020345', '57025': '9020346', '57026': '9020347', '57027': '9020348', '57028': '9020349', '57029': '9020350', '57030': '9020351', '57031': '9020352', '57032': '9020353', '57033': '9020354', '57034': '9020355', '57035': '9020356', '57036': '9020357', '57037': '9020358', '57038': '9020359', '57039': '9020360', '57040': '9020361', '57041': '9020362', '57042': '9020363', '57043': '9020364', '57045': '9020365', '57046': '9020366', '57047': '9020367', '57048': '9020368', '57049': '9020369', '57050': '9020370', '57051': '9020371', '57052': '9020372', '57053': '9020373', '57054': '9020374', '57055': '9020375', '57057': '9020376', '57058': '9020377', '57059': '9020378', '57061': '9020379', '57062': '9020380', '57063': '9020381', '57064': '9020382', '57065': '9020383', '57066': '9020384', '57067': '9020385', '57068': '9020386', '57069': '9020387', '57070': '9020388', '57071': '9020389', '57072': '9020390', '57073': '9020391', '57075': '9020392', '57076': '9020393', '57077': '9020394', '57078': '9020395', '57103': '9020396', '57104': '9020397', '57105': '9020398', '57106': '9020399', '57107': '9020400', '57108': '9020401', '57110': '9020402', '57197': '9020403', '57201': '9020404', '57212': '9020405', '57213': '9020406', '57216': '9020407', '57217': '9020408', '57218': '9020409', '57219': '9020410', '57220': '9020411', '57221': '9020412', '57223': '9020413', '57225': '9020415', '57226': '9020416', '57227': '9020417', '57231': '9020418', '57232': '9020419', '57233': '9020420', '57234': '9020421', '57235': '9020422', '57236': '9020423', '57237': '9020424', '57238': '9020425', '57239': '9020426', '57241': '9020427', '57242': '9020428', '57243': '9020429', '57246': '9020431', '57247': '9020432', '57248': '9020433', '57249': '9020434', '57251': '9020435', '57252': '9020436', '57255': '9020437', '57256': '9020438', '57257': '9020439', '57258': '9020440', '57259': '9020441', '57260': '9020442', '57261': '9020443', '57262': '9020444', '57263': '9020445', '57264': '9020446', '57265': '9020447', '57266': '9020448', '57268': '9020449', '57269': '9020450', '57270': '9020451', '57271': '9020452', '57272': '9020453', '57273': '9020454', '57274': '9020455', '57276': '9020456', '57278': '9020457', '57279': '9020458', '57301': '9020459', '57311': '9020460', '57312': '9020461', '57313': '9020462', '57314': '9020463', '57315': '9020464', '57317': '9020465', '57319': '9020466', '57321': '9020467', '57322': '9020468', '57323': '9020469', '57324': '9020470', '57325': '9020471', '57328': '9020472', '57329': '9020473', '57330': '9020474', '57331': '9020475', '57332': '9020476', '57334': '9020477', '57335': '9020478', '57337': '9020479', '57339': '9020480', '57340': '9020481', '57341': '9020482', '57342': '9020483', '57344': '9020484', '57345': '9020485', '57348': '9020486', '57349': '9020487', '57350': '9020488', '57353': '9020489', '57355': '9020490', '57356': '9020491', '57359': '9020492', '57362': '9020493', '57363': '9020494', '57364': '9020495', '57365': '9020496', '57366': '9020497', '57367': '9020498', '57368': '9020499', '57369': '9020500', '57370': '9020501', '57371': '9020502', '57373': '9020503', '57374': '9020504', '57375': '9020505', '57376': '9020506', '57379': '9020507', '57380': '9020508', '57381': '9020509', '57382': '9020510', '57383': '9020511', '57384': '9020512', '57385': '9020513', '57386': '9020514', '57399': '9020515', '57401': '9020516', '57421': '9020517', '57422': '9020518', '57424': '9020519', '57426': '9020520', '57427': '9020521', '57428': '9020522', '57430': '9020523', '57432': '9020524', '57433': '9020525', '57434': '9020526', '57435': '9020527', '57436': '9020528', '57437': '9020529', '57438': '9020530', '57440': '9020531', '57441': '9020532', '57442': '9020533', '57445': '9020534', '57446': '9020535', '57448': '9020536', '57449': '9020537', '57450': '9020538', '57451': '9020539', '57452': '9020540', '57454': '9020541', '57455': '9020542', '57456': '9020543', '57457': '9020544', '57460': '9020545', '57461': '9020546', '57465': '9020548', '57466': '9020549', '57467': '9020550', '57468': '9020551', '57469': '9020552', '57470': '9020553', '57471': '9020554', '57472': '9020555', '57473': '9020556', '57474': '9020557', '57475': '9020558', '57476': '9020559', '57477': '9020560', '57479': '9020561', '57481': '9020562', '57501': '9020563', '57520': '9020564', '57521': '9020565', '57522': '9020566', '57523': '9020567', '57528': '9020568', '57529': '9020569', '57531': '9020570', '57532': '9020571', '57533': '9020572', '57534': '9020573', '57536': '9020574', '57537': '9020575', '57538': '9020576', '57540': '9020577', '57541': '9020578', '57543': '9020580', '57544': '9020581', '57547': '9020582', '57548': '9020583', '57551': '9020584', '57552': '9020585', '57553': '9020586', '57555': '9020587', '57559': '9020588', '57560': '9020589', '57562': '9020590', '57564': '9020592', '57566': '9020593', '57567': '9020594', '57568': '9020595', '57569': '9020596', '57570': '9020597', '57571': '9020598', '57572': '9020599', '57574': '9020600', '57576': '9020601', '57577': '9020602', '57579': '9020604', '57580': '9020605', '57584': '9020606', '57585': '9020607', '57601': '9020608', '57620': '9020609', '57621': '9020610', '57622': '9020611', '57623': '9020612', '57625': '9020613', '57626': '9020614', '57630': '9020616', '57631': '9020617', '57632': '9020618', '57633': '9020619', '57634': '9020620', '57636': '9020621', '57638': '9020622', '57639': '9020623', '57640': '9020624', '57641': '9020625', '57642': '9020626', '57644': '9020627', '57645': '9020628', '57646': '9020629', '57648': '9020630', '57649': '9020631', '57650': '9020632', '57651': '9020633', '57652': '9020634', '57656': '9020635', '57657': '9020636', '57658': '9020637', '57659': '9020638', '57660': '9020639', '57661': '9020640', '57701': '9020641', '57702': '9020642', '57703': '9020643', '57706': '9020644', '57714': '9020645', '57716': '9020646', '57717': '9020647', '57718': '9020648', '57719': '9020649', '57720': '9020650', '57722': '9020651', '57724': '9020652', '57725': '9020653', '57730': '9020654', '57732': '9020655', '57735': '9020656', '57737': '9020658', '57738': '9020659', '57741': '9020660', '57744': '9020661', '57745': '9020662', '57747': '9020663', '57748': '9020664', '57750': '9020665', '57751': '9020666', '57752': '9020667', '57754': '9020668', '57755': '9020669', '57756': '9020670', '57758': '9020671', '57759': '9020672', '57760': '9020673', '57761': '9020674', '57762': '9020675', '57763': '9020676', '57764': '9020677', '57766': '9020678', '57767': '9020679', '57769': '9020680', '57770': '9020681', '57772': '9020682', '57775': '9020684', '57779': '9020686', '57780': '9020687', '57783': '9020688', '57785': '9020689', '57787': '9020690', '57788': '9020691', '57790': '9020692', '57791': '9020693', '57792': '9020694', '57793': '9020695', '57794': '9020696', '57799': '9020697', '58001': '9020698', '58002': '9020699', '58004': '9020700', '58005': '9020701', '58006': '9020702', '58007': '9020703', '58008': '9020704', '58009': '9020705', '58011': '9020706', '58012': '9020707', '58013': '9020708', '58015': '9020709', '58016': '9020710', '58017': '9020711', '58018': '9020712', '58021': '9020713', '58027': '9020714', '58029': '9020715', '58030': '9020716', '58031': '9020717', '58032': '9020718', '58033': '9020719', '58035': '9020720', '58036': '9020721', '58038': '9020722', '58040': '9020723', '58041': '9020724', '58042': '9020725', '58043': '9020726', '58045': '9020727', '58046': '9020728', '58047': '9020729', '58048': '9020730', '58049': '9020731', '58051': '9020732', '58052': '9020733', '58053': '9020734', '58054': '9020735', '58056': '9020736', '58057': '9020737', '58058': '9020738', '58059': '9020739', '58060': '9020740', '58061': '9020741', '58062': '9020742', '58063': '9020743', '58064': '9020744', '58065': '9020745', '58067': '9020746', '58068': '9020747', '58069': '9020748', '58071': '9020749', '58072': '9020750', '58075': '9020751', '58076': '9020752', '58077': '9020753', '58078': '9020754', '58079': '9020755', '58081': '9020756', '58102': '9020757', '58103': '9020758', '58104': '9020759', '58105': '9020760', '58121': '9020762', '58126': '9020764', '58201': '9020765', '58202': '9020766', '58203': '9020767', '58204': '9020768', '58205': '9020769', '58210': '9020770', '58212': '9020771', '58214': '9020772', '58216': '9020773', '58218': '9020774', '58219': '9020775', '58220': '9020776', '58222': '9020777', '58223': '9020778', '58224': '9020779', '58225': '9020780', '58227': '9020781', '58228': '9020782', '58229': '9020783', '58230': '9020784', '58231': '9020785', '58233': '9020786', '58235': '9020787', '58236': '9020788', '58237': '9020789', '58238': '9020790', '58239': '9020791', '58240': '9020792', '58241': '9020793', '58243': '9020794', '58244': '9020795', '58249': '9020796', '58250': '9020797', '58251': '9020798', '58254': '9020799', '58256': '9020800', '58257': '9020801', '58258': '9020802', '58259': '9020803', '58260': '9020804', '58261': '9020805', '58262': '9020806', '58265': '9020807', '58266': '9020808', '58267': '9020809', '58269': '9020810', '58270': '9020811', '58271': '9020812', '58272': '9020813', '58273': '9020814', '58274': '9020815', '58275': '9020816', '58276': '9020817', '58277': '9020818', '58278': '9020819', '58281': '9020820', '58282': '9020821', '58301': '9020822', '58310': '9020823', '58311': '9020824', '58313': '9020825', '58316': '9020826', '58317': '9020827', '58318': '9020828', '58321': '9020829', '58323': '9020830', '58324': '9020831', '58325': '9020832', '58327': '9020833', '58329': '9020834', '58330': '9020835', '58331': '9020836', '58332': '9020837', '58338': '9020839', '58339': '9020840', '58341': '9020841', '58343': '9020842', '58344': '9020843', '58345': '9020844', '58346': '9020845', '58348': '9020846', '58351': '9020847', '58352': '9020848', '58353': '9020849', '58355': '9020850', '58356': '9020851', '58357': '9020852', '58361': '9020853', '58362': '9020854', '58363': '9020855', '58365': '9020856', '58366': '9020857', '58367': '9020858', '58368': '9020859', '58369': '9020860', '58370': '9020861', '58372': '9020862', '58374': '9020863', '58377': '9020864', '58380': '9020865', '58381': '9020866', '58382': '9020867', '58384': '9020868', '58385': '9020869', '58386': '9020870', '58401': '9020871', '58405': '9020872', '58413': '9020873', '58415': '9020874', '58416': '9020875', '58418': '9020876', '58420': '9020877', '58421': '9020878', '58422': '9020879', '58423': '9020880', '58424': '9020881', '58425': '9020882', '58426': '9020883', '58428': '9020884', '58429': '9020885', '58430': '9020886', '58431': '9020887', '58433': '9020888', '58436': '9020889', '58438': '9020890', '58439': '9020891', '58440': '9020892', '58441': '9020893', '58442': '9020894', '58443': '9020895', '58444': '9020896', '58445': '9020897', '58448': '9020898', '58451': '9020899', '58454': '9020900', '58455': '9020901', '58456': '9020902', '58458': '9020903', '58460': '9020904', '58461': '9020905', '58463': '9020906', '58464': '9020907', '58466': '9020908', '58467': '9020909', '58472': '9020910', '58474': '9020911', '58475': '9020912', '58476': '9020913', '58477': '9020914', '58478': '9020915', '58479': '9020916', '58480': '9020917', '58481': '9020918', '58482': '9020919', '58483': '9020920', '58484': '9020921', '58486': '9020922', '58487': '9020923', '58488': '9020924', '58490': '9020925', '58492': '9020926', '58494': '9020927', '58495': '9020928', '58496': '9020929', '58497': '9020930', '58501': '9020931', '58503': '9020932', '58504': '9020933', '58505': '9020934', '58520': '9020935', '58521': '9020936', '58523': '9020937', '58524': '9020938', '58528': '9020939', '58529': '9020940', '58530': '9020941', '58531': '9020942', '58532': '9020943', '58533': '9020944', '58535': '9020945', '58538': '9020946', '58540': '9020947', '58541': '9020948', '58542': '9020949', '58544': '9020950', '58545': '9020951', '58549': '9020952', '58552': '9020953', '58554': '9020954', '58558': '9020955', '58559': '9020956', '58560': '9020957', '58561': '9020958', '58562': '9020959', '58563': '9020960', '58564': '9020961', '58565': '9020962', '58566': '9020963', '58568': '9020964', '58569': '9020965', '58570': '9020966', '58571': '9020967', '58572': '9020968', '58573': '9020969', '58575': '9020970', '58576': '9020971', '58577': '9020972', '58579': '9020973', '58580': '9020974', '58581': '9020975', '58601': '9020976', '58620': '9020978', '58621': '9020979', '58622': '9020980', '58623': '9020981', '58625': '9020982', '58626': '9020983', '58627': '9020984', '58630': '9020985', '58631': '9020986', '58632': '9020987', '58634': '9020988', '58636': '9020989', '58638': '9020990', '58639': '9020991', '58640': '9020992', '58641': '9020993', '58642': '9020994', '58643': '9020995', '58645': '9020996', '58646': '9020997', '58647': '9020998', '58649': '9020999', '58650': '9021000', '58651': '9021001', '58652': '9021002', '58653': '9021003', '58654': '9021004', '58655': '9021005', '58656': '9021006', '58701': '9021007', '58703': '9021008', '58704': '9021009', '58707': '9021011', '58710': '9021012', '58711': '9021013', '58712': '9021014', '58713': '9021015', '58716': '9021016', '58718': '9021017', '58721': '9021018', '58722': '9021019', '58723': '9021020', '58725': '9021021', '58727': '9021022', '58730': '9021023', '58731': '9021024', '58733': '9021025', '58734': '9021026', '58735': '9021027', '58736': '9021028', '58737': '9021029', '58740': '9021030', '58741': '9021031', '58744': '9021032', '58746': '9021033', '58748': '9021034', '58750': '9021035', '58752': '9021036', '58755': '9021037', '58756': '9021038', '58757': '9021039', '58758': '9021040', '58759': '9021041', '58760': '9021042', '58761': '9021043', '58762': '9021044', '58763': '9021045', '58765': '9021046', '58768': '9021047', '58769': '9021048', '58770': '9021049', '58771': '9021050', '58772': '9021051', '58773': '9021052', '58775': '9021053', '58776': '9021054', '58778': '9021055', '58779': '9021056', '58781': '9021057', '58782': '9021058', '58783': '9021059', '58784': '9021060', '58785': '9021061', '58787': '9021062', '58788': '9021063', '58789': '9021064', '58790': '9021065', '58792': '9021066', '58793': '9021067', '58794': '9021068', '58795': '9021069', '58801': '9021070', '58830': '9021071', '58831': '9021072', '58833': '9021073', '58835': '9021074', '58838': '9021075', '58843': '9021076', '58844': '9021077', '58845': '9021078', '58847': '9021079', '58849': '9021080', '58852': '9021081', '58854': '9021082', '58856': '9021083', '59001': '9021084', '59002': '9021085', '59003': '9021086', '59006': '9021087', '59008': '9021088', '59010': '9021089', '59011': '9021090', '59012': '9021091', '59014': '9021092', '59015': '9021093', '59016': '9021094', '59019': '9021095', '59020': '9021096', '59022': '9021097', '59024': '9021098', '59025': '9021099', '59026': '9021100', '59027': '9021101', '59028': '9021102', '59029': '9021103', '59030': '9021104', '59031': '9021105', '59032': '9021106', '59034': '9021107', '59035': '9021108', '59036': '9021109', '59037': '9021110', '59038': '9021111', '59039': '9021112', '59041': '9021113', '59043': '9021114', '59044': '9021115', '59046': '9021116', '59047': '9021117', '59050': '9021118', '59052': '9021119', '59053': '9021120', '59054': '9021121', '59055': '9021122', '59057': '9021123', '59058': '9021124', '59059': '9021125', '59061': '9021126', '59062': '9021127', '59063': '9021128', '59064': '9021129', '59065': '9021130', '59066': '9021131', '59067': '9021132', '59068': '9021133', '59069': '9021134', '59070': '9021135', '59072': '9021136', '59074': '9021137', '59075': '9021138', '59077': '9021139', '59078': '9021140', '59079': '9021141', '59081': '9021142', '59085': '9021143', '59086': '9021144', '59087': '9021145', '59088': '9021146', '59089': '9021147', '59101': '9021148', '59102': '9021149', '59105': '9021150', '59106': '9021151', '59201': '9021152', '59211': '9021153', '59212': '9021154', '59213': '9021155', '59214': '9021156', '59215': '9021157', '59218': '9021159', '59219': '9021160', '59221': '9021161', '59222': '9021162', '59223': '9021163', '59225': '9021164', '59226': '9021165', '59230': '9021166', '59240': '9021167', '59241': '9021168', '59242': '9021169', '59243': '9021170', '59244': '9021171', '59247': '9021172', '59248': '9021173', '59250': '9021174', '59252': '9021175', '59253': '9021176', '59254': '9021177', '59255': '9021178', '59256': '9021179', '59257': '9021180', '59258': '9021181', '59259': '9021182', '59260': '9021183', '59261': '9021184', '59262': '9021185', '59263': '9021186', '59270': '9021187', '59274': '9021188', '59275': '9021189', '59276': '9021190', '59301': '9021191', '59311': '9021192', '59313': '9021193', '59314': '9021194', '59315': '9021195', '59317': '9021196', '59318': '9021197', '59322': '9021198', '59323': '9021199', '59324': '9021200', '59326': '9021201', '59327': '9021202', '59330': '9021203', '59332': '9021204', '59333': '9021205', '59336': '9021206', '59337': '9021207', '59338': '9021208', '59339': '9021209', '59341': '9021210', '59343': '9021211', '59344': '9021212', '59347': '9021213', '59349': '9021214', '59351': '9021215', '59353': '9021216', '59401': '9021218', '59404': '9021219', '59405': '9021220', '59410': '9021221', '59411': '9021222', '59412': '9021223', '59414': '9021224', '59416': '9021225', '59417': '9021226', '59419': '9021227', '59420': '9021228', '59421': '9021229', '59422': '9021230', '59424': '9021231', '59425': '9021232', '59427': '9021233', '59430': '9021234', '59432': '9021235', '59433': '9021236', '59434': '9021237', '59436': '9021238', '59440': '9021239', '59441': '9021240', '59442': '9021241', '59443': '9021242', '59444': '9021243', '59446': '9021245', '59447': '9021246', '59448': '9021247', '59450': '9021248', '59451': '9021249', '59452': '9021250', '59453': '9021251', '59454': '9021252', '59456': '9021253', '59457': '9021254', '59460': '9021255', '59462': '9021256', '59463': '9021257', '59464': '9021258', '59465': '9021259', '59466': '9021260', '59467': '9021261', '59468': '9021262', '59469': '9021263', '59471': '9021264', '59472': '9021265', '59474': '9021266', '59479': '9021268', '59480': '9021269', '59482': '9021270', '59483': '9021271', '59484': '9021272', '59486': '9021273', '59487': '9021274', '59489': '9021275', '59501': '9021276', '59520': '9021277', '59521': '9021278', '59522': '9021279', '59523': '9021280', '59524': '9021281', '59525': '9021282', '59526': '9021283', '59527': '9021284', '59528': '9021285', '59529': '9021286', '59530': '9021287', '59531': '9021288', '59532': '9021289', '59535': '9021290', '59537': '9021291', '59538': '9021292', '59540': '9021293', '59542': '9021294', '59544': '9021295', '59545': '9021296', '59546': '9021297', '59547': '9021298', '59601': '9021299', '59602': '9021300', '59623': '9021301', '59625': '9021302', '59626': '9021303', '59631': '9021304', '59632': '9021305', '59633': '9021306', '59634': '9021307', '59635': '9021308', '59638': '9021310', '59639': '9021311', '59642': '9021312', '59643': '9021313', '59644': '9021314', '59645': '9021315', '59648': '9021316', '59701': '9021317', '59710': '9021318', '59711': '9021319', '59713': '9021320', '59714': '9021321', '59715': '9021322', '59718': '9021324', '59720': '9021325', '59721': '9021326', '59722': '9021327', '59724': '9021328', '59725': '9021329', '59727': '9021330', '59728': '9021331', '59729': '9021332', '59730': '9021333', '59731': '9021334', '59732': '9021335', '59733': '9021336', '59735': '9021337', '59736': '9021338', '59739': '9021339', '59741': '9021340', '59743': '9021341', '59745': '9021342', '59746': '9021343', '59747': '9021344', '59749': '9021345', '59750': '9021346', '59751': '9021347', '59752': '9021348', '59754': '9021349', '59758': '9021351', '59759': '9021352', '59761': '9021353', '59762': '9021354', '59801': '9021355', '59802': '9021356', '59803': '9021357', '59804': '9021358', '59808': '9021359', '59812': '9021360', '59820': '9021361', '59821': '9021362', '59823': '9021363', '59824': '9021364', '59825': '9021365', '59826': '9021366', '59827': '9021367', '59828': '9021368', '59829': '9021369', '59831': '9021370', '59832': '9021371', '59833': '9021372', '59834': '9021373', '59837': '9021374', '59840': '9021375', '59843': '9021377', '59844': '9021378', '59845': '9021379', '59846': '9021380', '59847': '9021381', '59848': '9021382', '59853': '9021383', '59854': '9021384', '59858': '9021385', '59859': '9021386', '59860': '9021387', '59863': '9021388', '59864': '9021389', '59865': '9021390', '59866': '9021391', '59867': '9021392', '59868': '9021393', '59870': '9021394', '59871': '9021395', '59872': '9021396', '59873': '9021397', '59874': '9021398', '59875': '9021399', '59901': '9021400', '59910': '9021401', '59911': '9021402', '59912': '9021403', '59913': '9021404', '59915': '9021405', '59916': '9021406', '59917': '9021407', '59919': '9021409', '59920': '9021410', '59922': '9021411', '59923': '9021412', '59925': '9021413', '59926': '9021414', '59927': '9021415', '59928': '9021416', '59929': '9021417', '59930': '9021418', '59931': '9021419', '59932': '9021420', '59933': '9021421', '59934': '9021422', '59935': '9021423', '59936': '9021424', '59937': '9021425', '60002': '9021426', '60004': '9021427', '60005': '9021428', '60007': '9021429', '60008': '9021430', '60010': '9021431', '60012': '9021432', '60013': '9021433', '60014': '9021434', '60015': '9021435', '60016': '9021436', '60018': '9021437', '60020': '9021438', '60021': '9021439', '60022': '9021440', '60025': '9021441', '60026': '9021442', '60029': '9021443', '60030': '9021444', '60031': '9021445', '60033': '9021446', '60034': '9021447', '60035': '9021448', '60040': '9021450', '60041': '9021451', '60042': '9021452', '60043': '9021453', '60044': '9021454', '60045': '9021455', '60046': '9021456', '60047': '9021457', '60048': '9021458', '60050': '9021459', '60051': '9021460', '60053': '9021461', '60056': '9021462', '60060': '9021463', '60061': '9021464', '60062': '9021465', '60064': '9021466', '60067': '9021467', '60068': '9021468', '60069': '9021469', '60070': '9021470', '60071': '9021471', '60072': '9021472', '60073': '9021473', '60074': '9021474', '60076': '9021475', '60077': '9021476', '60081': '9021477', '60083': '9021478', '60084': '9021479', '60085': '9021480', '60087': '9021481', '60088': '9021482', '60089': '9021483', '60090': '9021484', '60091': '9021485', '60093': '9021486', '60095': '9021487', '60096': '9021488', '60097': '9021489', '60098': '9021490', '60099': '9021491', '60101': '9021492', '60102': '9021493', '60103': '9021494', '60104': '9021495', '60106': '9021496', '60107': '9021497', '60108': '9021498', '60110': '9021500', '60111': '9021501', '60112': '9021502', '60115': '9021504', '60117': '9021505', '60118': '9021506', '60119': '9021507', '60120': '9021508', '60123': '9021509', '60124': '9021510', '60126': '9021511', '60129': '9021512', '60130': '9021513', '60131': '9021514', '60133': '9021515', '60134': '9021516', '60135': '9021517', '60136': '9021518', '60137': '9021519', '60139': '9021520', '60140': '9021521', '60142': '9021523', '60143': '9021524', '60145': '9021525', '60146': '9021526', '60148': '9021527', '60150': '9021528', '60151': '9021529', '60152': '9021530', '60153': '9021531', '60154': '9021532', '60155': '9021533', '60156': '9021534', '60157': '9021535', '60160': '9021536', '60162': '9021537', '60163': '9021538', '60164': '9021539', '60165': '9021540', '60169': '9021541', '60171': '9021542', '60172': '9021543', '60173': '9021544', '60174': '9021545', '60175': '9021546', '60176': '9021547', '60177': '9021548', '60178': '9021549', '60180': '9021550', '60181': '9021551', '60184': '9021552', '60185': '9021553', '60187': '9021554', '60188': '9021555', '60189': '9021556', '60190': '9021557', '60191': '9021558', '60192': '9021559', '60193': '9021560', '60194': '9021561', '60195': '9021562', '60196': '9021563', '60201': '9021564', '60202': '9021565', '60203': '9021566', '60208': '9021567', '60301': '9021568', '60302': '9021569', '60304': '9021570', '60305': '9021571', '60401': '9021572', '60402': '9021573', '60403': '9021574', '60404': '9021575', '60406': '9021576', '60407': '9021577', '60408': '9021578', '60409': '9021579', '60410': '9021580', '60411': '9021581', '60415': '9021582', '60416': '9021583', '60417': '9021584', '60419': '9021585', '60420': '9021586', '60421': '9021587', '60422': '9021588', '60423': '9021589', '60424': '9021590', '60425': '9021591', '60426': '9021592', '60428': '9021593', '60429': '9021594', '60430': '9021595', '60431': '9021596', '60432': '9021597', '60433': '9021598', '60435': '9021599', '60436': '9021600', '60437': '9021601', '60438': '9021602', '60439': '9021603', '60440': '9021604', '60441': '9021605', '60442': '9021606', '60443': '9021607', '60444': '9021608', '60445': '9021609', '60446': '9021610', '60447': '9021611', '60448': '9021612', '60449': '9021613', '60450': '9021614', '60451': '9021615', '60452': '9021616', '60453': '9021617', '60455': '9021618', '60456': '9021619', '60457': '9021620', '60458': '9021621', '60459': '9021622', '60460': '9021623', '60461': '9021624', '60462': '9021625', '60463': '9021626', '60464': '9021627', '60465': '9021628', '60466': '9021629', '60467': '9021630', '60468': '9021631', '60469': '9021632', '60470': '9021633', '60471': '9021634', '60472': '9021635', '60473': '9021636', '60475': '9021638', '60476': '9021639', '60477': '9021640', '60478': '9021641', '60479': '9021642', '60480': '9021643', '60481': '9021644', '60482': '9021645', '60484': '9021646', '60487': '9021647', '60490': '9021648', '60491': '9021649', '60499': '9021650', '60501': '9021651', '60502': '9021652', '60503': '9021653', '60504': '9021654', '60505': '9021655', '60506': '9021656', '60510': '9021657', '60511': '9021658', '60512': '9021659', '60513': '9021660', '60514': '9021661', '60515': '9021662', '60516': '9021663', '60517': '9021664', '60518': '9021665', '60520': '9021667', '60521': '9021668', '60523': '9021669', '60525': '9021670', '60526': '9021671', '60527': '9021672', '60530': '9021673', '60531': '9021674', '60532': '9021675', '60534': '9021676', '60536': '9021677', '60538': '9021679', '60539': '9021680', '60540': '9021681', '60541': '9021682', '60542': '9021683', '60543': '9021684', '60544': '9021685', '60545': '9021686', '60546': '9021687', '60548': '9021688', '60549': '9021689', '60550': '9021690', '60551': '9021691', '60552': '9021692', '60553': '9021693', '60554': '9021694', '60555': '9021695', '60556': '9021696', '60558': '9021697', '60559': '9021698', '60560': '9021699', '60561': '9021700', '60563': '9021701', '60564': '9021702', '60565': '9021703', '60585': '9021704', '60586': '9021705', '60601': '9021706', '60602': '9021707', '60603': '9021708', '60604': '9021709', '60605': '9021710', '60606': '9021711', '60607': '9021712', '60608': '9021713', '60609': '9021714', '60610': '9021715', '60611': '9021716', '60612': '9021717', '60613': '9021718', '60614': '9021719', '60615': '9021720', '60616': '9021721', '60617': '9021722', '60618': '9021723', '60619': '9021724', '60620': '9021725', '60621': '9021726', '60622': '9021727', '60623': '9021728', '60624': '9021729', '60625': '9021730', '60626': '9021731', '60628': '9021732', '60629': '9021733', '60630': '9021734', '60631': '9021735', '60632': '9021736', '60633': '9021737', '60634': '9021738', '60636': '9021739', '60637': '9021740', '60638': '9021741', '60639': '9021742', '60640': '9021743', '60641': '9021744', '60642': '9021745', '60643': '9021746', '60644': '9021747', '60645': '9021748', '60646': '9021749', '60647': '9021750', '60649': '9021751', '60651': '9021752', '60652': '9021753', '60653': '9021754', '60654': '9021755', '60655': '9021756', '60656': '9021757', '60657': '9021758', '60659': '9021759', '60660': '9021760', '60661': '9021761', '60666': '9021762', '60699': '9021764', '60706': '9021765', '60707': '9021766', '60712': '9021767', '60714': '9021768', '60803': '9021769', '60804': '9021770', '60805': '9021771', '60827': '9021772', '60901': '9021773', '60911': '9021775', '60912': '9021776', '60913': '9021777', '60914': '9021778', '60915': '9021779', '60917': '9021780', '60918': '9021781', '60919': '9021782', '60920': '9021783', '60921': '9021784', '60922': '9021785', '60924': '9021786', '60927': '9021788', '60928': '9021789', '60929': '9021790', '60930': '9021791', '60931': '9021792', '60932': '9021793', '60934': '9021794', '60935': '9021795', '60936': '9021796', '60938': '9021797', '60940': '9021798', '60941': '9021799', '60942': '9021800', '60946': '9021801', '60948': '9021802', '60949': '9021803', '60950': '9021804', '60951': '9021805', '60952': '9021806', '60953': '9021807', '60954': '9021808', '60955': '9021809', '60957': '9021811', '60959': '9021812', '60960': '9021813', '60961': '9021814', '60962': '9021815', '60963': '9021816', '60964': '9021817', '60966': '9021818', '60968': '9021819', '60970': '9021821', '60973': '9021822', '61001': '9021824', '61006': '9021825', '61007': '9021826', '61008': '9021827', '61010': '9021828', '61011': '9021829', '61012': '9021830', '61014': '9021832', '61015': '9021833', '61016': '9021834', '61018': '9021835', '61019': '9021836', '61020': '9021837', '61021': '9021838', '61024': '9021839', '61025': '9021840', '61028': '9021842', '61030': '9021843', '61031': '9021844', '61032': '9021845', '61036': '9021846', '61038': '9021848', '61039': '9021849', '61041': '9021850', '61042': '9021851', '61044': '9021852', '61046': '9021853', '61047': '9021854', '61048': '9021855', '61049': '9021856', '61050': '9021857', '61051': '9021858', '61052': '9021859', '61053': '9021860', '61054': '9021861', '61057': '9021862', '61060': '9021863', '61061': '9021864', '61062': '9021865', '61063': '9021866', '61064': '9021867', '61065': '9021868', '61067': '9021869', '61068': '9021870', '61070': '9021871', '61071': '9021872', '61072': '9021873', '61073': '9021874', '61074': '9021875', '61075': '9021876', '61078': '9021878', '61080': '9021879', '61081': '9021880', '61084': '9021881', '61085': '9021882', '61087': '9021883', '61088': '9021884', '61089': '9021885', '61101': '9021886', '61102': '9021887', '61103': '9021888', '61104': '9021889', '61107': '9021890', '61108': '9021891', '61109': '9021892', '61111': '9021893', '61112': '9021894', '61114': '9021895', '61115': '9021896', '61201': '9021898', '61230': '9021899', '61231': '9021900', '61232': '9021901', '61234': '9021902', '61235': '9021903', '61238': '9021904', '61239': '9021905', '61240': '9021906', '61241': '9021907', '61242': '9021908', '61243': '9021909', '61244': '9021910', '61250': '9021911', '61251': '9021912', '61252': '9021913', '61254': '9021914', '61256': '9021915', '61257': '9021916', '61258': '9021917', '61259': '9021918', '61260': '9021919', '61261': '9021920', '61262': '9021921', '61264': '9021922', '61265': '9021923', '61270': '9021924', '61272': '9021925', '61273': '9021926', '61274': '9021927', '61275': '9021928', '61277': '9021929', '61279': '9021930', '61281': '9021931', '61282': '9021932', '61283': '9021933', '61284': '9021934', '61285': '9021935', '61301': '9021936', '61310': '9021937', '61311': '9021938', '61312': '9021939', '61313': '9021940', '61314': '9021941', '61315': '9021942', '61318': '9021944', '61319': '9021945', '61320': '9021946', '61321': '9021947', '61322': '9021948', '61323': '9021949', '61325': '9021951', '61326': '9021952', '61327': '9021953', '61329': '9021954', '61330': '9021955', '61333': '9021957', '61334': '9021958', '61335': '9021959', '61336': '9021960', '61337': '9021961', '61341': '9021964', '61342': '9021965', '61344': '9021966', '61345': '9021967', '61348': '9021969', '61349': '9021970', '61350': '9021971', '61353': '9021972', '61354': '9021973', '61356': '9021974', '61358': '9021975', '61360': '9021977', '61361': '9021978', '61362': '9021979', '61363': '9021980', '61364': '9021981', '61367': '9021982', '61368': '9021983', '61369': '9021984', '61370': '9021985', '61371': '9021986', '61373': '9021987', '61375': '9021989', '61376': '9021990', '61377': '9021991', '61378': '9021992', '61379': '9021993', '61401': '9021994', '61410': '9021995', '61411': '9021996', '61412': '9021997', '61413': '9021998', '61414': '9021999', '61415': '9022000', '61416': '9022001', '61417': '9022002', '61418': '9022003', '61419': '9022004', '61420': '9022005', '61421': '9022006', '61422': '9022007', '61423': '9022008', '61424': '9022009', '61425': '9022010', '61427': '9022012', '61428': '9022013', '61430': '9022014', '61431': '9022015', '61432': '9022016', '61434': '9022017', '61435': '9022018', '61436': '9022019', '61437': '9022020', '61438': '9022021', '61439': '9022022', '61440': '9022023', '61441': '9022024', '61442': '9022025', '61443': '9022026', '61447': '9022027', '61448': '9022028', '61449': '9022029', '61450': '9022030', '61451': '9022031', '61452': '9022032', '61453': '9022033', '61454': '9022034', '61455': '9022035', '61458': '9022036', '61459': '9022037', '61460': '9022038', '61462': '9022039', '61465': '9022040', '61466': '9022041', '61467': '9022042', '61468': '9022043', '61469': '9022044', '61470': '9022045', '61471': '9022046', '61472': '9022047', '61473': '9022048', '61474': '9022049', '61475': '9022050', '61476': '9022051', '61477': '9022052', '61478': '9022053', '61479': '9022054', '61480': '9022055', '61482': '9022056', '61483': '9022057', '61484': '9022058', '61485': '9022059', '61486': '9022060', '61488': '9022061', '61489': '9022062', '61490': '9022063', '61491': '9022064', '61501': '9022065', '61516': '9022066', '61517': '9022067', '61519': '9022068', '61520': '9022069', '61523': '9022070', '61525': '9022072', '61526': '9022073', '61528': '9022074', '61529': '9022075', '61530': '9022076', '61531': '9022077', '61532': '9022078', '61533': '9022079', '61534': '9022080', '61535': '9022081', '61536': '9022082', '61537': '9022083', '61540': '9022085', '61542': '9022087', '61544': '9022088', '61545': '9022089', '61546': '9022090', '61547': '9022091', '61548': '9022092', '61550': '9022093', '61552': '9022094', '61554': '9022096', '61559': '9022097', '61560': '9022098', '61561': '9022099', '61563': '9022101', '61564': '9022102', '61565': '9022103', '61567': '9022104', '61568': '9022105', '61569': '9022106', '61570': '9022107', '61571': '9022108', '61572': '9022109', '61602': '9022111', '61603': '9022112', '61604': '9022113', '61605': '9022114', '61606': '9022115', '61607': '9022116', '61610': '9022117', '61611': '9022118', '61613': '9022119', '61614': '9022120', '61615': '9022121', '61616': '9022122', '61629': '9022123', '61636': '9022124', '61637': '9022125', '61639': '9022126', '61643': '9022127', '61701': '9022128', '61704': '9022129', '61705': '9022130', '61709': '9022131', '61720': '9022132', '61721': '9022133', '61722': '9022134', '61723': '9022135', '61724': '9022136', '61725': '9022137', '61726': '9022138', '61727': '9022139', '61728': '9022140', '61729': '9022141', '61730': '9022142', '61731': '9022143', '61732': '9022144', '61733': '9022145', '61734': '9022146', '61735': '9022147', '61736': '9022148', '61737': '9022149', '61738': '9022150', '61739': '9022151', '61740': '9022152', '61741': '9022153', '61742': '9022154', '61743': '9022155', '61744': '9022156', '61745': '9022157', '61747': '9022158', '61748': '9022159', '61749': '9022160', '61750': '9022161', '61752': '9022163', '61753': '9022164', '61754': '9022165', '61755': '9022166', '61756': '9022167', '61759': '9022169', '61760': '9022170', '61761': '9022171', '61764': '9022172', '61769': '9022173', '61770': '9022174', '61771': '9022175', '61772': '9022176', '61773': '9022177', '61774': '9022178', '61775': '9022179', '61776': '9022180', '61777': '9022181', '61778': '9022182', '61791': '9022183', '61799': '9022184', '61801': '9022185', '61802': '9022186', '61810': '9022187', '61811': '9022188', '61812': '9022189', '61813': '9022190', '61814': '9022191', '61816': '9022193', '61817': '9022194', '61818': '9022195', '61820': '9022196', '61821': '9022197', '61822': '9022198', '61830': '9022199', '61831': '9022200', '61832': '9022201', '61833': '9022202', '61834': '9022203', '61839': '9022204', '61840': '9022205', '61841': '9022206', '61842': '9022207', '61843': '9022208', '61844': '9022209', '61845': '9022210', '61846': '9022211', '61847': '9022212', '61848': '9022213', '61849': '9022214', '61850': '9022215', '61851': '9022216', '61852': '9022217', '61853': '9022218', '61854': '9022219', '61855': '9022220', '61856': '9022221', '61858': '9022223', '61859': '9022224', '61862': '9022225', '61863': '9022226', '61864': '9022227', '61865': '9022228', '61866': '9022229', '61870': '9022230', '61871': '9022231', '61872': '9022232', '61873': '9022233', '61874': '9022234', '61875': '9022235', '61876': '9022236', '61877': '9022237', '61878': '9022238', '61880': '9022239', '61882': '9022240', '61883': '9022241', '61884': '9022242', '61910': '9022243', '61911': '9022244', '61912': '9022245', '61913': '9022246', '61914': '9022247', '61917': '9022248', '61919': '9022249', '61920': '9022250', '61924': '9022251', '61925': '9022252', '61928': '9022253', '61929': '9022254', '61930': '9022255', '61931': '9022256', '61932': '9022257', '61933': '9022258', '61936': '9022259', '61937': '9022260', '61938': '9022261', '61940': '9022262', '61942': '9022263', '61943': '9022264', '61944': '9022265', '61951': '9022267', '61953': '9022268', '61956': '9022270', '61957': '9022271', '62001': '9022272', '62002': '9022273', '62006': '9022274', '62009': '9022275', '62010': '9022276', '62011': '9022277', '62012': '9022278', '62013': '9022279', '62014': '9022280', '62015': '9022281', '62016': '9022282', '62017': '9022283', '62018': '9022284', '62019': '9022285', '62021': '9022286', '62022': '9022287', '62024': '9022289', '62025': '9022290', '62027': '9022291', '62028': '9022292', '62031': '9022293', '62032': '9022294', '62033': '9022295', '62034': '9022296', '62035': '9022297', '62036': '9022298', '62037': '9022299', '62040': '9022300', '62044': '9022301', '62045': '9022302', '62046': '9022303', '62047': '9022304', '62048': '9022305', '62049': '9022306', '62050': '9022307', '62051': '9022308', '62052': '9022309', '62053': '9022310', '62054': '9022311', '62056': '9022312', '62059': '9022314', '62060': '9022315', '62061': '9022316', '62062': '9022317', '62063': '9022318', '62065': '9022319', '62067': '9022320', '62069': '9022321', '62070': '9022322', '62074': '9022323', '62075': '9022324', '62076': '9022325', '62078': '9022327', '62079': '9022328', '62080': '9022329', '62081': '9022330', '62082': '9022331', '62083': '9022332', '62084': '9022333', '62086': '9022335', '62087': '9022336', '62088': '9022337', '62090': '9022339', '62091': '9022340', '62092': '9022341', '62094': '9022343', '62095': '9022344', '62097': '9022345', '62201': '9022346', '62203': '9022347', '62204': '9022348', '62205': '9022349', '62206': '9022350', '62207': '9022351', '62208': '9022352', '62214': '9022353', '62215': '9022354', '62216': '9022355', '62217': '9022356', '62218': '9022357', '62220': '9022359', '62221': '9022360', '62223': '9022361', '62225': '9022362', '62226': '9022363', '62230': '9022364', '62231': '9022365', '62232': '9022366', '62233': '9022367', '62234': '9022368', '62236': '9022369', '62237': '9022370', '62238': '9022371', '62239': '9022372', '62240': '9022373', '62241': '9022374', '62242': '9022375', '62243': '9022376', '62244': '9022377', '62245': '9022378', '62246': '9022379', '62249': '9022381', '62250': '9022382', '62253': '9022383', '62254': '9022384', '62255': '9022385', '62257': '9022386', '62258': '9022387', '62260': '9022388', '62261': '9022389', '62262': '9022390', '62263': '9022391', '62264': '9022392', '62265': '9022393', '62268': '9022394', '62269': '9022395', '62271': '9022396', '62272': '9022397', '62274': '9022398', '62275': '9022399', '62277': '9022400', '62278': '9022401', '62280': '9022403', '62281': '9022404', '62282': '9022405', '62284': '9022406', '62285': '9022407', '62286': '9022408', '62288': '9022409', '62293': '9022411', '62294': '9022412', '62295': '9022413', '62297': '9022414', '62298': '9022415', '62301': '9022416', '62305': '9022417', '62311': '9022418', '62312': '9022419', '62313': '9022420', '62314': '9022421', '62316': '9022422', '62319': '9022423', '62320': '9022424', '62321': '9022425', '62323': '9022426', '62324': '9022427', '62325': '9022428', '62326': '9022429', '62330': '9022430', '62334': '9022431', '62338': '9022433', '62339': '9022434', '62340': '9022435', '62341': '9022436', '62343': '9022437', '62344': '9022438', '62345': '9022439', '62346': '9022440', '62347': '9022441', '62349': '9022442', '62351': '9022443', '62352': '9022444', '62353': '9022445', '62354': '9022446', '62355': '9022447', '62356': '9022448', '62357': '9022449', '62358': '9022450', '62359': '9022451', '62360': '9022452', '62361': '9022453', '62363': '9022455', '62365': '9022456', '62366': '9022457', '62367': '9022458', '62370': '9022459', '62373': '9022460', '62374': '9022461', '62375': '9022462', '62376': '9022463', '62378': '9022464', '62379': '9022465', '62380': '9022466', '62401': '9022467', '62410': '9022468', '62411': '9022469', '62413': '9022470', '62414': '9022471', '62417': '9022472', '62418': '9022473', '62419': '9022474', '62420': '9022475', '62421': '9022476', '62422': '9022477', '62423': '9022478', '62424': '9022479', '62425': '9022480', '62426': '9022481', '62427': '9022482', '62428': '9022483', '62431': '9022484', '62432': '9022485', '62433': '9022486', '62434': '9022487', '62436': '9022488', '62438': '9022489', '62439': '9022490', '62440': '9022491', '62441': '9022492', '62442': '9022493', '62443': '9022494', '62444': '9022495', '62445': '9022496', '62446': '9022497', '62447': '9022498', '62448': '9022499', '62449': '9022500', '62450': '9022501', '62451': '9022502', '62452': '9022503', '62454': '9022504', '62458': '9022505', '62459': '9022506', '62460': '9022507', '62461': '9022508', '62462': '9022509', '62463': '9022510', '62465': '9022511', '62466': '9022512', '62467': '9022513', '62468': '9022514', '62469': '9022515', '62471': '9022516', '62473': '9022517', '62474': '9022518', '62475': '9022519', '62476': '9022520', '62477': '9022521', '62478': '9022522', '62479': '9022523', '62480': '9022524', '62481': '9022525', '62501': '9022526', '62510': '9022527', '62512': '9022528', '62513': '9022529', '62514': '9022530', '62515': '9022531', '62517': '9022532', '62518': '9022533', '62520': '9022535', '62521': '9022536', '62522': '9022537', '62523': '9022538', '62526': '9022539', '62530': '9022540', '62531': '9022541', '62533': '9022542', '62534': '9022543', '62535': '9022544', '62536': '9022545', '62538': '9022547', '62539': '9022548', '62540': '9022549', '62543': '9022551', '62544': '9022552', '62545': '9022553', '62546': '9022554', '62547': '9022555', '62548': '9022556', '62549': '9022557', '62550': '9022558', '62551': '9022559', '62553': '9022560', '62554': '9022561', '62555': '9022562', '62556': '9022563', '62557': '9022564', '62558': '9022565', '62560': '9022566', '62561': '9022567', '62563': '9022568', '62565': '9022569', '62567': '9022570', '62568': '9022571', '62571': '9022573', '62572': '9022574', '62573': '9022575', '62601': '9022576', '62611': '9022578', '62612': '9022579', '62613': '9022580', '62615': '9022581', '62617': '9022582', '62618': '9022583', '62621': '9022584', '62624': '9022585', '62625': '9022586', '62626': '9022587', '62627': '9022588', '62628': '9022589', '62629': '9022590', '62630': '9022591', '62631': '9022592', '62633': '9022593', '62634': '9022594', '62635': '9022595', '62638': '9022596', '62639': '9022597', '62640': '9022598', '62642': '9022599', '62643': '9022600', '62644': '9022601', '62649': '9022602', '62650': '9022603', '62655': '9022604', '62656': '9022605', '62661': '9022606', '62664': '9022608', '62665': '9022609', '62666': '9022610', '62667': '9022611', '62668': '9022612', '62670': '9022613', '62671': '9022614', '62672': '9022615', '62673': '9022616', '62674': '9022617', '62675': '9022618', '62677': '9022619', '62681': '9022620', '62682': '9022621', '62684': '9022622', '62685': '9022623', '62688': '9022624', '62690': '9022626', '62691': '9022627', '62692': '9022628', '62693': '9022629', '62694': '9022630', '62701': '9022631', '62702': '9022632', '62703': '9022633', '62704': '9022634', '62707': '9022635', '62711': '9022636', '62712': '9022637', '62757': '9022638', '62761': '9022639', '62764': '9022640', '62769': '9022641', '62801': '9022642', '62803': '9022643', '62806': '9022644', '62807': '9022645', '62808': '9022646', '62809': '9022647', '62810': '9022648', '62812': '9022650', '62814': '9022651', '62815': '9022652', '62816': '9022653', '62817': '9022654', '62818': '9022655', '62819': '9022656', '62820': '9022657', '62821': '9022658', '62822': '9022659', '62823': '9022660', '62824': '9022661', '62827': '9022663', '62828': '9022664', '62829': '9022665', '62830': '9022666', '62831': '9022667', '62832': '9022668', '62833': '9022669', '62835': '9022670', '62836': '9022671', '62837': '9022672', '62838': '9022673', '62839': '9022674', '62842': '9022675', '62843': '9022676', '62844': '9022677', '62846': '9022678', '62848': '9022679', '62849': '9022680', '62850': '9022681', '62851': '9022682', '62853': '9022683', '62854': '9022684', '62858': '9022687', '62859': '9022688', '62860': '9022689', '62862': '9022691', '62863': '9022692', '62864': '9022693', '62865': '9022694', '62867': '9022695', '62868': '9022696', '62869': '9022697', '62870': '9022698', '62871': '9022699', '62872': '9022700', '62875': '9022701', '62877': '9022703', '62878': '9022704', '62880': '9022705', '62881': '9022706', '62882': '9022707', '62883': '9022708', '62884': '9022709', '62885': '9022710', '62886': '9022711', '62887': '9022712', '62888': '9022713', '62889': '9022714', '62890': '9022715', '62892': '9022716', '62893': '9022717', '62894': '9022718', '62895': '9022719', '62896': '9022720', '62897': '9022721', '62898': '9022722', '62899': '9022723', '62901': '9022724', '62902': '9022725', '62903': '9022726', '62905': '9022727', '62906': '9022728', '62907': '9022729', '62908': '9022730', '62910': '9022731', '62912': '9022732', '62914': '9022733', '62916': '9022735', '62917': '9022736', '62918': '9022737', '62919': '9022738', '62920': '9022739', '62922': '9022741', '62923': '9022742', '62924': '9022743', '62926': '9022744', '62927': '9022745', '62928': '9022746', '62930': '9022747', '62931': '9022748', '62932': '9022749', '62933': '9022750', '62934': '9022751', '62935': '9022752', '62938': '9022753', '62939': '9022754', '62940': '9022755', '62941': '9022756', '62942': '9022757', '62943': '9022758', '62946': '9022759', '62947': '9022760', '62948': '9022761', '62950': '9022763', '62951': '9022764', '62952': '9022765', '62954': '9022767', '62956': '9022768', '62957': '9022769', '62958': '9022770', '62959': '9022771', '62960': '9022772', '62962': '9022774', '62963': '9022775', '62964': '9022776', '62966': '9022778', '62967': '9022779', '62969': '9022780', '62970': '9022781', '62972': '9022782', '62974': '9022783', '62975': '9022784', '62976': '9022785', '62977': '9022786', '62979': '9022787', '62982': '9022788', '62983': '9022789', '62984': '9022790', '62985': '9022791', '62987': '9022792', '62988': '9022793', '62990': '9022794', '62992': '9022795', '62994': '9022796', '62995': '9022797', '62996': '9022798', '62998': '9022800', '62999': '9022801', '63005': '9022803', '63010': '9022804', '63011': '9022805', '63012': '9022806', '63013': '9022807', '63014': '9022808', '63015': '9022809', '63016': '9022810', '63017': '9022811', '63019': '9022812', '63020': '9022813', '63021': '9022814', '63023': '9022815', '63025': '9022816', '63026': '9022817', '63028': '9022818', '63030': '9022819', '63031': '9022820', '63033': '9022821', '63034': '9022822', '63036': '9022823', '63037': '9022824', '63038': '9022825', '63039': '9022826', '63040': '9022827', '63041': '9022828', '63042': '9022829', '63043': '9022830', '63044': '9022831', '63045': '9022832', '63048': '9022833', '63049': '9022834', '63050': '9022835', '63051': '9022836', '63052': '9022837', '63055': '9022839', '63056': '9022840', '63060': '9022841', '63068': '9022842', '63069': '9022843', '63070': '9022844', '63071': '9022845', '63072': '9022846', '63074': '9022847', '63077': '9022848', '63080': '9022849', '63084': '9022850', '63087': '9022851', '63088': '9022852', '63089': '9022853', '63090': '9022854', '63091': '9022855', '63101': '9022856', '63102': '9022857', '63103': '9022858', '63104': '9022859', '63105': '9022860', '63106': '9022861', '63107': '9022862', '63108': '9022863', '63109': '9022864', '63110': '9022865', '63111': '9022866', '63112': '9022867', '63113': '9022868', '63114': '9022869', '63115': '9022870', '63116': '9022871', '63117': '9022872', '63118': '9022873', '63119': '9022874', '63120': '9022875', '63121': '9022876', '63122': '9022877', '63123': '9022878', '63124': '9022879', '63125': '9022880', '63126': '9022881', '63127': '9022882', '63128': '9022883', '63129': '9022884', '63130': '9022885', '63131': '9022886', '63132': '9022887', '63133': '9022888', '63134': '9022889', '63135': '9022890', '63136': '9022891', '63137': '9022892', '63138': '9022893', '63139': '9022894', '63140': '9022895', '63141': '9022896', '63143': '9022897', '63144': '9022898', '63145': '9022899', '63146': '9022900', '63147': '9022901', '63167': '9022902', '63182': '9022903', '63301': '9022904', '63303': '9022905', '63304': '9022906', '63330': '9022907', '63332': '9022908', '63333': '9022909', '63334': '9022910', '63336': '9022911', '63339': '9022912', '63341': '9022913', '63343': '9022915', '63344': '9022916', '63345': '9022917', '63347': '9022918', '63348': '9022919', '63349': '9022920', '63350': '9022921', '63351': '9022922', '63352': '9022923', '63353': '9022924', '63357': '9022925', '63359': '9022926', '63361': '9022927', '63362': '9022928', '63363': '9022929', '63366': '9022931', '63367': '9022932', '63368': '9022933', '63369': '9022934', '63373': '9022935', '63376': '9022936', '63377': '9022937', '63379': '9022938', '63381': '9022939', '63382': '9022940', '63383': '9022941', '63384': '9022942', '63385': '9022943', '63386': '9022944', '63388': '9022946', '63389': '9022947', '63390': '9022948', '63401': '9022949', '63430': '9022950', '63431': '9022951', '63432': '9022952', '63433': '9022953', '63434': '9022954', '63435': '9022955', '63436': '9022956', '63437': '9022957', '63438': '9022958', '63439': '9022959', '63440': '9022960', '63441': '9022961', '63443': '9022962', '63445': '9022963', '63446': '9022964', '63447': '9022965', '63448': '9022966', '63450': '9022967', '63451': '9022968', '63452': '9022969', '63453': '9022970', '63454': '9022971', '63456': '9022972', '63457': '9022973', '63458': '9022974', '63459': '9022975', '63460': '9022976', '63461': '9022977', '63462': '9022978', '63463': '9022979', '63465': '9022980', '63468': '9022981', '63469': '9022982', '63471': '9022983', '63472': '9022984', '63473': '9022985', '63474': '9022986', '63501': '9022987', '63530': '9022988', '63531': '9022989', '63532': '9022990', '63533': '9022991', '63534': '9022992', '63535': '9022993', '63536': '9022994', '63537': '9022995', '63538': '9022996', '63539': '9022997', '63540': '9022998', '63541': '9022999', '63543': '9023000', '63544': '9023001', '63545': '9023002', '63546': '9023003', '63547': '9023004', '63548': '9023005', '63549': '9023006', '63551': '9023007', '63552': '9023008', '63555': '9023009', '63556': '9023010', '63557': '9023011', '63558': '9023012', '63559': '9023013', '63560': '9023014', '63561': '9023015', '63563': '9023016', '63565': '9023017', '63566': '9023018', '63567': '9023019', '63601': '9023020', '63620': '9023021', '63621': '9023022', '63622': '9023023', '63623': '9023024', '63624': '9023025', '63625': '9023026', '63626': '9023027', '63627': '9023028', '63628': '9023029', '63629': '9023030', '63630': '9023031', '63631': '9023032', '63633': '9023033', '63636': '9023034', '63637': '9023035', '63638': '9023036', '63640': '9023037', '63645': '9023038', '63648': '9023039', '63650': '9023040', '63653': '9023041', '63654': '9023042', '63655': '9023043', '63656': '9023044', '63660': '9023045', '63662': '9023046', '63664': '9023048', '63665': '9023049', '63670': '9023050', '63673': '9023051', '63675': '9023052', '63701': '9023053', '63703': '9023054', '63730': '9023055', '63732': '9023056', '63735': '9023057', '63736': '9023058', '63738': '9023059', '63739': '9023060', '63740': '9023061', '63743': '9023063', '63745': '9023064', '63747': '9023065', '63748': '9023066', '63750': '9023067', '63751': '9023068', '63755': '9023070', '63763': '9023072', '63764': '9023073', '63766': '9023074', '63769': '9023076', '63770': '9023077', '63771': '9023078', '63775': '9023079', '63780': '9023080', '63781': '9023081', '63782': '9023082', '63783': '9023083', '63784': '9023084', '63785': '9023085', '63787': '9023086', '63801': '9023087', '63821': '9023089', '63822': '9023090', '63823': '9023091', '63825': '9023092', '63827': '9023094', '63828': '9023095', '63829': '9023096', '63830': '9023097', '63833': '9023098', '63834': '9023099', '63837': '9023100', '63839': '9023101', '63841': '9023102', '63845': '9023103', '63846': '9023104', '63847': '9023105', '63848': '9023106', '63849': '9023107', '63851': '9023108', '63852': '9023109', '63853': '9023110', '63855': '9023111', '63857': '9023112', '63862': '9023113', '63863': '9023114', '63866': '9023115', '63867': '9023116', '63869': '9023117', '63870': '9023118', '63873': '9023119', '63874': '9023120', '63876': '9023121', '63877': '9023122', '63879': '9023123', '63882': '9023124', '63901': '9023125', '63932': '9023126', '63933': '9023127', '63934': '9023128', '63935': '9023129', '63936': '9023130', '63937': '9023131', '63939': '9023132', '63940': '9023133', '63941': '9023134', '63942': '9023135', '63943': '9023136', '63944': '9023137', '63945': '9023138', '63951': '9023141', '63952': '9023142', '63953': '9023143', '63954': '9023144', '63955': '9023145', '63956': '9023146', '63957': '9023147', '63960': '9023148', '63961': '9023149', '63964': '9023152', '63965': '9023153', '63966': '9023154', '63967': '9023155', '64001': '9023156', '64011': '9023157', '64012': '9023158', '64014': '9023159', '64015': '9023160', '64016': '9023161', '64017': '9023162', '64018': '9023163', '64019': '9023164', '64020': '9023165', '64021': '9023166', '64022': '9023167', '64024': '9023168', '64028': '9023169', '64029': '9023170', '64030': '9023171', '64034': '9023172', '64035': '9023173', '64036': '9023174', '64037': '9023175', '64040': '9023176', '64048': '9023177', '64050': '9023178', '64052': '9023179', '64053': '9023180', '64054': '9023181', '64055': '9023182', '64056': '9023183', '64057': '9023184', '64058': '9023185', '64060': '9023186', '64061': '9023187', '64062': '9023188', '64063': '9023189', '64064': '9023190', '64067': '9023192', '64068': '9023193', '64070': '9023194', '64071': '9023195', '64072': '9023196', '64074': '9023197', '64075': '9023198', '64076': '9023199', '64077': '9023200', '64078': '9023201', '64079': '9023202', '64080': '9023203', '64081': '9023204', '64082': '9023205', '64083': '9023206', '64084': '9023207', '64085': '9023208', '64086': '9023209', '64088': '9023210', '64089': '9023211', '64093': '9023213', '64096': '9023214', '64097': '9023215', '64098': '9023216', '64101': '9023217', '64102': '9023218', '64105': '9023219', '64106': '9023220', '64108': '9023221', '64109': '9023222', '64110': '9023223', '64111': '9023224', '64112': '9023225', '64113': '9023226', '64114': '9023227', '64116': '9023228', '64117': '9023229', '64118': '9023230', '64119': '9023231', '64120': '9023232', '64123': '9023234', '64124': '9023235', '64125': '9023236', '64126': '9023237', '64127': '9023238', '64128': '9023239', '64129': '9023240', '64130': '9023241', '64131': '9023242', '64132': '9023243', '64133': '9023244', '64134': '9023245', '64136': '9023246', '64137': '9023247', '64138': '9023248', '64139': '9023249', '64145': '9023250', '64146': '9023251', '64147': '9023252', '64149': '9023253', '64150': '9023254', '64151': '9023255', '64152': '9023256', '64153': '9023257', '64154': '9023258', '64155': '9023259', '64156': '9023260', '64157': '9023261', '64158': '9023262', '64161': '9023263', '64163': '9023264', '64164': '9023265', '64165': '9023266', '64166': '9023267', '64167': '9023268', '64170': '9023269', '64198': '9023272', '64401': '9023273', '64402': '9023274', '64421': '9023275', '64422': '9023276', '64423': '9023277', '64424': '9023278', '64426': '9023279', '64427': '9023280', '64428': '9023281', '64429': '9023282', '64430': '9023283', '64431': '9023284', '64432': '9023285', '64433': '9023286', '64434': '9023287', '64436': '9023288', '64437': '9023289', '64438': '9023290', '64439': '9023291', '64440': '9023292', '64441': '9023293', '64442': '9023294', '64443': '9023295', '64444': '9023296', '64445': '9023297', '64446': '9023298', '64448': '9023299', '64449': '9023300', '64451': '9023301', '64453': '9023302', '64454': '9023303', '64455': '9023304', '64456': '9023305', '64457': '9023306', '64458': '9023307', '64459': '9023308', '64461': '9023309', '64463': '9023310', '64465': '9023311', '64466': '9023312', '64467': '9023313', '64468': '9023314', '64469': '9023315', '64470': '9023316', '64471': '9023317', '64473': '9023318', '64474': '9023319', '64475': '9023320', '64476': '9023321', '64477': '9023322', '64479': '9023323', '64480': '9023324', '64481': '9023325', '64482': '9023326', '64483': '9023327', '64484': '9023328', '64485': '9023329', '64486': '9023330', '64487': '9023331', '64489': '9023332', '64490': '9023333', '64491': '9023334', '64492': '9023335', '64493': '9023336', '64494': '9023337', '64496': '9023338', '64497': '9023339', '64498': '9023340', '64499': '9023341', '64501': '9023342', '64503': '9023343', '64504': '9023344', '64505': '9023345', '64506': '9023346', '64507': '9023347', '64601': '9023348', '64620': '9023349', '64622': '9023350', '64623': '9023351', '64624': '9023352', '64625': '9023353', '64628': '9023354', '64630': '9023355', '64631': '9023356', '64632': '9023357', '64633': '9023358', '64635': '9023359', '64636': '9023360', '64637': '9023361', '64638': '9023362', '64639': '9023363', '64640': '9023364', '64641': '9023365', '64642': '9023366', '64643': '9023367', '64644': '9023368', '64645': '9023369', '64646': '9023370', '64647': '9023371', '64648': '9023372', '64649': '9023373', '64650': '9023374', '64651': '9023375', '64652': '9023376', '64653': '9023377', '64655': '9023378', '64656': '9023379', '64657': '9023380', '64658': '9023381', '64659': '9023382', '64660': '9023383', '64661': '9023384', '64664': '9023385', '64667': '9023386', '64668': '9023387', '64670': '9023388', '64671': '9023389', '64672': '9023390', '64673': '9023391', '64674': '9023392', '64676': '9023393', '64679': '9023394', '64681': '9023395', '64682': '9023396', '64683': '9023397', '64688': '9023398', '64689': '9023399', '64701': '9023400', '64720': '9023401', '64722': '9023402', '64723': '9023403', '64724': '9023404', '64725': '9023405', '64726': '9023406', '64728': '9023407', '64730': '9023408', '64733': '9023409', '64734': '9023410', '64735': '9023411', '64738': '9023412', '64739': '9023413', '64740': '9023414', '64741': '9023415', '64742': '9023416', '64744': '9023418', '64745': '9023419', '64746': '9023420', '64747': '9023421', '64748': '9023422', '64750': '9023423', '64752': '9023425', '64755': '9023426', '64756': '9023427', '64759': '9023428', '64761': '9023429', '64762': '9023430', '64763': '9023431', '64767': '9023433', '64769': '9023434', '64770': '9023435', '64771': '9023436', '64772': '9023437', '64776': '9023438', '64778': '9023439', '64779': '9023440', '64780': '9023441', '64783': '9023442', '64784': '9023443', '64788': '9023444', '64790': '9023445', '64801': '9023446', '64804': '9023447', '64831': '9023449', '64832': '9023450', '64834': '9023452', '64835': '9023453', '64836': '9023454', '64840': '9023455', '64842': '9023457', '64843': '9023458', '64844': '9023459', '64848': '9023460', '64850': '9023461', '64854': '9023462', '64855': '9023463', '64856': '9023464', '64859': '9023465', '64861': '9023466', '64862': '9023467', '64863': '9023468', '64865': '9023469', '64866': '9023470', '64867': '9023471', '64870': '9023473', '64873': '9023474', '64874': '9023475', '65001': '9023476', '65010': '9023477', '65011': '9023478', '65013': '9023479', '65014': '9023480', '65016': '9023481', '65017': '9023482', '65018': '9023483', '65020': '9023484', '65023': '9023485', '65024': '9023486', '65025': '9023487', '65026': '9023488', '65032': '9023489', '65034': '9023490', '65035': '9023491', '65037': '9023493', '65039': '9023495', '65040': '9023496', '65041': '9023497', '65043': '9023498', '65046': '9023499', '65047': '9023500', '65049': '9023501', '65050': '9023502', '65051': '9023503', '65052': '9023504', '65053': '9023505', '65058': '9023506', '65059': '9023507', '65061': '9023508', '65062': '9023509', '65063': '9023510', '65064': '9023511', '65065': '9023512', '65066': '9023513', '65067': '9023514', '65068': '9023515', '65069': '9023516', '65072': '9023517', '65074': '9023518', '65075': '9023519', '65076': '9023520', '65077': '9023521', '65078': '9023522', '65079': '9023523', '65080': '9023524', '65081': '9023525', '65082': '9023526', '65083': '9023527', '65084': '9023528', '65085': '9023529', '65101': '9023530', '65109': '9023531', '65111': '9023532', '65201': '9023533', '65202': '9023534', '65203': '9023535', '65211': '9023536', '65212': '9023537', '65215': '9023538', '65216': '9023539', '65217': '9023540', '65218': '9023541', '65230': '9023542', '65231': '9023543', '65232': '9023544', '65233': '9023545', '65236': '9023546', '65237': '9023547', '65239': '9023548', '65240': '9023549', '65243': '9023550', '65244': '9023551', '65246': '9023552', '65247': '9023553', '65248': '9023554', '65250': '9023555', '65251': '9023556', '65254': '9023557', '65255': '9023558', '65256': '9023559', '65257': '9023560', '65258': '9023561', '65259': '9023562', '65260': '9023563', '65261': '9023564', '65262': '9023565', '65263': '9023566', '65264': '9023567', '65265': '9023568', '65270': '9023569', '65274': '9023570', '65275': '9023571', '65276': '9023572', '65279': '9023573', '65280': '9023574', '65281': '9023575', '65282': '9023576', '65283': '9023577', '65284': '9023578', '65285': '9023579', '65286': '9023580', '65287': '9023581', '65301': '9023582', '65305': '9023583', '65320': '9023584', '65321': '9023585', '65322': '9023586', '65323': '9023587', '65324': '9023588', '65325': '9023589', '65326': '9023590', '65329': '9023592', '65330': '9023593', '65332': '9023594', '65333': '9023595', '65334': '9023596', '65335': '9023597', '65336': '9023598', '65337': '9023599', '65338': '9023600', '65339': '9023601', '65340': '9023602', '65344': '9023603', '65345': '9023604', '65347': '9023605', '65348': '9023606', '65349': '9023607', '65350': '9023608', '65351': '9023609', '65354': '9023610', '65355': '9023611', '65360': '9023612', '65401': '9023613', '65409': '9023614', '65436': '9023615', '65438': '9023616', '65439': '9023617', '65440': '9023618', '65441': '9023619', '65443': '9023620', '65444': '9023621', '65446': '9023622', '65449': '9023623', '65452': '9023624', '65453': '9023625', '65456': '9023626', '65457': '9023627', '65459': '9023628', '65461': '9023629', '65462': '9023630', '65463': '9023631', '65464': '9023632', '65466': '9023633', '65468': '9023634', '65470': '9023635', '65473': '9023636', '65479': '9023637', '65483': '9023638', '65484': '9023639', '65486': '9023640', '65501': '9023641', '65529': '9023642', '65534': '9023643', '65535': '9023644', '65536': '9023645', '65542': '9023647', '65543': '9023648', '65548': '9023649', '65550': '9023650', '65552': '9023651', '65555': '9023652', '65556': '9023653', '65557': '9023654', '65559': '9023655', '65560': '9023656', '65564': '9023657', '65565': '9023658', '65566': '9023659', '65567': '9023660', '65570': '9023661', '65571': '9023662', '65580': '9023663', '65582': '9023664', '65583': '9023665', '65584': '9023666', '65588': '9023667', '65589': '9023668', '65590': '9023669', '65591': '9023670', '65601': '9023671', '65603': '9023672', '65604': '9023673', '65605': '9023674', '65606': '9023675', '65608': '9023676', '65609': '9023677', '65610': '9023678', '65611': '9023679', '65612': '9023680', '65613': '9023681', '65614': '9023682', '65616': '9023683', '65617': '9023684', '65618': '9023685', '65619': '9023686', '65620': '9023687', '65622': '9023688', '65624': '9023689', '65625': '9023690', '65626': '9023691', '65627': '9023692', '65629': '9023693', '65630': '9023694', '65631': '9023695', '65632': '9023696', '65633': '9023697', '65634': '9023698', '65635': '9023699', '65637': '9023700', '65638': '9023701', '65640': '9023702', '65641': '9023703', '65644': '9023704', '65646': '9023705', '65647': '9023706', '65648': '9023707', '65649': '9023708', '65650': '9023709', '65652': '9023710', '65653': '9023711', '65655': '9023712', '65656': '9023713', '65657': '9023714', '65658': '9023715', '65660': '9023716', '65661': '9023717', '65662': '9023718', '65663': '9023719', '65667': '9023721', '65668': '9023722', '65669': '9023723', '65672': '9023724', '65674': '9023725', '65676': '9023726', '65679': '9023727', '65680': '9023728', '65681': '9023729', '65682': '9023730', '65685': '9023731', '65686': '9023732', '65689': '9023733', '65690': '9023734', '65692': '9023735', '65702': '9023736', '65704': '9023737', '65705': '9023738', '65706': '9023739', '65707': '9023740', '65708': '9023741', '65710': '9023742', '65711': '9023743', '65712': '9023744', '65713': '9023745', '65714': '9023746', '65715': '9023747', '65717': '9023748', '65720': '9023749', '65721': '9023750', '65722': '9023751', '65723': '9023752', '65724': '9023753', '65725': '9023754', '65727': '9023755', '65728': '9023756', '65729': '9023757', '65730': '9023758', '65731': '9023759', '65732': '9023760', '65733': '9023761', '65734': '9023762', '65737': '9023763', '65738': '9023764', '65739': '9023765', '65740': '9023766', '65742': '9023767', '65744': '9023768', '65745': '9023769', '65746': '9023770', '65747': '9023771', '65752': '9023772', '65753': '9023773', '65754': '9023774', '65755': '9023775', '65756': '9023776', '65757': '9023777', '65759': '9023778', '65760': '9023779', '65761': '9023780', '65762': '9023781', '65764': '9023782', '65766': '9023783', '65767': '9023784', '65768': '9023785', '65769': '9023786', '65770': '9023787', '65771': '9023788', '65772': '9023789', '65773': '9023790', '65774': '9023791', '65775': '9023792', '65777': '9023793', '65778': '9023794', '65779': '9023795', '65781': '9023796', '65783': '9023797', '65784': '9023798', '65785': '9023799', '65786': '9023800', '65787': '9023801', '65788': '9023802', '65789': '9023803', '65790': '9023804', '65791': '9023805', '65793': '9023806', '65802': '9023808', '65803': '9023809', '65804': '9023810', '65806': '9023811', '65807': '9023812', '65809': '9023813', '65810': '9023814', '65897': '9023815', '66002': '9023816', '66006': '9023817', '66007': '9023818', '66008': '9023819', '66010': '9023820', '66012': '9023821', '66013': '9023822', '66014': '9023823', '66015': '9023824', '66016': '9023825', '66017': '9023826', '66018': '9023827', '66020': '9023828', '66021': '9023829', '66023': '9023830', '66025': '9023832', '66026': '9023833', '66027': '9023834', '66030': '9023835', '66031': '9023836', '66032': '9023837', '66033': '9023838', '66035': '9023839', '66039': '9023840', '66040': '9023841', '66041': '9023842', '66042': '9023843', '66043': '9023844', '66044': '9023845', '66045': '9023846', '66046': '9023847', '66047': '9023848', '66048': '9023849', '66049': '9023850', '66050': '9023851', '66052': '9023852', '66053': '9023853', '66054': '9023854', '66056': '9023855', '66058': '9023856', '66060': '9023857', '66061': '9023858', '66062': '9023859', '66064': '9023860', '66066': '9023861', '66067': '9023862', '66070': '9023863', '66071': '9023864', '66072': '9023865', '66073': '9023866', '66075': '9023867', '66076': '9023868', '66078': '9023869', '66079': '9023870', '66080': '9023871', '66083': '9023872', '66085': '9023873', '66086': '9023874', '66087': '9023875', '66088': '9023876', '66090': '9023877', '66091': '9023878', '66092': '9023879', '66093': '9023880', '66094': '9023881', '66095': '9023882', '66097': '9023883', '66101': '9023884', '66102': '9023885', '66103': '9023886', '66104': '9023887', '66105': '9023888', '66106': '9023889', '66109': '9023890', '66111': '9023891', '66112': '9023892', '66115': '9023893', '66118': '9023894', '66202': '9023896', '66203': '9023897', '66204': '9023898', '66205': '9023899', '66206': '9023900', '66207': '9023901', '66208': '9023902', '66209': '9023903', '66210': '9023904', '66211': '9023905', '66212': '9023906', '66213': '9023907', '66214': '9023908', '66215': '9023909', '66216': '9023910', '66217': '9023911', '66218': '9023912', '66219': '9023913', '66220': '9023914', '66221': '9023915', '66223': '9023916', '66224': '9023917', '66226': '9023918', '66227': '9023919', '66250': '9023920', '66401': '9023924', '66402': '9023925', '66403': '9023926', '66404': '9023927', '66406': '9023928', '66407': '9023929', '66408': '9023930', '66409': '9023931', '66411': '9023932', '66412': '9023933', '66413': '9023934', '66414': '9023935', '66415': '9023936', '66416': '9023937', '66417': '9023938', '66418': '9023939', '66419': '9023940', '66420': '9023941', '66422': '9023942', '66423': '9023943', '66424': '9023944', '66425': '9023945', '66427': '9023946', '66428': '9023947', '66429': '9023948', '66431': '9023949', '66432': '9023950', '66434': '9023951', '66436': '9023952', '66438': '9023953', '66439': '9023954', '66440': '9023955', '66441': '9023956', '66442': '9023957', '66449': '9023958', '66451': '9023959', '66502': '9023960', '66503': '9023961', '66506': '9023962', '66507': '9023963', '66508': '9023964', '66509': '9023965', '66510': '9023966', '66512': '9023967', '66514': '9023968', '66515': '9023969', '66516': '9023970', '66517': '9023971', '66518': '9023972', '66520': '9023973', '66521': '9023974', '66522': '9023975', '66523': '9023976', '66524': '9023977', '66526': '9023978', '66527': '9023979', '66528': '9023980', '66531': '9023981', '66532': '9023982', '66533': '9023983', '66534': '9023984', '66535': '9023985', '66536': '9023986', '66537': '9023987', '66538': '9023988', '66539': '9023989', '66540': '9023990', '66541': '9023991', '66542': '9023992', '66543': '9023993', '66544': '9023994', '66546': '9023995', '66547': '9023996', '66548': '9023997', '66549': '9023998', '66550': '9023999', '66552': '9024000', '66554': '9024001', '66603': '9024002', '66604': '9024003', '66605': '9024004', '66606': '9024005', '66607': '9024006', '66608': '9024007', '66609': '9024008', '66610': '9024009', '66611': '9024010', '66612': '9024011', '66614': '9024012', '66615': '9024013', '66616': '9024014', '66617': '9024015', '66618': '9024016', '66619': '9024017', '66621': '9024018', '66701': '9024019', '66710': '9024020', '66711': '9024021', '66712': '9024022', '66713': '9024023', '66714': '9024024', '66716': '9024025', '66717': '9024026', '66720': '9024027', '66724': '9024028', '66725': '9024029', '66732': '9024030', '66733': '9024031', '66734': '9024032', '66735': '9024033', '66736': '9024034', '66738': '9024035', '66739': '9024036', '66740': '9024037', '66741': '9024038', '66743': '9024039', '66746': '9024040', '66748': '9024041', '66749': '9024042', '66751': '9024043', '66753': '9024044', '66754': '9024045', '66755': '9024046', '66756': '9024047', '66757': '9024048', '66758': '9024049', '66760': '9024051', '66761': '9024052', '66762': '9024053', '66763': '9024054', '66767': '9024055', '66769': '9024056', '66770': '9024057', '66771': '9024058', '66772': '9024059', '66773': '9024060', '66775': '9024061', '66776': '9024062', '66777': '9024063', '66778': '9024064', '66779': '9024065', '66780': '9024066', '66781': '9024067', '66783': '9024069', '66801': '9024070', '66830': '9024071', '66833': '9024072', '66834': '9024073', '66835': '9024074', '66838': '9024075', '66839': '9024076', '66840': '9024077', '66842': '9024078', '66843': '9024079', '66845': '9024080', '66846': '9024081', '66849': '9024082', '66850': '9024083', '66851': '9024084', '66852': '9024085', '66853': '9024086', '66854': '9024087', '66856': '9024088', '66857': '9024089', '66858': '9024090', '66859': '9024091', '66860': '9024092', '66861': '9024093', '66862': '9024094', '66864': '9024096', '66865': '9024097', '66866': '9024098', '66868': '9024099', '66869': '9024100', '66870': '9024101', '66871': '9024102', '66872': '9024103', '66873': '9024104', '66901': '9024105', '66930': '9024106', '66932': '9024107', '66933': '9024108', '66935': '9024109', '66936': '9024110', '66937': '9024111', '66938': '9024112', '66939': '9024113', '66940': '9024114', '66941': '9024115', '66942': '9024116', '66943': '9024117', '66944': '9024118', '66945': '9024119', '66946': '9024120', '66948': '9024121', '66949': '9024122', '66951': '9024123', '66952': '9024124', '66953': '9024125', '66955': '9024126', '66956': '9024127', '66958': '9024128', '66959': '9024129', '66960': '9024130', '66962': '9024131', '66963': '9024132', '66964': '9024133', '66966': '9024134', '66967': '9024135', '66968': '9024136', '66970': '9024137', '67001': '9024138', '67002': '9024139', '67003': '9024140', '67004': '9024141', '67005': '9024142', '67008': '9024143', '67009': '9024144', '67010': '9024145', '67012': '9024146', '67013': '9024147', '67016': '9024148', '67017': '9024149', '67018': '9024150', '67019': '9024151', '67020': '9024152', '67021': '9024153', '67022': '9024154', '67023': '9024155', '67024': '9024156', '67025': '9024157', '67026': '9024158', '67028': '9024159', '67029': '9024160', '67030': '9024161', '67031': '9024162', '67035': '9024163', '67036': '9024164', '67037': '9024165', '67038': '9024166', '67039': '9024167', '67041': '9024168', '67042': '9024169', '67045': '9024170', '67047': '9024171', '67049': '9024172', '67050': '9024173', '67051': '9024174', '67052': '9024175', '67053': '9024176', '67054': '9024177', '67055': '9024178', '67056': '9024179', '67057': '9024180', '67058': '9024181', '67059': '9024182', '67060': '9024183', '67061': '9024184', '67062': '9024185', '67063': '9024186', '67065': '9024187', '67066': '9024188', '67067': '9024189', '67068': '9024190', '67070': '9024191', '67071': '9024192', '67072': '9024193', '67073': '9024194', '67074': '9024195', '67101': '9024196', '67103': '9024197', '67104': '9024198', '67105': '9024199', '67106': '9024200', '67107': '9024201', '67108': '9024202', '67109': '9024203', '67110': '9024204', '67111': '9024205', '67112': '9024206', '67114': '9024207', '67117': '9024208', '67118': '9024209', '67119': '9024210', '67120': '9024211', '67122': '9024212', '67123': '9024213', '67124': '9024214', '67127': '9024215', '67131': '9024216', '67132': '9024217', '67133': '9024218', '67134': '9024219', '67135': '9024220', '67137': '9024221', '67138': '9024222', '67140': '9024223', '67142': '9024224', '67143': '9024225', '67144': '9024226', '67146': '9024227', '67147': '9024228', '67149': '9024229', '67150': '9024230', '67151': '9024231', '67152': '9024232', '67154': '9024233', '67155': '9024234', '67156': '9024235', '67159': '9024236', '67202': '9024237', '67203': '9024238', '67204': '9024239', '67205': '9024240', '67206': '9024241', '67207': '9024242', '67208': '9024243', '67209': '9024244', '67210': '9024245', '67211': '9024246', '67212': '9024247', '67213': '9024248', '67214': '9024249', '67215': '9024250', '67216': '9024251', '67217': '9024252', '67218': '9024253', '67219': '9024254', '67220': '9024255', '67223': '9024256', '67226': '9024257', '67227': '9024258', '67228': '9024259', '67230': '9024260', '67232': '9024261', '67235': '9024262', '67276': '9024263', '67301': '9024264', '67330': '9024265', '67332': '9024266', '67333': '9024267', '67335': '9024268', '67336': '9024269', '67337': '9024270', '67341': '9024271', '67342': '9024272', '67344': '9024273', '67345': '9024274', '67346': '9024275', '67347': '9024276', '67349': '9024277', '67351': '9024278', '67352': '9024279', '67353': '9024280', '67354': '9024281', '67355': '9024282', '67356': '9024283', '67357': '9024284', '67360': '9024285', '67361': '9024286', '67364': '9024287', '67401': '9024288', '67410': '9024289', '67416': '9024290', '67417': '9024291', '67418': '9024292', '67420': '9024293', '67422': '9024294', '67423': '9024295', '67425': '9024296', '67427': '9024297', '67428': '9024298', '67430': '9024299', '67431': '9024300', '67432': '9024301', '67436': '9024302', '67437': '9024303', '67438': '9024304', '67439': '9024305', '67441': '9024306', '67442': '9024307', '67443': '9024308', '67444': '9024309', '67445': '9024310', '67446': '9024311', '67447': '9024312', '67448': '9024313', '67449': '9024314', '67450': '9024315', '67451': '9024316', '67452': '9024317', '67454': '9024318', '67455': '9024319', '67456': '9024320', '67457': '9024321', '67458': '9024322', '67459': '9024323', '67460': '9024324', '67464': '9024325', '67466': '9024326', '67467': '9024327', '67468': '9024328', '67470': '9024329', '67473': '9024330', '67474': '9024331', '67475': '9024332', '67480': '9024334', '67481': '9024335', '67483': '9024337', '67484': '9024338', '67485': '9024339', '67487': '9024340', '67490': '9024341', '67491': '9024342', '67492': '9024343', '67501': '9024344', '67502': '9024345', '67505': '9024346', '67510': '9024347', '67511': '9024348', '67512': '9024349', '67513': '9024350', '67514': '9024351', '67515': '9024352', '67516': '9024353', '67518': '9024354', '67519': '9024355', '67520': '9024356', '67521': '9024357', '67522': '9024358', '67523': '9024359', '67524': '9024360', '67525': '9024361', '67526': '9024362', '67529': '9024363', '67530': '9024364', '67543': '9024365', '67544': '9024366', '67545': '9024367', '67546': '9024368', '67547': '9024369', '67548': '9024370', '67550': '9024371', '67552': '9024372', '67553': '9024373', '67554': '9024374', '67556': '9024375', '67557': '9024376', '67559': '9024377', '67560': '9024378', '67561': '9024379', '67563': '9024380', '67564': '9024381', '67565': '9024382', '67566': '9024383', '67567': '9024384', '67568': '9024385', '67570': '9024386', '67572': '9024387', '67573': '9024388', '67574': '9024389', '67575': '9024390', '67576': '9024391', '67578': '9024392', '67579': '9024393', '67581': '9024394', '67583': '9024395', '67584': '9024396', '67601': '9024398', '67621': '9024399', '67622': '9024400', '67623': '9024401', '67625': '9024402', '67626': '9024403', '67628': '9024404', '67629': '9024405', '67631': '9024406', '67632': '9024407', '67634': '9024408', '67635': '9024409', '67637': '9024410', '67638': '9024411', '67639': '9024412', '67640': '9024413', '67642': '9024414', '67643': '9024415', '67644': '9024416', '67645': '9024417', '67646': '9024418', '67647': '9024419', '67648': '9024420', '67649': '9024421', '67650': '9024422', '67651': '9024423', '67653': '9024424', '67654': '9024425', '67656': '9024426', '67657': '9024427', '67658': '9024428', '67659': '9024429', '67660': '9024430', '67661': '9024431', '67663': '9024432', '67664': '9024433', '67665': '9024434', '67669': '9024436', '67671': '9024437', '67672': '9024438', '67673': '9024439', '67674': '9024440', '67675': '9024441', '67701': '9024442', '67730': '9024443', '67731': '9024444', '67732': '9024445', '67733': '9024446', '67734': '9024447', '67735': '9024448', '67736': '9024449', '67737': '9024450', '67738': '9024451', '67739': '9024452', '67740': '9024453', '67741': '9024454', '67743': '9024455', '67744': '9024456', '67745': '9024457', '67747': '9024458', '67748': '9024459', '67749': '9024460', '67751': '9024461', '67752': '9024462', '67753': '9024463', '67756': '9024464', '67757': '9024465', '67758': '9024466', '67761': '9024467', '67762': '9024468', '67764': '9024469', '67801': '9024470', '67831': '9024471', '67834': '9024472', '67835': '9024473', '67836': '9024474', '67837': '9024475', '67838': '9024476', '67839': '9024477', '67841': '9024479', '67842': '9024480', '67843': '9024481', '67844': '9024482', '67846': '9024483', '67849': '9024484', '67850': '9024485', '67851': '9024486', '67853': '9024487', '67854': '9024488', '67855': '9024489', '67857': '9024490', '67859': '9024491', '67860': '9024492', '67861': '9024493', '67862': '9024494', '67863': '9024495', '67864': '9024496', '67865': '9024497', '67867': '9024498', '67868': '9024499', '67869': '9024500', '67870': '9024501', '67871': '9024502', '67876': '9024503', '67877': '9024504', '67878': '9024505', '67879': '9024506', '67880': '9024507', '67882': '9024508', '67901': '9024509', '67950': '9024510', '67951': '9024511', '67952': '9024512', '67953': '9024513', '67954': '9024514', '68002': '9024516', '68003': '9024517', '68004': '9024518', '68005': '9024519', '68007': '9024520', '68008': '9024521', '68010': '9024522', '68014': '9024523', '68015': '9024524', '68017': '9024525', '68018': '9024526', '68019': '9024527', '68020': '9024528', '68022': '9024529', '68023': '9024530', '68025': '9024531', '68028': '9024532', '68029': '9024533', '68030': '9024534', '68031': '9024535', '68033': '9024536', '68034': '9024537', '68036': '9024538', '68037': '9024539', '68038': '9024540', '68039': '9024541', '68040': '9024542', '68041': '9024543', '68042': '9024544', '68044': '9024545', '68045': '9024546', '68046': '9024547', '68047': '9024548', '68048': '9024549', '68050': '9024550', '68055': '9024551', '68057': '9024552', '68058': '9024553', '68059': '9024554', '68061': '9024555', '68062': '9024556', '68064': '9024558', '68065': '9024559', '68066': '9024560', '68067': '9024561', '68068': '9024562', '68069': '9024563', '68070': '9024564', '68071': '9024565', '68073': '9024567', '68102': '9024568', '68104': '9024569', '68105': '9024570', '68106': '9024571', '68107': '9024572', '68108': '9024573', '68110': '9024574', '68111': '9024575', '68112': '9024576', '68113': '9024577', '68114': '9024578', '68116': '9024579', '68117': '9024580', '68118': '9024581', '68122': '9024582', '68123': '9024583', '68124': '9024584', '68127': '9024585', '68128': '9024586', '68130': '9024587', '68131': '9024588', '68132': '9024589', '68133': '9024590', '68134': '9024591', '68135': '9024592', '68136': '9024593', '68137': '9024594', '68138': '9024595', '68142': '9024596', '68144': '9024597', '68147': '9024599', '68152': '9024600', '68154': '9024601', '68157': '9024602', '68164': '9024603', '68178': '9024604', '68179': '9024605', '68180': '9024606', '68182': '9024607', '68183': '9024608', '68197': '9024609', '68198': '9024610', '68301': '9024611', '68303': '9024612', '68304': '9024613', '68305': '9024614', '68307': '9024615', '68309': '9024616', '68310': '9024617', '68313': '9024618', '68314': '9024619', '68315': '9024620', '68316': '9024621', '68317': '9024622', '68318': '9024623', '68319': '9024624', '68320': '9024625', '68321': '9024626', '68322': '9024627', '68323': '9024628', '68324': '9024629', '68325': '9024630', '68326': '9024631', '68327': '9024632', '68328': '9024633', '68329': '9024634', '68331': '9024636', '68332': '9024637', '68333': '9024638', '68335': '9024639', '68336': '9024640', '68337': '9024641', '68338': '9024642', '68339': '9024643', '68340': '9024644', '68341': '9024645', '68342': '9024646', '68343': '9024647', '68344': '9024648', '68345': '9024649', '68346': '9024650', '68347': '9024651', '68348': '9024652', '68349': '9024653', '68350': '9024654', '68351': '9024655', '68352': '9024656', '68354': '9024657', '68355': '9024658', '68357': '9024659', '68358': '9024660', '68359': '9024661', '68360': '9024662', '68361': '9024663', '68365': '9024665', '68366': '9024666', '68367': '9024667', '68368': '9024668', '68370': '9024669', '68371': '9024670', '68372': '9024671', '68375': '9024672', '68376': '9024673', '68377': '9024674', '68378': '9024675', '68379': '9024676', '68380': '9024677', '68381': '9024678', '68382': '9024679', '68401': '9024680', '68402': '9024681', '68404': '9024683', '68405': '9024684', '68406': '9024685', '68407': '9024686', '68409': '9024687', '68410': '9024688', '68413': '9024689', '68414': '9024690', '68415': '9024691', '68416': '9024692', '68417': '9024693', '68418': '9024694', '68419': '9024695', '68420': '9024696', '68421': '9024697', '68422': '9024698', '68423': '9024699', '68424': '9024700', '68428': '9024701', '68429': '9024702', '68430': '9024703', '68431': '9024704', '68433': '9024705', '68434': '9024706', '68436': '9024707', '68437': '9024708', '68439': '9024710', '68440': '9024711', '68441': '9024712', '68442': '9024713', '68443': '9024714', '68444': '9024715', '68445': '9024716', '68446': '9024717', '68447': '9024718', '68448': '9024719', '68450': '9024720', '68453': '9024721', '68454': '9024722', '68455': '9024723', '68456': '9024724', '68457': '9024725', '68458': '9024726', '68460': '9024727', '68461': '9024728', '68462': '9024729', '68463': '9024730', '68464': '9024731', '68465': '9024732', '68466': '9024733', '68467': '9024734', '68502': '9024736', '68503': '9024737', '68504': '9024738', '68505': '9024739', '68506': '9024740', '68507': '9024741', '68508': '9024742', '68510': '9024743', '68512': '9024744', '68514': '9024745', '68516': '9024746', '68517': '9024747', '68520': '9024748', '68521': '9024749', '68522': '9024750', '68523': '9024751', '68524': '9024752', '68526': '9024753', '68527': '9024754', '68528': '9024755', '68531': '9024756', '68532': '9024757', '68601': '9024759', '68620': '9024760', '68621': '9024761', '68622': '9024762', '68623': '9024763', '68624': '9024764', '68626': '9024765', '68627': '9024766', '68628': '9024767', '68629': '9024768', '68631': '9024769', '68632': '9024770', '68633': '9024771', '68635': '9024773', '68636': '9024774', '68637': '9024775', '68638': '9024776', '68640': '9024777', '68641': '9024778', '68642': '9024779', '68643': '9024780', '68644': '9024781', '68647': '9024782', '68648': '9024783', '68649': '9024784', '68651': '9024785', '68652': '9024786', '68653': '9024787', '68654': '9024788', '68655': '9024789', '68658': '9024790', '68659': '9024791', '68660': '9024792', '68661': '9024793', '68662': '9024794', '68663': '9024795', '68665': '9024797', '68666': '9024798', '68667': '9024799', '68669': '9024800', '68701': '9024801', '68710': '9024802', '68711': '9024803', '68713': '9024804', '68714': '9024805', '68715': '9024806', '68716': '9024807', '68717': '9024808', '68718': '9024809', '68719': '9024810', '68720': '9024811', '68722': '9024812', '68723': '9024813', '68724': '9024814', '68725': '9024815', '68726': '9024816', '68727': '9024817', '68728': '9024818', '68729': '9024819', '68730': '9024820', '68731': '9024821', '68732': '9024822', '68733': '9024823', '68734': '9024824', '68735': '9024825', '68736': '9024826', '68739': '9024827', '68740': '9024828', '68741': '9024829', '68742': '9024830', '68743': '9024831', '68745': '9024832', '68746': '9024833', '68747': '9024834', '68748': '9024835', '68751': '9024836', '68752': '9024837', '68753': '9024838', '68755': '9024839', '68756': '9024840', '68757': '9024841', '68758': '9024842', '68759': '9024843', '68760': '9024844', '68761': '9024845', '68763': '9024846', '68764': '9024847', '68765': '9024848', '68766': '9024849', '68767': '9024850', '68768': '9024851', '68769': '9024852', '68770': '9024853', '68771': '9024854', '68773': '9024855', '68774': '9024856', '68776': '9024857', '68777': '9024858', '68778': '9024859', '68779': '9024860', '68780': '9024861', '68781': '9024862', '68783': '9024863', '68784': '9024864', '68785': '9024865', '68786': '9024866', '68787': '9024867', '68788': '9024868', '68789': '9024869', '68790': '9024870', '68791': '9024871', '68792': '9024872', '68801': '9024873', '68803': '9024874', '68810': '9024875', '68812': '9024876', '68813': '9024877', '68814': '9024878', '68815': '9024879', '68816': '9024880', '68817': '9024881', '68818': '9024882', '68820': '9024883', '68821': '9024884', '68822': '9024885', '68823': '9024886', '68824': '9024887', '68825': '9024888', '68826': '9024889', '68827': '9024890', '68828': '9024891', '68831': '9024892', '68832': '9024893', '68833': '9024894', '68834': '9024895', '68835': '9024896', '68836': '9024897', '68837': '9024898', '68838': '9024899', '68840': '9024900', '68841': '9024901', '68842': '9024902', '68843': '9024903', '68844': '9024904', '68845': '9024905', '68846': '9024906', '68847': '9024907', '68849': '9024908', '68850': '9024909', '68852': '9024910', '68853': '9024911', '68854': '9024912', '68855': '9024913', '68856': '9024914', '68858': '9024915', '68859': '9024916', '68860': '9024917', '68861': '9024918', '68862': '9024919', '68863': '9024920', '68864': '9024921', '68865': '9024922', '68866': '9024923', '68869': '9024924', '68870': '9024925', '68871': '9024926', '68872': '9024927', '68873': '9024928', '68874': '9024929', '68875': '9024930', '68876': '9024931', '68878': '9024932', '68879': '9024933', '68881': '9024934', '68882': '9024935', '68883': '9024936', '68901': '9024937', '68920': '9024938', '68922': '9024939', '68924': '9024940', '68925': '9024941', '68926': '9024942', '68927': '9024943', '68928': '9024944', '68929': '9024945', '68930': '9024946', '68932': '9024947', '68933': '9024948', '68934': '9024949', '68935': '9024950', '68936': '9024951', '68937': '9024952', '68938': '9024953', '68939': '9024954', '68940': '9024955', '68941': '9024956', '68942': '9024957', '68943': '9024958', '68944': '9024959', '68945': '9024960', '68946': '9024961', '68947': '9024962', '68948': '9024963', '68949': '9024964', '68950': '9024965', '68952': '9024966', '68955': '9024967', '68956': '9024968', '68957': '9024969', '68958': '9024970', '68959': '9024971', '68960': '9024972', '68961': '9024973', '68964': '9024974', '68966': '9024975', '68967': '9024976', '68970': '9024977', '68971': '9024978', '68972': '9024979', '68973': '9024980', '68974': '9024981', '68975': '9024982', '68976': '9024983', '68977': '9024984', '68978': '9024985', '68979': '9024986', '68980': '9024987', '68981': '9024988', '68982': '9024989', '69001': '9024990', '69020': '9024991', '69021': '9024992', '69022': '9024993', '69023': '9024994', '69024': '9024995', '69025': '9024996', '69026': '9024997', '69027': '9024998', '69028': '9024999', '69029': '9025000', '69030': '9025001', '69032': '9025003', '69033': '9025004', '69034': '9025005', '69036': '9025006', '69037': '9025007', '69038': '9025008', '69039': '9025009', '69040': '9025010', '69041': '9025011', '69042': '9025012', '69043': '9025013', '69044': '9025014', '69045': '9025015', '69046': '9025016', '69101': '9025017', '69120': '9025018', '69121': '9025019', '69122': '9025020', '69123': '9025021', '69125': '9025022', '69127': '9025023', '69128': '9025024', '69129': '9025025', '69130': '9025026', '69131': '9025027', '69132': '9025028', '69133': '9025029', '69134': '9025030', '69135': '9025031', '69138': '9025032', '69140': '9025033', '69141': '9025034', '69142': '9025035', '69143': '9025036', '69144': '9025037', '69145': '9025038', '69146': '9025039', '69147': '9025040', '69148': '9025041', '69149': '9025042', '69150': '9025043', '69151': '9025044', '69152': '9025045', '69153': '9025046', '69154': '9025047', '69155': '9025048', '69156': '9025049', '69157': '9025050', '69161': '9025051', '69162': '9025052', '69163': '9025053', '69165': '9025054', '69166': '9025055', '69167': '9025056', '69168': '9025057', '69169': '9025058', '69170': '9025059', '69201': '9025060', '69210': '9025061', '69211': '9025062', '69212': '9025063', '69214': '9025064', '69216': '9025065', '69217': '9025066', '69218': '9025067', '69219': '9025068', '69220': '9025069', '69221': '9025070', '69301': '9025071', '69331': '9025072', '69333': '9025073', '69334': '9025074', '69335': '9025075', '69336': '9025076', '69337': '9025077', '69339': '9025078', '69340': '9025079', '69341': '9025080', '69343': '9025081', '69345': '9025082', '69346': '9025083', '69347': '9025084', '69348': '9025085', '69350': '9025086', '69351': '9025087', '69352': '9025088', '69354': '9025089', '69356': '9025091', '69357': '9025092', '69358': '9025093', '69360': '9025094', '69361': '9025095', '69366': '9025097', '69367': '9025098', '70001': '9025099', '70002': '9025100', '70003': '9025101', '70005': '9025102', '70006': '9025103', '70030': '9025104', '70031': '9025105', '70032': '9025106', '70036': '9025107', '70037': '9025108', '70039': '9025110', '70040': '9025111', '70041': '9025112', '70043': '9025113', '70047': '9025114', '70049': '9025115', '70051': '9025117', '70052': '9025118', '70053': '9025119', '70056': '9025120', '70057': '9025121', '70058': '9025122', '70062': '9025123', '70065': '9025124', '70067': '9025125', '70068': '9025126', '70070': '9025127', '70071': '9025128', '70072': '9025129', '70075': '9025130', '70076': '9025131', '70079': '9025132', '70080': '9025133', '70082': '9025134', '70083': '9025135', '70084': '9025136', '70085': '9025137', '70086': '9025138', '70087': '9025139', '70090': '9025140', '70091': '9025141', '70092': '9025142', '70094': '9025143', '70112': '9025144', '70113': '9025145', '70114': '9025146', '70115': '9025147', '70116': '9025148', '70117': '9025149', '70118': '9025150', '70119': '9025151', '70121': '9025152', '70122': '9025153', '70123': '9025154', '70124': '9025155', '70125': '9025156', '70126': '9025157', '70127': '9025158', '70128': '9025159', '70129': '9025160', '70130': '9025161', '70131': '9025162', '70139': '9025163', '70146': '9025164', '70163': '9025165', '70170': '9025166', '70301': '9025167', '70310': '9025168', '70339': '9025169', '70341': '9025170', '70342': '9025171', '70343': '9025172', '70344': '9025173', '70345': '9025174', '70346': '9025175', '70352': '9025176', '70353': '9025177', '70354': '9025178', '70355': '9025179', '70356': '9025180', '70357': '9025181', '70358': '9025182', '70359': '9025183', '70360': '9025184', '70363': '9025185', '70364': '9025186', '70372': '9025187', '70373': '9025188', '70374': '9025189', '70375': '9025190', '70377': '9025191', '70380': '9025192', '70390': '9025193', '70392': '9025195', '70393': '9025196', '70394': '9025197', '70395': '9025198', '70397': '9025199', '70401': '9025200', '70403': '9025201', '70420': '9025202', '70422': '9025203', '70426': '9025204', '70427': '9025205', '70431': '9025206', '70433': '9025207', '70435': '9025208', '70436': '9025209', '70437': '9025210', '70438': '9025211', '70441': '9025212', '70442': '9025213', '70443': '9025214', '70444': '9025215', '70445': '9025216', '70446': '9025217', '70447': '9025218', '70448': '9025219', '70449': '9025220', '70450': '9025221', '70452': '9025223', '70453': '9025224', '70454': '9025225', '70455': '9025226', '70456': '9025227', '70458': '9025228', '70460': '9025229', '70461': '9025230', '70462': '9025231', '70465': '9025233', '70466': '9025234', '70471': '9025235', '70501': '9025236', '70503': '9025237', '70504': '9025238', '70506': '9025239', '70507': '9025240', '70508': '9025241', '70510': '9025242', '70512': '9025243', '70514': '9025244', '70515': '9025245', '70516': '9025246', '70517': '9025247', '70518': '9025248', '70520': '9025249', '70525': '9025251', '70526': '9025252', '70528': '9025253', '70529': '9025254', '70531': '9025255', '70532': '9025256', '70533': '9025257', '70535': '9025259', '70537': '9025260', '70538': '9025261', '70541': '9025262', '70542': '9025263', '70543': '9025264', '70544': '9025265', '70546': '9025258', '70548': '9025267', '70549': '9025268', '70552': '9025270', '70554': '9025271', '70555': '9025272', '70559': '9025274', '70560': '9025275', '70563': '9025276', '70570': '9025277', '70577': '9025280', '70578': '9025281', '70581': '9025282', '70582': '9025283', '70583': '9025284', '70584': '9025285', '70586': '9025287', '70589': '9025288', '70591': '9025289', '70592': '9025290', '70601': '9025291', '70605': '9025292', '70607': '9025293', '70611': '9025295', '70615': '9025296', '70630': '9025297', '70631': '9025298', '70632': '9025299', '70633': '9025300', '70634': '9025301', '70637': '9025302', '70638': '9025303', '70639': '9025304', '70640': '9025305', '70643': '9025306', '70644': '9025307', '70645': '9025308', '70647': '9025309', '70648': '9025310', '70650': '9025311', '70652': '9025313', '70653': '9025314', '70654': '9025315', '70655': '9025316', '70656': '9025317', '70657': '9025318', '70658': '9025319', '70660': '9025320', '70661': '9025321', '70662': '9025322', '70663': '9025323', '70665': '9025324', '70668': '9025325', '70669': '9025326', '70706': '9025327', '70710': '9025328', '70711': '9025329', '70714': '9025330', '70715': '9025331', '70719': '9025332', '70721': '9025333', '70722': '9025334', '70723': '9025335', '70725': '9025336', '70726': '9025337', '70729': '9025338', '70730': '9025339', '70732': '9025340', '70733': '9025341', '70734': '9025342', '70736': '9025343', '70737': '9025344', '70739': '9025345', '70740': '9025346', '70744': '9025347', '70748': '9025348', '70749': '9025349', '70750': '9025350', '70752': '9025351', '70753': '9025352', '70754': '9025353', '70755': '9025354', '70756': '9025355', '70757': '9025356', '70759': '9025357', '70760': '9025358', '70761': '9025359', '70762': '9025360', '70763': '9025361', '70764': '9025362', '70767': '9025363', '70769': '9025364', '70770': '9025365', '70772': '9025366', '70773': '9025367', '70774': '9025368', '70775': '9025369', '70776': '9025370', '70777': '9025371', '70778': '9025372', '70780': '9025373', '70782': '9025374', '70783': '9025375', '70785': '9025376', '70787': '9025377', '70788': '9025378', '70789': '9025379', '70791': '9025380', '70801': '9025381', '70802': '9025382', '70805': '9025384', '70806': '9025385', '70807': '9025386', '70808': '9025387', '70809': '9025388', '70810': '9025389', '70811': '9025390', '70812': '9025391', '70814': '9025392', '70815': '9025393', '70816': '9025394', '70817': '9025395', '70818': '9025396', '70819': '9025397', '70820': '9025398', '70827': '9025399', '70836': '9025400', '71001': '9025401', '71002': '9025402', '71003': '9025403', '71004': '9025404', '71006': '9025405', '71007': '9025406', '71008': '9025407', '71016': '9025409', '71018': '9025410', '71019': '9025411', '71021': '9025412', '71023': '9025413', '71024': '9025414', '71027': '9025416', '71028': '9025417', '71029': '9025418', '71030': '9025419', '71031': '9025420', '71032': '9025421', '71033': '9025422', '71037': '9025423', '71038': '9025424', '71039': '9025425', '71040': '9025426', '71043': '9025427', '71044': '9025428', '71045': '9025429', '71046': '9025430', '71047': '9025431', '71048': '9025432', '71049': '9025433', '71051': '9025434', '71052': '9025435', '71055': '9025436', '71060': '9025437', '71061': '9025438', '71063': '9025439', '71064': '9025440', '71065': '9025441', '71067': '9025442', '71068': '9025443', '71069': '9025444', '71070': '9025445', '71071': '9025446', '71072': '9025447', '71073': '9025448', '71075': '9025449', '71078': '9025450', '71079': '9025451', '71082': '9025452', '71101': '9025453', '71103': '9025455', '71104': '9025456', '71105': '9025457', '71106': '9025458', '71107': '9025459', '71108': '9025460', '71109': '9025461', '71110': '9025462', '71111': '9025463', '71112': '9025464', '71115': '9025465', '71118': '9025466', '71119': '9025467', '71129': '9025468', '71201': '9025470', '71202': '9025471', '71203': '9025472', '71209': '9025473', '71212': '9025474', '71219': '9025475', '71220': '9025476', '71222': '9025477', '71223': '9025478', '71225': '9025479', '71226': '9025480', '71227': '9025481', '71229': '9025482', '71232': '9025483', '71234': '9025484', '71235': '9025485', '71237': '9025486', '71238': '9025487', '71241': '9025488', '71243': '9025489', '71245': '9025490', '71247': '9025491', '71250': '9025492', '71251': '9025493', '71254': '9025494', '71256': '9025495', '71259': '9025496', '71260': '9025497', '71261': '9025498', '71263': '9025499', '71264': '9025500', '71266': '9025501', '71268': '9025502', '71269': '9025503', '71270': '9025504', '71275': '9025506', '71276': '9025507', '71277': '9025508', '71280': '9025509', '71282': '9025510', '71286': '9025511', '71291': '9025512', '71292': '9025513', '71295': '9025514', '71301': '9025515', '71302': '9025516', '71303': '9025517', '71316': '9025518', '71322': '9025519', '71323': '9025520', '71325': '9025521', '71326': '9025522', '71327': '9025523', '71328': '9025524', '71331': '9025526', '71333': '9025527', '71334': '9025528', '71336': '9025529', '71340': '9025530', '71341': '9025531', '71342': '9025532', '71343': '9025533', '71345': '9025534', '71346': '9025535', '71350': '9025536', '71351': '9025537', '71353': '9025538', '71354': '9025539', '71355': '9025540', '71356': '9025541', '71357': '9025542', '71358': '9025543', '71359': '9025544', '71360': '9025545', '71362': '9025547', '71366': '9025548', '71367': '9025549', '71368': '9025550', '71369': '9025551', '71371': '9025552', '71373': '9025553', '71375': '9025554', '71378': '9025555', '71403': '9025556', '71404': '9025557', '71405': '9025558', '71406': '9025559', '71407': '9025560', '71409': '9025561', '71411': '9025563', '71416': '9025564', '71417': '9025565', '71418': '9025566', '71419': '9025567', '71422': '9025568', '71423': '9025569', '71424': '9025570', '71427': '9025571', '71428': '9025572', '71429': '9025573', '71430': '9025574', '71432': '9025575', '71433': '9025576', '71435': '9025578', '71438': '9025579', '71439': '9025580', '71441': '9025581', '71446': '9025582', '71447': '9025583', '71449': '9025584', '71450': '9025585', '71452': '9025586', '71454': '9025587', '71455': '9025588', '71456': '9025589', '71457': '9025590', '71459': '9025591', '71461': '9025592', '71462': '9025593', '71463': '9025594', '71465': '9025595', '71466': '9025596', '71467': '9025597', '71468': '9025598', '71469': '9025599', '71472': '9025600', '71473': '9025601', '71474': '9025602', '71479': '9025603', '71480': '9025604', '71483': '9025605', '71485': '9025606', '71486': '9025607', '71601': '9025608', '71602': '9025609', '71603': '9025610', '71630': '9025611', '71631': '9025612', '71635': '9025613', '71638': '9025614', '71639': '9025615', '71640': '9025616', '71642': '9025617', '71643': '9025618', '71644': '9025619', '71646': '9025620', '71647': '9025621', '71651': '9025622', '71652': '9025623', '71653': '9025624', '71654': '9025625', '71655': '9025626', '71658': '9025627', '71660': '9025628', '71661': '9025629', '71662': '9025630', '71663': '9025631', '71665': '9025632', '71667': '9025633', '71670': '9025634', '71671': '9025635', '71674': '9025636', '71675': '9025637', '71676': '9025638', '71677': '9025639', '71701': '9025640', '71720': '9025641', '71724': '9025642', '71725': '9025643', '71726': '9025644', '71730': '9025645', '71740': '9025646', '71742': '9025647', '71743': '9025648', '71744': '9025649', '71747': '9025650', '71749': '9025651', '71751': '9025652', '71752': '9025653', '71753': '9025654', '71758': '9025655', '71762': '9025656', '71763': '9025657', '71764': '9025658', '71765': '9025659', '71766': '9025660', '71770': '9025661', '71801': '9025662', '71822': '9025663', '71825': '9025665', '71826': '9025666', '71827': '9025667', '71831': '9025668', '71832': '9025669', '71833': '9025670', '71834': '9025671', '71835': '9025672', '71836': '9025673', '71837': '9025674', '71838': '9025675', '71839': '9025676', '71841': '9025677', '71842': '9025678', '71845': '9025679', '71846': '9025680', '71847': '9025681', '71851': '9025682', '71852': '9025683', '71853': '9025684', '71854': '9025685', '71855': '9025686', '71857': '9025687', '71858': '9025688', '71859': '9025689', '71860': '9025690', '71861': '9025691', '71862': '9025692', '71866': '9025693', '71901': '9025694', '71909': '9025695', '71913': '9025696', '71921': '9025697', '71923': '9025698', '71929': '9025699', '71933': '9025700', '71935': '9025701', '71937': '9025702', '71940': '9025703', '71941': '9025704', '71943': '9025705', '71944': '9025706', '71945': '9025707', '71949': '9025708', '71950': '9025709', '71952': '9025710', '71953': '9025711', '71956': '9025712', '71957': '9025713', '71958': '9025714', '71959': '9025715', '71960': '9025716', '71961': '9025717', '71962': '9025718', '71964': '9025719', '71965': '9025720', '71968': '9025721', '71969': '9025722', '71970': '9025723', '71971': '9025724', '71972': '9025725', '71973': '9025726', '71999': '9025727', '72001': '9025728', '72002': '9025729', '72003': '9025730', '72004': '9025731', '72005': '9025732', '72006': '9025733', '72007': '9025734', '72010': '9025735', '72011': '9025736', '72012': '9025737', '72013': '9025738', '72015': '9025739', '72016': '9025740', '72017': '9025741', '72019': '9025742', '72020': '9025743', '72021': '9025744', '72022': '9025745', '72023': '9025746', '72024': '9025747', '72025': '9025748', '72026': '9025749', '72027': '9025750', '72029': '9025751', '72030': '9025752', '72031': '9025753', '72032': '9025754', '72034': '9025755', '72035': '9025756', '72036': '9025757', '72038': '9025758', '72039': '9025759', '72040': '9025760', '72041': '9025761', '72042': '9025762', '72044': '9025764', '72045': '9025765', '72046': '9025766', '72047': '9025767', '72048': '9025768', '72051': '9025769', '72055': '9025771', '72057': '9025772', '72058': '9025773', '72060': '9025774', '72061': '9025775', '72063': '9025776', '72064': '9025777', '72065': '9025778', '72067': '9025779', '72068': '9025780', '72069': '9025781', '72070': '9025782', '72072': '9025783', '72073': '9025784', '72076': '9025785', '72079': '9025786', '72080': '9025787', '72081': '9025788', '72082': '9025789', '72084': '9025790', '72086': '9025792', '72087': '9025793', '72088': '9025794', '72099': '9025795', '72101': '9025796', '72102': '9025797', '72103': '9025798', '72104': '9025799', '72106': '9025800', '72107': '9025801', '72110': '9025802', '72111': '9025803', '72112': '9025804', '72113': '9025805', '72114': '9025806', '72116': '9025807', '72117': '9025808', '72118': '9025809', '72120': '9025810', '72121': '9025811', '72122': '9025812', '72125': '9025813', '72126': '9025814', '72127': '9025815', '72128': '9025816', '72129': '9025817', '72130': '9025818', '72131': '9025819', '72132': '9025820', '72134': '9025821', '72135': '9025822', '72136': '9025823', '72137': '9025824', '72140': '9025825', '72141': '9025826', '72142': '9025827', '72143': '9025828', '72149': '9025829', '72150': '9025830', '72152': '9025831', '72153': '9025832', '72156': '9025833', '72157': '9025834', '72160': '9025835', '72165': '9025836', '72166': '9025837', '72167': '9025838', '72168': '9025839', '72169': '9025840', '72173': '9025841', '72175': '9025842', '72176': '9025843', '72179': '9025844', '72180': '9025845', '72181': '9025846', '72199': '9025847', '72201': '9025848', '72202': '9025849', '72204': '9025850', '72205': '9025851', '72206': '9025852', '72207': '9025853', '72209': '9025854', '72210': '9025855', '72211': '9025856', '72212': '9025857', '72223': '9025859', '72227': '9025860', '72301': '9025861', '72315': '9025862', '72320': '9025863', '72321': '9025864', '72324': '9025865', '72326': '9025866', '72327': '9025867', '72328': '9025868', '72330': '9025869', '72331': '9025870', '72332': '9025871', '72333': '9025872', '72335': '9025873', '72338': '9025874', '72340': '9025876', '72342': '9025878', '72346': '9025879', '72347': '9025880', '72348': '9025881', '72350': '9025882', '72351': '9025883', '72353': '9025884', '72354': '9025885', '72355': '9025886', '72358': '9025887', '72360': '9025889', '72364': '9025890', '72365': '9025891', '72366': '9025892', '72367': '9025893', '72368': '9025894', '72370': '9025895', '72372': '9025896', '72373': '9025897', '72374': '9025898', '72376': '9025899', '72379': '9025901', '72384': '9025902', '72386': '9025903', '72390': '9025904', '72392': '9025905', '72394': '9025906', '72395': '9025907', '72396': '9025908', '72401': '9025909', '72404': '9025910', '72410': '9025911', '72411': '9025912', '72412': '9025913', '72413': '9025914', '72414': '9025915', '72415': '9025916', '72416': '9025917', '72417': '9025918', '72419': '9025919', '72421': '9025920', '72422': '9025921', '72425': '9025922', '72427': '9025924', '72428': '9025925', '72429': '9025926', '72430': '9025927', '72432': '9025928', '72433': '9025929', '72434': '9025930', '72435': '9025931', '72436': '9025932', '72437': '9025933', '72438': '9025934', '72440': '9025935', '72442': '9025936', '72443': '9025937', '72444': '9025938', '72447': '9025939', '72450': '9025940', '72453': '9025941', '72454': '9025942', '72455': '9025943', '72456': '9025944', '72458': '9025946', '72459': '9025947', '72460': '9025948', '72461': '9025949', '72462': '9025950', '72466': '9025951', '72469': '9025952', '72470': '9025953', '72471': '9025954', '72472': '9025955', '72473': '9025956', '72476': '9025957', '72478': '9025958', '72479': '9025959', '72482': '9025960', '72501': '9025961', '72512': '9025962', '72513': '9025963', '72515': '9025964', '72519': '9025966', '72520': '9025967', '72521': '9025968', '72522': '9025969', '72523': '9025970', '72524': '9025971', '72527': '9025972', '72529': '9025973', '72530': '9025974', '72531': '9025975', '72532': '9025976', '72533': '9025977', '72534': '9025978', '72536': '9025979', '72537': '9025980', '72538': '9025981', '72539': '9025982', '72540': '9025983', '72542': '9025984', '72543': '9025985', '72544': '9025986', '72546': '9025987', '72550': '9025988', '72554': '9025989', '72555': '9025990', '72556': '9025991', '72560': '9025992', '72561': '9025993', '72562': '9025994', '72564': '9025995', '72565': '9025996', '72566': '9025997', '72567': '9025998', '72568': '9025999', '72569': '9026000', '72571': '9026001', '72572': '9026002', '72576': '9026004', '72577': '9026005', '72578': '9026006', '72579': '9026007', '72581': '9026008', '72583': '9026009', '72585': '9026010', '72601': '9026011', '72611': '9026012', '72616': '9026013', '72617': '9026014', '72619': '9026015', '72623': '9026016', '72626': '9026017', '72628': '9026018', '72629': '9026019', '72631': '9026020', '72632': '9026021', '72633': '9026022', '72634': '9026023', '72635': '9026024', '72636': '9026025', '72638': '9026026', '72639': '9026027', '72640': '9026028', '72641': '9026029', '72642': '9026030', '72644': '9026031', '72645': '9026032', '72650': '9026034', '72651': '9026035', '72653': '9026036', '72655': '9026037', '72658': '9026038', '72660': '9026039', '72661': '9026040', '72662': '9026041', '72663': '9026042', '72666': '9026043', '72668': '9026044', '72670': '9026045', '72675': '9026046', '72679': '9026047', '72680': '9026048', '72682': '9026049', '72683': '9026050', '72685': '9026051', '72686': '9026052', '72687': '9026053', '72701': '9026054', '72703': '9026055', '72704': '9026056', '72712': '9026058', '72714': '9026059', '72715': '9026060', '72716': '9026061', '72717': '9026062', '72718': '9026063', '72719': '9026064', '72721': '9026065', '72722': '9026066', '72727': '9026067', '72729': '9026068', '72730': '9026069', '72732': '9026070', '72734': '9026071', '72736': '9026072', '72738': '9026073', '72739': '9026074', '72740': '9026075', '72742': '9026077', '72744': '9026078', '72745': '9026079', '72747': '9026080', '72749': '9026081', '72751': '9026082', '72752': '9026083', '72753': '9026084', '72756': '9026085', '72758': '9026086', '72760': '9026087', '72761': '9026088', '72762': '9026089', '72764': '9026090', '72768': '9026091', '72769': '9026092', '72773': '9026093', '72774': '9026094', '72776': '9026095', '72801': '9026096', '72802': '9026097', '72821': '9026098', '72823': '9026099', '72824': '9026100', '72827': '9026102', '72828': '9026103', '72830': '9026105', '72832': '9026106', '72833': '9026107', '72834': '9026108', '72835': '9026109', '72837': '9026110', '72838': '9026111', '72839': '9026112', '72840': '9026113', '72841': '9026114', '72842': '9026115', '72843': '9026116', '72845': '9026117', '72846': '9026118', '72847': '9026119', '72851': '9026120', '72852': '9026121', '72853': '9026122', '72854': '9026123', '72855': '9026124', '72856': '9026125', '72857': '9026126', '72858': '9026127', '72860': '9026128', '72863': '9026129', '72865': '9026130', '72901': '9026131', '72903': '9026132', '72904': '9026133', '72908': '9026134', '72916': '9026135', '72921': '9026136', '72923': '9026137', '72926': '9026138', '72927': '9026139', '72928': '9026140', '72930': '9026141', '72932': '9026142', '72933': '9026143', '72934': '9026144', '72935': '9026145', '72936': '9026146', '72937': '9026147', '72938': '9026148', '72940': '9026149', '72941': '9026150', '72943': '9026151', '72944': '9026152', '72946': '9026154', '72947': '9026155', '72948': '9026156', '72949': '9026157', '72950': '9026158', '72951': '9026159', '72952': '9026160', '72955': '9026161', '72956': '9026162', '72958': '9026163', '72959': '9026164', '73002': '9026165', '73003': '9026166', '73004': '9026167', '73005': '9026168', '73006': '9026169', '73007': '9026170', '73008': '9026171', '73009': '9026172', '73010': '9026173', '73011': '9026174', '73012': '9026175', '73013': '9026176', '73014': '9026177', '73015': '9026178', '73016': '9026179', '73017': '9026180', '73018': '9026181', '73019': '9026182', '73020': '9026183', '73021': '9026184', '73024': '9026185', '73025': '9026186', '73026': '9026187', '73027': '9026188', '73028': '9026189', '73029': '9026190', '73030': '9026191', '73033': '9026192', '73034': '9026193', '73036': '9026194', '73038': '9026195', '73040': '9026196', '73041': '9026197', '73042': '9026198', '73043': '9026199', '73044': '9026200', '73045': '9026201', '73047': '9026202', '73048': '9026203', '73049': '9026204', '73050': '9026205', '73051': '9026206', '73052': '9026207', '73053': '9026208', '73054': '9026209', '73055': '9026210', '73056': '9026211', '73057': '9026212', '73058': '9026213', '73059': '9026214', '73061': '9026215', '73062': '9026216', '73063': '9026217', '73064': '9026218', '73065': '9026219', '73067': '9026220', '73068': '9026221', '73069': '9026222', '73071': '9026223', '73072': '9026224', '73073': '9026225', '73074': '9026226', '73075': '9026227', '73077': '9026228', '73078': '9026229', '73079': '9026230', '73080': '9026231', '73082': '9026232', '73084': '9026233', '73086': '9026234', '73089': '9026235', '73090': '9026236', '73092': '9026237', '73093': '9026238', '73095': '9026239', '73096': '9026240', '73098': '9026242', '73099': '9026243', '73102': '9026244', '73103': '9026245', '73104': '9026246', '73105': '9026247', '73106': '9026248', '73107': '9026249', '73108': '9026250', '73109': '9026251', '73110': '9026252', '73111': '9026253', '73112': '9026254', '73114': '9026255', '73115': '9026256', '73116': '9026257', '73117': '9026258', '73118': '9026259', '73119': '9026260', '73120': '9026261', '73121': '9026262', '73122': '9026263', '73125': '9026265', '73127': '9026266', '73128': '9026267', '73129': '9026268', '73130': '9026269', '73131': '9026270', '73132': '9026271', '73134': '9026272', '73135': '9026273', '73139': '9026274', '73141': '9026275', '73142': '9026276', '73145': '9026277', '73149': '9026278', '73150': '9026279', '73151': '9026280', '73159': '9026281', '73160': '9026282', '73162': '9026283', '73165': '9026284', '73169': '9026285', '73170': '9026286', '73173': '9026287', '73179': '9026288', '73401': '9026289', '73430': '9026291', '73432': '9026292', '73433': '9026293', '73434': '9026294', '73437': '9026296', '73438': '9026297', '73439': '9026298', '73440': '9026299', '73441': '9026300', '73442': '9026301', '73443': '9026302', '73444': '9026303', '73446': '9026304', '73447': '9026305', '73448': '9026306', '73449': '9026307', '73450': '9026308', '73453': '9026309', '73456': '9026310', '73458': '9026311', '73459': '9026312', '73460': '9026313', '73461': '9026314', '73463': '9026315', '73481': '9026316', '73487': '9026317', '73488': '9026318', '73491': '9026319', '73501': '9026320', '73503': '9026321', '73505': '9026322', '73507': '9026323', '73521': '9026325', '73523': '9026326', '73526': '9026327', '73527': '9026328', '73528': '9026329', '73529': '9026330', '73530': '9026331', '73531': '9026332', '73532': '9026333', '73533': '9026334', '73537': '9026335', '73538': '9026336', '73539': '9026337', '73540': '9026338', '73541': '9026339', '73542': '9026340', '73543': '9026341', '73544': '9026342', '73546': '9026343', '73547': '9026344', '73548': '9026345', '73549': '9026346', '73550': '9026347', '73551': '9026348', '73552': '9026349', '73553': '9026350', '73554': '9026351', '73555': '9026352', '73556': '9026353', '73559': '9026354', '73560': '9026355', '73561': '9026356', '73562': '9026357', '73564': '9026358', '73565': '9026359', '73566': '9026360', '73567': '9026361', '73568': '9026362', '73569': '9026363', '73570': '9026364', '73571': '9026365', '73572': '9026366', '73573': '9026367', '73601': '9026368', '73620': '9026369', '73622': '9026370', '73625': '9026372', '73626': '9026373', '73627': '9026374', '73628': '9026375', '73632': '9026376', '73638': '9026377', '73639': '9026378', '73641': '9026379', '73642': '9026380', '73644': '9026381', '73645': '9026382', '73646': '9026383', '73647': '9026384', '73650': '9026385', '73651': '9026386', '73654': '9026387', '73655': '9026388', '73658': '9026389', '73659': '9026390', '73660': '9026391', '73661': '9026392', '73662': '9026393', '73663': '9026394', '73664': '9026395', '73666': '9026396', '73667': '9026397', '73668': '9026398', '73669': '9026399', '73673': '9026400', '73701': '9026401', '73703': '9026402', '73705': '9026403', '73716': '9026404', '73717': '9026405', '73718': '9026406', '73719': '9026407', '73720': '9026408', '73722': '9026409', '73724': '9026410', '73726': '9026411', '73727': '9026412', '73728': '9026413', '73729': '9026414', '73730': '9026415', '73731': '9026416', '73733': '9026417', '73734': '9026418', '73735': '9026419', '73736': '9026420', '73737': '9026421', '73738': '9026422', '73739': '9026423', '73741': '9026424', '73742': '9026425', '73744': '9026427', '73747': '9026428', '73749': '9026429', '73750': '9026430', '73753': '9026431', '73754': '9026432', '73755': '9026433', '73756': '9026434', '73757': '9026435', '73758': '9026436', '73759': '9026437', '73760': '9026438', '73761': '9026439', '73762': '9026440', '73763': '9026441', '73764': '9026442', '73766': '9026443', '73768': '9026444', '73771': '9026445', '73772': '9026446', '73773': '9026447', '73801': '9026448', '73832': '9026449', '73834': '9026450', '73835': '9026451', '73838': '9026452', '73840': '9026453', '73841': '9026454', '73842': '9026455', '73843': '9026456', '73844': '9026457', '73848': '9026459', '73851': '9026460', '73852': '9026461', '73853': '9026462', '73855': '9026463', '73857': '9026464', '73858': '9026465', '73859': '9026466', '73860': '9026467', '73901': '9026468', '73931': '9026469', '73932': '9026470', '73933': '9026471', '73937': '9026472', '73938': '9026473', '73939': '9026474', '73942': '9026475', '73944': '9026476', '73945': '9026477', '73946': '9026478', '73947': '9026479', '73949': '9026480', '73950': '9026481', '73951': '9026482', '74002': '9026483', '74003': '9026484', '74006': '9026485', '74008': '9026486', '74010': '9026487', '74011': '9026488', '74012': '9026489', '74014': '9026490', '74015': '9026491', '74016': '9026492', '74017': '9026493', '74019': '9026494', '74020': '9026495', '74021': '9026496', '74022': '9026497', '74023': '9026498', '74026': '9026499', '74027': '9026500', '74028': '9026501', '74029': '9026502', '74030': '9026503', '74032': '9026504', '74033': '9026505', '74035': '9026506', '74036': '9026507', '74037': '9026508', '74038': '9026509', '74039': '9026510', '74041': '9026511', '74042': '9026512', '74044': '9026513', '74045': '9026514', '74047': '9026515', '74048': '9026516', '74051': '9026517', '74052': '9026518', '74053': '9026519', '74054': '9026520', '74055': '9026521', '74056': '9026522', '74058': '9026523', '74059': '9026524', '74061': '9026525', '74062': '9026526', '74063': '9026527', '74066': '9026528', '74070': '9026529', '74072': '9026530', '74073': '9026531', '74074': '9026532', '74075': '9026533', '74078': '9026534', '74079': '9026535', '74080': '9026536', '74083': '9026537', '74084': '9026538', '74085': '9026539', '74103': '9026540', '74104': '9026541', '74105': '9026542', '74106': '9026543', '74107': '9026544', '74108': '9026545', '74110': '9026546', '74112': '9026547', '74114': '9026548', '74115': '9026549', '74116': '9026550', '74117': '9026551', '74119': '9026552', '74120': '9026553', '74126': '9026554', '74127': '9026555', '74128': '9026556', '74129': '9026557', '74130': '9026558', '74131': '9026559', '74132': '9026560', '74133': '9026561', '74134': '9026562', '74135': '9026563', '74136': '9026564', '74137': '9026565', '74141': '9026566', '74145': '9026567', '74146': '9026568', '74192': '9026569', '74301': '9026570', '74330': '9026571', '74331': '9026572', '74332': '9026573', '74333': '9026574', '74337': '9026575', '74338': '9026576', '74339': '9026577', '74342': '9026578', '74343': '9026579', '74344': '9026580', '74346': '9026581', '74347': '9026582', '74352': '9026584', '74354': '9026585', '74360': '9026587', '74361': '9026588', '74363': '9026589', '74364': '9026590', '74365': '9026591', '74366': '9026592', '74367': '9026593', '74369': '9026594', '74370': '9026595', '74401': '9026596', '74403': '9026597', '74421': '9026598', '74422': '9026599', '74423': '9026600', '74425': '9026601', '74426': '9026602', '74427': '9026603', '74428': '9026604', '74429': '9026605', '74431': '9026607', '74432': '9026608', '74434': '9026609', '74435': '9026610', '74436': '9026611', '74437': '9026612', '74441': '9026614', '74442': '9026615', '74445': '9026616', '74447': '9026617', '74450': '9026618', '74451': '9026619', '74452': '9026620', '74454': '9026621', '74455': '9026622', '74461': '9026623', '74462': '9026624', '74464': '9026625', '74467': '9026626', '74469': '9026627', '74470': '9026628', '74471': '9026629', '74472': '9026630', '74501': '9026631', '74523': '9026633', '74525': '9026634', '74528': '9026635', '74530': '9026636', '74531': '9026637', '74533': '9026638', '74534': '9026639', '74535': '9026640', '74536': '9026641', '74538': '9026642', '74540': '9026643', '74543': '9026644', '74547': '9026646', '74549': '9026647', '74552': '9026648', '74553': '9026649', '74555': '9026650', '74557': '9026651', '74558': '9026652', '74560': '9026653', '74561': '9026654', '74562': '9026655', '74563': '9026656', '74567': '9026657', '74569': '9026658', '74570': '9026659', '74571': '9026660', '74572': '9026661', '74574': '9026662', '74576': '9026663', '74577': '9026664', '74578': '9026665', '74601': '9026666', '74604': '9026667', '74630': '9026668', '74631': '9026669', '74632': '9026670', '74633': '9026671', '74636': '9026672', '74637': '9026673', '74640': '9026674', '74641': '9026675', '74643': '9026676', '74644': '9026677', '74646': '9026678', '74647': '9026679', '74650': '9026680', '74651': '9026681', '74652': '9026682', '74653': '9026683', '74701': '9026684', '74722': '9026685', '74723': '9026686', '74724': '9026687', '74726': '9026688', '74727': '9026689', '74728': '9026690', '74729': '9026691', '74730': '9026692', '74731': '9026693', '74733': '9026694', '74734': '9026695', '74735': '9026696', '74736': '9026697', '74738': '9026699', '74740': '9026700', '74741': '9026701', '74743': '9026702', '74745': '9026703', '74748': '9026704', '74754': '9026705', '74755': '9026706', '74756': '9026707', '74759': '9026708', '74760': '9026709', '74761': '9026710', '74764': '9026711', '74766': '9026712', '74801': '9026713', '74804': '9026715', '74820': '9026716', '74824': '9026718', '74825': '9026719', '74826': '9026720', '74827': '9026721', '74829': '9026722', '74831': '9026723', '74832': '9026724', '74833': '9026725', '74834': '9026726', '74837': '9026727', '74839': '9026728', '74840': '9026729', '74843': '9026731', '74845': '9026733', '74848': '9026734', '74849': '9026735', '74850': '9026736', '74851': '9026737', '74852': '9026738', '74854': '9026739', '74855': '9026740', '74856': '9026741', '74857': '9026742', '74859': '9026743', '74860': '9026744', '74864': '9026745', '74865': '9026746', '74866': '9026747', '74867': '9026748', '74868': '9026749', '74869': '9026750', '74871': '9026751', '74872': '9026752', '74873': '9026753', '74875': '9026754', '74878': '9026755', '74880': '9026756', '74881': '9026757', '74883': '9026758', '74884': '9026759', '74901': '9026760', '74902': '9026761', '74930': '9026762', '74931': '9026763', '74932': '9026764', '74936': '9026766', '74937': '9026767', '74939': '9026768', '74940': '9026769', '74941': '9026770', '74944': '9026773', '74945': '9026774', '74948': '9026776', '74949': '9026777', '74951': '9026778', '74953': '9026779', '74954': '9026780', '74955': '9026781', '74956': '9026782', '74957': '9026783', '74959': '9026784', '74960': '9026785', '74962': '9026786', '74963': '9026787', '74964': '9026788', '74965': '9026789', '74966': '9026790', '75001': '9026791', '75002': '9026792', '75006': '9026793', '75007': '9026794', '75009': '9026795', '75010': '9026796', '75013': '9026797', '75019': '9026798', '75020': '9026799', '75021': '9026800', '75022': '9026801', '75023': '9026802', '75024': '9026803', '75025': '9026804', '75028': '9026805', '75032': '9026806', '75034': '9026807', '75035': '9026808', '75038': '9026809', '75039': '9026810', '75040': '9026811', '75041': '9026812', '75042': '9026813', '75043': '9026814', '75044': '9026815', '75048': '9026816', '75050': '9026817', '75051': '9026818', '75052': '9026819', '75054': '9026820', '75056': '9026821', '75057': '9026822', '75058': '9026823', '75060': '9026824', '75061': '9026825', '75062': '9026826', '75063': '9026827', '75065': '9026828', '75067': '9026829', '75068': '9026830', '75069': '9026831', '75070': '9026832', '75071': '9026833', '75074': '9026834', '75075': '9026835', '75076': '9026836', '75077': '9026837', '75078': '9026838', '75080': '9026839', '75081': '9026840', '75082': '9026841', '75087': '9026842', '75088': '9026843', '75089': '9026844', '75090': '9026845', '75092': '9026846', '75093': '9026847', '75094': '9026848', '75098': '9026850', '75099': '9026851', '75102': '9026853', '75103': '9026854', '75104': '9026855', '75105': '9026856', '75109': '9026858', '75110': '9026859', '75114': '9026860', '75115': '9026861', '75116': '9026862', '75117': '9026863', '75119': '9026864', '75124': '9026865', '75125': '9026866', '75126': '9026867', '75127': '9026868', '75134': '9026869', '75135': '9026870', '75137': '9026871', '75140': '9026872', '75141': '9026873', '75142': '9026874', '75143': '9026875', '75144': '9026876', '75146': '9026877', '75147': '9026878', '75148': '9026879', '75149': '9026880', '75150': '9026881', '75152': '9026882', '75153': '9026883', '75154': '9026884', '75155': '9026885', '75156': '9026886', '75157': '9026887', '75158': '9026888', '75159': '9026889', '75160': '9026890', '75161': '9026891', '75163': '9026892', '75165': '9026893', '75166': '9026894', '75167': '9026895', '75169': '9026896', '75172': '9026897', '75173': '9026898', '75180': '9026899', '75181': '9026900', '75182': '9026901', '75189': '9026902', '75201': '9026903', '75202': '9026904', '75203': '9026905', '75204': '9026906', '75205': '9026907', '75206': '9026908', '75207': '9026909', '75208': '9026910', '75209': '9026911', '75210': '9026912', '75211': '9026913', '75212': '9026914', '75214': '9026915', '75215': '9026916', '75216': '9026917', '75217': '9026918', '75218': '9026919', '75219': '9026920', '75220': '9026921', '75223': '9026922', '75224': '9026923', '75225': '9026924', '75226': '9026925', '75227': '9026926', '75228': '9026927', '75229': '9026928', '75230': '9026929', '75231': '9026930', '75232': '9026931', '75233': '9026932', '75234': '9026933', '75235': '9026934', '75236': '9026935', '75237': '9026936', '75238': '9026937', '75240': '9026938', '75241': '9026939', '75242': '9026940', '75243': '9026941', '75244': '9026942', '75246': '9026943', '75247': '9026944', '75248': '9026945', '75249': '9026946', '75251': '9026947', '75252': '9026948', '75253': '9026949', '75254': '9026950', '75270': '9026952', '75287': '9026954', '75390': '9026955', '75401': '9026956', '75402': '9026957', '75407': '9026958', '75409': '9026959', '75410': '9026960', '75411': '9026961', '75412': '9026962', '75414': '9026964', '75415': '9026965', '75416': '9026966', '75417': '9026967', '75418': '9026968', '75420': '9026969', '75421': '9026970', '75422': '9026971', '75423': '9026972', '75424': '9026973', '75426': '9026974', '75428': '9026975', '75431': '9026977', '75432': '9026978', '75433': '9026979', '75435': '9026980', '75436': '9026981', '75437': '9026982', '75438': '9026983', '75439': '9026984', '75440': '9026985', '75441': '9026986', '75442': '9026987', '75446': '9026988', '75447': '9026989', '75448': '9026990', '75449': '9026991', '75450': '9026992', '75451': '9026993', '75452': '9026994', '75453': '9026995', '75454': '9026996', '75455': '9026997', '75457': '9026998', '75459': '9026999', '75460': '9027000', '75462': '9027001', '75468': '9027002', '75469': '9027003', '75470': '9027004', '75471': '9027005', '75472': '9027006', '75473': '9027007', '75474': '9027008', '75476': '9027009', '75477': '9027010', '75478': '9027011', '75479': '9027012', '75480': '9027013', '75481': '9027014', '75482': '9027015', '75486': '9027016', '75487': '9027017', '75488': '9027018', '75489': '9027019', '75490': '9027020', '75491': '9027021', '75492': '9027022', '75493': '9027023', '75494': '9027024', '75495': '9027025', '75496': '9027026', '75497': '9027027', '75501': '9027028', '75503': '9027029', '75550': '9027030', '75551': '9027031', '75554': '9027032', '75555': '9027033', '75556': '9027034', '75558': '9027035', '75559': '9027036', '75560': '9027037', '75561': '9027038', '75562': '9027039', '75563': '9027040', '75565': '9027042', '75566': '9027043', '75567': '9027044', '75568': '9027045', '75569': '9027046', '75570': '9027047', '75571': '9027048', '75572': '9027049', '75574': '9027050', '75601': '9027051', '75602': '9027052', '75603': '9027053', '75604': '9027054', '75605': '9027055', '75630': '9027056', '75631': '9027057', '75633': '9027058', '75638': '9027059', '75639': '9027060', '75640': '9027061', '75643': '9027062', '75644': '9027063', '75645': '9027064', '75647': '9027065', '75650': '9027066', '75651': '9027067', '75652': '9027068', '75654': '9027069', '75656': '9027070', '75657': '9027071', '75661': '9027072', '75662': '9027073', '75667': '9027074', '75668': '9027075', '75669': '9027076', '75670': '9027077', '75672': '9027078', '75681': '9027079', '75683': '9027080', '75684': '9027081', '75686': '9027082', '75691': '9027083', '75692': '9027084', '75693': '9027085', '75701': '9027086', '75702': '9027087', '75703': '9027088', '75704': '9027089', '75705': '9027090', '75706': '9027091', '75707': '9027092', '75708': '9027093', '75750': '9027094', '75751': '9027095', '75752': '9027096', '75754': '9027097', '75755': '9027098', '75756': '9027099', '75757': '9027100', '75760': '9027101', '75762': '9027102', '75763': '9027103', '75765': '9027104', '75766': '9027105', '75770': '9027106', '75771': '9027107', '75773': '9027109', '75778': '9027110', '75779': '9027111', '75783': '9027113', '75784': '9027114', '75785': '9027115', '75789': '9027116', '75790': '9027117', '75791': '9027118', '75792': '9027119', '75801': '9027120', '75803': '9027121', '75831': '9027122', '75833': '9027123', '75835': '9027124', '75838': '9027125', '75839': '9027126', '75840': '9027127', '75844': '9027128', '75845': '9027129', '75846': '9027130', '75847': '9027131', '75850': '9027134', '75851': '9027135', '75852': '9027136', '75853': '9027137', '75855': '9027138', '75856': '9027139', '75858': '9027140', '75859': '9027141', '75860': '9027142', '75861': '9027143', '75862': '9027144', '75901': '9027145', '75904': '9027146', '75925': '9027147', '75926': '9027148', '75928': '9027149', '75929': '9027150', '75930': '9027151', '75931': '9027152', '75932': '9027153', '75933': '9027154', '75935': '9027156', '75936': '9027157', '75937': '9027158', '75938': '9027159', '75939': '9027160', '75941': '9027161', '75943': '9027163', '75944': '9027164', '75946': '9027165', '75948': '9027166', '75949': '9027167', '75951': '9027168', '75954': '9027169', '75956': '9027170', '75959': '9027171', '75960': '9027172', '75961': '9027173', '75964': '9027175', '75965': '9027176', '75966': '9027177', '75968': '9027178', '75969': '9027179', '75972': '9027180', '75973': '9027181', '75974': '9027182', '75975': '9027183', '75976': '9027184', '75977': '9027185', '75979': '9027186', '75980': '9027187', '76001': '9027188', '76002': '9027189', '76006': '9027191', '76008': '9027192', '76009': '9027193', '76010': '9027194', '76011': '9027195', '76012': '9027196', '76013': '9027197', '76014': '9027198', '76015': '9027199', '76016': '9027200', '76017': '9027201', '76018': '9027202', '76020': '9027204', '76021': '9027205', '76022': '9027206', '76023': '9027207', '76028': '9027208', '76031': '9027209', '76033': '9027210', '76034': '9027211', '76035': '9027212', '76036': '9027213', '76039': '9027214', '76040': '9027215', '76041': '9027216', '76043': '9027217', '76044': '9027218', '76048': '9027219', '76049': '9027220', '76050': '9027221', '76051': '9027222', '76052': '9027223', '76053': '9027224', '76054': '9027225', '76055': '9027226', '76058': '9027227', '76059': '9027228', '76060': '9027229', '76063': '9027230', '76064': '9027231', '76065': '9027232', '76066': '9027233', '76067': '9027234', '76070': '9027235', '76071': '9027236', '76073': '9027237', '76077': '9027238', '76078': '9027239', '76082': '9027240', '76084': '9027241', '76085': '9027242', '76086': '9027243', '76087': '9027244', '76088': '9027245', '76092': '9027246', '76093': '9027247', '76102': '9027248', '76103': '9027249', '76104': '9027250', '76105': '9027251', '76106': '9027252', '76107': '9027253', '76108': '9027254', '76109': '9027255', '76110': '9027256', '76111': '9027257', '76112': '9027258', '76114': '9027259', '76115': '9027260', '76116': '9027261', '76117': '9027262', '76118': '9027263', '76119': '9027264', '76120': '9027265', '76123': '9027266', '76126': '9027268', '76127': '9027269', '76129': '9027270', '76131': '9027271', '76132': '9027272', '76133': '9027273', '76134': '9027274', '76135': '9027275', '76137': '9027276', '76140': '9027277', '76148': '9027278', '76155': '9027279', '76164': '9027281', '76177': '9027282', '76179': '9027283', '76180': '9027284', '76182': '9027285', '76201': '9027286', '76205': '9027289', '76207': '9027290', '76208': '9027291', '76209': '9027292', '76210': '9027293', '76225': '9027294', '76226': '9027295', '76227': '9027296', '76228': '9027297', '76230': '9027298', '76233': '9027299', '76234': '9027300', '76238': '9027301', '76239': '9027302', '76240': '9027303', '76244': '9027304', '76245': '9027305', '76247': '9027306', '76248': '9027307', '76249': '9027308', '76250': '9027309', '76251': '9027310', '76252': '9027311', '76255': '9027313', '76258': '9027314', '76259': '9027315', '76261': '9027316', '76262': '9027317', '76264': '9027318', '76265': '9027319', '76266': '9027320', '76270': '9027322', '76271': '9027323', '76272': '9027324', '76273': '9027325', '76301': '9027326', '76302': '9027327', '76305': '9027328', '76306': '9027329', '76308': '9027330', '76309': '9027331', '76310': '9027332', '76311': '9027333', '76351': '9027334', '76354': '9027335', '76357': '9027336', '76360': '9027337', '76363': '9027338', '76364': '9027339', '76365': '9027340', '76366': '9027341', '76367': '9027342', '76370': '9027343', '76371': '9027344', '76372': '9027345', '76373': '9027346', '76374': '9027347', '76377': '9027348', '76379': '9027349', '76380': '9027350', '76384': '9027351', '76388': '9027352', '76389': '9027353', '76401': '9027354', '76424': '9027355', '76426': '9027356', '76427': '9027357', '76429': '9027358', '76430': '9027359', '76431': '9027360', '76432': '9027361', '76433': '9027362', '76435': '9027363', '76436': '9027364', '76437': '9027365', '76442': '9027366', '76443': '9027367', '76444': '9027368', '76445': '9027369', '76446': '9027370', '76448': '9027371', '76449': '9027372', '76450': '9027373', '76452': '9027374', '76453': '9027375', '76454': '9027376', '76455': '9027377', '76457': '9027378', '76458': '9027379', '76459': '9027380', '76460': '9027381', '76462': '9027382', '76463': '9027383', '76464': '9027384', '76469': '9027385', '76470': '9027386', '76471': '9027387', '76472': '9027388', '76474': '9027389', '76475': '9027390', '76476': '9027391', '76481': '9027392', '76483': '9027393', '76484': '9027394', '76486': '9027395', '76487': '9027396', '76490': '9027397', '76491': '9027398', '76501': '9027399', '76502': '9027400', '76504': '9027401', '76508': '9027402', '76511': '9027403', '76513': '9027404', '76518': '9027405', '76519': '9027406', '76520': '9027407', '76522': '9027408', '76524': '9027409', '76525': '9027410', '76527': '9027411', '76528': '9027412', '76530': '9027413', '76531': '9027414', '76534': '9027415', '76537': '9027416', '76538': '9027417', '76539': '9027418', '76541': '9027419', '76542': '9027420', '76543': '9027421', '76544': '9027422', '76548': '9027423', '76549': '9027424', '76550': '9027425', '76554': '9027426', '76556': '9027427', '76557': '9027428', '76559': '9027429', '76561': '9027430', '76565': '9027431', '76566': '9027432', '76567': '9027433', '76569': '9027434', '76570': '9027435', '76571': '9027436', '76574': '9027437', '76577': '9027438', '76578': '9027439', '76579': '9027440', '76596': '9027441', '76598': '9027442', '76621': '9027443', '76622': '9027444', '76624': '9027445', '76626': '9027446', '76627': '9027447', '76628': '9027448', '76629': '9027449', '76630': '9027450', '76631': '9027451', '76632': '9027452', '76633': '9027453', '76634': '9027454', '76635': '9027455', '76636': '9027456', '76637': '9027457', '76638': '9027458', '76639': '9027459', '76640': '9027460', '76641': '9027461', '76642': '9027462', '76643': '9027463', '76645': '9027464', '76648': '9027465', '76649': '9027466', '76651': '9027468', '76652': '9027469', '76653': '9027470', '76655': '9027471', '76656': '9027472', '76657': '9027473', '76660': '9027474', '76661': '9027475', '76664': '9027476', '76665': '9027477', '76666': '9027478', '76667': '9027479', '76670': '9027480', '76671': '9027481', '76673': '9027482', '76676': '9027483', '76678': '9027484', '76679': '9027485', '76680': '9027486', '76681': '9027487', '76682': '9027488', '76685': '9027489', '76687': '9027491', '76689': '9027492', '76690': '9027493', '76691': '9027494', '76692': '9027495', '76693': '9027496', '76701': '9027497', '76704': '9027498', '76705': '9027499', '76706': '9027500', '76707': '9027501', '76708': '9027502', '76710': '9027503', '76711': '9027504', '76712': '9027505', '76798': '9027506', '76801': '9027507', '76802': '9027508', '76820': '9027509', '76821': '9027510', '76823': '9027511', '76824': '9027512', '76825': '9027513', '76827': '9027514', '76828': '9027515', '76832': '9027516', '76834': '9027517', '76836': '9027518', '76837': '9027519', '76841': '9027520', '76842': '9027521', '76844': '9027522', '76845': '9027523', '76848': '9027524', '76849': '9027525', '76852': '9027526', '76853': '9027527', '76854': '9027528', '76856': '9027529', '76857': '9027530', '76858': '9027531', '76859': '9027532', '76861': '9027533', '76862': '9027534', '76864': '9027535', '76865': '9027536', '76866': '9027537', '76869': '9027538', '76870': '9027539', '76871': '9027540', '76872': '9027541', '76873': '9027542', '76874': '9027543', '76875': '9027544', '76877': '9027545', '76878': '9027546', '76882': '9027547', '76884': '9027548', '76885': '9027549', '76887': '9027550', '76888': '9027551', '76890': '9027552', '76901': '9027553', '76903': '9027555', '76904': '9027556', '76905': '9027557', '76909': '9027558', '76930': '9027559', '76932': '9027560', '76933': '9027561', '76934': '9027562', '76935': '9027563', '76936': '9027564', '76937': '9027565', '76940': '9027566', '76941': '9027567', '76943': '9027568', '76945': '9027569', '76949': '9027570', '76950': '9027571', '76951': '9027572', '76953': '9027573', '76955': '9027574', '76957': '9027575', '76958': '9027576', '77002': '9027577', '77003': '9027578', '77004': '9027579', '77005': '9027580', '77006': '9027581', '77007': '9027582', '77008': '9027583', '77009': '9027584', '77010': '9027585', '77011': '9027586', '77012': '9027587', '77013': '9027588', '77014': '9027589', '77015': '9027590', '77016': '9027591', '77017': '9027592', '77018': '9027593', '77019': '9027594', '77020': '9027595', '77021': '9027596', '77022': '9027597', '77023': '9027598', '77024': '9027599', '77025': '9027600', '77026': '9027601', '77027': '9027602', '77028': '9027603', '77029': '9027604', '77030': '9027605', '77031': '9027606', '77032': '9027607', '77033': '9027608', '77034': '9027609', '77035': '9027610', '77036': '9027611', '77037': '9027612', '77038': '9027613', '77039': '9027614', '77040': '9027615', '77041': '9027616', '77042': '9027617', '77043': '9027618', '77044': '9027619', '77045': '9027620', '77047': '9027622', '77048': '9027623', '77049': '9027624', '77050': '9027625', '77051': '9027626', '77053': '9027627', '77054': '9027628', '77055': '9027629', '77056': '9027630', '77057': '9027631', '77058': '9027632', '77059': '9027633', '77060': '9027634', '77061': '9027635', '77062': '9027636', '77063': '9027637', '77064': '9027638', '77065': '9027639', '77066': '9027640', '77067': '9027641', '77068': '9027642', '77069': '9027643', '77070': '9027644', '77071': '9027645', '77072': '9027646', '77073': '9027647', '77074': '9027648', '77075': '9027649', '77076': '9027650', '77077': '9027651', '77078': '9027652', '77079': '9027653', '77080': '9027654', '77081': '9027655', '77082': '9027656', '77083': '9027657', '77084': '9027658', '77085': '9027659', '77086': '9027660', '77087': '9027661', '77088': '9027662', '77089': '9027663', '77090': '9027664', '77091': '9027665', '77092': '9027666', '77093': '9027667', '77094': '9027668', '77095': '9027669', '77096': '9027670', '77098': '9027671', '77099': '9027672', '77201': '9027673', '77204': '9027674', '77301': '9027676', '77302': '9027677', '77303': '9027678', '77304': '9027679', '77306': '9027680', '77316': '9027681', '77318': '9027682', '77320': '9027683', '77327': '9027684', '77328': '9027685', '77331': '9027686', '77335': '9027687', '77336': '9027688', '77338': '9027689', '77339': '9027690', '77340': '9027691', '77345': '9027692', '77346': '9027693', '77351': '9027695', '77354': '9027696', '77355': '9027697', '77356': '9027698', '77357': '9027699', '77358': '9027700', '77359': '9027701', '77360': '9027702', '77362': '9027703', '77363': '9027704', '77364': '9027705', '77365': '9027706', '77369': '9027709', '77371': '9027710', '77372': '9027711', '77373': '9027712', '77374': '9027713', '77375': '9027714', '77376': '9027715', '77377': '9027716', '77378': '9027717', '77379': '9027718', '77380': '9027719', '77381': '9027720', '77382': '9027721', '77384': '9027722', '77385': '9027723', '77386': '9027724', '77388': '9027725', '77389': '9027726', '77396': '9027727', '77399': '9027728', '77401': '9027729', '77406': '9027730', '77407': '9027731', '77414': '9027733', '77417': '9027735', '77418': '9027736', '77419': '9027737', '77420': '9027738', '77422': '9027739', '77423': '9027740', '77426': '9027741', '77428': '9027742', '77429': '9027743', '77430': '9027744', '77432': '9027745', '77433': '9027746', '77434': '9027747', '77435': '9027748', '77437': '9027749', '77441': '9027751', '77442': '9027752', '77444': '9027753', '77445': '9027754', '77447': '9027756', '77449': '9027758', '77450': '9027759', '77451': '9027760', '77454': '9027761', '77455': '9027762', '77456': '9027763', '77457': '9027764', '77458': '9027765', '77459': '9027766', '77461': '9027768', '77465': '9027770', '77466': '9027771', '77467': '9027772', '77468': '9027773', '77469': '9027774', '77470': '9027775', '77471': '9027776', '77474': '9027777', '77477': '9027780', '77478': '9027781', '77479': '9027782', '77480': '9027783', '77482': '9027784', '77483': '9027785', '77484': '9027786', '77485': '9027787', '77486': '9027788', '77488': '9027789', '77489': '9027790', '77493': '9027791', '77494': '9027792', '77498': '9027793', '77502': '9027794', '77503': '9027795', '77504': '9027796', '77505': '9027797', '77506': '9027798', '77507': '9027799', '77510': '9027800', '77511': '9027801', '77514': '9027802', '77515': '9027803', '77517': '9027804', '77518': '9027805', '77519': '9027806', '77520': '9027807', '77521': '9027808', '77523': '9027809', '77530': '9027810', '77531': '9027811', '77532': '9027812', '77533': '9027813', '77534': '9027814', '77535': '9027815', '77536': '9027816', '77538': '9027817', '77539': '9027818', '77541': '9027819', '77545': '9027820', '77546': '9027821', '77547': '9027822', '77550': '9027823', '77551': '9027824', '77554': '9027827', '77555': '9027828', '77560': '9027829', '77562': '9027830', '77563': '9027831', '77564': '9027832', '77565': '9027833', '77566': '9027834', '77568': '9027835', '77571': '9027836', '77573': '9027837', '77575': '9027838', '77577': '9027839', '77578': '9027840', '77581': '9027842', '77583': '9027844', '77584': '9027845', '77585': '9027846', '77586': '9027847', '77587': '9027848', '77590': '9027849', '77591': '9027850', '77597': '9027851', '77598': '9027852', '77611': '9027853', '77612': '9027854', '77613': '9027855', '77614': '9027856', '77615': '9027857', '77616': '9027858', '77617': '9027859', '77619': '9027860', '77622': '9027861', '77623': '9027862', '77624': '9027863', '77625': '9027864', '77627': '9027865', '77629': '9027866', '77630': '9027867', '77632': '9027868', '77640': '9027869', '77642': '9027870', '77650': '9027871', '77651': '9027872', '77655': '9027873', '77656': '9027874', '77657': '9027875', '77659': '9027876', '77660': '9027877', '77662': '9027878', '77664': '9027880', '77665': '9027881', '77701': '9027882', '77702': '9027883', '77703': '9027884', '77705': '9027885', '77706': '9027886', '77707': '9027887', '77708': '9027888', '77713': '9027889', '77801': '9027890', '77802': '9027891', '77803': '9027892', '77807': '9027894', '77808': '9027895', '77830': '9027896', '77831': '9027897', '77833': '9027898', '77835': '9027899', '77836': '9027900', '77837': '9027901', '77840': '9027902', '77844': '9027905', '77845': '9027906', '77853': '9027907', '77856': '9027908', '77857': '9027909', '77859': '9027910', '77861': '9027911', '77864': '9027912', '77865': '9027913', '77866': '9027914', '77867': '9027915', '77868': '9027916', '77871': '9027917', '77872': '9027918', '77873': '9027919', '77879': '9027921', '77880': '9027922', '77901': '9027924', '77904': '9027925', '77905': '9027926', '77950': '9027927', '77951': '9027928', '77954': '9027929', '77957': '9027930', '77962': '9027932', '77963': '9027933', '77964': '9027934', '77968': '9027935', '77969': '9027936', '77970': '9027937', '77971': '9027938', '77973': '9027939', '77974': '9027940', '77975': '9027941', '77977': '9027942', '77978': '9027943', '77979': '9027944', '77982': '9027945', '77983': '9027946', '77984': '9027947', '77990': '9027949', '77991': '9027950', '77994': '9027951', '77995': '9027952', '78001': '9027953', '78002': '9027954', '78003': '9027955', '78004': '9027956', '78005': '9027957', '78006': '9027958', '78007': '9027959', '78008': '9027960', '78009': '9027961', '78010': '9027962', '78011': '9027963', '78012': '9027964', '78013': '9027965', '78014': '9027966', '78015': '9027967', '78016': '9027968', '78017': '9027969', '78019': '9027970', '78021': '9027971', '78022': '9027972', '78023': '9027973', '78024': '9027974', '78025': '9027975', '78026': '9027976', '78027': '9027977', '78028': '9027978', '78039': '9027979', '78040': '9027980', '78041': '9027981', '78043': '9027982', '78045': '9027983', '78046': '9027984', '78052': '9027985', '78055': '9027986', '78056': '9027987', '78057': '9027988', '78058': '9027989', '78059': '9027990', '78061': '9027991', '78063': '9027992', '78064': '9027993', '78065': '9027994', '78066': '9027995', '78067': '9027996', '78069': '9027997', '78070': '9027998', '78071': '9027999', '78072': '9028000', '78073': '9028001', '78075': '9028003', '78076': '9028004', '78101': '9028005', '78102': '9028006', '78108': '9028008', '78109': '9028009', '78112': '9028010', '78113': '9028011', '78114': '9028012', '78116': '9028013', '78117': '9028014', '78118': '9028015', '78119': '9028016', '78121': '9028017', '78122': '9028018', '78123': '9028019', '78124': '9028020', '78125': '9028021', '78130': '9028022', '78132': '9028023', '78133': '9028024', '78140': '9028025', '78141': '9028026', '78142': '9028027', '78146': '9028030', '78148': '9028031', '78150': '9194971', '78151': '9028033', '78152': '9028034', '78154': '9028035', '78155': '9028036', '78159': '9028037', '78160': '9028038', '78161': '9028039', '78163': '9028040', '78164': '9028041', '78201': '9028042', '78202': '9028043', '78203': '9028044', '78204': '9028045', '78205': '9028046', '78206': '9028047', '78207': '9028048', '78208': '9028049', '78209': '9028050', '78210': '9028051', '78211': '9028052', '78212': '9028053', '78213': '9028054', '78214': '9028055', '78215': '9028056', '78216': '9028057', '78217': '9028058', '78218': '9028059', '78219': '9028060', '78220': '9028061', '78221': '9028062', '78222': '9028063', '78223': '9028064', '78224': '9028065', '78225': '9028066', '78226': '9028067', '78227': '9028068', '78228': '9028069', '78229': '9028070', '78230': '9028071', '78231': '9028072', '78232': '9028073', '78233': '9028074', '78234': '9028075', '78235': '9028076', '78236': '9028077', '78237': '9028078', '78238': '9028079', '78239': '9028080', '78240': '9028081', '78242': '9028082', '78243': '9028083', '78244': '9028084', '78245': '9028085', '78247': '9028086', '78248': '9028087', '78249': '9028088', '78250': '9028089', '78251': '9028090', '78252': '9028091', '78253': '9028092', '78254': '9028093', '78255': '9028094', '78256': '9028095', '78257': '9028096', '78258': '9028097', '78259': '9028098', '78260': '9028099', '78261': '9028100', '78263': '9028101', '78264': '9028102', '78266': '9028103', '78284': '9028104', '78288': '9028105', '78330': '9028106', '78332': '9028107', '78336': '9028108', '78339': '9028109', '78340': '9028110', '78341': '9028111', '78343': '9028112', '78344': '9028113', '78349': '9028115', '78351': '9028116', '78353': '9028117', '78355': '9028118', '78357': '9028119', '78359': '9028121', '78361': '9028122', '78362': '9028123', '78363': '9028124', '78368': '9028126', '78369': '9028127', '78370': '9028128', '78371': '9028129', '78372': '9028130', '78373': '9028131', '78374': '9028132', '78375': '9028133', '78376': '9028134', '78377': '9028135', '78379': '9028136', '78380': '9028137', '78382': '9028138', '78383': '9028139', '78384': '9028140', '78385': '9028141', '78387': '9028142', '78389': '9028143', '78390': '9028144', '78391': '9028145', '78393': '9028146', '78401': '9028147', '78402': '9028148', '78404': '9028149', '78405': '9028150', '78406': '9028151', '78407': '9028152', '78408': '9028153', '78409': '9028154', '78410': '9028155', '78411': '9028156', '78412': '9028157', '78413': '9028158', '78414': '9028159', '78415': '9028160', '78416': '9028161', '78417': '9028162', '78418': '9028163', '78501': '9028165', '78503': '9028166', '78504': '9028167', '78516': '9028168', '78520': '9028169', '78521': '9028170', '78526': '9028171', '78537': '9028172', '78538': '9028173', '78539': '9028174', '78541': '9028175', '78542': '9028176', '78543': '9028177', '78548': '9028178', '78549': '9028179', '78550': '9028180', '78552': '9028181', '78557': '9028182', '78559': '9028184', '78560': '9028185', '78562': '9028187', '78563': '9028188', '78564': '9028189', '78565': '9028190', '78566': '9028191', '78569': '9028192', '78570': '9028193', '78572': '9028194', '78573': '9028195', '78574': '9028196', '78575': '9028197', '78576': '9028198', '78577': '9028199', '78578': '9028200', '78580': '9028201', '78582': '9028202', '78583': '9028203', '78584': '9028204', '78586': '9028205', '78588': '9028206', '78589': '9028207', '78591': '9028209', '78593': '9028211', '78595': '9028213', '78596': '9028214', '78597': '9028215', '78598': '9028216', '78602': '9028217', '78605': '9028218', '78606': '9028219', '78607': '9028220', '78608': '9028221', '78609': '9028222', '78610': '9028223', '78611': '9028224', '78612': '9028225', '78613': '9028226', '78614': '9028227', '78615': '9028228', '78616': '9028229', '78617': '9028230', '78618': '9028231', '78619': '9028232', '78620': '9028233', '78621': '9028234', '78623': '9028235', '78624': '9028236', '78626': '9028237', '78628': '9028239', '78629': '9028240', '78631': '9028241', '78632': '9028242', '78633': '9028243', '78634': '9028244', '78636': '9028245', '78638': '9028246', '78639': '9028247', '78640': '9028248', '78641': '9028249', '78642': '9028250', '78643': '9028251', '78644': '9028252', '78645': '9028253', '78648': '9028254', '78650': '9028255', '78652': '9028256', '78653': '9028257', '78654': '9028258', '78655': '9028259', '78656': '9028260', '78657': '9028261', '78659': '9028262', '78660': '9028263', '78662': '9028265', '78663': '9028266', '78664': '9028267', '78665': '9028268', '78666': '9028269', '78669': '9028270', '78671': '9028271', '78672': '9028272', '78675': '9028273', '78676': '9028274', '78681': '9028275', '78701': '9028276', '78702': '9028277', '78703': '9028278', '78704': '9028279', '78705': '9028280', '78710': '9028281', '78712': '9028283', '78717': '9028284', '78719': '9028285', '78721': '9028287', '78722': '9028288', '78723': '9028289', '78724': '9028290', '78725': '9028291', '78726': '9028292', '78727': '9028293', '78728': '9028294', '78729': '9028295', '78730': '9028296', '78731': '9028297', '78732': '9028298', '78733': '9028299', '78734': '9028300', '78735': '9028301', '78736': '9028302', '78737': '9028303', '78738': '9028304', '78739': '9028305', '78741': '9028306', '78742': '9028307', '78744': '9028308', '78745': '9028309', '78746': '9028310', '78747': '9028311', '78748': '9028312', '78749': '9028313', '78750': '9028314', '78751': '9028315', '78752': '9028316', '78753': '9028317', '78754': '9028318', '78756': '9028319', '78757': '9028320', '78758': '9028321', '78759': '9028322', '78801': '9028325', '78827': '9028326', '78828': '9028327', '78829': '9028328', '78830': '9028329', '78832': '9028330', '78833': '9028331', '78834': '9028332', '78836': '9028333', '78837': '9028334', '78838': '9028335', '78839': '9028336', '78840': '9028337', '78843': '9028338', '78850': '9028339', '78851': '9028340', '78852': '9028341', '78860': '9028342', '78861': '9028343', '78870': '9028344', '78871': '9028345', '78872': '9028346', '78873': '9028347', '78877': '9028348', '78879': '9028349', '78880': '9028350', '78881': '9028351', '78883': '9028352', '78884': '9028353', '78885': '9028354', '78886': '9028355', '78931': '9028356', '78932': '9028357', '78933': '9028358', '78934': '9028359', '78935': '9028360', '78938': '9028361', '78940': '9028362', '78941': '9028363', '78942': '9028364', '78943': '9028365', '78944': '9028366', '78945': '9028367', '78946': '9028368', '78947': '9028369', '78948': '9028370', '78949': '9028371', '78950': '9028372', '78953': '9028373', '78954': '9028374', '78956': '9028375', '78957': '9028376', '78959': '9028377', '78962': '9028379', '78963': '9028380', '79001': '9028381', '79003': '9028382', '79005': '9028383', '79007': '9028384', '79009': '9028386', '79010': '9028387', '79011': '9028388', '79012': '9028389', '79013': '9028390', '79014': '9028391', '79015': '9028392', '79016': '9028393', '79018': '9028394', '79019': '9028395', '79021': '9028396', '79022': '9028397', '79024': '9028398', '79027': '9028399', '79029': '9028400', '79031': '9028401', '79033': '9028403', '79034': '9028404', '79035': '9028405', '79036': '9028406', '79039': '9028407', '79040': '9028408', '79041': '9028409', '79042': '9028410', '79043': '9028411', '79044': '9028412', '79045': '9028413', '79046': '9028414', '79051': '9028415', '79052': '9028416', '79054': '9028417', '79056': '9028418', '79057': '9028419', '79058': '9028420', '79059': '9028421', '79061': '9028422', '79062': '9028423', '79063': '9028424', '79064': '9028425', '79065': '9028426', '79068': '9028427', '79070': '9028428', '79072': '9028429', '79078': '9028430', '79079': '9028431', '79080': '9028432', '79081': '9028433', '79082': '9028434', '79083': '9028435', '79084': '9028436', '79086': '9028437', '79087': '9028438', '79088': '9028439', '79091': '9028440', '79092': '9028441', '79093': '9028442', '79094': '9028443', '79095': '9028444', '79096': '9028445', '79097': '9028446', '79098': '9028447', '79101': '9028448', '79102': '9028449', '79103': '9028450', '79104': '9028451', '79105': '9028452', '79106': '9028453', '79107': '9028454', '79108': '9028455', '79109': '9028456', '79110': '9028457', '79111': '9028458', '79118': '9028460', '79119': '9028461', '79121': '9028463', '79124': '9028464', '79201': '9028465', '79220': '9028466', '79223': '9028467', '79225': '9028468', '79226': '9028469', '79227': '9028470', '79229': '9028471', '79230': '9028472', '79231': '9028473', '79233': '9028474', '79234': '9028475', '79235': '9028476', '79236': '9028477', '79237': '9028478', '79239': '9028479', '79241': '9028480', '79243': '9028481', '79244': '9028482', '79245': '9028483', '79248': '9028484', '79250': '9028485', '79251': '9028486', '79252': '9028487', '79255': '9028488', '79256': '9028489', '79257': '9028490', '79258': '9028491', '79259': '9028492', '79261': '9028493', '79311': '9028494', '79312': '9028495', '79313': '9028496', '79314': '9028497', '79316': '9028498', '79322': '9028500', '79323': '9028501', '79324': '9028502', '79325': '9028503', '79326': '9028504', '79329': '9028505', '79330': '9028506', '79331': '9028507', '79336': '9028508', '79339': '9028509', '79342': '9028510', '79343': '9028511', '79344': '9028512', '79345': '9028513', '79346': '9028514', '79347': '9028515', '79351': '9028517', '79353': '9028518', '79355': '9028519', '79356': '9028520', '79357': '9028521', '79358': '9028522', '79359': '9028523', '79360': '9028524', '79363': '9028525', '79364': '9028526', '79366': '9028527', '79369': '9028528', '79370': '9028529', '79371': '9028530', '79372': '9028531', '79373': '9028532', '79376': '9028533', '79377': '9028534', '79378': '9028535', '79379': '9028536', '79381': '9028537', '79382': '9028538', '79383': '9028539', '79401': '9028540', '79403': '9028541', '79404': '9028542', '79407': '9028543', '79409': '9028545', '79410': '9028546', '79411': '9028547', '79412': '9028548', '79413': '9028549', '79414': '9028550', '79415': '9028551', '79416': '9028552', '79423': '9028553', '79424': '9028554', '79430': '9028555', '79501': '9028556', '79502': '9028557', '79503': '9028558', '79504': '9028559', '79505': '9028560', '79506': '9028561', '79508': '9028562', '79510': '9028563', '79511': '9028564', '79512': '9028565', '79517': '9028566', '79518': '9028567', '79519': '9028568', '79520': '9028569', '79521': '9028570', '79525': '9028571', '79526': '9028572', '79527': '9028573', '79528': '9028574', '79529': '9028575', '79530': '9028576', '79532': '9028577', '79533': '9028578', '79534': '9028579', '79535': '9028580', '79536': '9028581', '79537': '9028582', '79538': '9028583', '79539': '9028584', '79540': '9028585', '79541': '9028586', '79543': '9028587', '79544': '9028588', '79545': '9028589', '79546': '9028590', '79547': '9028591', '79548': '9028592', '79549': '9028593', '79553': '9028594', '79556': '9028595', '79560': '9028596', '79561': '9028597', '79562': '9028598', '79563': '9028599', '79565': '9028600', '79566': '9028601', '79567': '9028602', '79601': '9028603', '79602': '9028604', '79603': '9028605', '79605': '9028606', '79606': '9028607', '79607': '9028608', '79697': '9028609', '79699': '9028610', '79701': '9028611', '79703': '9028612', '79705': '9028613', '79706': '9028614', '79707': '9028615', '79713': '9028617', '79714': '9028618', '79718': '9028619', '79719': '9028620', '79720': '9028621', '79730': '9028622', '79731': '9028623', '79734': '9028625', '79735': '9028626', '79738': '9028627', '79739': '9028628', '79740': '9028629', '79741': '9028630', '79742': '9028631', '79743': '9028632', '79744': '9028633', '79745': '9028634', '79748': '9028635', '79749': '9028636', '79752': '9028637', '79754': '9028638', '79755': '9028639', '79756': '9028640', '79758': '9028641', '79759': '9028642', '79761': '9028643', '79762': '9028644', '79763': '9028645', '79764': '9028646', '79765': '9028647', '79766': '9028648', '79772': '9028649', '79777': '9028651', '79778': '9028652', '79780': '9028653', '79781': '9028654', '79782': '9028655', '79783': '9028656', '79785': '9028657', '79788': '9028658', '79789': '9028659', '79821': '9028660', '79830': '9028661', '79831': '9028662', '79832': '9028663', '79834': '9028664', '79835': '9028665', '79836': '9028666', '79837': '9028667', '79838': '9028668', '79839': '9028669', '79842': '9028670', '79843': '9028671', '79845': '9028672', '79846': '9028673', '79847': '9028674', '79848': '9028675', '79849': '9028676', '79851': '9028677', '79852': '9028678', '79853': '9028679', '79854': '9028680', '79855': '9028681', '79901': '9028682', '79902': '9028683', '79903': '9028684', '79904': '9028685', '79905': '9028686', '79906': '9028687', '79907': '9028688', '79908': '9028689', '79910': '9028690', '79911': '9028691', '79912': '9028692', '79915': '9028693', '79918': '9028694', '79922': '9028696', '79924': '9028697', '79925': '9028698', '79927': '9028699', '79928': '9028700', '79930': '9028701', '79932': '9028702', '79934': '9028703', '79935': '9028704', '79936': '9028705', '79938': '9028706', '80002': '9028707', '80003': '9028708', '80004': '9028709', '80005': '9028710', '80007': '9028711', '80010': '9028712', '80011': '9028713', '80012': '9028714', '80013': '9028715', '80014': '9028716', '80015': '9028717', '80016': '9028718', '80017': '9028719', '80018': '9028720', '80019': '9028721', '80020': '9028722', '80021': '9028723', '80022': '9028724', '80023': '9028725', '80026': '9028727', '80027': '9028728', '80030': '9028729', '80031': '9028730', '80033': '9028731', '80045': '9028732', '80101': '9028733', '80102': '9028734', '80103': '9028735', '80104': '9028736', '80105': '9028737', '80106': '9028738', '80107': '9028739', '80108': '9028740', '80109': '9028741', '80110': '9028742', '80111': '9028743', '80112': '9028744', '80113': '9028745', '80116': '9028746', '80117': '9028747', '80118': '9028748', '80120': '9028749', '80121': '9028750', '80122': '9028751', '80123': '9028752', '80124': '9028753', '80125': '9028754', '80126': '9028755', '80127': '9028756', '80128': '9028757', '80129': '9028758', '80130': '9028759', '80132': '9028761', '80133': '9028762', '80134': '9028763', '80135': '9028764', '80136': '9028765', '80137': '9028766', '80138': '9028767', '80202': '9028768', '80203': '9028769', '80204': '9028770', '80205': '9028771', '80206': '9028772', '80207': '9028773', '80208': '9028774', '80209': '9028775', '80210': '9028776', '80211': '9028777', '80212': '9028778', '80214': '9028779', '80215': '9028780', '80216': '9028781', '80218': '9028782', '80219': '9028783', '80220': '9028784', '80221': '9028785', '80222': '9028786', '80223': '9028787', '80224': '9028788', '80226': '9028789', '80227': '9028790', '80228': '9028791', '80229': '9028792', '80230': '9028793', '80231': '9028794', '80232': '9028795', '80233': '9028796', '80234': '9028797', '80235': '9028798', '80236': '9028799', '80237': '9028800', '80238': '9028801', '80239': '9028802', '80241': '9028803', '80246': '9028804', '80247': '9028805', '80249': '9028806', '80257': '9028807', '80260': '9028808', '80264': '9028809', '80265': '9028810', '80266': '9028811', '80290': '9028812', '80293': '9028813', '80294': '9028814', '80299': '9028816', '80301': '9028817', '80302': '9028818', '80303': '9028819', '80304': '9028820', '80305': '9028821', '80401': '9028824', '80403': '9028825', '80420': '9028826', '80421': '9028827', '80422': '9028828', '80423': '9028829', '80424': '9028830', '80426': '9028832', '80427': '9028833', '80428': '9028834', '80430': '9028835', '80433': '9028836', '80434': '9028837', '80435': '9028838', '80436': '9028839', '80438': '9028840', '80439': '9028841', '80440': '9028842', '80442': '9028843', '80443': '9028844', '80444': '9028845', '80446': '9028846', '80447': '9028847', '80448': '9028848', '80449': '9028849', '80451': '9028850', '80452': '9028851', '80453': '9028852', '80454': '9028853', '80455': '9028854', '80456': '9028855', '80457': '9028856', '80459': '9028857', '80461': '9028858', '80463': '9028859', '80465': '9028860', '80466': '9028861', '80467': '9028862', '80468': '9028863', '80469': '9028864', '80470': '9028865', '80473': '9028867', '80474': '9028868', '80476': '9028869', '80478': '9028871', '80480': '9028872', '80481': '9028873', '80482': '9028874', '80483': '9028875', '80487': '9028876', '80497': '9028878', '80498': '9028879', '80501': '9028880', '80503': '9028882', '80504': '9028883', '80510': '9028884', '80512': '9028886', '80513': '9028887', '80514': '9028888', '80515': '9028889', '80516': '9028890', '80517': '9028891', '80521': '9028893', '80524': '9028895', '80525': '9028896', '80526': '9028897', '80528': '9028898', '80530': '9028899', '80534': '9028900', '80535': '9028901', '80536': '9028902', '80537': '9028903', '80538': '9028904', '80540': '9028905', '80542': '9028906', '80543': '9028907', '80545': '9028909', '80547': '9028910', '80549': '9028911', '80550': '9028912', '80601': '9028913', '80602': '9028914', '80603': '9028915', '80610': '9028916', '80611': '9028917', '80612': '9028918', '80615': '9028919', '80620': '9028920', '80621': '9028921', '80622': '9028922', '80624': '9028924', '80631': '9028925', '80634': '9028926', '80639': '9028927', '80640': '9028928', '80642': '9028929', '80643': '9028930', '80644': '9028931', '80645': '9028932', '80648': '9028933', '80649': '9028934', '80650': '9028935', '80651': '9028936', '80652': '9028937', '80653': '9028938', '80654': '9028939', '80701': '9028940', '80705': '9028941', '80720': '9028942', '80721': '9028943', '80722': '9028944', '80723': '9028945', '80726': '9028946', '80727': '9028947', '80728': '9028948', '80729': '9028949', '80731': '9028950', '80733': '9028951', '80734': '9028952', '80735': '9028953', '80736': '9028954', '80737': '9028955', '80740': '9028956', '80741': '9028957', '80742': '9028958', '80743': '9028959', '80744': '9028960', '80745': '9028961', '80747': '9028962', '80749': '9028963', '80750': '9028964', '80751': '9028965', '80754': '9028966', '80755': '9028967', '80757': '9028968', '80758': '9028969', '80759': '9028970', '80801': '9028971', '80802': '9028972', '80804': '9028973', '80805': '9028974', '80807': '9028975', '80808': '9028976', '80809': '9028977', '80810': '9028978', '80812': '9028979', '80813': '9028980', '80814': '9028981', '80815': '9028982', '80816': '9028983', '80817': '9028984', '80818': '9028985', '80819': '9028986', '80820': '9028987', '80821': '9028988', '80822': '9028989', '80823': '9028990', '80824': '9028991', '80825': '9028992', '80827': '9028993', '80828': '9028994', '80829': '9028995', '80830': '9028996', '80831': '9028997', '80832': '9028998', '80833': '9028999', '80834': '9029000', '80835': '9029001', '80836': '9029002', '80840': '9029003', '80860': '9029004', '80861': '9029005', '80862': '9029006', '80863': '9029007', '80864': '9029008', '80902': '9029010', '80903': '9029011', '80904': '9029012', '80905': '9029013', '80906': '9029014', '80907': '9029015', '80908': '9029016', '80909': '9029017', '80910': '9029018', '80911': '9029019', '80913': '9029020', '80914': '9029021', '80915': '9029022', '80916': '9029023', '80917': '9029024', '80918': '9029025', '80919': '9029026', '80920': '9029027', '80921': '9029028', '80922': '9029029', '80923': '9029030', '80924': '9029031', '80925': '9029032', '80926': '9029033', '80927': '9029034', '80928': '9029035', '80929': '9029036', '80930': '9029037', '80938': '9029038', '80939': '9029039', '80943': '9029040', '80951': '9029041', '81001': '9029042', '81003': '9029043', '81004': '9029044', '81005': '9029045', '81006': '9029046', '81007': '9029047', '81008': '9029048', '81019': '9029049', '81020': '9029050', '81021': '9029051', '81022': '9029052', '81023': '9029053', '81024': '9029054', '81025': '9029055', '81027': '9029056', '81029': '9029057', '81036': '9029060', '81039': '9029061', '81040': '9029062', '81041': '9029063', '81044': '9029065', '81045': '9029066', '81047': '9029067', '81049': '9029068', '81050': '9029069', '81052': '9029070', '81054': '9029071', '81055': '9029072', '81057': '9029073', '81058': '9029074', '81059': '9029075', '81062': '9029076', '81063': '9029077', '81064': '9029078', '81067': '9029079', '81069': '9029080', '81071': '9029081', '81073': '9029082', '81076': '9029083', '81081': '9029085', '81082': '9029086', '81084': '9029087', '81087': '9029088', '81089': '9029089', '81090': '9029090', '81091': '9029091', '81092': '9029092', '81101': '9029093', '81120': '9029095', '81122': '9029096', '81123': '9029097', '81125': '9029098', '81128': '9029100', '81130': '9029101', '81131': '9029102', '81132': '9029103', '81133': '9029104', '81136': '9029106', '81137': '9029107', '81140': '9029108', '81141': '9029109', '81143': '9029110', '81144': '9029111', '81146': '9029112', '81147': '9029113', '81149': '9029115', '81151': '9029116', '81152': '9029117', '81154': '9029119', '81155': '9029120', '81201': '9029121', '81210': '9029122', '81211': '9029123', '81212': '9029124', '81220': '9029125', '81221': '9029126', '81222': '9029127', '81223': '9029128', '81224': '9029129', '81225': '9029130', '81226': '9029131', '81230': '9029132', '81233': '9029133', '81235': '9029134', '81236': '9029135', '81237': '9029136', '81239': '9029137', '81240': '9029138', '81241': '9029139', '81243': '9029140', '81248': '9029141', '81251': '9029142', '81252': '9029143', '81253': '9029144', '81301': '9029145', '81303': '9029146', '81320': '9029147', '81321': '9029148', '81323': '9029149', '81324': '9029150', '81325': '9029151', '81326': '9029152', '81327': '9029153', '81328': '9029154', '81330': '9029155', '81331': '9029156', '81332': '9029157', '81334': '9029158', '81335': '9029159', '81401': '9029160', '81403': '9029161', '81410': '9029162', '81411': '9029163', '81413': '9029164', '81415': '9029165', '81416': '9029166', '81418': '9029167', '81419': '9029168', '81422': '9029169', '81423': '9029170', '81424': '9029171', '81425': '9029172', '81427': '9029173', '81428': '9029174', '81429': '9029175', '81430': '9029176', '81431': '9029177', '81432': '9029178', '81433': '9029179', '81434': '9029180', '81435': '9029181', '81501': '9029182', '81503': '9029183', '81504': '9029184', '81505': '9029185', '81506': '9029186', '81507': '9029187', '81520': '9029188', '81521': '9029189', '81522': '9029190', '81523': '9029191', '81524': '9029192', '81525': '9029193', '81526': '9029194', '81527': '9029195', '81601': '9029196', '81610': '9029197', '81611': '9029198', '81620': '9029200', '81621': '9029201', '81623': '9029202', '81624': '9029203', '81625': '9029204', '81630': '9029205', '81631': '9029206', '81632': '9029207', '81633': '9029208', '81635': '9029209', '81637': '9029210', '81638': '9029211', '81639': '9029212', '81640': '9029213', '81641': '9029214', '81642': '9029215', '81643': '9029216', '81645': '9029217', '81646': '9029218', '81647': '9029219', '81648': '9029220', '81649': '9029221', '81650': '9029222', '81652': '9029223', '81653': '9029224', '81654': '9029225', '81655': '9029226', '81657': '9029228', '82001': '9029230', '82005': '9029231', '82007': '9029232', '82009': '9029233', '82050': '9029234', '82051': '9029235', '82052': '9029236', '82053': '9029237', '82054': '9029238', '82055': '9029239', '82058': '9029240', '82059': '9029241', '82061': '9029242', '82063': '9029243', '82070': '9029244', '82072': '9029246', '82081': '9029247', '82082': '9029248', '82083': '9029249', '82084': '9029250', '82190': '9029251', '82201': '9029252', '82210': '9029253', '82212': '9029254', '82213': '9029255', '82214': '9029256', '82215': '9029257', '82217': '9029258', '82219': '9029260', '82221': '9029261', '82222': '9029262', '82223': '9029263', '82224': '9029264', '82225': '9029265', '82227': '9029266', '82229': '9029267', '82240': '9029268', '82243': '9029269', '82244': '9029270', '82301': '9029271', '82310': '9029272', '82321': '9029273', '82322': '9029274', '82323': '9029275', '82324': '9029276', '82325': '9029277', '82327': '9029278', '82329': '9029279', '82331': '9029280', '82332': '9029281', '82334': '9029282', '82335': '9029283', '82336': '9029284', '82401': '9029285', '82410': '9029286', '82411': '9029287', '82412': '9029288', '82414': '9029289', '82420': '9029290', '82421': '9029291', '82422': '9029292', '82423': '9029293', '82426': '9029294', '82428': '9029295', '82431': '9029297', '82432': '9029298', '82433': '9029299', '82434': '9029300', '82435': '9029301', '82441': '9029302', '82442': '9029303', '82443': '9029304', '82501': '9029305', '82510': '9029306', '82512': '9029307', '82513': '9029308', '82514': '9029309', '82515': '9029310', '82516': '9029311', '82520': '9029312', '82523': '9029313', '82524': '9029314', '82601': '9029315', '82604': '9029317', '82609': '9029318', '82620': '9029319', '82630': '9029320', '82633': '9029321', '82635': '9029322', '82636': '9029323', '82637': '9029324', '82639': '9029325', '82640': '9029326', '82642': '9029327', '82643': '9029328', '82649': '9029330', '82701': '9029331', '82710': '9029332', '82711': '9029333', '82712': '9029334', '82714': '9029335', '82715': '9029336', '82716': '9029337', '82718': '9029338', '82720': '9029339', '82721': '9029340', '82723': '9029341', '82725': '9029342', '82727': '9029343', '82729': '9029344', '82730': '9029345', '82731': '9029346', '82801': '9029347', '82831': '9029348', '82832': '9029349', '82834': '9029351', '82835': '9029352', '82836': '9029353', '82838': '9029354', '82839': '9029355', '82844': '9029356', '82901': '9029357', '82922': '9029358', '82923': '9029359', '82925': '9029360', '82929': '9029361', '82930': '9029362', '82932': '9029363', '82933': '9029364', '82934': '9029365', '82935': '9029366', '82936': '9029367', '82937': '9029368', '82938': '9029369', '82941': '9029371', '82942': '9029372', '82943': '9029373', '82944': '9029374', '82945': '9029375', '83001': '9029376', '83011': '9029378', '83012': '9029379', '83013': '9029380', '83014': '9029381', '83025': '9029382', '83101': '9029383', '83110': '9029384', '83111': '9029385', '83112': '9029386', '83113': '9029387', '83114': '9029388', '83115': '9029389', '83116': '9029390', '83118': '9029391', '83120': '9029393', '83121': '9029394', '83122': '9029395', '83123': '9029396', '83124': '9029397', '83126': '9029398', '83127': '9029399', '83128': '9029400', '83201': '9029401', '83202': '9029402', '83204': '9029403', '83209': '9029404', '83210': '9029405', '83211': '9029406', '83212': '9029407', '83213': '9029408', '83214': '9029409', '83217': '9029410', '83220': '9029411', '83221': '9029412', '83223': '9029413', '83226': '9029414', '83227': '9029415', '83228': '9029416', '83232': '9029417', '83234': '9029418', '83235': '9029419', '83236': '9029420', '83237': '9029421', '83238': '9029422', '83239': '9029423', '83241': '9029424', '83243': '9029425', '83244': '9029426', '83245': '9029427', '83246': '9029428', '83250': '9029429', '83251': '9029430', '83252': '9029431', '83253': '9029432', '83254': '9029433', '83255': '9029434', '83261': '9029435', '83262': '9029436', '83263': '9029437', '83271': '9029438', '83272': '9029439', '83274': '9029440', '83276': '9029441', '83278': '9029442', '83281': '9029443', '83283': '9029444', '83285': '9029445', '83286': '9029446', '83287': '9029447', '83301': '9029448', '83302': '9029449', '83311': '9029450', '83312': '9029451', '83313': '9029452', '83314': '9029453', '83316': '9029454', '83318': '9029455', '83320': '9029456', '83321': '9029457', '83322': '9029458', '83323': '9029459', '83324': '9029460', '83325': '9029461', '83327': '9029462', '83328': '9029463', '83330': '9029464', '83332': '9029465', '83333': '9029466', '83334': '9029467', '83335': '9029468', '83336': '9029469', '83337': '9029470', '83338': '9029471', '83340': '9029472', '83341': '9029473', '83342': '9029474', '83344': '9029475', '83346': '9029476', '83347': '9029477', '83349': '9029478', '83350': '9029479', '83352': '9029480', '83353': '9029481', '83355': '9029482', '83401': '9029483', '83402': '9029484', '83404': '9029485', '83406': '9029486', '83420': '9029487', '83422': '9029488', '83423': '9029489', '83424': '9029490', '83425': '9029491', '83427': '9029492', '83428': '9029493', '83429': '9029494', '83431': '9029495', '83434': '9029496', '83435': '9029497', '83436': '9029498', '83440': '9029499', '83442': '9029500', '83443': '9029501', '83444': '9029502', '83445': '9029503', '83446': '9029504', '83448': '9029505', '83449': '9029506', '83450': '9029507', '83451': '9029508', '83452': '9029509', '83455': '9029510', '83462': '9029511', '83463': '9029512', '83464': '9029513', '83465': '9029514', '83466': '9029515', '83467': '9029516', '83468': '9029517', '83469': '9029518', '83501': '9029519', '83520': '9029520', '83522': '9029521', '83523': '9029522', '83524': '9029523', '83525': '9029524', '83526': '9029525', '83530': '9029526', '83533': '9029527', '83535': '9029528', '83536': '9029529', '83537': '9029530', '83539': '9029531', '83540': '9029532', '83541': '9029533', '83542': '9029534', '83543': '9029535', '83544': '9029536', '83545': '9029537', '83546': '9029538', '83547': '9029539', '83548': '9029540', '83549': '9029541', '83552': '9029542', '83553': '9029543', '83554': '9029544', '83555': '9029545', '83601': '9029546', '83602': '9029547', '83604': '9029548', '83605': '9029549', '83607': '9029550', '83610': '9029551', '83611': '9029552', '83612': '9029553', '83615': '9029554', '83616': '9029555', '83617': '9029556', '83619': '9029557', '83622': '9029558', '83623': '9029559', '83624': '9029560', '83626': '9029561', '83627': '9029562', '83628': '9029563', '83629': '9029564', '83631': '9029565', '83632': '9029566', '83633': '9029567', '83634': '9029568', '83637': '9029570', '83638': '9029571', '83639': '9029572', '83641': '9029573', '83642': '9029574', '83643': '9029575', '83644': '9029576', '83645': '9029577', '83646': '9029578', '83647': '9029579', '83648': '9029580', '83650': '9029581', '83651': '9029582', '83654': '9029583', '83655': '9029584', '83657': '9029586', '83660': '9029587', '83661': '9029588', '83666': '9029589', '83669': '9029590', '83670': '9029591', '83671': '9029592', '83672': '9029593', '83676': '9029594', '83677': '9029595', '83686': '9029596', '83687': '9029597', '83702': '9029598', '83703': '9029599', '83704': '9029600', '83705': '9029601', '83706': '9029602', '83708': '9029604', '83709': '9029605', '83712': '9029606', '83713': '9029607', '83714': '9029608', '83716': '9029609', '83724': '9029611', '83725': '9029612', '83801': '9029613', '83802': '9029614', '83803': '9029615', '83804': '9029616', '83805': '9029617', '83806': '9029618', '83808': '9029619', '83809': '9029620', '83810': '9029621', '83811': '9029622', '83812': '9029623', '83813': '9029624', '83814': '9029625', '83815': '9029626', '83821': '9029627', '83822': '9029628', '83823': '9029629', '83824': '9029630', '83827': '9029631', '83830': '9029632', '83832': '9029633', '83833': '9029634', '83834': '9029635', '83835': '9029636', '83836': '9029637', '83837': '9029638', '83839': '9029639', '83842': '9029640', '83843': '9029641', '83844': '9029642', '83845': '9029643', '83846': '9029644', '83847': '9029645', '83848': '9029646', '83849': '9029647', '83850': '9029648', '83851': '9029649', '83852': '9029650', '83854': '9029652', '83855': '9029653', '83856': '9029654', '83857': '9029655', '83858': '9029656', '83860': '9029657', '83861': '9029658', '83864': '9029659', '83867': '9029660', '83868': '9029661', '83869': '9029662', '83870': '9029663', '83871': '9029664', '83872': '9029665', '83873': '9029666', '83876': '9029668', '84001': '9029669', '84002': '9029670', '84003': '9029671', '84004': '9029672', '84005': '9029673', '84006': '9029674', '84007': '9029675', '84010': '9029676', '84013': '9029677', '84014': '9029678', '84015': '9029679', '84017': '9029681', '84018': '9029682', '84020': '9029683', '84021': '9029684', '84022': '9029685', '84023': '9029686', '84024': '9029687', '84025': '9029688', '84026': '9029689', '84027': '9029690', '84028': '9029691', '84029': '9029692', '84031': '9029693', '84032': '9029694', '84033': '9029695', '84034': '9029696', '84035': '9029697', '84036': '9029698', '84037': '9029699', '84038': '9029700', '84039': '9029701', '84040': '9029702', '84041': '9029703', '84042': '9029704', '84043': '9029705', '84044': '9029706', '84045': '9029707', '84046': '9029708', '84047': '9029709', '84049': '9029710', '84050': '9029711', '84051': '9029712', '84052': '9029713', '84054': '9029714', '84055': '9029715', '84056': '9029716', '84057': '9029717', '84058': '9029718', '84060': '9029719', '84061': '9029720', '84062': '9029721', '84063': '9029722', '84064': '9029723', '84065': '9029724', '84066': '9029725', '84067': '9029726', '84069': '9029728', '84070': '9029729', '84071': '9029730', '84072': '9029731', '84073': '9029732', '84074': '9029733', '84075': '9029734', '84078': '9029736', '84080': '9029737', '84081': '9029738', '84082': '9029739', '84083': '9029740', '84084': '9029741', '84085': '9029742', '84086': '9029743', '84087': '9029744', '84088': '9029745', '84092': '9029746', '84093': '9029747', '84094': '9029748', '84095': '9029749', '84096': '9029750', '84097': '9029751', '84098': '9029752', '84101': '9029753', '84102': '9029754', '84103': '9029755', '84104': '9029756', '84105': '9029757', '84106': '9029758', '84107': '9029759', '84108': '9029760', '84109': '9029761', '84111': '9029763', '84112': '9029764', '84113': '9029765', '84115': '9029766', '84116': '9029767', '84117': '9029768', '84118': '9029769', '84119': '9029770', '84120': '9029771', '84121': '9029772', '84123': '9029774', '84124': '9029775', '84128': '9029776', '84132': '9029777', '84138': '9029778', '84143': '9029779', '84150': '9029781', '84184': '9029783', '84190': '9029784', '84199': '9029785', '84201': '9029786', '84302': '9029787', '84304': '9029788', '84305': '9029789', '84306': '9029790', '84307': '9029791', '84308': '9029792', '84309': '9029793', '84310': '9029794', '84311': '9029795', '84312': '9029796', '84313': '9029797', '84314': '9029798', '84315': '9029799', '84316': '9029800', '84317': '9029801', '84318': '9029802', '84319': '9029803', '84320': '9029804', '84321': '9029805', '84322': '9029806', '84324': '9029807', '84325': '9029808', '84327': '9029810', '84328': '9029811', '84329': '9029812', '84331': '9029813', '84332': '9029814', '84333': '9029815', '84335': '9029817', '84336': '9029818', '84337': '9029819', '84338': '9029820', '84339': '9029821', '84340': '9029822', '84341': '9029823', '84401': '9029824', '84403': '9029825', '84404': '9029826', '84405': '9029827', '84408': '9029828', '84414': '9029829', '84501': '9029830', '84511': '9029831', '84512': '9029832', '84513': '9029833', '84516': '9029834', '84518': '9029835', '84520': '9029836', '84521': '9029837', '84522': '9029838', '84523': '9029839', '84525': '9029840', '84526': '9029841', '84528': '9029842', '84529': '9029843', '84530': '9029844', '84531': '9029845', '84532': '9029846', '84533': '9029847', '84534': '9029848', '84535': '9029849', '84536': '9029850', '84537': '9029851', '84539': '9029852', '84540': '9029853', '84542': '9029854', '84601': '9029855', '84604': '9029857', '84606': '9029858', '84620': '9029859', '84621': '9029860', '84622': '9029861', '84624': '9029863', '84626': '9029864', '84627': '9029865', '84628': '9029866', '84629': '9029867', '84630': '9029868', '84631': '9029869', '84632': '9029870', '84633': '9029871', '84634': '9029872', '84635': '9029873', '84636': '9029874', '84637': '9029875', '84639': '9029876', '84640': '9029877', '84642': '9029878', '84643': '9029879', '84645': '9029880', '84646': '9029881', '84647': '9029882', '84648': '9029883', '84649': '9029884', '84651': '9029885', '84652': '9029886', '84653': '9029887', '84654': '9029888', '84655': '9029889', '84656': '9029890', '84657': '9029891', '84660': '9029892', '84662': '9029893', '84663': '9029894', '84664': '9029895', '84701': '9029897', '84710': '9029898', '84711': '9029899', '84712': '9029900', '84713': '9029901', '84714': '9029902', '84715': '9029903', '84716': '9029904', '84718': '9029906', '84719': '9029907', '84720': '9029908', '84721': '9029909', '84722': '9029910', '84723': '9029911', '84724': '9029912', '84725': '9029913', '84726': '9029914', '84728': '9029915', '84729': '9029916', '84730': '9029917', '84731': '9029918', '84732': '9029919', '84733': '9029920', '84734': '9029921', '84735': '9029922', '84736': '9029923', '84737': '9029924', '84738': '9029925', '84739': '9029926', '84740': '9029927', '84741': '9029928', '84742': '9029929', '84743': '9029930', '84744': '9029931', '84745': '9029932', '84746': '9029933', '84747': '9029934', '84749': '9029935', '84750': '9029936', '84751': '9029937', '84752': '9029938', '84753': '9029939', '84754': '9029940', '84755': '9029941', '84756': '9029942', '84757': '9029943', '84758': '9029944', '84759': '9029945', '84760': '9029946', '84761': '9029947', '84762': '9029948', '84763': '9029949', '84764': '9029950', '84765': '9029951', '84766': '9029952', '84767': '9029953', '84770': '9029954', '84772': '9029955', '84773': '9029956', '84774': '9029957', '84775': '9029958', '84776': '9029959', '84779': '9029960', '84780': '9029961', '84781': '9029962', '84782': '9029963', '84783': '9029964', '84790': '9029965', '85003': '9029966', '85004': '9029967', '85006': '9029968', '85007': '9029969', '85008': '9029970', '85009': '9029971', '85012': '9029972', '85013': '9029973', '85014': '9029974', '85015': '9029975', '85016': '9029976', '85017': '9029977', '85018': '9029978', '85019': '9029979', '85020': '9029980', '85021': '9029981', '85022': '9029982', '85023': '9029983', '85024': '9029984', '85026': '9029985', '85027': '9029986', '85028': '9029987', '85029': '9029988', '85031': '9029989', '85032': '9029990', '85033': '9029991', '85034': '9029992', '85035': '9029993', '85037': '9029994', '85040': '9029995', '85041': '9029996', '85042': '9029997', '85043': '9029998', '85044': '9029999', '85045': '9030000', '85048': '9030001', '85050': '9030002', '85051': '9030003', '85053': '9030004', '85054': '9030005', '85083': '9030007', '85085': '9030008', '85086': '9030009', '85087': '9030010', '85118': '9030011', '85119': '9030012', '85120': '9030013', '85122': '9030014', '85128': '9030015', '85131': '9030016', '85132': '9030017', '85137': '9030018', '85138': '9030019', '85139': '9030020', '85142': '9030021', '85145': '9030022', '85172': '9030023', '85173': '9030024', '85192': '9030026', '85193': '9030027', '85194': '9030028', '85201': '9030029', '85202': '9030030', '85203': '9030031', '85204': '9030032', '85205': '9030033', '85206': '9030034', '85207': '9030035', '85208': '9030036', '85209': '9030037', '85210': '9030038', '85212': '9030039', '85213': '9030040', '85215': '9030041', '85224': '9030048', '85225': '9030049', '85226': '9030050', '85233': '9030055', '85234': '9030056', '85248': '9030067', '85249': '9030068', '85250': '9030069', '85251': '9030070', '85253': '9030071', '85254': '9030072', '85255': '9030073', '85256': '9030074', '85257': '9030075', '85258': '9030076', '85259': '9030077', '85260': '9030078', '85262': '9030080', '85263': '9030081', '85264': '9030082', '85266': '9030083', '85268': '9030084', '85281': '9030087', '85282': '9030088', '85283': '9030089', '85284': '9030090', '85286': '9030091', '85295': '9030095', '85296': '9030096', '85297': '9030097', '85298': '9030098', '85301': '9030099', '85302': '9030100', '85303': '9030101', '85304': '9030102', '85305': '9030103', '85306': '9030104', '85307': '9030105', '85308': '9030106', '85309': '9030107', '85310': '9030108', '85320': '9030109', '85321': '9030110', '85322': '9030111', '85323': '9030112', '85324': '9030113', '85325': '9030114', '85326': '9030115', '85328': '9030117', '85331': '9030119', '85332': '9030120', '85333': '9030121', '85334': '9030122', '85335': '9030123', '85336': '9030124', '85337': '9030125', '85338': '9030126', '85339': '9030127', '85340': '9030128', '85341': '9030129', '85342': '9030130', '85344': '9030131', '85345': '9030132', '85346': '9030133', '85347': '9030134', '85348': '9030135', '85349': '9030136', '85350': '9030137', '85351': '9030138', '85353': '9030139', '85354': '9030140', '85355': '9030141', '85356': '9030142', '85357': '9030143', '85360': '9030144', '85361': '9030145', '85362': '9030146', '85363': '9030147', '85364': '9030148', '85365': '9030149', '85367': '9030151', '85373': '9030152', '85374': '9030153', '85375': '9030154', '85377': '9030155', '85379': '9030156', '85381': '9030157', '85382': '9030158', '85383': '9030159', '85387': '9030160', '85388': '9030161', '85390': '9030162', '85392': '9030163', '85395': '9030164', '85396': '9030165', '85501': '9030166', '85530': '9030167', '85533': '9030168', '85534': '9030169', '85535': '9030170', '85536': '9030171', '85539': '9030172', '85540': '9030173', '85541': '9030174', '85542': '9030175', '85543': '9030176', '85544': '9030177', '85545': '9030178', '85546': '9030179', '85550': '9030180', '85551': '9030181', '85552': '9030182', '85553': '9030183', '85554': '9030184', '85601': '9030185', '85602': '9030186', '85603': '9030187', '85605': '9030188', '85606': '9030189', '85607': '9030190', '85609': '9030192', '85610': '9030193', '85611': '9030194', '85613': '9030195', '85614': '9030196', '85615': '9030197', '85616': '9030198', '85617': '9030199', '85618': '9030200', '85619': '9030201', '85620': '9030202', '85621': '9030203', '85622': '9030204', '85623': '9030205', '85624': '9030206', '85625': '9030207', '85629': '9030209', '85630': '9030210', '85631': '9030211', '85632': '9030212', '85633': '9030213', '85634': '9030214', '85635': '9030215', '85637': '9030216', '85638': '9030217', '85640': '9030219', '85641': '9030220', '85643': '9030221', '85645': '9030222', '85646': '9030223', '85648': '9030224', '85650': '9030225', '85653': '9030226', '85658': '9030228', '85701': '9030229', '85704': '9030230', '85705': '9030231', '85706': '9030232', '85707': '9030233', '85708': '9030234', '85709': '9030235', '85710': '9030236', '85711': '9030237', '85712': '9030238', '85713': '9030239', '85714': '9030240', '85715': '9030241', '85716': '9030242', '85718': '9030243', '85719': '9030244', '85721': '9030245', '85723': '9030246', '85724': '9030247', '85730': '9030249', '85735': '9030250', '85736': '9030251', '85737': '9030252', '85739': '9030253', '85741': '9030254', '85742': '9030255', '85743': '9030256', '85745': '9030257', '85746': '9030258', '85747': '9030259', '85748': '9030260', '85749': '9030261', '85750': '9030262', '85755': '9030263', '85756': '9030264', '85757': '9030265', '85901': '9030266', '85911': '9030267', '85920': '9030268', '85922': '9030269', '85924': '9030270', '85925': '9030271', '85926': '9030272', '85927': '9030273', '85928': '9030274', '85929': '9030275', '85930': '9030276', '85931': '9030277', '85932': '9030278', '85933': '9030279', '85934': '9030280', '85935': '9030281', '85936': '9030282', '85937': '9030283', '85938': '9030284', '85939': '9030285', '85940': '9030286', '85941': '9030287', '85942': '9030288', '86001': '9030289', '86004': '9030291', '86011': '9030292', '86015': '9030293', '86016': '9030294', '86017': '9030295', '86018': '9030296', '86020': '9030297', '86021': '9030298', '86022': '9030299', '86023': '9030300', '86024': '9030301', '86025': '9030302', '86030': '9030303', '86031': '9030304', '86032': '9030305', '86033': '9030306', '86034': '9030307', '86035': '9030308', '86036': '9030309', '86038': '9030310', '86039': '9030311', '86040': '9030312', '86042': '9030313', '86043': '9030314', '86044': '9030315', '86045': '9030316', '86046': '9030317', '86047': '9030318', '86052': '9030319', '86053': '9030320', '86054': '9030321', '86301': '9030322', '86303': '9030323', '86305': '9030324', '86314': '9030327', '86315': '9030328', '86320': '9030329', '86321': '9030330', '86322': '9030331', '86323': '9030332', '86324': '9030333', '86325': '9030334', '86326': '9030335', '86327': '9030336', '86331': '9030337', '86332': '9030338', '86333': '9030339', '86334': '9030340', '86335': '9030341', '86336': '9030342', '86337': '9030343', '86338': '9030344', '86343': '9030346', '86351': '9030347', '86401': '9030348', '86403': '9030350', '86404': '9030351', '86406': '9030352', '86409': '9030353', '86413': '9030354', '86426': '9030355', '86429': '9030356', '86431': '9030358', '86432': '9030359', '86433': '9030360', '86434': '9030361', '86435': '9030362', '86436': '9030363', '86437': '9030364', '86438': '9030365', '86440': '9030366', '86441': '9030367', '86442': '9030368', '86444': '9030369', '86445': '9030370', '86502': '9030371', '86503': '9030372', '86504': '9030373', '86505': '9030374', '86506': '9030375', '86507': '9030376', '86508': '9030377', '86510': '9030378', '86511': '9030379', '86512': '9030380', '86514': '9030381', '86515': '9030382', '86520': '9030383', '86535': '9030384', '86538': '9030385', '86540': '9030386', '86544': '9030387', '86545': '9030388', '86547': '9030389', '86556': '9030391', '87001': '9030392', '87002': '9030393', '87004': '9030394', '87005': '9030395', '87006': '9030396', '87007': '9030397', '87008': '9030398', '87010': '9030399', '87011': '9030400', '87012': '9030401', '87013': '9030402', '87014': '9030403', '87015': '9030404', '87016': '9030405', '87017': '9030406', '87018': '9030407', '87020': '9030408', '87021': '9030409', '87022': '9030410', '87023': '9030411', '87024': '9030412', '87025': '9030413', '87026': '9030414', '87027': '9030415', '87028': '9030416', '87029': '9030417', '87031': '9030418', '87032': '9030419', '87034': '9030420', '87035': '9030421', '87036': '9030422', '87037': '9030423', '87038': '9030424', '87040': '9030425', '87041': '9030426', '87042': '9030427', '87043': '9030428', '87044': '9030429', '87045': '9030430', '87047': '9030431', '87048': '9030432', '87049': '9030433', '87052': '9030434', '87053': '9030435', '87056': '9030436', '87059': '9030437', '87061': '9030439', '87062': '9030440', '87063': '9030441', '87064': '9030442', '87068': '9030443', '87070': '9030444', '87083': '9030445', '87101': '9030446', '87102': '9030447', '87104': '9030448', '87105': '9030449', '87106': '9030450', '87107': '9030451', '87108': '9030452', '87109': '9030453', '87110': '9030454', '87111': '9030455', '87112': '9030456', '87113': '9030457', '87114': '9030458', '87116': '9030459', '87120': '9030460', '87121': '9030461', '87122': '9030462', '87123': '9030463', '87124': '9030464', '87144': '9030466', '87301': '9030468', '87305': '9030469', '87310': '9030470', '87311': '9030471', '87312': '9030472', '87313': '9030473', '87315': '9030474', '87316': '9030475', '87319': '9030477', '87320': '9030478', '87321': '9030479', '87323': '9030480', '87325': '9030481', '87326': '9030482', '87327': '9030483', '87328': '9030484', '87347': '9030485', '87357': '9030486', '87364': '9030487', '87375': '9030488', '87401': '9030489', '87402': '9030490', '87410': '9030491', '87412': '9030492', '87413': '9030493', '87415': '9030494', '87416': '9030495', '87417': '9030496', '87418': '9030497', '87419': '9030498', '87420': '9030499', '87421': '9030500', '87455': '9030501', '87461': '9030502', '87501': '9030503', '87505': '9030504', '87506': '9030505', '87507': '9030506', '87508': '9030507', '87510': '9030508', '87512': '9030510', '87514': '9030511', '87515': '9030512', '87516': '9030513', '87517': '9030514', '87518': '9030515', '87519': '9030516', '87520': '9030517', '87521': '9030518', '87522': '9030519', '87524': '9030520', '87525': '9030521', '87527': '9030522', '87528': '9030523', '87529': '9030524', '87530': '9030525', '87531': '9030526', '87532': '9030527', '87535': '9030529', '87537': '9030530', '87539': '9030531', '87540': '9030532', '87544': '9030533', '87548': '9030534', '87549': '9030535', '87551': '9030536', '87552': '9030537', '87553': '9030538', '87556': '9030539', '87557': '9030540', '87558': '9030541', '87560': '9030542', '87562': '9030543', '87564': '9030544', '87565': '9030545', '87566': '9030546', '87567': '9030547', '87569': '9030548', '87571': '9030549', '87573': '9030550', '87575': '9030551', '87577': '9030552', '87578': '9030553', '87579': '9030554', '87580': '9030555', '87581': '9030556', '87582': '9030557', '87583': '9030558', '87701': '9030559', '87710': '9030560', '87711': '9030561', '87712': '9030562', '87713': '9030563', '87714': '9030564', '87715': '9030565', '87718': '9030566', '87722': '9030567', '87723': '9030568', '87724': '9030569', '87728': '9030570', '87729': '9030571', '87730': '9030572', '87731': '9030573', '87732': '9030574', '87733': '9030575', '87734': '9030576', '87735': '9030577', '87736': '9030578', '87740': '9030579', '87742': '9030580', '87743': '9030581', '87745': '9030582', '87747': '9030583', '87749': '9030584', '87752': '9030585', '87753': '9030586', '87801': '9030587', '87820': '9030588', '87821': '9030589', '87823': '9030590', '87824': '9030591', '87825': '9030592', '87827': '9030593', '87828': '9030594', '87829': '9030595', '87830': '9030596', '87831': '9030597', '87832': '9030598', '87901': '9030599', '87930': '9030600', '87931': '9030601', '87935': '9030602', '87936': '9030603', '87937': '9030604', '87939': '9030605', '87940': '9030606', '87942': '9030608', '87943': '9030609', '88001': '9030610', '88002': '9030611', '88003': '9030612', '88005': '9030614', '88007': '9030615', '88008': '9030616', '88009': '9030617', '88011': '9030618', '88012': '9030619', '88020': '9030620', '88021': '9030621', '88022': '9030622', '88023': '9030623', '88025': '9030624', '88026': '9030625', '88029': '9030626', '88030': '9030627', '88033': '9030628', '88038': '9030629', '88039': '9030630', '88040': '9030631', '88041': '9030632', '88042': '9030633', '88043': '9030634', '88044': '9030635', '88045': '9030636', '88047': '9030638', '88048': '9030639', '88049': '9030640', '88051': '9030641', '88052': '9030642', '88055': '9030644', '88056': '9030645', '88061': '9030646', '88063': '9030647', '88072': '9030648', '88081': '9030649', '88101': '9030650', '88103': '9030651', '88112': '9030652', '88113': '9030653', '88114': '9030654', '88116': '9030655', '88118': '9030656', '88119': '9030657', '88120': '9030658', '88121': '9030659', '88123': '9030660', '88124': '9030661', '88125': '9030662', '88126': '9030663', '88130': '9030664', '88132': '9030665', '88133': '9030666', '88134': '9030667', '88135': '9030668', '88136': '9030669', '88201': '9030670', '88203': '9030671', '88210': '9030672', '88220': '9030673', '88230': '9030674', '88231': '9030675', '88232': '9030676', '88240': '9030677', '88242': '9030678', '88250': '9030679', '88252': '9030680', '88253': '9030681', '88254': '9030682', '88255': '9030683', '88256': '9030684', '88260': '9030685', '88262': '9030686', '88263': '9030687', '88264': '9030688', '88265': '9030689', '88267': '9030690', '88301': '9030692', '88310': '9030693', '88312': '9030694', '88314': '9030695', '88316': '9030696', '88317': '9030697', '88318': '9030698', '88321': '9030699', '88324': '9030700', '88325': '9030701', '88330': '9030702', '88336': '9030703', '88337': '9030704', '88338': '9030705', '88339': '9030706', '88340': '9030707', '88341': '9030708', '88342': '9030709', '88343': '9030710', '88344': '9030711', '88345': '9030712', '88346': '9030713', '88347': '9030714', '88348': '9030715', '88350': '9030716', '88351': '9030717', '88352': '9030718', '88353': '9030719', '88354': '9030720', '88401': '9030722', '88410': '9030723', '88411': '9030724', '88414': '9030725', '88415': '9030726', '88416': '9030727', '88417': '9030728', '88418': '9030729', '88419': '9030730', '88421': '9030731', '88422': '9030732', '88424': '9030733', '88426': '9030734', '88427': '9030735', '88430': '9030736', '88431': '9030737', '88434': '9030738', '88435': '9030739', '88436': '9030740', '89001': '9030742', '89002': '9030743', '89003': '9030744', '89004': '9030745', '89005': '9030746', '89007': '9030747', '89008': '9030748', '89010': '9030749', '89011': '9030750', '89012': '9030751', '89013': '9030752', '89014': '9030753', '89015': '9030754', '89017': '9030755', '89018': '9030756', '89019': '9030757', '89020': '9030758', '89021': '9030759', '89022': '9030760', '89025': '9030762', '89027': '9030763', '89029': '9030764', '89030': '9030765', '89031': '9030766', '89032': '9030767', '89034': '9030768', '89039': '9030769', '89040': '9030770', '89042': '9030771', '89043': '9030772', '89044': '9030773', '89045': '9030774', '89046': '9030775', '89047': '9030776', '89048': '9030777', '89049': '9030778', '89052': '9030779', '89054': '9030780', '89060': '9030781', '89061': '9030782', '89074': '9030783', '89081': '9030784', '89084': '9030785', '89085': '9030786', '89086': '9030787', '89101': '9030788', '89102': '9030789', '89103': '9030790', '89104': '9030791', '89106': '9030792', '89107': '9030793', '89108': '9030794', '89109': '9030795', '89110': '9030796', '89113': '9030797', '89115': '9030798', '89117': '9030799', '89118': '9030800', '89119': '9030801', '89120': '9030802', '89121': '9030803', '89122': '9030804', '89123': '9030805', '89124': '9030806', '89128': '9030808', '89129': '9030809', '89130': '9030810', '89131': '9030811', '89134': '9030812', '89135': '9030813', '89138': '9030814', '89139': '9030815', '89141': '9030816', '89142': '9030817', '89143': '9030818', '89144': '9030819', '89145': '9030820', '89146': '9030821', '89147': '9030822', '89148': '9030823', '89149': '9030824', '89151': '9030826', '89152': '9030827', '89153': '9030828', '89154': '9030829', '89156': '9030830', '89164': '9030831', '89166': '9030832', '89169': '9030833', '89178': '9030834', '89183': '9030835', '89191': '9030836', '89301': '9030838', '89310': '9030839', '89311': '9030840', '89314': '9030841', '89316': '9030842', '89317': '9030843', '89318': '9030844', '89319': '9030845', '89403': '9030846', '89404': '9030847', '89405': '9030848', '89406': '9030849', '89408': '9030850', '89409': '9030851', '89410': '9030852', '89412': '9030854', '89413': '9030855', '89414': '9030856', '89415': '9030857', '89418': '9030858', '89419': '9030859', '89420': '9030860', '89421': '9030861', '89422': '9030862', '89423': '9030863', '89424': '9030864', '89425': '9030865', '89426': '9030866', '89427': '9030867', '89428': '9030868', '89429': '9030869', '89430': '9030870', '89431': '9030871', '89433': '9030872', '89434': '9030873', '89436': '9030874', '89438': '9030875', '89439': '9030876', '89440': '9030877', '89441': '9030878', '89442': '9030879', '89444': '9030880', '89445': '9030881', '89447': '9030882', '89448': '9030883', '89449': '9030884', '89451': '9030886', '89460': '9030887', '89496': '9030888', '89501': '9030889', '89502': '9030890', '89503': '9030891', '89506': '9030893', '89508': '9030894', '89509': '9030895', '89510': '9030896', '89511': '9030897', '89512': '9030898', '89519': '9030899', '89521': '9030900', '89523': '9030901', '89557': '9030902', '89595': '9030903', '89701': '9030904', '89703': '9030905', '89704': '9030906', '89705': '9030907', '89706': '9030908', '89801': '9030909', '89815': '9030911', '89820': '9030912', '89821': '9030913', '89822': '9030914', '89823': '9030915', '89825': '9030917', '89826': '9030918', '89828': '9030919', '89830': '9030920', '89831': '9030921', '89832': '9030922', '89833': '9030923', '89834': '9030924', '89835': '9030925', '89883': '9030926', '90001': '9030927', '90002': '9030928', '90003': '9030929', '90004': '9030930', '90005': '9030931', '90006': '9030932', '90007': '9030933', '90008': '9030934', '90010': '9030936', '90011': '9030937', '90012': '9030938', '90013': '9030939', '90014': '9030940', '90015': '9030941', '90016': '9030942', '90017': '9030943', '90018': '9030944', '90019': '9030945', '90020': '9030946', '90021': '9030947', '90022': '9030948', '90023': '9030949', '90024': '9030950', '90025': '9030951', '90026': '9030952', '90027': '9030953', '90028': '9030954', '90029': '9030955', '90031': '9030956', '90032': '9030957', '90033': '9030958', '90034': '9030959', '90035': '9030960', '90036': '9030961', '90037': '9030962', '90038': '9030963', '90039': '9030964', '90040': '9030965', '90041': '9030966', '90042': '9030967', '90043': '9030968', '90044': '9030969', '90045': '9030970', '90046': '9030971', '90047': '9030972', '90048': '9030973', '90049': '9030974', '90056': '9030976', '90057': '9030977', '90058': '9030978', '90059': '9030979', '90061': '9030980', '90062': '9030981', '90063': '9030982', '90064': '9030983', '90065': '9030984', '90066': '9030985', '90067': '9030986', '90068': '9030987', '90069': '9030988', '90071': '9030989', '90077': '9030990', '90079': '9030991', '90089': '9030992', '90094': '9030993', '90095': '9030994', '90201': '9030995', '90210': '9030997', '90211': '9030998', '90212': '9030999', '90220': '9031000', '90221': '9031001', '90222': '9031002', '90230': '9031003', '90232': '9031004', '90240': '9031005', '90241': '9031006', '90242': '9031007', '90245': '9031008', '90247': '9031009', '90248': '9031010', '90249': '9031011', '90250': '9031012', '90254': '9031013', '90255': '9031014', '90260': '9031015', '90261': '9031016', '90262': '9031017', '90263': '9031018', '90265': '9031019', '90266': '9031020', '90270': '9031021', '90272': '9031022', '90274': '9031023', '90275': '9031024', '90277': '9031025', '90278': '9031026', '90280': '9031027', '90290': '9031028', '90291': '9031029', '90292': '9031030', '90293': '9031031', '90301': '9031032', '90302': '9031033', '90303': '9031034', '90304': '9031035', '90305': '9031036', '90401': '9031037', '90402': '9031038', '90403': '9031039', '90404': '9031040', '90405': '9031041', '90501': '9031042', '90502': '9031043', '90503': '9031044', '90504': '9031045', '90505': '9031046', '90506': '9031047', '90601': '9031048', '90602': '9031049', '90603': '9031050', '90604': '9031051', '90605': '9031052', '90606': '9031053', '90620': '9031054', '90621': '9031055', '90623': '9031056', '90630': '9031057', '90631': '9031058', '90638': '9031059', '90640': '9031061', '90650': '9031062', '90660': '9031063', '90670': '9031064', '90680': '9031065', '90701': '9031066', '90703': '9031067', '90704': '9031068', '90706': '9031069', '90710': '9031070', '90712': '9031071', '90713': '9031072', '90715': '9031073', '90716': '9031074', '90717': '9031075', '90720': '9031076', '90723': '9031077', '90731': '9031078', '90732': '9031079', '90740': '9031080', '90744': '9031082', '90745': '9031083', '90746': '9031084', '90747': '9031085', '90755': '9031086', '90802': '9031087', '90803': '9031088', '90804': '9031089', '90805': '9031090', '90806': '9031091', '90807': '9031092', '90808': '9031093', '90810': '9031094', '90813': '9031095', '90814': '9031096', '90815': '9031097', '90822': '9031098', '90831': '9031099', '90840': '9031100', '90844': '9031101', '91001': '9031102', '91006': '9031103', '91007': '9031104', '91008': '9031105', '91010': '9031106', '91011': '9031107', '91016': '9031108', '91020': '9031109', '91024': '9031110', '91030': '9031111', '91040': '9031112', '91042': '9031113', '91101': '9031114', '91103': '9031116', '91104': '9031117', '91105': '9031118', '91106': '9031119', '91107': '9031120', '91108': '9031121', '91121': '9031123', '91124': '9031124', '91125': '9031125', '91182': '9031127', '91184': '9031128', '91188': '9031129', '91189': '9031130', '91201': '9031131', '91202': '9031132', '91203': '9031133', '91204': '9031134', '91205': '9031135', '91206': '9031136', '91207': '9031137', '91208': '9031138', '91210': '9031139', '91214': '9031140', '91301': '9031142', '91302': '9031143', '91303': '9031144', '91304': '9031145', '91306': '9031146', '91307': '9031147', '91311': '9031148', '91316': '9031149', '91320': '9031150', '91321': '9031151', '91324': '9031152', '91325': '9031153', '91326': '9031154', '91330': '9031157', '91331': '9031158', '91335': '9031159', '91340': '9031160', '91342': '9031161', '91343': '9031162', '91344': '9031163', '91345': '9031164', '91350': '9031165', '91351': '9031166', '91352': '9031167', '91354': '9031168', '91355': '9031169', '91356': '9031170', '91360': '9031172', '91361': '9031173', '91362': '9031174', '91364': '9031175', '91367': '9031176', '91377': '9031178', '91381': '9031179', '91384': '9031180', '91387': '9031181', '91390': '9031182', '91401': '9031183', '91402': '9031184', '91403': '9031185', '91405': '9031186', '91406': '9031187', '91411': '9031188', '91423': '9031189', '91436': '9031190', '91501': '9031191', '91502': '9031192', '91504': '9031193', '91505': '9031194', '91506': '9031195', '91521': '9031196', '91522': '9031197', '91523': '9031198', '91601': '9031199', '91602': '9031200', '91604': '9031201', '91605': '9031202', '91606': '9031203', '91607': '9031204', '91701': '9031206', '91702': '9031207', '91706': '9031208', '91708': '9031209', '91709': '9031210', '91710': '9031211', '91711': '9031212', '91722': '9031214', '91723': '9031215', '91724': '9031216', '91730': '9031217', '91731': '9031218', '91732': '9031219', '91733': '9031220', '91737': '9031221', '91739': '9031222', '91740': '9031223', '91741': '9031224', '91744': '9031225', '91745': '9031226', '91746': '9031227', '91748': '9031229', '91750': '9031230', '91752': '9031231', '91754': '9031232', '91755': '9031233', '91759': '9031234', '91761': '9031235', '91762': '9031236', '91763': '9031237', '91764': '9031238', '91765': '9031239', '91766': '9031240', '91767': '9031241', '91768': '9031242', '91770': '9031244', '91773': '9031245', '91775': '9031246', '91776': '9031247', '91780': '9031248', '91784': '9031249', '91786': '9031250', '91789': '9031251', '91790': '9031252', '91791': '9031253', '91792': '9031254', '91801': '9031256', '91803': '9031257', '91901': '9031258', '91902': '9031259', '91905': '9031260', '91906': '9031261', '91910': '9031262', '91911': '9031263', '91913': '9031264', '91914': '9031265', '91915': '9031266', '91916': '9031267', '91917': '9031268', '91932': '9031269', '91934': '9031270', '91935': '9031271', '91941': '9031272', '91942': '9031273', '91945': '9031274', '91948': '9031275', '91950': '9031276', '91962': '9031277', '91963': '9031278', '91977': '9031279', '91978': '9031280', '91980': '9031281', '92003': '9031282', '92004': '9031283', '92007': '9031284', '92008': '9031285', '92009': '9031286', '92010': '9031287', '92011': '9031288', '92014': '9031289', '92019': '9031290', '92020': '9031291', '92021': '9031292', '92024': '9031293', '92025': '9031294', '92026': '9031295', '92027': '9031296', '92028': '9031297', '92029': '9031298', '92036': '9031299', '92037': '9031300', '92040': '9031301', '92054': '9031302', '92056': '9031303', '92057': '9031304', '92058': '9031305', '92059': '9031306', '92060': '9031307', '92061': '9031308', '92064': '9031309', '92065': '9031310', '92066': '9031311', '92067': '9031312', '92069': '9031313', '92070': '9031314', '92071': '9031315', '92075': '9031316', '92078': '9031317', '92081': '9031318', '92082': '9031319', '92083': '9031320', '92084': '9031321', '92086': '9031322', '92091': '9031323', '92093': '9031324', '92096': '9031325', '92101': '9031326', '92102': '9031327', '92103': '9031328', '92104': '9031329', '92105': '9031330', '92106': '9031331', '92107': '9031332', '92108': '9031333', '92109': '9031334', '92110': '9031335', '92111': '9031336', '92113': '9031337', '92114': '9031338', '92115': '9031339', '92116': '9031340', '92117': '9031341', '92118': '9031342', '92119': '9031343', '92120': '9031344', '92121': '9031345', '92122': '9031346', '92123': '9031347', '92124': '9031348', '92126': '9031349', '92127': '9031350', '92128': '9031351', '92129': '9031352', '92130': '9031353', '92131': '9031354', '92132': '9031355', '92134': '9031356', '92139': '9031357', '92140': '9031358', '92145': '9031360', '92147': '9031361', '92154': '9031362', '92173': '9031363', '92182': '9031364', '92187': '9031365', '92201': '9031366', '92203': '9031367', '92210': '9031368', '92211': '9031369', '92220': '9031370', '92222': '9031371', '92223': '9031372', '92225': '9031373', '92227': '9031374', '92230': '9031375', '92231': '9031376', '92233': '9031377', '92234': '9031378', '92236': '9031379', '92239': '9031380', '92240': '9031381', '92241': '9031382', '92242': '9031383', '92243': '9031384', '92249': '9031385', '92250': '9031386', '92251': '9031387', '92252': '9031388', '92253': '9031389', '92254': '9031390', '92256': '9031391', '92257': '9031392', '92258': '9031393', '92259': '9031394', '92260': '9031395', '92262': '9031396', '92264': '9031397', '92266': '9031398', '92267': '9031399', '92268': '9031400', '92270': '9031401', '92273': '9031402', '92274': '9031403', '92275': '9031404', '92276': '9031405', '92277': '9031406', '92280': '9031407', '92281': '9031408', '92282': '9031409', '92283': '9031410', '92284': '9031411', '92285': '9031412', '92301': '9031413', '92304': '9031414', '92305': '9031415', '92307': '9031416', '92308': '9031417', '92309': '9031418', '92310': '9031419', '92311': '9031420', '92313': '9031421', '92314': '9031422', '92315': '9031423', '92316': '9031424', '92320': '9031426', '92321': '9031427', '92323': '9031428', '92324': '9031429', '92325': '9031430', '92327': '9031431', '92328': '9031432', '92332': '9031433', '92333': '9031434', '92335': '9031435', '92336': '9031436', '92337': '9031437', '92339': '9031438', '92341': '9031439', '92342': '9031440', '92344': '9031441', '92345': '9031442', '92346': '9031443', '92347': '9031444', '92350': '9031445', '92352': '9031446', '92354': '9031447', '92356': '9031448', '92358': '9031449', '92359': '9031450', '92363': '9031451', '92364': '9031452', '92365': '9031453', '92368': '9031454', '92371': '9031455', '92372': '9031456', '92373': '9031457', '92374': '9031458', '92376': '9031459', '92377': '9031460', '92378': '9031461', '92382': '9031462', '92384': '9031463', '92386': '9031464', '92389': '9031465', '92391': '9031466', '92392': '9031467', '92394': '9031468', '92395': '9031469', '92397': '9031470', '92398': '9031471', '92399': '9031472', '92401': '9031473', '92404': '9031475', '92405': '9031476', '92407': '9031477', '92408': '9031478', '92410': '9031479', '92411': '9031480', '92415': '9031481', '92418': '9031482', '92501': '9031483', '92503': '9031484', '92504': '9031485', '92505': '9031486', '92506': '9031487', '92507': '9031488', '92508': '9031489', '92509': '9031490', '92518': '9031491', '92530': '9031493', '92532': '9031494', '92536': '9031495', '92539': '9031496', '92543': '9031497', '92544': '9031498', '92545': '9031499', '92548': '9031500', '92549': '9031501', '92551': '9031502', '92553': '9031503', '92555': '9031504', '92557': '9031505', '92561': '9031506', '92562': '9031507', '92563': '9031508', '92567': '9031509', '92570': '9031510', '92571': '9031511', '92582': '9031512', '92583': '9031513', '92584': '9031514', '92585': '9031515', '92586': '9031516', '92587': '9031517', '92590': '9031518', '92591': '9031519', '92592': '9031520', '92595': '9031521', '92596': '9031522', '92602': '9031523', '92603': '9031524', '92604': '9031525', '92606': '9031526', '92610': '9031527', '92612': '9031528', '92614': '9031529', '92617': '9031531', '92618': '9031532', '92620': '9031533', '92624': '9031534', '92625': '9031535', '92626': '9031536', '92627': '9031537', '92629': '9031538', '92630': '9031539', '92637': '9031540', '92646': '9031541', '92647': '9031542', '92648': '9031543', '92649': '9031544', '92651': '9031545', '92653': '9031546', '92655': '9031547', '92656': '9031548', '92657': '9031549', '92660': '9031550', '92661': '9031551', '92662': '9031552', '92663': '9031553', '92672': '9031554', '92673': '9031555', '92675': '9031556', '92676': '9031557', '92677': '9031558', '92679': '9031560', '92683': '9031561', '92688': '9031562', '92691': '9031563', '92692': '9031564', '92694': '9031565', '92697': '9031566', '92701': '9031567', '92703': '9031568', '92704': '9031569', '92705': '9031570', '92706': '9031571', '92707': '9031572', '92708': '9031573', '92780': '9031574', '92782': '9031575', '92799': '9031576', '92801': '9031577', '92802': '9031578', '92804': '9031579', '92805': '9031580', '92806': '9031581', '92807': '9031582', '92808': '9031583', '92821': '9031584', '92823': '9031585', '92831': '9031586', '92832': '9031587', '92833': '9031588', '92835': '9031589', '92840': '9031590', '92841': '9031591', '92843': '9031592', '92844': '9031593', '92845': '9031594', '92860': '9031595', '92861': '9031596', '92865': '9031597', '92866': '9031598', '92867': '9031599', '92868': '9031600', '92869': '9031601', '92870': '9031602', '92879': '9031604', '92880': '9031605', '92881': '9031606', '92882': '9031607', '92883': '9031608', '92886': '9031610', '92887': '9031611', '92899': '9031612', '93001': '9031613', '93003': '9031614', '93004': '9031615', '93009': '9031616', '93010': '9031617', '93012': '9031618', '93013': '9031619', '93015': '9031620', '93021': '9031621', '93022': '9031622', '93023': '9031623', '93030': '9031624', '93033': '9031625', '93035': '9031626', '93036': '9031627', '93040': '9031628', '93041': '9031629', '93042': '9031630', '93060': '9031631', '93063': '9031632', '93064': '9031633', '93065': '9031634', '93066': '9031635', '93101': '9031637', '93103': '9031638', '93105': '9031639', '93108': '9031641', '93109': '9031642', '93110': '9031643', '93111': '9031644', '93117': '9031645', '93199': '9031646', '93201': '9031647', '93202': '9031648', '93203': '9031649', '93204': '9031650', '93205': '9031651', '93206': '9031652', '93207': '9031653', '93208': '9031654', '93210': '9031655', '93212': '9031656', '93215': '9031657', '93218': '9031658', '93219': '9031659', '93220': '9031660', '93221': '9031661', '93222': '9031662', '93223': '9031663', '93224': '9031664', '93225': '9031665', '93226': '9031666', '93230': '9031667', '93234': '9031668', '93235': '9031669', '93238': '9031670', '93239': '9031671', '93240': '9031672', '93241': '9031673', '93242': '9031674', '93243': '9031675', '93244': '9031676', '93245': '9031677', '93246': '9031678', '93247': '9031679', '93249': '9031680', '93250': '9031681', '93251': '9031682', '93252': '9031683', '93254': '9031684', '93255': '9031685', '93256': '9031686', '93257': '9031687', '93260': '9031688', '93261': '9031689', '93262': '9031690', '93263': '9031691', '93265': '9031692', '93266': '9031693', '93267': '9031694', '93268': '9031695', '93270': '9031696', '93271': '9031697', '93272': '9031698', '93274': '9031699', '93276': '9031700', '93277': '9031701', '93280': '9031702', '93283': '9031703', '93285': '9031704', '93286': '9031705', '93287': '9031706', '93291': '9031707', '93292': '9031708', '93301': '9031709', '93304': '9031710', '93305': '9031711', '93306': '9031712', '93307': '9031713', '93308': '9031714', '93309': '9031715', '93311': '9031716', '93312': '9031717', '93313': '9031718', '93314': '9031719', '93401': '9031721', '93402': '9031722', '93405': '9031723', '93408': '9031725', '93420': '9031726', '93422': '9031727', '93424': '9031728', '93426': '9031729', '93427': '9031730', '93428': '9031731', '93429': '9031732', '93430': '9031733', '93432': '9031734', '93433': '9031735', '93434': '9031736', '93435': '9031737', '93436': '9031738', '93437': '9031739', '93440': '9031740', '93441': '9031741', '93442': '9031742', '93444': '9031743', '93445': '9031744', '93446': '9031745', '93449': '9031747', '93450': '9031748', '93451': '9031749', '93452': '9031750', '93453': '9031751', '93454': '9031752', '93455': '9031753', '93458': '9031754', '93460': '9031755', '93461': '9031756', '93463': '9031757', '93465': '9031758', '93501': '9031759', '93505': '9031760', '93510': '9031761', '93512': '9031762', '93513': '9031763', '93514': '9031764', '93516': '9031765', '93517': '9031766', '93518': '9031767', '93522': '9031768', '93523': '9031769', '93524': '9031770', '93526': '9031771', '93527': '9031772', '93528': '9031773', '93529': '9031774', '93530': '9031775', '93531': '9031776', '93532': '9031777', '93534': '9031778', '93535': '9031779', '93536': '9031780', '93541': '9031781', '93543': '9031782', '93544': '9031783', '93545': '9031784', '93546': '9031785', '93549': '9031786', '93550': '9031787', '93551': '9031788', '93552': '9031789', '93553': '9031790', '93554': '9031791', '93555': '9031792', '93560': '9031793', '93561': '9031794', '93562': '9031795', '93563': '9031796', '93591': '9031797', '93601': '9031798', '93602': '9031799', '93603': '9031800', '93604': '9031801', '93605': '9031802', '93608': '9031804', '93609': '9031805', '93610': '9031806', '93611': '9031807', '93612': '9031808', '93614': '9031809', '93615': '9031810', '93616': '9031811', '93618': '9031812', '93619': '9031813', '93620': '9031814', '93621': '9031815', '93622': '9031816', '93623': '9031817', '93624': '9031818', '93625': '9031819', '93626': '9031820', '93627': '9031821', '93628': '9031822', '93630': '9031823', '93631': '9031824', '93634': '9031825', '93635': '9031826', '93636': '9031827', '93637': '9031828', '93638': '9031829', '93640': '9031830', '93641': '9031831', '93643': '9031832', '93644': '9031833', '93645': '9031834', '93646': '9031835', '93647': '9031836', '93648': '9031837', '93650': '9031838', '93651': '9031839', '93652': '9031840', '93653': '9031841', '93654': '9031842', '93656': '9031843', '93657': '9031844', '93660': '9031845', '93662': '9031846', '93664': '9031847', '93667': '9031849', '93668': '9031850', '93669': '9031851', '93675': '9031853', '93701': '9031854', '93702': '9031855', '93703': '9031856', '93704': '9031857', '93705': '9031858', '93706': '9031859', '93710': '9031860', '93711': '9031861', '93720': '9031862', '93721': '9031863', '93722': '9031864', '93723': '9031865', '93725': '9031866', '93726': '9031867', '93727': '9031868', '93728': '9031869', '93730': '9031870', '93750': '9031872', '93760': '9031873', '93761': '9031874', '93764': '9031875', '93765': '9031876', '93786': '9031877', '93888': '9031878', '93901': '9031879', '93905': '9031880', '93906': '9031881', '93907': '9031882', '93908': '9031883', '93920': '9031884', '93923': '9031886', '93924': '9031887', '93925': '9031888', '93926': '9031889', '93927': '9031890', '93928': '9031891', '93930': '9031892', '93932': '9031893', '93933': '9031894', '93940': '9031895', '93943': '9031896', '93944': '9031897', '93950': '9031898', '93953': '9031899', '93954': '9031900', '93955': '9031901', '93960': '9031902', '94002': '9031903', '94005': '9031904', '94010': '9031905', '94014': '9031906', '94015': '9031907', '94019': '9031909', '94020': '9031910', '94021': '9031911', '94022': '9031912', '94024': '9031913', '94025': '9031914', '94027': '9031915', '94028': '9031916', '94030': '9031917', '94037': '9031919', '94038': '9031920', '94040': '9031921', '94041': '9031922', '94043': '9031923', '94044': '9031924', '94060': '9031925', '94061': '9031926', '94062': '9031927', '94063': '9031928', '94065': '9031929', '94066': '9031930', '94070': '9031931', '94074': '9031932', '94080': '9031933', '94085': '9031934', '94086': '9031935', '94087': '9031936', '94089': '9031937', '94102': '9031938', '94103': '9031939', '94104': '9031940', '94105': '9031941', '94107': '9031942', '94108': '9031943', '94109': '9031944', '94110': '9031945', '94111': '9031946', '94112': '9031947', '94114': '9031948', '94115': '9031949', '94116': '9031950', '94117': '9031951', '94118': '9031952', '94121': '9031953', '94122': '9031954', '94123': '9031955', '94124': '9031956', '94127': '9031957', '94128': '9031958', '94129': '9031959', '94130': '9031960', '94131': '9031961', '94132': '9031962', '94133': '9031963', '94134': '9031964', '94143': '9031965', '94158': '9031966', '94301': '9031967', '94303': '9031968', '94304': '9031969', '94305': '9031970', '94306': '9031971', '94401': '9031972', '94402': '9031973', '94403': '9031974', '94404': '9031975', '94497': '9031976', '94501': '9031977', '94502': '9031978', '94503': '9031979', '94505': '9031980', '94506': '9031981', '94507': '9031982', '94508': '9031983', '94509': '9031984', '94510': '9031985', '94511': '9031986', '94512': '9031987', '94513': '9031988', '94514': '9031989', '94515': '9031990', '94516': '9031991', '94517': '9031992', '94518': '9031993', '94519': '9031994', '94520': '9031995', '94521': '9031996', '94523': '9031997', '94525': '9031998', '94526': '9031999', '94530': '9032001', '94531': '9032002', '94533': '9032003', '94534': '9032004', '94535': '9032005', '94536': '9032006', '94538': '9032007', '94539': '9032008', '94541': '9032009', '94542': '9032010', '94544': '9032011', '94545': '9032012', '94546': '9032013', '94547': '9032014', '94549': '9032015', '94550': '9032016', '94551': '9032017', '94552': '9032018', '94553': '9032019', '94555': '9032020', '94556': '9032021', '94558': '9032022', '94559': '9032023', '94560': '9032024', '94561': '9032025', '94563': '9032027', '94564': '9032028', '94565': '9032029', '94566': '9032030', '94567': '9032031', '94568': '9032032', '94569': '9032033', '94571': '9032034', '94572': '9032035', '94573': '9032036', '94574': '9032037', '94576': '9032038', '94577': '9032039', '94578': '9032040', '94579': '9032041', '94580': '9032042', '94582': '9032043', '94583': '9032044', '94585': '9032045', '94586': '9032046', '94587': '9032047', '94588': '9032048', '94589': '9032049', '94590': '9032050', '94591': '9032051', '94592': '9032052', '94595': '9032053', '94596': '9032054', '94597': '9032055', '94598': '9032056', '94599': '9032057', '94601': '9032058', '94602': '9032059', '94603': '9032060', '94605': '9032061', '94606': '9032062', '94607': '9032063', '94608': '9032064', '94609': '9032065', '94610': '9032066', '94611': '9032067', '94612': '9032068', '94615': '9032069', '94618': '9032070', '94619': '9032071', '94621': '9032072', '94660': '9032073', '94702': '9032074', '94703': '9032075', '94704': '9032076', '94705': '9032077', '94706': '9032078', '94707': '9032079', '94708': '9032080', '94709': '9032081', '94710': '9032082', '94720': '9032083', '94801': '9032084', '94803': '9032085', '94804': '9032086', '94805': '9032087', '94806': '9032088', '94901': '9032089', '94903': '9032090', '94904': '9032091', '94920': '9032092', '94922': '9032093', '94923': '9032094', '94924': '9032095', '94925': '9032096', '94928': '9032097', '94929': '9032098', '94930': '9032099', '94931': '9032100', '94937': '9032101', '94938': '9032102', '94939': '9032103', '94940': '9032104', '94941': '9032105', '94945': '9032106', '94946': '9032107', '94947': '9032108', '94949': '9032109', '94950': '9032110', '94951': '9032111', '94952': '9032112', '94954': '9032113', '94956': '9032114', '94957': '9032115', '94960': '9032116', '94963': '9032117', '94964': '9032118', '94965': '9032119', '94970': '9032121', '94971': '9032122', '94972': '9032123', '94973': '9032124', '95002': '9032126', '95003': '9032127', '95004': '9032128', '95005': '9032129', '95006': '9032130', '95008': '9032131', '95010': '9032132', '95012': '9032134', '95014': '9032135', '95017': '9032136', '95018': '9032137', '95019': '9032138', '95020': '9032139', '95023': '9032140', '95030': '9032141', '95032': '9032142', '95033': '9032143', '95035': '9032144', '95037': '9032145', '95039': '9032146', '95043': '9032148', '95045': '9032149', '95046': '9032150', '95050': '9032151', '95051': '9032152', '95053': '9032153', '95054': '9032154', '95060': '9032155', '95062': '9032156', '95064': '9032158', '95065': '9032159', '95066': '9032160', '95070': '9032161', '95073': '9032162', '95075': '9032163', '95076': '9032164', '95101': '9032165', '95110': '9032166', '95111': '9032167', '95112': '9032168', '95113': '9032169', '95116': '9032170', '95117': '9032171', '95118': '9032172', '95119': '9032173', '95120': '9032174', '95121': '9032175', '95122': '9032176', '95123': '9032177', '95124': '9032178', '95125': '9032179', '95126': '9032180', '95127': '9032181', '95128': '9032182', '95129': '9032183', '95130': '9032184', '95131': '9032185', '95132': '9032186', '95133': '9032187', '95134': '9032188', '95135': '9032189', '95136': '9032190', '95138': '9032191', '95139': '9032192', '95140': '9032193', '95148': '9032194', '95190': '9032195', '95191': '9032196', '95196': '9032197', '95202': '9032198', '95203': '9032199', '95204': '9032200', '95205': '9032201', '95206': '9032202', '95207': '9032203', '95209': '9032204', '95210': '9032205', '95211': '9032206', '95212': '9032207', '95215': '9032209', '95219': '9032210', '95220': '9032211', '95222': '9032213', '95223': '9032214', '95224': '9032215', '95226': '9032216', '95227': '9032217', '95228': '9032218', '95230': '9032219', '95231': '9032220', '95232': '9032221', '95236': '9032222', '95237': '9032223', '95240': '9032224', '95242': '9032225', '95245': '9032226', '95246': '9032227', '95247': '9032228', '95249': '9032229', '95251': '9032230', '95252': '9032231', '95254': '9032232', '95255': '9032233', '95257': '9032234', '95258': '9032235', '95301': '9032236', '95303': '9032237', '95304': '9032238', '95305': '9032239', '95306': '9032240', '95307': '9032241', '95310': '9032242', '95311': '9032243', '95313': '9032245', '95315': '9032246', '95316': '9032247', '95317': '9032248', '95318': '9032249', '95320': '9032251', '95321': '9032252', '95322': '9032253', '95323': '9032254', '95324': '9032255', '95325': '9032256', '95326': '9032257', '95327': '9032258', '95328': '9032259', '95329': '9032260', '95330': '9032261', '95333': '9032262', '95334': '9032263', '95335': '9032264', '95336': '9032265', '95337': '9032266', '95338': '9032267', '95340': '9032268', '95341': '9032269', '95343': '9032270', '95345': '9032271', '95346': '9032272', '95348': '9032273', '95350': '9032274', '95351': '9032275', '95354': '9032276', '95355': '9032277', '95356': '9032278', '95357': '9032279', '95358': '9032280', '95360': '9032281', '95361': '9032282', '95363': '9032283', '95364': '9032284', '95365': '9032285', '95366': '9032286', '95367': '9032287', '95368': '9032288', '95369': '9032289', '95370': '9032290', '95372': '9032291', '95374': '9032292', '95375': '9032293', '95376': '9032294', '95377': '9032295', '95379': '9032296', '95380': '9032297', '95382': '9032298', '95383': '9032299', '95385': '9032300', '95386': '9032301', '95387': '9032302', '95388': '9032303', '95389': '9032304', '95391': '9032305', '95401': '9032306', '95403': '9032308', '95404': '9032309', '95405': '9032310', '95407': '9032311', '95409': '9032312', '95410': '9032313', '95412': '9032314', '95415': '9032315', '95417': '9032316', '95420': '9032318', '95421': '9032319', '95422': '9032320', '95423': '9032321', '95425': '9032322', '95427': '9032324', '95428': '9032325', '95429': '9032326', '95430': '9032327', '95432': '9032328', '95436': '9032330', '95437': '9032331', '95439': '9032332', '95441': '9032333', '95442': '9032334', '95443': '9032335', '95444': '9032336', '95445': '9032337', '95446': '9032338', '95448': '9032339', '95449': '9032340', '95450': '9032341', '95451': '9032342', '95452': '9032343', '95453': '9032344', '95454': '9032345', '95456': '9032346', '95457': '9032347', '95458': '9032348', '95459': '9032349', '95460': '9032350', '95461': '9032351', '95462': '9032352', '95464': '9032353', '95465': '9032354', '95466': '9032355', '95467': '9032356', '95468': '9032357', '95469': '9032358', '95470': '9032359', '95472': '9032360', '95476': '9032361', '95480': '9032362', '95482': '9032363', '95485': '9032364', '95488': '9032365', '95490': '9032366', '95492': '9032367', '95493': '9032368', '95494': '9032369', '95501': '9032371', '95503': '9032372', '95511': '9032373', '95514': '9032374', '95519': '9032375', '95521': '9032376', '95524': '9032377', '95525': '9032378', '95526': '9032379', '95527': '9032380', '95528': '9032381', '95531': '9032382', '95532': '9032383', '95536': '9032384', '95540': '9032386', '95542': '9032387', '95543': '9032388', '95545': '9032389', '95546': '9032390', '95547': '9032391', '95548': '9032392', '95549': '9032393', '95550': '9032394', '95551': '9032395', '95552': '9032396', '95553': '9032397', '95554': '9032398', '95555': '9032399', '95556': '9032400', '95558': '9032401', '95560': '9032402', '95562': '9032403', '95563': '9032404', '95564': '9032405', '95565': '9032406', '95567': '9032407', '95568': '9032408', '95569': '9032409', '95570': '9032410', '95571': '9032411', '95573': '9032412', '95585': '9032413', '95587': '9032414', '95589': '9032415', '95595': '9032416', '95601': '9032417', '95602': '9032418', '95603': '9032419', '95605': '9032421', '95606': '9032422', '95607': '9032423', '95608': '9032424', '95610': '9032425', '95612': '9032426', '95614': '9032428', '95615': '9032429', '95616': '9032430', '95618': '9032432', '95619': '9032433', '95620': '9032434', '95621': '9032435', '95623': '9032436', '95624': '9032437', '95626': '9032439', '95627': '9032440', '95628': '9032441', '95629': '9032442', '95630': '9032443', '95631': '9032444', '95632': '9032445', '95633': '9032446', '95634': '9032447', '95635': '9032448', '95636': '9032449', '95637': '9032450', '95638': '9032451', '95640': '9032452', '95641': '9032453', '95642': '9032454', '95645': '9032455', '95646': '9032456', '95648': '9032457', '95650': '9032458', '95651': '9032459', '95652': '9032460', '95653': '9032461', '95655': '9032462', '95658': '9032463', '95659': '9032464', '95660': '9032465', '95661': '9032466', '95662': '9032467', '95663': '9032468', '95664': '9032469', '95665': '9032470', '95666': '9032471', '95667': '9032472', '95668': '9032473', '95669': '9032474', '95670': '9032475', '95672': '9032476', '95673': '9032477', '95674': '9032478', '95675': '9032479', '95676': '9032480', '95677': '9032481', '95678': '9032482', '95681': '9032483', '95682': '9032484', '95683': '9032485', '95684': '9032486', '95685': '9032487', '95686': '9032488', '95687': '9032489', '95688': '9032490', '95689': '9032491', '95690': '9032492', '95691': '9032493', '95692': '9032494', '95693': '9032495', '95694': '9032496', '95695': '9032497', '95698': '9032499', '95701': '9032501', '95703': '9032502', '95709': '9032503', '95713': '9032504', '95714': '9032505', '95715': '9032506', '95717': '9032507', '95720': '9032508', '95721': '9032509', '95722': '9032510', '95726': '9032511', '95728': '9032512', '95735': '9032513', '95742': '9032514', '95746': '9032515', '95747': '9032516', '95757': '9032517', '95758': '9032518', '95762': '9032519', '95765': '9032520', '95776': '9032521', '95811': '9032523', '95814': '9032524', '95815': '9032525', '95816': '9032526', '95817': '9032527', '95818': '9032528', '95819': '9032529', '95820': '9032530', '95821': '9032531', '95822': '9032532', '95823': '9032533', '95824': '9032534', '95825': '9032535', '95826': '9032536', '95827': '9032537', '95828': '9032538', '95829': '9032539', '95830': '9032540', '95831': '9032541', '95832': '9032542', '95833': '9032543', '95834': '9032544', '95835': '9032545', '95836': '9032546', '95837': '9032547', '95838': '9032548', '95841': '9032549', '95842': '9032550', '95843': '9032551', '95864': '9032552', '95867': '9032553', '95894': '9032554', '95901': '9032555', '95903': '9032556', '95910': '9032557', '95912': '9032558', '95914': '9032559', '95916': '9032560', '95917': '9032561', '95918': '9032562', '95919': '9032563', '95920': '9032564', '95922': '9032565', '95923': '9032566', '95925': '9032567', '95926': '9032568', '95928': '9032569', '95930': '9032571', '95932': '9032572', '95934': '9032573', '95935': '9032574', '95936': '9032575', '95937': '9032576', '95938': '9032577', '95939': '9032578', '95941': '9032579', '95942': '9032580', '95943': '9032581', '95944': '9032582', '95945': '9032583', '95946': '9032584', '95947': '9032585', '95948': '9032586', '95949': '9032587', '95950': '9032588', '95951': '9032589', '95953': '9032590', '95954': '9032591', '95955': '9032592', '95956': '9032593', '95957': '9032594', '95959': '9032596', '95960': '9032597', '95961': '9032598', '95962': '9032599', '95963': '9032600', '95965': '9032601', '95966': '9032602', '95968': '9032603', '95969': '9032604', '95970': '9032605', '95971': '9032606', '95972': '9032607', '95973': '9032608', '95974': '9032609', '95975': '9032610', '95977': '9032611', '95978': '9032612', '95979': '9032613', '95981': '9032614', '95982': '9032615', '95983': '9032616', '95984': '9032617', '95986': '9032618', '95987': '9032619', '95988': '9032620', '95991': '9032621', '95993': '9032622', '96001': '9032623', '96002': '9032624', '96003': '9032625', '96006': '9032626', '96007': '9032627', '96008': '9032628', '96009': '9032629', '96010': '9032630', '96011': '9032631', '96013': '9032632', '96014': '9032633', '96015': '9032634', '96016': '9032635', '96017': '9032636', '96019': '9032637', '96020': '9032638', '96021': '9032639', '96022': '9032640', '96023': '9032641', '96024': '9032642', '96025': '9032643', '96027': '9032644', '96028': '9032645', '96029': '9032646', '96031': '9032647', '96032': '9032648', '96033': '9032649', '96034': '9032650', '96035': '9032651', '96038': '9032652', '96039': '9032653', '96040': '9032654', '96041': '9032655', '96044': '9032656', '96046': '9032657', '96047': '9032658', '96048': '9032659', '96050': '9032660', '96051': '9032661', '96052': '9032662', '96054': '9032663', '96055': '9032664', '96056': '9032665', '96057': '9032666', '96058': '9032667', '96059': '9032668', '96061': '9032669', '96062': '9032670', '96063': '9032671', '96064': '9032672', '96065': '9032673', '96067': '9032674', '96068': '9032675', '96069': '9032676', '96071': '9032677', '96073': '9032678', '96074': '9032679', '96075': '9032680', '96076': '9032681', '96080': '9032682', '96084': '9032683', '96085': '9032684', '96086': '9032685', '96087': '9032686', '96088': '9032687', '96090': '9032689', '96091': '9032690', '96092': '9032691', '96093': '9032692', '96094': '9032693', '96096': '9032694', '96097': '9032695', '96101': '9032696', '96103': '9032697', '96104': '9032698', '96105': '9032699', '96106': '9032700', '96107': '9032701', '96108': '9032702', '96109': '9032703', '96110': '9032704', '96112': '9032705', '96113': '9032706', '96114': '9032707', '96115': '9032708', '96116': '9032709', '96117': '9032710', '96118': '9032711', '96119': '9032712', '96120': '9032713', '96121': '9032714', '96122': '9032715', '96123': '9032716', '96124': '9032717', '96125': '9032718', '96126': '9032719', '96128': '9032720', '96129': '9032721', '96130': '9032722', '96132': '9032723', '96133': '9032724', '96134': '9032725', '96136': '9032726', '96137': '9032727', '96140': '9032728', '96141': '9032729', '96142': '9032730', '96143': '9032731', '96145': '9032732', '96146': '9032733', '96148': '9032734', '96150': '9032735', '96161': '9032737', '96701': '9032739', '96704': '9032740', '96705': '9032741', '96706': '9032742', '96707': '9032743', '96708': '9032744', '96712': '9032745', '96713': '9032746', '96714': '9032747', '96716': '9032748', '96717': '9032749', '96719': '9032750', '96720': '9032751', '96722': '9032752', '96725': '9032753', '96727': '9032754', '96729': '9032755', '96730': '9032756', '96731': '9032757', '96732': '9032758', '96734': '9032759', '96737': '9032760', '96738': '9032761', '96740': '9032762', '96741': '9032763', '96742': '9032764', '96743': '9032765', '96744': '9032766', '96746': '9032767', '96748': '9032768', '96749': '9032769', '96750': '9032770', '96752': '9032771', '96753': '9032772', '96754': '9032773', '96755': '9032774', '96756': '9032775', '96757': '9032776', '96760': '9032777', '96761': '9032778', '96762': '9032779', '96763': '9032780', '96764': '9032781', '96766': '9032783', '96768': '9032784', '96769': '9032785', '96770': '9032786', '96771': '9032787', '96772': '9032788', '96773': '9032789', '96774': '9032790', '96776': '9032791', '96777': '9032792', '96778': '9032793', '96779': '9032794', '96780': '9032795', '96782': '9032796', '96783': '9032797', '96785': '9032798', '96786': '9032799', '96789': '9032800', '96790': '9032801', '96791': '9032802', '96792': '9032803', '96793': '9032804', '96795': '9032805', '96796': '9032806', '96797': '9032807', '96813': '9032808', '96814': '9032809', '96815': '9032810', '96816': '9032811', '96817': '9032812', '96818': '9032813', '96819': '9032814', '96821': '9032815', '96822': '9032816', '96825': '9032817', '96826': '9032818', '96850': '9032820', '96857': '9032821', '97001': '9032823', '97002': '9032824', '97004': '9032825', '97005': '9032826', '97006': '9032827', '97007': '9032828', '97008': '9032829', '97009': '9032830', '97010': '9032831', '97011': '9032832', '97013': '9032833', '97014': '9032834', '97015': '9032835', '97016': '9032836', '97017': '9032837', '97018': '9032838', '97019': '9032839', '97020': '9032840', '97021': '9032841', '97022': '9032842', '97023': '9032843', '97024': '9032844', '97026': '9032845', '97027': '9032846', '97028': '9032847', '97029': '9032848', '97030': '9032849', '97031': '9032850', '97032': '9032851', '97033': '9032852', '97034': '9032853', '97035': '9032854', '97037': '9032856', '97038': '9032857', '97039': '9032858', '97040': '9032859', '97041': '9032860', '97042': '9032861', '97045': '9032862', '97048': '9032863', '97049': '9032864', '97050': '9032865', '97051': '9032866', '97053': '9032867', '97054': '9032868', '97055': '9032869', '97056': '9032870', '97058': '9032871', '97060': '9032872', '97062': '9032873', '97063': '9032874', '97064': '9032875', '97065': '9032876', '97067': '9032877', '97068': '9032878', '97070': '9032879', '97071': '9032880', '97080': '9032882', '97086': '9032883', '97089': '9032884', '97101': '9032885', '97102': '9032886', '97103': '9032887', '97106': '9032888', '97107': '9032889', '97108': '9032890', '97109': '9032891', '97110': '9032892', '97111': '9032893', '97112': '9032894', '97113': '9032895', '97114': '9032896', '97115': '9032897', '97116': '9032898', '97117': '9032899', '97118': '9032900', '97119': '9032901', '97121': '9032902', '97122': '9032903', '97123': '9032904', '97124': '9032905', '97125': '9032906', '97127': '9032907', '97128': '9032908', '97130': '9032909', '97131': '9032910', '97132': '9032911', '97133': '9032912', '97135': '9032913', '97136': '9032914', '97137': '9032915', '97138': '9032916', '97140': '9032917', '97141': '9032918', '97144': '9032919', '97145': '9032920', '97146': '9032921', '97147': '9032922', '97148': '9032923', '97149': '9032924', '97201': '9032925', '97202': '9032926', '97203': '9032927', '97204': '9032928', '97205': '9032929', '97206': '9032930', '97209': '9032933', '97210': '9032934', '97211': '9032935', '97212': '9032936', '97213': '9032937', '97214': '9032938', '97215': '9032939', '97216': '9032940', '97217': '9032941', '97218': '9032942', '97219': '9032943', '97220': '9032944', '97221': '9032945', '97222': '9032946', '97223': '9032947', '97224': '9032948', '97225': '9032949', '97227': '9032950', '97229': '9032951', '97230': '9032952', '97231': '9032953', '97232': '9032954', '97233': '9032955', '97236': '9032956', '97239': '9032957', '97258': '9032958', '97266': '9032959', '97267': '9032960', '97301': '9032963', '97302': '9032964', '97303': '9032965', '97304': '9032966', '97305': '9032967', '97306': '9032968', '97310': '9032969', '97312': '9032970', '97317': '9032971', '97321': '9032972', '97322': '9032973', '97324': '9032974', '97325': '9032975', '97326': '9032976', '97327': '9032977', '97329': '9032978', '97330': '9032979', '97331': '9032980', '97333': '9032981', '97338': '9032982', '97341': '9032984', '97342': '9032985', '97343': '9032986', '97344': '9032987', '97345': '9032988', '97346': '9032989', '97347': '9032990', '97348': '9032991', '97350': '9032992', '97351': '9032993', '97352': '9032994', '97355': '9032995', '97357': '9032996', '97358': '9032997', '97360': '9032998', '97361': '9032999', '97362': '9033000', '97364': '9033001', '97365': '9033002', '97366': '9033003', '97367': '9033004', '97368': '9033005', '97369': '9033006', '97370': '9033007', '97371': '9033008', '97374': '9033009', '97375': '9033010', '97376': '9033011', '97377': '9033012', '97378': '9033013', '97380': '9033014', '97381': '9033015', '97383': '9033016', '97385': '9033017', '97386': '9033018', '97388': '9033019', '97389': '9033020', '97390': '9033021', '97391': '9033022', '97392': '9033023', '97394': '9033024', '97396': '9033025', '97401': '9033026', '97402': '9033027', '97403': '9033028', '97404': '9033029', '97405': '9033030', '97406': '9033031', '97407': '9033032', '97408': '9033033', '97410': '9033034', '97411': '9033035', '97412': '9033036', '97413': '9033037', '97414': '9033038', '97415': '9033039', '97416': '9033040', '97417': '9033041', '97419': '9033042', '97420': '9033043', '97423': '9033044', '97424': '9033045', '97426': '9033047', '97429': '9033049', '97430': '9033050', '97431': '9033051', '97434': '9033052', '97435': '9033053', '97436': '9033054', '97437': '9033055', '97438': '9033056', '97439': '9033057', '97441': '9033058', '97442': '9033059', '97443': '9033060', '97444': '9033061', '97446': '9033062', '97447': '9033063', '97448': '9033064', '97449': '9033065', '97450': '9033066', '97451': '9033067', '97452': '9033068', '97453': '9033069', '97454': '9033070', '97455': '9033071', '97456': '9033072', '97457': '9033073', '97458': '9033074', '97459': '9033075', '97461': '9033076', '97462': '9033077', '97463': '9033078', '97465': '9033079', '97466': '9033080', '97467': '9033081', '97469': '9033082', '97470': '9033083', '97471': '9033084', '97473': '9033085', '97476': '9033086', '97477': '9033087', '97478': '9033088', '97479': '9033089', '97480': '9033090', '97481': '9033091', '97484': '9033092', '97486': '9033093', '97487': '9033094', '97488': '9033095', '97489': '9033096', '97490': '9033097', '97492': '9033098', '97493': '9033099', '97495': '9033100', '97496': '9033101', '97497': '9033102', '97498': '9033103', '97499': '9033104', '97501': '9033105', '97502': '9033106', '97503': '9033107', '97504': '9033108', '97520': '9033109', '97522': '9033110', '97523': '9033111', '97524': '9033112', '97525': '9033113', '97526': '9033114', '97527': '9033115', '97530': '9033116', '97531': '9033117', '97532': '9033118', '97534': '9033119', '97535': '9033120', '97536': '9033121', '97537': '9033122', '97538': '9033123', '97539': '9033124', '97540': '9033125', '97541': '9033126', '97543': '9033127', '97544': '9033128', '97601': '9033129', '97603': '9033130', '97604': '9033131', '97620': '9033132', '97621': '9033133', '97622': '9033134', '97623': '9033135', '97624': '9033136', '97625': '9033137', '97626': '9033138', '97627': '9033139', '97630': '9033140', '97632': '9033141', '97633': '9033142', '97634': '9033143', '97635': '9033144', '97636': '9033145', '97637': '9033146', '97638': '9033147', '97639': '9033148', '97640': '9033149', '97641': '9033150', '97701': '9033151', '97702': '9033152', '97707': '9033153', '97710': '9033154', '97711': '9033155', '97712': '9033156', '97720': '9033157', '97721': '9033158', '97722': '9033159', '97730': '9033160', '97731': '9033161', '97732': '9033162', '97733': '9033163', '97734': '9033164', '97735': '9033165', '97736': '9033166', '97737': '9033167', '97738': '9033168', '97739': '9033169', '97741': '9033170', '97750': '9033171', '97751': '9033172', '97752': '9033173', '97753': '9033174', '97754': '9033175', '97756': '9033176', '97758': '9033177', '97759': '9033178', '97760': '9033179', '97761': '9033180', '97801': '9033181', '97810': '9033182', '97812': '9033183', '97813': '9033184', '97814': '9033185', '97817': '9033186', '97818': '9033187', '97819': '9033188', '97820': '9033189', '97823': '9033190', '97824': '9033191', '97825': '9033192', '97826': '9033193', '97827': '9033194', '97828': '9033195', '97830': '9033196', '97833': '9033197', '97834': '9033198', '97835': '9033199', '97836': '9033200', '97837': '9033201', '97838': '9033202', '97839': '9033203', '97840': '9033204', '97841': '9033205', '97842': '9033206', '97843': '9033207', '97844': '9033208', '97845': '9033209', '97846': '9033210', '97848': '9033211', '97850': '9033212', '97856': '9033213', '97857': '9033214', '97859': '9033215', '97862': '9033216', '97864': '9033217', '97865': '9033218', '97867': '9033219', '97868': '9033220', '97869': '9033221', '97870': '9033222', '97873': '9033223', '97874': '9033224', '97875': '9033225', '97876': '9033226', '97877': '9033227', '97880': '9033228', '97882': '9033229', '97883': '9033230', '97884': '9033231', '97885': '9033232', '97886': '9033233', '97901': '9033234', '97902': '9033235', '97903': '9033236', '97904': '9033237', '97905': '9033238', '97906': '9033239', '97907': '9033240', '97908': '9033241', '97909': '9033242', '97910': '9033243', '97911': '9033244', '97913': '9033245', '97914': '9033246', '97917': '9033247', '97918': '9033248', '97920': '9033249', '98001': '9033250', '98002': '9033251', '98003': '9033252', '98004': '9033253', '98005': '9033254', '98006': '9033255', '98007': '9033256', '98008': '9033257', '98010': '9033258', '98011': '9033259', '98012': '9033260', '98014': '9033261', '98019': '9033263', '98020': '9033264', '98021': '9033265', '98022': '9033266', '98023': '9033267', '98024': '9033268', '98026': '9033269', '98027': '9033270', '98028': '9033271', '98029': '9033272', '98030': '9033273', '98031': '9033274', '98032': '9033275', '98033': '9033276', '98034': '9033277', '98036': '9033278', '98037': '9033279', '98038': '9033280', '98039': '9033281', '98040': '9033282', '98042': '9033283', '98043': '9033284', '98045': '9033285', '98047': '9033286', '98051': '9033287', '98052': '9033288', '98053': '9033289', '98055': '9033290', '98056': '9033291', '98057': '9033292', '98058': '9033293', '98059': '9033294', '98065': '9033296', '98068': '9033297', '98070': '9033298', '98072': '9033299', '98074': '9033300', '98075': '9033301', '98077': '9033302', '98087': '9033303', '98092': '9033304', '98101': '9033305', '98102': '9033306', '98103': '9033307', '98104': '9033308', '98105': '9033309', '98106': '9033310', '98107': '9033311', '98108': '9033312', '98109': '9033313', '98110': '9033314', '98112': '9033315', '98115': '9033316', '98116': '9033317', '98117': '9033318', '98118': '9033319', '98119': '9033320', '98121': '9033321', '98122': '9033322', '98125': '9033324', '98126': '9033325', '98133': '9033326', '98134': '9033327', '98136': '9033328', '98144': '9033329', '98146': '9033330', '98148': '9033331', '98154': '9033332', '98155': '9033333', '98158': '9033334', '98164': '9033335', '98166': '9033336', '98168': '9033337', '98174': '9033338', '98177': '9033339', '98178': '9033340', '98181': '9033341', '98188': '9033342', '98195': '9033343', '98198': '9033344', '98199': '9033345', '98201': '9033346', '98203': '9033347', '98204': '9033348', '98207': '9033350', '98208': '9033351', '98220': '9033352', '98221': '9033353', '98223': '9033354', '98224': '9033355', '98225': '9033356', '98226': '9033357', '98229': '9033359', '98230': '9033360', '98232': '9033361', '98233': '9033362', '98236': '9033364', '98237': '9033365', '98239': '9033367', '98240': '9033368', '98241': '9033369', '98244': '9033370', '98245': '9033371', '98247': '9033372', '98248': '9033373', '98249': '9033374', '98250': '9033375', '98251': '9033376', '98252': '9033377', '98253': '9033378', '98256': '9033380', '98257': '9033381', '98258': '9033382', '98260': '9033383', '98261': '9033384', '98262': '9033385', '98264': '9033386', '98266': '9033387', '98267': '9033388', '98270': '9033389', '98271': '9033390', '98272': '9033391', '98273': '9033392', '98274': '9033393', '98275': '9033394', '98277': '9033395', '98278': '9033396', '98279': '9033397', '98280': '9033398', '98281': '9033399', '98282': '9033400', '98283': '9033401', '98284': '9033402', '98288': '9033403', '98290': '9033404', '98292': '9033405', '98294': '9033406', '98295': '9033407', '98296': '9033408', '98303': '9033410', '98304': '9033411', '98305': '9033412', '98310': '9033413', '98311': '9033414', '98312': '9033415', '98314': '9033416', '98315': '9033417', '98320': '9033418', '98321': '9033419', '98323': '9033420', '98325': '9033421', '98326': '9033422', '98327': '9033423', '98328': '9033424', '98329': '9033425', '98330': '9033426', '98331': '9033427', '98332': '9033428', '98333': '9033429', '98335': '9033430', '98336': '9033431', '98337': '9033432', '98338': '9033433', '98339': '9033434', '98340': '9033435', '98342': '9033436', '98345': '9033437', '98346': '9033438', '98349': '9033439', '98350': '9033440', '98351': '9033441', '98354': '9033443', '98355': '9033444', '98356': '9033445', '98357': '9033446', '98358': '9033447', '98359': '9033448', '98360': '9033449', '98361': '9033450', '98362': '9033451', '98363': '9033452', '98365': '9033454', '98366': '9033455', '98367': '9033456', '98368': '9033457', '98370': '9033458', '98371': '9033459', '98372': '9033460', '98373': '9033461', '98374': '9033462', '98375': '9033463', '98376': '9033464', '98377': '9033465', '98380': '9033466', '98381': '9033467', '98382': '9033468', '98383': '9033469', '98387': '9033471', '98388': '9033472', '98390': '9033473', '98391': '9033474', '98392': '9033475', '98394': '9033476', '98396': '9033477', '98402': '9033478', '98403': '9033479', '98404': '9033480', '98405': '9033481', '98406': '9033482', '98407': '9033483', '98408': '9033484', '98409': '9033485', '98413': '9033486', '98416': '9033487', '98418': '9033488', '98421': '9033489', '98422': '9033490', '98424': '9033491', '98433': '9033492', '98438': '9033493', '98439': '9033494', '98443': '9033495', '98444': '9033496', '98445': '9033497', '98446': '9033498', '98447': '9033499', '98465': '9033500', '98466': '9033501', '98467': '9033502', '98498': '9033503', '98499': '9033504', '98501': '9033505', '98502': '9033506', '98503': '9033507', '98505': '9033509', '98506': '9033510', '98512': '9033511', '98513': '9033512', '98516': '9033513', '98520': '9033514', '98524': '9033515', '98526': '9033516', '98528': '9033517', '98531': '9033519', '98532': '9033520', '98533': '9033521', '98535': '9033522', '98536': '9033523', '98537': '9033524', '98538': '9033525', '98541': '9033527', '98542': '9033528', '98546': '9033529', '98547': '9033530', '98548': '9033531', '98550': '9033532', '98552': '9033533', '98555': '9033534', '98557': '9033535', '98560': '9033537', '98562': '9033538', '98563': '9033539', '98564': '9033540', '98568': '9033541', '98569': '9033542', '98570': '9033543', '98571': '9033544', '98572': '9033545', '98575': '9033546', '98576': '9033547', '98577': '9033548', '98579': '9033549', '98580': '9033550', '98581': '9033551', '98582': '9033552', '98584': '9033553', '98585': '9033554', '98586': '9033555', '98587': '9033556', '98588': '9033557', '98589': '9033558', '98590': '9033559', '98591': '9033560', '98592': '9033561', '98593': '9033562', '98595': '9033563', '98596': '9033564', '98597': '9033565', '98601': '9033566', '98602': '9033567', '98603': '9033568', '98604': '9033569', '98605': '9033570', '98606': '9033571', '98607': '9033572', '98610': '9033573', '98611': '9033574', '98612': '9033575', '98613': '9033576', '98614': '9033577', '98616': '9033578', '98617': '9033579', '98619': '9033580', '98620': '9033581', '98621': '9033582', '98624': '9033583', '98625': '9033584', '98626': '9033585', '98628': '9033586', '98629': '9033587', '98631': '9033588', '98632': '9033589', '98635': '9033590', '98638': '9033591', '98640': '9033592', '98641': '9033593', '98642': '9033594', '98643': '9033595', '98644': '9033596', '98645': '9033597', '98647': '9033598', '98648': '9033599', '98649': '9033600', '98650': '9033601', '98651': '9033602', '98660': '9033603', '98661': '9033604', '98662': '9033605', '98663': '9033606', '98664': '9033607', '98665': '9033608', '98670': '9033609', '98671': '9033610', '98672': '9033611', '98674': '9033612', '98675': '9033613', '98682': '9033614', '98683': '9033615', '98684': '9033616', '98685': '9033617', '98686': '9033618', '98801': '9033619', '98802': '9033620', '98812': '9033621', '98813': '9033622', '98814': '9033623', '98815': '9033624', '98816': '9033625', '98817': '9033626', '98819': '9033627', '98822': '9033629', '98823': '9033630', '98826': '9033632', '98827': '9033633', '98828': '9033634', '98830': '9033635', '98831': '9033636', '98832': '9033637', '98833': '9033638', '98834': '9033639', '98837': '9033641', '98840': '9033642', '98841': '9033643', '98843': '9033644', '98844': '9033645', '98845': '9033646', '98846': '9033647', '98847': '9033648', '98848': '9033649', '98849': '9033650', '98850': '9033651', '98851': '9033652', '98852': '9033653', '98855': '9033654', '98856': '9033655', '98857': '9033656', '98858': '9033657', '98859': '9033658', '98860': '9033659', '98862': '9033660', '98901': '9033661', '98902': '9033662', '98903': '9033663', '98908': '9033664', '98922': '9033665', '98923': '9033666', '98925': '9033667', '98926': '9033668', '98930': '9033669', '98932': '9033670', '98933': '9033671', '98934': '9033672', '98935': '9033673', '98936': '9033674', '98937': '9033675', '98938': '9033676', '98940': '9033678', '98941': '9033679', '98942': '9033680', '98944': '9033682', '98946': '9033683', '98947': '9033684', '98948': '9033685', '98950': '9033686', '98951': '9033687', '98952': '9033688', '98953': '9033689', '99001': '9033690', '99003': '9033691', '99004': '9033692', '99005': '9033693', '99006': '9033694', '99008': '9033695', '99009': '9033696', '99011': '9033697', '99012': '9033698', '99013': '9033699', '99016': '9033700', '99017': '9033701', '99018': '9033702', '99019': '9033703', '99021': '9033705', '99022': '9033706', '99023': '9033707', '99025': '9033708', '99026': '9033709', '99027': '9033710', '99029': '9033711', '99030': '9033712', '99031': '9033713', '99032': '9033714', '99033': '9033715', '99034': '9033716', '99036': '9033717', '99037': '9033718', '99040': '9033719', '99101': '9033720', '99103': '9033722', '99105': '9033723', '99109': '9033724', '99110': '9033725', '99111': '9033726', '99113': '9033727', '99114': '9033728', '99115': '9033729', '99116': '9033730', '99117': '9033731', '99118': '9033732', '99119': '9033733', '99121': '9033734', '99122': '9033735', '99123': '9033736', '99125': '9033737', '99126': '9033738', '99128': '9033739', '99129': '9033740', '99130': '9033741', '99131': '9033742', '99133': '9033743', '99134': '9033744', '99135': '9033745', '99136': '9033746', '99137': '9033747', '99138': '9033748', '99139': '9033749', '99140': '9033750', '99141': '9033751', '99143': '9033752', '99144': '9033753', '99147': '9033754', '99148': '9033755', '99150': '9033756', '99152': '9033757', '99153': '9033758', '99154': '9033759', '99155': '9033760', '99156': '9033761', '99157': '9033762', '99158': '9033763', '99159': '9033764', '99160': '9033765', '99161': '9033766', '99163': '9033767', '99166': '9033768', '99167': '9033769', '99169': '9033770', '99170': '9033771', '99171': '9033772', '99173': '9033773', '99176': '9033775', '99179': '9033776', '99180': '9033777', '99181': '9033778', '99185': '9033779', '99201': '9033780', '99202': '9033781', '99203': '9033782', '99204': '9033783', '99205': '9033784', '99206': '9033785', '99207': '9033786', '99208': '9033787', '99212': '9033788', '99216': '9033789', '99217': '9033790', '99218': '9033791', '99223': '9033792', '99224': '9033793', '99251': '9033794', '99252': '9033795', '99256': '9033796', '99258': '9033797', '99260': '9033798', '99301': '9033799', '99320': '9033800', '99321': '9033801', '99322': '9033802', '99323': '9033803', '99324': '9033804', '99326': '9033805', '99328': '9033806', '99329': '9033807', '99330': '9033808', '99335': '9033809', '99336': '9033810', '99337': '9033811', '99338': '9033812', '99341': '9033813', '99343': '9033814', '99344': '9033815', '99345': '9033816', '99346': '9033817', '99347': '9033818', '99348': '9033819', '99349': '9033820', '99350': '9033821', '99352': '9033822', '99353': '9033823', '99354': '9033824', '99356': '9033825', '99357': '9033826', '99360': '9033827', '99361': '9033828', '99362': '9033829', '99363': '9033830', '99371': '9033831', '99401': '9033832', '99402': '9033833', '99403': '9033834', '99501': '9033835', '99502': '9033836', '99503': '9033837', '99504': '9033838', '99505': '9033839', '99506': '9033840', '99507': '9033841', '99508': '9033842', '99513': '9033844', '99515': '9033845', '99516': '9033846', '99517': '9033847', '99518': '9033848', '99530': '9033849', '99540': '9033850', '99546': '9033851', '99547': '9033852', '99549': '9033853', '99550': '9033854', '99551': '9033855', '99552': '9033856', '99553': '9033857', '99554': '9033858', '99555': '9033859', '99556': '9033860', '99557': '9033861', '99558': '9033862', '99559': '9033863', '99561': '9033864', '99563': '9033865', '99564': '9033866', '99565': '9033867', '99566': '9033868', '99567': '9033869', '99568': '9033870', '99569': '9033871', '99571': '9033872', '99572': '9033873', '99573': '9033874', '99574': '9033875', '99575': '9033876', '99576': '9033877', '99577': '9033878', '99578': '9033879', '99579': '9033880', '99580': '9033881', '99581': '9033882', '99583': '9033883', '99585': '9033884', '99586': '9033885', '99587': '9033886', '99588': '9033887', '99589': '9033888', '99590': '9033889', '99591': '9033890', '99599': '9033891', '99602': '9033892', '99603': '9033893', '99604': '9033894', '99605': '9033895', '99606': '9033896', '99607': '9033897', '99609': '9033899', '99610': '9033900', '99611': '9033901', '99612': '9033902', '99613': '9033903', '99614': '9033904', '99615': '9033905', '99620': '9033906', '99621': '9033907', '99622': '9033908', '99624': '9033909', '99625': '9033910', '99626': '9033911', '99627': '9033912', '99628': '9033913', '99630': '9033914', '99631': '9033915', '99632': '9033916', '99633': '9033917', '99634': '9033918', '99636': '9033920', '99637': '9033921', '99638': '9033922', '99639': '9033923', '99640': '9033924', '99643': '9033926', '99644': '9033927', '99645': '9033928', '99647': '9033929', '99648': '9033930', '99649': '9033931', '99650': '9033932', '99651': '9033933', '99652': '9033934', '99653': '9033935', '99654': '9033936', '99655': '9033937', '99656': '9033938', '99657': '9033939', '99658': '9033940', '99659': '9033941', '99660': '9033942', '99661': '9033943', '99662': '9033944', '99663': '9033945', '99664': '9033946', '99665': '9033947', '99666': '9033948', '99667': '9033949', '99668': '9033950', '99669': '9033951', '99670': '9033952', '99671': '9033953', '99672': '9033954', '99674': '9033955', '99676': '9033957', '99677': '9033958', '99678': '9033959', '99679': '9033960', '99680': '9033961', '99681': '9033962', '99682': '9033963', '99683': '9033964', '99684': '9033965', '99685': '9033966', '99686': '9033967', '99688': '9033969', '99689': '9033970', '99690': '9033971', '99691': '9033972', '99693': '9033973', '99694': '9033974', '99695': '9033975', '99701': '9033977', '99702': '9033978', '99703': '9033979', '99704': '9033980', '99705': '9033981', '99709': '9033982', '99712': '9033983', '99714': '9033984', '99720': '9033985', '99721': '9033986', '99722': '9033987', '99723': '9033988', '99724': '9033989', '99726': '9033990', '99729': '9033992', '99730': '9033993', '99732': '9033994', '99733': '9033995', '99736': '9033996', '99737': '9033997', '99738': '9033998', '99739': '9033999', '99740': '9034000', '99741': '9034001', '99742': '9034002', '99743': '9034003', '99744': '9034004', '99745': '9034005', '99746': '9034006', '99747': '9034007', '99748': '9034008', '99749': '9034009', '99750': '9034010', '99751': '9034011', '99752': '9034012', '99753': '9034013', '99754': '9034014', '99755': '9034015', '99756': '9034016', '99757': '9034017', '99758': '9034018', '99759': '9034019', '99760': '9034020', '99761': '9034021', '99762': '9034022', '99763': '9034023', '99764': '9034024', '99765': '9034025', '99766': '9034026', '99767': '9034027', '99768': '9034028', '99769': '9034029', '99770': '9034030', '99771': '9034031', '99772': '9034032', '99773': '9034033', '99774': '9034034', '99776': '9034035', '99777': '9034036', '99778': '9034037', '99780': '9034039', '99781': '9034040', '99782': '9034041', '99783': '9034042', '99784': '9034043', '99785': '9034044', '99786': '9034045', '99788': '9034046', '99789': '9034047', '99791': '9034048', '99801': '9034049', '99820': '9034050', '99824': '9034051', '99825': '9034052', '99826': '9034053', '99827': '9034054', '99829': '9034055', '99830': '9034056', '99832': '9034057', '99833': '9034058', '99835': '9034059', '99836': '9034060', '99840': '9034061', '99841': '9034062', '99901': '9034064', '99903': '9034065', '99918': '9034066', '99919': '9034067', '99921': '9034068', '99922': '9034069', '99923': '9034070', '99925': '9034071', '99926': '9034072', '99927': '9034073', '99929': '9034074', '4642': '9053447', '4683': '9053448', '4650': '9053449', '4629': '9053450', '4674': '9053451', '4613': '9053452', '4669': '9053453', '4664': '9053454', '4469': '9053455', '4336': '9053460', '4333': '9053461', '4122': '9053462', '4109': '9053463', '3832': '9053465', '3850': '9053466', '3589': '9053467', '3593': '9053468', '3238': '9053470', '3769': '9053471', '5041': '9053473', '5762': '9053474', '5671': '9053475', '5603': '9053476', '5609': '9053477', '5868': '9053478', '4751': '9053480', '4741': '9053481', '12911': '9053484', '12961': '9053485', '12987': '9053486', '13641': '9053488', '49722': '9053490', '49826': '9053491', '49970': '9053492', '49903': '9053493', '49819': '9053494', '49877': '9053495', '54543': '9053498', '49971': '9053499', '99734': '9053501', '99790': '9053502', '99706': '9053503', '99731': '9053504', '54816': '9053505', '54536': '9053506', '55488': '9053507', '55487': '9053508', '55377': '9053509', '56393': '9053513', '56658': '9053518', '56720': '9053519', '56740': '9053520', '58452': '9053521', '56525': '9053523', '57429': '9053524', '57420': '9053525', '58644': '9053526', '57776': '9053527', '59319': '9053528', '59345': '9053529', '82842': '9053530', '82845': '9053531', '59076': '9053532', '59312': '9053533', '59273': '9053534', '59402': '9053535', '59018': '9053536', '59033': '9053537', '59418': '9053538', '59007': '9053539', '82450': '9053540', '59071': '9053542', '83433': '9053543', '83414': '9053544', '83438': '9053546', '83460': '9053547', '83256': '9053550', '83277': '9053551', '59740': '9053552', '59756': '9053553', '59640': '9053554', '83866': '9053555', '83841': '9053556', '99107': '9053557', '83825': '9053560', '59914': '9053561', '59461': '9053563', '98222': '9053565', '98348': '9053566', '98566': '9053567', '98623': '9053573', '98853': '9053576', '98829': '9053579', '99164': '9053582', '99149': '9053583', '83343': '9053585', '83348': '9053586', '96037': '9053590', '96049': '9053591', '96070': '9053592', '96095': '9053593', '95559': '9053594', '99519': '9053596', '99548': '9053597', '96728': '9053598', '96710': '9053599', '96781': '9053600', '96848': '9053601', '96860': '9053602', '96853': '9053603', '96751': '9053604', '96703': '9053605', '95463': '9053606', '95913': '9053607', '95679': '9053609', '94850': '9053611', '94999': '9053614', '94933': '9053615', '95141': '9053616', '95013': '9053617', '94613': '9053619', '94666': '9053620', '93737': '9053624', '93724': '9053625', '89711': '9053627', '96111': '9053628', '89402': '9053629', '96155': '9053630', '95248': '9053631', '95656': '9053632', '95680': '9053633', '95639': '9053634', '95724': '9053636', '96135': '9053637', '95915': '9053638', '93633': '9053639', '93592': '9053640', '93519': '9053641', '91123': '9053643', '93599': '9053647', '92403': '9053648', '92338': '9053649', '89179': '9053652', '89161': '9053653', '86411': '9053655', '86443': '9053656', '89026': '9053657', '85371': '9053658', '85343': '9053659', '85352': '9053660', '92179': '9053661', '92136': '9053663', '92155': '9053664', '91931': '9053665', '92278': '9053666', '92161': '9053667', '92055': '9053668', '92522': '9053669', '90834': '9053674', '90846': '9053676', '93043': '9053677', '93410': '9053679', '70148': '9053680', '70060': '9053681', '70743': '9053682', '70513': '9053683', '70551': '9053686', '71339': '9053687', '39630': '9053689', '71233': '9053693', '39162': '9053694', '38765': '9053695', '38739': '9053696', '38966': '9053697', '38781': '9053698', '72383': '9053699', '38776': '9053700', '38731': '9053701', '71659': '9053702', '71748': '9053703', '71745': '9053704', '71401': '9053708', '71425': '9053709', '71034': '9053711', '71828': '9053715', '71722': '9053716', '71864': '9053717', '74750': '9053720', '75641': '9053721', '71134': '9053723', '75637': '9053724', '75865': '9053726', '70556': '9053729', '70629': '9053730', '70646': '9053731', '77661': '9053732', '77431': '9053737', '77961': '9053738', '78107': '9053739', '78111': '9053740', '78677': '9053741', '73301': '9053745', '78772': '9053746', '77333': '9053749', '77341': '9053750', '75832': '9053751', '75709': '9053752', '75799': '9053753', '73455': '9053758', '76263': '9053760', '76623': '9053762', '76599': '9053764', '76461': '9053765', '76908': '9053766', '76831': '9053767', '78635': '9053768', '78135': '9053770', '78162': '9053771', '78802': '9053772', '78044': '9053773', '78049': '9053774', '78545': '9053776', '78547': '9053777', '78536': '9053778', '78360': '9053779', '78419': '9053781', '78338': '9053782', '85531': '9053784', '88028': '9053785', '88034': '9053788', '87933': '9053789', '88349': '9053791', '88323': '9053792', '88213': '9053793', '79770': '9053794', '79916': '9053795', '79942': '9053796', '79367': '9053797', '79402': '9053798', '79491': '9053799', '79240': '9053800', '79085': '9053802', '81046': '9053803', '80977': '9053804', '80950': '9053805', '80947': '9053806', '80942': '9053807', '80944': '9053808', '80946': '9053809', '80945': '9053810', '80995': '9053811', '80941': '9053812', '81011': '9053813', '81009': '9053814', '81232': '9053815', '81242': '9053817', '81124': '9053818', '81138': '9053819', '87513': '9053820', '87554': '9053821', '87523': '9053822', '87509': '9053823', '87072': '9053825', '87538': '9053826', '87750': '9053827', '87746': '9053828', '88439': '9053829', '87151': '9053830', '87051': '9053831', '87365': '9053832', '87322': '9053833', '85135': '9053834', '85143': '9053835', '85140': '9053836', '85147': '9053837', '85121': '9053838', '85141': '9053839', '85123': '9053840', '86329': '9053841', '85923': '9053843', '85912': '9053844', '86029': '9053845', '86028': '9053846', '86003': '9053847', '87499': '9053848', '81121': '9053849', '87046': '9053850', '81426': '9053851', '80479': '9053852', '84515': '9053853', '84644': '9053854', '84665': '9053855', '84638': '9053856', '84053': '9053857', '84148': '9053858', '84301': '9053859', '83233': '9053860', '84330': '9053861', '82646': '9053862', '82648': '9053863', '82638': '9053864', '80432': '9053866', '80475': '9053867', '80309': '9053868', '80271': '9053869', '80243': '9053870', '80262': '9053871', '80165': '9053872', '80551': '9053874', '82060': '9053875', '69190': '9053877', '80746': '9053878', '57782': '9053879', '57354': '9053880', '57214': '9053881', '51340': '9053883', '68749': '9053884', '68738': '9053885', '68175': '9053886', '68362': '9053887', '68954': '9053888', '68452': '9053889', '69171': '9053890', '68969': '9053891', '68923': '9053892', '67627': '9053893', '73557': '9053894', '74081': '9053895', '74046': '9053897', '73190': '9053898', '73194': '9053899', '74830': '9053901', '74565': '9053904', '74463': '9053906', '74446': '9053907', '74458': '9053908', '74060': '9053911', '74172': '9053912', '74186': '9053913', '74001': '9053915', '67340': '9053917', '67363': '9053918', '67260': '9053919', '67221': '9053920', '67476': '9053921', '66622': '9053922', '66626': '9053923', '66629': '9053924', '64999': '9053926', '64144': '9053927', '64686': '9053929', '65735': '9053930', '74335': '9053933', '64847': '9053934', '74359': '9053938', '72905': '9053939', '74946': '9053940', '72820': '9053941', '72672': '9053942', '72624': '9053944', '65890': '9053946', '65899': '9053947', '65898': '9053948', '72584': '9053949', '72123': '9053951', '72553': '9053954', '72424': '9053959', '63099': '9053963', '63674': '9053964', '63061': '9053965', '63073': '9053966', '65541': '9053967', '65048': '9053968', '65054': '9053969', '63467': '9053970', '63346': '9053971', '62683': '9053973', '62098': '9053975', '62622': '9053977', '52601': '9053979', '52771': '9053980', '52243': '9053981', '52312': '9053982', '52220': '9053983', '50068': '9053985', '51452': '9053988', '50031': '9053989', '50013': '9053990', '50398': '9053991', '50481': '9053992', '50427': '9053993', '56047': '9053994', '56056': '9053995', '54774': '9053997', '50664': '9053998', '53595': '9054000', '53584': '9054002', '54472': '9054006', '54934': '9054008', '54127': '9054010', '53062': '9054012', '53263': '9054015', '53290': '9054016', '53501': '9054019', '53931': '9054020', '53957': '9054021', '61317': '9054028', '61638': '9054030', '61634': '9054031', '61630': '9054032', '61633': '9054033', '61558': '9054034', '60933': '9054035', '60958': '9054037', '60147': '9054040', '60199': '9054042', '60179': '9054043', '46381': '9054050', '46968': '9054054', '46937': '9054057', '49357': '9054065', '49351': '9054066', '49413': '9054067', '49696': '9054069', '48859': '9054072', '48916': '9054075', '48825': '9054076', '48937': '9054077', '48551': '9054079', '48411': '9054080', '16531': '9054084', '44316': '9054085', '44328': '9054086', '44073': '9054087', '16475': '9054090', '16344': '9054093', '16035': '9054094', '16108': '9054095', '15682': '9054103', '15673': '9054105', '15689': '9054112', '15688': '9054114', '15625': '9054115', '15698': '9054116', '15262': '9054118', '15463': '9054122', '15454': '9054124', '15482': '9054125', '15492': '9054126', '15612': '9054127', '15465': '9054128', '26544': '9054130', '15359': '9054131', '44750': '9054144', '44697': '9054146', '43711': '9054150', '43199': '9054157', '43216': '9054158', '43251': '9054159', '43291': '9054160', '43322': '9054164', '43660': '9054167', '43555': '9054171', '49281': '9054172', '45374': '9054181', '45062': '9054185', '45470': '9054186', '40460': '9054192', '40481': '9054193', '40914': '9054194', '40334': '9054195', '41039': '9054196', '40317': '9054197', '41135': '9054198', '41408': '9054199', '41352': '9054200', '40316': '9054201', '41390': '9054202', '41848': '9054203', '41660': '9054204', '41631': '9054205', '41643': '9054206', '41517': '9054207', '41231': '9054209', '25676': '9054210', '41267': '9054211', '41203': '9054212', '41262': '9054213', '25512': '9054215', '25534': '9054216', '45636': '9054218', '41174': '9054219', '45172': '9054221', '45721': '9054227', '45729': '9054228', '26133': '9054229', '45739': '9054230', '25264': '9054232', '25124': '9054233', '25011': '9054234', '25231': '9054235', '25030': '9054236', '25088': '9054237', '25285': '9054238', '25133': '9054239', '26611': '9054241', '26238': '9054242', '26404': '9054243', '26560': '9054244', '26222': '9054245', '26627': '9054246', '26631': '9054247', '26615': '9054248', '26619': '9054249', '26610': '9054250', '26217': '9054251', '26266': '9054252', '26660': '9054253', '26691': '9054254', '26662': '9054255', '26202': '9054256', '24977': '9054257', '24962': '9054258', '24957': '9054259', '24457': '9054261', '24130': '9054262', '24366': '9054263', '24613': '9054265', '24716': '9054266', '25826': '9054267', '24847': '9054268', '25811': '9054269', '24739': '9054271', '25979': '9054272', '26684': '9054273', '25938': '9054274', '26656': '9054275', '25115': '9054276', '25119': '9054278', '25118': '9054279', '25139': '9054280', '25103': '9054282', '25025': '9054283', '25134': '9054284', '25061': '9054285', '25083': '9054286', '25836': '9054289', '25873': '9054291', '25848': '9054292', '25180': '9054293', '25617': '9054294', '25606': '9054295', '25183': '9054296', '25114': '9054297', '25149': '9054298', '25108': '9054299', '25093': '9054301', '25214': '9054302', '25387': '9054303', '25317': '9054304', '25396': '9054305', '25392': '9054306', '25107': '9054307', '25169': '9054308', '25142': '9054309', '25009': '9054310', '25051': '9054311', '25154': '9054312', '25081': '9054313', '25203': '9054314', '25544': '9054315', '25540': '9054316', '25121': '9054317', '25653': '9054318', '25646': '9054319', '25076': '9054320', '25612': '9054321', '25678': '9054323', '24601': '9054324', '24628': '9054325', '28629': '9054327', '27099': '9054329', '28223': '9054334', '28367': '9054336', '29733': '9054338', '28281': '9054339', '28074': '9054346', '28702': '9054352', '28810': '9054353', '37699': '9054354', '37765': '9054355', '40913': '9054358', '40845': '9054359', '40964': '9054360', '40921': '9054361', '40995': '9054362', '40813': '9054363', '40958': '9054364', '40939': '9054365', '40923': '9054366', '40949': '9054367', '40943': '9054368', '40946': '9054369', '40953': '9054370', '40903': '9054371', '30732': '9054375', '35899': '9054377', '35896': '9054378', '37161': '9054379', '42216': '9054381', '42163': '9054382', '42124': '9054383', '40061': '9054384', '40122': '9054386', '40110': '9054387', '40292': '9054388', '47190': '9054389', '40025': '9054390', '40032': '9054392', '40058': '9054393', '47019': '9054395', '46154': '9054401', '47420': '9054404', '47860': '9054414', '40171': '9054421', '62464': '9054425', '62766': '9054429', '62762': '9054430', '62763': '9054431', '62706': '9054432', '62767': '9054433', '62781': '9054434', '62756': '9054436', '62777': '9054437', '62739': '9054438', '62723': '9054439', '62716': '9054440', '62841': '9054447', '63760': '9054452', '63744': '9054453', '63868': '9054454', '63860': '9054455', '63878': '9054457', '38070': '9054458', '38238': '9054459', '38943': '9054462', '36913': '9054464', '36910': '9054465', '36764': '9054466', '36446': '9054467', '36436': '9054468', '36745': '9054469', '38879': '9054470', '36865': '9054476', '36008': '9054478', '36723': '9054479', '36454': '9054480', '36473': '9054481', '32512': '9054482', '36313': '9054485', '36540': '9054488', '36512': '9054489', '39595': '9054490', '39407': '9054491', '70463': '9054492', '33744': '9054494', '33106': '9054497', '33116': '9054498', '33950': '9054499', '33459': '9054500', '32919': '9054503', '32099': '9054505', '31561': '9054506', '31547': '9054507', '32214': '9054508', '32133': '9054511', '34453': '9054512', '32683': '9054514', '32307': '9054515', '32061': '9054521', '31623': '9054522', '31083': '9054523', '30412': '9054524', '30464': '9054525', '30448': '9054526', '31003': '9054527', '31832': '9054530', '30099': '9054533', '29850': '9054535', '29226': '9054538', '29214': '9054539', '29933': '9054541', '29846': '9054542', '30451': '9054544', '29915': '9054546', '29921': '9054547', '29943': '9054548', '29409': '9054549', '28575': '9054551', '27708': '9054557', '27711': '9054558', '27582': '9054559', '27815': '9054560', '27827': '9054562', '23108': '9054565', '23161': '9054566', '23023': '9054567', '23126': '9054568', '23147': '9054569', '23269': '9054570', '23160': '9054571', '23105': '9054572', '23909': '9054575', '24514': '9054576', '22957': '9054577', '22989': '9054578', '22732': '9054579', '22730': '9054580', '22948': '9054581', '22743': '9054582', '26818': '9054584', '22649': '9054585', '25432': '9054586', '25441': '9054587', '22160': '9054588', '22333': '9054591', '20566': '9054592', '20204': '9054593', '20565': '9054594', '20436': '9054595', '20502': '9054596', '20373': '9054597', '20310': '9054598', '20506': '9054599', '20427': '9054600', '20532': '9054601', '20372': '9054602', '20268': '9054604', '20251': '9054605', '20554': '9054606', '20390': '9054607', '20544': '9054608', '21411': '9054611', '21624': '9054612', '21836': '9054613', '20686': '9054614', '23389': '9054617', '23408': '9054618', '23443': '9054619', '23125': '9054620', '23056': '9054621', '23021': '9054622', '23076': '9054623', '23066': '9054624', '23064': '9054625', '23068': '9054626', '23035': '9054627', '23025': '9054628', '23681': '9054629', '23708': '9054630', '23630': '9054631', '23404': '9054632', '8342': '9054637', '8240': '9054640', '8224': '9054641', '7097': '9054643', '10173': '9054644', '11599': '9054645', '10910': '9054648', '7890': '9054650', '7880': '9054652', '8933': '9054653', '18933': '9054655', '8556': '9054656', '18953': '9054657', '18016': '9054660', '18212': '9054662', '18370': '9054664', '18473': '9054666', '18456': '9054667', '18451': '9054668', '17920': '9054671', '18220': '9054675', '19554': '9054678', '17923': '9054680', '19457': '9054686', '8074': '9054687', '19017': '9054688', '19735': '9054689', '19890': '9054690', '21628': '9054695', '19718': '9054696', '17130': '9054698', '17089': '9054699', '17071': '9054703', '17021': '9054704', '17060': '9054705', '17260': '9054706', '17213': '9054707', '17239': '9054709', '17261': '9054713', '21709': '9054716', '21715': '9054717', '15564': '9054720', '15548': '9054724', '15750': '9054727', '15745': '9054730', '15922': '9054732', '15737': '9054733', '16629': '9054737', '16638': '9054738', '16634': '9054739', '16674': '9054741', '17253': '9054742', '16685': '9054743', '17052': '9054744', '16683': '9054745', '16876': '9054746', '16850': '9054747', '16645': '9054751', '15781': '9054752', '15733': '9054753', '15780': '9054754', '15744': '9054755', '16253': '9054757', '16245': '9054758', '15776': '9054759', '15770': '9054760', '15778': '9054761', '15764': '9054762', '16732': '9054766', '16750': '9054767', '17769': '9054769', '17076': '9054772', '17885': '9054773', '17014': '9054779', '17867': '9054782', '17836': '9054783', '16910': '9054785', '18814': '9054786', '14831': '9054787', '13139': '9054788', '13065': '9054789', '14461': '9054791', '14876': '9054793', '14585': '9054794', '14592': '9054796', '14029': '9054798', '14788': '9054799', '14135': '9054802', '14263': '9054804', '14642': '9054809', '14651': '9054810', '14646': '9054811', '14643': '9054812', '14638': '9054813', '14647': '9054814', '14649': '9054815', '13504': '9054821', '13758': '9054824', '13794': '9054825', '13738': '9054826', '18825': '9054827', '18441': '9054828', '18842': '9054830', '18430': '9054831', '18455': '9054833', '12767': '9054834', '12438': '9054837', '13751': '9054838', '13806': '9054839', '12787': '9054841', '12604': '9054845', '12530': '9054848', '12436': '9054851', '12222': '9054853', '12132': '9054854', '12246': '9054855', '12288': '9054856', '12235': '9054857', '12031': '9054859', '12854': '9054861', '5768': '9054862', '5159': '9054864', '5141': '9054865', '3273': '9054867', '5501': '9054868', '2841': '9054871', '6338': '9054874', '6350': '9054876', '6230': '9054877', '1093': '9054878', '1111': '9054879', '6006': '9054880', '1260': '9054882', '6758': '9054885', '6816': '9054888', '6817': '9054889', '6857': '9054891', '11249': '9073497', '29486': '9077370', '85378': '9189345', '75758': '9191102', '75036': '9191694', '89437': '9193446', '97703': '9195881', '32163': '9195958', '84009': '9196758', '75072': '9198580', '85288': '9198599', '11947': '9207563', '95671': '9210327', '28646': '9211292', '97078': '9212769', '33538': '9213587', '78599': '9216674', '74340': '9217345', '15687': '9218688', '1009': '9001640', '1066': '9001670', '1094': '9001689', '1101': '9001693', '1242': '9001724', '1347': '9001753', '1438': '9001777', '1580': '9001833', '1582': '9001835', '1613': '9001851', '1965': '9001938', '2051': '9001959', '2205': '9002027', '2331': '9002035', '2553': '9002093', '2558': '9002097', '2672': '9002138', '3847': '9002463', '3871': '9002483', '3896': '9002497', '3911': '9002509', '4056': '9002545', '4063': '9002548', '4271': '9002613', '4286': '9002622', '4341': '9002629', '4615': '9002746', '5059': '9002934', '5088': '9002955', '5490': '9003050', '5825': '9003131', '6061': '9003201', '6258': '9003268', '6263': '9003272', '6332': '9003286', '6467': '9003346', '6721': '9003396', '6753': '9003400', '6922': '9003460', '7842': '9003716', '7844': '9003718', '7846': '9003719', '7878': '9003738', '7926': '9003746', '7977': '9003765', '7979': '9003767', '8023': '9003789', '8042': '9003804', '8064': '9003823', '8352': '9003915', '8650': '9003968', '8821': '9004008', '8888': '9004049', '10005': '9004060', '10503': '9004184', '10517': '9004195', '10519': '9004197', '10542': '9004213', '10953': '9004285', '12045': '9004622', '12174': '9004706', '12417': '9004760', '12420': '9004763', '12453': '9004788', '12475': '9004808', '12512': '9004829', '12574': '9004870', '12584': '9004878', '12785': '9004932', '12872': '9004992', '12929': '9005018', '13087': '9005110', '13102': '9005115', '13117': '9005125', '13123': '9005129', '13134': '9005134', '13138': '9005137', '13157': '9005151', '13162': '9005155', '13163': '9005156', '13261': '9005178', '13305': '9005184', '13321': '9005197', '13341': '9005215', '13426': '9005249', '13615': '9005302', '13847': '9005428', '13848': '9005429', '14061': '9005479', '14168': '9005525', '14173': '9005529', '14463': '9005587', '14511': '9005614', '14537': '9005632', '14549': '9005640', '14558': '9005644', '14692': '9005684', '14722': '9005700', '14732': '9005709', '14745': '9005720', '14752': '9005724', '14851': '9005780', '14854': '9005782', '15028': '9005839', '15081': '9005876', '15082': '9005877', '15088': '9005882', '15324': '9005971', '15331': '9005975', '15346': '9005986', '15358': '9005992', '15361': '9005994', '15366': '9005998', '15368': '9006000', '15421': '9006014', '15422': '9006015', '15430': '9006021', '15460': '9006039', '15466': '9006043', '15472': '9006047', '15477': '9006051', '15484': '9006056', '15520': '9006062', '15547': '9006080', '15560': '9006089', '15561': '9006090', '15629': '9006106', '15635': '9006110', '15640': '9006114', '15663': '9006125', '15716': '9006150', '15723': '9006153', '15731': '9006159', '15736': '9006161', '15739': '9006162', '15754': '9006169', '15756': '9006170', '15783': '9006185', '15925': '9006223', '15934': '9006228', '15948': '9006238', '15960': '9006247', '15962': '9006249', '16022': '9006254', '16024': '9006256', '16027': '9006258', '16029': '9006260', '16030': '9006261', '16036': '9006264', '16054': '9006276', '16113': '9006290', '16160': '9006320', '16213': '9006324', '16230': '9006333', '16238': '9006337', '16244': '9006341', '16246': '9006342', '16370': '9006384', '16427': '9006405', '16624': '9006443', '16672': '9006471', '16725': '9006486', '16848': '9006525', '16851': '9006527', '16853': '9006529', '16911': '9006551', '17005': '9006583', '17016': '9006590', '17072': '9006636', '17075': '9006639', '17081': '9006643', '17097': '9006652', '17105': '9006659', '17249': '9006699', '17254': '9006701', '17317': '9006722', '17355': '9006741', '17371': '9006752', '17508': '9006765', '17550': '9006785', '17568': '9006796', '17580': '9006802', '17604': '9006809', '17730': '9006818', '17749': '9006827', '17762': '9006834', '17779': '9006844', '17829': '9006857', '17862': '9006877', '17868': '9006880', '17884': '9006886', '17887': '9006888', '17930': '9006896', '17933': '9006898', '17936': '9006901', '17949': '9006907', '17951': '9006908', '18030': '9006938', '18081': '9006975', '18083': '9006976', '18086': '9006978', '18219': '9006997', '18230': '9007002', '18231': '9007003', '18239': '9007008', '18244': '9007012', '18246': '9007013', '18248': '9007014', '18254': '9007018', '18351': '9007045', '18416': '9007058', '18827': '9007159', '18912': '9007180', '18921': '9007185', '18970': '9007208', '19108': '9007287', '19345': '9007352', '19423': '9007375', '19437': '9007381', '19443': '9007384', '19472': '9007395', '19519': '9007415', '19536': '9007424', '19544': '9007430', '19559': '9007437', '19612': '9007453', '19731': '9007467', '19733': '9007469', '19936': '9007493', '19955': '9007508', '19980': '9007524', '20059': '9007550', '20307': '9007612', '20585': '9007647', '20612': '9007661', '21071': '9007850', '21105': '9007865', '21504': '9007943', '21560': '9007961', '21641': '9007986', '21653': '9007996', '21664': '9008006', '21717': '9008028', '21759': '9008046', '22125': '9008146', '22529': '9008228', '22548': '9008235', '22646': '9008266', '22848': '9008330', '23090': '9008409', '23284': '9008478', '23401': '9008506', '23407': '9008508', '23486': '9008545', '23501': '9008548', '24022': '9008688', '24058': '9008693', '24132': '9008734', '24402': '9008844', '24448': '9008862', '24474': '9008874', '24506': '9008888', '24624': '9008948', '24627': '9008949', '24658': '9008962', '24821': '9008980', '24831': '9008986', '24834': '9008987', '24871': '9009006', '24894': '9009015', '25010': '9009050', '25022': '9009054', '25162': '9009094', '25211': '9009110', '25507': '9009180', '25709': '9009236', '25849': '9009255', '25871': '9009262', '25911': '9009270', '25916': '9009273', '25942': '9009280', '26074': '9009311', '26186': '9009344', '26349': '9009402', '26434': '9009427', '26559': '9009453', '26563': '9009455', '26589': '9009466', '26639': '9009477', '26641': '9009478', '26886': '9009529', '27014': '9009536', '27331': '9009629', '27555': '9009699', '27556': '9009700', '27568': '9009707', '27570': '9009709', '27588': '9009719', '27813': '9009763', '27878': '9009815', '27985': '9009886', '28017': '9009894', '28072': '9009914', '28076': '9009917', '28169': '9009966', '28325': '9010017', '28330': '9010021', '28332': '9010022', '28424': '9010085', '28519': '9010140', '28554': '9010164', '28619': '9010202', '28628': '9010210', '28725': '9010277', '29046': '9010361', '29132': '9010407', '29329': '9010460', '29373': '9010479', '29377': '9010482', '29493': '9010544', '29602': '9010602', '29656': '9010636', '29724': '9010680', '29816': '9010698', '29834': '9010709', '30072': '9010797', '30330': '9010946', '30378': '9010968', '30719': '9011116', '30806': '9011142', '31004': '9011169', '31039': '9011200', '31333': '9011282', '31722': '9011378', '31902': '9011441', '32013': '9011453', '32147': '9011516', '32182': '9011529', '32192': '9011533', '32330': '9011590', '32360': '9011609', '32432': '9011632', '32452': '9011646', '32463': '9011653', '32681': '9011731', '32697': '9011737', '32706': '9011741', '32775': '9011772', '33022': '9011862', '33101': '9011900', '33152': '9011928', '33847': '9012180', '33848': '9012181', '33945': '9012229', '34137': '9012271', '34260': '9012314', '34478': '9012350', '34661': '9012376', '34679': '9012381', '34681': '9012382', '35036': '9012461', '35060': '9012475', '35070': '9012481', '35074': '9012485', '35119': '9012506', '35149': '9012525', '35181': '9012537', '35449': '9012587', '35584': '9012642', '35990': '9012765', '36267': '9012852', '36515': '9012927', '36543': '9012945', '36779': '9013027', '37152': '9013161', '37230': '9013205', '37326': '9013233', '37394': '9013284', '37682': '9013331', '37732': '9013359', '37733': '9013360', '37851': '9013413', '37950': '9013465', '38007': '9013472', '38036': '9013486', '38101': '9013513', '38235': '9013561', '38281': '9013576', '38389': '9013632', '38503': '9013671', '38578': '9013706', '38723': '9013771', '38880': '9013838', '39061': '9013887', '39177': '9013938', '39436': '9014013', '39632': '9014068', '39635': '9014070', '40020': '9014165', '40310': '9014256', '40348': '9014269', '40357': '9014274', '40801': '9014341', '40807': '9014343', '40854': '9014360', '40999': '9014386', '41137': '9014445', '41849': '9014626', '42037': '9014647', '42060': '9014664', '42084': '9014675', '42322': '9014741', '42332': '9014749', '42370': '9014770', '42440': '9014786', '42463': '9014800', '43005': '9014862', '43010': '9014866', '43027': '9014880', '43032': '9014884', '43036': '9014886', '43070': '9014905', '43077': '9014910', '43109': '9014922', '43111': '9014924', '43126': '9014932', '43142': '9014941', '43144': '9014943', '43151': '9014950', '43156': '9014955', '43157': '9014956', '43158': '9014957', '43317': '9014997', '43330': '9015006', '43335': '9015011', '43408': '9015032', '43437': '9015043', '43468': '9015062', '43505': '9015067', '43510': '9015069', '43529': '9015083', '43531': '9015084', '43547': '9015096', '43553': '9015100', '43565': '9015106', '43722': '9015136', '43735': '9015147', '43740': '9015149', '43909': '9015200', '43914': '9015204', '43928': '9015211', '43934': '9015216', '43939': '9015219', '43940': '9015220', '43948': '9015227', '43951': '9015229', '43962': '9015233', '43981': '9015241', '44045': '9015265', '44101': '9015300', '44199': '9015348', '44211': '9015353', '44274': '9015387', '44309': '9015404', '44493': '9015463', '44501': '9015464', '44640': '9015503', '44653': '9015511', '44659': '9015515', '44661': '9015516', '44670': '9015522', '44682': '9015529', '44693': '9015536', '44809': '9015559', '44825': '9015569', '44828': '9015572', '44838': '9015577', '44848': '9015586', '44850': '9015588', '44856': '9015593', '44860': '9015596', '44874': '9015603', '44901': '9015612', '45041': '9015633', '45112': '9015654', '45115': '9015656', '45119': '9015658', '45132': '9015665', '45145': '9015672', '45147': '9015674', '45156': '9015681', '45158': '9015683', '45228': '9015718', '45234': '9015724', '45301': '9015742', '45307': '9015748', '45310': '9015751', '45316': '9015756', '45328': '9015768', '45330': '9015769', '45336': '9015775', '45349': '9015787', '45351': '9015788', '45352': '9015789', '45353': '9015790', '45354': '9015791', '45358': '9015793', '45360': '9015795', '45361': '9015796', '45372': '9015805', '45378': '9015808', '45389': '9015817', '45401': '9015819', '45408': '9015825', '45418': '9015832', '45427': '9015839', '45428': '9015840', '45469': '9015852', '45618': '9015864', '45621': '9015867', '45624': '9015870', '45674': '9015899', '45779': '9015951', '45782': '9015953', '45783': '9015954', '45816': '9015970', '45820': '9015973', '45838': '9015984', '45853': '9015994', '45854': '9015995', '45855': '9015996', '45861': '9016001', '45864': '9016004', '45866': '9016006', '45870': '9016010', '45893': '9016029', '45899': '9016035', '46047': '9016055', '46103': '9016079', '46144': '9016106', '46155': '9016113', '46206': '9016141', '46211': '9016143', '46302': '9016179', '46345': '9016196', '46401': '9016218', '46502': '9016229', '46513': '9016236', '46537': '9016248', '46595': '9016274', '46957': '9016387', '46967': '9016393', '47035': '9016426', '47226': '9016485', '47324': '9016516', '47337': '9016524', '47344': '9016530', '47351': '9016534', '47382': '9016552', '47388': '9016558', '47464': '9016591', '47535': '9016615', '47584': '9016641', '47851': '9016701', '47855': '9016703', '47863': '9016708', '47871': '9016711', '47880': '9016715', '47884': '9016717', '47916': '9016725', '47924': '9016732', '47964': '9016757', '47965': '9016758', '47969': '9016761', '47983': '9016770', '48068': '9016824', '48175': '9016900', '48190': '9016913', '48243': '9016958', '48308': '9016964', '48812': '9017193', '48816': '9017196', '48852': '9017225', '49016': '9017284', '49027': '9017290', '49069': '9017323', '49121': '9017362', '49263': '9017405', '49289': '9017426', '49335': '9017454', '49409': '9017476', '49430': '9017491', '49611': '9017535', '49627': '9017550', '49634': '9017557', '49764': '9017642', '49791': '9017658', '49863': '9017699', '49864': '9017700', '49871': '9017704', '49901': '9017723', '49915': '9017730', '49917': '9017732', '49922': '9017737', '49929': '9017740', '50160': '9017877', '50241': '9017922', '50318': '9017962', '50431': '9017981', '50573': '9018077', '50592': '9018092', '50593': '9018093', '51008': '9018199', '51045': '9018229', '51341': '9018279', '51432': '9018299', '51444': '9018307', '51460': '9018320', '51578': '9018379', '51656': '9018401', '52758': '9018679', '53016': '9018711', '53167': '9018806', '53192': '9018825', '53195': '9018826', '53537': '9018891', '53599': '9018940', '53940': '9018997', '53953': '9019007', '54211': '9019103', '54214': '9019106', '54232': '9019114', '54450': '9019167', '54458': '9019174', '54927': '9019422', '54980': '9019458', '55090': '9019532', '55764': '9019761', '55796': '9019781', '55950': '9019829', '56035': '9019886', '56153': '9019964', '56313': '9020075', '56325': '9020085', '56328': '9020088', '56356': '9020108', '56369': '9020118', '56376': '9020123', '56395': '9020134', '56712': '9020290', '57245': '9020430', '57462': '9020547', '57542': '9020579', '57563': '9020591', '57578': '9020603', '57628': '9020615', '57736': '9020657', '57773': '9020683', '57777': '9020685', '58602': '9020977', '59354': '9021217', '59445': '9021244', '59477': '9021267', '59755': '9021350', '60109': '9021499', '60113': '9021503', '60141': '9021522', '60474': '9021637', '60519': '9021666', '60537': '9021678', '60910': '9021774', '60926': '9021787', '60956': '9021810', '60969': '9021820', '60974': '9021823', '61013': '9021831', '61027': '9021841', '61037': '9021847', '61077': '9021877', '61125': '9021897', '61316': '9021943', '61324': '9021950', '61332': '9021956', '61338': '9021962', '61340': '9021963', '61346': '9021968', '61359': '9021976', '61374': '9021988', '61426': '9022011', '61524': '9022071', '61539': '9022084', '61541': '9022086', '61553': '9022095', '61562': '9022100', '61601': '9022110', '61758': '9022168', '61815': '9022192', '61857': '9022222', '61949': '9022266', '61955': '9022269', '62023': '9022288', '62058': '9022313', '62077': '9022326', '62085': '9022334', '62089': '9022338', '62093': '9022342', '62219': '9022358', '62248': '9022380', '62292': '9022410', '62336': '9022432', '62362': '9022454', '62519': '9022534', '62537': '9022546', '62541': '9022550', '62570': '9022572', '62610': '9022577', '62663': '9022607', '62689': '9022625', '62811': '9022649', '62825': '9022662', '62856': '9022685', '62857': '9022686', '62861': '9022690', '62876': '9022702', '62921': '9022740', '62949': '9022762', '62953': '9022766', '62961': '9022773', '62965': '9022777', '62997': '9022799', '63001': '9022802', '63053': '9022838', '63342': '9022914', '63365': '9022930', '63387': '9022945', '63663': '9023047', '63742': '9023062', '63753': '9023069', '63758': '9023071', '63767': '9023075', '63826': '9023093', '63947': '9023139', '63962': '9023150', '63963': '9023151', '64066': '9023191', '64092': '9023212', '64121': '9023233', '64197': '9023271', '64743': '9023417', '64751': '9023424', '64765': '9023432', '64830': '9023448', '64833': '9023451', '64841': '9023456', '65036': '9023492', '65327': '9023591', '65540': '9023646', '65664': '9023720', '65801': '9023807', '66024': '9023831', '66759': '9024050', '66782': '9024068', '66863': '9024095', '67478': '9024333', '67482': '9024336', '67667': '9024435', '68001': '9024515', '68063': '9024557', '68072': '9024566', '68330': '9024635', '68364': '9024664', '68403': '9024682', '68438': '9024709', '68501': '9024735', '68588': '9024758', '68634': '9024772', '68664': '9024796', '69031': '9025002', '69355': '9025090', '70050': '9025116', '70464': '9025232', '70523': '9025250', '70550': '9025269', '70558': '9025273', '70575': '9025278', '70576': '9025279', '70585': '9025286', '71009': '9025408', '71025': '9025415', '71102': '9025454', '71148': '9025469', '71330': '9025525', '71361': '9025546', '71410': '9025562', '71434': '9025577', '72043': '9025763', '72085': '9025791', '72214': '9025858', '72339': '9025875', '72359': '9025888', '72377': '9025900', '72426': '9025923', '72457': '9025945', '72826': '9026101', '72945': '9026153', '73097': '9026241', '73743': '9026426', '73847': '9026458', '74358': '9026586', '74440': '9026613', '74844': '9026732', '74935': '9026765', '74942': '9026771', '74943': '9026772', '75097': '9026849', '75101': '9026852', '75413': '9026963', '75848': '9027132', '75934': '9027155', '75942': '9027162', '76004': '9027190', '76124': '9027267', '76161': '9027280', '76253': '9027312', '76268': '9027321', '76650': '9027467', '76686': '9027490', '76902': '9027554', '77046': '9027621', '77266': '9027675', '77368': '9027708', '77448': '9027757', '77464': '9027769', '77476': '9027779', '77552': '9027825', '77806': '9027893', '77876': '9027920', '77988': '9027948', '78074': '9028002', '78144': '9028028', '78145': '9028029', '78347': '9028114', '78358': '9028120', '78364': '9028125', '78469': '9028164', '78661': '9028264', '78711': '9028282', '79116': '9028459', '79120': '9028462', '79320': '9028499', '79408': '9028544', '79776': '9028650', '79920': '9028695', '80025': '9028726', '80131': '9028760', '80329': '9028823', '80425': '9028831', '80471': '9028866', '80511': '9028885', '80520': '9028892', '80544': '9028908', '80623': '9028923', '81030': '9029058', '81033': '9029059', '81043': '9029064', '81077': '9029084', '81126': '9029099', '81134': '9029105', '81148': '9029114', '81153': '9029118', '81656': '9029227', '82430': '9029296', '82644': '9029329', '82833': '9029350', '82939': '9029370', '83002': '9029377', '83119': '9029392', '83656': '9029585', '83874': '9029667', '84326': '9029809', '84334': '9029816', '84717': '9029905', '85191': '9030025', '85218': '9030042', '85219': '9030043', '85221': '9030045', '85222': '9030046', '85223': '9030047', '85230': '9030052', '85231': '9030053', '85232': '9030054', '85236': '9030057', '85237': '9030058', '85239': '9030060', '85241': '9030061', '85242': '9030062', '85243': '9030063', '85245': '9030065', '85247': '9030066', '85272': '9030085', '85273': '9030086', '85292': '9030094', '85329': '9030118', '85608': '9030191', '85626': '9030208', '85639': '9030218', '85726': '9030248', '86549': '9030390', '87060': '9030438', '87533': '9030528', '88004': '9030613', '88046': '9030637', '88053': '9030643', '88437': '9030741', '89024': '9030761', '89411': '9030853', '89803': '9030910', '89824': '9030916', '90009': '9030935', '90052': '9030975', '91109': '9031122', '91747': '9031228', '91795': '9031255', '92885': '9031609', '93067': '9031636', '93606': '9031803', '93666': '9031848', '93673': '9031852', '94018': '9031908', '94528': '9032000', '95063': '9032157', '95213': '9032208', '95221': '9032212', '95312': '9032244', '95319': '9032250', '95426': '9032323', '95435': '9032329', '95537': '9032385', '95613': '9032427', '95625': '9032438', '95697': '9032498', '95699': '9032500', '95799': '9032522', '96089': '9032688', '96765': '9032782', '96828': '9032819', '97036': '9032855', '97207': '9032931', '97208': '9032932', '97269': '9032961', '97425': '9033046', '97427': '9033048', '98238': '9033366', '98255': '9033379', '98297': '9033409', '98353': '9033442', '98385': '9033470', '98530': '9033518', '98539': '9033526', '98559': '9033536', '98821': '9033628', '98824': '9033631', '98836': '9033640', '98939': '9033677', '98943': '9033681', '99020': '9033704', '99102': '9033721', '99174': '9033774', '99509': '9033843', '99697': '9033976', '99779': '9034038', '99850': '9034063', '4865': '9053443', '4926': '9053444', '4431': '9053445', '4972': '9053446', '4489': '9053456', '4415': '9053457', '4992': '9053458', '4234': '9053459', '4014': '9053464', '5861': '9053469', '5031': '9053472', '3597': '9053479', '5485': '9053482', '5481': '9053483', '13678': '9053487', '49723': '9053489', '49902': '9053496', '49964': '9053497', '99510': '9053500', '56363': '9053510', '55029': '9053511', '56344': '9053512', '56333': '9053514', '56335': '9053515', '56478': '9053516', '55772': '9053517', '56591': '9053522', '82440': '9053541', '83421': '9053545', '83454': '9053548', '83218': '9053549', '99146': '9053558', '83840': '9053559', '59435': '9053562', '98263': '9053564', '98583': '9053568', '98527': '9053569', '98554': '9053570', '98565': '9053571', '97044': '9053572', '98920': '9053574', '98921': '9053575', '98293': '9053577', '99124': '9053578', '99014': '9053580', '99359': '9053581', '99039': '9053584', '97384': '9053587', '97336': '9053588', '97432': '9053589', '97134': '9053595', '95486': '9053608', '94701': '9053610', '95431': '9053612', '95433': '9053613', '95007': '9053618', '94548': '9053621', '95208': '9053622', '95381': '9053623', '93670': '9053626', '95813': '9053635', '90073': '9053642', '91802': '9053644', '91734': '9053645', '91793': '9053646', '89116': '9053650', '89158': '9053651', '89009': '9053654', '91912': '9053662', '92871': '9053670', '92822': '9053671', '92863': '9053672', '92619': '9053673', '90809': '9053675', '93102': '9053678', '70712': '9053684', '70747': '9053685', '71320': '9053688', '70434': '9053690', '39167': '9053691', '39077': '9053692', '71253': '9053705', '71242': '9053706', '71324': '9053707', '71415': '9053710', '71759': '9053712', '71772': '9053713', '71922': '9053714', '71840': '9053718', '71865': '9053719', '75694': '9053722', '75788': '9053725', '77626': '9053727', '71426': '9053728', '77501': '9053733', '77473': '9053734', '77443': '9053735', '77453': '9053736', '78622': '9053742', '78951': '9053743', '77878': '9053744', '78674': '9053747', '76526': '9053748', '74720': '9053754', '75121': '9053755', '75485': '9053756', '74753': '9053757', '73436': '9053759', '75371': '9053761', '76702': '9053763', '78054': '9053769', '78585': '9053775', '78335': '9053780', '78568': '9053783', '88027': '9053786', '88032': '9053787', '88054': '9053790', '88102': '9053801', '81244': '9053816', '87574': '9053824', '86342': '9053842', '80532': '9053865', '80546': '9053873', '69353': '9053876', '56294': '9053882', '74068': '9053896', '73032': '9053900', '74456': '9053902', '74460': '9053903', '74459': '9053905', '74050': '9053909', '74071': '9053910', '74082': '9053914', '67334': '9053916', '66036': '9053925', '64654': '9053928', '64857': '9053931', '64849': '9053932', '64864': '9053935', '65654': '9053936', '72733': '9053937', '72615': '9053943', '65675': '9053945', '72183': '9053950', '72178': '9053952', '72526': '9053953', '72431': '9053955', '72322': '9053956', '72325': '9053957', '72465': '9053958', '63651': '9053960', '62256': '9053961', '63057': '9053962', '62030': '9053972', '62695': '9053974', '61543': '9053976', '62329': '9053978', '62348': '9053984', '64420': '9053986', '50831': '9053987', '56030': '9053996', '53812': '9053999', '53535': '9054001', '53540': '9054003', '53962': '9054004', '54662': '9054005', '54946': '9054007', '54152': '9054009', '54182': '9054011', '54931': '9054013', '53003': '9054014', '53101': '9054017', '53159': '9054018', '53928': '9054022', '53571': '9054023', '61059': '9054024', '61079': '9054025', '61331': '9054026', '61372': '9054027', '61091': '9054029', '60945': '9054036', '60557': '9054038', '60144': '9054039', '60075': '9054041', '60082': '9054044', '49084': '9054045', '46393': '9054046', '46355': '9054047', '46372': '9054048', '46377': '9054049', '47982': '9054051', '47962': '9054052', '47925': '9054053', '46931': '9054055', '46965': '9054056', '46045': '9054058', '46063': '9054059', '47361': '9054060', '47367': '9054061', '46778': '9054062', '46799': '9054063', '46704': '9054064', '49501': '9054068', '48627': '9054070', '48620': '9054071', '48862': '9054073', '48874': '9054074', '48143': '9054078', '48440': '9054081', '48343': '9054082', '14785': '9054083', '44285': '9054088', '44080': '9054089', '16413': '9054091', '16416': '9054092', '16151': '9054096', '44424': '9054097', '16140': '9054098', '44492': '9054099', '15004': '9054100', '15379': '9054101', '15339': '9054102', '16236': '9054104', '15680': '9054106', '15624': '9054107', '15662': '9054108', '15633': '9054109', '15676': '9054110', '15664': '9054111', '15621': '9054113', '15660': '9054117', '15447': '9054119', '15429': '9054120', '15420': '9054121', '15475': '9054123', '15416': '9054129', '15353': '9054132', '26058': '9054133', '43757': '9054134', '43768': '9054135', '43985': '9054136', '43759': '9054137', '43972': '9054138', '43905': '9054139', '43974': '9054140', '44619': '9054141', '44665': '9054142', '44232': '9054143', '44671': '9054145', '44639': '9054147', '44660': '9054148', '44636': '9054149', '43738': '9054151', '43030': '9054152', '43721': '9054153', '43048': '9054154', '43350': '9054155', '43033': '9054156', '43002': '9054161', '43336': '9054162', '43007': '9054163', '44845': '9054165', '48177': '9054166', '43434': '9054168', '43463': '9054169', '43467': '9054170', '43519': '9054173', '43530': '9054174', '45837': '9054175', '45848': '9054176', '45884': '9054177', '45888': '9054178', '45802': '9054179', '45501': '9054180', '45826': '9054182', '45350': '9054183', '45004': '9054184', '45032': '9054187', '41062': '9054188', '45105': '9054189', '40448': '9054190', '40492': '9054191', '41526': '9054208', '41268': '9054214', '45643': '9054217', '45630': '9054220', '45642': '9054222', '45617': '9054223', '43117': '9054224', '43101': '9054225', '45740': '9054226', '45720': '9054231', '26671': '9054240', '24438': '9054260', '24606': '9054264', '25853': '9054270', '25866': '9054277', '25110': '9054281', '25818': '9054287', '25909': '9054288', '25851': '9054290', '25205': '9054300', '25692': '9054322', '28667': '9054326', '27049': '9054328', '27202': '9054330', '27201': '9054331', '27010': '9054332', '28041': '9054333', '28108': '9054335', '29079': '9054337', '29346': '9054340', '29368': '9054341', '28019': '9054342', '28024': '9054343', '28038': '9054344', '28089': '9054345', '29378': '9054347', '29320': '9054348', '29331': '9054349', '29606': '9054350', '29665': '9054351', '40847': '9054356', '40824': '9054357', '37719': '9054372', '37314': '9054373', '30724': '9054374', '30756': '9054376', '37165': '9054380', '40048': '9054385', '40041': '9054391', '47021': '9054394', '47033': '9054396', '47370': '9054397', '47335': '9054398', '47225': '9054399', '47263': '9054400', '47282': '9054402', '47467': '9054403', '47437': '9054405', '47434': '9054406', '47435': '9054407', '46183': '9054408', '47455': '9054409', '47857': '9054410', '47881': '9054411', '47853': '9054412', '47836': '9054413', '47966': '9054415', '47831': '9054416', '47876': '9054417', '47865': '9054418', '47654': '9054419', '47683': '9054420', '42374': '9054422', '42460': '9054423', '62852': '9054424', '61941': '9054426', '62879': '9054427', '62532': '9054428', '62721': '9054435', '62273': '9054441', '62289': '9054442', '62266': '9054443', '62252': '9054444', '62866': '9054445', '62891': '9054446', '62874': '9054448', '62909': '9054449', '62973': '9054450', '63752': '9054451', '63850': '9054456', '38338': '9054460', '38839': '9054461', '38947': '9054463', '35573': '9054471', '35577': '9054472', '35187': '9054473', '35032': '9054474', '36254': '9054475', '36851': '9054477', '32530': '9054483', '36476': '9054484', '36371': '9054486', '39832': '9054487', '33630': '9054493', '33586': '9054495', '33427': '9054496', '33846': '9054501', '33856': '9054502', '32957': '9054504', '32662': '9054509', '34729': '9054510', '32658': '9054513', '39829': '9054516', '31782': '9054517', '31753': '9054518', '31747': '9054519', '31627': '9054520', '31760': '9054528', '31084': '9054529', '30070': '9054531', '30266': '9054532', '30819': '9054534', '29839': '9054536', '29002': '9054537', '29826': '9054540', '30423': '9054543', '31556': '9054545', '29062': '9054550', '28362': '9054552', '28375': '9054553', '28368': '9054554', '27543': '9054555', '27359': '9054556', '27879': '9054561', '27841': '9054563', '22507': '9054564', '23884': '9054573', '23955': '9054574', '24469': '9054583', '20138': '9054589', '20661': '9054590', '20523': '9054603', '20898': '9054609', '20726': '9054610', '22530': '9054615', '23422': '9054616', '23441': '9054633', '8252': '9054634', '8218': '9054635', '8214': '9054636', '8217': '9054638', '8213': '9054639', '8073': '9054642', '11802': '9054646', '10545': '9054647', '10979': '9054649', '7837': '9054651', '18950': '9054654', '18962': '9054658', '18046': '9054659', '18065': '9054661', '7833': '9054663', '18357': '9054665', '18654': '9054669', '18653': '9054670', '18256': '9054672', '18251': '9054673', '18225': '9054674', '19564': '9054676', '19511': '9054677', '17979': '9054679', '19367': '9054681', '17528': '9054682', '19542': '9054683', '19535': '9054684', '19442': '9054685', '8039': '9054691', '8347': '9054692', '8320': '9054693', '8315': '9054694', '17312': '9054697', '17069': '9054700', '17306': '9054701', '17337': '9054702', '17251': '9054708', '17263': '9054710', '21720': '9054711', '17235': '9054712', '17250': '9054714', '21762': '9054715', '21734': '9054718', '21503': '9054719', '21542': '9054721', '15532': '9054722', '15555': '9054723', '15930': '9054725', '15951': '9054726', '15752': '9054728', '15710': '9054729', '15929': '9054731', '15738': '9054734', '16619': '9054735', '16665': '9054736', '16633': '9054740', '15841': '9054748', '16671': '9054749', '16620': '9054750', '16211': '9054756', '15847': '9054763', '16352': '9054764', '16312': '9054765', '16733': '9054768', '16826': '9054770', '16835': '9054771', '17835': '9054774', '17748': '9054775', '17883': '9054776', '17880': '9054777', '17861': '9054778', '17833': '9054780', '17831': '9054781', '16939': '9054784', '14518': '9054790', '14588': '9054792', '14488': '9054795', '14774': '9054797', '14742': '9054800', '14166': '9054801', '14035': '9054803', '14112': '9054805', '14056': '9054806', '14169': '9054807', '14557': '9054808', '13115': '9054816', '13651': '9054817', '13611': '9054818', '13435': '9054819', '13352': '9054820', '13362': '9054822', '13020': '9054823', '18413': '9054829', '18454': '9054832', '13457': '9054835', '12452': '9054836', '12724': '9054840', '12769': '9054842', '12722': '9054843', '12555': '9054844', '12506': '9054846', '12504': '9054847', '12172': '9054849', '12541': '9054850', '12161': '9054852', '12884': '9054858', '13410': '9054860', '12040': '9054863', '3754': '9054866', '6387': '9054869', '2350': '9054870', '6373': '9054872', '6439': '9054873', '6383': '9054875', '6020': '9054881', '1244': '9054883', '6079': '9054884', '6050': '9054886', '6444': '9054887', '6602': '9054890', '2669': '9054892'}
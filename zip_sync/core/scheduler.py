@@ -0,0 +1,67 @@
+import random
+import signal
+import threading
+import time
+from typing import Callable, Optional
+
+
+class SyncScheduler:
+    """
+    Runs the sync over and over in one long-lived process, so imports, the zip index,
+    API clients and caches stay warm between runs.
+
+    * Runs start every `interval` seconds, plus or minus up to `jitter` seconds.
+    * Runs never overlap: a run that overruns its slot is followed straight away by the next one.
+    * `stop()` (called on SIGTERM / SIGINT) lets the current run finish, then ends the loop.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[], None],
+        interval: float,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        random_uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        self._run = run
+        self.interval = interval
+        self.jitter = max(0.0, min(jitter, interval))
+        self._clock = clock
+        self._random_uniform = random_uniform
+        self._stop_event = threading.Event()
+        self.runs = 0
+
+    def stop(self, *_) -> None:
+        if not self._stop_event.is_set():
+            print("Stop requested. Finishing the current run before shutting down.")
+        self._stop_event.set()
+
+    def install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def serve(self, max_runs: Optional[int] = None) -> None:
+        while not self._stop_event.is_set():
+            started_at = self._clock()
+            try:
+                self._run()
+            except Exception as e:
+                # The run has already reported the error; keep the daemon alive for the next one
+                print(f"Sync run failed: {e}")
+            self.runs += 1
+            if max_runs is not None and self.runs >= max_runs:
+                break
+
+            delay = self.get_next_delay(self._clock() - started_at)
+            if delay > 0:
+                print(f"Next sync in {delay:.0f}s.")
+            # Returns early if stop() is called while waiting
+            self._stop_event.wait(delay)
+        print("Scheduler stopped.")
+
+    def get_next_delay(self, elapsed: float) -> float:
+        """Seconds to wait after a run that took `elapsed` seconds."""
+        offset = self._random_uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.interval + offset - elapsed)
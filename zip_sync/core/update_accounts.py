@@ -0,0 +1,177 @@
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Optional
+from zip_sync.core.update_campaigns import _get_google_ads_client, update_campaigns
+from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.environment.folder_paths import get_state_dir_path
+from zip_sync.slack.send_admin_slack import send_admin_slack
+from zip_sync.slack.send_alert_slack import send_alert_slack
+from zip_sync.slack.slack_dispatcher import flush_slack
+from zip_sync.utils.run_metrics import RunMetrics, get_run_metrics, start_run_metrics
+
+
+@dataclass
+class AccountResult:
+    """What one account's sync did, sent back from its worker process."""
+    account_id: str
+    applied: bool = False
+    seconds: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def update_accounts(criteria_ids_by_name_pattern: dict[str, list[str]], account_ids: Optional[list[str]]) -> bool:
+    """
+    Sync each of account_ids' campaigns to criteria_ids_by_name_pattern (see update_campaigns).
+    With no account list (see get_account_ids) this is just update_campaigns for
+    GOOGLE_ADS_ACCOUNT_ID, in this process.
+    Returns True if every account's changes were applied successfully.
+    """
+    if account_ids is None:
+        return update_campaigns(criteria_ids_by_name_pattern)
+    if not account_ids:
+        send_alert_slack("No Google Ads accounts found to sync. Check GOOGLE_ADS_MANAGER_ACCOUNT_ID.")
+        return False
+
+    max_workers = min(EnvironmentService().get_account_workers(), len(account_ids))
+    print(f"Syncing {len(account_ids)} accounts with {max_workers} worker processes.")
+    run_metrics = get_run_metrics()
+    results = _run_account_syncs(account_ids, criteria_ids_by_name_pattern, max_workers, run_metrics)
+    return _log_account_results(results, run_metrics)
+
+
+def get_account_ids() -> Optional[list[str]]:
+    """
+    The accounts to sync: GOOGLE_ADS_ACCOUNT_IDS if set, otherwise the client accounts under
+    GOOGLE_ADS_MANAGER_ACCOUNT_ID. Returns None if neither is set, or the API is off (single-account mode).
+    """
+    from zip_sync.ads_api.customer_client_fetcher import CustomerClientFetcher
+
+    environment_service = EnvironmentService()
+    if not environment_service.get_api_active():
+        return None
+    account_ids = environment_service.get_google_ads_account_ids()
+    if account_ids:
+        return list(dict.fromkeys(account_ids))
+    manager_account_id = environment_service.get_google_ads_manager_account_id()
+    if manager_account_id is None:
+        return None
+    return CustomerClientFetcher(_get_google_ads_client(), manager_account_id).get_client_account_ids()
+
+
+def _get_account_environment(account_id: str, max_workers: int) -> dict[str, str]:
+    """
+    Environment overrides for one account's worker: the account ID, a state directory of its own
+    (criterion replica, batch size), and an even share of the mutate request rate, so the
+    accounts together stay within MUTATION_REQUESTS_PER_SECOND.
+    """
+    environment_service = EnvironmentService()
+    return {
+        "GOOGLE_ADS_ACCOUNT_ID": account_id,
+        "STATE_DIR": os.path.join(get_state_dir_path(), "accounts", account_id),
+        "MUTATION_REQUESTS_PER_SECOND": str(environment_service.get_mutation_requests_per_second() / max_workers),
+        "MUTATION_BURST": str(max(1.0, environment_service.get_mutation_burst() / max_workers)),
+    }
+
+
+def _sync_account(account_id: str, criteria_ids_by_name_pattern: dict[str, list[str]], environment: dict[str, str]) -> AccountResult:
+    """
+    Runs update_campaigns for one account. This is the worker process's entry point, so it
+    never raises: failures come back in the result.
+    """
+    os.environ.update(environment)
+    run_metrics = start_run_metrics()
+    result = AccountResult(account_id)
+    try:
+        result.applied = update_campaigns(criteria_ids_by_name_pattern)
+    except Exception as e:
+        result.error = f"{e}\n{traceback.format_exc()}"
+    finally:
+        flush_slack()
+    snapshot = run_metrics.snapshot()
+    result.seconds = snapshot["duration_seconds"]
+    result.stages = snapshot["stages"]
+    result.counters = snapshot["counters"]
+    return result
+
+
+# Worker processes outlive a run, so `serve` mode keeps their clients and caches warm
+_account_pool: Optional[ProcessPoolExecutor] = None
+_account_pool_workers = 0
+
+
+def _get_account_pool(max_workers: int) -> Executor:
+    """
+    Returns the process-wide pool of account workers, replacing it if the worker count changed.
+    Workers are spawned rather than forked: gRPC channels don't survive a fork.
+    """
+    global _account_pool, _account_pool_workers
+    if _account_pool is None or _account_pool_workers != max_workers:
+        if _account_pool is not None:
+            _account_pool.shutdown()
+        _account_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        _account_pool_workers = max_workers
+    return _account_pool
+
+
+def _discard_account_pool() -> None:
+    global _account_pool
+    if _account_pool is not None:
+        _account_pool.shutdown(wait=False, cancel_futures=True)
+        _account_pool = None
+
+
+def _run_account_syncs(account_ids: list[str], criteria_ids_by_name_pattern: dict[str, list[str]], max_workers: int, run_metrics: RunMetrics) -> list[AccountResult]:
+    """
+    Sync the accounts in parallel, at most max_workers at a time, and add each one's
+    stage times and counters to run_metrics.
+    """
+    environments = [_get_account_environment(account_id, max_workers) for account_id in account_ids]
+    executor = _get_account_pool(max_workers)
+    futures = [
+        executor.submit(_sync_account, account_id, criteria_ids_by_name_pattern, environment)
+        for account_id, environment in zip(account_ids, environments)
+    ]
+    results = []
+    for account_id, future in zip(account_ids, futures):
+        started = time.perf_counter()
+        try:
+            result = future.result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); the pool can't be used again
+            _discard_account_pool()
+            result = AccountResult(account_id, seconds=time.perf_counter() - started, error=f"Worker process died: {e}")
+        results.append(result)
+        for name, seconds in result.stages.items():
+            run_metrics.add_duration(name, seconds)
+        for name, value in result.counters.items():
+            run_metrics.increment(name, value)
+    return results
+
+
+def _log_account_results(results: list[AccountResult], run_metrics: RunMetrics) -> bool:
+    """
+    Print each account's outcome, add it to the admin digest and run_metrics, and alert
+    on accounts that failed. Returns False unless every account was applied.
+    """
+    lines = []
+    for result in results:
+        outcome = "failed" if result.error else "applied" if result.applied else "incomplete"
+        run_metrics.increment(f"accounts_{outcome}")
+        lines.append(
+            f"Account {result.account_id}: {outcome} in {result.seconds:.1f}s, "
+            f"added {result.counters.get('criteria_added', 0):g}, removed {result.counters.get('criteria_removed', 0):g}, "
+            f"failed {result.counters.get('criteria_failed', 0):g}, unsent {result.counters.get('criteria_unsent', 0):g}"
+        )
+        if result.error:
+            send_alert_slack(f"Error syncing account {result.account_id}: {result.error}")
+    summary = "\n".join(lines)
+    print(summary)
+    send_admin_slack(summary)
+    return all(result.applied and not result.error for result in results)
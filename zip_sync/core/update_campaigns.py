@@ -1,88 +1,234 @@
 import time
-from zip_sync.utils.chunker import chunk_list
-from zip_sync.ads_api.campaign_fetcher import CampaignFetcher
-from zip_sync.ads_api.campaign_criterion_mutator import CampaignCriterionMutator
-from zip_sync.ads_api.campaign_criterion_id_fetcher import CampaignCriterionIdFetcher
-from zip_sync.ads_api.google_ads_client import GoogleAdsClient
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+from zip_sync.ads_api.criterion_changes import CampaignMutationResult, build_criterion_changes, merge_campaign_results
+from zip_sync.utils.chunker import iter_chunks
+from zip_sync.utils.rate_limiter import TokenBucket
+from zip_sync.utils.run_metrics import get_run_metrics
 from zip_sync.environment.folder_paths import get_google_ads_api_yaml_path
 from zip_sync.environment.environment_service import EnvironmentService
 from zip_sync.slack.send_admin_slack import send_admin_slack
 
+# The ads_api modules pull in the google.ads stack, so they're imported where they're used
+# rather than at module level. That keeps runs that never reach the API cheap to start.
+if TYPE_CHECKING:
+    from google.ads.googleads.client import GoogleAdsClient
+    from zip_sync.ads_api.adaptive_batch_sizer import AdaptiveBatchSizer
+    from zip_sync.state.criterion_replica import CriterionReplica
 
-def update_campaigns(api_criteria_ids: list[str]) -> None:
+
+def update_campaigns(criteria_ids_by_name_pattern: Mapping[str, list[str]]) -> bool:
+    """
+    Sync the location criteria of the campaigns matching each name pattern to that pattern's criteria IDs.
+    A campaign matching several patterns targets all of their criteria. The criterion report
+    and mutations run once over every matched campaign.
+    Returns True if the full set of changes was applied successfully.
+    """
     if not EnvironmentService().get_api_active():
         print("API is not active. Skipping campaign zip code sync. See API_ACTIVE environment variable.")
         send_admin_slack("API is not active. Skipping campaign zip code sync. See API_ACTIVE environment variable.")
-        return
+        return False
     
-    campaign_ids = _get_campaign_ids()
-    campaign_criterion_ids_map = _get_campaign_criterion_ids_map(campaign_ids)
-    _sync_campaign_criteria(campaign_ids, api_criteria_ids, campaign_criterion_ids_map)
+    campaign_targets = _get_campaign_targets(criteria_ids_by_name_pattern)
+    campaign_ids = list(campaign_targets)
+    replica = _get_criterion_replica()
+    if replica is None:
+        campaign_criterion_ids_map = _get_campaign_criterion_ids_map(campaign_ids)
+    else:
+        campaign_criterion_ids_map = _get_replicated_campaign_criterion_ids_map(campaign_ids, replica)
+    applied = _sync_campaign_criteria(campaign_targets, campaign_criterion_ids_map, replica)
+    # Test mode only applies a sample of the changes
+    return applied and not EnvironmentService().get_test_mode()
     
-def _get_campaign_ids() -> list[str]:
+def _get_campaign_targets(criteria_ids_by_name_pattern: Mapping[str, list[str]]) -> dict[str, set[str]]:
     """
-    Get the active campaign IDs from the Google Ads API.
+    Work out the criteria IDs each active campaign should target.
+    GAQL has no OR, so each name pattern's campaigns are listed separately. Campaigns matching
+    the same patterns share one set.
     """
+    campaign_targets: dict[str, set[str]] = {}
+    unions: dict[tuple[int, int], set[str]] = {}
+    for name_pattern, criteria_ids in criteria_ids_by_name_pattern.items():
+        criteria_id_set = set(criteria_ids)
+        for campaign_id in _get_campaign_ids(name_pattern):
+            existing = campaign_targets.get(campaign_id)
+            if existing is None:
+                campaign_targets[campaign_id] = criteria_id_set
+                continue
+            key = (id(existing), id(criteria_id_set))
+            if key not in unions:
+                unions[key] = existing | criteria_id_set
+            campaign_targets[campaign_id] = unions[key]
+    return campaign_targets
+
+# (account ID, name pattern) -> (fetched at, campaign IDs) from the last fetch, reused by later runs
+# in the same process (`serve` mode, and account workers that sync several accounts)
+_campaign_ids_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+
+def _get_campaign_ids(name_pattern: str) -> list[str]:
+    """
+    Get the active campaign IDs whose names match name_pattern from the Google Ads API.
+    Within CAMPAIGN_LIST_TTL_SECONDS of the last fetch, the same process reuses that list.
+    """
+    from zip_sync.ads_api.campaign_fetcher import CampaignFetcher
+
+    environment_service = EnvironmentService()
+    google_ads_account_id = environment_service.get_google_ads_account_id()
+    cache_key = (google_ads_account_id, name_pattern)
+    ttl_seconds = environment_service.get_campaign_list_ttl_seconds()
+    cached = _campaign_ids_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+        return list(cached[1])
+
     google_ads_client = _get_google_ads_client()
-    google_ads_account_id = EnvironmentService().get_google_ads_account_id()
-    campaign_fetcher = CampaignFetcher(google_ads_client, google_ads_account_id)
+    campaign_fetcher = CampaignFetcher(google_ads_client, google_ads_account_id, name_pattern)
     campaign_ids = campaign_fetcher.get_active_campaign_ids()
+    # An empty list usually means the fetch failed, so it isn't worth keeping
+    if campaign_ids:
+        _campaign_ids_cache[cache_key] = (time.monotonic(), list(campaign_ids))
+    else:
+        _campaign_ids_cache.pop(cache_key, None)
     return campaign_ids
 
-def _get_campaign_criterion_ids_map(campaign_ids: list[str]) -> dict[str, dict[str, str]]:
+def _get_campaign_criterion_ids_map(campaign_ids: list[str]) -> dict[str, Mapping[str, str]]:
     """
     Get the campaign criterion IDs map.
     """
+    from zip_sync.ads_api.campaign_criterion_id_fetcher import CampaignCriterionIdFetcher
+
+    environment_service = EnvironmentService()
     google_ads_client = _get_google_ads_client()
-    google_ads_account_id = EnvironmentService().get_google_ads_account_id()
-    campaign_criterion_id_fetcher = CampaignCriterionIdFetcher(google_ads_client, google_ads_account_id)
+    google_ads_account_id = environment_service.get_google_ads_account_id()
+    campaign_criterion_id_fetcher = CampaignCriterionIdFetcher(
+        google_ads_client,
+        google_ads_account_id,
+        shard_size=environment_service.get_criterion_report_shard_size(),
+        max_workers=environment_service.get_criterion_report_workers(),
+    )
     campaign_criterion_ids_map = campaign_criterion_id_fetcher.get_campaign_location_criteria_for_campaigns(campaign_ids)
     return campaign_criterion_ids_map
 
-def _get_criteria_to_add(api_criteria_ids: list[str], existing_criteria_ids: set[str]) -> list[str]:
+def _get_criterion_replica() -> Optional["CriterionReplica"]:
+    """
+    Get the local replica of the campaigns' location criteria.
+    Returns None if it's turned off, in which case every run downloads the full criterion report.
+    """
+    from zip_sync.state.criterion_replica import CriterionReplica
+
+    environment_service = EnvironmentService()
+    if not environment_service.get_criterion_replica():
+        return None
+    return CriterionReplica(
+        environment_service.get_google_ads_account_id(),
+        full_refresh_every_hours=environment_service.get_criterion_replica_full_refresh_hours(),
+    )
+
+def _get_replicated_campaign_criterion_ids_map(campaign_ids: list[str], replica: "CriterionReplica") -> dict[str, Mapping[str, str]]:
+    """
+    Bring the replica up to date and return the campaigns' criteria from it.
+    Normally only the criteria changed since the last run are read (via change_status), plus any
+    campaigns the replica doesn't have yet. A full report is downloaded on a cold start, on the
+    full refresh schedule, or when change_status can't account for every change.
+    """
+    from google.ads.googleads.errors import GoogleAdsException
+    from zip_sync.ads_api.change_status_reader import ChangeStatusReader
+
+    change_status_reader = ChangeStatusReader(_get_google_ads_client(), EnvironmentService().get_google_ads_account_id())
+    # Taken before reading, so anything that changes while we read is picked up again next run
+    checkpoint = change_status_reader.get_account_now()
+
+    full_refresh = replica.is_full_refresh_due()
+    if not full_refresh:
+        try:
+            full_refresh = not _reconcile_criterion_replica(replica, change_status_reader, checkpoint)
+        except GoogleAdsException as ex:
+            print(f"Reading change status failed ({ex.error.code().name}). Falling back to a full criterion report.")
+            full_refresh = True
+
+    if full_refresh:
+        print("Downloading the full criterion report.")
+        replica.replace_all(_get_campaign_criterion_ids_map(campaign_ids), checkpoint)
+    else:
+        missing_campaign_ids = replica.get_missing_campaign_ids(campaign_ids)
+        if missing_campaign_ids:
+            print(f"Downloading criteria for {len(missing_campaign_ids)} campaigns not in the replica.")
+            replica.set_campaigns(_get_campaign_criterion_ids_map(missing_campaign_ids))
+    replica.save()
+    return {str(campaign_id): replica.get(campaign_id) for campaign_id in campaign_ids if replica.get(campaign_id) is not None}
+
+def _reconcile_criterion_replica(replica: "CriterionReplica", change_status_reader, checkpoint: str) -> bool:
+    """
+    Apply the criterion changes since the replica's checkpoint, including ones made outside the sync.
+    The window starts a few minutes before the checkpoint, to catch changes that reached change_status
+    late. Changes read twice are no-ops: removed criteria are already gone and added ones already known.
+    Returns False if there were too many changes to read, in which case a full report is needed.
+    """
+    from zip_sync.ads_api.change_status_reader import get_window_start
+
+    criterion_changes = change_status_reader.get_criterion_changes(get_window_start(replica.checkpoint), checkpoint)
+    if criterion_changes.truncated:
+        print("Too many criterion changes since the last run to read from change status.")
+        return False
+
+    removed = replica.apply_removals(criterion_changes.changes)
+    unknown_additions = replica.get_unknown_additions(criterion_changes.changes)
+    location_criteria = change_status_reader.get_location_criteria(unknown_additions) if unknown_additions else []
+    replica.apply_additions(location_criteria)
+    replica.checkpoint = checkpoint
+    print(
+        f"Reconciled the criterion replica: {len(criterion_changes.changes)} changes, "
+        f"{removed} removed and {len(location_criteria)} added outside the sync."
+    )
+    return True
+
+def _get_criteria_to_add(api_criteria_ids: set[str], existing_criteria_ids: set[str]) -> list[str]:
     """
     Return criteria IDs that need to be added.
     """
-    return list(set(api_criteria_ids) - existing_criteria_ids)
+    return list(api_criteria_ids - existing_criteria_ids)
 
 
-def _get_criteria_to_remove(api_criteria_ids: list[str], existing_criteria_ids: set[str]) -> list[str]:
+def _get_criteria_to_remove(api_criteria_ids: set[str], existing_criteria_ids: set[str]) -> list[str]:
     """
     Return criteria IDs that need to be removed.
     """
-    return list(existing_criteria_ids - set(api_criteria_ids))
+    return list(existing_criteria_ids - api_criteria_ids)
 
 
-def _get_resource_names_to_remove(criteria_to_remove_ids: list[str], existing_criteria: dict[str, str]) -> list[str]:
+def _get_resource_names_to_remove(criteria_to_remove_ids: list[str], existing_criteria: Mapping[str, str]) -> list[str]:
     """
     Map criteria IDs to resource names for removal.
     """
     return [existing_criteria[crit_id] for crit_id in criteria_to_remove_ids]
 
 
-def _apply_campaign_criteria_changes(campaign_criterion_mutator, campaign_id: str, criteria_to_add: list[str], resource_names_to_remove: list[str], chunk_size: int) -> None:
+def _apply_campaign_criteria_changes(campaign_criterion_mutator, campaign_id: str, criteria_to_add: list[str], resource_names_to_remove: list[str], get_chunk_size: Callable[[], int]) -> CampaignMutationResult:
     """
     Apply adds and removes to a campaign using the mutator.
+    The chunk size is read before each request, so it follows the adaptive batch sizer.
+    Request pacing is handled by the mutator's rate limiter.
+    Returns the campaign's added, removed, failed and unsent counts across all of its requests.
     """
+    result = CampaignMutationResult(campaign_id)
     if criteria_to_add:
-        for chunk in chunk_list(criteria_to_add, chunk_size):
-            campaign_criterion_mutator.add_location_criteria_to_campaign(campaign_id, chunk)
-            time.sleep(1)
+        for chunk in iter_chunks(criteria_to_add, get_chunk_size):
+            result.merge(campaign_criterion_mutator.add_location_criteria_to_campaign(campaign_id, chunk))
     if resource_names_to_remove:
-        for chunk in chunk_list(resource_names_to_remove, chunk_size):
-            campaign_criterion_mutator.remove_location_criteria_from_campaign(campaign_id, chunk)
-            time.sleep(1)
+        for chunk in iter_chunks(resource_names_to_remove, get_chunk_size):
+            result.merge(campaign_criterion_mutator.remove_location_criteria_from_campaign(campaign_id, chunk))
+    return result
 
 
-def _sync_campaign_criteria(campaign_ids: list[str], api_criteria_ids: list[str], campaign_criterion_ids_map: dict[str, dict[str, str]]) -> None:
+def _get_campaign_changes(campaign_targets: Mapping[str, set[str]], campaign_criterion_ids_map: dict[str, Mapping[str, str]]) -> list[tuple[str, list[str], list[str]]]:
     """
-    Sync the campaign criteria.
+    Work out the criteria to add and the resource names to remove for each campaign,
+    given the criteria IDs each campaign should target.
+    Campaigns with nothing to change are left out.
     """
-    google_ads_client = _get_google_ads_client()
-    google_ads_account_id = EnvironmentService().get_google_ads_account_id()
-    campaign_criterion_mutator = CampaignCriterionMutator(google_ads_client, google_ads_account_id)
-
-    for campaign_id in campaign_ids:
+    test_mode = EnvironmentService().get_test_mode()
+    campaign_changes = []
+    for campaign_id, api_criteria_ids in campaign_targets.items():
         existing_criteria = campaign_criterion_ids_map.get(str(campaign_id), {})
         existing_criteria_ids = set(existing_criteria.keys())
 
@@ -90,26 +236,190 @@ def _sync_campaign_criteria(campaign_ids: list[str], api_criteria_ids: list[str]
         criteria_to_remove_ids = _get_criteria_to_remove(api_criteria_ids, existing_criteria_ids)
         resource_names_to_remove = _get_resource_names_to_remove(criteria_to_remove_ids, existing_criteria)
 
-        if EnvironmentService().get_test_mode():
-            print(f"Test mode is enabled. Only the first criteria will be added to the campaign.")
+        if test_mode:
+            print(f"Test mode is enabled. Only the first criteria will be added to and removed from campaign {campaign_id}.")
             criteria_to_add = criteria_to_add[0:1]
-        chunk_size = EnvironmentService().get_chunk_size()
-        if EnvironmentService().get_test_mode():
-            print(f"Test mode is enabled. Only the first criteria will be removed from the campaign.")
             resource_names_to_remove = resource_names_to_remove[0:1]
 
-        _apply_campaign_criteria_changes(
-            campaign_criterion_mutator,
-            campaign_id,
-            criteria_to_add,
-            resource_names_to_remove,
-            chunk_size
+        if criteria_to_add or resource_names_to_remove:
+            campaign_changes.append((campaign_id, criteria_to_add, resource_names_to_remove))
+    return campaign_changes
+
+
+def _sync_campaign_criteria(campaign_targets: Mapping[str, set[str]], campaign_criterion_ids_map: dict[str, Mapping[str, str]], replica: Optional["CriterionReplica"] = None) -> bool:
+    """
+    Sync the campaign criteria.
+    Campaigns are mutated in parallel by a pool of workers sharing one mutator and rate limiter.
+    The results are applied to the criterion replica, if there is one.
+    Returns False if any campaign's changes failed to apply.
+    """
+    from zip_sync.ads_api.campaign_criterion_mutator import CampaignCriterionMutator
+
+    environment_service = EnvironmentService()
+    google_ads_client = _get_google_ads_client()
+    google_ads_account_id = environment_service.get_google_ads_account_id()
+    rate_limiter = TokenBucket(
+        environment_service.get_mutation_requests_per_second(),
+        environment_service.get_mutation_burst(),
+    )
+    batch_sizer = _get_batch_sizer()
+    campaign_criterion_mutator = CampaignCriterionMutator(
+        google_ads_client, google_ads_account_id, rate_limiter, batch_sizer=batch_sizer
+    )
+
+    campaign_changes = _get_campaign_changes(campaign_targets, campaign_criterion_ids_map)
+    if not campaign_changes:
+        print("All campaigns are already in sync.")
+        return True
+
+    if batch_sizer:
+        get_chunk_size = lambda: batch_sizer.size
+    else:
+        chunk_size = environment_service.get_chunk_size()
+        get_chunk_size = lambda: chunk_size
+
+    operation_count = sum(len(criteria_to_add) + len(resource_names_to_remove) for _, criteria_to_add, resource_names_to_remove in campaign_changes)
+    batch_job_threshold = environment_service.get_batch_job_threshold()
+    max_workers = environment_service.get_mutation_workers()
+    if batch_job_threshold and operation_count > batch_job_threshold:
+        print(f"{operation_count} operations is over the batch job threshold of {batch_job_threshold}. Using a batch job.")
+        results = _apply_batch_job(google_ads_client, google_ads_account_id, campaign_changes)
+    elif environment_service.get_cross_campaign_batching():
+        results = _apply_cross_campaign_batches(campaign_criterion_mutator, campaign_changes, get_chunk_size, max_workers)
+    else:
+        results = _apply_per_campaign(campaign_criterion_mutator, campaign_changes, get_chunk_size, max_workers)
+
+    if batch_sizer:
+        batch_sizer.save()
+    if replica:
+        replica.apply_mutation_results(campaign_changes, results)
+        replica.save()
+    return _log_campaign_results(results)
+
+
+def _apply_per_campaign(campaign_criterion_mutator, campaign_changes: list[tuple[str, list[str], list[str]]], get_chunk_size: Callable[[], int], max_workers: int) -> dict[str, CampaignMutationResult]:
+    """
+    Mutate each campaign with its own requests, several campaigns at a time.
+    Operations rejected by partial failure count as failed; operations in a request that failed outright count as unsent.
+    """
+    max_workers = min(max_workers, len(campaign_changes))
+    print(f"Syncing {len(campaign_changes)} campaigns with {max_workers} workers.")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mutate") as executor:
+        futures = [
+            executor.submit(
+                _apply_campaign_criteria_changes,
+                campaign_criterion_mutator,
+                campaign_id,
+                criteria_to_add,
+                resource_names_to_remove,
+                get_chunk_size
+            )
+            for campaign_id, criteria_to_add, resource_names_to_remove in campaign_changes
+        ]
+        return {campaign_id: future.result() for (campaign_id, _, _), future in zip(campaign_changes, futures)}
+
+
+def _apply_cross_campaign_batches(campaign_criterion_mutator, campaign_changes: list[tuple[str, list[str], list[str]]], get_chunk_size: Callable[[], int], max_workers: int) -> dict[str, CampaignMutationResult]:
+    """
+    Pack the campaigns' adds and removes into full-size requests that span campaigns.
+    Each campaign belongs to one worker, so no two requests change the same campaign at the
+    same time (which Google Ads rejects with CONCURRENT_MODIFICATION). A worker works through
+    its campaigns in chunks that follow the current batch size.
+    """
+    lanes = _split_into_lanes(campaign_changes, max_workers)
+
+    def worker(lane: list[tuple[str, list[str], list[str]]]) -> list[dict[str, CampaignMutationResult]]:
+        return [
+            campaign_criterion_mutator.mutate_criterion_changes(chunk)
+            for chunk in iter_chunks(build_criterion_changes(lane), get_chunk_size)
+        ]
+
+    operation_count = sum(len(criteria_to_add) + len(resource_names_to_remove) for _, criteria_to_add, resource_names_to_remove in campaign_changes)
+    print(f"Syncing {operation_count} changes across {len(campaign_changes)} campaigns with {len(lanes)} workers.")
+    with ThreadPoolExecutor(max_workers=len(lanes), thread_name_prefix="mutate") as executor:
+        futures = [executor.submit(worker, lane) for lane in lanes]
+        return merge_campaign_results([result for future in futures for result in future.result()])
+
+
+def _split_into_lanes(campaign_changes: list[tuple[str, list[str], list[str]]], lane_count: int) -> list[list[tuple[str, list[str], list[str]]]]:
+    """
+    Deal the campaigns out to at most lane_count lanes, the biggest first onto the lightest lane,
+    so the lanes carry about the same number of operations. Campaigns keep their order within a lane.
+    """
+    lane_count = max(1, min(lane_count, len(campaign_changes)))
+    lane_indices: list[list[int]] = [[] for _ in range(lane_count)]
+    lane_sizes = [0] * lane_count
+    by_size = sorted(
+        range(len(campaign_changes)),
+        key=lambda index: len(campaign_changes[index][1]) + len(campaign_changes[index][2]),
+        reverse=True,
+    )
+    for index in by_size:
+        lane = lane_sizes.index(min(lane_sizes))
+        lane_indices[lane].append(index)
+        lane_sizes[lane] += len(campaign_changes[index][1]) + len(campaign_changes[index][2])
+    return [[campaign_changes[index] for index in sorted(indices)] for indices in lane_indices if indices]
+
+
+def _apply_batch_job(google_ads_client, google_ads_account_id: str, campaign_changes: list[tuple[str, list[str], list[str]]]) -> dict[str, CampaignMutationResult]:
+    """
+    Submit every campaign's changes as one offline batch job.
+    If the job failed or timed out, every operation counts as unsent.
+    """
+    from zip_sync.ads_api.batch_job_executor import BatchJobExecutor
+
+    batch_job_executor = BatchJobExecutor(
+        google_ads_client,
+        google_ads_account_id,
+        poll_timeout=EnvironmentService().get_batch_job_timeout_seconds(),
+    )
+    return batch_job_executor.mutate_criterion_changes(build_criterion_changes(campaign_changes))
+
+
+def _log_campaign_results(results: dict[str, CampaignMutationResult]) -> bool:
+    """
+    Print each campaign's tally and add the totals to the run metrics.
+    Returns False if any operations went unsent or failed, so the run isn't recorded as applied.
+    """
+    run_metrics = get_run_metrics()
+    run_metrics.increment("campaigns_changed", len(results))
+    for campaign_result in results.values():
+        run_metrics.increment("criteria_added", campaign_result.added)
+        run_metrics.increment("criteria_removed", campaign_result.removed)
+        run_metrics.increment("criteria_failed", campaign_result.failed)
+        run_metrics.increment("criteria_unsent", campaign_result.unsent)
+        print(
+            f"Campaign {campaign_result.campaign_id}: added {campaign_result.added}, removed {campaign_result.removed}, "
+            f"failed {campaign_result.failed}, unsent {campaign_result.unsent}"
         )
+    return all(campaign_result.unsent == 0 and campaign_result.failed == 0 for campaign_result in results.values())
+
+
+def _get_batch_sizer() -> Optional["AdaptiveBatchSizer"]:
+    """
+    Get the adaptive batch sizer, starting from the last run's size.
+    Returns None if adaptive sizing is turned off, in which case CHUNK_SIZE is used.
+    """
+    from zip_sync.ads_api.adaptive_batch_sizer import AdaptiveBatchSizer
+
+    environment_service = EnvironmentService()
+    if not environment_service.get_adaptive_batch_size():
+        return None
+    return AdaptiveBatchSizer.load(
+        initial_size=environment_service.get_mutation_batch_size_initial(),
+        min_size=environment_service.get_mutation_batch_size_min(),
+        max_size=environment_service.get_mutation_batch_size_max(),
+        target_latency=environment_service.get_mutation_target_latency_seconds(),
+    )
     
-def _get_google_ads_client() -> GoogleAdsClient:
+def _get_google_ads_client() -> "GoogleAdsClient":
     """
     Get the Google Ads client.
+    The client is built once per process and its services and channels are shared.
     """
-    google_ads_client = GoogleAdsClient()
-    client = google_ads_client.get(get_google_ads_api_yaml_path())
-    return client
\ No newline at end of file
+    from zip_sync.ads_api.google_ads_client import get_shared_google_ads_client
+
+    return get_shared_google_ads_client(
+        get_google_ads_api_yaml_path(),
+        keepalive=EnvironmentService().get_google_ads_keepalive(),
+    )
\ No newline at end of file
@@ -1,14 +1,53 @@
+from collections.abc import Mapping
+from typing import Optional
+
 from zip_sync.sheets.sheets_service import SheetsService
+from zip_sync.sheets.sheets_snapshot import SheetsSnapshot
 from zip_sync.environment.folder_paths import get_google_credentials_path
 from zip_sync.environment.environment_service import EnvironmentService
 
-def update_google_sheets(criteria_ids: list[str]) -> None:
-    spreadsheet_url = EnvironmentService().get_google_sheet_url()
-    sheets_service = SheetsService(get_google_credentials_path(), spreadsheet_url)
+# Kept between runs in the same process (`serve` mode) so the authorized session is reused
+_sheets_services: dict[str, SheetsService] = {}
+
+def _get_sheets_service(spreadsheet_url: str) -> SheetsService:
+    sheets_service = _sheets_services.get(spreadsheet_url)
+    if sheets_service is None:
+        environment_service = EnvironmentService()
+        sheets_service = _sheets_services[spreadsheet_url] = SheetsService(
+            get_google_credentials_path(),
+            spreadsheet_url,
+            max_cells_per_request=environment_service.get_sheets_max_cells_per_request(),
+            max_workers=environment_service.get_sheets_write_workers(),
+        )
+    return sheets_service
+
+def set_sheets_service(spreadsheet_url: str, sheets_service: Optional[SheetsService]) -> None:
+    """Makes runs use sheets_service for spreadsheet_url (e.g. one backed by a load test stand-in). None goes back to the default."""
+    if sheets_service is None:
+        _sheets_services.pop(spreadsheet_url, None)
+    else:
+        _sheets_services[spreadsheet_url] = sheets_service
+
+def update_google_sheets(criteria_ids: list[str], worksheet_criteria_ids: Optional[Mapping[str, list[str]]] = None) -> None:
+    """
+    Writes the criteria IDs to every tab of the spreadsheet, in one batch.
+    Tabs named in worksheet_criteria_ids get their own criteria IDs instead.
+    """
+    worksheet_criteria_ids = worksheet_criteria_ids or {}
+    environment_service = EnvironmentService()
+    spreadsheet_url = environment_service.get_google_sheet_url()
+    sheets_service = _get_sheets_service(spreadsheet_url)
     sheets_service.authorize()
 
+    snapshot = None
+    if environment_service.get_sheets_diff_writes():
+        snapshot = SheetsSnapshot(spreadsheet_url, verify_every_hours=environment_service.get_sheets_verify_every_hours())
+
     worksheet_names = sheets_service.get_worksheet_names()
-    for worksheet_name in worksheet_names:
-        sheets_service.update_column(worksheet_name, criteria_ids, column=1, start_row=2)
+    missing_worksheet_names = [worksheet_name for worksheet_name in worksheet_criteria_ids if worksheet_name not in worksheet_names]
+    if missing_worksheet_names:
+        print(f"Worksheets named in FEED_CATEGORIES aren't in the spreadsheet: {', '.join(missing_worksheet_names)}")
+    values_by_worksheet = {worksheet_name: worksheet_criteria_ids.get(worksheet_name, criteria_ids) for worksheet_name in worksheet_names}
+    sheets_service.update_worksheet_columns(values_by_worksheet, column=1, start_row=2, snapshot=snapshot)
     
     
\ No newline at end of file
@@ -0,0 +1,83 @@
+import hashlib
+import os
+import time
+from typing import Iterable, Iterator, Optional
+
+from zip_sync.environment.folder_paths import get_state_dir_path
+from zip_sync.state.state_file import read_state, write_state
+
+
+def get_feed_cache_dir_path() -> str:
+    return os.path.join(get_state_dir_path(), "feed_cache")
+
+
+class FeedCache:
+    """
+    On-disk copy of the last successful response for a URL, with the validators
+    (ETag / Last-Modified) needed to make the next request conditional.
+    """
+
+    def __init__(self, url: str, cache_dir: Optional[str] = None):
+        self.url = url
+        self.cache_dir = cache_dir or get_feed_cache_dir_path()
+        key = hashlib.sha256(url.encode()).hexdigest()[:16]
+        self.body_path = os.path.join(self.cache_dir, f"{key}.body")
+        self.meta_path = os.path.join(self.cache_dir, f"{key}.json")
+
+    def load_meta(self) -> dict:
+        """Returns the cached metadata, or {} if there's no usable cached response."""
+        meta = read_state(self.meta_path)
+        if meta.get("url") != self.url or not os.path.exists(self.body_path):
+            return {}
+        return meta
+
+    def exists(self) -> bool:
+        return bool(self.load_meta())
+
+    def conditional_headers(self) -> dict:
+        meta = self.load_meta()
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def read_body(self) -> bytes:
+        with open(self.body_path, "rb") as f:
+            return f.read()
+
+    def iter_body(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        with open(self.body_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def store(self, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> str:
+        """Stores a response body and its validators. Returns the body hash."""
+        return self.store_stream([body], etag, last_modified)
+
+    def store_stream(self, chunks: Iterable[bytes], etag: Optional[str] = None, last_modified: Optional[str] = None) -> str:
+        """
+        Streams a response body to disk, then stores its validators. Returns the body hash.
+        The previous cached response is only replaced once the new body is complete.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        tmp_path = f"{self.body_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+        body_hash = digest.hexdigest()
+        # Drop the old validators first so they can never be paired with the new body
+        if os.path.exists(self.meta_path):
+            os.remove(self.meta_path)
+        os.replace(tmp_path, self.body_path)
+        write_state(self.meta_path, {
+            "url": self.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash,
+            "fetched_at": time.time(),
+        })
+        return body_hash
@@ -0,0 +1,109 @@
+import hashlib
+import json
+from dataclasses import dataclass
+
+from zip_sync.filter.zip_code_filter import PriceRule, parse_price_rules
+
+DEFAULT_CATEGORY_ID = "149"
+DEFAULT_CAMPAIGN_NAME_PATTERN = "%[Appliance]%"
+CATEGORY_ID_PLACEHOLDER = "{category_id}"
+
+
+@dataclass(frozen=True)
+class FeedCategory:
+    """
+    One eLocal call category: its price list feed, the rules its zip codes must pass, and
+    the campaigns (a GAQL LIKE pattern on the campaign name) that target them.
+    `worksheets` are the Sheets tabs that list this category's criteria.
+    """
+    category_id: str = DEFAULT_CATEGORY_ID
+    campaign_name_pattern: str = DEFAULT_CAMPAIGN_NAME_PATTERN
+    price_rules: tuple[PriceRule, ...] = (PriceRule(),)
+    worksheets: tuple[str, ...] = ()
+
+    def get_feed_url(self, url_template: str) -> str:
+        """The category's feed URL: url_template with {category_id} filled in."""
+        return url_template.replace(CATEGORY_ID_PLACEHOLDER, self.category_id)
+
+
+def parse_feed_categories(config: str, default_price_rules: list[PriceRule]) -> list[FeedCategory]:
+    """
+    Parses a JSON list of categories, e.g.
+    [{"category_id": 149, "campaigns": "%[Appliance]%", "price_rules": "max_call_price>20"},
+     {"category_id": 212, "campaigns": "%[Plumbing]%", "price_threshold": 35, "worksheets": ["Plumbing"]}]
+
+    `price_rules` takes the same format as PRICE_RULES, and `price_threshold` is short for
+    max_call_price above it. A category with neither uses default_price_rules.
+    """
+    try:
+        entries = json.loads(config)
+    except ValueError as e:
+        raise ValueError(f"FEED_CATEGORIES isn't valid JSON: {e}")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("FEED_CATEGORIES must be a non-empty JSON list of categories")
+
+    categories = []
+    for entry in entries:
+        if not isinstance(entry, dict) or "category_id" not in entry or "campaigns" not in entry:
+            raise ValueError(f"Each feed category needs a category_id and campaigns, got {entry!r}")
+        campaign_name_pattern = str(entry["campaigns"])
+        if "'" in campaign_name_pattern or '"' in campaign_name_pattern:
+            raise ValueError(f"Campaign name patterns can't contain quotes: {campaign_name_pattern!r}")
+        categories.append(FeedCategory(
+            category_id=str(entry["category_id"]),
+            campaign_name_pattern=campaign_name_pattern,
+            price_rules=tuple(_get_price_rules(entry, default_price_rules)),
+            worksheets=tuple(str(worksheet) for worksheet in entry.get("worksheets", [])),
+        ))
+
+    category_ids = [category.category_id for category in categories]
+    duplicates = sorted({category_id for category_id in category_ids if category_ids.count(category_id) > 1})
+    if duplicates:
+        raise ValueError(f"Feed categories are listed more than once: {', '.join(duplicates)}")
+    return categories
+
+
+def _get_price_rules(entry: dict, default_price_rules: list[PriceRule]) -> list[PriceRule]:
+    if "price_rules" in entry:
+        return parse_price_rules(str(entry["price_rules"]))
+    if "price_threshold" in entry:
+        return [PriceRule(threshold=float(entry["price_threshold"]))]
+    return default_price_rules
+
+
+def get_combined_body_hash(categories: list[FeedCategory], body_hashes: dict[str, str]) -> str:
+    """
+    A single hash for the categories' feeds (category ID -> body hash) and their config, so a
+    run can be skipped when no feed changed, but not when the rules or campaigns did.
+    """
+    combined = [(repr(category), body_hashes[category.category_id]) for category in categories]
+    return hashlib.sha256(json.dumps(combined).encode()).hexdigest()
+
+
+def _merge_criteria_ids(criteria_id_lists: list[list[str]]) -> list[str]:
+    """Combines lists of criteria IDs, keeping the first occurrence of each. A single list is returned as is."""
+    if len(criteria_id_lists) == 1:
+        return criteria_id_lists[0]
+    return list(dict.fromkeys(criteria_id for criteria_ids in criteria_id_lists for criteria_id in criteria_ids))
+
+
+def get_all_criteria_ids(criteria_ids_by_category: dict[str, list[str]]) -> list[str]:
+    """Every category's criteria IDs combined."""
+    return _merge_criteria_ids(list(criteria_ids_by_category.values()))
+
+
+def get_criteria_ids_by_name_pattern(categories: list[FeedCategory], criteria_ids_by_category: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Campaign name pattern -> the criteria IDs of every category that uses it."""
+    lists_by_name_pattern: dict[str, list[list[str]]] = {}
+    for category in categories:
+        lists_by_name_pattern.setdefault(category.campaign_name_pattern, []).append(criteria_ids_by_category[category.category_id])
+    return {name_pattern: _merge_criteria_ids(lists) for name_pattern, lists in lists_by_name_pattern.items()}
+
+
+def get_worksheet_criteria_ids(categories: list[FeedCategory], criteria_ids_by_category: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Worksheet name -> the criteria IDs of every category that lists it."""
+    lists_by_worksheet: dict[str, list[list[str]]] = {}
+    for category in categories:
+        for worksheet in category.worksheets:
+            lists_by_worksheet.setdefault(worksheet, []).append(criteria_ids_by_category[category.category_id])
+    return {worksheet: _merge_criteria_ids(lists) for worksheet, lists in lists_by_worksheet.items()}
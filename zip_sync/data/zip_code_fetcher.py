@@ -1,23 +1,128 @@
+import hashlib
+import json
 import requests
 import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from zip_sync.data.feed_cache import FeedCache
+from zip_sync.utils.http_session import get_http_session
+from zip_sync.utils.run_metrics import get_run_metrics
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FeedResult:
+    """
+    A fetched feed body. On a 304 (or an offline replay) the body is only read
+    from the cache if it's actually needed.
+    """
+    body_hash: str
+    not_modified: bool = False
+    from_cache: bool = False
+    body: Optional[bytes] = None
+    cache: Optional[FeedCache] = None
+
+    def read_body(self) -> bytes:
+        if self.body is None:
+            self.body = self.cache.read_body()
+        return self.body
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yields the body in chunks, streaming it from the cache if it isn't in memory."""
+        if self.body is not None:
+            for start in range(0, len(self.body), chunk_size):
+                yield self.body[start:start + chunk_size]
+        else:
+            yield from self.cache.iter_body(chunk_size)
+
+    def json(self):
+        return json.loads(self.read_body())
+
 
 class ZipCodeFetcher:
-    def __init__(self, url: str, max_retries: int = 5, backoff_factor: float = 1.0):
+    def __init__(
+        self,
+        url: str,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        session: Optional[requests.Session] = None,
+        cache: Optional[FeedCache] = None,
+        offline: bool = False,
+    ):
+        """
+        Args:
+            url (str): The feed URL.
+            session: HTTP session to use. Defaults to the shared pooled session.
+            cache: If given, requests are made conditional on the cached ETag / Last-Modified
+                   and a 304 is served from the cache.
+            offline (bool): Replay the cached response without touching the network (development).
+        """
         self.url = url
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.session = session
+        self.cache = cache
+        self.offline = offline
 
     def fetch(self):
+        return self.fetch_feed().json()
+
+    def fetch_feed(self) -> FeedResult:
+        if self.offline:
+            return self._replay_from_cache()
+
         attempt = 0
         while attempt < self.max_retries:
             try:
-                response = requests.get(self.url, timeout=10)
-                response.raise_for_status()
-                return response.json()
+                return self._request_feed()
             except requests.RequestException as e:
                 attempt += 1
                 if attempt == self.max_retries:
                     raise
                 sleep_time = self.backoff_factor * (2 ** (attempt - 1))
                 print(f"Fetch failed (attempt {attempt}/{self.max_retries}): {e}. Retrying in {sleep_time} seconds...")
+                get_run_metrics().increment("feed_retries")
                 time.sleep(sleep_time)
+
+    def _request_feed(self) -> FeedResult:
+        session = self.session or get_http_session()
+        cache_meta = self.cache.load_meta() if self.cache else {}
+        headers = self.cache.conditional_headers() if cache_meta else {}
+
+        run_metrics = get_run_metrics()
+        run_metrics.increment("feed_requests")
+        with session.get(self.url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304 and cache_meta:
+                run_metrics.increment("feed_not_modified")
+                return FeedResult(cache_meta["body_hash"], not_modified=True, from_cache=True, cache=self.cache)
+            response.raise_for_status()
+
+            if self.cache:
+                # Stream straight to disk; the body is read back in chunks when it's parsed
+                body_hash = self.cache.store_stream(
+                    _count_bytes(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+                return FeedResult(body_hash, cache=self.cache)
+
+            body = response.content
+            run_metrics.increment("feed_bytes", len(body))
+            return FeedResult(hashlib.sha256(body).hexdigest(), body=body)
+
+    def _replay_from_cache(self) -> FeedResult:
+        cache_meta = self.cache.load_meta() if self.cache else {}
+        if not cache_meta:
+            raise ValueError(f"Offline mode is enabled but there is no cached response for {self.url}")
+        print(f"Offline mode: replaying the cached feed fetched at {time.ctime(cache_meta['fetched_at'])}")
+        return FeedResult(cache_meta["body_hash"], from_cache=True, cache=self.cache)
+
+
+def _count_bytes(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Passes the chunks through, adding their size to the run's feed_bytes."""
+    run_metrics = get_run_metrics()
+    for chunk in chunks:
+        run_metrics.increment("feed_bytes", len(chunk))
+        yield chunk
@@ -0,0 +1,133 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from zip_sync.environment.folder_paths import get_zip_index_path
+
+# File layout (little-endian):
+#   header:  8 byte magic, uint32 entry count, uint32 reserved
+#   body:    <count> sorted uint32 zip codes, then <count> uint32 geo target IDs
+MAGIC = b"ZIPIDX1\x00"
+HEADER = struct.Struct("<8sII")
+
+
+def normalize_zip_code(zip_code) -> Optional[int]:
+    """
+    Returns the integer key for a zip code, so '01001', '1001' and 1001 all match.
+    ZIP+4 codes ('01001-1234') use the five digit part. Returns None for anything else.
+    """
+    if zip_code is None:
+        return None
+    if isinstance(zip_code, int):
+        return zip_code if zip_code >= 0 else None
+    zip_code = str(zip_code).strip().split("-", 1)[0]
+    if not zip_code.isdigit():
+        return None
+    return int(zip_code)
+
+
+def write_zip_index(path: str, zip_to_geo_target: dict) -> int:
+    """
+    Writes a zip -> geo target ID mapping to the binary index format.
+    Returns the number of entries written.
+    """
+    pairs = {}
+    for zip_code, geo_target_id in zip_to_geo_target.items():
+        key = normalize_zip_code(zip_code)
+        if key is None:
+            raise ValueError(f"Invalid zip code: {zip_code!r}")
+        pairs[key] = int(geo_target_id)
+
+    keys = array("I", sorted(pairs))
+    values = array("I", (pairs[key] for key in keys))
+    if sys.byteorder != "little":
+        keys.byteswap()
+        values.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys), 0))
+        f.write(keys.tobytes())
+        f.write(values.tobytes())
+    return len(keys)
+
+
+class ZipIndex:
+    """
+    Read-only zip code -> geo target ID lookup backed by a memory-mapped binary file.
+    Only the pages touched by lookups are read, so startup cost doesn't depend on the size of the index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a zip index file")
+        expected_size = HEADER.size + count * 8
+        if len(self._mmap) != expected_size:
+            raise ValueError(f"{path} is truncated: expected {expected_size} bytes, got {len(self._mmap)}")
+
+        self._count = count
+        self._keys = self._read_array(HEADER.size, count)
+        self._values = self._read_array(HEADER.size + count * 4, count)
+
+    def _read_array(self, offset: int, count: int):
+        view = memoryview(self._mmap)[offset:offset + count * 4]
+        if sys.byteorder == "little" and array("I").itemsize == 4:
+            return view.cast("I")
+        # Big-endian or unusual platforms: fall back to an in-memory copy
+        values = array("I")
+        values.frombytes(view.tobytes())
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, zip_code) -> bool:
+        return self.get(zip_code) is not None
+
+    def get(self, zip_code) -> Optional[str]:
+        """Returns the geo target ID for a zip code, or None if it isn't in the index."""
+        key = normalize_zip_code(zip_code)
+        if key is None:
+            return None
+        position = bisect_left(self._keys, key)
+        if position < self._count and self._keys[position] == key:
+            return str(self._values[position])
+        return None
+
+    def lookup_many(self, zip_codes: Iterable) -> list[str]:
+        """
+        Returns the geo target IDs for the zip codes that are in the index, in input order.
+        Unknown zip codes are dropped.
+        """
+        geo_target_ids = []
+        for zip_code in zip_codes:
+            geo_target_id = self.get(zip_code)
+            if geo_target_id is not None:
+                geo_target_ids.append(geo_target_id)
+        return geo_target_ids
+
+    def close(self) -> None:
+        if isinstance(self._keys, memoryview):
+            self._keys.release()
+            self._values.release()
+        self._mmap.close()
+
+
+_zip_index: Optional[ZipIndex] = None
+
+
+def get_zip_index() -> ZipIndex:
+    """Returns the process-wide zip index, opening it on first use."""
+    global _zip_index
+    if _zip_index is None:
+        _zip_index = ZipIndex(get_zip_index_path())
+    return _zip_index
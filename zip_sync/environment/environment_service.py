@@ -1,5 +1,6 @@
 # coding: utf-8
 import os
+from typing import Optional
 
 class EnvironmentService(object):
 
@@ -33,4 +34,226 @@ class EnvironmentService(object):
         google_sheet_url = os.getenv("GOOGLE_SHEET_URL", None)
         if google_sheet_url is None:
             raise ValueError("GOOGLE_SHEET_URL is not set")
-        return google_sheet_url
\ No newline at end of file
+        return google_sheet_url
+    
+    def get_full_reconcile_every_runs(self) -> int:
+        """Force a full sync after this many skipped (unchanged) runs. 0 disables the check."""
+        full_reconcile_every_runs = os.getenv("FULL_RECONCILE_EVERY_RUNS", "12")
+        return int(full_reconcile_every_runs)
+    
+    def get_full_reconcile_every_hours(self) -> float:
+        """Force a full sync if the last one was longer ago than this. 0 disables the check."""
+        full_reconcile_every_hours = os.getenv("FULL_RECONCILE_EVERY_HOURS", "6")
+        return float(full_reconcile_every_hours)
+    
+    def get_feed_cache_enabled(self) -> bool:
+        """Keep an on-disk copy of the feed and make requests conditional on it."""
+        feed_cache = os.getenv("FEED_CACHE", "true")
+        return feed_cache.lower() == "true"
+    
+    def get_feed_offline(self) -> bool:
+        """Replay the cached feed instead of calling the API (development only)."""
+        feed_offline = os.getenv("FEED_OFFLINE", "false")
+        return feed_offline.lower() == "true"
+    
+    def get_price_threshold(self) -> float:
+        """Zip codes need a max_call_price above this to be targeted."""
+        price_threshold = os.getenv("PRICE_THRESHOLD", "20")
+        return float(price_threshold)
+    
+    def get_price_rules(self) -> Optional[str]:
+        """
+        Comma separated price rules, e.g. "max_call_price>20,min_call_price>=5".
+        Takes precedence over PRICE_THRESHOLD when set.
+        """
+        return os.getenv("PRICE_RULES", None) or None
+    
+    def get_mutation_workers(self) -> int:
+        """Number of campaigns mutated in parallel."""
+        mutation_workers = os.getenv("MUTATION_WORKERS", "4")
+        return max(1, int(mutation_workers))
+    
+    def get_mutation_requests_per_second(self) -> float:
+        """Sustained mutate request rate shared by all workers."""
+        mutation_requests_per_second = os.getenv("MUTATION_REQUESTS_PER_SECOND", "4")
+        return float(mutation_requests_per_second)
+    
+    def get_mutation_burst(self) -> float:
+        """Number of mutate requests that can be sent back to back before the rate applies. At least 1."""
+        mutation_burst = os.getenv("MUTATION_BURST", "4")
+        return max(1.0, float(mutation_burst))
+    
+    def get_adaptive_batch_size(self) -> bool:
+        """Size mutate requests from API feedback. When false, CHUNK_SIZE is used."""
+        adaptive_batch_size = os.getenv("ADAPTIVE_BATCH_SIZE", "true")
+        return adaptive_batch_size.lower() == "true"
+    
+    def get_mutation_batch_size_initial(self) -> int:
+        """Starting batch size when no size has been remembered from a previous run."""
+        mutation_batch_size_initial = os.getenv("MUTATION_BATCH_SIZE_INITIAL", "1000")
+        return int(mutation_batch_size_initial)
+    
+    def get_mutation_batch_size_min(self) -> int:
+        mutation_batch_size_min = os.getenv("MUTATION_BATCH_SIZE_MIN", "10")
+        return int(mutation_batch_size_min)
+    
+    def get_mutation_batch_size_max(self) -> int:
+        mutation_batch_size_max = os.getenv("MUTATION_BATCH_SIZE_MAX", "5000")
+        return int(mutation_batch_size_max)
+    
+    def get_mutation_target_latency_seconds(self) -> float:
+        """Mutate requests slower than this shrink the batch size."""
+        mutation_target_latency_seconds = os.getenv("MUTATION_TARGET_LATENCY_SECONDS", "10")
+        return float(mutation_target_latency_seconds)
+    
+    def get_cross_campaign_batching(self) -> bool:
+        """Pack changes for many campaigns into each mutate request instead of one campaign per request."""
+        cross_campaign_batching = os.getenv("CROSS_CAMPAIGN_BATCHING", "true")
+        return cross_campaign_batching.lower() == "true"
+    
+    def get_batch_job_threshold(self) -> int:
+        """Diffs with more operations than this are sent as a BatchJobService job. 0 disables batch jobs."""
+        batch_job_threshold = os.getenv("BATCH_JOB_THRESHOLD", "20000")
+        return int(batch_job_threshold)
+    
+    def get_batch_job_timeout_seconds(self) -> float:
+        batch_job_timeout_seconds = os.getenv("BATCH_JOB_TIMEOUT_SECONDS", "600")
+        return float(batch_job_timeout_seconds)
+    
+    def get_criterion_report_shard_size(self) -> int:
+        """Number of campaigns in each criterion report query."""
+        criterion_report_shard_size = os.getenv("CRITERION_REPORT_SHARD_SIZE", "500")
+        return max(1, int(criterion_report_shard_size))
+    
+    def get_criterion_report_workers(self) -> int:
+        """Number of criterion report shards streamed in parallel."""
+        criterion_report_workers = os.getenv("CRITERION_REPORT_WORKERS", "4")
+        return max(1, int(criterion_report_workers))
+    
+    def get_google_ads_keepalive(self) -> bool:
+        """Send gRPC keepalive pings on the Google Ads channels."""
+        google_ads_keepalive = os.getenv("GOOGLE_ADS_KEEPALIVE", "true")
+        return google_ads_keepalive.lower() == "true"
+    
+    def get_sheets_max_cells_per_request(self) -> int:
+        """Largest number of cells written in one Sheets values batch update."""
+        sheets_max_cells_per_request = os.getenv("SHEETS_MAX_CELLS_PER_REQUEST", "40000")
+        return max(1, int(sheets_max_cells_per_request))
+    
+    def get_sheets_write_workers(self) -> int:
+        """Number of Sheets batch update requests sent in parallel when a write is split."""
+        sheets_write_workers = os.getenv("SHEETS_WRITE_WORKERS", "4")
+        return max(1, int(sheets_write_workers))
+    
+    def get_sheets_diff_writes(self) -> bool:
+        """Only write the Sheets rows that changed since the last run."""
+        sheets_diff_writes = os.getenv("SHEETS_DIFF_WRITES", "true")
+        return sheets_diff_writes.lower() == "true"
+    
+    def get_sheets_verify_every_hours(self) -> float:
+        """Re-read each worksheet to catch manual edits at least this often. 0 only reads worksheets with no snapshot."""
+        sheets_verify_every_hours = os.getenv("SHEETS_VERIFY_EVERY_HOURS", "24")
+        return float(sheets_verify_every_hours)
+    
+    def get_slack_alert_cooldown_seconds(self) -> float:
+        """Repeats of the same alert within this many seconds are not sent."""
+        slack_alert_cooldown_seconds = os.getenv("SLACK_ALERT_COOLDOWN_SECONDS", "300")
+        return float(slack_alert_cooldown_seconds)
+    
+    def get_slack_flush_timeout_seconds(self) -> float:
+        """Longest a run waits at the end for queued Slack messages to send."""
+        slack_flush_timeout_seconds = os.getenv("SLACK_FLUSH_TIMEOUT_SECONDS", "10")
+        return float(slack_flush_timeout_seconds)
+    
+    def get_serve_interval_seconds(self) -> float:
+        """Seconds between the starts of runs in `serve` mode."""
+        serve_interval_seconds = os.getenv("SERVE_INTERVAL_SECONDS", "300")
+        return float(serve_interval_seconds)
+    
+    def get_serve_jitter_seconds(self) -> float:
+        """Each `serve` run starts up to this many seconds early or late."""
+        serve_jitter_seconds = os.getenv("SERVE_JITTER_SECONDS", "30")
+        return float(serve_jitter_seconds)
+    
+    def get_campaign_list_ttl_seconds(self) -> float:
+        """How long a long-running process reuses the active campaign list. 0 fetches it every run."""
+        campaign_list_ttl_seconds = os.getenv("CAMPAIGN_LIST_TTL_SECONDS", "900")
+        return float(campaign_list_ttl_seconds)
+    
+    def get_criterion_replica(self) -> bool:
+        """Keep a local replica of the campaigns' criteria instead of downloading them all every run."""
+        criterion_replica = os.getenv("CRITERION_REPLICA", "true")
+        return criterion_replica.lower() == "true"
+    
+    def get_criterion_replica_full_refresh_hours(self) -> float:
+        """Replace the criterion replica with a full report at least this often. 0 only does so on a cold start."""
+        criterion_replica_full_refresh_hours = os.getenv("CRITERION_REPLICA_FULL_REFRESH_HOURS", "24")
+        return float(criterion_replica_full_refresh_hours)
+    
+    def get_feed_url(self) -> Optional[str]:
+        """Fetch the price list from this URL instead of the eLocal API (e.g. a local stand-in for load tests)."""
+        return os.getenv("FEED_URL", None) or None
+    
+    def get_run_metrics_format(self) -> str:
+        """How each run's metrics are written: "jsonl" (appended), "prometheus" (a textfile collector file) or "off"."""
+        run_metrics_format = os.getenv("RUN_METRICS_FORMAT", "jsonl")
+        return run_metrics_format.lower()
+    
+    def get_run_metrics_path(self) -> Optional[str]:
+        """Where run metrics are written. Defaults to state/run_metrics.jsonl or state/run_metrics.prom."""
+        return os.getenv("RUN_METRICS_PATH", None) or None
+    
+    def get_run_time_budget_seconds(self) -> float:
+        """Runs that take longer than this send an alert. 0 disables the check."""
+        run_time_budget_seconds = os.getenv("RUN_TIME_BUDGET_SECONDS", "0")
+        return float(run_time_budget_seconds)
+    
+    def get_profile_mode(self) -> str:
+        """Profile runs: "cpu" (sampled stacks), "mem" (allocations live at the peak) or "off"."""
+        profile_mode = os.getenv("ZIP_SYNC_PROFILE", "off")
+        return profile_mode.lower()
+    
+    def get_profile_sample_rate(self) -> float:
+        """Fraction of runs profiled when ZIP_SYNC_PROFILE is set, e.g. 0.05 for one run in twenty."""
+        profile_sample_rate = os.getenv("ZIP_SYNC_PROFILE_SAMPLE_RATE", "1")
+        return float(profile_sample_rate)
+    
+    def get_profile_interval_ms(self) -> float:
+        """How often the cpu profiler samples the stacks."""
+        profile_interval_ms = os.getenv("ZIP_SYNC_PROFILE_INTERVAL_MS", "10")
+        return float(profile_interval_ms)
+    
+    def get_profile_mem_frames(self) -> int:
+        """Frames kept per allocation traceback in mem mode. More attribute better but slow the run down more."""
+        profile_mem_frames = os.getenv("ZIP_SYNC_PROFILE_MEM_FRAMES", "10")
+        return int(profile_mem_frames)
+    
+    def get_profile_top(self) -> int:
+        """Number of entries in each table of a profile report."""
+        profile_top = os.getenv("ZIP_SYNC_PROFILE_TOP", "20")
+        return int(profile_top)
+    
+    def get_profile_keep(self) -> int:
+        """Number of profiles of each mode kept in state/profiles."""
+        profile_keep = os.getenv("ZIP_SYNC_PROFILE_KEEP", "20")
+        return int(profile_keep)
+    
+    def get_google_ads_account_ids(self) -> list[str]:
+        """Comma-separated customer IDs to sync in multi-account mode. Empty syncs GOOGLE_ADS_ACCOUNT_ID only."""
+        account_ids = os.getenv("GOOGLE_ADS_ACCOUNT_IDS", "")
+        return [account_id.strip().replace("-", "") for account_id in account_ids.split(",") if account_id.strip()]
+    
+    def get_google_ads_manager_account_id(self) -> Optional[str]:
+        """Manager account whose client accounts are all synced, when GOOGLE_ADS_ACCOUNT_IDS isn't set."""
+        manager_account_id = os.getenv("GOOGLE_ADS_MANAGER_ACCOUNT_ID", None) or None
+        return manager_account_id.replace("-", "") if manager_account_id else None
+    
+    def get_account_workers(self) -> int:
+        """Number of accounts synced in parallel, each in its own process."""
+        account_workers = os.getenv("ACCOUNT_WORKERS", "4")
+        return max(1, int(account_workers))
+    
+    def get_feed_categories(self) -> Optional[str]:
+        """JSON list mapping eLocal call categories to campaign name patterns and price rules."""
+        feed_categories = os.getenv("FEED_CATEGORIES", None) or None
+        return feed_categories
@@ -28,4 +28,26 @@ def get_google_credentials_path() -> str:
     """Return the path to the google credentials file.
     The same file handles both the Google Ads API and the Google Sheets API.
     """
-    return os.path.join(_get_secrets_dir_path(), "google-credentials.json")
\ No newline at end of file
+    return os.path.join(_get_secrets_dir_path(), "google-credentials.json")
+
+def get_zip_index_path() -> str:
+    """Return the path to the binary zip code -> geo target ID index."""
+    return os.path.join(_get_project_root_path(), "zip_sync", "constants", "zips_index.bin")
+
+def get_state_dir_path() -> str:
+    """Return the path to the directory holding local run state (fingerprints, caches).
+    STATE_DIR moves it, e.g. so a load test doesn't touch the real state.
+    """
+    state_dir = os.getenv("STATE_DIR", None)
+    if state_dir:
+        return os.path.abspath(state_dir)
+    return os.path.abspath(os.path.join(_get_project_root_path(), "state"))
+
+def get_run_metrics_path(format: str) -> str:
+    """Return the default path of the run metrics file for a format ("jsonl" or "prometheus")."""
+    extension = "prom" if format == "prometheus" else "jsonl"
+    return os.path.join(get_state_dir_path(), f"run_metrics.{extension}")
+
+def get_profile_dir_path() -> str:
+    """Return the path to the directory holding run profiles."""
+    return os.path.join(get_state_dir_path(), "profiles")
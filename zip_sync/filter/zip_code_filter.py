@@ -1,4 +1,23 @@
-from typing import List, Dict
+import codecs
+import json
+import operator
+from array import array
+from dataclasses import dataclass
+from itertools import compress, repeat
+from typing import Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_PRICE_FIELD = 'max_call_price'
+DEFAULT_PRICE_THRESHOLD = 20.0
+
+# Number of feed entries held in the column arrays at once
+DEFAULT_BATCH_SIZE = 5000
+
+OPERATORS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+}
 
 def is_max_call_price_above_threshold(entry: dict, threshold: float) -> bool:
     try:
@@ -6,9 +25,123 @@ def is_max_call_price_above_threshold(entry: dict, threshold: float) -> bool:
     except (TypeError, ValueError):
         return False
 
-def filter_zip_codes(data: List[Dict]) -> List[str]:
-    result = []
-    for entry in data:
-        if is_max_call_price_above_threshold(entry, 20):
-            result.append(str(entry.get('zip_code')))
-    return result
+@dataclass(frozen=True)
+class PriceRule:
+    """A comparison a zip code's price field must pass, e.g. max_call_price > 20."""
+    field: str = DEFAULT_PRICE_FIELD
+    operator: str = '>'
+    threshold: float = DEFAULT_PRICE_THRESHOLD
+
+    @classmethod
+    def from_string(cls, rule: str) -> "PriceRule":
+        """Parses a rule like 'max_call_price>20' or 'min_call_price >= 5'."""
+        for symbol in OPERATORS:  # two character operators are checked first
+            field, found, threshold = rule.partition(symbol)
+            if found:
+                try:
+                    return cls(field.strip(), symbol, float(threshold))
+                except ValueError:
+                    break
+        raise ValueError(f"Invalid price rule {rule!r}. Expected e.g. 'max_call_price>20'")
+
+def parse_price_rules(rules: str) -> list[PriceRule]:
+    """Parses a comma separated list of rules, e.g. 'max_call_price>20,min_call_price>=5'."""
+    return [PriceRule.from_string(rule) for rule in rules.split(',') if rule.strip()]
+
+def _to_price(value) -> float:
+    """Missing or non-numeric prices become NaN, which fails every comparison."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+class ZipCodeColumns:
+    """
+    A batch of feed entries held as columns: the zip codes plus one float array per price field.
+    """
+
+    def __init__(self, price_fields: Iterable[str]):
+        self.zip_codes: list[str] = []
+        self.prices: dict[str, array] = {field: array('d') for field in price_fields}
+
+    def __len__(self) -> int:
+        return len(self.zip_codes)
+
+    def append(self, entry: dict) -> None:
+        self.zip_codes.append(str(entry.get('zip_code')))
+        for field, column in self.prices.items():
+            column.append(_to_price(entry.get(field)))
+
+    def filter(self, rules: list[PriceRule]) -> Iterator[str]:
+        """Yields the zip codes that pass every rule, comparing whole columns at once."""
+        mask = None
+        for rule in rules:
+            passed = map(OPERATORS[rule.operator], self.prices[rule.field], repeat(rule.threshold))
+            mask = passed if mask is None else map(operator.and_, mask, passed)
+        if mask is None:
+            return iter(self.zip_codes)
+        return compress(self.zip_codes, mask)
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Incrementally parses a JSON array of objects from byte chunks, yielding one entry at a time,
+    so the whole response never has to be held in memory.
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    started = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + utf8_decoder.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position == len(buffer):
+                break
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError("Expected the feed to be a JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == ']':
+                return
+            try:
+                entry, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # incomplete entry, wait for the next chunk
+            if not isinstance(entry, dict):
+                raise ValueError(f"Expected feed entries to be objects, got {entry!r}")
+            yield entry
+
+    # A truncated feed must not be mistaken for a short one
+    raise ValueError("Unexpected end of feed")
+
+def filter_zip_code_entries(
+    entries: Iterable[dict],
+    rules: Optional[list[PriceRule]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Yields the zip codes of entries that pass every price rule.
+    Entries are collected into column batches of batch_size, so memory stays flat however long the feed is.
+    """
+    rules = rules if rules is not None else [PriceRule()]
+    price_fields = {rule.field for rule in rules}
+    columns = ZipCodeColumns(price_fields)
+    for entry in entries:
+        columns.append(entry)
+        if len(columns) >= batch_size:
+            yield from columns.filter(rules)
+            columns = ZipCodeColumns(price_fields)
+    yield from columns.filter(rules)
+
+def filter_zip_code_stream(chunks: Iterable[bytes], rules: Optional[list[PriceRule]] = None) -> Iterator[str]:
+    """Yields the passing zip codes straight from the raw feed body chunks."""
+    return filter_zip_code_entries(iter_feed_entries(chunks), rules)
+
+def filter_zip_codes(data: List[Dict], rules: Optional[list[PriceRule]] = None) -> List[str]:
+    return list(filter_zip_code_entries(data, rules))
@@ -1,24 +1,49 @@
-import gspread
+import threading
 import time
-from oauth2client.service_account import ServiceAccountCredentials
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from zip_sync.sheets.sheets_snapshot import SheetsSnapshot, diff_column
+from zip_sync.utils.run_metrics import get_run_metrics
 
 class SheetsService:
-    def __init__(self, credentials_path: str, spreadsheet_url: str):
+    def __init__(self, credentials_path: str, spreadsheet_url: str, max_cells_per_request: int = 40000, max_workers: int = 4, client=None):
+        """
+        Args:
+            client: An authorized gspread-like client to use instead of authorizing with the
+                    credentials file (e.g. a local stand-in for load tests). It's kept across session resets.
+        """
         self.credentials_path = credentials_path
         self.spreadsheet_url = spreadsheet_url
+        self.max_cells_per_request = max(1, max_cells_per_request)
+        self.max_workers = max(1, max_workers)
+        # The authorized client and spreadsheet handle are reused for every call,
+        # and only rebuilt after an error that might mean the session went bad
+        self._lock = threading.Lock()
+        self._fixed_client = client
+        self._client = client
+        self._spreadsheet = None
 
     def authorize(self):
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        credentials = ServiceAccountCredentials.from_json_keyfile_name(self.credentials_path, scope)
-        return gspread.authorize(credentials)
+        with self._lock:
+            if self._client is None:
+                import gspread
+                from oauth2client.service_account import ServiceAccountCredentials
+
+                scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
+                credentials = ServiceAccountCredentials.from_json_keyfile_name(self.credentials_path, scope)
+                self._client = gspread.authorize(credentials)
+            return self._client
     
     def get_spreadsheet(self,):
         """
         Gets and returns a spreadsheet instance based on a spreadsheet url
         """
         def method():
+            if self._spreadsheet is not None:
+                return self._spreadsheet
             gc = self.authorize()
             ss = gc.open_by_url(self.spreadsheet_url)
+            self._spreadsheet = ss
 
             return ss
         
@@ -26,6 +51,11 @@ class SheetsService:
 
         return ss
     
+    def _reset_session(self):
+        with self._lock:
+            self._client = self._fixed_client
+            self._spreadsheet = None
+    
     def _try_spreadsheet_method(self, method):
 
         """
@@ -45,6 +75,8 @@ class SheetsService:
                     raise e
                 if self._is_spreadsheet_error(e):
                     print("Spreadsheet error. Waiting and trying again.")
+                    get_run_metrics().increment("sheets_retries")
+                    self._reset_session()
                     time.sleep((int(i)+1)*3)
                 else:
                     print(str(e))
@@ -90,6 +122,144 @@ class SheetsService:
             worksheet.update(cell_range, value_matrix)
         self._try_spreadsheet_method(method)
 
+    def update_columns(self, worksheet_names: list[str], values: list, column: int = 1, start_row: int = 2, snapshot: Optional[SheetsSnapshot] = None):
+        """
+        Writes the same column of values to every worksheet. See update_worksheet_columns.
+        Args:
+            worksheet_names (list[str]): The names of the worksheets/tabs.
+            values (list): List of values to write (one per row).
+            column (int): Column number (1 = A, 2 = B, ...).
+            start_row (int): Row number to start writing (default 2).
+            snapshot (SheetsSnapshot): Optional record of what was last written to each worksheet.
+        """
+        self.update_worksheet_columns({worksheet_name: values for worksheet_name in worksheet_names}, column, start_row, snapshot)
+
+    def update_worksheet_columns(self, values_by_worksheet: dict[str, list], column: int = 1, start_row: int = 2, snapshot: Optional[SheetsSnapshot] = None):
+        """
+        Writes a column of values to each worksheet with values batch-update requests.
+        All the tabs normally go in one request; payloads over max_cells_per_request are split
+        into several requests that are sent in parallel.
+
+        With a snapshot, only the rows that differ from what was last written (or, when a
+        verification read is due, from what's in the sheet) are sent, including clearing rows
+        left over from a longer list. The snapshot is updated once the writes succeed.
+        Args:
+            values_by_worksheet (dict[str, list]): Worksheet/tab name -> values to write (one per row).
+            column (int): Column number (1 = A, 2 = B, ...).
+            start_row (int): Row number to start writing (default 2).
+            snapshot (SheetsSnapshot): Optional record of what was last written to each worksheet.
+        """
+        worksheet_names = list(values_by_worksheet)
+        if snapshot is None:
+            ranges = [
+                range_data
+                for worksheet_name, values in values_by_worksheet.items()
+                for range_data in self._get_column_ranges(worksheet_name, values, column, start_row)
+            ]
+            self._send_ranges(ranges)
+            return
+
+        # Tabs usually share a list, so each distinct list is only converted once
+        string_values: dict[int, list[str]] = {}
+        for values in values_by_worksheet.values():
+            if id(values) not in string_values:
+                string_values[id(values)] = [str(v) for v in values]
+        new_values_by_worksheet = {worksheet_name: string_values[id(values)] for worksheet_name, values in values_by_worksheet.items()}
+        keys = {worksheet_name: snapshot.get_key(worksheet_name, column, start_row) for worksheet_name in worksheet_names}
+        to_verify = [worksheet_name for worksheet_name in worksheet_names if snapshot.needs_verification(keys[worksheet_name])]
+        current_values = self.read_columns(to_verify, column, start_row)
+
+        ranges = []
+        for worksheet_name in worksheet_names:
+            if worksheet_name in current_values:
+                old_values = current_values[worksheet_name]
+            else:
+                old_values = snapshot.get_values(keys[worksheet_name]) or []
+            for offset, run_values in diff_column(old_values, new_values_by_worksheet[worksheet_name]):
+                ranges.extend(self._get_column_ranges(worksheet_name, run_values, column, start_row + offset))
+        cells = sum(len(range_data["values"]) for range_data in ranges)
+        print(f"Writing {cells} changed cells across {len(worksheet_names)} worksheets ({len(to_verify)} verified against the sheet).")
+        self._send_ranges(ranges)
+
+        for worksheet_name in worksheet_names:
+            snapshot.record(keys[worksheet_name], new_values_by_worksheet[worksheet_name], verified=worksheet_name in current_values)
+        snapshot.save()
+
+    def read_columns(self, worksheet_names: list[str], column: int = 1, start_row: int = 2) -> dict[str, list[str]]:
+        """
+        Reads a column from each worksheet in one values batch-get request.
+        Returns worksheet name -> values, with "" for empty cells.
+        """
+        if not worksheet_names:
+            return {}
+        col_letter = self._get_column_letter(column)
+        ranges = [f"{self._quote_worksheet_name(worksheet_name)}!{col_letter}{start_row}:{col_letter}" for worksheet_name in worksheet_names]
+        get_run_metrics().increment("sheets_requests")
+        response = self._try_spreadsheet_method(lambda: self.get_spreadsheet().values_batch_get(ranges))
+        value_ranges = response.get("valueRanges", [])
+        get_run_metrics().increment("sheets_rows_read", sum(len(value_range.get("values", [])) for value_range in value_ranges))
+        return {
+            worksheet_name: [str(row[0]) if row else "" for row in value_range.get("values", [])]
+            for worksheet_name, value_range in zip(worksheet_names, value_ranges)
+        }
+
+    def _send_ranges(self, ranges: list[dict]):
+        requests = self._pack_ranges(ranges)
+        if not requests:
+            return
+
+        run_metrics = get_run_metrics()
+        run_metrics.increment("sheets_cells_written", sum(len(range_data["values"]) for range_data in ranges))
+
+        def send(data: list[dict]):
+            body = {"valueInputOption": "RAW", "data": data}
+            run_metrics.increment("sheets_requests")
+            return self._try_spreadsheet_method(lambda: self.get_spreadsheet().values_batch_update(body))
+
+        if len(requests) == 1:
+            send(requests[0])
+            return
+        print(f"Writing {len(ranges)} ranges in {len(requests)} batch update requests.")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests)), thread_name_prefix="sheets") as executor:
+            # list() so an error in any request is raised here
+            list(executor.map(send, requests))
+
+    def _get_column_ranges(self, worksheet_name: str, values: list, column: int, start_row: int) -> list[dict]:
+        """Splits one worksheet's column into value ranges of at most max_cells_per_request rows."""
+        col_letter = self._get_column_letter(column)
+        quoted_name = self._quote_worksheet_name(worksheet_name)
+        ranges = []
+        for offset in range(0, len(values), self.max_cells_per_request):
+            chunk = values[offset:offset + self.max_cells_per_request]
+            first_row = start_row + offset
+            last_row = first_row + len(chunk) - 1
+            ranges.append({
+                "range": f"{quoted_name}!{col_letter}{first_row}:{col_letter}{last_row}",
+                "values": [[v] for v in chunk],
+            })
+        return ranges
+
+    def _get_column_letter(self, column: int) -> str:
+        return chr(ord('A') + column - 1)
+
+    def _quote_worksheet_name(self, worksheet_name: str) -> str:
+        return "'" + worksheet_name.replace("'", "''") + "'"
+
+    def _pack_ranges(self, ranges: list[dict]) -> list[list[dict]]:
+        """Groups value ranges into requests of at most max_cells_per_request cells."""
+        requests = []
+        current, current_cells = [], 0
+        for range_data in ranges:
+            cells = len(range_data["values"])
+            if current and current_cells + cells > self.max_cells_per_request:
+                requests.append(current)
+                current, current_cells = [], 0
+            current.append(range_data)
+            current_cells += cells
+        if current:
+            requests.append(current)
+        return requests
+
     def get_worksheet_names(self):
         """
         Returns a list of all worksheet/tab names in the spreadsheet.
@@ -0,0 +1,73 @@
+import time
+from typing import Optional
+
+from zip_sync.state.state_file import get_state_file_path, read_state, write_state
+
+SHEETS_SNAPSHOT_STATE_NAME = "sheets_snapshot"
+
+
+def diff_column(old_values: list[str], new_values: list[str], max_gap: int = 5) -> list[tuple[int, list[str]]]:
+    """
+    Returns the (row offset, values) runs needed to turn old_values into new_values.
+    Rows past the end of new_values that held something are cleared with "".
+    Runs separated by max_gap unchanged rows or fewer are merged, since one slightly
+    larger range is cheaper than several requests' worth of ranges.
+    """
+    length = max(len(old_values), len(new_values))
+    runs: list[tuple[int, int]] = []
+    for index in range(length):
+        old_value = old_values[index] if index < len(old_values) else ""
+        new_value = new_values[index] if index < len(new_values) else ""
+        if old_value == new_value:
+            continue
+        if runs and index - runs[-1][1] <= max_gap + 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+
+    padded_values = list(new_values) + [""] * (length - len(new_values))
+    return [(start, padded_values[start:end + 1]) for start, end in runs]
+
+
+class SheetsSnapshot:
+    """
+    Local copy of the column last written to each worksheet, so later runs only send the rows that changed.
+
+    The snapshot can drift from the sheet if someone edits it by hand, so each worksheet is re-read
+    from the sheet every `verify_every_hours` and the diff is taken against what's really there.
+    """
+
+    def __init__(self, spreadsheet_url: str, verify_every_hours: float = 24.0, path: Optional[str] = None):
+        self.spreadsheet_url = spreadsheet_url
+        self.verify_every_hours = verify_every_hours
+        self.path = path or get_state_file_path(SHEETS_SNAPSHOT_STATE_NAME)
+        state = read_state(self.path)
+        # A snapshot of a different spreadsheet is no use
+        self._worksheets: dict = state.get("worksheets", {}) if state.get("spreadsheet_url") == spreadsheet_url else {}
+
+    @staticmethod
+    def get_key(worksheet_name: str, column: int, start_row: int) -> str:
+        return f"{worksheet_name}!{column}:{start_row}"
+
+    def get_values(self, key: str) -> Optional[list[str]]:
+        """Returns the values last written for a worksheet column, or None if there's no snapshot of it."""
+        worksheet = self._worksheets.get(key)
+        return worksheet["values"] if worksheet else None
+
+    def needs_verification(self, key: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        worksheet = self._worksheets.get(key)
+        if worksheet is None:
+            return True
+        return self.verify_every_hours > 0 and now - worksheet.get("verified_at", 0) >= self.verify_every_hours * 3600
+
+    def record(self, key: str, values: list[str], verified: bool, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        previous = self._worksheets.get(key, {})
+        self._worksheets[key] = {
+            "values": list(values),
+            "verified_at": now if verified else previous.get("verified_at", 0),
+        }
+
+    def save(self) -> None:
+        write_state(self.path, {"spreadsheet_url": self.spreadsheet_url, "worksheets": self._worksheets})
@@ -1,9 +1,9 @@
-from zip_sync.slack.slack_notifier import SlackNotifier
+from zip_sync.slack.slack_dispatcher import get_slack_dispatcher
 import os
 
 def send_admin_slack(message: str):
+    """Adds the message to this run's admin digest. It's sent in the background by flush_slack()."""
     slack_admin_webhook = os.getenv("SLACK_ADMIN_WEBHOOK", None)
     if not slack_admin_webhook:
         raise ValueError("SLACK_ADMIN_WEBHOOK is not set in the environment variables")
-    slack_notifier = SlackNotifier(slack_admin_webhook=slack_admin_webhook)
-    slack_notifier.send_admin_message(message)
\ No newline at end of file
+    get_slack_dispatcher().notify_admin(slack_admin_webhook, message)
\ No newline at end of file
@@ -1,9 +1,9 @@
-from zip_sync.slack.slack_notifier import SlackNotifier
+from zip_sync.slack.slack_dispatcher import get_slack_dispatcher
 import os
 
 def send_alert_slack(message: str):
+    """Queues the alert to be sent straight away in the background. Repeats within the cooldown are dropped."""
     slack_alerts_webhook = os.getenv("SLACK_ALERTS_WEBHOOK", None)
     if not slack_alerts_webhook:
         raise ValueError("SLACK_ALERTS_WEBHOOK is not set in the environment variables")
-    slack_notifier = SlackNotifier(slack_alerts_webhook=slack_alerts_webhook)
-    slack_notifier.send_alerts_message(message)
\ No newline at end of file
+    get_slack_dispatcher().notify_alert(slack_alerts_webhook, message)
\ No newline at end of file
@@ -0,0 +1,125 @@
+import atexit
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.slack.slack_notifier import SlackNotifier
+
+# Slack truncates message text at 40,000 characters
+MAX_MESSAGE_LENGTH = 35000
+
+
+class SlackDispatcher:
+    """
+    Sends Slack messages from a background thread so the sync never waits on Slack.
+
+    * Admin messages are collected into one digest per run, sent by `flush()`.
+    * Alerts go out straight away, but an alert with the same first line as one sent
+      within `alert_cooldown` seconds is dropped and only counted in the digest.
+    * `flush()` waits for the queue to drain for at most `timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        notifier: Optional[SlackNotifier] = None,
+        alert_cooldown: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._notifier = notifier or SlackNotifier()
+        self._alert_cooldown = alert_cooldown
+        self._clock = clock
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._digests: dict[str, list[str]] = {}
+        self._last_alert_at: dict[str, float] = {}
+        self._suppressed_alerts: dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def notify_admin(self, webhook_url: str, message: str) -> None:
+        """Adds a message to the run's digest for webhook_url."""
+        with self._lock:
+            self._digests.setdefault(webhook_url, []).append(f"[{time.strftime('%H:%M:%S')}] {message}")
+
+    def notify_alert(self, webhook_url: str, message: str) -> None:
+        """Queues an alert for sending, unless the same alert went out recently."""
+        key = message.split("\n", 1)[0]
+        with self._lock:
+            now = self._clock()
+            last_sent_at = self._last_alert_at.get(key)
+            if last_sent_at is not None and now - last_sent_at < self._alert_cooldown:
+                self._suppressed_alerts[key] = self._suppressed_alerts.get(key, 0) + 1
+                return
+            self._last_alert_at[key] = now
+        self._enqueue(webhook_url, message)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Sends the digests and waits up to `timeout` seconds for everything queued to go out.
+        Returns False if messages were still unsent when the time ran out.
+        """
+        with self._lock:
+            digests, self._digests = self._digests, {}
+            suppressed_alerts, self._suppressed_alerts = self._suppressed_alerts, {}
+
+        for webhook_url, messages in digests.items():
+            if suppressed_alerts:
+                messages = messages + [
+                    f"Suppressed {count} repeats of alert: {key}" for key, count in suppressed_alerts.items()
+                ]
+            for part in _split_message("\n".join(messages)):
+                self._enqueue(webhook_url, part)
+        return self._wait(timeout)
+
+    def _enqueue(self, webhook_url: str, message: str) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="slack", daemon=True)
+                self._thread.start()
+        self._queue.put((webhook_url, message))
+
+    def _run(self) -> None:
+        while True:
+            webhook_url, message = self._queue.get()
+            try:
+                self._notifier.send_message(message, webhook_url)
+            except Exception as e:
+                print(f"error when sending slack notification: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print(f"Gave up waiting for {self._queue.unfinished_tasks} slack notifications after {timeout:.0f}s")
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+
+def _split_message(message: str) -> list[str]:
+    return [message[i:i + MAX_MESSAGE_LENGTH] for i in range(0, len(message), MAX_MESSAGE_LENGTH)]
+
+
+_dispatcher: Optional[SlackDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_slack_dispatcher() -> SlackDispatcher:
+    """Returns the process-wide dispatcher. Anything still queued gets a bounded flush at exit."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            environment_service = EnvironmentService()
+            _dispatcher = SlackDispatcher(alert_cooldown=environment_service.get_slack_alert_cooldown_seconds())
+            atexit.register(_dispatcher.flush, environment_service.get_slack_flush_timeout_seconds())
+        return _dispatcher
+
+
+def flush_slack() -> bool:
+    """Sends this run's digest and waits (bounded by SLACK_FLUSH_TIMEOUT_SECONDS) for queued messages."""
+    return get_slack_dispatcher().flush(EnvironmentService().get_slack_flush_timeout_seconds())
@@ -1,16 +1,25 @@
 import requests
 from typing import Optional
 
+from zip_sync.utils.http_session import get_http_session
+
+# (connect, read) timeouts, so a slow Slack can't hold up whoever is sending
+DEFAULT_TIMEOUT = (3.05, 10)
+
 
 class SlackNotifier:
 
     def __init__(
         self,
         slack_admin_webhook: Optional[str] = None,
-        slack_alerts_webhook: Optional[str] = None
+        slack_alerts_webhook: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout=DEFAULT_TIMEOUT,
     ):
         self.slack_admin_webhook = slack_admin_webhook
         self.slack_alerts_webhook = slack_alerts_webhook
+        self.session = session or get_http_session()
+        self.timeout = timeout
         
     def send_alerts_message(self, message: str) -> None:
         if not self.slack_alerts_webhook:
@@ -23,12 +32,16 @@ class SlackNotifier:
         if not self.slack_admin_webhook:
             raise ValueError("slack_admin_webhook is not set")
         self._send_message(message, self.slack_admin_webhook)
+
+    def send_message(self, message: str, webhook_url: str) -> None:
+        self._send_message(message, webhook_url)
     
     def _send_message(self, message: str, webhook_url: str) -> None:
-        response = requests.post(
+        response = self.session.post(
             webhook_url,
             json={'text': message},
             headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
         )
         if response.status_code != 200:
-            print(f"error when sending slack notification: {response.status_code}")
\ No newline at end of file
+            print(f"error when sending slack notification: {response.status_code}")
@@ -0,0 +1,137 @@
+import time
+from typing import Iterable, Optional
+
+from zip_sync.ads_api.campaign_location_criteria import CampaignLocationCriteria
+from zip_sync.ads_api.change_status_reader import CriterionStatusChange, parse_campaign_criterion_resource_name
+from zip_sync.ads_api.criterion_changes import CampaignMutationResult
+from zip_sync.state.state_file import get_state_file_path, read_state, write_state
+
+CRITERION_REPLICA_STATE_NAME = "criterion_replica"
+
+
+class CriterionReplica:
+    """
+    Local copy of every synced campaign's location criteria, so a run doesn't have to
+    download the whole account's targeting to work out its diff.
+
+    * The sync's own successful mutations are applied to it directly.
+    * Changes made outside the sync are picked up from the change_status resource,
+      starting at `checkpoint` (account time).
+    * A campaign whose mutations didn't all succeed is dropped, so it's re-fetched next run.
+    * A full report replaces everything on a cold start and every `full_refresh_every_hours`.
+    """
+
+    def __init__(self, customer_id: str, full_refresh_every_hours: float = 24.0, path: Optional[str] = None):
+        self.customer_id = customer_id
+        self.full_refresh_every_hours = full_refresh_every_hours
+        self.path = path or get_state_file_path(CRITERION_REPLICA_STATE_NAME)
+        state = read_state(self.path)
+        if state.get("customer_id") != customer_id:
+            state = {}
+        self.refreshed_at: Optional[float] = state.get("refreshed_at")
+        self.checkpoint: Optional[str] = state.get("checkpoint")
+        self._campaigns: dict[str, CampaignLocationCriteria] = {
+            campaign_id: self._load_campaign(campaign_id, campaign_state)
+            for campaign_id, campaign_state in state.get("campaigns", {}).items()
+        }
+
+    def is_full_refresh_due(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        if self.refreshed_at is None or self.checkpoint is None:
+            return True
+        return self.full_refresh_every_hours > 0 and now - self.refreshed_at >= self.full_refresh_every_hours * 3600
+
+    def replace_all(self, criteria_map: dict[str, CampaignLocationCriteria], checkpoint: str, now: Optional[float] = None) -> None:
+        """Replaces the replica with a full report taken after `checkpoint`."""
+        self._campaigns = dict(criteria_map)
+        self.checkpoint = checkpoint
+        self.refreshed_at = time.time() if now is None else now
+
+    def set_campaigns(self, criteria_map: dict[str, CampaignLocationCriteria]) -> None:
+        """Adds or replaces individual campaigns, e.g. ones that are new since the last full report."""
+        self._campaigns.update(criteria_map)
+
+    def get_missing_campaign_ids(self, campaign_ids: Iterable[str]) -> list[str]:
+        return [str(campaign_id) for campaign_id in campaign_ids if str(campaign_id) not in self._campaigns]
+
+    def get(self, campaign_id: str) -> Optional[CampaignLocationCriteria]:
+        return self._campaigns.get(str(campaign_id))
+
+    def get_unknown_additions(self, changes: list[CriterionStatusChange]) -> list[CriterionStatusChange]:
+        """Returns the added or changed criteria of replicated campaigns that aren't in the replica yet."""
+        known_criterion_ids: dict[str, set[int]] = {}
+        unknown_additions = []
+        for change in changes:
+            if change.resource_status == "REMOVED" or change.campaign_id not in self._campaigns:
+                continue
+            criterion_ids = known_criterion_ids.get(change.campaign_id)
+            if criterion_ids is None:
+                criterion_ids = known_criterion_ids[change.campaign_id] = self._campaigns[change.campaign_id].get_criterion_ids()
+            if change.criterion_id not in criterion_ids:
+                unknown_additions.append(change)
+        return unknown_additions
+
+    def apply_removals(self, changes: list[CriterionStatusChange]) -> int:
+        """Drops removed criteria. Returns how many were in the replica."""
+        removed_criterion_ids: dict[str, set[int]] = {}
+        for change in changes:
+            if change.resource_status == "REMOVED" and change.campaign_id in self._campaigns:
+                removed_criterion_ids.setdefault(change.campaign_id, set()).add(change.criterion_id)
+        return sum(
+            self._campaigns[campaign_id].discard_criteria(criterion_ids)
+            for campaign_id, criterion_ids in removed_criterion_ids.items()
+        )
+
+    def apply_additions(self, location_criteria: list[tuple[str, int, int]]) -> None:
+        """Adds (campaign ID, location ID, criterion ID) criteria."""
+        for campaign_id, location_id, criterion_id in location_criteria:
+            criteria = self._campaigns.get(campaign_id)
+            if criteria is not None:
+                criteria.add(location_id, criterion_id)
+
+    def apply_mutation_results(
+        self,
+        campaign_changes: list[tuple[str, list[str], list[str]]],
+        results: dict[str, CampaignMutationResult],
+    ) -> None:
+        """
+        Applies the sync's own changes. Location criterion IDs are the geo target constant IDs,
+        so added criteria are known without reading them back. Campaigns with any failed or
+        unsent operation are dropped and get re-fetched next run.
+        """
+        for campaign_id, criteria_to_add, resource_names_to_remove in campaign_changes:
+            criteria = self._campaigns.get(campaign_id)
+            result = results.get(campaign_id)
+            if criteria is None:
+                continue
+            if result is None or result.failed or result.unsent:
+                del self._campaigns[campaign_id]
+                continue
+            if resource_names_to_remove:
+                criteria.discard_criteria({parse_campaign_criterion_resource_name(resource_name)[1] for resource_name in resource_names_to_remove})
+            for location_id in criteria_to_add:
+                criteria.add(int(location_id), int(location_id))
+
+    def save(self) -> None:
+        write_state(self.path, {
+            "customer_id": self.customer_id,
+            "refreshed_at": self.refreshed_at,
+            "checkpoint": self.checkpoint,
+            "campaigns": {
+                campaign_id: self._dump_campaign(criteria)
+                for campaign_id, criteria in self._campaigns.items()
+            },
+        })
+
+    def _load_campaign(self, campaign_id: str, campaign_state: dict) -> CampaignLocationCriteria:
+        criteria = CampaignLocationCriteria(self.customer_id, campaign_id)
+        for location_id, criterion_id in zip(campaign_state["location_ids"], campaign_state["criterion_ids"]):
+            criteria.add(location_id, criterion_id)
+        return criteria
+
+    def _dump_campaign(self, criteria: CampaignLocationCriteria) -> dict:
+        ids = list(criteria.iter_ids())
+        return {
+            "location_ids": [location_id for location_id, _ in ids],
+            "criterion_ids": [criterion_id for _, criterion_id in ids],
+        }
@@ -0,0 +1,33 @@
+import fcntl
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from zip_sync.environment.folder_paths import get_state_dir_path
+
+RUN_LOCK_NAME = "sync.lock"
+
+
+def get_run_lock_path() -> str:
+    return os.path.join(get_state_dir_path(), RUN_LOCK_NAME)
+
+
+@contextmanager
+def acquire_run_lock(path: Optional[str] = None) -> Iterator[bool]:
+    """
+    Takes an exclusive, non-blocking lock on the run lock file for the duration of the block.
+    Yields False if another process (e.g. a cron run alongside `serve`) already holds it.
+    The OS releases the lock if the holder dies, so a crash can't leave it stuck.
+    """
+    path = path or get_run_lock_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
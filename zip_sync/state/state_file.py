@@ -0,0 +1,38 @@
+import json
+import os
+import tempfile
+
+from zip_sync.environment.folder_paths import get_state_dir_path
+
+
+def get_state_file_path(name: str) -> str:
+    """Return the path of a named state file in the state directory."""
+    return os.path.join(get_state_dir_path(), f"{name}.json")
+
+
+def read_state(path: str) -> dict:
+    """
+    Reads a JSON state file.
+    A missing or unreadable file is treated as empty state, so a bad file only costs a full run.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_state(path: str, data: dict) -> None:
+    """Writes a JSON state file atomically so a crash mid-write can't leave a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
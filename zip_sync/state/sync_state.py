@@ -0,0 +1,90 @@
+import hashlib
+import time
+from typing import Iterable, Optional
+
+from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.state.state_file import get_state_file_path, read_state, write_state
+
+SYNC_STATE_NAME = "sync_state"
+
+
+def compute_fingerprint(criteria_ids: Iterable[str]) -> str:
+    """Returns a stable hash of a criteria ID set. Order and duplicates don't matter."""
+    digest = hashlib.sha256()
+    for criteria_id in sorted({str(criteria_id) for criteria_id in criteria_ids}):
+        digest.update(criteria_id.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class SyncState:
+    """
+    Remembers the fingerprint of the last criteria set that was fully applied,
+    so runs where the filtered feed hasn't changed can skip the Sheets and Ads stages.
+
+    A full reconcile is still forced every N skipped runs or N hours, which picks up
+    changes made outside the sync (e.g. in the Ads UI or new campaigns).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        full_reconcile_every_runs: Optional[int] = None,
+        full_reconcile_every_hours: Optional[float] = None,
+    ):
+        environment_service = EnvironmentService()
+        self.path = path or get_state_file_path(SYNC_STATE_NAME)
+        self.full_reconcile_every_runs = (
+            full_reconcile_every_runs if full_reconcile_every_runs is not None
+            else environment_service.get_full_reconcile_every_runs()
+        )
+        self.full_reconcile_every_hours = (
+            full_reconcile_every_hours if full_reconcile_every_hours is not None
+            else environment_service.get_full_reconcile_every_hours()
+        )
+        self._state = read_state(self.path)
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return self._state.get("fingerprint")
+
+    def is_full_reconcile_due(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        applied_at = self._state.get("applied_at")
+        if applied_at is None:
+            return True
+        if self.full_reconcile_every_runs > 0 and self._state.get("skipped_runs", 0) >= self.full_reconcile_every_runs:
+            return True
+        if self.full_reconcile_every_hours > 0 and now - applied_at >= self.full_reconcile_every_hours * 3600:
+            return True
+        return False
+
+    def should_skip(self, fingerprint: str, now: Optional[float] = None) -> bool:
+        """True if the fingerprint matches the last applied set and no full reconcile is due."""
+        return fingerprint == self.fingerprint and not self.is_full_reconcile_due(now)
+
+    def should_skip_feed(self, feed_hash: str, now: Optional[float] = None) -> bool:
+        """
+        True if the raw feed is byte-for-byte the one behind the last applied set
+        and no full reconcile is due, so the feed doesn't even need parsing.
+        """
+        return feed_hash == self._state.get("feed_hash") and not self.is_full_reconcile_due(now)
+
+    def record_skipped(self, feed_hash: Optional[str] = None) -> None:
+        """
+        Counts a skipped run. If a different feed body produced the same criteria set,
+        pass its hash so the next identical feed can be skipped without parsing.
+        """
+        self._state["skipped_runs"] = self._state.get("skipped_runs", 0) + 1
+        if feed_hash is not None:
+            self._state["feed_hash"] = feed_hash
+        write_state(self.path, self._state)
+
+    def record_applied(self, fingerprint: str, feed_hash: Optional[str] = None, now: Optional[float] = None) -> None:
+        self._state = {
+            "fingerprint": fingerprint,
+            "feed_hash": feed_hash,
+            "applied_at": time.time() if now is None else now,
+            "skipped_runs": 0,
+        }
+        write_state(self.path, self._state)
@@ -1,3 +1,16 @@
+from typing import Callable, Iterator
+
 def chunk_list(data: list, size: int) -> list[list]:
     """Splits a list into chunks of a specified size."""
     return [data[i:i + size] for i in range(0, len(data), size)]
+
+def iter_chunks(data: list, get_size: Callable[[], int]) -> Iterator[list]:
+    """
+    Yields consecutive chunks of a list, asking get_size() for the size of each chunk as it's taken.
+    Lets the chunk size change while the list is being worked through.
+    """
+    start = 0
+    while start < len(data):
+        size = max(1, get_size())
+        yield data[start:start + size]
+        start += size
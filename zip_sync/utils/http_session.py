@@ -0,0 +1,35 @@
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "campaign-zip-code-sync",
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_http_session(pool_maxsize: int = 10) -> requests.Session:
+    """Returns a new session with connection pooling and compressed responses enabled."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session, so connections (and TLS sessions) are reused
+    across every request the sync makes.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_http_session()
+        return _session
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+# Packages that should only be imported once a run actually needs them
+HEAVY_PACKAGES = ["google", "grpc", "proto", "pandas", "numpy", "gspread", "oauth2client"]
+
+STARTUP_MODULE = "zip_sync.__main__"
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """
+    Parses the stderr of `python -X importtime`.
+    Lines look like: `import time:       120 |        350 |   zip_sync.data.zip_index`
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in parts)
+        if not self_us.isdigit():
+            continue  # the header line
+        timings.append(ImportTiming(module, int(self_us), int(cumulative_us)))
+    return timings
+
+
+def measure_startup_imports(module: str = STARTUP_MODULE) -> list[ImportTiming]:
+    """Imports the module in a fresh interpreter with -X importtime and returns the timings."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def format_report(timings: list[ImportTiming], top: int = 15) -> tuple[str, float, list[str]]:
+    """
+    Builds a readable report from import timings.
+    Returns the report text, the total import time in milliseconds and any heavy packages that were imported.
+    """
+    total_ms = sum(timing.self_us for timing in timings) / 1000
+    heavy_imported = sorted({
+        timing.module.split(".")[0] for timing in timings
+        if timing.module.split(".")[0] in HEAVY_PACKAGES
+    })
+
+    lines = [f"Startup imports: {len(timings)} modules, {total_ms:.1f} ms"]
+    lines.append(f"Top {top} by self time:")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"  {timing.self_us / 1000:8.1f} ms  {timing.module}")
+    if heavy_imported:
+        lines.append(f"Heavy packages imported at startup: {', '.join(heavy_imported)}")
+    else:
+        lines.append("No heavy packages imported at startup.")
+    return "\n".join(lines), total_ms, heavy_imported
+
+
+def profile_imports(budget_ms: Optional[float] = None, top: int = 15) -> int:
+    """
+    Prints an import-time report for the startup path and returns an exit code.
+    Fails (1) if a heavy package is imported at startup or the total exceeds budget_ms.
+    """
+    report, total_ms, heavy_imported = format_report(measure_startup_imports(), top)
+    print(report)
+    if heavy_imported:
+        return 1
+    if budget_ms is not None and total_ms > budget_ms:
+        print(f"Startup import time {total_ms:.1f} ms exceeds the budget of {budget_ms:.1f} ms")
+        return 1
+    return 0
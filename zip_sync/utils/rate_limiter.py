@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every worker that calls the same API.
+
+    Tokens refill at `rate` per second up to `capacity`, so short bursts are allowed
+    but the sustained request rate stays at `rate`. When the API reports a quota error,
+    `backoff()` pauses every caller, doubling the pause on consecutive quota errors
+    until a request succeeds again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        # acquire() takes a whole token, so a smaller bucket could never fill enough to grant one
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._consecutive_backoffs = 0
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Blocks until `tokens` are available and takes them. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = max(self._paused_until - now, (tokens - self._tokens) / self.rate)
+            self._sleep(wait)
+            waited += wait
+
+    def backoff(self, delay: Optional[float] = None) -> float:
+        """
+        Pauses all callers after a quota error. Uses `delay` if the API suggested one,
+        otherwise an exponential backoff. Returns the pause length.
+        """
+        with self._lock:
+            if delay is None:
+                delay = min(self.max_backoff, self.initial_backoff * (2 ** self._consecutive_backoffs))
+            self._consecutive_backoffs += 1
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + delay)
+            self._tokens = 0.0
+            self._updated_at = now
+            return delay
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_backoffs = 0
+
+    def _refill(self, now: float) -> None:
+        # Nothing refills while paused
+        refill_from = max(self._updated_at, self._paused_until)
+        if now > refill_from:
+            self._tokens = min(self.capacity, self._tokens + (now - refill_from) * self.rate)
+        self._updated_at = now
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+PROMETHEUS_PREFIX = "zip_sync"
+
+
+class RunMetrics:
+    """
+    Durations and counters for one sync run, shared by every thread working on it.
+
+    * Stages are timed with `stage(name)`; time spent in the same stage adds up.
+    * Counters (rows, requests, retries, bytes, operations) are added to with `increment(name, value)`.
+    """
+
+    def __init__(self, clock=time.time, timer=time.perf_counter):
+        self._lock = threading.Lock()
+        self._timer = timer
+        self.started_at = clock()
+        self._started = timer()
+        self.outcome: Optional[str] = None
+        self._durations: dict[str, float] = {}
+        self._counters: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = self._timer()
+        try:
+            yield
+        finally:
+            self.add_duration(name, self._timer() - started)
+
+    def add_duration(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._durations[name] = self._durations.get(name, 0.0) + seconds
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get_elapsed(self) -> float:
+        return self._timer() - self._started
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "duration_seconds": round(self.get_elapsed(), 3),
+                "outcome": self.outcome,
+                "stages": {name: round(seconds, 3) for name, seconds in self._durations.items()},
+                "counters": dict(self._counters),
+            }
+
+    def to_json_line(self) -> str:
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """Renders the run as gauges in the Prometheus text format, for node_exporter's textfile collector."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {PROMETHEUS_PREFIX}_run_timestamp_seconds When the last run started.",
+            f"# TYPE {PROMETHEUS_PREFIX}_run_timestamp_seconds gauge",
+            f"{PROMETHEUS_PREFIX}_run_timestamp_seconds {snapshot['started_at']:.3f}",
+            f"# HELP {PROMETHEUS_PREFIX}_run_duration_seconds How long the last run took.",
+            f"# TYPE {PROMETHEUS_PREFIX}_run_duration_seconds gauge",
+            f"{PROMETHEUS_PREFIX}_run_duration_seconds {snapshot['duration_seconds']}",
+            f"# HELP {PROMETHEUS_PREFIX}_run_outcome The last run's outcome (1 for the current one).",
+            f"# TYPE {PROMETHEUS_PREFIX}_run_outcome gauge",
+            f'{PROMETHEUS_PREFIX}_run_outcome{{outcome="{snapshot["outcome"] or "unknown"}"}} 1',
+            f"# HELP {PROMETHEUS_PREFIX}_stage_duration_seconds Time spent in each stage of the last run.",
+            f"# TYPE {PROMETHEUS_PREFIX}_stage_duration_seconds gauge",
+        ]
+        lines.extend(
+            f'{PROMETHEUS_PREFIX}_stage_duration_seconds{{stage="{name}"}} {seconds}'
+            for name, seconds in sorted(snapshot["stages"].items())
+        )
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} gauge")
+            lines.append(f"{PROMETHEUS_PREFIX}_{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> str:
+        """A short human-readable summary for the Slack digest."""
+        snapshot = self.snapshot()
+        stages = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in snapshot["stages"].items())
+        counters = ", ".join(f"{name} {value:g}" for name, value in sorted(snapshot["counters"].items()))
+        lines = [f"Run {snapshot['outcome'] or 'finished'} in {snapshot['duration_seconds']:.1f}s"]
+        if stages:
+            lines.append(f"Stages: {stages}")
+        if counters:
+            lines.append(f"Counters: {counters}")
+        return "\n".join(lines)
+
+    def write(self, path: str, format: str) -> None:
+        """
+        Writes the run to `path`: "jsonl" appends a line, "prometheus" replaces the file atomically
+        (the textfile collector must never read a half-written file).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if format == "jsonl":
+            with open(path, "a") as f:
+                f.write(self.to_json_line() + "\n")
+            return
+        if format != "prometheus":
+            raise ValueError(f"Unknown run metrics format: {format}")
+        fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=".tmp-", suffix=".prom")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+_run_metrics = RunMetrics()
+
+
+def start_run_metrics() -> RunMetrics:
+    """Starts collecting metrics for a new run. Everything recorded from now on goes to it."""
+    global _run_metrics
+    _run_metrics = RunMetrics()
+    return _run_metrics
+
+
+def get_run_metrics() -> RunMetrics:
+    """Returns the current run's metrics."""
+    return _run_metrics
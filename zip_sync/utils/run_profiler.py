@@ -0,0 +1,336 @@
+import glob
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterator, Optional
+
+OWN_PACKAGE = "zip_sync"
+OWN_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(OWN_PACKAGE_DIR)
+# The Slack sender spends the run idle, waiting for messages
+IGNORED_THREAD_NAMES = {"slack"}
+
+
+@dataclass
+class Profile:
+    """
+    A profile of one run.
+
+    * cpu: wall-clock seconds (samples x interval, per thread) by function.
+    * mem: bytes allocated and still live at the run's peak, by line.
+
+    `own` attributes everything to the innermost zip_sync function (or line) on the stack,
+    `own_cumulative` to every zip_sync function on it (cpu only), and `functions` to
+    wherever the time or memory was actually spent, including library code.
+    """
+    mode: str
+    started_at: float
+    duration_seconds: float
+    unit: str
+    total: float
+    own: dict[str, float] = field(default_factory=dict)
+    own_cumulative: dict[str, float] = field(default_factory=dict)
+    functions: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Profile":
+        return cls(**data)
+
+
+def _get_function_key(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _is_own_frame(frame) -> bool:
+    module = frame.f_globals.get("__name__", "")
+    return module == OWN_PACKAGE or module.startswith(OWN_PACKAGE + ".")
+
+
+class SamplingProfiler:
+    """
+    Samples every thread's stack from a background thread every `interval` seconds.
+    Unlike cProfile this sees the worker threads and costs the same whatever the code does,
+    so it's cheap enough for production runs. Samples are wall-clock, so time spent waiting
+    on the APIs shows up too. Threads with no zip_sync code on their stack are left out.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples = 0
+        self._own: dict[str, int] = {}
+        self._own_cumulative: dict[str, int] = {}
+        self._functions: dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def get_tables(self) -> tuple[dict[str, float], dict[str, float], dict[str, float]]:
+        """Returns the own, own cumulative and all-function tables in seconds."""
+        def to_seconds(table: dict[str, int]) -> dict[str, float]:
+            return {key: round(count * self.interval, 4) for key, count in table.items()}
+        return to_seconds(self._own), to_seconds(self._own_cumulative), to_seconds(self._functions)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        ignored_ids = {
+            thread.ident for thread in threading.enumerate()
+            if thread.name in IGNORED_THREAD_NAMES or thread is self._thread
+        }
+        ignored_ids.add(threading.get_ident())
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id not in ignored_ids:
+                self._record(frame)
+
+    def _record(self, top_frame) -> None:
+        own_key = None
+        own_keys = set()
+        frame = top_frame
+        while frame is not None:
+            if _is_own_frame(frame):
+                key = _get_function_key(frame)
+                own_key = own_key or key
+                own_keys.add(key)
+            frame = frame.f_back
+        if own_key is None:
+            return
+
+        self.samples += 1
+        self._own[own_key] = self._own.get(own_key, 0) + 1
+        for key in own_keys:
+            self._own_cumulative[key] = self._own_cumulative.get(key, 0) + 1
+        function_key = _get_function_key(top_frame)
+        self._functions[function_key] = self._functions.get(function_key, 0) + 1
+
+
+class PeakMemoryTracer:
+    """
+    Traces allocations with tracemalloc, and snapshots them whenever traced memory reaches
+    a new high (by at least `min_growth`), so the report shows what was live at the peak.
+    Tracing slows the run down, more so the more `frames` of each traceback are kept; too
+    few and allocations deep inside a library can't be traced back to zip_sync code.
+    """
+
+    def __init__(self, frames: int = 10, interval: float = 0.05, min_growth: float = 0.1):
+        self.frames = frames
+        self.interval = interval
+        self.min_growth = min_growth
+        self.peak_bytes = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        tracemalloc.start(self.frames)
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.check()
+        self.peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        current_bytes, _ = tracemalloc.get_traced_memory()
+        if self._snapshot is None or current_bytes > self._snapshot_bytes * (1 + self.min_growth):
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_bytes = current_bytes
+
+    def get_tables(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Returns bytes live at the peak snapshot by innermost zip_sync line, and by allocating line."""
+        own: dict[str, float] = {}
+        functions: dict[str, float] = {}
+        if self._snapshot is None:
+            return own, functions
+        for statistic in self._snapshot.statistics("traceback"):
+            frames = list(statistic.traceback)
+            # Frames run from the oldest call to the allocation itself
+            allocation_key = _get_line_key(frames[-1].filename, frames[-1].lineno)
+            functions[allocation_key] = functions.get(allocation_key, 0) + statistic.size
+            own_frame = next((frame for frame in reversed(frames) if _is_own_file(frame.filename)), None)
+            if own_frame is not None:
+                own_key = _get_line_key(own_frame.filename, own_frame.lineno)
+                own[own_key] = own.get(own_key, 0) + statistic.size
+        return own, functions
+
+
+def _is_own_file(filename: str) -> bool:
+    return os.path.abspath(filename).startswith(OWN_PACKAGE_DIR + os.sep)
+
+
+def _get_line_key(filename: str, lineno: int) -> str:
+    path = os.path.abspath(filename)
+    if path.startswith(PROJECT_ROOT + os.sep):
+        path = os.path.relpath(path, PROJECT_ROOT)
+    return f"{path}:{lineno}"
+
+
+@contextmanager
+def profile(mode: str, interval: float = 0.01, mem_frames: int = 10, result: Optional[list] = None) -> Iterator[None]:
+    """
+    Profiles the block in "cpu" or "mem" mode and appends the Profile to `result`.
+    """
+    started_at = time.time()
+    started = time.perf_counter()
+    if mode == "cpu":
+        profiler = SamplingProfiler(interval)
+    elif mode == "mem":
+        profiler = PeakMemoryTracer(mem_frames)
+    else:
+        raise ValueError(f"Unknown profile mode: {mode}")
+
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        duration_seconds = round(time.perf_counter() - started, 3)
+        if mode == "cpu":
+            own, own_cumulative, functions = profiler.get_tables()
+            run_profile = Profile(mode, started_at, duration_seconds, "seconds", round(profiler.samples * interval, 4), own, own_cumulative, functions)
+        else:
+            own, functions = profiler.get_tables()
+            run_profile = Profile(mode, started_at, duration_seconds, "bytes", profiler.peak_bytes, own, {}, functions)
+        if result is not None:
+            result.append(run_profile)
+
+
+def _format_value(value: float, unit: str) -> str:
+    if unit == "bytes":
+        return f"{value / 1e6:9.2f} MB"
+    return f"{value:9.2f} s "
+
+
+def _format_table(title: str, table: dict[str, float], unit: str, top: int) -> list[str]:
+    lines = [title]
+    for key, value in sorted(table.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {_format_value(value, unit)}  {key}")
+    return lines
+
+
+def diff_tables(old: dict[str, float], new: dict[str, float], top: int = 20) -> list[tuple[str, float, float]]:
+    """Returns the `top` (key, old value, new value) entries that changed most, largest change first."""
+    keys = set(old) | set(new)
+    changes = [(key, old.get(key, 0), new.get(key, 0)) for key in keys]
+    changes = [change for change in changes if change[1] != change[2]]
+    return sorted(changes, key=lambda change: abs(change[2] - change[1]), reverse=True)[:top]
+
+
+def format_profile(run_profile: Profile, top: int = 20, previous: Optional[Profile] = None) -> str:
+    unit = run_profile.unit
+    total_label = "sampled thread time" if run_profile.mode == "cpu" else "peak traced memory"
+    lines = [
+        f"{run_profile.mode} profile of a {run_profile.duration_seconds:.1f}s run "
+        f"({total_label} {_format_value(run_profile.total, unit).strip()})",
+    ]
+    lines += _format_table(f"Top {top} zip_sync code (innermost on the stack):", run_profile.own, unit, top)
+    if run_profile.own_cumulative:
+        lines += _format_table(f"Top {top} zip_sync functions (including callees):", run_profile.own_cumulative, unit, top)
+    lines += _format_table(f"Top {top} overall:", run_profile.functions, unit, top)
+
+    if previous is not None:
+        lines.append(f"Biggest changes in zip_sync code since the profile of {time.ctime(previous.started_at)}:")
+        for key, old_value, new_value in diff_tables(previous.own, run_profile.own, top):
+            delta = new_value - old_value
+            sign = "+" if delta >= 0 else "-"
+            lines.append(f"  {sign + _format_value(abs(delta), unit).strip():>13}  {key}")
+    return "\n".join(lines)
+
+
+def load_profile(path: str) -> Profile:
+    with open(path) as f:
+        return Profile.from_dict(json.load(f))
+
+
+def compare_profiles(old_path: str, new_path: str, top: int = 20) -> str:
+    """Returns the report of the profile at new_path, with a diff against the one at old_path."""
+    old, new = load_profile(old_path), load_profile(new_path)
+    if old.mode != new.mode:
+        raise ValueError(f"Can't compare a {old.mode} profile with a {new.mode} profile")
+    return format_profile(new, top, old)
+
+
+def find_previous_profile(profile_dir: str, mode: str) -> Optional[str]:
+    paths = sorted(glob.glob(os.path.join(profile_dir, f"*-{mode}.json")))
+    return paths[-1] if paths else None
+
+
+def save_profile(run_profile: Profile, profile_dir: str, report: str, keep: int = 20) -> str:
+    """Writes the profile (JSON) and its report (text), then deletes all but the newest `keep` of that mode."""
+    os.makedirs(profile_dir, exist_ok=True)
+    stem = os.path.join(profile_dir, time.strftime("%Y%m%d-%H%M%S", time.localtime(run_profile.started_at)) + f"-{run_profile.mode}")
+    with open(stem + ".json", "w") as f:
+        json.dump(run_profile.to_dict(), f)
+    with open(stem + ".txt", "w") as f:
+        f.write(report + "\n")
+
+    paths = sorted(glob.glob(os.path.join(profile_dir, f"*-{run_profile.mode}.json")))
+    for old_path in paths[:-keep] if keep > 0 else []:
+        for path in (old_path, old_path[:-len(".json")] + ".txt"):
+            if os.path.exists(path):
+                os.remove(path)
+    return stem + ".json"
+
+
+@contextmanager
+def profile_run(
+    mode: str,
+    profile_dir: str,
+    sample_rate: float = 1.0,
+    top: int = 20,
+    keep: int = 20,
+    interval: float = 0.01,
+    mem_frames: int = 10,
+    random_value: Callable[[], float] = random.random,
+) -> Iterator[None]:
+    """
+    Profiles a sync run if `mode` is "cpu" or "mem" and this run falls within `sample_rate`.
+    The report is printed and saved with a diff against the previous profile of the same mode.
+    Profiling problems are printed, never raised, so they can't fail the run.
+    """
+    if mode not in ("cpu", "mem") or random_value() >= sample_rate:
+        yield
+        return
+
+    result: list[Profile] = []
+    try:
+        with profile(mode, interval, mem_frames, result):
+            yield
+    finally:
+        try:
+            run_profile = result[0]
+            previous_path = find_previous_profile(profile_dir, mode)
+            previous = load_profile(previous_path) if previous_path else None
+            report = format_profile(run_profile, top, previous)
+            path = save_profile(run_profile, profile_dir, report, keep)
+            print(report)
+            print(f"Saved the {mode} profile to {path}")
+        except Exception as e:
+            print(f"Couldn't save the {mode} profile: {e}")
@@ -1,9 +1,72 @@
-from zip_sync.data.zip_code_fetcher import ZipCodeFetcher
-from zip_sync.filter.zip_code_filter import filter_zip_codes
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-API_URL = "https://www.elocal.com/api/call_category_price_list/149.json?api_key=c13b178aca3cd7d642b6b1e4fe22f1bb"
+from zip_sync.data.feed_cache import FeedCache
+from zip_sync.data.feed_category import FeedCategory, parse_feed_categories
+from zip_sync.data.zip_code_fetcher import FeedResult, ZipCodeFetcher
+from zip_sync.data.zip_index import get_zip_index
+from zip_sync.environment.environment_service import EnvironmentService
+from zip_sync.filter.zip_code_filter import PriceRule, filter_zip_code_stream, parse_price_rules
+from zip_sync.utils.run_metrics import get_run_metrics
 
-def get_zip_codes():
-    fetcher = ZipCodeFetcher(API_URL)
-    data = fetcher.fetch()
-    return filter_zip_codes(data)
+API_URL = "https://www.elocal.com/api/call_category_price_list/{category_id}.json?api_key=c13b178aca3cd7d642b6b1e4fe22f1bb"
+
+def fetch_feed(category: Optional[FeedCategory] = None) -> FeedResult:
+    environment_service = EnvironmentService()
+    category = category or FeedCategory()
+    feed_url = category.get_feed_url(environment_service.get_feed_url() or API_URL)
+    cache = FeedCache(feed_url) if environment_service.get_feed_cache_enabled() else None
+    fetcher = ZipCodeFetcher(feed_url, cache=cache, offline=environment_service.get_feed_offline())
+    return fetcher.fetch_feed()
+
+def fetch_feeds(categories: list[FeedCategory]) -> dict[str, FeedResult]:
+    """
+    Fetches every category's feed concurrently over the shared HTTP session.
+    Returns category ID -> feed.
+    """
+    if len(categories) == 1:
+        return {categories[0].category_id: fetch_feed(categories[0])}
+    with ThreadPoolExecutor(max_workers=len(categories), thread_name_prefix="feed") as executor:
+        feeds = list(executor.map(fetch_feed, categories))
+    return {category.category_id: feed for category, feed in zip(categories, feeds)}
+
+def get_price_rules() -> list[PriceRule]:
+    environment_service = EnvironmentService()
+    price_rules = environment_service.get_price_rules()
+    if price_rules:
+        return parse_price_rules(price_rules)
+    return [PriceRule(threshold=environment_service.get_price_threshold())]
+
+def get_feed_categories() -> list[FeedCategory]:
+    """
+    The categories from FEED_CATEGORIES. Without it there's the one default category,
+    filtered by PRICE_RULES / PRICE_THRESHOLD.
+    """
+    feed_categories = EnvironmentService().get_feed_categories()
+    if feed_categories:
+        return parse_feed_categories(feed_categories, get_price_rules())
+    return [FeedCategory(price_rules=tuple(get_price_rules()))]
+
+def get_zip_codes(feed: Optional[FeedResult] = None) -> list[str]:
+    feed = feed or fetch_feed()
+    zip_codes = list(filter_zip_code_stream(feed.iter_chunks(), get_price_rules()))
+    get_run_metrics().increment("feed_zip_codes", len(zip_codes))
+    return zip_codes
+
+def get_criteria_ids(feed: Optional[FeedResult] = None, price_rules: Optional[list[PriceRule]] = None) -> list[str]:
+    """
+    Returns the geo target IDs of the zip codes that pass the price rules (by default PRICE_RULES / PRICE_THRESHOLD).
+    The feed is parsed, filtered and mapped as a stream, so only the passing IDs are held in memory.
+    """
+    feed = feed or fetch_feed()
+    zip_codes = filter_zip_code_stream(feed.iter_chunks(), price_rules if price_rules is not None else get_price_rules())
+    criteria_ids = get_zip_index().lookup_many(zip_codes)
+    get_run_metrics().increment("criteria", len(criteria_ids))
+    return criteria_ids
+
+def get_criteria_ids_by_category(feeds: dict[str, FeedResult], categories: list[FeedCategory]) -> dict[str, list[str]]:
+    """Filters each category's feed once with its own price rules. Returns category ID -> criteria IDs."""
+    return {
+        category.category_id: get_criteria_ids(feeds[category.category_id], list(category.price_rules))
+        for category in categories
+    }
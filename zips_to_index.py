@@ -0,0 +1,62 @@
+"""
+Builds zip_sync/constants/zips_index.bin from zips.txt.
+
+zips.txt is the tab separated geo target export: `<geo target ID>\t<zip code>` per line.
+
+Usage:
+    python zips_to_index.py [path/to/zips.txt]
+"""
+import os
+import sys
+
+from zip_sync.data.zip_index import ZipIndex, write_zip_index
+from zip_sync.environment.folder_paths import get_zip_index_path
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+zips_txt_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(script_dir, 'zips.txt')
+output_path = get_zip_index_path()
+
+if not os.path.exists(zips_txt_path):
+    print(f"ERROR: {zips_txt_path} not found.")
+    sys.exit(1)
+
+zips_dict = {}
+try:
+    with open(zips_txt_path, 'r') as f:
+        lines = f.readlines()
+except Exception as e:
+    print(f"ERROR: Could not open {zips_txt_path}: {e}")
+    sys.exit(1)
+
+if not lines:
+    print(f"ERROR: {zips_txt_path} is empty.")
+    sys.exit(1)
+
+for line in lines:
+    line = line.strip()
+    if not line:
+        continue
+    parts = line.split('\t')
+    if len(parts) == 2:
+        key, value = parts
+        zips_dict[str(value)] = str(key)
+
+if not zips_dict:
+    print(f"ERROR: No valid lines found in {zips_txt_path}.")
+    sys.exit(1)
+
+try:
+    count = write_zip_index(output_path, zips_dict)
+except ValueError as e:
+    print(f"ERROR: {e}")
+    sys.exit(1)
+
+# Sanity check the written file before it gets committed
+zip_index = ZipIndex(output_path)
+mismatches = [zip_code for zip_code, geo_target_id in zips_dict.items() if zip_index.get(zip_code) != geo_target_id]
+zip_index.close()
+if mismatches:
+    print(f"ERROR: {len(mismatches)} zip codes did not round-trip, e.g. {mismatches[:5]}")
+    sys.exit(1)
+
+print(f"Index with {count} entries written to {output_path}")